@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cold-start import time and memory of the package.
+
+Every statement runs in a fresh interpreter, so nothing is cached between
+measurements, and the best of ``--number`` runs is reported, along with the
+growth of the peak resident set size over the bare interpreter (on platforms
+with the :mod:`resource` module). With
+``--budget``, the script fails if a bare ``import google.cloud.compute_v1``
+takes longer than that many milliseconds, which guards the lazy imports of
+the package ``__init__`` modules.
+
+Run from the repository root, with the package installed
+(``pip install -e .``)::
+
+    python benchmarks/import_time.py [--number N] [--budget MS]
+"""
+
+import argparse
+import subprocess
+import sys
+
+STATEMENTS = [
+    ("import google.cloud.compute_v1", "import google.cloud.compute_v1"),
+    ("import google.cloud.compute", "import google.cloud.compute"),
+    (
+        "compute_v1.Instance",
+        "from google.cloud import compute_v1; compute_v1.Instance",
+    ),
+    (
+        "compute_v1.InstancesClient",
+        "from google.cloud import compute_v1; compute_v1.InstancesClient",
+    ),
+    (
+        "ZonesClient + InstancesClient",
+        "from google.auth import credentials\n"
+        "from google.cloud import compute_v1\n"
+        "creds = credentials.AnonymousCredentials()\n"
+        "compute_v1.ZonesClient(credentials=creds)\n"
+        "compute_v1.InstancesClient(credentials=creds)\n"
+        "compute_v1.Instance(name='instance-1', zone='us-central1-a')",
+    ),
+    (
+        "every name in __all__",
+        "from google.cloud import compute_v1\n"
+        "for name in compute_v1.__all__:\n"
+        "    getattr(compute_v1, name)",
+    ),
+]
+
+_TIMER = """
+import time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def peak_kib():
+    if resource is None:
+        return float("nan")
+    # ru_maxrss is in KiB on Linux and in bytes on macOS.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if {darwin!r} else peak
+
+baseline = peak_kib()
+start = time.perf_counter()
+exec(compile({statement!r}, "<statement>", "exec"))
+print((time.perf_counter() - start) * 1e3, peak_kib() - baseline)
+"""
+
+
+def _measure(statement, number):
+    times = []
+    peaks = []
+    timer = _TIMER.format(statement=statement, darwin=sys.platform == "darwin")
+    for _ in range(number):
+        output = subprocess.run(
+            [sys.executable, "-c", timer],
+            check=True,
+            stdout=subprocess.PIPE,
+            universal_newlines=True,
+        ).stdout
+        elapsed, peak = output.split()
+        times.append(float(elapsed))
+        peaks.append(float(peak))
+    return min(times), min(peaks) / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None)
+    args = parser.parse_args()
+
+    print("{:<32}{:>12}{:>12}".format("statement", "best (ms)", "RSS (MiB)"))
+    results = {}
+    for name, statement in STATEMENTS:
+        results[name], rss = _measure(statement, args.number)
+        print("{:<32}{:>12.1f}{:>12.1f}".format(name, results[name], rss))
+
+    if args.budget is not None:
+        elapsed = results[STATEMENTS[0][0]]
+        if elapsed > args.budget:
+            sys.exit(
+                "{} took {:.1f} ms, over the budget of {:.1f} ms".format(
+                    STATEMENTS[0][0], elapsed, args.budget
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
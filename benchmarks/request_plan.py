@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Per-call CPU cost of building REST requests.
+
+Compares the precompiled request plans used by the REST transports with the
+previous per-call pipeline (``to_dict``, ``path_template.transcode``,
+``to_json`` and ``json.loads`` of the query parameters, then
+``flatten_query_params``) for ``InstancesClient.get``, ``list`` and
+``insert``. No requests are sent.
+
+Run from the repository root, with the package installed
+(``pip install -e .``)::
+
+    python benchmarks/request_plan.py [--number N]
+"""
+
+import argparse
+import json
+import time
+
+from google.api_core import path_template
+from google.api_core import rest_helpers
+
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1.types import compute
+
+
+def _legacy(request_type, http_options, request, body_type=None):
+    request_kwargs = request_type.to_dict(request)
+    transcoded_request = path_template.transcode(http_options, **request_kwargs)
+    body = None
+    if body_type is not None:
+        body = body_type.to_json(
+            body_type(transcoded_request["body"]),
+            including_default_value_fields=False,
+            use_integers_for_enums=False,
+        )
+    query_params = json.loads(
+        request_type.to_json(
+            request_type(transcoded_request["query_params"]),
+            including_default_value_fields=False,
+            use_integers_for_enums=False,
+        )
+    )
+    params = rest_helpers.flatten_query_params(query_params)
+    return transcoded_request["method"], transcoded_request["uri"], body, params
+
+
+def _planned(plan, request):
+    method, uri, body = plan.expand(request)
+    return method, uri, body, plan.query_params(request)
+
+
+def _cases():
+    zone_uri = "/compute/v1/projects/{project}/zones/{zone}"
+    get = compute.GetInstanceRequest(
+        project="my-project", zone="us-central1-a", instance="my-instance"
+    )
+    list_ = compute.ListInstancesRequest(
+        project="my-project",
+        zone="us-central1-a",
+        filter="status = RUNNING",
+        max_results=500,
+        order_by="creationTimestamp desc",
+        page_token="token",
+        return_partial_success=True,
+    )
+    insert = compute.InsertInstanceRequest(
+        project="my-project",
+        zone="us-central1-a",
+        request_id="5f6c4a57-1b1c-4b52-9d2a-0d8d7c4a7b7e",
+        instance_resource=compute.Instance(
+            name="my-instance",
+            machine_type="zones/us-central1-a/machineTypes/e2-standard-4",
+            labels={"env": "prod", "team": "compute"},
+            disks=[
+                compute.AttachedDisk(
+                    boot=True,
+                    auto_delete=True,
+                    initialize_params=compute.AttachedDiskInitializeParams(
+                        source_image="projects/debian-cloud/global/images/family/debian-11",
+                        disk_size_gb=20,
+                    ),
+                )
+            ],
+            network_interfaces=[
+                compute.NetworkInterface(
+                    network="global/networks/default",
+                    access_configs=[compute.AccessConfig(name="External NAT")],
+                )
+            ],
+        ),
+    )
+    return [
+        (
+            "get",
+            compute.GetInstanceRequest,
+            [{"method": "get", "uri": zone_uri + "/instances/{instance}"}],
+            get,
+            None,
+        ),
+        (
+            "list",
+            compute.ListInstancesRequest,
+            [{"method": "get", "uri": zone_uri + "/instances"}],
+            list_,
+            None,
+        ),
+        (
+            "insert",
+            compute.InsertInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": zone_uri + "/instances",
+                    "body": "instance_resource",
+                }
+            ],
+            insert,
+            compute.Instance,
+        ),
+    ]
+
+
+def _per_call(func, number):
+    func()
+    start = time.process_time()
+    for _ in range(number):
+        func()
+    return (time.process_time() - start) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=5000)
+    args = parser.parse_args()
+
+    print(
+        "{:<8}{:>14}{:>14}{:>10}".format(
+            "method", "legacy (us)", "plan (us)", "speedup"
+        )
+    )
+    for name, request_type, http_options, request, body_type in _cases():
+        plan = _request_plan.RequestPlan(request_type, http_options)
+        legacy_result = _legacy(request_type, http_options, request, body_type)
+        assert legacy_result == _planned(plan, request), name
+
+        legacy = _per_call(
+            lambda: _legacy(request_type, http_options, request, body_type),
+            args.number,
+        )
+        planned = _per_call(lambda: _planned(plan, request), args.number)
+        print(
+            "{:<8}{:>14.1f}{:>14.1f}{:>9.1f}x".format(
+                name, legacy, planned, legacy / planned
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""CPU cost of decoding aggregated list pages.
+
+Compares ``Message.from_json`` with
+:func:`google.cloud.compute_v1.response_decoding.from_json` on 500-item
+``InstanceAggregatedList``, ``DiskAggregatedList`` and
+``OperationAggregatedList`` pages, then the cost of a scan that reads
+``name``, ``status`` and ``zone`` of every item from fully decoded pages and
+from ``lazy=True`` views. The pages are generated with the shape and field
+population of real API responses, since recorded responses contain project
+data.
+
+Run from the repository root, with the package installed
+(``pip install -e .``)::
+
+    python benchmarks/response_decoding.py [--number N] [--items N]
+"""
+
+import argparse
+import json
+import time
+
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.types import compute
+
+PROJECT = "https://www.googleapis.com/compute/v1/projects/my-project"
+ZONES = ["us-central1-a", "us-central1-b", "us-east1-b", "europe-west1-c"]
+
+
+def _instance(index, zone):
+    zone_url = "{}/zones/{}".format(PROJECT, zone)
+    name = "instance-{}".format(index)
+    return {
+        "kind": "compute#instance",
+        "id": str(7000000000000000000 + index),
+        "creationTimestamp": "2021-06-01T10:00:00.000-07:00",
+        "name": name,
+        "tags": {
+            "items": ["http-server", "https-server"],
+            "fingerprint": "42WmSpB8rSM=",
+        },
+        "machineType": zone_url + "/machineTypes/e2-standard-4",
+        "status": "RUNNING",
+        "zone": zone_url,
+        "canIpForward": False,
+        "networkInterfaces": [
+            {
+                "kind": "compute#networkInterface",
+                "network": PROJECT + "/global/networks/default",
+                "subnetwork": PROJECT + "/regions/us-central1/subnetworks/default",
+                "networkIP": "10.128.0.{}".format(index % 250 + 2),
+                "name": "nic0",
+                "accessConfigs": [
+                    {
+                        "kind": "compute#accessConfig",
+                        "type": "ONE_TO_ONE_NAT",
+                        "name": "External NAT",
+                        "natIP": "34.72.{}.{}".format(index % 250, index % 200),
+                        "networkTier": "PREMIUM",
+                    }
+                ],
+                "fingerprint": "9H4Dnbh5ZgM=",
+                "stackType": "IPV4_ONLY",
+            }
+        ],
+        "disks": [
+            {
+                "kind": "compute#attachedDisk",
+                "type": "PERSISTENT",
+                "mode": "READ_WRITE",
+                "source": zone_url + "/disks/" + name,
+                "deviceName": name,
+                "index": 0,
+                "boot": True,
+                "autoDelete": True,
+                "licenses": [
+                    "https://www.googleapis.com/compute/v1/projects/debian-cloud/global/licenses/debian-11-bullseye"
+                ],
+                "interface": "SCSI",
+                "guestOsFeatures": [
+                    {"type": "UEFI_COMPATIBLE"},
+                    {"type": "VIRTIO_SCSI_MULTIQUEUE"},
+                ],
+                "diskSizeGb": "20",
+            }
+        ],
+        "metadata": {
+            "kind": "compute#metadata",
+            "fingerprint": "8m2iaTJvIGs=",
+            "items": [
+                {"key": "startup-script", "value": "#! /bin/bash\napt-get update"}
+            ],
+        },
+        "serviceAccounts": [
+            {
+                "email": "123456789-compute@developer.gserviceaccount.com",
+                "scopes": ["https://www.googleapis.com/auth/cloud-platform"],
+            }
+        ],
+        "selfLink": zone_url + "/instances/" + name,
+        "scheduling": {
+            "onHostMaintenance": "MIGRATE",
+            "automaticRestart": True,
+            "preemptible": False,
+        },
+        "cpuPlatform": "Intel Broadwell",
+        "labels": {"env": "prod", "team": "team-{}".format(index % 7)},
+        "labelFingerprint": "vezUS-42LLM=",
+        "startRestricted": False,
+        "deletionProtection": False,
+        "shieldedInstanceConfig": {
+            "enableSecureBoot": False,
+            "enableVtpm": True,
+            "enableIntegrityMonitoring": True,
+        },
+        "fingerprint": "jRwKrPHAUTc=",
+        "lastStartTimestamp": "2021-06-01T10:00:10.000-07:00",
+    }
+
+
+def _disk(index, zone):
+    zone_url = "{}/zones/{}".format(PROJECT, zone)
+    name = "disk-{}".format(index)
+    return {
+        "kind": "compute#disk",
+        "id": str(8000000000000000000 + index),
+        "creationTimestamp": "2021-06-01T10:00:00.000-07:00",
+        "name": name,
+        "sizeGb": "100",
+        "zone": zone_url,
+        "status": "READY",
+        "selfLink": zone_url + "/disks/" + name,
+        "sourceImage": "https://www.googleapis.com/compute/v1/projects/debian-cloud/global/images/debian-11-bullseye-v20210609",
+        "sourceImageId": "6371839342898826385",
+        "type": zone_url + "/diskTypes/pd-balanced",
+        "licenses": [
+            "https://www.googleapis.com/compute/v1/projects/debian-cloud/global/licenses/debian-11-bullseye"
+        ],
+        "guestOsFeatures": [{"type": "UEFI_COMPATIBLE"}, {"type": "GVNIC"}],
+        "lastAttachTimestamp": "2021-06-01T10:00:00.000-07:00",
+        "users": [zone_url + "/instances/instance-{}".format(index)],
+        "labels": {"env": "prod"},
+        "labelFingerprint": "vezUS-42LLM=",
+        "licenseCodes": ["3853522013536123851"],
+        "physicalBlockSizeBytes": "4096",
+        "satisfiesPzs": False,
+    }
+
+
+def _operation(index, zone):
+    zone_url = "{}/zones/{}".format(PROJECT, zone)
+    return {
+        "kind": "compute#operation",
+        "id": str(9000000000000000000 + index),
+        "name": "operation-1622566800000-5c3b1d{:06d}".format(index),
+        "zone": zone_url,
+        "operationType": "insert",
+        "targetLink": zone_url + "/instances/instance-{}".format(index),
+        "targetId": str(7000000000000000000 + index),
+        "status": "DONE",
+        "user": "someone@example.com",
+        "progress": 100,
+        "insertTime": "2021-06-01T10:00:00.000-07:00",
+        "startTime": "2021-06-01T10:00:01.000-07:00",
+        "endTime": "2021-06-01T10:00:09.000-07:00",
+        "selfLink": zone_url + "/operations/operation-{}".format(index),
+    }
+
+
+def _page(kind, key, make_item, items):
+    per_zone = items // len(ZONES)
+    scopes = {}
+    for zone_index, zone in enumerate(ZONES):
+        scopes["zones/" + zone] = {
+            key: [make_item(zone_index * per_zone + i, zone) for i in range(per_zone)]
+        }
+    scopes["zones/asia-east1-a"] = {
+        "warning": {
+            "code": "NO_RESULTS_ON_PAGE",
+            "message": "There are no results for scope 'zones/asia-east1-a' on this page.",
+            "data": [{"key": "scope", "value": "zones/asia-east1-a"}],
+        }
+    }
+    return json.dumps(
+        {
+            "kind": kind,
+            "id": "projects/my-project/aggregated/" + key,
+            "items": scopes,
+            "nextPageToken": "CkAKPgo8CjpodHRwczovL3d3dy5nb29nbGVhcGlzLmNvbS9jb21wdXRl",
+            "selfLink": PROJECT + "/aggregated/" + key,
+        }
+    ).encode("utf-8")
+
+
+def _scan(message_type, key, payload, lazy):
+    page = response_decoding.from_json(message_type, payload, lazy=lazy)
+    for scoped in page.items.values():
+        for item in getattr(scoped, key):
+            item.name, item.status, item.zone
+
+
+def _per_call(func, number):
+    func()
+    start = time.process_time()
+    for _ in range(number):
+        func()
+    return (time.process_time() - start) / number * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--number", type=int, default=10)
+    parser.add_argument("--items", type=int, default=500)
+    args = parser.parse_args()
+
+    cases = [
+        (
+            compute.InstanceAggregatedList,
+            "instances",
+            _page("compute#instanceAggregatedList", "instances", _instance, args.items),
+        ),
+        (
+            compute.DiskAggregatedList,
+            "disks",
+            _page("compute#diskAggregatedList", "disks", _disk, args.items),
+        ),
+        (
+            compute.OperationAggregatedList,
+            "operations",
+            _page(
+                "compute#operationAggregatedList", "operations", _operation, args.items
+            ),
+        ),
+    ]
+    backends = ["json"]
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        pass
+    else:
+        backends.append("orjson")
+
+    print(
+        "{:<26}{:>16}".format("page", "from_json (ms)")
+        + "".join("{:>16}".format(b + " (ms)") for b in backends)
+    )
+    for message_type, _, payload in cases:
+        expected = message_type.from_json(payload, ignore_unknown_fields=True)
+        reference = _per_call(
+            lambda: message_type.from_json(payload, ignore_unknown_fields=True),
+            args.number,
+        )
+        row = "{:<26}{:>16.1f}".format(message_type.__name__, reference)
+        for backend in backends:
+            response_decoding.set_json_backend(backend)
+            assert response_decoding.from_json(message_type, payload) == expected
+            elapsed = _per_call(
+                lambda: response_decoding.from_json(message_type, payload), args.number,
+            )
+            row += "{:>9.1f} ({:>3.0f}x)".format(elapsed, reference / elapsed)
+        print(row)
+
+    response_decoding.set_json_backend("auto")
+    print()
+    print("{:<26}{:>16}{:>16}".format("scan", "messages (ms)", "views (ms)"))
+    for message_type, key, payload in cases:
+        full = _per_call(lambda: _scan(message_type, key, payload, False), args.number)
+        lazy = _per_call(lambda: _scan(message_type, key, payload, True), args.number)
+        print(
+            "{:<26}{:>16.1f}{:>9.1f} ({:>3.0f}x)".format(
+                message_type.__name__, full, lazy, full / lazy
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Asynchronous authorized HTTP session used by the ``rest_asyncio`` transports."""
+
+import asyncio
+import collections
+import json
+import os
+import ssl
+import tempfile
+from typing import Callable, Mapping, Optional, Sequence, Tuple
+
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.auth.transport import requests as auth_requests  # type: ignore
+
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 15.0
+DEFAULT_REFRESH_STATUS_CODES = (401,)
+DEFAULT_MAX_REFRESH_ATTEMPTS = 2
+
+_RequestInfo = collections.namedtuple("_RequestInfo", ["method", "url"])
+
+
+class AsyncResponse:
+    """A fully read HTTP response.
+
+    Exposes the subset of :class:`requests.Response` that the REST transports
+    and :func:`google.api_core.exceptions.from_http_response` rely on.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        headers: Mapping[str, str],
+        content: bytes,
+        method: str,
+        url: str,
+    ):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.request = _RequestInfo(method, url)
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", "replace")
+
+    def json(self):
+        return json.loads(self.content)
+
+    def __repr__(self) -> str:
+        return "<AsyncResponse [{}]>".format(self.status_code)
+
+
+def _import_aiohttp():
+    # Imported once a session is used, so that sync clients, which import
+    # this module through the sessions module, do not load aiohttp.
+    try:
+        import aiohttp  # type: ignore
+    except ImportError:  # pragma: NO COVER
+        raise ImportError(
+            "The rest_asyncio transport requires aiohttp. Install it "
+            "with `pip install google-cloud-compute[async_rest]`."
+        )
+    return aiohttp
+
+
+def _stringify_params(params):
+    # aiohttp only accepts str, int and float query values.
+    if not params:
+        return params
+    return [
+        (key, ("true" if value else "false") if isinstance(value, bool) else value)
+        for key, value in params
+    ]
+
+
+class AsyncAuthorizedSession:
+    """An asyncio HTTP session that attaches credentials to each request.
+
+    Requests share one keep-alive connection pool bounded by
+    ``max_connections``; callers beyond the bound wait for a free connection
+    rather than opening new sockets. The underlying :mod:`aiohttp` session is
+    created lazily on first use so that it binds to the running event loop.
+
+    Args:
+        credentials (google.auth.credentials.Credentials): The credentials to
+            attach to requests.
+        max_connections (int): The maximum number of simultaneous connections
+            in the pool. ``0`` means unbounded.
+        max_connections_per_host (int): The maximum number of simultaneous
+            connections to a single host. ``0`` means unbounded.
+        keepalive_timeout (float): Seconds an idle connection is kept open
+            for reuse.
+        refresh_status_codes (Sequence[int]): Response status codes that
+            trigger a credential refresh and a retry of the request.
+        max_refresh_attempts (int): The maximum number of refresh-and-retry
+            cycles for a single request.
+    """
+
+    def __init__(
+        self,
+        credentials: ga_credentials.Credentials,
+        *,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        refresh_status_codes: Sequence[int] = DEFAULT_REFRESH_STATUS_CODES,
+        max_refresh_attempts: int = DEFAULT_MAX_REFRESH_ATTEMPTS,
+    ):
+        self.credentials = credentials
+        self._max_connections = max_connections
+        self._max_connections_per_host = max_connections_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._refresh_status_codes = tuple(refresh_status_codes)
+        self._max_refresh_attempts = max_refresh_attempts
+        self._auth_request = auth_requests.Request()
+        self._ssl_context = None  # type: Optional[ssl.SSLContext]
+        self._session = None
+        self._refresh_lock = None  # type: Optional[asyncio.Lock]
+
+    def configure_mtls_channel(
+        self, client_cert_source: Callable[[], Tuple[bytes, bytes]]
+    ) -> None:
+        """Configure the client certificate presented for mutual TLS.
+
+        Args:
+            client_cert_source (Callable[[], Tuple[bytes, bytes]]): A callback
+                returning the PEM encoded certificate and private key.
+        """
+        cert, key = client_cert_source()
+        context = ssl.create_default_context()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cert_path = os.path.join(tmpdir, "cert.pem")
+            key_path = os.path.join(tmpdir, "key.pem")
+            with open(cert_path, "wb") as cert_file:
+                cert_file.write(cert)
+            with open(key_path, "wb") as key_file:
+                key_file.write(key)
+            context.load_cert_chain(cert_path, key_path)
+        self._ssl_context = context
+
+    def _get_session(self):
+        if self._session is None:
+            aiohttp = _import_aiohttp()
+            connector = aiohttp.TCPConnector(
+                limit=self._max_connections,
+                limit_per_host=self._max_connections_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ssl=self._ssl_context if self._ssl_context is not None else True,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def _refresh_credentials(self, stale_token) -> None:
+        # Refreshing is a blocking call; run it off the event loop and make
+        # concurrent callers share a single refresh.
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        async with self._refresh_lock:
+            token = getattr(self.credentials, "token", None)
+            if self.credentials.valid and token != stale_token:
+                return
+            loop = asyncio.get_event_loop()
+            await loop.run_in_executor(
+                None, self.credentials.refresh, self._auth_request
+            )
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Sequence[Tuple[str, str]]] = None,
+        data: Optional[str] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> AsyncResponse:
+        """Send an authorized request and read the full response.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The request URL.
+            params (Sequence[Tuple[str, str]]): Query string parameters.
+            data (str): The request body.
+            headers (Mapping[str, str]): Additional request headers.
+            timeout (float): The total timeout for the request, in seconds.
+
+        Returns:
+            AsyncResponse: The response.
+        """
+        session = self._get_session()
+        method = method.upper()
+        params = _stringify_params(params)
+        client_timeout = _import_aiohttp().ClientTimeout(total=timeout)
+
+        attempt = 0
+        while True:
+            token = getattr(self.credentials, "token", None)
+            if not self.credentials.valid:
+                await self._refresh_credentials(token)
+                token = self.credentials.token
+            request_headers = dict(headers or {})
+            self.credentials.apply(request_headers)
+
+            async with session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                headers=request_headers,
+                timeout=client_timeout,
+            ) as response:
+                content = await response.read()
+                status_code = response.status
+                response_headers = response.headers
+                response_url = str(response.url)
+
+            if (
+                status_code in self._refresh_status_codes
+                and attempt < self._max_refresh_attempts
+            ):
+                attempt += 1
+                await self._refresh_credentials(token)
+                continue
+
+            return AsyncResponse(
+                status_code, response_headers, content, method, response_url
+            )
+
+    async def get(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str, **kwargs) -> AsyncResponse:
+        return await self.request("DELETE", url, **kwargs)
+
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+
+__all__ = (
+    "AsyncAuthorizedSession",
+    "AsyncResponse",
+)
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Checkpoints of the position of pagers.
+
+A checkpoint is a small JSON document with the request of the page being
+iterated, including its page token, and how many of the results of that
+page have been yielded. A pager made from a checkpoint requests that page
+again and skips the results that were yielded, so a long iteration can
+continue after the process stops without requesting the pages before it
+again.
+"""
+
+import json
+from typing import Any, Tuple, Type
+
+from google.protobuf import json_format
+
+
+def dumps(request: Any, offset: int) -> str:
+    """Return the checkpoint of a pager.
+
+    Args:
+        request (Any): The request of the page being iterated.
+        offset (int): How many results of the page have been yielded.
+    """
+    message = type(request).pb(request)
+    fields = json_format.MessageToDict(message, preserving_proto_field_name=True)
+    if not fields.get("page_token"):
+        # The first page has no page token.
+        fields.pop("page_token", None)
+    return json.dumps(
+        {"type": message.DESCRIPTOR.full_name, "request": fields, "offset": offset},
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+
+
+def loads(checkpoint: str, request_type: Type[Any]) -> Tuple[Any, int]:
+    """Return the request and the count of results to skip of a checkpoint.
+
+    Args:
+        checkpoint (str): A checkpoint returned by ``dumps``.
+        request_type (Type): The type of the request of the method to
+            continue.
+
+    Raises:
+        ValueError: If the checkpoint is not one of a pager of the method.
+    """
+    try:
+        state = json.loads(checkpoint)
+        full_name = state["type"]
+        fields = state["request"]
+        offset = int(state["offset"])
+    except (TypeError, ValueError, KeyError) as exc:
+        raise ValueError("Invalid checkpoint: {!r}".format(checkpoint)) from exc
+    message = request_type.pb()()
+    if full_name != message.DESCRIPTOR.full_name:
+        raise ValueError(
+            "The checkpoint is of a {} and not of a {}.".format(
+                full_name, message.DESCRIPTOR.full_name
+            )
+        )
+    json_format.ParseDict(fields, message)
+    return request_type.wrap(message), offset
@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client information of the generated clients and transports.
+
+The version of the installed ``google-cloud-compute`` distribution is looked
+up once, on the first request that sends a user agent, instead of when the
+services are imported.
+"""
+
+import functools
+from typing import Optional
+
+from google.api_core import gapic_v1
+
+DISTRIBUTION = "google-cloud-compute"
+
+
+@functools.lru_cache(maxsize=None)
+def gapic_version() -> Optional[str]:
+    """Return the installed version of the package.
+
+    Returns:
+        Optional[str]: The version, or ``None`` if the package is not
+            installed as a distribution.
+    """
+    try:
+        from importlib import metadata
+    except ImportError:  # pragma: NO COVER
+        # Python < 3.8.
+        try:
+            import importlib_metadata as metadata  # type: ignore
+        except ImportError:
+            import pkg_resources
+
+            try:
+                return pkg_resources.get_distribution(DISTRIBUTION).version
+            except pkg_resources.DistributionNotFound:
+                return None
+    try:
+        return metadata.version(DISTRIBUTION)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+class ClientInfo(gapic_v1.client_info.ClientInfo):
+    """Client information whose ``gapic_version`` defaults to the version of
+    the installed package, as returned by :func:`gapic_version`.
+
+    Takes the same arguments as
+    :class:`google.api_core.gapic_v1.client_info.ClientInfo`.
+    """
+
+    @property
+    def gapic_version(self) -> Optional[str]:
+        # The value is kept in the instance dict, from which the base class
+        # formats the user agent.
+        if self.__dict__.get("gapic_version") is None:
+            self.__dict__["gapic_version"] = gapic_version()
+        return self.__dict__["gapic_version"]
+
+    @gapic_version.setter
+    def gapic_version(self, value: Optional[str]) -> None:
+        self.__dict__["gapic_version"] = value
+
+
+__all__ = ("ClientInfo", "gapic_version")
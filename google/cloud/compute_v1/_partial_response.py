@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Formatting of the ``fields`` system parameter for partial responses.
+
+A selection is a comma-separated list of fields. ``a/b`` selects field ``b``
+of ``a``, ``a(b,c)`` selects fields ``b`` and ``c`` of ``a``, and ``*``
+matches every key of a map, as in ``items/*/instances(name,status)``.
+"""
+
+from typing import List, Sequence, Union
+
+PAGE_TOKEN_FIELD = "nextPageToken"
+
+
+def _top_level(fields: str) -> List[str]:
+    """Split a selection on the commas that are outside parentheses."""
+    selections = []
+    depth = 0
+    start = 0
+    for index, char in enumerate(fields):
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+            if depth < 0:
+                raise ValueError("Unbalanced parentheses in fields {!r}".format(fields))
+        elif char == "," and depth == 0:
+            selections.append(fields[start:index].strip())
+            start = index + 1
+    if depth:
+        raise ValueError("Unbalanced parentheses in fields {!r}".format(fields))
+    selections.append(fields[start:].strip())
+    return selections
+
+
+def format_fields(fields: Union[str, Sequence[str]], *, paged: bool = False) -> str:
+    """Build the value of the ``fields`` query parameter.
+
+    Args:
+        fields (Union[str, Sequence[str]]): A selection such as
+            ``"items(name,status)"``, or a sequence of selections that is
+            joined with commas.
+        paged (bool): Whether the method is paged. ``nextPageToken`` is
+            added to selections that leave it out, so that pagers can
+            still fetch the following pages.
+
+    Returns:
+        str: The parameter value.
+
+    Raises:
+        ValueError: If the selection is empty or its parentheses are
+            unbalanced.
+    """
+    if not isinstance(fields, str):
+        fields = ",".join(fields)
+    selections = _top_level(fields)
+    if not all(selections):
+        raise ValueError("Empty selection in fields {!r}".format(fields))
+
+    if paged:
+        roots = {
+            selection.split("/", 1)[0].split("(", 1)[0].strip()
+            for selection in selections
+        }
+        if PAGE_TOKEN_FIELD not in roots and "*" not in roots:
+            selections.append(PAGE_TOKEN_FIELD)
+    return ",".join(selections)
+
+
+__all__ = ("format_fields",)
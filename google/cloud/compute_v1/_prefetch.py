@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Background fetching of the following pages of pagers.
+
+A pager requests the next page only once the caller is done with the
+current one, so the time to iterate is the time spent waiting for pages
+plus the time spent processing them. With ``prefetch`` set, a background
+worker requests the following pages while the caller processes the
+current one, so that the time to iterate approaches the larger of the
+two.
+
+The worker runs at most ``depth`` pages ahead of the caller: it takes a
+slot before requesting a page and the caller gives the slot back when it
+takes the page, so no more than ``depth`` pages are held besides the
+one being processed. An error requesting a page is raised to the caller
+when it reaches that page, and the worker stops once the caller stops
+iterating.
+"""
+
+import asyncio
+import queue
+import threading
+from typing import Any, AsyncIterator, Callable, Iterator, Sequence, Tuple
+
+# Put after the last page.
+_DONE = object()
+
+
+class _Error:
+    def __init__(self, exception):
+        self.exception = exception
+
+
+def pages(
+    method: Callable[..., Any],
+    request: Any,
+    response: Any,
+    depth: int,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> Iterator[Tuple[str, Any]]:
+    """Yield the page token and page of ``response`` and of the pages
+    following it, requesting up to ``depth`` pages ahead on a background
+    thread.
+
+    Args:
+        method (Callable): The method to request each page with.
+        request (Any): The request of the first page.
+        response (Any): The first page.
+        depth (int): The most pages to request ahead.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+    """
+    if not response.next_page_token:
+        yield request.page_token, response
+        return
+    first_page_token = request.page_token
+    request = type(request)(request)
+
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+    ready = queue.Queue()
+
+    def fetch():
+        page = response
+        try:
+            while page.next_page_token:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                request.page_token = page.next_page_token
+                page = method(request, metadata=metadata)
+                ready.put((request.page_token, page))
+            ready.put(_DONE)
+        except Exception as exc:
+            ready.put(_Error(exc))
+
+    worker = threading.Thread(target=fetch, name="PagerPrefetch", daemon=True)
+    worker.start()
+    try:
+        yield first_page_token, response
+        while True:
+            entry = ready.get()
+            if entry is _DONE:
+                return
+            if isinstance(entry, _Error):
+                raise entry.exception
+            # The worker may request another page while this one is used.
+            slots.release()
+            yield entry
+    finally:
+        # Wake the worker if it waits for a slot, so that it stops.
+        stopped.set()
+        slots.release()
+
+
+async def async_pages(
+    method: Callable[..., Any],
+    request: Any,
+    response: Any,
+    depth: int,
+    metadata: Sequence[Tuple[str, str]] = (),
+) -> AsyncIterator[Tuple[str, Any]]:
+    """Yield the page token and page of ``response`` and of the pages
+    following it, requesting up to ``depth`` pages ahead in a background
+    task.
+
+    Args:
+        method (Callable): The coroutine function to request each page
+            with.
+        request (Any): The request of the first page.
+        response (Any): The first page.
+        depth (int): The most pages to request ahead.
+        metadata (Sequence[Tuple[str, str]]): Strings which should be
+            sent along with each request as metadata.
+    """
+    if not response.next_page_token:
+        yield request.page_token, response
+        return
+    first_page_token = request.page_token
+    request = type(request)(request)
+
+    slots = asyncio.Semaphore(depth)
+    ready = asyncio.Queue()
+
+    async def fetch():
+        page = response
+        try:
+            while page.next_page_token:
+                await slots.acquire()
+                request.page_token = page.next_page_token
+                page = await method(request, metadata=metadata)
+                ready.put_nowait((request.page_token, page))
+            ready.put_nowait(_DONE)
+        except Exception as exc:
+            ready.put_nowait(_Error(exc))
+
+    worker = asyncio.ensure_future(fetch())
+    try:
+        yield first_page_token, response
+        while True:
+            entry = await ready.get()
+            if entry is _DONE:
+                return
+            if isinstance(entry, _Error):
+                raise entry.exception
+            # The worker may request another page while this one is used.
+            slots.release()
+            yield entry
+    finally:
+        worker.cancel()
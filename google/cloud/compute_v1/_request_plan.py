@@ -0,0 +1,333 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Precompiled HTTP request plans used by the REST transports.
+
+A :class:`RequestPlan` produces the same URI, query parameters and body as
+:func:`google.api_core.path_template.transcode` followed by the JSON
+encoding of the query parameters, but analyzes the HTTP rule and the layout
+of the request message once instead of on every call. Requests are read
+straight from the underlying protobuf message, without converting them to a
+``dict`` or round-tripping the query parameters through JSON.
+"""
+
+import base64
+import math
+import re
+import struct
+import threading
+import urllib.parse
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple
+
+from google.protobuf import descriptor as descriptor_lib
+
+_FieldDescriptor = descriptor_lib.FieldDescriptor
+
+_VARIABLE_RE = re.compile(r"{([^}]*)}")
+_FIELD_NAME_RE = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+_INT64_TYPES = frozenset(
+    (
+        _FieldDescriptor.TYPE_INT64,
+        _FieldDescriptor.TYPE_UINT64,
+        _FieldDescriptor.TYPE_SINT64,
+        _FieldDescriptor.TYPE_FIXED64,
+        _FieldDescriptor.TYPE_SFIXED64,
+    )
+)
+_PASSTHROUGH_TYPES = frozenset(
+    (
+        _FieldDescriptor.TYPE_STRING,
+        _FieldDescriptor.TYPE_BOOL,
+        _FieldDescriptor.TYPE_INT32,
+        _FieldDescriptor.TYPE_UINT32,
+        _FieldDescriptor.TYPE_SINT32,
+        _FieldDescriptor.TYPE_FIXED32,
+        _FieldDescriptor.TYPE_SFIXED32,
+    )
+)
+
+
+def _encode_special_float(value):
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "-Infinity" if value < 0 else "Infinity"
+    return None
+
+
+def _encode_double(value):
+    special = _encode_special_float(value)
+    return value if special is None else special
+
+
+def _encode_float(value):
+    special = _encode_special_float(value)
+    if special is not None:
+        return special
+    # Match json_format: the shortest decimal that round-trips through a
+    # 32-bit float.
+    for precision in range(6, 10):
+        candidate = float("{0:.{1}g}".format(value, precision))
+        if struct.unpack("<f", struct.pack("<f", candidate))[0] == value:
+            return candidate
+    return value
+
+
+def _encode_bytes(value):
+    return base64.b64encode(value).decode("utf-8")
+
+
+def _make_enum_encoder(enum_type):
+    names = {value.number: value.name for value in enum_type.values}
+
+    def encode(value):
+        return names.get(value, value)
+
+    return encode
+
+
+def _scalar_encoder(field: _FieldDescriptor) -> Optional[Callable[[Any], Any]]:
+    """Return the JSON encoder for a scalar field, ``None`` for identity."""
+    if field.type in _PASSTHROUGH_TYPES:
+        return None
+    if field.type in _INT64_TYPES:
+        return str
+    if field.type == _FieldDescriptor.TYPE_DOUBLE:
+        return _encode_double
+    if field.type == _FieldDescriptor.TYPE_FLOAT:
+        return _encode_float
+    if field.type == _FieldDescriptor.TYPE_BYTES:
+        return _encode_bytes
+    if field.type == _FieldDescriptor.TYPE_ENUM:
+        return _make_enum_encoder(field.enum_type)
+    raise TypeError(
+        "Field '{}' of type {} cannot be sent as a query parameter.".format(
+            field.full_name, field.type
+        )
+    )
+
+
+def _is_repeated(field: _FieldDescriptor) -> bool:
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is None:
+        return field.label == _FieldDescriptor.LABEL_REPEATED
+    return is_repeated
+
+
+def _has_presence(field: _FieldDescriptor) -> bool:
+    has_presence = getattr(field, "has_presence", None)
+    if has_presence is None:
+        return (
+            field.containing_oneof is not None
+            or field.type == _FieldDescriptor.TYPE_MESSAGE
+        )
+    return has_presence
+
+
+class _Binding:
+    """A single compiled HTTP rule."""
+
+    __slots__ = ("method", "uri_format", "path_fields", "body_field", "body_type")
+
+    def __init__(self, request_type, http_option: Mapping[str, str]):
+        uri = http_option["uri"]
+        path_fields = _VARIABLE_RE.findall(uri)
+        for name in path_fields:
+            # The Compute Engine API only binds top-level fields to plain
+            # ``{field}`` segments; anything else needs the generic
+            # transcoder.
+            if not _FIELD_NAME_RE.match(name):
+                raise ValueError(
+                    "Unsupported path variable '{{{}}}' in '{}'.".format(name, uri)
+                )
+
+        self.method = http_option["method"]
+        self.uri_format = _VARIABLE_RE.sub("{}", uri)
+        self.path_fields = tuple(path_fields)
+        self.body_field = http_option.get("body")
+        self.body_type = None
+        if self.body_field:
+            if self.body_field == "*":
+                raise ValueError("Unsupported body '*' in '{}'.".format(uri))
+            self.body_type = request_type.meta.fields[self.body_field].message
+
+    def expand(self, request, pb) -> Optional[Tuple[str, str, Optional[str]]]:
+        values = []
+        for name in self.path_fields:
+            value = urllib.parse.quote(str(getattr(pb, name)), safe="/")
+            # Each variable must match the single-segment pattern ``*``.
+            if not value or "/" in value:
+                return None
+            values.append(value)
+
+        body = None
+        if self.body_field:
+            if not pb.HasField(self.body_field):
+                return None
+            body = self.body_type.to_json(
+                getattr(request, self.body_field),
+                including_default_value_fields=False,
+                use_integers_for_enums=False,
+            )
+        return self.method, self.uri_format.format(*values), body
+
+
+class RequestPlan:
+    """Turns request messages of one type into HTTP requests.
+
+    The plan is compiled on first use and is immutable afterwards, so a
+    single plan can be shared by every transport that calls the method.
+
+    Args:
+        request_type (Type[proto.Message]): The request message class.
+        http_options (Sequence[Mapping[str, str]]): The HTTP rules of the
+            method, in the format accepted by
+            :func:`google.api_core.path_template.transcode`.
+        required_fields_default_values (Optional[Mapping[str, Any]]): Query
+            parameters, keyed by JSON name, that are always sent, using
+            the given value when the request leaves them unset.
+    """
+
+    def __init__(
+        self,
+        request_type,
+        http_options: Sequence[Mapping[str, str]],
+        *,
+        required_fields_default_values: Optional[Mapping[str, Any]] = None,
+    ):
+        self._request_type = request_type
+        self._http_options = http_options
+        self._required_fields_default_values = dict(
+            required_fields_default_values or {}
+        )
+        self._lock = threading.Lock()
+        self._bindings = None  # type: Optional[Tuple[_Binding, ...]]
+        self._query_fields = None  # type: Optional[Tuple[Tuple, ...]]
+
+    def _compile(self) -> None:
+        with self._lock:
+            if self._bindings is not None:
+                return
+            bindings = tuple(
+                _Binding(self._request_type, http_option)
+                for http_option in self._http_options
+            )
+            # Every binding of a Compute Engine method uses the same path
+            # and body fields, so the remaining fields are the query string.
+            excluded = set(bindings[0].path_fields)
+            excluded.add(bindings[0].body_field)
+
+            descriptor = self._request_type.pb().DESCRIPTOR
+            query_fields = []
+            for field in sorted(descriptor.fields, key=lambda f: f.number):
+                if field.name in excluded:
+                    continue
+                query_fields.append(
+                    (
+                        field.name,
+                        field.json_name,
+                        _scalar_encoder(field),
+                        _is_repeated(field),
+                        _has_presence(field),
+                    )
+                )
+            self._query_fields = tuple(query_fields)
+            self._bindings = bindings
+
+    def expand(self, request) -> Tuple[str, str, Optional[str]]:
+        """Resolve the HTTP method, URI and JSON body of a request.
+
+        Args:
+            request (proto.Message): The request message.
+
+        Returns:
+            Tuple[str, str, Optional[str]]: The HTTP method, the URI path and
+                the JSON encoded body, or ``None`` if the method has no body.
+
+        Raises:
+            ValueError: If the request does not match any HTTP rule, for
+                example because a path field is not set.
+        """
+        if self._bindings is None:
+            self._compile()
+        pb = self._request_type.pb(request)
+        for binding in self._bindings:
+            expanded = binding.expand(request, pb)
+            if expanded is not None:
+                return expanded
+
+        raise ValueError(
+            "Invalid request."
+            "\nSome of the fields of the request message are either not "
+            "initialized or initialized with an invalid value."
+            "\nPlease make sure your request matches at least one accepted "
+            "HTTP binding.\nTo match a binding the request message must have "
+            "all the required fields initialized with values matching their "
+            "patterns as listed below:{}".format(
+                "".join(
+                    '\n\tURI: "{}"\n\tRequired request fields:{}'.format(
+                        http_option["uri"],
+                        "".join(
+                            '\n\t\tfield: "{}", pattern: "*"'.format(name)
+                            for name in binding.path_fields
+                        ),
+                    )
+                    for http_option, binding in zip(self._http_options, self._bindings)
+                )
+            )
+        )
+
+    def query_params(self, request) -> List[Tuple[str, Any]]:
+        """Build the query parameters of a request.
+
+        Args:
+            request (proto.Message): The request message.
+
+        Returns:
+            List[Tuple[str, Any]]: The query parameters, in the form
+                produced by :func:`google.api_core.rest_helpers.flatten_query_params`.
+        """
+        if self._bindings is None:
+            self._compile()
+        pb = self._request_type.pb(request)
+        params = []
+        for name, json_name, encode, repeated, has_presence in self._query_fields:
+            if repeated:
+                values = getattr(pb, name)
+                if encode is None:
+                    params.extend((json_name, value) for value in values)
+                else:
+                    params.extend((json_name, encode(value)) for value in values)
+                continue
+            if has_presence:
+                if not pb.HasField(name):
+                    continue
+                value = getattr(pb, name)
+            else:
+                value = getattr(pb, name)
+                if not value:
+                    continue
+            params.append((json_name, value if encode is None else encode(value)))
+
+        if self._required_fields_default_values:
+            present = {key for key, _ in params}
+            for key, value in self._required_fields_default_values.items():
+                if key not in present:
+                    params.append((key, value))
+        return params
+
+
+__all__ = ("RequestPlan",)
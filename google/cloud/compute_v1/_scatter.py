@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Parallel listing of the scopes of ``aggregated_list`` pagers.
+
+An aggregated list returns the resources of every zone and region page by
+page, one page after the other. Every page names all scopes, with a
+warning for those that have no resources on it, so when there are more
+pages the pager can instead list each scope with the ``list`` method of
+the service that holds its resources, several scopes at a time, and yield
+each scope as one page in place of the aggregated pages once it is
+complete. Whole project sweeps then take about as long as the largest
+scope instead of the sum of all pages.
+
+The resources of a scope are listed by the service itself if its ``list``
+method takes that kind of scope, or else by the sibling service named
+after it: ``region_disks`` for the regional disks of ``disks``,
+``global_addresses`` for the global addresses of ``addresses``, and so on.
+If a scope has no such service, the pager pages sequentially.
+
+Each scope is listed with the ``retry``, ``timeout``, ``metadata``,
+``prefetch`` and ``page_sizer`` arguments of the aggregated list.
+"""
+
+import concurrent.futures
+import functools
+import inspect
+import re
+from typing import Any, Callable, Iterator, Optional, Sequence, Tuple
+
+from google.api_core import gapic_v1
+
+from google.cloud.compute_v1 import _siblings
+
+# The request field of each kind of scope key, such as "zones/us-central1-a".
+_SCOPE_FIELDS = {"zones": "zone", "regions": "region", "global": None}
+# The request fields copied from the aggregated request to the list requests.
+_COPIED_FIELDS = ("project", "filter", "max_results", "order_by")
+
+
+@functools.lru_cache(maxsize=None)
+def lister(service: str, kind: str) -> Optional[str]:
+    """Return the service that lists the resources of a kind of scope of an
+    aggregated list, or ``None``.
+
+    Args:
+        service (str): The module name of the service of the aggregated
+            list, such as ``"disks"``.
+        kind (str): ``"zones"``, ``"regions"`` or ``"global"``.
+    """
+    if kind not in _SCOPE_FIELDS:
+        return None
+    base = re.sub(r"^(global|region|zone)_", "", service)
+    candidates = {
+        "zones": (base, "zone_" + base),
+        "regions": ("region_" + base, base),
+        "global": ("global_" + base, base),
+    }[kind]
+    field = _SCOPE_FIELDS[kind]
+    for candidate in candidates:
+        try:
+            cls = _siblings.client_class(candidate)
+        except (ImportError, AttributeError):
+            continue
+        if not hasattr(cls, "list"):
+            continue
+        params = inspect.signature(cls.list).parameters
+        if field is None and "zone" not in params and "region" not in params:
+            return candidate
+        if field is not None and field in params:
+            return candidate
+    return None
+
+
+def _list_scope(transport, service, kind, name, request, scoped_list_type, options):
+    list_request = {
+        field: getattr(request, field)
+        for field in _COPIED_FIELDS
+        if field in request and getattr(request, field)
+    }
+    if request.return_partial_success:
+        list_request["return_partial_success"] = True
+    field = _SCOPE_FIELDS[kind]
+    if field is not None:
+        list_request[field] = name
+    pager = _siblings.client(transport, service).list(request=list_request, **options)
+    items = [item for page in pager.pages for item in page.items]
+    item_field = next(
+        field for field in scoped_list_type.meta.fields if field != "warning"
+    )
+    return scoped_list_type(**{item_field: items})
+
+
+def scatter(
+    transport: Any,
+    service: str,
+    max_workers: int,
+    *,
+    retry: Any = gapic_v1.method.DEFAULT,
+    timeout: Any = gapic_v1.method.DEFAULT,
+    metadata: Sequence[Tuple[str, str]] = (),
+    prefetch: int = 0,
+    page_sizer: Any = None,
+) -> Callable[[Any, Any], Optional[Iterator[Any]]]:
+    """Return the function an ``AggregatedListPager`` calls to list its
+    remaining scopes in parallel.
+
+    The function takes the aggregated request and its first response, and
+    returns an iterator of aggregated responses, one per scope, or ``None``
+    if a scope cannot be listed on its own.
+
+    Args:
+        transport (Any): The transport of the client.
+        service (str): The module name of the service of the aggregated
+            list.
+        max_workers (int): The most scopes to list at once.
+        retry (google.api_core.retry.Retry): The retry of each ``list``
+            request.
+        timeout (float): The timeout of each ``list`` request.
+        metadata (Sequence[Tuple[str, str]]): The metadata of each ``list``
+            request.
+        prefetch (int): The most following pages of each scope to request
+            in the background.
+        page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+            If set, tunes the size of the pages of each scope.
+    """
+    options = dict(
+        retry=retry,
+        timeout=timeout,
+        metadata=metadata,
+        prefetch=prefetch,
+        page_sizer=page_sizer,
+    )
+
+    def scatter_pages(request, first_response):
+        scopes = []
+        for key in first_response.items:
+            kind, _, name = key.partition("/")
+            sibling = lister(service, kind)
+            if sibling is None:
+                return None
+            scopes.append((key, kind, name, sibling))
+        return _gather(request, first_response, scopes)
+
+    def _gather(request, first_response, scopes):
+        response_type = type(first_response)
+        scoped_list_type = type(first_response).meta.fields["items"].message
+        scoped_list_type = scoped_list_type.meta.fields["value"].message
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="AggregatedListPager"
+        )
+        futures = {
+            executor.submit(
+                _list_scope,
+                transport,
+                sibling,
+                kind,
+                name,
+                request,
+                scoped_list_type,
+                options,
+            ): key
+            for key, kind, name, sibling in scopes
+        }
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                key = futures[future]
+                scoped_list = future.result()
+                if not scoped_list:
+                    # Keep the warning that the scope is empty.
+                    scoped_list = first_response.items[key]
+                yield response_type(id=first_response.id, items={key: scoped_list})
+        finally:
+            # Stop listing scopes if the iteration is abandoned or fails.
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    return scatter_pages
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Clients of other services that send their requests like a transport.
+
+Helpers such as operation futures and parallel pagers call services other
+than the one of the client they were made by. They call them through a
+client that shares the host, credentials, HTTP session, retry policy and
+rate limiter of the original transport, created once per transport and
+service.
+"""
+
+import importlib
+import threading
+from typing import Any
+
+_lock = threading.Lock()
+
+
+def client_class(service: str) -> Any:
+    """Return the synchronous client class of a service.
+
+    Args:
+        service (str): The module name of the service, such as
+            ``"zone_operations"``.
+
+    Raises:
+        ImportError: If there is no such service.
+    """
+    module = importlib.import_module("google.cloud.compute_v1.services." + service)
+    return getattr(
+        module, "".join(word.capitalize() for word in service.split("_")) + "Client"
+    )
+
+
+def client(transport: Any, service: str) -> Any:
+    """Return a client of a service that sends its requests like
+    ``transport``.
+
+    Args:
+        transport (Any): The transport to share the settings of.
+        service (str): The module name of the service, such as
+            ``"zone_operations"``.
+    """
+    with _lock:
+        clients = transport.__dict__.setdefault("_sibling_clients", {})
+        sibling = clients.get(service)
+        if sibling is None:
+            cls = client_class(service)
+            sibling = clients[service] = cls(
+                transport=cls.get_transport_class("rest")(
+                    host=transport._host,
+                    credentials=transport._credentials,
+                    session=getattr(transport, "_session", None),
+                    retry_policy=getattr(transport, "_retry_policy", None),
+                    rate_limiter=getattr(transport, "_rate_limiter", None),
+                )
+            )
+    return sibling
@@ -0,0 +1,360 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Send many calls in one HTTP request through the batch endpoint.
+
+Calls added to a :class:`Batch` are queued instead of sent. When the
+``with`` block exits they are sent as ``multipart/mixed`` requests to the
+Compute Engine batch endpoint, at most :data:`MAX_BATCH_SIZE` calls per
+request, and each call's future is resolved with its decoded response or
+with the exception the call would have raised on its own:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    instances = compute_v1.InstancesClient()
+    with compute_v1.batch(instances) as b:
+        futures = [
+            b.add(instances.get, project=project, zone=zone, instance=name)
+            for name in names
+        ]
+    for future in futures:
+        print(future.result().status)
+
+Calls of any synchronous client can share a batch, as long as the clients
+use the same endpoint. The batch is sent with the session of the client
+given to :func:`batch`, or of the first call's client. Retry and timeout
+settings of the individual methods do not apply to batched calls, and
+paged methods return their first page instead of a pager.
+"""
+
+import concurrent.futures
+import re
+import urllib.parse
+import uuid
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+from google.api_core import exceptions as core_exceptions
+import requests
+
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import response_decoding
+
+BATCH_PATH = "/batch/compute/v1"
+MAX_BATCH_SIZE = 1000
+
+_CONTENT_ID_RE = re.compile(r"\+(\d+)>?$")
+_BOUNDARY_RE = re.compile(r'boundary="?([^";]+)"?')
+
+
+class _Call:
+    __slots__ = ("method", "uri", "body", "headers", "response_type", "future")
+
+    def __init__(self, method, uri, body, headers, response_type):
+        self.method = method
+        self.uri = uri
+        self.body = body
+        self.headers = headers
+        self.response_type = response_type
+        self.future = concurrent.futures.Future()
+
+
+def _split_head(data: bytes) -> Tuple[List[bytes], bytes]:
+    """Split an HTTP message into its header lines and its body."""
+    crlf = data.find(b"\r\n\r\n")
+    lf = data.find(b"\n\n")
+    if crlf != -1 and (lf == -1 or crlf < lf):
+        head, body = data[:crlf], data[crlf + 4 :]
+    elif lf != -1:
+        head, body = data[:lf], data[lf + 2 :]
+    else:
+        head, body = data, b""
+    return head.splitlines(), body
+
+
+def _parse_headers(lines: Sequence[bytes]) -> dict:
+    headers = requests.structures.CaseInsensitiveDict()
+    for line in lines:
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip()] = value.strip()
+    return headers
+
+
+def _split_multipart(content_type: str, content: bytes) -> List[bytes]:
+    match = _BOUNDARY_RE.search(content_type)
+    if match is None:
+        raise ValueError("Batch response is not multipart: {!r}".format(content_type))
+    delimiter = b"--" + match.group(1).encode("latin-1")
+    parts = []
+    for chunk in content.split(delimiter)[1:]:
+        if chunk.startswith(b"--"):
+            break
+        parts.append(chunk.strip(b"\r\n"))
+    return parts
+
+
+class Batch:
+    """Collects calls and sends them through the batch endpoint.
+
+    Args:
+        client (Optional[Any]): A synchronous Compute Engine client whose
+            session and endpoint the batch uses. If ``None``, those of the
+            first added call are used.
+        max_batch_size (int): The maximum number of calls per HTTP request.
+            Larger batches are split.
+        timeout (Optional[float]): The timeout of each HTTP request.
+    """
+
+    def __init__(
+        self,
+        client: Any = None,
+        *,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        timeout: Optional[float] = None,
+    ):
+        if not 0 < max_batch_size <= MAX_BATCH_SIZE:
+            raise ValueError(
+                "max_batch_size must be between 1 and {}.".format(MAX_BATCH_SIZE)
+            )
+        self._max_batch_size = max_batch_size
+        self._timeout = timeout
+        self._session = None
+        self._host = None
+        self._calls = []  # type: List[_Call]
+        if client is not None:
+            self._bind(client.transport)
+
+    def _bind(self, transport) -> None:
+        session = getattr(transport, "_session", None)
+        if not isinstance(session, requests.Session):
+            raise TypeError(
+                "{} does not send requests through a synchronous HTTP session "
+                "and cannot be batched.".format(type(transport).__name__)
+            )
+        if self._session is None:
+            self._session = session
+            self._host = transport._host
+        elif transport._host != self._host:
+            raise ValueError(
+                "Cannot batch calls to {} with calls to {}.".format(
+                    transport._host, self._host
+                )
+            )
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    def add(
+        self,
+        method: Callable,
+        request: Any = None,
+        *,
+        metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
+        **kwargs,
+    ) -> concurrent.futures.Future:
+        """Queue a call.
+
+        Args:
+            method (Callable): A method of a synchronous Compute Engine
+                client, such as ``client.get`` or ``client.stop_unary``.
+            request (Union[proto.Message, dict]): The request, as it would
+                be passed to ``method``.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the call as headers.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response; see the ``fields`` argument of ``get``.
+            **kwargs: Fields of the request, instead of ``request``, like
+                the flattened arguments of ``method``.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the response message
+                once the batch is sent.
+
+        Raises:
+            TypeError: If ``method`` cannot be batched.
+            ValueError: If both ``request`` and request fields are given,
+                or the request does not match the method's HTTP rule.
+        """
+        client = getattr(method, "__self__", None)
+        transport = getattr(client, "transport", None)
+        name = getattr(method, "__name__", "")
+        if name.endswith("_unary"):
+            name = name[: -len("_unary")]
+        stub = getattr(transport, name, None)
+        plan = getattr(stub, "_PLAN", None)
+        if plan is None:
+            raise TypeError("{!r} cannot be batched.".format(method))
+        self._bind(transport)
+
+        if request is not None and kwargs:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+        request_type = plan._request_type
+        if not isinstance(request, request_type):
+            request = request_type(request)
+            for key, value in kwargs.items():
+                setattr(request, key, value)
+
+        http_method, uri, body = plan.expand(request)
+        query_params = plan.query_params(request)
+        if fields is not None:
+            query_params.append(("fields", _partial_response.format_fields(fields)))
+        if query_params:
+            uri += "?" + urllib.parse.urlencode(query_params)
+        headers = dict(metadata)
+        headers["Content-Type"] = "application/json"
+        response_type = type(stub).__call__.__annotations__["return"]
+
+        call = _Call(http_method.upper(), uri, body, headers, response_type)
+        self._calls.append(call)
+        return call.future
+
+    def execute(self) -> None:
+        """Send the queued calls and resolve their futures.
+
+        Calls added afterwards are sent by the next :meth:`execute`.
+        """
+        calls, self._calls = self._calls, []
+        for start in range(0, len(calls), self._max_batch_size):
+            self._send(calls[start : start + self._max_batch_size])
+
+    def cancel(self) -> None:
+        """Cancel the queued calls without sending them."""
+        calls, self._calls = self._calls, []
+        for call in calls:
+            call.future.cancel()
+
+    def _send(self, calls: Sequence[_Call]) -> None:
+        boundary = "batch_" + uuid.uuid4().hex
+        url = "https://{host}{path}".format(host=self._host, path=BATCH_PATH)
+        try:
+            response = self._session.post(
+                url,
+                data=self._encode(boundary, calls),
+                headers={"Content-Type": "multipart/mixed; boundary=" + boundary},
+                timeout=self._timeout,
+            )
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            responses = self._decode(
+                response.headers.get("Content-Type", ""), response.content
+            )
+        except Exception as exc:
+            for call in calls:
+                call.future.set_exception(exc)
+            return
+
+        for index, call in enumerate(calls):
+            part = responses.get(index)
+            if part is None:
+                call.future.set_exception(
+                    core_exceptions.InternalServerError(
+                        "The batch response has no part for {} {}".format(
+                            call.method, call.uri
+                        )
+                    )
+                )
+                continue
+            part.request = requests.Request(
+                call.method, "https://{}{}".format(self._host, call.uri)
+            ).prepare()
+            try:
+                if part.status_code >= 400:
+                    raise core_exceptions.from_http_response(part)
+                result = response_decoding.from_json(call.response_type, part.content)
+            except Exception as exc:
+                call.future.set_exception(exc)
+            else:
+                call.future.set_result(result)
+
+    @staticmethod
+    def _encode(boundary: str, calls: Sequence[_Call]) -> bytes:
+        chunks = []
+        for index, call in enumerate(calls):
+            lines = [
+                "--" + boundary,
+                "Content-Type: application/http",
+                "Content-ID: <{}+{}>".format(boundary, index),
+                "",
+                "{} {} HTTP/1.1".format(call.method, call.uri),
+            ]
+            lines.extend(
+                "{}: {}".format(key, value) for key, value in call.headers.items()
+            )
+            lines.extend(("", call.body or ""))
+            chunks.append("\r\n".join(lines))
+        chunks.append("--" + boundary + "--\r\n")
+        return "\r\n".join(chunks).encode("utf-8")
+
+    @staticmethod
+    def _decode(content_type: str, content: bytes) -> dict:
+        """Map the index of each call to its response."""
+        responses = {}
+        for part in _split_multipart(content_type, content):
+            part_lines, message = _split_head(part)
+            match = _CONTENT_ID_RE.search(
+                _parse_headers(part_lines).get("Content-ID", "")
+            )
+            if match is None:
+                continue
+            lines, body = _split_head(message)
+            response = requests.Response()
+            response.status_code = int(lines[0].split()[1])
+            response.headers = _parse_headers(lines[1:])
+            response._content = body
+            response.encoding = "utf-8"
+            responses[int(match.group(1))] = response
+        return responses
+
+    def __enter__(self) -> "Batch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.execute()
+        else:
+            self.cancel()
+
+
+def batch(
+    client: Any = None,
+    *,
+    max_batch_size: int = MAX_BATCH_SIZE,
+    timeout: Optional[float] = None,
+) -> Batch:
+    """Start a batch of calls; see :class:`Batch`.
+
+    Args:
+        client (Optional[Any]): A synchronous Compute Engine client whose
+            session and endpoint the batch uses.
+        max_batch_size (int): The maximum number of calls per HTTP request.
+        timeout (Optional[float]): The timeout of each HTTP request.
+
+    Returns:
+        Batch: The batch, to be used as a context manager.
+    """
+    return Batch(client, max_batch_size=max_batch_size, timeout=timeout)
+
+
+__all__ = (
+    "BATCH_PATH",
+    "Batch",
+    "MAX_BATCH_SIZE",
+    "batch",
+)
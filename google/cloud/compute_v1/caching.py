@@ -0,0 +1,547 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Cache the responses of catalog clients.
+
+Machine types, disk types, accelerator types, zones, regions and image
+families rarely change, but every lookup of one is a round trip to the
+service. A :class:`Cache` set as the ``cache`` option of the clients of
+these resources keeps their responses:
+
+- A response is reused for an equal request, including its page token,
+  until it is ``ttl`` seconds old.
+- A response is only reused by clients of the same endpoint that act as the
+  same principal, so that clients with other credentials sharing a cache,
+  or a :class:`DiskCache` file, are not served each other's responses.
+- The cache holds at most ``max_entries`` responses, and evicts others to
+  make room for new ones.
+- Errors are not cached.
+
+:class:`ResponseCache` keeps the responses in the memory of the process,
+and :class:`DiskCache` in a database file that the processes of a host
+share, so that short-lived processes do not each fetch the same data.
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    cache = compute_v1.ResponseCache(ttl=3600)
+    options = compute_v1.ClientOptions(cache=cache)
+    machine_types = compute_v1.MachineTypesClient(client_options=options)
+    zones = compute_v1.ZonesClient(client_options=options)
+
+    machine_types.get(project=project, zone=zone, machine_type="e2-medium")
+    print(cache.stats())
+
+    # Shared by the processes of the host.
+    cache = compute_v1.DiskCache("/var/cache/compute", ttl=3600)
+
+Other clients ignore the option, so the same options can be passed to all
+clients; :class:`~google.cloud.compute_v1.ImagesClient` only caches
+:meth:`~google.cloud.compute_v1.ImagesClient.get_from_family`. Every caller
+gets a copy of a cached message, so changing it does not change what the
+cache holds. Views, with ``views=True``, are read-only and are not copied,
+and are not kept by a :class:`DiskCache`.
+"""
+
+import abc
+import collections
+import contextlib
+import functools
+import hashlib
+import inspect
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Callable, Hashable, Iterator, NamedTuple, Optional, Tuple
+
+import proto  # type: ignore
+
+from google.auth import credentials as ga_credentials  # type: ignore
+
+# The identities of credentials that do not tell who they act as.
+_tokens = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+_tokens_lock = threading.Lock()
+
+
+class CacheStats(NamedTuple):
+    """A snapshot of the counters of a :class:`Cache`.
+
+    Attributes:
+        hits (int): The number of calls answered from the cache.
+        misses (int): The number of calls sent to the service, including
+            those whose cached response had expired.
+        evictions (int): The number of responses dropped to make room for
+            others.
+        size (int): The number of responses held.
+        errors (int): The number of lookups and stores that failed, and
+            were treated as misses or skipped.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    errors: int = 0
+
+
+def _request_key(request: Any) -> Tuple[str, bytes]:
+    message = type(request).pb(request)
+    # The page token selects the page, not the resources, so pages of one
+    # request are invalidated together.
+    if "page_token" in message.DESCRIPTOR.fields_by_name:
+        message = type(message)()
+        message.CopyFrom(type(request).pb(request))
+        message.ClearField("page_token")
+    return (
+        message.DESCRIPTOR.full_name,
+        message.SerializeToString(deterministic=True),
+    )
+
+
+def _entry_key(request: Any, scope: Hashable, kwargs: dict) -> Tuple[Any, ...]:
+    return (
+        _request_key(request),
+        getattr(request, "page_token", ""),
+        bool(kwargs.get("views")),
+        kwargs.get("fields"),
+        scope,
+    )
+
+
+def _principal(credentials: Any) -> str:
+    """Return who credentials act as.
+
+    The principal is the same in every process when the credentials tell it,
+    such as the email of a service account; otherwise it is unique to the
+    credentials object, and its responses are not shared with other
+    processes.
+    """
+    if isinstance(credentials, ga_credentials.AnonymousCredentials):
+        principal = "anonymous"
+    else:
+        principal = getattr(credentials, "service_account_email", None)
+        refresh_token = getattr(credentials, "refresh_token", None)
+        if not isinstance(principal, str) and isinstance(refresh_token, str):
+            principal = "user:" + hashlib.sha256(refresh_token.encode()).hexdigest()
+        if not isinstance(principal, str):
+            with _tokens_lock:
+                try:
+                    principal = _tokens.get(credentials)
+                    if principal is None:
+                        principal = "object:" + uuid.uuid4().hex
+                        _tokens[credentials] = principal
+                except TypeError:
+                    # Credentials that cannot be weakly referenced.
+                    principal = "object:{}:{}".format(os.getpid(), id(credentials))
+    quota_project_id = getattr(credentials, "quota_project_id", None)
+    return "{}.{}:{}:{}".format(
+        type(credentials).__module__,
+        type(credentials).__qualname__,
+        principal,
+        quota_project_id if isinstance(quota_project_id, str) else "",
+    )
+
+
+def _scope(transport: Any) -> Tuple[str, str]:
+    return transport._host, _principal(transport._credentials)
+
+
+def _digest(key: Any) -> str:
+    return hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _message_type(full_name: str) -> Optional[Any]:
+    # The response types of the clients are all in the types module.
+    from google.cloud.compute_v1.types import compute
+
+    message_type = getattr(compute, full_name.rsplit(".", 1)[-1], None)
+    if message_type is None or message_type.pb().DESCRIPTOR.full_name != full_name:
+        return None
+    return message_type
+
+
+def _copy(response: Any) -> Any:
+    if isinstance(response, proto.Message):
+        return type(response)(response)
+    return response
+
+
+class Cache(abc.ABC):
+    """A cache of the responses of clients."""
+
+    @abc.abstractmethod
+    def lookup(
+        self, request: Any, *, scope: Hashable = None, **kwargs
+    ) -> Optional[Any]:
+        """Return the cached response of a request, or ``None``.
+
+        Args:
+            request (proto.Message): The request.
+            scope (Hashable): The endpoint and the principal of the call.
+                Only responses stored with the same scope are returned.
+            kwargs: The ``views`` and ``fields`` arguments of the call.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def store(
+        self, request: Any, response: Any, *, scope: Hashable = None, **kwargs
+    ) -> None:
+        """Cache the response of a request.
+
+        Args:
+            request (proto.Message): The request.
+            response (Any): The response.
+            scope (Hashable): The endpoint and the principal of the call.
+            kwargs: The ``views`` and ``fields`` arguments of the call.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def invalidate(self, request: Any) -> int:
+        """Drop the cached responses of a request, and return how many were
+        dropped.
+
+        All pages of a list request are dropped, whatever its page token,
+        and whatever the scope of the calls that stored them.
+
+        Args:
+            request (proto.Message): The request, such as a
+                :class:`~google.cloud.compute_v1.types.GetMachineTypeRequest`.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Drop every cached response."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def stats(self) -> CacheStats:
+        """Return the counters of the cache."""
+        raise NotImplementedError()
+
+
+class ResponseCache(Cache):
+    """A cache of responses in memory with an expiry time and a bound on
+    the number of entries.
+
+    A cache is safe to share between threads and clients, and evicts the
+    least recently used response when it is full.
+
+    Args:
+        ttl (float): How long a response is reused, in seconds.
+        max_entries (int): The most responses held at once.
+        clock (Callable[[], float]): The monotonic clock that ages the
+            responses, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 300.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if ttl <= 0:
+            raise ValueError("Expected ttl > 0.")
+        if max_entries < 1:
+            raise ValueError("Expected max_entries >= 1.")
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Maps (request key, page token, options, scope) to (expiry,
+        # response), in the order of last use.
+        self._entries = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(
+        self, request: Any, *, scope: Hashable = None, **kwargs
+    ) -> Optional[Any]:
+        key = _entry_key(request, scope, kwargs)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            response = entry[1]
+        return _copy(response)
+
+    def store(
+        self, request: Any, response: Any, *, scope: Hashable = None, **kwargs
+    ) -> None:
+        key = _entry_key(request, scope, kwargs)
+        entry = (self._clock() + self._ttl, _copy(response))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, request: Any) -> int:
+        request_key = _request_key(request)
+        with self._lock:
+            keys = [key for key in self._entries if key[0] == request_key]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, len(self._entries)
+            )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCache(Cache):
+    """A cache of responses in an SQLite database, shared by the processes
+    that use the same directory.
+
+    Responses are stored encoded, with their expiry time, so a response
+    cached by one process is reused by the others until it expires. A cache
+    is safe to share between threads, and between processes, including
+    forked ones. When it is full, the responses closest to expiry are
+    evicted. A failure of the database, such as a full disk, does not fail
+    the call: the response is fetched, or not cached, and counted in
+    ``errors`` of :meth:`stats`.
+
+    Args:
+        directory (str): The directory of the database, created if needed.
+        ttl (float): How long a response is reused, in seconds.
+        max_entries (int): The most responses held at once.
+        clock (Callable[[], float]): The wall clock that ages the
+            responses, in seconds. It is shared by processes, so it must not
+            be a monotonic clock.
+    """
+
+    FILENAME = "compute-responses.sqlite3"
+
+    def __init__(
+        self,
+        directory: str,
+        *,
+        ttl: float = 3600.0,
+        max_entries: int = 65536,
+        clock: Callable[[], float] = time.time,
+    ):
+        if ttl <= 0:
+            raise ValueError("Expected ttl > 0.")
+        if max_entries < 1:
+            raise ValueError("Expected max_entries >= 1.")
+        os.makedirs(directory, exist_ok=True)
+        self._path = os.path.join(directory, self.FILENAME)
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._errors = 0
+        with self._transaction() as db:
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, request TEXT NOT NULL, "
+                "expires REAL NOT NULL, type TEXT NOT NULL, value BLOB NOT NULL)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_request ON responses (request)"
+            )
+            db.execute(
+                "CREATE INDEX IF NOT EXISTS responses_expires ON responses (expires)"
+            )
+
+    @property
+    def path(self) -> str:
+        """The path of the database."""
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        local = self._local
+        # Connections are not shared with other threads, nor with the
+        # children of a fork.
+        if getattr(local, "pid", None) != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=30, isolation_level=None)
+            # Readers do not wait for writers in write-ahead logging mode.
+            connection.execute("PRAGMA journal_mode=WAL")
+            local.connection = connection
+            local.pid = os.getpid()
+        return local.connection
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def lookup(
+        self, request: Any, *, scope: Hashable = None, **kwargs
+    ) -> Optional[Any]:
+        try:
+            row = (
+                self._connection()
+                .execute(
+                    "SELECT type, value FROM responses WHERE key = ? AND expires > ?",
+                    (_digest(_entry_key(request, scope, kwargs)), self._clock()),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error:
+            self._count("_errors")
+            row = None
+        response_type = row and _message_type(row[0])
+        if response_type is None:
+            self._count("_misses")
+            return None
+        self._count("_hits")
+        return response_type.deserialize(row[1])
+
+    def store(
+        self, request: Any, response: Any, *, scope: Hashable = None, **kwargs
+    ) -> None:
+        if not isinstance(response, proto.Message):
+            return
+        now = self._clock()
+        row = (
+            _digest(_entry_key(request, scope, kwargs)),
+            _digest(_request_key(request)),
+            now + self._ttl,
+            type(response).pb(response).DESCRIPTOR.full_name,
+            type(response).serialize(response),
+        )
+        try:
+            with self._transaction() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", row
+                )
+                db.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+                (size,) = db.execute("SELECT COUNT(*) FROM responses").fetchone()
+                evicted = 0
+                if size > self._max_entries:
+                    evicted = db.execute(
+                        "DELETE FROM responses WHERE key IN (SELECT key FROM "
+                        "responses ORDER BY expires LIMIT ?)",
+                        (size - self._max_entries,),
+                    ).rowcount
+        except sqlite3.Error:
+            self._count("_errors")
+            return
+        with self._lock:
+            self._evictions += evicted
+
+    def invalidate(self, request: Any) -> int:
+        with self._transaction() as db:
+            return db.execute(
+                "DELETE FROM responses WHERE request = ?",
+                (_digest(_request_key(request)),),
+            ).rowcount
+
+    def clear(self) -> None:
+        with self._transaction() as db:
+            db.execute("DELETE FROM responses")
+
+    def stats(self) -> CacheStats:
+        (size,) = (
+            self._connection()
+            .execute(
+                "SELECT COUNT(*) FROM responses WHERE expires > ?", (self._clock(),)
+            )
+            .fetchone()
+        )
+        with self._lock:
+            return CacheStats(
+                self._hits, self._misses, self._evictions, size, self._errors
+            )
+
+
+def cached(func: Callable, cache: Optional[Cache], transport: Any) -> Callable:
+    """Make a transport method answer from a cache when it can.
+
+    Args:
+        func (Callable): The transport method, which takes the request as
+            its first argument.
+        cache (Optional[Cache]): The cache. If ``None``, ``func`` is
+            returned unchanged.
+        transport (Any): The transport of the method, whose endpoint and
+            credentials scope the responses.
+
+    Returns:
+        Callable: The cached method, a coroutine function if ``func`` is one.
+    """
+    if cache is None:
+        return func
+
+    if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    ):
+
+        @functools.wraps(func)
+        async def call(request, *args, **kwargs):
+            scope = _scope(transport)
+            response = cache.lookup(request, scope=scope, **kwargs)
+            if response is None:
+                response = await func(request, *args, **kwargs)
+                cache.store(request, response, scope=scope, **kwargs)
+            return response
+
+    else:
+
+        @functools.wraps(func)
+        def call(request, *args, **kwargs):
+            scope = _scope(transport)
+            response = cache.lookup(request, scope=scope, **kwargs)
+            if response is None:
+                response = func(request, *args, **kwargs)
+                cache.store(request, response, scope=scope, **kwargs)
+            return response
+
+    return call
+
+
+__all__ = (
+    "Cache",
+    "CacheStats",
+    "DiskCache",
+    "ResponseCache",
+    "cached",
+)
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client options for the Compute Engine clients.
+
+Extends :class:`google.api_core.client_options.ClientOptions` with settings
+that only apply to the Compute Engine REST transports. Every client accepts
+either this class, the plain ``google.api_core`` class, or a ``dict`` with
+any of the options below.
+"""
+
+from typing import Any, Mapping
+
+from google.api_core import client_options as client_options_lib
+
+
+class ClientOptions(client_options_lib.ClientOptions):
+    """Client options for the Compute Engine clients.
+
+    Accepts every argument of
+    :class:`google.api_core.client_options.ClientOptions`, plus:
+
+    Args:
+        session (Optional[google.auth.transport.requests.AuthorizedSession]):
+            An HTTP session for the transport to send requests through
+            instead of opening its own. Pass the same session to several
+            clients to share one connection pool and one set of
+            credentials; see :func:`google.cloud.compute_v1.create_session`.
+            Async clients take an
+            :class:`~google.cloud.compute_v1._async_session.AsyncAuthorizedSession`.
+        retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+            The default retry and timeout of the methods of the client. If
+            ``None``,
+            :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+        rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+            A limiter that paces the calls of the client. Pass the same
+            limiter to several clients to keep all of them within the rate
+            quotas of a project; see :mod:`google.cloud.compute_v1.rate_limiting`.
+        cache (Optional[google.cloud.compute_v1.caching.Cache]):
+            A cache of the responses of the catalog clients: accelerator
+            types, disk types, machine types, regions, zones and
+            ``get_from_family`` of images. Other clients ignore it; see
+            :mod:`google.cloud.compute_v1.caching`.
+        coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+            Shares one HTTP ``GET`` among identical reads in flight at the
+            same time. Pass the same coalescer to several clients to share
+            calls among them; see :mod:`google.cloud.compute_v1.coalescing`.
+    """
+
+    def __init__(
+        self,
+        *args,
+        session: Any = None,
+        retry_policy: Any = None,
+        rate_limiter: Any = None,
+        cache: Any = None,
+        coalescer: Any = None,
+        **kwargs
+    ):
+        super(ClientOptions, self).__init__(*args, **kwargs)
+        self.session = session
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.coalescer = coalescer
+
+
+def from_dict(options: Mapping[str, object]) -> ClientOptions:
+    """Construct a client options object from a mapping object.
+
+    Args:
+        options (collections.abc.Mapping): A mapping object with client options.
+            See the docstring for ClientOptions for details on valid arguments.
+    """
+    client_options = ClientOptions()
+
+    for key, value in options.items():
+        if hasattr(client_options, key):
+            setattr(client_options, key, value)
+        else:
+            raise ValueError("ClientOptions does not accept an option '" + key + "'")
+
+    return client_options
+
+
+__all__ = (
+    "ClientOptions",
+    "from_dict",
+)
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Share one call among identical reads in flight at the same time.
+
+When many threads read the same resource at once, such as the latest image
+of a family, each of them sends the same HTTP ``GET``. A
+:class:`RequestCoalescer` set as the ``coalescer`` option of clients sends
+only the first of them; the others wait for its response instead of
+sending their own:
+
+- Only methods sent as HTTP ``GET`` are coalesced, and only with calls of
+  the same method, request, ``views`` and ``fields``, sent to the same
+  endpoint by clients that act as the same principal.
+- Every waiting caller gets a copy of the decoded response, or the error of
+  the call.
+- A call is only shared while it is in flight; the next one is sent again.
+  See :mod:`google.cloud.compute_v1.caching` to reuse responses for longer.
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    options = compute_v1.ClientOptions(coalescer=compute_v1.RequestCoalescer())
+    images = compute_v1.ImagesClient(client_options=options)
+
+    # Called from many threads at once.
+    images.get_from_family(project="debian-cloud", family="debian-11")
+
+Each call that waits uses the retry, timeout and metadata of the call it
+waits for. A call that is cancelled, or interrupted by anything other than
+an :class:`Exception`, is not shared: the calls that waited for it send
+their own.
+"""
+
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Hashable, NamedTuple, Optional
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.caching import _principal
+
+# The result of a call that did not finish.
+_ABANDONED = object()
+
+
+class CoalescerStats(NamedTuple):
+    """A snapshot of the counters of a :class:`RequestCoalescer`.
+
+    Attributes:
+        calls (int): The number of calls sent.
+        coalesced (int): The number of calls that waited for another one
+            instead of being sent.
+        in_flight (int): The number of calls being sent.
+    """
+
+    calls: int
+    coalesced: int
+    in_flight: int
+
+
+class _Call:
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self, done):
+        self.done = done
+        self.result = _ABANDONED
+        self.error = None  # type: Optional[Exception]
+        self.waiters = 0
+
+    @property
+    def abandoned(self) -> bool:
+        return self.error is None and self.result is _ABANDONED
+
+    def outcome(self) -> Any:
+        if self.error is not None:
+            raise self.error
+        return _copy(self.result)
+
+
+def _copy(response: Any) -> Any:
+    if isinstance(response, proto.Message):
+        return type(response)(response)
+    # Views are read-only.
+    return response
+
+
+class RequestCoalescer:
+    """Shares one call among identical calls in flight at the same time.
+
+    A coalescer is safe to share between threads and clients, and between
+    sync and async clients. Async calls are only shared with calls of the
+    same event loop.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}  # type: Dict[Hashable, _Call]
+        self._count = 0
+        self._coalesced = 0
+
+    def _join(self, key: Hashable, new_event: Callable[[], Any]):
+        # Return the call of the key and whether the caller sends it.
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = _Call(new_event())
+                self._count += 1
+                return call, True
+            call.waiters += 1
+            self._coalesced += 1
+            return call, False
+
+    def _finish(self, key: Hashable, call: _Call) -> bool:
+        # Return whether other calls wait for the result.
+        with self._lock:
+            del self._calls[key]
+            return call.waiters > 0
+
+    def call(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Return the result of ``func``, or of the call in flight with the
+        same key.
+
+        Args:
+            key (Hashable): The key of identical calls.
+            func (Callable[[], Any]): Sends the call.
+        """
+        while True:
+            call, leader = self._join(key, threading.Event)
+            if leader:
+                break
+            call.done.wait()
+            if not call.abandoned:
+                return call.outcome()
+
+        shared = False
+        try:
+            call.result = func()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            shared = self._finish(key, call)
+            call.done.set()
+        # The caller may change its response, but not the one it shares.
+        return _copy(call.result) if shared else call.result
+
+    async def call_async(
+        self, key: Hashable, func: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the result of ``func``, or of the call in flight with the
+        same key; see :meth:`call`.
+
+        Args:
+            key (Hashable): The key of identical calls.
+            func (Callable[[], Awaitable[Any]]): Sends the call.
+        """
+        key = (asyncio.get_running_loop(), key)
+        while True:
+            call, leader = self._join(key, asyncio.Event)
+            if leader:
+                break
+            await call.done.wait()
+            if not call.abandoned:
+                return call.outcome()
+
+        shared = False
+        try:
+            call.result = await func()
+        except Exception as exc:
+            call.error = exc
+            raise
+        finally:
+            shared = self._finish(key, call)
+            call.done.set()
+        return _copy(call.result) if shared else call.result
+
+    def stats(self) -> CoalescerStats:
+        """Return the counters of the coalescer."""
+        with self._lock:
+            return CoalescerStats(self._count, self._coalesced, len(self._calls))
+
+
+def _key(transport: Any, request: Any, kwargs: dict) -> Hashable:
+    message = type(request).pb(request)
+    return (
+        transport._host,
+        # Responses are not shared between principals.
+        _principal(transport._credentials),
+        message.DESCRIPTOR.full_name,
+        message.SerializeToString(deterministic=True),
+        bool(kwargs.get("views")),
+        kwargs.get("fields"),
+    )
+
+
+def coalesce(
+    func: Callable, coalescer: Optional[RequestCoalescer], transport: Any
+) -> Callable:
+    """Make a transport method share its calls with identical calls in
+    flight.
+
+    Args:
+        func (Callable): The transport method, which takes the request as
+            its first argument and is sent as an HTTP ``GET``.
+        coalescer (Optional[RequestCoalescer]): The coalescer. If ``None``,
+            ``func`` is returned unchanged.
+        transport (Any): The transport of the method.
+
+    Returns:
+        Callable: The coalesced method, a coroutine function if ``func`` is
+        one.
+    """
+    if coalescer is None:
+        return func
+
+    if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    ):
+
+        @functools.wraps(func)
+        async def coalesced(request, *args, **kwargs):
+            return await coalescer.call_async(
+                _key(transport, request, kwargs),
+                lambda: func(request, *args, **kwargs),
+            )
+
+    else:
+
+        @functools.wraps(func)
+        def coalesced(request, *args, **kwargs):
+            return coalescer.call(
+                _key(transport, request, kwargs),
+                lambda: func(request, *args, **kwargs),
+            )
+
+    return coalesced
+
+
+__all__ = (
+    "CoalescerStats",
+    "RequestCoalescer",
+    "coalesce",
+)
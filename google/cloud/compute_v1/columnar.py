@@ -0,0 +1,589 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Read fields of list results into columns.
+
+Turning the results of ``list`` and ``aggregated_list`` into a data frame
+one message at a time decodes every field of every result into a message,
+only to copy a few of them out again. The ``to_columns`` method of pagers
+reads only the selected fields of the remaining results, by column, without
+creating a message for each result:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    instances = compute_v1.InstancesClient()
+    pager = instances.aggregated_list(project=project, views=True)
+    columns = pager.to_columns(
+        {
+            "name": "name",
+            "status": "status",
+            "ip": "network_interfaces[0].network_i_p",
+            "disk_sizes": "disks.disk_size_gb",
+            "team": "labels.team",
+        }
+    )
+    frame = columns.to_arrow().to_pandas()
+
+With ``views=True``, the fields are converted from the JSON objects of the
+pages; otherwise, they are read from the protobuf messages of the pages.
+
+The columns are given as a sequence of paths, or as a mapping from the
+names of the columns to paths. A path is a dot-separated sequence of field
+names, as they are named on the message classes:
+
+- A path ends at a scalar, repeated scalar or map field. Repeated and map
+  fields give a ``list`` and a ``dict`` per result.
+- ``field[i]`` selects the ``i``-th element of a repeated field; a negative
+  index counts from the end.
+- A repeated message field without an index collects the values of the rest
+  of the path from each of its elements into a flat ``list``.
+- The name that follows a map field is a key of the map.
+
+Fields that are not set, and elements and keys that do not exist, are
+``None``.
+
+:meth:`Columns.to_arrow` and :meth:`Columns.to_numpy` need :mod:`pyarrow`
+and :mod:`numpy`; install them with
+``pip install google-cloud-compute[arrow]`` and
+``pip install google-cloud-compute[numpy]``.
+"""
+
+import re
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from google.protobuf import descriptor as descriptor_lib
+
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._request_plan import _has_presence
+
+_FieldDescriptor = descriptor_lib.FieldDescriptor
+
+ColumnPaths = Union[Sequence[str], Mapping[str, str]]
+
+# Operations of the steps of a path.
+_FIELD = 0  # A message field.
+_INDEX = 1  # An element of a repeated message field.
+_EACH = 2  # All elements of a repeated message field.
+_KEY = 3  # A value of a map of messages.
+_SCALAR = 4
+_SCALAR_INDEX = 5  # An element of a repeated scalar field.
+_SCALAR_KEY = 6  # A value of a map of scalars.
+_REPEATED = 7  # A repeated scalar field.
+_MAP = 8  # A map of scalars.
+
+_SEGMENT_RE = re.compile(r"^(\w+)(?:\[(-?\d+)\])?$")
+
+# The names of the pyarrow types and the numpy dtypes of scalar fields.
+_ARROW_TYPES = {
+    _FieldDescriptor.TYPE_DOUBLE: "float64",
+    _FieldDescriptor.TYPE_FLOAT: "float32",
+    _FieldDescriptor.TYPE_INT64: "int64",
+    _FieldDescriptor.TYPE_SINT64: "int64",
+    _FieldDescriptor.TYPE_SFIXED64: "int64",
+    _FieldDescriptor.TYPE_UINT64: "uint64",
+    _FieldDescriptor.TYPE_FIXED64: "uint64",
+    _FieldDescriptor.TYPE_INT32: "int32",
+    _FieldDescriptor.TYPE_SINT32: "int32",
+    _FieldDescriptor.TYPE_SFIXED32: "int32",
+    _FieldDescriptor.TYPE_ENUM: "int32",
+    _FieldDescriptor.TYPE_UINT32: "uint32",
+    _FieldDescriptor.TYPE_FIXED32: "uint32",
+    _FieldDescriptor.TYPE_BOOL: "bool_",
+    _FieldDescriptor.TYPE_STRING: "string",
+    _FieldDescriptor.TYPE_BYTES: "binary",
+}
+
+
+class _Step(NamedTuple):
+    op: int
+    name: str
+    json_name: str
+    # The index or key of the step, and how to convert JSON values.
+    arg: Any = None
+    convert: Optional[Callable] = None
+
+
+class _Column(NamedTuple):
+    name: str
+    steps: Tuple[_Step, ...]
+    # "scalar", "list" or "map", and the pyarrow types of the values and of
+    # the keys of maps.
+    shape: str
+    value_type: str
+    key_type: Optional[str] = None
+
+
+def _scalar_converter(field) -> Optional[Callable]:
+    if field.type == _FieldDescriptor.TYPE_FLOAT:
+        return response_decoding._to_float32
+    return response_decoding._single_converter(field, None)
+
+
+def _map_entry(field):
+    entry_type = field.message_type
+    if entry_type is not None and entry_type.GetOptions().map_entry:
+        return entry_type.fields_by_name["key"], entry_type.fields_by_name["value"]
+    return None
+
+
+def _compile(name: str, descriptor, path: str) -> _Column:
+    """Compile the path of a column of the fields of ``descriptor``."""
+    segments = path.split(".")
+    steps = []  # type: List[_Step]
+    shape = "scalar"
+    position = 0
+    while position < len(segments):
+        match = _SEGMENT_RE.match(segments[position])
+        if match is None:
+            raise ValueError("Invalid path {!r}.".format(path))
+        field = descriptor.fields_by_name.get(match.group(1))
+        if field is None:
+            raise ValueError(
+                "Invalid path {!r}: {} has no field {!r}.".format(
+                    path, descriptor.name, match.group(1)
+                )
+            )
+        index = None if match.group(2) is None else int(match.group(2))
+        last = position == len(segments) - 1
+        position += 1
+        entry = _map_entry(field)
+        if entry is not None and index is None:
+            key_field, value_field = entry
+            if last:
+                if value_field.type == _FieldDescriptor.TYPE_MESSAGE:
+                    break
+                convert_key = None
+                if key_field.type != _FieldDescriptor.TYPE_STRING:
+                    convert_key = response_decoding._MAP_KEY_CONVERTERS.get(
+                        key_field.type, int
+                    )
+                convert = response_decoding._map(
+                    convert_key, _scalar_converter(value_field)
+                )
+                if shape != "scalar":
+                    raise ValueError(
+                        "Invalid path {!r}: maps of the elements of a repeated "
+                        "field cannot be collected; select a key.".format(path)
+                    )
+                steps.append(_Step(_MAP, field.name, field.json_name, None, convert))
+                return _Column(
+                    name,
+                    tuple(steps),
+                    "map",
+                    _ARROW_TYPES[value_field.type],
+                    _ARROW_TYPES[key_field.type],
+                )
+            key = segments[position]
+            position += 1
+            if value_field.type == _FieldDescriptor.TYPE_MESSAGE:
+                steps.append(_Step(_KEY, field.name, field.json_name, key))
+                descriptor = value_field.message_type
+                continue
+            if position < len(segments):
+                break
+            convert = _scalar_converter(value_field)
+            steps.append(_Step(_SCALAR_KEY, field.name, field.json_name, key, convert))
+            return _Column(name, tuple(steps), shape, _ARROW_TYPES[value_field.type])
+        repeated = response_decoding._is_repeated(field)
+        if index is not None and (not repeated or entry is not None):
+            raise ValueError(
+                "Invalid path {!r}: {} is not a repeated field.".format(
+                    path, field.name
+                )
+            )
+        if field.type == _FieldDescriptor.TYPE_MESSAGE:
+            if last:
+                break
+            if not repeated:
+                op, arg = _FIELD, _has_presence(field)
+            elif index is None:
+                op, arg = _EACH, None
+                shape = "list"
+            else:
+                op, arg = _INDEX, index
+            steps.append(_Step(op, field.name, field.json_name, arg))
+            descriptor = field.message_type
+            continue
+        if not last:
+            break
+        convert = _scalar_converter(field)
+        if not repeated:
+            # Fields without presence read as their default, like in
+            # messages.
+            default = None if _has_presence(field) else field.default_value
+            steps.append(_Step(_SCALAR, field.name, field.json_name, default, convert))
+        elif index is None:
+            steps.append(_Step(_REPEATED, field.name, field.json_name, None, convert))
+            shape = "list"
+        else:
+            steps.append(
+                _Step(_SCALAR_INDEX, field.name, field.json_name, index, convert)
+            )
+        return _Column(name, tuple(steps), shape, _ARROW_TYPES[field.type])
+    raise ValueError(
+        "Invalid path {!r}: a path ends at a scalar, repeated scalar or map "
+        "field.".format(path)
+    )
+
+
+def _element(values, index: int):
+    if -len(values) <= index < len(values):
+        return values[index]
+    return None
+
+
+def _json_field(obj, step: _Step):
+    value = obj.get(step.json_name)
+    if value is None and step.name != step.json_name:
+        value = obj.get(step.name)
+    return value
+
+
+def _convert(step: _Step, value):
+    if value is None or step.convert is None:
+        return value
+    value = step.convert(value)
+    return None if value is response_decoding._SKIP else value
+
+
+def _from_json(obj, steps: Sequence[_Step]):
+    """Read the value at ``steps`` from the JSON object of a message."""
+    for position, step in enumerate(steps):
+        value = _json_field(obj, step)
+        op = step.op
+        if op == _FIELD or op == _INDEX or op == _KEY:
+            if op == _INDEX and value is not None:
+                value = _element(value, step.arg)
+            elif op == _KEY and value is not None:
+                value = value.get(step.arg)
+            if value is None:
+                return None
+            obj = value
+        elif op == _EACH:
+            rest = steps[position + 1 :]
+            collected = []  # type: List[Any]
+            for item in value or ():
+                _collect(collected, _from_json(item, rest), rest)
+            return collected
+        elif op == _SCALAR:
+            if value is None:
+                return step.arg
+            return _convert(step, value)
+        elif op == _SCALAR_INDEX:
+            return _convert(step, _element(value or (), step.arg))
+        elif op == _SCALAR_KEY:
+            return _convert(step, (value or {}).get(step.arg))
+        elif op == _REPEATED:
+            if value is None:
+                return []
+            return list(value) if step.convert is None else step.convert(value)
+        else:
+            return {} if value is None else _convert(step, value)
+
+
+def _from_pb(message, steps: Sequence[_Step]):
+    """Read the value at ``steps`` from a protobuf message."""
+    for position, step in enumerate(steps):
+        op = step.op
+        if op == _FIELD:
+            if step.arg and not message.HasField(step.name):
+                return None
+            message = getattr(message, step.name)
+        elif op == _INDEX:
+            message = _element(getattr(message, step.name), step.arg)
+            if message is None:
+                return None
+        elif op == _KEY:
+            message = getattr(message, step.name).get(step.arg)
+            if message is None:
+                return None
+        elif op == _EACH:
+            rest = steps[position + 1 :]
+            collected = []  # type: List[Any]
+            for item in getattr(message, step.name):
+                _collect(collected, _from_pb(item, rest), rest)
+            return collected
+        elif op == _SCALAR:
+            if step.arg is None and not message.HasField(step.name):
+                return None
+            return getattr(message, step.name)
+        elif op == _SCALAR_INDEX:
+            return _element(getattr(message, step.name), step.arg)
+        elif op == _SCALAR_KEY:
+            return getattr(message, step.name).get(step.arg)
+        elif op == _REPEATED:
+            return list(getattr(message, step.name))
+        else:
+            return dict(getattr(message, step.name))
+
+
+def _collect(collected: List[Any], value, rest: Sequence[_Step]) -> None:
+    # Values that are lists themselves are flattened.
+    if any(step.op in (_EACH, _REPEATED) for step in rest):
+        collected.extend(value)
+    else:
+        collected.append(value)
+
+
+class Columns:
+    """The values of fields of list results, by column, as returned by the
+    ``to_columns`` method of pagers.
+
+    The values of a column are indexed by result, in the order the pager
+    iterates the results.
+    """
+
+    def __init__(
+        self, columns: Sequence[_Column], values: Sequence[List[Any]], rows: int
+    ):
+        self._columns = tuple(columns)
+        self._names = tuple(column.name for column in self._columns)
+        self._values = dict(zip(self._names, values))
+        self._rows = rows
+
+    @property
+    def names(self) -> Tuple[str, ...]:
+        """Tuple[str, ...]: The names of the columns."""
+        return self._names
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def __getitem__(self, name: str) -> List[Any]:
+        return self._values[name]
+
+    def __repr__(self) -> str:
+        return "Columns({!r}, rows={})".format(list(self._names), self._rows)
+
+    def to_pydict(self) -> Dict[str, List[Any]]:
+        """Return the values of each column, by name."""
+        return {name: self._values[name] for name in self._names}
+
+    def to_arrow(self) -> Any:
+        """Return the columns as a :class:`pyarrow.Table`.
+
+        Scalar fields have the pyarrow type of their protobuf type, repeated
+        fields a list type, and maps a map type with their entries sorted by
+        key; enums are ``int32``.
+        """
+        # Imported here, so that importing pagers does not import pyarrow.
+        try:
+            import pyarrow  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required to convert columns to Arrow; install it "
+                "with `pip install google-cloud-compute[arrow]`."
+            )
+        arrays = []
+        for column in self._columns:
+            value_type = getattr(pyarrow, column.value_type)()
+            values = self._values[column.name]
+            if column.shape == "list":
+                value_type = pyarrow.list_(value_type)
+            elif column.shape == "map":
+                value_type = pyarrow.map_(
+                    getattr(pyarrow, column.key_type)(), value_type
+                )
+                values = [
+                    value if value is None else sorted(value.items())
+                    for value in values
+                ]
+            arrays.append(pyarrow.array(values, type=value_type))
+        return pyarrow.Table.from_arrays(arrays, names=list(self._names))
+
+    def to_numpy(self) -> Any:
+        """Return the columns as a structured :class:`numpy.ndarray`, with one
+        record per result.
+
+        Numbers and booleans have the dtype of their protobuf type, and
+        missing floats are NaN. Strings, bytes, lists, maps, and integers and
+        booleans with missing values are Python objects.
+        """
+        try:
+            import numpy  # type: ignore
+        except ImportError:
+            raise ImportError(
+                "numpy is required to convert columns to NumPy; install it "
+                "with `pip install google-cloud-compute[numpy]`."
+            )
+        dtypes = []
+        for column in self._columns:
+            dtype = "O"
+            if column.shape == "scalar" and column.value_type not in (
+                "string",
+                "binary",
+            ):
+                dtype = "bool" if column.value_type == "bool_" else column.value_type
+                if not dtype.startswith("float") and any(
+                    value is None for value in self._values[column.name]
+                ):
+                    dtype = "O"
+            dtypes.append((column.name, dtype))
+        records = numpy.empty(self._rows, dtype=dtypes)
+        for name, dtype in dtypes:
+            if dtype == "O":
+                # Element by element, so that lists are not broadcast.
+                field = records[name]
+                for row, value in enumerate(self._values[name]):
+                    field[row] = value
+            else:
+                records[name] = self._values[name]
+        return records
+
+
+class _Reader:
+    """Reads the columns of the results of pages."""
+
+    def __init__(
+        self,
+        item_type: Any,
+        columns: ColumnPaths,
+        items: str,
+        scoped: Optional[str],
+        offset: int,
+    ):
+        if isinstance(columns, str):
+            raise TypeError("Expected a sequence or a mapping of paths.")
+        if not isinstance(columns, Mapping):
+            columns = {path: path for path in columns}
+        descriptor = item_type.pb().DESCRIPTOR
+        self._columns = [
+            _compile(name, descriptor, path) for name, path in columns.items()
+        ]
+        self._values = [[] for _ in self._columns]  # type: List[List[Any]]
+        self._items = items
+        self._scoped = scoped
+        self._offset = offset
+        self._rows = 0
+        # The JSON names of the fields of results, once a view is read.
+        self._json_names = None  # type: Optional[Tuple[str, Optional[str]]]
+
+    def _json_items(self, page: response_decoding.LazyMessage) -> Iterable[Any]:
+        if self._json_names is None:
+            field = page._message_type.pb().DESCRIPTOR.fields_by_name[self._items]
+            scoped = None
+            if self._scoped is not None:
+                _, value_field = _map_entry(field)
+                scoped = value_field.message_type.fields_by_name[self._scoped]
+                scoped = scoped.json_name
+            self._json_names = field.json_name, scoped
+        items, scoped = self._json_names
+        values = page._obj.get(items) or ()
+        if scoped is None:
+            return values
+        return [
+            item
+            for _, scoped_list in sorted(values.items())[self._offset :]
+            for item in scoped_list.get(scoped) or ()
+        ]
+
+    def _pb_items(self, page: Any) -> Iterable[Any]:
+        values = getattr(type(page).pb(page), self._items)
+        if self._scoped is None:
+            return values
+        return [
+            item
+            for _, scoped_list in sorted(values.items())[self._offset :]
+            for item in getattr(scoped_list, self._scoped)
+        ]
+
+    def add(self, page: Any) -> None:
+        """Read the results of a page."""
+        if isinstance(page, response_decoding.LazyMessage):
+            items, read = self._json_items(page), _from_json
+        else:
+            items, read = self._pb_items(page), _from_pb
+        if self._scoped is None and self._offset:
+            items = list(items)[self._offset :]
+        # Only the first page can have been partly iterated.
+        self._offset = 0
+        for item in items:
+            for column, values in zip(self._columns, self._values):
+                values.append(read(item, column.steps))
+            self._rows += 1
+
+    def columns(self) -> Columns:
+        return Columns(self._columns, self._values, self._rows)
+
+
+def read(
+    pages: Iterable[Any],
+    item_type: Any,
+    columns: ColumnPaths,
+    items: str,
+    *,
+    scoped: Optional[str] = None,
+    offset: int = 0
+) -> Columns:
+    """Read fields of the results of pages into columns.
+
+    Args:
+        pages (Iterable[Any]): The pages, as messages or views.
+        item_type (Type[proto.Message]): The message class of the results.
+        columns (Union[Sequence[str], Mapping[str, str]]): The paths of the
+            fields, or the paths by column name.
+        items (str): The field of the pages with the results.
+        scoped (Optional[str]): For aggregated lists, whose ``items`` map
+            scopes to scoped lists, the field of the scoped lists with the
+            results.
+        offset (int): The number of results, or of scopes of aggregated
+            lists, of the first page to skip.
+
+    Returns:
+        Columns: The columns.
+    """
+    reader = _Reader(item_type, columns, items, scoped, offset)
+    for page in pages:
+        reader.add(page)
+    return reader.columns()
+
+
+async def read_async(
+    pages: AsyncIterator[Any],
+    item_type: Any,
+    columns: ColumnPaths,
+    items: str,
+    *,
+    scoped: Optional[str] = None,
+    offset: int = 0
+) -> Columns:
+    """Read fields of the results of pages into columns; see :func:`read`."""
+    reader = _Reader(item_type, columns, items, scoped, offset)
+    async for page in pages:
+        reader.add(page)
+    return reader.columns()
+
+
+__all__ = (
+    "ColumnPaths",
+    "Columns",
+    "read",
+    "read_async",
+)
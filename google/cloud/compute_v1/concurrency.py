@@ -0,0 +1,309 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Run many calls at the highest concurrency the service sustains.
+
+An :class:`AdaptiveExecutor` runs the calls submitted to it on a thread
+pool, but only lets as many of them run at once as its current concurrency
+limit, which it adjusts as the calls complete, in the manner of TCP
+congestion control:
+
+- The limit starts at ``initial`` and doubles every round of successful
+  calls, until the first sign of congestion.
+- From then on, it grows by ``increase`` every round of successful calls
+  whose latency stays within ``latency_tolerance`` times the lowest latency
+  seen so far.
+- It is multiplied by ``decrease`` when a call is throttled, with a 429 or
+  503 error or a 403 ``rateLimitExceeded`` error, or when a call succeeds
+  with an inflated latency. Calls that were already running when the limit
+  was lowered do not lower it again.
+
+.. code-block:: python
+
+    import concurrent.futures
+
+    from google.cloud import compute_v1
+
+    instances = compute_v1.InstancesClient()
+    with compute_v1.AdaptiveExecutor(maximum=200) as executor:
+        futures = {
+            executor.submit(
+                instances.stop_unary, project=project, zone=zone, instance=name
+            ): name
+            for name in names
+        }
+        for future in concurrent.futures.as_completed(futures):
+            if future.exception() is not None:
+                print(futures[future], future.exception())
+    print(executor.stats())
+
+The latency of all calls is compared with one baseline, so an executor is
+best used for calls of one method.
+"""
+
+import collections
+import concurrent.futures
+import threading
+import time
+from typing import Callable, NamedTuple, Optional
+
+from google.api_core import exceptions as core_exceptions
+
+from google.cloud.compute_v1 import retry_policy
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """Return whether an error means the service is congested.
+
+    Args:
+        exc (BaseException): The error a call raised.
+    """
+    return retry_policy.if_rate_limited(exc) or isinstance(
+        exc, core_exceptions.ServiceUnavailable
+    )
+
+
+class ExecutorStats(NamedTuple):
+    """A snapshot of the progress of an :class:`AdaptiveExecutor`.
+
+    Attributes:
+        submitted (int): The number of calls submitted.
+        running (int): The number of calls running.
+        succeeded (int): The number of calls that returned.
+        failed (int): The number of calls that raised, including throttled
+            calls.
+        throttled (int): The number of calls that raised an error for which
+            :func:`is_throttled` is true.
+        concurrency (float): The current concurrency limit.
+        peak_concurrency (int): The most calls that have run at once.
+        min_latency (Optional[float]): The lowest latency of a successful
+            call, in seconds.
+        mean_latency (Optional[float]): The mean latency of the completed
+            calls, in seconds.
+    """
+
+    submitted: int
+    running: int
+    succeeded: int
+    failed: int
+    throttled: int
+    concurrency: float
+    peak_concurrency: int
+    min_latency: Optional[float]
+    mean_latency: Optional[float]
+
+
+class _Controller:
+    """The additive-increase, multiplicative-decrease concurrency limit."""
+
+    def __init__(
+        self,
+        initial: float,
+        minimum: float,
+        maximum: float,
+        increase: float,
+        decrease: float,
+        latency_tolerance: float,
+    ):
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.min_latency = None  # type: Optional[float]
+        self.slow_start = True
+        # The time of the last decrease. Calls started before it do not
+        # decrease the limit again.
+        self.decreased = float("-inf")
+
+    def on_success(self, started: float, now: float) -> None:
+        latency = now - started
+        if self.min_latency is None or latency < self.min_latency:
+            self.min_latency = latency
+        if latency > self.min_latency * self.latency_tolerance:
+            self.on_congestion(started, now)
+        elif self.slow_start:
+            self.limit = min(self.maximum, self.limit + 1)
+        else:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+    def on_congestion(self, started: float, now: float) -> None:
+        self.slow_start = False
+        if started < self.decreased:
+            return
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        self.decreased = now
+
+
+class AdaptiveExecutor(concurrent.futures.Executor):
+    """A :class:`concurrent.futures.Executor` that adapts how many calls it
+    runs at once to the throughput the service sustains.
+
+    Args:
+        initial (int): The concurrency limit to start with.
+        minimum (int): The lowest concurrency limit.
+        maximum (int): The highest concurrency limit, which is also the
+            number of worker threads.
+        increase (float): How much the limit grows every round of successful
+            calls, once a call has been throttled.
+        decrease (float): The factor the limit is multiplied by when a call
+            is throttled or slow.
+        latency_tolerance (float): How many times the lowest latency seen a
+            successful call may take before it counts as slow.
+        throttled (Callable[[BaseException], bool]): Whether an error of a
+            call means the service is congested. Defaults to
+            :func:`is_throttled`.
+        clock (Callable[[], float]): The monotonic clock that times the
+            calls, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 8,
+        minimum: int = 1,
+        maximum: int = 128,
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        throttled: Callable[[BaseException], bool] = is_throttled,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Expected 1 <= minimum <= initial <= maximum.")
+        if not 0 < decrease < 1:
+            raise ValueError("Expected 0 < decrease < 1.")
+        self._controller = _Controller(
+            initial, minimum, maximum, increase, decrease, latency_tolerance
+        )
+        self._throttled = throttled
+        self._clock = clock
+        self._pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=maximum, thread_name_prefix="AdaptiveExecutor"
+        )
+        self._lock = threading.Lock()
+        self._pending = collections.deque()
+        self._shutdown = False
+        self._submitted = 0
+        self._running = 0
+        self._succeeded = 0
+        self._failed = 0
+        self._throttled_count = 0
+        self._peak = 0
+        self._total_latency = 0.0
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        """Schedule ``fn(*args, **kwargs)`` to run when the concurrency
+        limit allows.
+
+        Returns:
+            concurrent.futures.Future: The future of the call's result.
+        """
+        future = concurrent.futures.Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new calls after shutdown")
+            self._submitted += 1
+            self._pending.append((future, fn, args, kwargs))
+            self._start_calls()
+        return future
+
+    def _start_calls(self) -> None:
+        """Start pending calls up to the concurrency limit. Called with the
+        lock held."""
+        while self._pending and self._running < max(1, int(self._controller.limit)):
+            future, fn, args, kwargs = self._pending.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            self._running += 1
+            self._peak = max(self._peak, self._running)
+            self._pool.submit(self._run, future, fn, args, kwargs)
+        if self._shutdown and not self._pending:
+            # Let the pool's threads exit once the started calls complete.
+            self._pool.shutdown(wait=False)
+
+    def _run(self, future, fn, args, kwargs) -> None:
+        started = self._clock()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as exc:
+            now = self._clock()
+            with self._lock:
+                self._running -= 1
+                self._failed += 1
+                self._total_latency += now - started
+                if self._throttled(exc):
+                    self._throttled_count += 1
+                    self._controller.on_congestion(started, now)
+                self._start_calls()
+            future.set_exception(exc)
+        else:
+            now = self._clock()
+            with self._lock:
+                self._running -= 1
+                self._succeeded += 1
+                self._total_latency += now - started
+                self._controller.on_success(started, now)
+                self._start_calls()
+            future.set_result(result)
+
+    @property
+    def concurrency(self) -> float:
+        """float: The current concurrency limit."""
+        return self._controller.limit
+
+    def stats(self) -> ExecutorStats:
+        """Return the progress of the calls so far."""
+        with self._lock:
+            completed = self._succeeded + self._failed
+            return ExecutorStats(
+                submitted=self._submitted,
+                running=self._running,
+                succeeded=self._succeeded,
+                failed=self._failed,
+                throttled=self._throttled_count,
+                concurrency=self._controller.limit,
+                peak_concurrency=self._peak,
+                min_latency=self._controller.min_latency,
+                mean_latency=self._total_latency / completed if completed else None,
+            )
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        """Stop accepting calls, and wait for the submitted ones to complete.
+
+        Args:
+            wait (bool): Whether to wait for the calls to complete.
+            cancel_futures (bool): Whether to cancel the calls that have not
+                started.
+        """
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._pending:
+                    self._pending.popleft()[0].cancel()
+            self._start_calls()
+            pending = [call[0] for call in self._pending]
+        if wait:
+            # Pending calls start as running ones complete.
+            concurrent.futures.wait(pending)
+            self._pool.shutdown(wait=True)
+
+
+__all__ = (
+    "AdaptiveExecutor",
+    "ExecutorStats",
+    "is_throttled",
+)
@@ -0,0 +1,371 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""An index of the instances of a project in memory.
+
+Finding instances by zone, status or label with ``aggregated_list`` and a
+filter lists them from the service on every query. An
+:class:`InstanceInventory` lists them once, indexes them by zone, region,
+status, label, machine type, network IP and self link, and answers queries
+from the indexes:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    instances = compute_v1.InstancesClient()
+    inventory = compute_v1.InstanceInventory(instances, project, max_staleness=10)
+    running = inventory.query(
+        region="us-central1", status="RUNNING", labels={"team": "x"}
+    )
+
+A query made more than ``max_staleness`` seconds after the last refresh
+refreshes the inventory first. A refresh does not list the instances
+again: it follows the operations of the project with an
+:class:`~google.cloud.compute_v1.operations.OperationChangeFeed`, and only
+gets the instances that the operations created, changed or deleted since
+the previous refresh, with one ``list`` call per zone filtered by their
+names. Changes that no operation reports are picked up by listing all
+instances again every ``resync_interval`` seconds.
+"""
+
+import collections
+import datetime
+import re
+import threading
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from google.cloud.compute_v1 import operations
+from google.cloud.compute_v1.types import compute
+
+_INSTANCE_RE = re.compile(r"/projects/([^/]+)/zones/([^/]+)/instances/([^/]+)$")
+
+_EMPTY = frozenset()  # type: frozenset
+
+
+class InventoryStats(NamedTuple):
+    """A snapshot of the counters of an :class:`InstanceInventory`.
+
+    Attributes:
+        instances (int): The number of instances indexed.
+        refreshes (int): The number of refreshes from operations.
+        resyncs (int): The number of times all instances were listed.
+        fetched (int): The number of instances got again after an
+            operation changed them.
+    """
+
+    instances: int
+    refreshes: int
+    resyncs: int
+    fetched: int
+
+
+def _name(url: str) -> str:
+    return url.rsplit("/", 1)[-1]
+
+
+def _index_keys(instance: compute.Instance) -> Iterator[Tuple[str, Any]]:
+    zone = _name(instance.zone)
+    yield "name", (zone, instance.name)
+    yield "zone", zone
+    yield "region", zone.rsplit("-", 1)[0]
+    yield "status", instance.status
+    yield "machine_type", _name(instance.machine_type)
+    for label in instance.labels.items():
+        yield "label", label
+    for interface in instance.network_interfaces:
+        if interface.network_i_p:
+            yield "network_ip", interface.network_i_p
+
+
+class InstanceInventory:
+    """An index of the instances of a project, refreshed from the
+    operations that change them.
+
+    An inventory is safe to query from many threads; one of them refreshes
+    it when it is stale, while the others wait. The instances it returns
+    are shared by all queries and must not be changed.
+
+    Args:
+        client (google.cloud.compute_v1.InstancesClient): The client to list
+            the instances and the operations through.
+        project (str): The project of the instances.
+        max_staleness (float): The longest time between the last refresh
+            and a query, in seconds.
+        resync_interval (float): The longest time between two listings of
+            all instances, in seconds.
+        overlap (float): How far back each refresh looks for operations it
+            may have missed; see
+            :class:`~google.cloud.compute_v1.operations.OperationChangeFeed`.
+        clock (Callable[[], float]): The monotonic clock that ages the
+            inventory, in seconds.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        project: str,
+        *,
+        max_staleness: float = 30.0,
+        resync_interval: float = 3600.0,
+        overlap: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_staleness <= 0:
+            raise ValueError("Expected max_staleness > 0.")
+        if resync_interval < max_staleness:
+            raise ValueError("Expected resync_interval >= max_staleness.")
+        self._client = client
+        self._project = project
+        self._max_staleness = max_staleness
+        self._resync_interval = resync_interval
+        self._overlap = overlap
+        self._clock = clock
+        # Guards the instances and indexes.
+        self._lock = threading.Lock()
+        # Lets one thread at a time refresh.
+        self._refresh_lock = threading.Lock()
+        self._instances = {}  # type: Dict[str, compute.Instance]
+        # The self links of the instances, by index and key.
+        self._indexes: Dict[str, Dict[Any, Set[str]]] = collections.defaultdict(dict)
+        self._feed = None  # type: Optional[operations.OperationChangeFeed]
+        # When the last refresh and the last resync started.
+        self._refreshed = None  # type: Optional[float]
+        self._resynced = None  # type: Optional[float]
+        self._refreshes = 0
+        self._resyncs = 0
+        self._fetched = 0
+
+    @property
+    def staleness(self) -> Optional[float]:
+        """Optional[float]: The time since the last refresh started, in
+        seconds, or ``None`` before the first one."""
+        if self._refreshed is None:
+            return None
+        return self._clock() - self._refreshed
+
+    def _add(self, instance: compute.Instance) -> None:
+        link = instance.self_link
+        self._remove(link)
+        self._instances[link] = instance
+        for index, key in _index_keys(instance):
+            self._indexes[index].setdefault(key, set()).add(link)
+
+    def _remove(self, link: str) -> None:
+        instance = self._instances.pop(link, None)
+        if instance is None:
+            return
+        for index, key in _index_keys(instance):
+            links = self._indexes[index][key]
+            links.discard(link)
+            if not links:
+                del self._indexes[index][key]
+
+    def _resync(self) -> None:
+        since = datetime.datetime.now(datetime.timezone.utc)
+        listed = {}
+        request = {"project": self._project, "return_partial_success": True}
+        for _, scoped_list in self._client.aggregated_list(request=request):
+            for instance in scoped_list.instances:
+                listed[instance.self_link] = instance
+        with self._lock:
+            for link in set(self._instances) - set(listed):
+                self._remove(link)
+            for link, instance in listed.items():
+                if self._instances.get(link) != instance:
+                    self._add(instance)
+        # Follow the operations from before the listing, which may have
+        # changed the instances while they were listed.
+        self._feed = self._new_feed(since=since)
+        self._resyncs += 1
+
+    def _new_feed(self, **kwargs) -> operations.OperationChangeFeed:
+        return operations.OperationChangeFeed(
+            self._client.transport,
+            project=self._project,
+            overlap=self._overlap,
+            **kwargs,
+        )
+
+    def _fetch_changed(self) -> None:
+        # Poll the same changes again at the next refresh if they cannot
+        # all be fetched.
+        checkpoint = self._feed.checkpoint()
+        try:
+            self._apply_changes(self._feed.poll())
+        except Exception:
+            self._feed = self._new_feed(resume_from=checkpoint)
+            raise
+        self._refreshes += 1
+
+    def _apply_changes(self, changes: Iterable[compute.Operation]) -> None:
+        # The names of the instances that operations changed, by zone.
+        changed = collections.defaultdict(set)  # type: Dict[str, Set[str]]
+        for operation in changes:
+            match = _INSTANCE_RE.search(operation.target_link)
+            if match is not None and match.group(1) == self._project:
+                changed[match.group(2)].add(match.group(3))
+        for zone, names in sorted(changed.items()):
+            names = sorted(names)
+            for start in range(0, len(names), operations.MAX_FILTER_NAMES):
+                chunk = names[start : start + operations.MAX_FILTER_NAMES]
+                request = {
+                    "project": self._project,
+                    "zone": zone,
+                    "filter": 'name eq "({})"'.format("|".join(chunk)),
+                    "max_results": operations.MAX_FILTER_NAMES,
+                }
+                found = {
+                    instance.name: instance
+                    for instance in self._client.list(request=request)
+                }
+                with self._lock:
+                    for name in chunk:
+                        if name in found:
+                            self._add(found[name])
+                        else:
+                            # Deleted.
+                            for link in list(
+                                self._indexes["name"].get((zone, name), _EMPTY)
+                            ):
+                                self._remove(link)
+                self._fetched += len(found)
+
+    def _refresh(self, full: bool) -> None:
+        started = self._clock()
+        if (
+            full
+            or self._feed is None
+            or started - self._resynced >= self._resync_interval
+        ):
+            self._resync()
+            self._resynced = started
+        else:
+            self._fetch_changed()
+        self._refreshed = started
+
+    def refresh(self, full: bool = False) -> None:
+        """Apply the changes since the last refresh.
+
+        Args:
+            full (bool): List all instances again, instead of only getting
+                those that operations changed.
+        """
+        with self._refresh_lock:
+            self._refresh(full)
+
+    def _ensure_fresh(self) -> None:
+        staleness = self.staleness
+        if staleness is not None and staleness <= self._max_staleness:
+            return
+        with self._refresh_lock:
+            # Another thread may have refreshed while this one waited.
+            staleness = self.staleness
+            if staleness is None or staleness > self._max_staleness:
+                self._refresh(full=False)
+
+    def get(self, self_link: str) -> Optional[compute.Instance]:
+        """Return the instance with a self link, or ``None``.
+
+        Args:
+            self_link (str): The self link of the instance.
+        """
+        self._ensure_fresh()
+        with self._lock:
+            return self._instances.get(self_link)
+
+    def query(
+        self,
+        *,
+        zone: Optional[str] = None,
+        region: Optional[str] = None,
+        status: Any = None,
+        labels: Optional[Mapping[str, str]] = None,
+        machine_type: Optional[str] = None,
+        network_ip: Optional[str] = None,
+    ) -> List[compute.Instance]:
+        """Return the instances that match all the given conditions.
+
+        Args:
+            zone (Optional[str]): The name of the zone, such as
+                ``us-central1-a``.
+            region (Optional[str]): The name of the region of the zone.
+            status (Union[str, google.cloud.compute_v1.types.Instance.Status]):
+                The status, such as ``"RUNNING"``.
+            labels (Optional[Mapping[str, str]]): Labels the instances have.
+            machine_type (Optional[str]): The name of the machine type, such
+                as ``e2-medium``.
+            network_ip (Optional[str]): An internal IP address of the
+                instances.
+
+        Returns:
+            List[google.cloud.compute_v1.types.Instance]: The instances, in
+                the order of their self links.
+        """
+        conditions = [
+            (index, key)
+            for index, key in (
+                ("zone", zone),
+                ("region", region),
+                ("status", getattr(status, "name", status)),
+                ("machine_type", machine_type),
+                ("network_ip", network_ip),
+            )
+            if key is not None
+        ]
+        conditions.extend(("label", label) for label in (labels or {}).items())
+        self._ensure_fresh()
+        with self._lock:
+            if conditions:
+                matches = sorted(
+                    (
+                        self._indexes[index].get(key, _EMPTY)
+                        for index, key in conditions
+                    ),
+                    key=len,
+                )
+                links = matches[0].intersection(*matches[1:])
+            else:
+                links = self._instances
+            return [self._instances[link] for link in sorted(links)]
+
+    def stats(self) -> InventoryStats:
+        """Return the counters of the inventory."""
+        with self._lock:
+            return InventoryStats(
+                len(self._instances), self._refreshes, self._resyncs, self._fetched
+            )
+
+    def __len__(self) -> int:
+        return len(self._instances)
+
+
+__all__ = (
+    "InstanceInventory",
+    "InventoryStats",
+)
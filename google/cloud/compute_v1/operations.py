@@ -0,0 +1,705 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Futures of the operations that mutations return.
+
+Every mutation of a synchronous client has two variants: ``insert_unary``
+returns the :class:`~google.cloud.compute_v1.types.Operation` as the
+service created it, and ``insert`` returns an :class:`OperationFuture` of
+it, which is resolved when the operation is done:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    instances = compute_v1.InstancesClient()
+    operation = instances.start(project=project, zone=zone, instance=name)
+    operation.result(timeout=300)
+
+The future finds the zonal, regional, global or organization operations
+service of the operation from its fields, and calls it through the
+transport of the client that started the operation. :meth:`~OperationFuture.result`
+and the callbacks of :meth:`~OperationFuture.add_done_callback` wait with
+the ``wait`` method of the operations service, which returns as soon as the
+operation is done or after about two minutes, instead of calling ``get``
+in a loop; :meth:`~OperationFuture.done` checks the status once with
+``get``. An operation that completes with errors raises a
+:class:`google.api_core.exceptions.GoogleAPICallError` built from
+:attr:`Operation.error <google.cloud.compute_v1.types.Operation.error>`.
+
+To wait for many operations at once, such as all operations of a rolling
+restart, use an :class:`OperationWaiter`, which refreshes them in bulk
+with filtered ``list`` calls, and to follow all operations of a project or
+organization as they are created and change status, an
+:class:`OperationChangeFeed`.
+"""
+
+import collections
+import concurrent.futures
+import datetime
+import json
+import re
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import extended_operation
+from google.api_core import retry as retries
+from google.api_core.future import polling as polling_lib
+import requests
+
+from google.cloud.compute_v1 import _siblings
+from google.cloud.compute_v1.types import compute
+
+_PROJECT_RE = re.compile(r"/projects/([^/]+)/")
+_DEFAULT_VALUE = polling_lib.PollingFuture._DEFAULT_VALUE
+_TIME_RE = re.compile(
+    r"^(\d{4}-\d\d-\d\dT\d\d:\d\d:\d\d)(?:\.(\d+))?(Z|[+-]\d\d:\d\d)$"
+)
+# The earliest UTC offset. The service returns times at the offset of its
+# local time, such as "-07:00", and compares them with a filter as strings,
+# so a time at this offset sorts before the same or later times at any
+# other offset.
+_EARLIEST_OFFSET = datetime.timezone(datetime.timedelta(hours=-12))
+
+# The most operation names that :class:`OperationWaiter` puts in the filter
+# of one call, which keeps the request URL short.
+MAX_FILTER_NAMES = 100
+
+# The operations services, with their client classes.
+ZONE_OPERATIONS = ("zone_operations", "ZoneOperationsClient")
+REGION_OPERATIONS = ("region_operations", "RegionOperationsClient")
+GLOBAL_OPERATIONS = ("global_operations", "GlobalOperationsClient")
+GLOBAL_ORGANIZATION_OPERATIONS = (
+    "global_organization_operations",
+    "GlobalOrganizationOperationsClient",
+)
+
+
+def scope(operation: compute.Operation) -> Tuple[Tuple[str, str], Dict[str, str]]:
+    """Return the operations service of an operation, and the fields that
+    identify the operation in the requests of the service.
+
+    Args:
+        operation (google.cloud.compute_v1.types.Operation): The operation.
+
+    Returns:
+        Tuple[Tuple[str, str], Dict[str, str]]: One of :data:`ZONE_OPERATIONS`,
+            :data:`REGION_OPERATIONS`, :data:`GLOBAL_OPERATIONS` or
+            :data:`GLOBAL_ORGANIZATION_OPERATIONS`, and the request fields.
+    """
+    fields = {"operation": operation.name}
+    project = _PROJECT_RE.search(operation.self_link)
+    if project is None:
+        return GLOBAL_ORGANIZATION_OPERATIONS, fields
+    fields["project"] = project.group(1)
+    if operation.zone:
+        fields["zone"] = operation.zone.rsplit("/", 1)[-1]
+        return ZONE_OPERATIONS, fields
+    if operation.region:
+        fields["region"] = operation.region.rsplit("/", 1)[-1]
+        return REGION_OPERATIONS, fields
+    return GLOBAL_OPERATIONS, fields
+
+
+def operations_client(transport: Any, service: Tuple[str, str]) -> Any:
+    """Return a client of an operations service that sends its requests
+    like ``transport``.
+
+    The client shares the host, credentials, HTTP session, retry policy and
+    rate limiter of the transport, and is created once per transport.
+
+    Args:
+        transport (Any): The transport of the client that started the
+            operations.
+        service (Tuple[str, str]): The operations service, as returned by
+            :func:`scope`.
+    """
+    return _siblings.client(transport, service[0])
+
+
+def operation_error(
+    operation: compute.Operation,
+) -> core_exceptions.GoogleAPICallError:
+    """Return the exception for an operation that completed with errors.
+
+    The exception is of the class of the operation's HTTP error status, and
+    its ``errors`` are the
+    :class:`~google.cloud.compute_v1.types.Errors` of the operation.
+
+    Args:
+        operation (google.cloud.compute_v1.types.Operation): The operation.
+    """
+    errors = list(operation.error.errors)
+    message = operation.http_error_message or "; ".join(
+        error.message for error in errors
+    )
+    if operation.http_error_status_code:
+        return core_exceptions.from_http_status(
+            operation.http_error_status_code,
+            message,
+            errors=errors,
+            response=operation,
+        )
+    return core_exceptions.GoogleAPICallError(
+        message, errors=errors, response=operation
+    )
+
+
+class OperationFuture(extended_operation.ExtendedOperation):
+    """A future of a Compute Engine operation.
+
+    The future's result is the operation once it is done. Other attributes
+    are read from the latest state of the operation, so ``future.target_link``
+    is the ``target_link`` of the operation.
+
+    Args:
+        operation (google.cloud.compute_v1.types.Operation): The operation
+            as returned by a mutation.
+        transport (Any): The transport of the client that started the
+            operation, such as ``client.transport``.
+        polling (google.api_core.retry.Retry): How often :meth:`result`
+            waits for the operation, and for how long.
+    """
+
+    def __init__(
+        self,
+        operation: compute.Operation,
+        transport: Any,
+        polling: retries.Retry = polling_lib.DEFAULT_POLLING,
+    ):
+        self._transport = transport
+        self._deadline = None  # type: Optional[float]
+        super().__init__(
+            operation, self._get, lambda: None, polling=polling,
+        )
+
+    @property
+    def operation(self) -> compute.Operation:
+        """google.cloud.compute_v1.types.Operation: The latest state of the
+        operation."""
+        return self._extended_operation
+
+    @property
+    def error_code(self) -> int:
+        return self._extended_operation.http_error_status_code
+
+    @property
+    def error_message(self) -> str:
+        return self._extended_operation.http_error_message
+
+    def _call(self, method_name: str, **kwargs) -> compute.Operation:
+        service, fields = scope(self._extended_operation)
+        method = getattr(operations_client(self._transport, service), method_name)
+        return method(**fields, **kwargs)
+
+    def _get(self, retry=None) -> compute.Operation:
+        if retry is None:
+            return self._call("get")
+        return self._call("get", retry=retry)
+
+    def _wait(self, retry=None) -> compute.Operation:
+        service, _ = scope(self._extended_operation)
+        if service == GLOBAL_ORGANIZATION_OPERATIONS:
+            # Organization operations cannot be waited for.
+            return self._get(retry)
+        kwargs = {}
+        if retry is not None:
+            kwargs["retry"] = retry
+        if self._deadline is not None:
+            kwargs["timeout"] = max(self._deadline - time.monotonic(), 1.0)
+        try:
+            return self._call("wait", **kwargs)
+        except requests.exceptions.Timeout:
+            # The wait outlasted the timeout of result(); the polling gives up.
+            return self._extended_operation
+
+    def _is_done(self) -> bool:
+        return self._extended_operation.status == compute.Operation.Status.DONE
+
+    def done(self, retry=None) -> bool:
+        """Check once whether the operation is done.
+
+        Args:
+            retry (google.api_core.retry.Retry): How to retry the ``get``
+                call.
+        """
+        self._refresh_and_update(retry)
+        return self._is_done()
+
+    def cancel(self) -> bool:
+        """Operations cannot be cancelled; returns ``False``."""
+        return False
+
+    def cancelled(self) -> bool:
+        return False
+
+    def _update(self, operation: compute.Operation) -> None:
+        """Update the future with a state of the operation read elsewhere."""
+        if not self._is_done():
+            self._extended_operation = operation
+            self._handle_refreshed_operation()
+
+    def _refresh_and_update(self, retry=None, refresh=None) -> None:
+        if not self._is_done():
+            self._extended_operation = (refresh or self._get)(retry)
+            self._handle_refreshed_operation()
+
+    def _done_or_raise(self, retry=None) -> None:
+        self._refresh_and_update(retry, self._wait)
+        if not self._is_done():
+            raise polling_lib._OperationNotComplete()
+
+    def _blocking_poll(self, timeout=_DEFAULT_VALUE, retry=None, polling=None) -> None:
+        # Bound each wait by the time left for result().
+        if timeout is _DEFAULT_VALUE:
+            timeout = (polling or self._polling).timeout
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            super()._blocking_poll(timeout=timeout, retry=retry, polling=polling)
+        finally:
+            self._deadline = None
+
+    def _handle_refreshed_operation(self) -> None:
+        with self._completion_lock:
+            if not self._is_done() or self._result_set:
+                return
+            if self._extended_operation.error.errors:
+                self.set_exception(operation_error(self._extended_operation))
+            else:
+                self.set_result(self._extended_operation)
+
+
+class OperationWaiter:
+    """Waits for many operations with few calls.
+
+    Instead of waiting for each operation on its own, the waiter refreshes
+    all pending operations of a project at once, with one ``list`` call of
+    the operations service if they share a zone or region, or one
+    ``aggregated_list`` call of the global operations service otherwise,
+    filtered by the names of the operations. Only
+    :data:`MAX_FILTER_NAMES` names fit in one call, so the number of calls
+    grows with the number of projects, and with the pending operations in
+    steps of :data:`MAX_FILTER_NAMES`. Organization operations are
+    refreshed one by one.
+
+    The interval between refreshes starts at ``initial``. It is multiplied
+    by ``multiplier``, up to ``maximum``, after a refresh in which no
+    operation completed, and divided by it after a refresh in which some
+    did.
+
+    .. code-block:: python
+
+        instances = compute_v1.InstancesClient()
+        waiter = compute_v1.OperationWaiter(
+            instances.reset(project=project, zone=zone, instance=name)
+            for name in names
+        )
+        for future in waiter.as_completed(timeout=1800):
+            if future.exception() is not None:
+                print(future.name, future.exception())
+
+    Args:
+        operations (Iterable[Union[OperationFuture, google.cloud.compute_v1.types.Operation]]):
+            The operations to wait for.
+        transport (Any): The transport to refresh operations through.
+            Defaults to the transport of each :class:`OperationFuture`, and
+            is required for operations given as messages.
+        initial (float): The first interval between refreshes, in seconds.
+        maximum (float): The longest interval between refreshes.
+        multiplier (float): How much the interval changes after a refresh.
+    """
+
+    def __init__(
+        self,
+        operations: Iterable[Union[OperationFuture, compute.Operation]],
+        transport: Any = None,
+        *,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        multiplier: float = 1.5,
+    ):
+        self._futures = []  # type: List[OperationFuture]
+        for operation in operations:
+            if not isinstance(operation, OperationFuture):
+                if transport is None:
+                    raise ValueError(
+                        "A transport is needed to wait for operations that are "
+                        "not OperationFutures."
+                    )
+                operation = OperationFuture(operation, transport)
+            self._futures.append(operation)
+        self._transport = transport
+        self._initial = initial
+        self._maximum = maximum
+        self._multiplier = multiplier
+        self._yielded = set()  # type: Set[int]
+
+    @property
+    def pending(self) -> List[OperationFuture]:
+        """List[OperationFuture]: The operations that are not done."""
+        return [future for future in self._futures if not future._is_done()]
+
+    def refresh(self) -> None:
+        """Refresh the state of every pending operation once."""
+        groups: Dict[Tuple[Any, str], List[OperationFuture]] = collections.defaultdict(
+            list
+        )
+        for future in self.pending:
+            service, fields = scope(future.operation)
+            if service == GLOBAL_ORGANIZATION_OPERATIONS:
+                future.done()
+                continue
+            transport = self._transport or future._transport
+            groups[transport, fields["project"]].append(future)
+        for (transport, project), futures in groups.items():
+            self._refresh_project(transport, project, futures)
+
+    def _refresh_project(
+        self, transport: Any, project: str, futures: List[OperationFuture]
+    ) -> None:
+        by_link = {future.self_link: future for future in futures}
+        scopes = {}
+        for future in futures:
+            service, fields = scope(future.operation)
+            del fields["operation"]
+            scopes[service, tuple(sorted(fields.items()))] = service, fields
+        for start in range(0, len(futures), MAX_FILTER_NAMES):
+            names = [
+                future.name for future in futures[start : start + MAX_FILTER_NAMES]
+            ]
+            request = {
+                "project": project,
+                "filter": 'name eq "({})"'.format("|".join(names)),
+                "max_results": MAX_FILTER_NAMES,
+            }
+            if len(scopes) == 1:
+                service, fields = next(iter(scopes.values()))
+                request.update(fields)
+                results = operations_client(transport, service).list(request=request)
+            else:
+                request["return_partial_success"] = True
+                results = (
+                    operation
+                    for _, scoped_list in operations_client(
+                        transport, GLOBAL_OPERATIONS
+                    ).aggregated_list(request=request)
+                    for operation in scoped_list.operations
+                )
+            for operation in results:
+                future = by_link.get(operation.self_link)
+                if future is not None:
+                    future._update(operation)
+
+    def as_completed(
+        self, timeout: Optional[float] = None
+    ) -> Iterator[OperationFuture]:
+        """Yield each operation once it is done.
+
+        Operations that are done already are yielded first. The others are
+        yielded in the order they complete, resolved with their final state,
+        so :meth:`OperationFuture.result` raises for operations that
+        completed with errors.
+
+        Args:
+            timeout (Optional[float]): How long to wait for all operations,
+                in seconds. If ``None``, wait indefinitely.
+
+        Raises:
+            concurrent.futures.TimeoutError: If operations are not done
+                when the timeout expires.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = None
+        while True:
+            completed = [
+                future
+                for future in self._futures
+                if future._is_done() and id(future) not in self._yielded
+            ]
+            for future in completed:
+                self._yielded.add(id(future))
+                yield future
+            pending = len(self.pending)
+            if not pending:
+                return
+            if interval is None:
+                interval = self._initial
+            elif completed:
+                interval = max(self._initial, interval / self._multiplier)
+            else:
+                interval = min(self._maximum, interval * self._multiplier)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise concurrent.futures.TimeoutError(
+                        "{} of {} operations are not done.".format(
+                            pending, len(self._futures)
+                        )
+                    )
+                interval = min(interval, remaining)
+            time.sleep(interval)
+            self.refresh()
+
+    def wait(self, timeout: Optional[float] = None) -> List[OperationFuture]:
+        """Wait until all operations are done.
+
+        Args:
+            timeout (Optional[float]): How long to wait, in seconds. If
+                ``None``, wait indefinitely.
+
+        Returns:
+            List[OperationFuture]: The operations, in the order given.
+
+        Raises:
+            concurrent.futures.TimeoutError: If operations are not done
+                when the timeout expires.
+        """
+        for _ in self.as_completed(timeout):
+            pass
+        return list(self._futures)
+
+
+def _parse_time(value: str) -> Optional[datetime.datetime]:
+    """Parse an RFC 3339 time of an operation, or return ``None``."""
+    match = _TIME_RE.match(value)
+    if match is None:
+        return None
+    seconds, fraction, offset = match.groups()
+    parsed = datetime.datetime.strptime(seconds, "%Y-%m-%dT%H:%M:%S").replace(
+        microsecond=int((fraction or "0")[:6].ljust(6, "0"))
+    )
+    if offset == "Z":
+        tz = datetime.timezone.utc
+    else:
+        sign = -1 if offset[0] == "-" else 1
+        hours, minutes = int(offset[1:3]), int(offset[4:6])
+        tz = datetime.timezone(sign * datetime.timedelta(hours=hours, minutes=minutes))
+    return parsed.replace(tzinfo=tz)
+
+
+def _changed(operation: compute.Operation) -> Optional[datetime.datetime]:
+    """Return when an operation last changed status."""
+    times = [
+        _parse_time(value)
+        for value in (operation.insert_time, operation.start_time, operation.end_time)
+    ]
+    times = [value for value in times if value is not None]
+    return max(times) if times else None
+
+
+class OperationChangeFeed:
+    """Yields the operations that were created or changed status since the
+    previous poll.
+
+    Each poll lists only the operations inserted, started or ended after a
+    watermark, with a filter on their ``insertTime``, ``startTime``
+    and ``endTime``, so its cost grows with the number of changes rather
+    than with the number of operations kept by the service. The watermark
+    trails the latest change seen by ``overlap``, to catch changes that
+    become visible late, and the changes seen within the overlap are
+    remembered, so each status of each operation is yielded once. The filter
+    has the watermark at the earliest UTC offset, since the service compares
+    times as strings, and the times of the operations it returns are checked
+    against the watermark again once parsed.
+
+    The operations of a project are listed with
+    ``GlobalOperationsClient.aggregated_list``, or with the ``list`` method of
+    the zone, region or global operations service if ``zone``, ``region`` or
+    ``scope="global"`` is given, and those of an organization with
+    ``GlobalOrganizationOperationsClient.list``.
+
+    .. code-block:: python
+
+        operations = compute_v1.GlobalOperationsClient()
+        feed = compute_v1.OperationChangeFeed(
+            operations.transport, project=project, resume_from=saved
+        )
+        for operation in feed.follow(interval=30):
+            audit(operation)
+            saved = feed.checkpoint()
+
+    Args:
+        transport (Any): The transport to list operations through, such as
+            ``client.transport``.
+        project (Optional[str]): The project whose operations to follow.
+        zone (Optional[str]): Only follow the operations of this zone.
+        region (Optional[str]): Only follow the operations of this region.
+        parent_id (Optional[str]): The organization or folder whose
+            operations to follow, as ``organizations/123``, instead of a
+            project.
+        since (Optional[datetime.datetime]): Only yield operations that
+            changed at or after this time. If ``None``, the first poll yields
+            every operation.
+        overlap (float): How far the watermark trails the latest change, in
+            seconds.
+        resume_from (Optional[str]): A checkpoint of a previous feed, as
+            returned by :meth:`checkpoint`, to continue from.
+    """
+
+    def __init__(
+        self,
+        transport: Any,
+        *,
+        project: Optional[str] = None,
+        zone: Optional[str] = None,
+        region: Optional[str] = None,
+        parent_id: Optional[str] = None,
+        since: Optional[datetime.datetime] = None,
+        overlap: float = 60.0,
+        resume_from: Optional[str] = None,
+    ):
+        if (project is None) == (parent_id is None):
+            raise ValueError("Exactly one of project and parent_id is required.")
+        if zone is not None and region is not None:
+            raise ValueError("At most one of zone and region can be given.")
+        self._transport = transport
+        self._project = project
+        self._zone = zone
+        self._region = region
+        self._parent_id = parent_id
+        self._overlap = datetime.timedelta(seconds=overlap)
+        self._latest = since  # type: Optional[datetime.datetime]
+        # The self link and status of the changes at or after the watermark,
+        # with the time of the change.
+        self._seen = {}  # type: Dict[Tuple[str, int], datetime.datetime]
+        if resume_from is not None:
+            state = json.loads(resume_from)
+            self._latest = state["latest"] and _parse_time(state["latest"])
+            self._seen = {
+                (link, status): _parse_time(changed)
+                for link, status, changed in state["seen"]
+            }
+
+    @property
+    def watermark(self) -> Optional[datetime.datetime]:
+        """Optional[datetime.datetime]: The earliest time of the changes
+        the next poll lists."""
+        if self._latest is None:
+            return None
+        return self._latest - self._overlap
+
+    def checkpoint(self) -> str:
+        """Return the state of the feed, to resume from with the
+        ``resume_from`` argument."""
+        return json.dumps(
+            {
+                "latest": self._latest and self._latest.isoformat(),
+                "seen": [
+                    [link, status, changed.isoformat()]
+                    for (link, status), changed in sorted(self._seen.items())
+                ],
+            }
+        )
+
+    def _list(self, request: Dict[str, Any]) -> Iterator[compute.Operation]:
+        if self._parent_id is not None:
+            request["parent_id"] = self._parent_id
+            return iter(
+                operations_client(self._transport, GLOBAL_ORGANIZATION_OPERATIONS).list(
+                    request=request
+                )
+            )
+        request["project"] = self._project
+        if self._zone is not None:
+            request["zone"] = self._zone
+            service = ZONE_OPERATIONS
+        elif self._region is not None:
+            request["region"] = self._region
+            service = REGION_OPERATIONS
+        else:
+            request["return_partial_success"] = True
+            return (
+                operation
+                for _, scoped_list in operations_client(
+                    self._transport, GLOBAL_OPERATIONS
+                ).aggregated_list(request=request)
+                for operation in scoped_list.operations
+            )
+        return iter(operations_client(self._transport, service).list(request=request))
+
+    def poll(self) -> List[compute.Operation]:
+        """List the changes since the previous poll.
+
+        Returns:
+            List[google.cloud.compute_v1.types.Operation]: The operations that
+                were created or changed status, in the order of their
+                changes.
+        """
+        request = {}  # type: Dict[str, Any]
+        watermark = self.watermark
+        if watermark is not None:
+            value = watermark.astimezone(_EARLIEST_OFFSET).isoformat(
+                timespec="milliseconds"
+            )
+            request["filter"] = " OR ".join(
+                '({} > "{}")'.format(field, value)
+                for field in ("insertTime", "startTime", "endTime")
+            )
+        changes = []
+        for operation in self._list(request):
+            changed = _changed(operation)
+            key = (operation.self_link, int(operation.status))
+            if key in self._seen or changed is None:
+                continue
+            if watermark is not None and changed < watermark:
+                continue
+            self._seen[key] = changed
+            changes.append((changed, operation))
+            if self._latest is None or changed > self._latest:
+                self._latest = changed
+        watermark = self.watermark
+        self._seen = {
+            key: changed for key, changed in self._seen.items() if changed >= watermark
+        }
+        changes.sort(key=lambda change: change[0])
+        return [operation for _, operation in changes]
+
+    def follow(
+        self, interval: float = 30.0, timeout: Optional[float] = None
+    ) -> Iterator[compute.Operation]:
+        """Poll for changes every ``interval`` seconds and yield them.
+
+        Args:
+            interval (float): The time between polls, in seconds.
+            timeout (Optional[float]): How long to follow the changes, in
+                seconds. If ``None``, follow them until the iteration is
+                abandoned.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            yield from self.poll()
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                time.sleep(min(interval, remaining))
+            else:
+                time.sleep(interval)
+
+
+__all__ = (
+    "GLOBAL_OPERATIONS",
+    "GLOBAL_ORGANIZATION_OPERATIONS",
+    "MAX_FILTER_NAMES",
+    "OperationChangeFeed",
+    "OperationFuture",
+    "OperationWaiter",
+    "REGION_OPERATIONS",
+    "ZONE_OPERATIONS",
+    "operation_error",
+    "operations_client",
+    "scope",
+)
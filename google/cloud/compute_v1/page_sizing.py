@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Tune the size of the pages of list calls as they are received.
+
+Small pages take many round trips, and large pages of large resources,
+such as instances with a lot of metadata, take long enough to time out.
+An :class:`AdaptivePageSize` passed as the ``page_sizer`` argument of a
+paged method sets ``max_results`` of each page from the latency and size
+of the pages before it:
+
+- It keeps a moving average of the time and the encoded size per result
+  of the full pages received.
+- The next page is as large as fits both ``target_latency`` and
+  ``target_bytes`` by these averages, at most ``growth`` times the
+  previous page, and within ``minimum`` and ``maximum``.
+- When a page times out, its size is halved and it is requested again,
+  down to ``minimum``.
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    instances = compute_v1.InstancesClient()
+    sizer = compute_v1.AdaptivePageSize(target_latency=1.0)
+    for instance in instances.list(project=project, zone=zone, page_sizer=sizer):
+        print(instance.name)
+
+A sizer keeps what it learned between pagers, so it is best used for the
+calls of one method.
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+from google.api_core import exceptions as core_exceptions
+import proto  # type: ignore
+import requests
+
+# The highest ``max_results`` the API accepts.
+MAX_RESULTS = 500
+
+_TIMEOUTS = (
+    core_exceptions.DeadlineExceeded,
+    core_exceptions.GatewayTimeout,
+    requests.exceptions.Timeout,
+    asyncio.TimeoutError,
+)
+
+
+def is_timeout(exc: BaseException) -> bool:
+    """Return whether an error means a call took too long.
+
+    Args:
+        exc (BaseException): The error a call raised.
+    """
+    if isinstance(exc, core_exceptions.RetryError):
+        exc = exc.cause
+    return isinstance(exc, _TIMEOUTS)
+
+
+def _encoded_size(response: Any) -> Optional[int]:
+    if isinstance(response, proto.Message):
+        return type(response).pb(response).ByteSize()
+    # Views are not encoded again to measure them.
+    return None
+
+
+class AdaptivePageSize:
+    """Sets ``max_results`` of each page of a pager from the latency and
+    size of the pages before it.
+
+    Args:
+        initial (int): The size of the first page.
+        minimum (int): The smallest page size.
+        maximum (int): The largest page size, at most :data:`MAX_RESULTS`.
+        target_latency (float): The time to receive a page in, in seconds.
+        target_bytes (int): The encoded size of a page.
+        growth (float): The most a page may grow over the previous one.
+        smoothing (float): The weight of the last page in the moving
+            averages, between 0 and 1.
+        clock (Callable[[], float]): The monotonic clock that times the
+            pages, in seconds.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 100,
+        minimum: int = 10,
+        maximum: int = MAX_RESULTS,
+        target_latency: float = 2.0,
+        target_bytes: int = 4 * 1024 * 1024,
+        growth: float = 2.0,
+        smoothing: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if not 1 <= minimum <= initial <= maximum <= MAX_RESULTS:
+            raise ValueError(
+                "Expected 1 <= minimum <= initial <= maximum <= {}.".format(MAX_RESULTS)
+            )
+        if target_latency <= 0 or target_bytes <= 0:
+            raise ValueError("Expected positive targets.")
+        if growth <= 1:
+            raise ValueError("Expected growth > 1.")
+        if not 0 < smoothing <= 1:
+            raise ValueError("Expected 0 < smoothing <= 1.")
+        self._minimum = minimum
+        self._maximum = maximum
+        self._target_latency = target_latency
+        self._target_bytes = target_bytes
+        self._growth = growth
+        self._smoothing = smoothing
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._page_size = initial
+        # The moving averages of the latency and size of a result.
+        self._latency = None  # type: Optional[float]
+        self._bytes = None  # type: Optional[float]
+
+    @property
+    def page_size(self) -> int:
+        """The size of the next page."""
+        return self._page_size
+
+    def _average(self, average: Optional[float], value: float) -> float:
+        if average is None:
+            return value
+        return average + self._smoothing * (value - average)
+
+    def observe(self, page_size: int, latency: float, size: int = None) -> None:
+        """Tune the page size after receiving a full page.
+
+        Args:
+            page_size (int): The ``max_results`` of the page.
+            latency (float): The time the page took, in seconds.
+            size (int): The encoded size of the page, if known.
+        """
+        with self._lock:
+            self._latency = self._average(self._latency, latency / page_size)
+            desired = self._target_latency / max(self._latency, 1e-9)
+            if size is not None:
+                self._bytes = self._average(self._bytes, size / page_size)
+            if self._bytes:
+                desired = min(desired, self._target_bytes / self._bytes)
+            desired = min(desired, page_size * self._growth)
+            self._page_size = int(max(self._minimum, min(self._maximum, desired)))
+
+    def on_timeout(self, page_size: int) -> bool:
+        """Halve the page size after a page timed out, and return whether a
+        smaller page may be requested.
+
+        Args:
+            page_size (int): The ``max_results`` of the page.
+        """
+        with self._lock:
+            smaller = max(self._minimum, page_size // 2)
+            self._page_size = min(self._page_size, smaller)
+            # Expect the time per result the timeout implies.
+            self._latency = self._target_latency / smaller
+            return smaller < page_size
+
+    def _sized(self, request: Any) -> Any:
+        sized = type(request)(request)
+        sized.max_results = self._page_size
+        return sized
+
+    def wrap(self, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Return a method that requests pages of the tuned size.
+
+        Args:
+            method (Callable): The method of a list call.
+        """
+
+        @functools.wraps(method)
+        def call(request, *args, **kwargs):
+            while True:
+                sized = self._sized(request)
+                started = self._clock()
+                try:
+                    response = method(sized, *args, **kwargs)
+                except Exception as exc:
+                    if is_timeout(exc) and self.on_timeout(sized.max_results):
+                        continue
+                    raise
+                if response.next_page_token:
+                    self.observe(
+                        sized.max_results,
+                        self._clock() - started,
+                        _encoded_size(response),
+                    )
+                return response
+
+        return call
+
+    def wrap_async(
+        self, method: Callable[..., Awaitable[Any]]
+    ) -> Callable[..., Awaitable[Any]]:
+        """Return a coroutine function that requests pages of the tuned
+        size.
+
+        Args:
+            method (Callable): The coroutine function of a list call.
+        """
+
+        @functools.wraps(method)
+        async def call(request, *args, **kwargs):
+            while True:
+                sized = self._sized(request)
+                started = self._clock()
+                try:
+                    response = await method(sized, *args, **kwargs)
+                except Exception as exc:
+                    if is_timeout(exc) and self.on_timeout(sized.max_results):
+                        continue
+                    raise
+                if response.next_page_token:
+                    self.observe(
+                        sized.max_results,
+                        self._clock() - started,
+                        _encoded_size(response),
+                    )
+                return response
+
+        return call
+
+    def __repr__(self) -> str:
+        return "<{} page_size={}>".format(type(self).__name__, self._page_size)
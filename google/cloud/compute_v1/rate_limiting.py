@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Client-side pacing of calls to stay within the API rate quotas.
+
+Compute Engine rate quotas apply per project to groups of methods. Every
+method of a client belongs to one :data:`READ`, :data:`LIST` or
+:data:`MUTATION` category, and a :class:`RateLimiter` given to the client
+is asked for permission before each attempt of a call, with the project of
+the request and the category of the method. Clients that share a limiter
+share its budget. With the per-minute quotas of a project, as shown on the
+Quotas page of the Google Cloud console:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+    from google.cloud.compute_v1 import rate_limiting
+
+    limiter = rate_limiting.TokenBucketLimiter(
+        {
+            rate_limiting.READ: 1200,
+            rate_limiting.LIST: 600,
+            rate_limiting.MUTATION: 600,
+        }
+    )
+    options = compute_v1.ClientOptions(rate_limiter=limiter)
+    instances = compute_v1.InstancesClient(client_options=options)
+    disks = compute_v1.DisksClient(client_options=options)
+
+Calls over the budget wait for their turn instead of being rejected by the
+service with ``rateLimitExceeded``, and :meth:`RateLimiter.queue_depth`
+tells how many are waiting.
+"""
+
+import abc
+import asyncio
+import functools
+import inspect
+import threading
+import time
+from typing import Callable, Mapping, Optional, Tuple
+
+READ = "read"
+LIST = "list"
+MUTATION = "mutation"
+
+
+class RateLimiter(abc.ABC):
+    """Decides when the calls of clients may be sent."""
+
+    @abc.abstractmethod
+    def acquire(self, project: str, category: str) -> None:
+        """Block until a call may be sent.
+
+        Args:
+            project (str): The project of the request, or ``""`` for
+                requests without one.
+            category (str): :data:`READ`, :data:`LIST` or :data:`MUTATION`.
+        """
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    async def acquire_async(self, project: str, category: str) -> None:
+        """Wait until a call of an async client may be sent; see
+        :meth:`acquire`."""
+        raise NotImplementedError()
+
+    def queue_depth(
+        self, project: Optional[str] = None, category: Optional[str] = None
+    ) -> int:
+        """Return how many calls are waiting.
+
+        Args:
+            project (Optional[str]): Only count calls of this project.
+            category (Optional[str]): Only count calls of this category.
+        """
+        return 0
+
+
+class _Bucket:
+    __slots__ = ("rate", "capacity", "tokens", "updated", "waiting")
+
+    def __init__(self, rate: float, capacity: float, now: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+        self.waiting = 0
+
+
+class TokenBucketLimiter(RateLimiter):
+    """Paces calls with a token bucket per project and category.
+
+    Each bucket fills at the rate of the quota of its category, up to
+    ``burst`` calls. A call takes a token, and a call that finds the bucket
+    empty reserves the next token and waits until it is due, so waiting
+    calls are sent in the order they arrived, at the quota rate.
+
+    Args:
+        quotas (Mapping[str, float]): The number of calls allowed per
+            ``period`` in each category. Calls of categories without a
+            quota are not paced.
+        period (float): The period of the quotas in seconds. Compute Engine
+            quotas are per minute.
+        burst (Optional[float]): The number of calls that may be sent at
+            once after a pause. Defaults to one second's worth of calls, and
+            at least one.
+        clock (Callable[[], float]): The monotonic clock that times the
+            buckets, in seconds.
+    """
+
+    def __init__(
+        self,
+        quotas: Mapping[str, float],
+        *,
+        period: float = 60.0,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        for category, quota in quotas.items():
+            if quota <= 0:
+                raise ValueError(
+                    "The quota of {!r} must be positive, not {!r}.".format(
+                        category, quota
+                    )
+                )
+        self._rates = {category: quota / period for category, quota in quotas.items()}
+        self._burst = burst
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._buckets = {}  # type: Dict[Tuple[str, str], _Bucket]
+
+    def _reserve(self, project: str, category: str) -> Tuple[Optional[_Bucket], float]:
+        """Take a token, and return its bucket and how long to wait for it."""
+        rate = self._rates.get(category)
+        if rate is None:
+            return None, 0.0
+        with self._lock:
+            now = self._clock()
+            bucket = self._buckets.get((project, category))
+            if bucket is None:
+                capacity = self._burst if self._burst is not None else max(rate, 1.0)
+                bucket = self._buckets[project, category] = _Bucket(rate, capacity, now)
+            bucket.tokens = min(
+                bucket.capacity, bucket.tokens + (now - bucket.updated) * rate
+            )
+            bucket.updated = now
+            bucket.tokens -= 1
+            if bucket.tokens >= 0:
+                return bucket, 0.0
+            bucket.waiting += 1
+            return bucket, -bucket.tokens / rate
+
+    def _release(self, bucket: _Bucket) -> None:
+        with self._lock:
+            bucket.waiting -= 1
+
+    def acquire(self, project: str, category: str) -> None:
+        bucket, delay = self._reserve(project, category)
+        if delay > 0:
+            try:
+                time.sleep(delay)
+            finally:
+                self._release(bucket)
+
+    async def acquire_async(self, project: str, category: str) -> None:
+        bucket, delay = self._reserve(project, category)
+        if delay > 0:
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._release(bucket)
+
+    def queue_depth(
+        self, project: Optional[str] = None, category: Optional[str] = None
+    ) -> int:
+        with self._lock:
+            return sum(
+                bucket.waiting
+                for (bucket_project, bucket_category), bucket in self._buckets.items()
+                if project in (None, bucket_project)
+                and category in (None, bucket_category)
+            )
+
+
+def limit(
+    func: Callable, rate_limiter: Optional[RateLimiter], category: str
+) -> Callable:
+    """Make a transport method acquire permission from a limiter before
+    each call.
+
+    Args:
+        func (Callable): The transport method, which takes the request as
+            its first argument.
+        rate_limiter (Optional[RateLimiter]): The limiter. If ``None``,
+            ``func`` is returned unchanged.
+        category (str): The category of the method.
+
+    Returns:
+        Callable: The paced method, a coroutine function if ``func`` is one.
+    """
+    if rate_limiter is None:
+        return func
+
+    if inspect.iscoroutinefunction(func) or inspect.iscoroutinefunction(
+        getattr(func, "__call__", None)
+    ):
+
+        @functools.wraps(func)
+        async def limited(request, *args, **kwargs):
+            await rate_limiter.acquire_async(getattr(request, "project", ""), category)
+            return await func(request, *args, **kwargs)
+
+    else:
+
+        @functools.wraps(func)
+        def limited(request, *args, **kwargs):
+            rate_limiter.acquire(getattr(request, "project", ""), category)
+            return func(request, *args, **kwargs)
+
+    return limited
+
+
+__all__ = (
+    "LIST",
+    "MUTATION",
+    "READ",
+    "RateLimiter",
+    "TokenBucketLimiter",
+    "limit",
+)
@@ -0,0 +1,504 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Decoding of JSON response bodies for the REST transports.
+
+Responses are parsed with a fast JSON library and the resulting ``dict`` is
+handed to the protobuf message constructor in one call, instead of being
+walked field by field by :mod:`google.protobuf.json_format`. The result is
+identical to ``Message.from_json(payload, ignore_unknown_fields=True)``; any
+payload the fast path cannot handle is passed to ``from_json`` so that errors
+are reported the same way.
+
+The JSON parser is chosen by the ``GOOGLE_CLOUD_COMPUTE_JSON_BACKEND``
+environment variable or by :func:`set_json_backend`:
+
+* ``"auto"`` (default): :mod:`orjson` if it is installed, otherwise
+  :mod:`json`. Install it with ``pip install google-cloud-compute[orjson]``.
+* ``"orjson"`` or ``"json"``: that library.
+* ``"json_format"``: always use ``Message.from_json``.
+
+With ``lazy=True``, :func:`from_json` only parses the JSON document and
+returns a :class:`LazyMessage` view that converts each field the first time
+it is read. Scans that look at a handful of fields of every item in a list
+response skip decoding the rest of each item.
+"""
+
+import base64
+import functools
+import json
+import os
+import struct
+import threading
+from typing import Any, Callable, Mapping, Union
+
+from google.protobuf import descriptor as descriptor_lib
+
+_FieldDescriptor = descriptor_lib.FieldDescriptor
+
+JSON_BACKEND_ENV = "GOOGLE_CLOUD_COMPUTE_JSON_BACKEND"
+
+_INT64_TYPES = frozenset(
+    (
+        _FieldDescriptor.TYPE_INT64,
+        _FieldDescriptor.TYPE_UINT64,
+        _FieldDescriptor.TYPE_SINT64,
+        _FieldDescriptor.TYPE_FIXED64,
+        _FieldDescriptor.TYPE_SFIXED64,
+    )
+)
+_FLOAT_TYPES = frozenset((_FieldDescriptor.TYPE_DOUBLE, _FieldDescriptor.TYPE_FLOAT))
+
+# Returned by converters for values that ignore_unknown_fields drops.
+_SKIP = object()
+_UNSET = object()
+
+_loads = _UNSET  # type: Any
+_tables = {}  # type: Dict[Any, Dict[str, Tuple[str, Optional[Callable]]]]
+_tables_lock = threading.Lock()
+
+
+def _resolve_backend(backend: Union[str, Callable[[bytes], Any]]):
+    if callable(backend):
+        return backend
+    if backend == "auto":
+        try:
+            import orjson  # type: ignore
+        except ImportError:
+            return json.loads
+        return orjson.loads
+    if backend == "orjson":
+        import orjson  # type: ignore
+
+        return orjson.loads
+    if backend == "json":
+        return json.loads
+    if backend == "json_format":
+        return None
+    raise ValueError(
+        "Unknown JSON backend {!r}; expected 'auto', 'orjson', 'json', "
+        "'json_format' or a callable.".format(backend)
+    )
+
+
+def set_json_backend(backend: Union[str, Callable[[bytes], Any]] = "auto") -> None:
+    """Select how REST transports parse response bodies.
+
+    Args:
+        backend (Union[str, Callable[[bytes], Any]]): ``"auto"``,
+            ``"orjson"``, ``"json"``, ``"json_format"``, or a callable that
+            parses a JSON document from ``bytes``, such as ``orjson.loads``.
+
+    Raises:
+        ValueError: If ``backend`` is not a known name.
+        ImportError: If ``backend`` is ``"orjson"`` and it is not installed.
+    """
+    global _loads
+    _loads = _resolve_backend(backend)
+
+
+def _get_loads():
+    global _loads
+    if _loads is _UNSET:
+        _loads = _resolve_backend(os.environ.get(JSON_BACKEND_ENV, "auto"))
+    return _loads
+
+
+def _to_int(value):
+    if type(value) is int:
+        return value
+    if isinstance(value, str):
+        return int(value)
+    raise TypeError("Expected an integer, got {!r}".format(value))
+
+
+def _to_float(value):
+    if isinstance(value, str):
+        # "NaN", "Infinity", "-Infinity" and numeric strings.
+        return float(value)
+    return value
+
+
+def _to_bytes(value):
+    if "-" in value or "_" in value:
+        return base64.urlsafe_b64decode(value + "=" * (-len(value) % 4))
+    return base64.b64decode(value + "=" * (-len(value) % 4))
+
+
+def _make_enum_converter(enum_type):
+    numbers = {value.name: value.number for value in enum_type.values}
+
+    def convert(value):
+        if isinstance(value, str):
+            return numbers.get(value, _SKIP)
+        return value
+
+    return convert
+
+
+_MAP_KEY_CONVERTERS = {
+    _FieldDescriptor.TYPE_BOOL: {"true": True, "false": False}.__getitem__,
+}
+
+
+def _decode_message(table, obj):
+    fields = {}
+    for key, value in obj.items():
+        entry = table.get(key)
+        if entry is None or value is None:
+            continue
+        name, convert = entry
+        if convert is not None:
+            value = convert(value)
+            if value is _SKIP:
+                continue
+        fields[name] = value
+    return fields
+
+
+def _single_converter(field, pending):
+    if field.type == _FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.full_name.startswith("google.protobuf."):
+            # Well-known types have their own JSON mappings.
+            raise TypeError("Unsupported field {}".format(field.full_name))
+        return functools.partial(_decode_message, _compile(field.message_type, pending))
+    if field.type in _INT64_TYPES:
+        return _to_int
+    if field.type in _FLOAT_TYPES:
+        return _to_float
+    if field.type == _FieldDescriptor.TYPE_BYTES:
+        return _to_bytes
+    if field.type == _FieldDescriptor.TYPE_ENUM:
+        return _make_enum_converter(field.enum_type)
+    return None
+
+
+def _repeated(convert):
+    def convert_all(values):
+        converted = [convert(value) for value in values]
+        return [value for value in converted if value is not _SKIP]
+
+    return convert_all
+
+
+def _map(convert_key, convert_value):
+    def convert_all(values):
+        converted = {}
+        for key, value in values.items():
+            if convert_value is not None:
+                value = convert_value(value)
+                if value is _SKIP:
+                    continue
+            converted[key if convert_key is None else convert_key(key)] = value
+        return converted
+
+    return convert_all
+
+
+def _is_repeated(field) -> bool:
+    is_repeated = getattr(field, "is_repeated", None)
+    if is_repeated is None:
+        return field.label == _FieldDescriptor.LABEL_REPEATED
+    return is_repeated
+
+
+def _converter(field, pending):
+    message_type = field.message_type
+    if message_type is not None and message_type.GetOptions().map_entry:
+        key_field = message_type.fields_by_name["key"]
+        value_field = message_type.fields_by_name["value"]
+        if key_field.type == _FieldDescriptor.TYPE_STRING:
+            convert_key = None
+        else:
+            convert_key = _MAP_KEY_CONVERTERS.get(key_field.type, int)
+        convert_value = _single_converter(value_field, pending)
+        if convert_key is None and convert_value is None:
+            return None
+        return _map(convert_key, convert_value)
+
+    convert = _single_converter(field, pending)
+    if convert is not None and _is_repeated(field):
+        return _repeated(convert)
+    return convert
+
+
+def _compile(descriptor, pending):
+    table = _tables.get(descriptor)
+    if table is None:
+        table = pending.get(descriptor)
+    if table is None:
+        # Register before filling in, so that recursive messages resolve to
+        # the same table.
+        table = pending[descriptor] = {}
+        for field in descriptor.fields:
+            entry = (field.name, _converter(field, pending))
+            table[field.name] = entry
+            table[field.json_name] = entry
+    return table
+
+
+def _get_table(descriptor):
+    table = _tables.get(descriptor)
+    if table is None:
+        with _tables_lock:
+            pending = {}
+            table = _compile(descriptor, pending)
+            # Publish the tables only once they are complete.
+            _tables.update(pending)
+    return table
+
+
+def _to_message(message_type, obj):
+    pb_type = message_type.pb()
+    try:
+        table = _get_table(pb_type.DESCRIPTOR)
+        pb = pb_type(**_decode_message(table, obj))
+    except (AttributeError, KeyError, TypeError, ValueError):
+        # Let json_format report why the object is invalid.
+        return message_type.from_json(json.dumps(obj), ignore_unknown_fields=True)
+    return message_type.wrap(pb)
+
+
+# Kinds of fields of a LazyMessage.
+_SCALAR = 0
+_MESSAGE = 1
+_REPEATED_SCALAR = 2
+_REPEATED_MESSAGE = 3
+_MAP_SCALAR = 4
+_MAP_MESSAGE = 5
+
+_view_tables = {}  # type: Dict[Any, Dict[str, Tuple]]
+
+
+def _to_float32(value):
+    value = _to_float(value)
+    return struct.unpack("<f", struct.pack("<f", value))[0]
+
+
+def _view_field(message_type, field):
+    """Describe how a view reads ``field`` of ``message_type``."""
+    message_field = message_type.meta.fields[field.name]
+    entry_type = field.message_type
+    if entry_type is not None and entry_type.GetOptions().map_entry:
+        key_field = entry_type.fields_by_name["key"]
+        value_field = entry_type.fields_by_name["value"]
+        if key_field.type == _FieldDescriptor.TYPE_STRING:
+            convert_key = None
+        else:
+            convert_key = _MAP_KEY_CONVERTERS.get(key_field.type, int)
+        if value_field.type == _FieldDescriptor.TYPE_MESSAGE:
+            value_type = message_field.message.meta.fields["value"].message
+            return _MAP_MESSAGE, convert_key, value_type, None
+        convert_value = _single_converter(value_field, None)
+        return _MAP_SCALAR, _map(convert_key, convert_value), None, None
+
+    if field.type == _FieldDescriptor.TYPE_MESSAGE:
+        if field.message_type.full_name.startswith("google.protobuf."):
+            raise TypeError("Unsupported field {}".format(field.full_name))
+        kind = _REPEATED_MESSAGE if _is_repeated(field) else _MESSAGE
+        return kind, None, message_field.message, None
+
+    if field.type == _FieldDescriptor.TYPE_FLOAT:
+        convert = _to_float32
+    else:
+        convert = _single_converter(field, None)
+    if _is_repeated(field):
+        return _REPEATED_SCALAR, convert and _repeated(convert), None, None
+    return _SCALAR, convert, None, field.default_value
+
+
+def _get_view_table(message_type):
+    table = _view_tables.get(message_type)
+    if table is None:
+        table = {}
+        for field in message_type.pb().DESCRIPTOR.fields:
+            table[field.name] = (field.json_name,) + _view_field(message_type, field)
+        _view_tables[message_type] = table
+    return table
+
+
+class LazyMessage:
+    """A read-only view of a message that decodes fields on first access.
+
+    The view keeps the parsed JSON object of the message and converts a
+    field only when it is read. Reading a field returns the same value as
+    reading it from the fully decoded message, except that nested messages
+    are returned as views too, and repeated and map fields as a ``list`` and
+    a ``dict``. Use :meth:`to_message` to decode the whole message.
+
+    Fields that are never read are never validated, so a malformed value
+    raises when it is read rather than when the response is received.
+
+    Args:
+        message_type (Type[proto.Message]): The message class.
+        obj (Mapping[str, Any]): The JSON object of the message.
+    """
+
+    __slots__ = ("_message_type", "_obj", "_cache", "_message")
+
+    def __init__(self, message_type, obj: Mapping[str, Any]):
+        object.__setattr__(self, "_message_type", message_type)
+        object.__setattr__(self, "_obj", obj)
+        object.__setattr__(self, "_cache", {})
+        object.__setattr__(self, "_message", None)
+
+    def _raw(self, name: str, json_name: str):
+        value = self._obj.get(json_name)
+        if value is None and name != json_name:
+            value = self._obj.get(name)
+        return value
+
+    def __getattr__(self, name: str) -> Any:
+        if name in LazyMessage.__slots__:
+            # Not initialized yet, for example while unpickling.
+            raise AttributeError(name)
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        entry = _get_view_table(self._message_type).get(name)
+        if entry is None:
+            # Properties of the message class, such as ``raw_page``.
+            prop = getattr(self._message_type, name, None)
+            if isinstance(prop, property):
+                return prop.fget(self)
+            raise AttributeError(
+                "Unknown field for {}: {}".format(self._message_type.__name__, name)
+            )
+        json_name, kind, convert, field_type, default = entry
+        raw = self._raw(name, json_name)
+
+        if kind == _SCALAR:
+            if raw is None:
+                value = default
+            else:
+                value = raw if convert is None else convert(raw)
+                if value is _SKIP:
+                    value = default
+        elif kind == _MESSAGE:
+            value = LazyMessage(field_type, raw if raw is not None else {})
+        elif kind == _REPEATED_SCALAR:
+            if raw is None:
+                value = []
+            else:
+                value = list(raw) if convert is None else convert(raw)
+        elif kind == _REPEATED_MESSAGE:
+            value = [LazyMessage(field_type, item) for item in raw or ()]
+        elif kind == _MAP_SCALAR:
+            value = {} if raw is None else convert(raw)
+        else:
+            value = {
+                (key if convert is None else convert(key)): LazyMessage(
+                    field_type, item
+                )
+                for key, item in (raw or {}).items()
+            }
+        cache[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            "{} views are read-only; call to_message() for a mutable "
+            "copy.".format(self._message_type.__name__)
+        )
+
+    def __contains__(self, name: str) -> bool:
+        entry = _get_view_table(self._message_type).get(name)
+        if entry is None:
+            return False
+        raw = self._raw(name, entry[0])
+        if raw is None:
+            return False
+        if entry[1] == _SCALAR:
+            return True
+        # Set messages count as present even when empty, like protobuf.
+        return entry[1] == _MESSAGE or bool(raw)
+
+    def __reduce__(self):
+        return LazyMessage, (self._message_type, self._obj)
+
+    def __dir__(self):
+        return sorted(_get_view_table(self._message_type))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyMessage):
+            other = other.to_message()
+        return self.to_message() == other
+
+    def __ne__(self, other: Any) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return "LazyMessage({}, {!r})".format(self._message_type.__name__, self._obj)
+
+    def to_message(self):
+        """Decode the whole message.
+
+        Returns:
+            proto.Message: The decoded message. The same message is returned
+                on every call.
+        """
+        message = self._message
+        if message is None:
+            message = _to_message(self._message_type, self._obj)
+            object.__setattr__(self, "_message", message)
+        return message
+
+
+def from_json(message_type, payload: Union[bytes, str], *, lazy: bool = False):
+    """Decode a JSON response body into a message.
+
+    Args:
+        message_type (Type[proto.Message]): The response message class.
+        payload (Union[bytes, str]): The JSON encoded message.
+        lazy (bool): Whether to return a :class:`LazyMessage` view that
+            decodes fields on first access instead of a message.
+
+    Returns:
+        Union[proto.Message, LazyMessage]: The decoded message. Unknown
+            fields are ignored.
+
+    Raises:
+        google.protobuf.json_format.ParseError: If the payload is not a
+            valid JSON encoding of ``message_type``.
+    """
+    loads = _get_loads()
+    if lazy:
+        try:
+            obj = (loads or json.loads)(payload)
+        except ValueError:
+            obj = None
+        if isinstance(obj, dict):
+            return LazyMessage(message_type, obj)
+    elif loads is not None:
+        pb_type = message_type.pb()
+        try:
+            table = _get_table(pb_type.DESCRIPTOR)
+            pb = pb_type(**_decode_message(table, loads(payload)))
+        except (AttributeError, KeyError, TypeError, ValueError):
+            pass
+        else:
+            return message_type.wrap(pb)
+    # Let json_format decode the payload, or report why it is invalid.
+    return message_type.from_json(payload, ignore_unknown_fields=True)
+
+
+__all__ = (
+    "JSON_BACKEND_ENV",
+    "LazyMessage",
+    "from_json",
+    "set_json_backend",
+)
@@ -0,0 +1,410 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Default retry and timeout of the Compute Engine methods.
+
+Every method of a client gets the :class:`RetryProfile` of its kind:
+
+* :data:`READ` methods, such as ``get``, ``list`` and ``aggregated_list``,
+  have no side effects and are retried on rate limiting and on transient
+  server errors.
+* :data:`MUTATION` methods take a ``request_id``. A request whose
+  ``request_id`` is unset gets a random one before the first attempt, so
+  that the service runs it at most once however often it is sent, and the
+  method is then retried like a read.
+* :data:`UNKEYED_MUTATION` methods have no ``request_id``. They are only
+  retried when the service rejected the request without running it: on
+  ``429 Too Many Requests`` and on rate-limit errors.
+
+The wait before each retry is drawn uniformly between zero and a bound that
+grows exponentially with each attempt, so that clients throttled together
+do not retry together, and is at least as long as the ``Retry-After``
+header of the failed response asks. Once the timeout of the profile has
+passed, no more attempts are started and
+:class:`~google.api_core.exceptions.RetryError` is raised.
+
+Clients take a :class:`RetryPolicy` through the ``retry_policy`` option of
+:class:`~google.cloud.compute_v1.client_options.ClientOptions`:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+    from google.cloud.compute_v1 import retry_policy
+
+    policy = retry_policy.RetryPolicy(
+        read=retry_policy.RetryProfile(timeout=30.0),
+        methods={"insert": None},
+    )
+    client = compute_v1.InstancesClient(client_options={"retry_policy": policy})
+
+The ``retry`` and ``timeout`` arguments of a call take precedence over the
+policy.
+"""
+
+import asyncio
+import datetime
+import email.utils
+import functools
+import inspect
+import random
+import time
+import uuid
+from typing import Callable, Iterable, Mapping, Optional
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+
+READ = "read"
+MUTATION = "mutation"
+UNKEYED_MUTATION = "unkeyed_mutation"
+
+RATE_LIMIT_REASONS = frozenset(
+    ("rateLimitExceeded", "userRateLimitExceeded", "RATE_LIMIT_EXCEEDED")
+)
+
+_TRANSIENT_ERRORS = (
+    core_exceptions.InternalServerError,
+    core_exceptions.BadGateway,
+    core_exceptions.ServiceUnavailable,
+    core_exceptions.GatewayTimeout,
+)
+
+
+def _reasons(exc: Exception) -> set:
+    reasons = {getattr(exc, "reason", None)}
+    for error in getattr(exc, "errors", None) or ():
+        if isinstance(error, Mapping):
+            reasons.add(error.get("reason"))
+    return reasons
+
+
+def if_rate_limited(exc: Exception) -> bool:
+    """Whether an error means that the service rejected a request without
+    running it, because the caller sends too many requests."""
+    if isinstance(exc, core_exceptions.TooManyRequests):
+        return True
+    return isinstance(exc, core_exceptions.Forbidden) and bool(
+        _reasons(exc) & RATE_LIMIT_REASONS
+    )
+
+
+def if_transient(exc: Exception) -> bool:
+    """Whether an error may not occur again when a request is sent again."""
+    return if_rate_limited(exc) or isinstance(exc, _TRANSIENT_ERRORS)
+
+
+def retry_after(exc: Exception) -> Optional[float]:
+    """Return how many seconds the ``Retry-After`` header of the response
+    that raised an error asks to wait, or ``None`` if it has none."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    value = headers.get("Retry-After") if headers else None
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((when - now).total_seconds(), 0.0)
+
+
+def _with_request_id(args: tuple) -> tuple:
+    """Return the arguments of a call with a copy of its request that has a
+    new ``request_id``, unless the caller set one."""
+    request = args[0] if args else None
+    if request is None or getattr(request, "request_id", True):
+        return args
+    # Copied, so that the same request sent again is not a duplicate of
+    # this call.
+    request = type(request)(request)
+    request.request_id = str(uuid.uuid4())
+    return (request,) + tuple(args[1:])
+
+
+class Retry:
+    """Retries a call with jittered exponential backoff that honors
+    ``Retry-After``.
+
+    Args:
+        predicate (Callable[[Exception], bool]): Whether an error is
+            retried.
+        initial (float): The bound of the wait before the second attempt,
+            in seconds.
+        maximum (float): The largest bound of a wait, in seconds.
+        multiplier (float): The factor by which the bound grows after each
+            attempt.
+        timeout (Optional[float]): The time after the first attempt past
+            which no attempt is started, in seconds. ``None`` retries for as
+            long as the predicate allows.
+        set_request_id (bool): Whether to send a copy of the request with a
+            new ``request_id``, shared by all attempts of a call, when the
+            request has none.
+    """
+
+    def __init__(
+        self,
+        predicate: Callable[[Exception], bool] = if_transient,
+        *,
+        initial: float = 1.0,
+        maximum: float = 60.0,
+        multiplier: float = 2.0,
+        timeout: Optional[float] = 120.0,
+        set_request_id: bool = False,
+    ):
+        self._predicate = predicate
+        self._initial = initial
+        self._maximum = maximum
+        self._multiplier = multiplier
+        self._timeout = timeout
+        self._set_request_id = set_request_id
+
+    def _bounds(self) -> Iterable[float]:
+        bound = self._initial
+        while True:
+            yield bound
+            bound = min(bound * self._multiplier, self._maximum)
+
+    def _wait(self, exc: Exception, bound: float, deadline: Optional[float]) -> float:
+        """Return how long to wait before retrying after an error, or raise
+        if the error is not retried."""
+        if not self._predicate(exc):
+            raise exc
+        wait = random.uniform(0.0, bound)
+        requested = retry_after(exc)
+        if requested is not None:
+            wait = max(wait, requested)
+        if deadline is not None and time.monotonic() + wait > deadline:
+            raise core_exceptions.RetryError(
+                "Timeout of {:.1f}s exceeded".format(self._timeout), exc
+            ) from exc
+        return wait
+
+    def _deadline(self) -> Optional[float]:
+        if self._timeout is None:
+            return None
+        return time.monotonic() + self._timeout
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        def retry_wrapped(*args, **kwargs):
+            if self._set_request_id:
+                args = _with_request_id(args)
+            deadline = self._deadline()
+            for bound in self._bounds():
+                try:
+                    return func(*args, **kwargs)
+                except Exception as exc:
+                    wait = self._wait(exc, bound, deadline)
+                time.sleep(wait)
+
+        return retry_wrapped
+
+    def __repr__(self) -> str:
+        return (
+            "<{} predicate={}, initial={:.1f}, maximum={:.1f}, multiplier={:.1f}, "
+            "timeout={}, set_request_id={}>".format(
+                type(self).__name__,
+                getattr(self._predicate, "__name__", self._predicate),
+                self._initial,
+                self._maximum,
+                self._multiplier,
+                self._timeout,
+                self._set_request_id,
+            )
+        )
+
+
+class AsyncRetry(Retry):
+    """:class:`Retry` for coroutine functions."""
+
+    def __call__(self, func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def retry_wrapped(*args, **kwargs):
+            if self._set_request_id:
+                args = _with_request_id(args)
+            deadline = self._deadline()
+            for bound in self._bounds():
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as exc:
+                    wait = self._wait(exc, bound, deadline)
+                await asyncio.sleep(wait)
+
+        return retry_wrapped
+
+
+class RetryProfile:
+    """The retry and timeout defaults of a kind of method.
+
+    Args:
+        initial (float): The bound of the wait before the second attempt,
+            in seconds.
+        maximum (float): The largest bound of a wait, in seconds.
+        multiplier (float): The factor by which the bound grows after each
+            attempt.
+        timeout (Optional[float]): The time within which a call, retries
+            included, must finish, in seconds. ``None`` for no limit.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: float = 1.0,
+        maximum: float = 60.0,
+        multiplier: float = 2.0,
+        timeout: Optional[float] = 120.0,
+    ):
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.timeout = timeout
+
+    def retry(self, kind: str, *, asynchronous: bool = False) -> Retry:
+        """Build the retry of a kind of method.
+
+        Args:
+            kind (str): :data:`READ`, :data:`MUTATION` or
+                :data:`UNKEYED_MUTATION`.
+            asynchronous (bool): Whether the method is a coroutine function.
+
+        Returns:
+            Retry: The retry.
+        """
+        if kind not in (READ, MUTATION, UNKEYED_MUTATION):
+            raise ValueError("Unknown kind of method: {!r}".format(kind))
+        return (AsyncRetry if asynchronous else Retry)(
+            if_rate_limited if kind == UNKEYED_MUTATION else if_transient,
+            initial=self.initial,
+            maximum=self.maximum,
+            multiplier=self.multiplier,
+            timeout=self.timeout,
+            set_request_id=kind == MUTATION,
+        )
+
+    def __repr__(self) -> str:
+        return "RetryProfile(initial={}, maximum={}, multiplier={}, timeout={})".format(
+            self.initial, self.maximum, self.multiplier, self.timeout
+        )
+
+
+DEFAULT_READ_PROFILE = RetryProfile(initial=0.5, maximum=32.0, timeout=120.0)
+DEFAULT_MUTATION_PROFILE = RetryProfile(initial=1.0, maximum=60.0, timeout=300.0)
+# ``wait`` of the operations services returns after up to two minutes.
+DEFAULT_METHOD_PROFILES = {"wait": RetryProfile(initial=1.0, timeout=600.0)}
+
+
+class RetryPolicy:
+    """The retry and timeout defaults of the methods of a client.
+
+    Args:
+        read (Optional[RetryProfile]): The profile of :data:`READ` methods.
+        mutation (Optional[RetryProfile]): The profile of :data:`MUTATION`
+            methods.
+        unkeyed_mutation (Optional[RetryProfile]): The profile of
+            :data:`UNKEYED_MUTATION` methods.
+        methods (Mapping[str, Optional[RetryProfile]]): Profiles of single
+            methods, by the name of the transport method, such as ``"get"``
+            or ``"insert"``, that take precedence over those of their kind.
+            ``None`` turns off retries and the timeout of the method.
+
+    Profiles that are not given are the defaults.
+    """
+
+    def __init__(
+        self,
+        *,
+        read: Optional[RetryProfile] = DEFAULT_READ_PROFILE,
+        mutation: Optional[RetryProfile] = DEFAULT_MUTATION_PROFILE,
+        unkeyed_mutation: Optional[RetryProfile] = DEFAULT_MUTATION_PROFILE,
+        methods: Mapping[str, Optional[RetryProfile]] = None,
+    ):
+        self._kinds = {
+            READ: read,
+            MUTATION: mutation,
+            UNKEYED_MUTATION: unkeyed_mutation,
+        }
+        self._methods = dict(DEFAULT_METHOD_PROFILES)
+        self._methods.update(methods or {})
+
+    def profile(self, method: str, kind: str) -> Optional[RetryProfile]:
+        """Return the profile of a method, or ``None`` if it has none.
+
+        Args:
+            method (str): The name of the transport method.
+            kind (str): The kind of the method.
+        """
+        if method in self._methods:
+            return self._methods[method]
+        return self._kinds[kind]
+
+    def wrap_method(
+        self,
+        func: Callable,
+        method: str,
+        kind: str,
+        client_info: gapic_v1.client_info.ClientInfo = gapic_v1.client_info.DEFAULT_CLIENT_INFO,
+    ) -> Callable:
+        """Wrap a transport method with its default retry and timeout.
+
+        Args:
+            func (Callable): The transport method. Coroutine functions get
+                an :class:`AsyncRetry`.
+            method (str): The name of the transport method.
+            kind (str): The kind of the method.
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info sent with the calls.
+
+        Returns:
+            Callable: The wrapped method, as made by
+                :func:`google.api_core.gapic_v1.method.wrap_method`.
+        """
+        profile = self.profile(method, kind)
+        if profile is None:
+            return gapic_v1.method.wrap_method(
+                func, default_timeout=None, client_info=client_info
+            )
+        asynchronous = inspect.iscoroutinefunction(func) or (
+            inspect.iscoroutinefunction(getattr(func, "__call__", None))
+        )
+        return gapic_v1.method.wrap_method(
+            func,
+            default_retry=profile.retry(kind, asynchronous=asynchronous),
+            default_timeout=profile.timeout,
+            client_info=client_info,
+        )
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+__all__ = (
+    "AsyncRetry",
+    "DEFAULT_RETRY_POLICY",
+    "MUTATION",
+    "READ",
+    "Retry",
+    "RetryPolicy",
+    "RetryProfile",
+    "UNKEYED_MUTATION",
+    "if_rate_limited",
+    "if_transient",
+    "retry_after",
+)
@@ -15,4 +15,18 @@
 #
 from .client import AcceleratorTypesClient
 
-__all__ = ("AcceleratorTypesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "AcceleratorTypesAsyncClient":
+        from .async_client import AcceleratorTypesAsyncClient
+
+        return AcceleratorTypesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "AcceleratorTypesClient",
+    "AcceleratorTypesAsyncClient",
+)
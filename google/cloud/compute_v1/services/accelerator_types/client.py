@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,12 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.accelerator_types import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _scatter
+from google.cloud.compute_v1 import _client_info
 from google.cloud.compute_v1.types import compute
 from .transports.base import AcceleratorTypesTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import AcceleratorTypesRestTransport
@@ -289,7 +295,12 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, AcceleratorTypesTransport, None] = None,
+        transport: Union[
+            str,
+            AcceleratorTypesTransport,
+            Callable[..., AcceleratorTypesTransport],
+            None,
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -301,9 +312,13 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, AcceleratorTypesTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, AcceleratorTypesTransport, Callable[..., AcceleratorTypesTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the AcceleratorTypesTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter``, ``cache`` and ``coalescer``
+                when they are set in ``client_options``. If set to None, a
+                transport is chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -320,6 +335,26 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``cache`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to reuse the responses of the client for a
+                while; see :mod:`google.cloud.compute_v1.caching`.
+                (7) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -331,7 +366,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -345,6 +380,12 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        cache = getattr(client_options, "cache", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -360,6 +401,31 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if cache is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its cache "
+                    "directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -371,8 +437,29 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if cache is not None:
+                transport_kwargs["cache"] = cache
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[AcceleratorTypesTransport],
+                Callable[..., AcceleratorTypesTransport],
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -381,6 +468,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def aggregated_list(
@@ -389,8 +477,14 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        parallel: int = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of accelerator types.
 
@@ -409,6 +503,38 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            parallel (int): If set, list the zones and regions named by
+                the first page with up to this many concurrent ``list``
+                requests instead of requesting the following pages, and
+                yield each zone or region as a page of its own once it is
+                complete, in no particular order. ``retry``, ``timeout``,
+                ``metadata``, ``prefetch`` and ``page_sizer`` apply to the
+                ``list`` requests of each zone and region. Cannot be
+                combined with ``views`` or ``fields``.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.accelerator_types.pagers.AggregatedListPager:
@@ -427,6 +553,33 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.AggregatedListAcceleratorTypesRequest
+            )
+
+        if parallel is not None:
+            if parallel < 1:
+                raise ValueError("The `parallel` argument must be at least 1.")
+            if views or fields is not None:
+                raise ValueError(
+                    "The `parallel` argument cannot be combined with "
+                    "`views` or `fields`."
+                )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.AggregatedListAcceleratorTypesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -438,17 +591,54 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             if project is not None:
                 request.project = project
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.aggregated_list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        scatter = None
+        if parallel is not None:
+            # List the zones and regions concurrently after the first page.
+            scatter = _scatter.scatter(
+                self._transport,
+                "accelerator_types",
+                parallel,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                prefetch=prefetch,
+                page_sizer=page_sizer,
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.AggregatedListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+            scatter=scatter,
         )
 
         # Done; return the response.
@@ -462,8 +652,9 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         zone: str = None,
         accelerator_type: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.AcceleratorType:
         r"""Returns the specified accelerator type.
 
@@ -496,6 +687,10 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.AcceleratorType:
@@ -538,6 +733,10 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -551,8 +750,13 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         project: str = None,
         zone: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Retrieves a list of accelerator types that are
         available to the specified project.
@@ -579,6 +783,30 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.accelerator_types.pagers.ListPager:
@@ -598,6 +826,24 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListAcceleratorTypesRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListAcceleratorTypesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -611,17 +857,39 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
             if zone is not None:
                 request.zone = zone
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -641,12 +909,7 @@ class AcceleratorTypesClient(metaclass=AcceleratorTypesClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("AcceleratorTypesClient",)
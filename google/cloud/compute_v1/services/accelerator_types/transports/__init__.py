@@ -24,7 +24,19 @@ from .rest import AcceleratorTypesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[AcceleratorTypesTransport]]
 _transport_registry["rest"] = AcceleratorTypesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "AcceleratorTypesAsyncRestTransport":
+        from .rest_asyncio import AcceleratorTypesAsyncRestTransport
+
+        return AcceleratorTypesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "AcceleratorTypesTransport",
     "AcceleratorTypesRestTransport",
+    "AcceleratorTypesAsyncRestTransport",
 )
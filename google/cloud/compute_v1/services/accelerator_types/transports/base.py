@@ -15,7 +15,6 @@
 #
 import abc
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Union
-import pkg_resources
 
 import google.auth  # type: ignore
 import google.api_core
@@ -25,14 +24,14 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import caching
+from google.cloud.compute_v1 import coalescing
+from google.cloud.compute_v1 import rate_limiting
+from google.cloud.compute_v1 import retry_policy
 from google.cloud.compute_v1.types import compute
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 class AcceleratorTypesTransport(abc.ABC):
@@ -46,6 +45,15 @@ class AcceleratorTypesTransport(abc.ABC):
 
     DEFAULT_HOST: str = "compute.googleapis.com"
 
+    # The default retry and timeout of each method.
+    _retry_policy = retry_policy.DEFAULT_RETRY_POLICY
+    # The limiter that paces the calls, if any.
+    _rate_limiter = None
+    # The cache of the responses, if any.
+    _cache = None
+    # The coalescer of identical reads in flight, if any.
+    _coalescer = None
+
     def __init__(
         self,
         *,
@@ -122,14 +130,53 @@ class AcceleratorTypesTransport(abc.ABC):
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.aggregated_list: gapic_v1.method.wrap_method(
-                self.aggregated_list, default_timeout=None, client_info=client_info,
+            self.aggregated_list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    caching.cached(
+                        rate_limiting.limit(
+                            self.aggregated_list, self._rate_limiter, rate_limiting.LIST
+                        ),
+                        self._cache,
+                        self,
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "aggregated_list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get, default_timeout=None, client_info=client_info,
+            self.get: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    caching.cached(
+                        rate_limiting.limit(
+                            self.get, self._rate_limiter, rate_limiting.READ
+                        ),
+                        self._cache,
+                        self,
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.list: gapic_v1.method.wrap_method(
-                self.list, default_timeout=None, client_info=client_info,
+            self.list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    caching.cached(
+                        rate_limiting.limit(
+                            self.list, self._rate_limiter, rate_limiting.LIST
+                        ),
+                        self._cache,
+                        self,
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
         }
 
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,20 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.caching import Cache
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    AcceleratorTypesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import AcceleratorTypesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -69,8 +68,6 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, AcceleratorTypesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -83,6 +80,11 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[Cache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -115,22 +117,55 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            cache (Optional[google.cloud.compute_v1.caching.Cache]):
+                A cache of the responses. Pass the same cache to several
+                transports to share its entries. If ``None``, responses
+                are not cached.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, AcceleratorTypesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AcceleratorTypesRestStub):
@@ -147,6 +182,17 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListAcceleratorTypesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/acceleratorTypes",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListAcceleratorTypesRequest,
@@ -154,6 +200,8 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.AcceleratorTypeAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -168,39 +216,21 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AcceleratorTypeAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/acceleratorTypes",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListAcceleratorTypesRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListAcceleratorTypesRequest.to_json(
-                    compute.AggregatedListAcceleratorTypesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -210,7 +240,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -218,8 +248,8 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AcceleratorTypeAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AcceleratorTypeAggregatedList, response.content, lazy=views
             )
 
     class _Get(AcceleratorTypesRestStub):
@@ -236,6 +266,17 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetAcceleratorTypeRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes/{accelerator_type}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetAcceleratorTypeRequest,
@@ -243,6 +284,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.AcceleratorType:
             r"""Call the get method over HTTP.
 
@@ -257,6 +299,8 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AcceleratorType:
@@ -271,31 +315,10 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes/{accelerator_type}",
-                },
-            ]
-
-            request_kwargs = compute.GetAcceleratorTypeRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetAcceleratorTypeRequest.to_json(
-                    compute.GetAcceleratorTypeRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -305,7 +328,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -313,8 +336,8 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AcceleratorType.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AcceleratorType, response.content
             )
 
     class _List(AcceleratorTypesRestStub):
@@ -331,6 +354,17 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListAcceleratorTypesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListAcceleratorTypesRequest,
@@ -338,6 +372,8 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.AcceleratorTypeList:
             r"""Call the list method over HTTP.
 
@@ -352,37 +388,21 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AcceleratorTypeList:
                     Contains a list of accelerator types.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes",
-                },
-            ]
-
-            request_kwargs = compute.ListAcceleratorTypesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListAcceleratorTypesRequest.to_json(
-                    compute.ListAcceleratorTypesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -392,7 +412,7 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -400,8 +420,8 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AcceleratorTypeList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AcceleratorTypeList, response.content, lazy=views
             )
 
     @property
@@ -411,9 +431,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
         [compute.AggregatedListAcceleratorTypesRequest],
         compute.AcceleratorTypeAggregatedList,
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -423,9 +443,9 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetAcceleratorTypeRequest], compute.AcceleratorType]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -433,14 +453,15 @@ class AcceleratorTypesRestTransport(AcceleratorTypesTransport):
     def list(
         self,
     ) -> Callable[[compute.ListAcceleratorTypesRequest], compute.AcceleratorTypeList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("AcceleratorTypesRestTransport",)
@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry_async as retries
+from google.api_core import gapic_v1
+import dataclasses
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    OptionalRetry = Union[retries.AsyncRetry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.AsyncRetry, object]  # type: ignore
+
+
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.caching import Cache
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
+from google.cloud.compute_v1.types import compute
+
+from .base import AcceleratorTypesTransport
+from .rest import DEFAULT_CLIENT_INFO
+
+
+@dataclasses.dataclass
+class AcceleratorTypesAsyncRestStub:
+    _session: AsyncAuthorizedSession
+    _host: str
+
+
+class AcceleratorTypesAsyncRestTransport(AcceleratorTypesTransport):
+    """Asynchronous REST backend transport for AcceleratorTypes.
+
+    Services
+    The AcceleratorTypes API.
+
+    This class defines the same methods as the primary client, so the
+    primary client can load the underlying transport implementation
+    and call it.
+
+    It sends JSON representations of protocol buffers over HTTP/1.1
+    from an asyncio event loop, so many requests can be in flight on a
+    single thread. Connections are drawn from the bounded pool of the
+    :class:`~google.cloud.compute_v1._async_session.AsyncAuthorizedSession`.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "compute.googleapis.com",
+        credentials: ga_credentials.Credentials = None,
+        credentials_file: str = None,
+        scopes: Sequence[str] = None,
+        client_cert_source_for_mtls: Callable[[], Tuple[bytes, bytes]] = None,
+        quota_project_id: Optional[str] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        always_use_jwt_access: Optional[bool] = False,
+        url_scheme: str = "https",
+        session: Optional[AsyncAuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[Cache] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ) -> None:
+        """Instantiate the transport.
+
+        Args:
+            host (Optional[str]):
+                 The hostname to connect to.
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+
+            credentials_file (Optional[str]): A file with credentials that can
+                be loaded with :func:`google.auth.load_credentials_from_file`.
+                This argument is ignored if ``channel`` is provided.
+            scopes (Optional(Sequence[str])): A list of scopes. This argument is
+                ignored if ``channel`` is provided.
+            client_cert_source_for_mtls (Callable[[], Tuple[bytes, bytes]]): Client
+                certificate to configure mutual TLS HTTP channel. It is ignored
+                if ``channel`` is provided.
+            quota_project_id (Optional[str]): An optional project to use for billing
+                and quota.
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info used to send a user-agent string along with
+                API requests. If ``None``, then default info will be used.
+                Generally, you only need to set this if you are developing
+                your own client library.
+            always_use_jwt_access (Optional[bool]): Whether self signed JWT should
+                be used for service account credentials.
+            url_scheme: the protocol scheme for the API endpoint.  Normally
+                "https", but for testing or local servers,
+                "http" can be specified.
+            session (Optional[google.cloud.compute_v1._async_session.AsyncAuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one bounded connection
+                pool. A shared session is not closed by :meth:`close`. If
+                ``None``, a session with the default pool size is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            cache (Optional[google.cloud.compute_v1.caching.Cache]):
+                A cache of the responses. Pass the same cache to several
+                transports to share its entries. If ``None``, responses
+                are not cached.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
+        """
+        # Run the base constructor
+        # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
+        # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
+        # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
+        super().__init__(
+            host=host,
+            credentials=credentials,
+            client_info=client_info,
+            always_use_jwt_access=always_use_jwt_access,
+        )
+        self._owns_session = session is None
+        if session is None:
+            session = AsyncAuthorizedSession(self._credentials)
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, AcceleratorTypesAsyncRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._coalescer = coalescer
+        self._prep_wrapped_messages(client_info)
+
+    class _AggregatedList(AcceleratorTypesAsyncRestStub):
+        def __hash__(self):
+            return hash("AggregatedList")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListAcceleratorTypesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/acceleratorTypes",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.AggregatedListAcceleratorTypesRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
+        ) -> compute.AcceleratorTypeAggregatedList:
+            r"""Call the aggregated list method over HTTP.
+
+            Args:
+                request (~.compute.AggregatedListAcceleratorTypesRequest):
+                    The request object. A request message for
+                AcceleratorTypes.AggregatedList. See the
+                method description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
+
+            Returns:
+                ~.compute.AcceleratorTypeAggregatedList:
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(
+                compute.AcceleratorTypeAggregatedList, response.content, lazy=views
+            )
+
+    class _Get(AcceleratorTypesAsyncRestStub):
+        def __hash__(self):
+            return hash("Get")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetAcceleratorTypeRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes/{accelerator_type}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.GetAcceleratorTypeRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
+        ) -> compute.AcceleratorType:
+            r"""Call the get method over HTTP.
+
+            Args:
+                request (~.compute.GetAcceleratorTypeRequest):
+                    The request object. A request message for
+                AcceleratorTypes.Get. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
+
+            Returns:
+                ~.compute.AcceleratorType:
+                    Represents an Accelerator Type
+                resource. Google Cloud Platform provides
+                graphics processing units (accelerators)
+                that you can add to VM instances to
+                improve or accelerate performance when
+                working with intensive workloads. For
+                more information, read GPUs on Compute
+                Engine.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(
+                compute.AcceleratorType, response.content
+            )
+
+    class _List(AcceleratorTypesAsyncRestStub):
+        def __hash__(self):
+            return hash("List")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListAcceleratorTypesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/acceleratorTypes",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.ListAcceleratorTypesRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
+        ) -> compute.AcceleratorTypeList:
+            r"""Call the list method over HTTP.
+
+            Args:
+                request (~.compute.ListAcceleratorTypesRequest):
+                    The request object. A request message for
+                AcceleratorTypes.List. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
+
+            Returns:
+                ~.compute.AcceleratorTypeList:
+                    Contains a list of accelerator types.
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(
+                compute.AcceleratorTypeList, response.content, lazy=views
+            )
+
+    @property
+    def aggregated_list(
+        self,
+    ) -> Callable[
+        [compute.AggregatedListAcceleratorTypesRequest],
+        Awaitable[compute.AcceleratorTypeAggregatedList],
+    ]:
+        stub = self._stubs.get("aggregated_list")
+        if not stub:
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
+                self._session, self._host
+            )
+
+        return stub
+
+    @property
+    def get(
+        self,
+    ) -> Callable[
+        [compute.GetAcceleratorTypeRequest], Awaitable[compute.AcceleratorType]
+    ]:
+        stub = self._stubs.get("get")
+        if not stub:
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
+
+        return stub
+
+    @property
+    def list(
+        self,
+    ) -> Callable[
+        [compute.ListAcceleratorTypesRequest], Awaitable[compute.AcceleratorTypeList]
+    ]:
+        stub = self._stubs.get("list")
+        if not stub:
+            stub = self._stubs["list"] = self._List(self._session, self._host)
+
+        return stub
+
+    async def close(self):
+        if self._owns_session:
+            await self._session.close()
+
+
+__all__ = ("AcceleratorTypesAsyncRestTransport",)
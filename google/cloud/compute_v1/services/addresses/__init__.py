@@ -15,4 +15,18 @@
 #
 from .client import AddressesClient
 
-__all__ = ("AddressesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "AddressesAsyncClient":
+        from .async_client import AddressesAsyncClient
+
+        return AddressesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "AddressesClient",
+    "AddressesAsyncClient",
+)
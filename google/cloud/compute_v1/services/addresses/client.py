@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,13 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.addresses import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _scatter
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import AddressesTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import AddressesRestTransport
@@ -285,7 +292,9 @@ class AddressesClient(metaclass=AddressesClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, AddressesTransport, None] = None,
+        transport: Union[
+            str, AddressesTransport, Callable[..., AddressesTransport], None
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -297,9 +306,13 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, AddressesTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, AddressesTransport, Callable[..., AddressesTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the AddressesTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -316,6 +329,22 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -327,7 +356,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -341,6 +370,11 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -356,6 +390,26 @@ class AddressesClient(metaclass=AddressesClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -367,8 +421,26 @@ class AddressesClient(metaclass=AddressesClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[AddressesTransport], Callable[..., AddressesTransport]
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -377,6 +449,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def aggregated_list(
@@ -385,8 +458,14 @@ class AddressesClient(metaclass=AddressesClientMeta):
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        parallel: int = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of addresses.
 
@@ -405,6 +484,38 @@ class AddressesClient(metaclass=AddressesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            parallel (int): If set, list the zones and regions named by
+                the first page with up to this many concurrent ``list``
+                requests instead of requesting the following pages, and
+                yield each zone or region as a page of its own once it is
+                complete, in no particular order. ``retry``, ``timeout``,
+                ``metadata``, ``prefetch`` and ``page_sizer`` apply to the
+                ``list`` requests of each zone and region. Cannot be
+                combined with ``views`` or ``fields``.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.addresses.pagers.AggregatedListPager:
@@ -423,6 +534,33 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.AggregatedListAddressesRequest
+            )
+
+        if parallel is not None:
+            if parallel < 1:
+                raise ValueError("The `parallel` argument must be at least 1.")
+            if views or fields is not None:
+                raise ValueError(
+                    "The `parallel` argument cannot be combined with "
+                    "`views` or `fields`."
+                )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.AggregatedListAddressesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -434,17 +572,54 @@ class AddressesClient(metaclass=AddressesClientMeta):
             if project is not None:
                 request.project = project
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.aggregated_list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        scatter = None
+        if parallel is not None:
+            # List the zones and regions concurrently after the first page.
+            scatter = _scatter.scatter(
+                self._transport,
+                "addresses",
+                parallel,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                prefetch=prefetch,
+                page_sizer=page_sizer,
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.AggregatedListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+            scatter=scatter,
         )
 
         # Done; return the response.
@@ -458,7 +633,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
         region: str = None,
         address: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes the specified address resource.
@@ -545,6 +720,64 @@ class AddressesClient(metaclass=AddressesClientMeta):
         # Done; return the response.
         return response
 
+    def delete(
+        self,
+        request: Union[compute.DeleteAddressRequest, dict] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        address: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes the specified address resource.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteAddressRequest, dict]):
+                The request object. A request message for
+                Addresses.Delete. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region for this request.
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            address (str):
+                Name of the address resource to
+                delete.
+
+                This corresponds to the ``address`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_unary(
+            request,
+            project=project,
+            region=region,
+            address=address,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetAddressRequest, dict] = None,
@@ -553,8 +786,9 @@ class AddressesClient(metaclass=AddressesClientMeta):
         region: str = None,
         address: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.Address:
         r"""Returns the specified address resource.
 
@@ -584,6 +818,10 @@ class AddressesClient(metaclass=AddressesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.Address:
@@ -625,6 +863,10 @@ class AddressesClient(metaclass=AddressesClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -639,7 +881,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
         region: str = None,
         address_resource: compute.Address = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates an address resource in the specified project
@@ -725,6 +967,63 @@ class AddressesClient(metaclass=AddressesClientMeta):
         # Done; return the response.
         return response
 
+    def insert(
+        self,
+        request: Union[compute.InsertAddressRequest, dict] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        address_resource: compute.Address = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates an address resource in the specified project
+        by using the data included in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertAddressRequest, dict]):
+                The request object. A request message for
+                Addresses.Insert. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region for this request.
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            address_resource (google.cloud.compute_v1.types.Address):
+                The body resource for this request
+                This corresponds to the ``address_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.insert_unary(
+            request,
+            project=project,
+            region=region,
+            address_resource=address_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def list(
         self,
         request: Union[compute.ListAddressesRequest, dict] = None,
@@ -732,8 +1031,13 @@ class AddressesClient(metaclass=AddressesClientMeta):
         project: str = None,
         region: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Retrieves a list of addresses contained within the
         specified region.
@@ -757,6 +1061,30 @@ class AddressesClient(metaclass=AddressesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.addresses.pagers.ListPager:
@@ -776,6 +1104,24 @@ class AddressesClient(metaclass=AddressesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListAddressesRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListAddressesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -789,17 +1135,39 @@ class AddressesClient(metaclass=AddressesClientMeta):
             if region is not None:
                 request.region = region
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -819,12 +1187,7 @@ class AddressesClient(metaclass=AddressesClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("AddressesClient",)
@@ -24,6 +24,9 @@ from typing import (
     Iterator,
 )
 
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _prefetch
+from google.cloud.compute_v1 import columnar
 from google.cloud.compute_v1.types import compute
 
 
@@ -51,7 +54,10 @@ class AggregatedListPager:
         request: compute.AggregatedListAddressesRequest,
         response: compute.AddressAggregatedList,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        scatter: Callable = None,
+        prefetch: int = 0,
+        offset: int = 0
     ):
         """Instantiate the pager.
 
@@ -64,17 +70,48 @@ class AggregatedListPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            scatter (Callable): If set, lists the scopes named by the
+                initial response concurrently instead of requesting the
+                following pages. See the ``parallel`` argument of
+                ``aggregated_list``.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used. If ``0``, each
+                page is requested once the previous one is used.
+            offset (int): How many results of the initial response to
+                skip when iterating, to continue from a checkpoint.
         """
         self._method = method
         self._request = compute.AggregatedListAddressesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._scatter = scatter
+        self._prefetch = prefetch
+        self._offset = offset
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterator[compute.AddressAggregatedList]:
+        if self._scatter is not None and self._response.next_page_token:
+            # The scopes replace the initial response, which names them all.
+            pages = self._scatter(self._request, self._response)
+            if pages is not None:
+                for self._response in pages:
+                    yield self._response
+                return
+        if self._prefetch:
+            # Request the following pages in the background.
+            pages = _prefetch.pages(
+                self._method,
+                self._request,
+                self._response,
+                self._prefetch,
+                self._metadata,
+            )
+            for self._request.page_token, self._response in pages:
+                yield self._response
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -82,12 +119,177 @@ class AggregatedListPager:
             yield self._response
 
     def __iter__(self) -> Iterator[Tuple[str, compute.AddressesScopedList]]:
+        offset = self._offset
         for page in self.pages:
-            yield from page.items.items()
+            for self._offset, response in enumerate(sorted(page.items.items()), 1):
+                if self._offset > offset:
+                    yield response
+            offset = 0
 
     def get(self, key: str) -> Optional[compute.AddressesScopedList]:
         return self._response.items.get(key)
 
+    def checkpoint(self) -> str:
+        """Return the position of the iteration, to continue from with the
+        ``resume_from`` argument of the method that made this pager.
+
+        The position is the page being iterated and how many of its
+        results have been yielded by iterating the pager.
+        """
+        if self._scatter is not None:
+            raise ValueError(
+                "The pager of a `parallel` aggregated list cannot be checkpointed."
+            )
+        return _checkpoint.dumps(self._request, self._offset)
+
+    def to_columns(self, columns: columnar.ColumnPaths) -> columnar.Columns:
+        """Read fields of the remaining results into columns, without
+        decoding each result into a message.
+
+        Args:
+            columns (Union[Sequence[str], Mapping[str, str]]): The paths of
+                the fields to read, or the paths by column name; see
+                :mod:`google.cloud.compute_v1.columnar`.
+
+        Returns:
+            google.cloud.compute_v1.columnar.Columns: The fields of the
+                :class:`google.cloud.compute_v1.types.Address` results, by
+                column.
+        """
+        return columnar.read(
+            self.pages,
+            compute.Address,
+            columns,
+            "items",
+            scoped="addresses",
+            offset=self._offset,
+        )
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class AggregatedListAsyncPager:
+    """A pager for iterating through ``aggregated_list`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.cloud.compute_v1.types.AddressAggregatedList` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``items`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``AggregatedList`` requests and continue to iterate
+    through the ``items`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.cloud.compute_v1.types.AddressAggregatedList`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[compute.AddressAggregatedList]],
+        request: compute.AggregatedListAddressesRequest,
+        response: compute.AddressAggregatedList,
+        *,
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        offset: int = 0
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.cloud.compute_v1.types.AggregatedListAddressesRequest):
+                The initial request object.
+            response (google.cloud.compute_v1.types.AddressAggregatedList):
+                The initial response object.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used. If ``0``, each
+                page is requested once the previous one is used.
+            offset (int): How many results of the initial response to
+                skip when iterating, to continue from a checkpoint.
+        """
+        self._method = method
+        self._request = compute.AggregatedListAddressesRequest(request)
+        self._response = response
+        self._metadata = metadata
+        self._prefetch = prefetch
+        self._offset = offset
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterator[compute.AddressAggregatedList]:
+        if self._prefetch:
+            # Request the following pages in the background.
+            pages = _prefetch.async_pages(
+                self._method,
+                self._request,
+                self._response,
+                self._prefetch,
+                self._metadata,
+            )
+            async for self._request.page_token, self._response in pages:
+                yield self._response
+            return
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(self._request, metadata=self._metadata)
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterator[Tuple[str, compute.AddressesScopedList]]:
+        async def async_generator():
+            offset = self._offset
+            async for page in self.pages:
+                for self._offset, response in enumerate(sorted(page.items.items()), 1):
+                    if self._offset > offset:
+                        yield response
+                offset = 0
+
+        return async_generator()
+
+    def get(self, key: str) -> Optional[compute.AddressesScopedList]:
+        return self._response.items.get(key)
+
+    def checkpoint(self) -> str:
+        """Return the position of the iteration, to continue from with the
+        ``resume_from`` argument of the method that made this pager.
+
+        The position is the page being iterated and how many of its
+        results have been yielded by iterating the pager.
+        """
+        return _checkpoint.dumps(self._request, self._offset)
+
+    async def to_columns(self, columns: columnar.ColumnPaths) -> columnar.Columns:
+        """Read fields of the remaining results into columns, without
+        decoding each result into a message.
+
+        Args:
+            columns (Union[Sequence[str], Mapping[str, str]]): The paths of
+                the fields to read, or the paths by column name; see
+                :mod:`google.cloud.compute_v1.columnar`.
+
+        Returns:
+            google.cloud.compute_v1.columnar.Columns: The fields of the
+                :class:`google.cloud.compute_v1.types.Address` results, by
+                column.
+        """
+        return await columnar.read_async(
+            self.pages,
+            compute.Address,
+            columns,
+            "items",
+            scoped="addresses",
+            offset=self._offset,
+        )
+
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
 
@@ -116,7 +318,9 @@ class ListPager:
         request: compute.ListAddressesRequest,
         response: compute.AddressList,
         *,
-        metadata: Sequence[Tuple[str, str]] = ()
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        offset: int = 0
     ):
         """Instantiate the pager.
 
@@ -129,17 +333,36 @@ class ListPager:
                 The initial response object.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used. If ``0``, each
+                page is requested once the previous one is used.
+            offset (int): How many results of the initial response to
+                skip when iterating, to continue from a checkpoint.
         """
         self._method = method
         self._request = compute.ListAddressesRequest(request)
         self._response = response
         self._metadata = metadata
+        self._prefetch = prefetch
+        self._offset = offset
 
     def __getattr__(self, name: str) -> Any:
         return getattr(self._response, name)
 
     @property
     def pages(self) -> Iterator[compute.AddressList]:
+        if self._prefetch:
+            # Request the following pages in the background.
+            pages = _prefetch.pages(
+                self._method,
+                self._request,
+                self._response,
+                self._prefetch,
+                self._metadata,
+            )
+            for self._request.page_token, self._response in pages:
+                yield self._response
+            return
         yield self._response
         while self._response.next_page_token:
             self._request.page_token = self._response.next_page_token
@@ -147,8 +370,156 @@ class ListPager:
             yield self._response
 
     def __iter__(self) -> Iterator[compute.Address]:
+        offset = self._offset
         for page in self.pages:
-            yield from page.items
+            for self._offset, response in enumerate(page.items, 1):
+                if self._offset > offset:
+                    yield response
+            offset = 0
+
+    def checkpoint(self) -> str:
+        """Return the position of the iteration, to continue from with the
+        ``resume_from`` argument of the method that made this pager.
+
+        The position is the page being iterated and how many of its
+        results have been yielded by iterating the pager.
+        """
+        return _checkpoint.dumps(self._request, self._offset)
+
+    def to_columns(self, columns: columnar.ColumnPaths) -> columnar.Columns:
+        """Read fields of the remaining results into columns, without
+        decoding each result into a message.
+
+        Args:
+            columns (Union[Sequence[str], Mapping[str, str]]): The paths of
+                the fields to read, or the paths by column name; see
+                :mod:`google.cloud.compute_v1.columnar`.
+
+        Returns:
+            google.cloud.compute_v1.columnar.Columns: The fields of the
+                :class:`google.cloud.compute_v1.types.Address` results, by
+                column.
+        """
+        return columnar.read(
+            self.pages, compute.Address, columns, "items", offset=self._offset
+        )
+
+    def __repr__(self) -> str:
+        return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
+
+
+class ListAsyncPager:
+    """A pager for iterating through ``list`` requests.
+
+    This class thinly wraps an initial
+    :class:`google.cloud.compute_v1.types.AddressList` object, and
+    provides an ``__aiter__`` method to iterate through its
+    ``items`` field.
+
+    If there are more pages, the ``__aiter__`` method will make additional
+    ``List`` requests and continue to iterate
+    through the ``items`` field on the
+    corresponding responses.
+
+    All the usual :class:`google.cloud.compute_v1.types.AddressList`
+    attributes are available on the pager. If multiple requests are made, only
+    the most recent response is retained, and thus used for attribute lookup.
+    """
+
+    def __init__(
+        self,
+        method: Callable[..., Awaitable[compute.AddressList]],
+        request: compute.ListAddressesRequest,
+        response: compute.AddressList,
+        *,
+        metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        offset: int = 0
+    ):
+        """Instantiate the pager.
+
+        Args:
+            method (Callable): The method that was originally called, and
+                which instantiated this pager.
+            request (google.cloud.compute_v1.types.ListAddressesRequest):
+                The initial request object.
+            response (google.cloud.compute_v1.types.AddressList):
+                The initial response object.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used. If ``0``, each
+                page is requested once the previous one is used.
+            offset (int): How many results of the initial response to
+                skip when iterating, to continue from a checkpoint.
+        """
+        self._method = method
+        self._request = compute.ListAddressesRequest(request)
+        self._response = response
+        self._metadata = metadata
+        self._prefetch = prefetch
+        self._offset = offset
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._response, name)
+
+    @property
+    async def pages(self) -> AsyncIterator[compute.AddressList]:
+        if self._prefetch:
+            # Request the following pages in the background.
+            pages = _prefetch.async_pages(
+                self._method,
+                self._request,
+                self._response,
+                self._prefetch,
+                self._metadata,
+            )
+            async for self._request.page_token, self._response in pages:
+                yield self._response
+            return
+        yield self._response
+        while self._response.next_page_token:
+            self._request.page_token = self._response.next_page_token
+            self._response = await self._method(self._request, metadata=self._metadata)
+            yield self._response
+
+    def __aiter__(self) -> AsyncIterator[compute.Address]:
+        async def async_generator():
+            offset = self._offset
+            async for page in self.pages:
+                for self._offset, response in enumerate(page.items, 1):
+                    if self._offset > offset:
+                        yield response
+                offset = 0
+
+        return async_generator()
+
+    def checkpoint(self) -> str:
+        """Return the position of the iteration, to continue from with the
+        ``resume_from`` argument of the method that made this pager.
+
+        The position is the page being iterated and how many of its
+        results have been yielded by iterating the pager.
+        """
+        return _checkpoint.dumps(self._request, self._offset)
+
+    async def to_columns(self, columns: columnar.ColumnPaths) -> columnar.Columns:
+        """Read fields of the remaining results into columns, without
+        decoding each result into a message.
+
+        Args:
+            columns (Union[Sequence[str], Mapping[str, str]]): The paths of
+                the fields to read, or the paths by column name; see
+                :mod:`google.cloud.compute_v1.columnar`.
+
+        Returns:
+            google.cloud.compute_v1.columnar.Columns: The fields of the
+                :class:`google.cloud.compute_v1.types.Address` results, by
+                column.
+        """
+        return await columnar.read_async(
+            self.pages, compute.Address, columns, "items", offset=self._offset
+        )
 
     def __repr__(self) -> str:
         return "{0}<{1!r}>".format(self.__class__.__name__, self._response)
@@ -24,7 +24,19 @@ from .rest import AddressesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[AddressesTransport]]
 _transport_registry["rest"] = AddressesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "AddressesAsyncRestTransport":
+        from .rest_asyncio import AddressesAsyncRestTransport
+
+        return AddressesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "AddressesTransport",
     "AddressesRestTransport",
+    "AddressesAsyncRestTransport",
 )
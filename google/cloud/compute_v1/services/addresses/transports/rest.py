@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,15 +32,18 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import AddressesTransport, DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
+from .base import AddressesTransport
 
-
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -65,8 +65,6 @@ class AddressesRestTransport(AddressesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, AddressesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -79,6 +77,10 @@ class AddressesRestTransport(AddressesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -111,22 +113,50 @@ class AddressesRestTransport(AddressesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, AddressesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AddressesRestStub):
@@ -143,6 +173,17 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListAddressesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/addresses",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListAddressesRequest,
@@ -150,6 +191,8 @@ class AddressesRestTransport(AddressesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.AddressAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -164,37 +207,21 @@ class AddressesRestTransport(AddressesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AddressAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/addresses",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListAddressesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListAddressesRequest.to_json(
-                    compute.AggregatedListAddressesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -204,7 +231,7 @@ class AddressesRestTransport(AddressesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -212,8 +239,8 @@ class AddressesRestTransport(AddressesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AddressAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AddressAggregatedList, response.content, lazy=views
             )
 
     class _Delete(AddressesRestStub):
@@ -230,6 +257,17 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteAddressRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteAddressRequest,
@@ -272,29 +310,8 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteAddressRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteAddressRequest.to_json(
-                    compute.DeleteAddressRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -304,7 +321,7 @@ class AddressesRestTransport(AddressesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -312,9 +329,7 @@ class AddressesRestTransport(AddressesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(AddressesRestStub):
         def __hash__(self):
@@ -330,6 +345,17 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetAddressRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetAddressRequest,
@@ -337,6 +363,7 @@ class AddressesRestTransport(AddressesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.Address:
             r"""Call the get method over HTTP.
 
@@ -350,6 +377,8 @@ class AddressesRestTransport(AddressesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.Address:
@@ -363,29 +392,10 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses/{address}",
-                },
-            ]
-
-            request_kwargs = compute.GetAddressRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetAddressRequest.to_json(
-                    compute.GetAddressRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -395,7 +405,7 @@ class AddressesRestTransport(AddressesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -403,9 +413,7 @@ class AddressesRestTransport(AddressesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Address.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Address, response.content)
 
     class _Insert(AddressesRestStub):
         def __hash__(self):
@@ -421,6 +429,18 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertAddressRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
+                    "body": "address_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertAddressRequest,
@@ -463,36 +483,8 @@ class AddressesRestTransport(AddressesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
-                    "body": "address_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertAddressRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Address.to_json(
-                compute.Address(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertAddressRequest.to_json(
-                    compute.InsertAddressRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -502,7 +494,7 @@ class AddressesRestTransport(AddressesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -511,9 +503,7 @@ class AddressesRestTransport(AddressesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(AddressesRestStub):
         def __hash__(self):
@@ -529,6 +519,17 @@ class AddressesRestTransport(AddressesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListAddressesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListAddressesRequest,
@@ -536,6 +537,8 @@ class AddressesRestTransport(AddressesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.AddressList:
             r"""Call the list method over HTTP.
 
@@ -549,35 +552,21 @@ class AddressesRestTransport(AddressesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AddressList:
                     Contains a list of addresses.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/addresses",
-                },
-            ]
-
-            request_kwargs = compute.ListAddressesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListAddressesRequest.to_json(
-                    compute.ListAddressesRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -587,7 +576,7 @@ class AddressesRestTransport(AddressesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -595,8 +584,8 @@ class AddressesRestTransport(AddressesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AddressList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AddressList, response.content, lazy=views
             )
 
     @property
@@ -605,9 +594,9 @@ class AddressesRestTransport(AddressesTransport):
     ) -> Callable[
         [compute.AggregatedListAddressesRequest], compute.AddressAggregatedList
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -615,38 +604,39 @@ class AddressesRestTransport(AddressesTransport):
 
     @property
     def delete(self) -> Callable[[compute.DeleteAddressRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
     @property
     def get(self) -> Callable[[compute.GetAddressRequest], compute.Address]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
     @property
     def insert(self) -> Callable[[compute.InsertAddressRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
     @property
     def list(self) -> Callable[[compute.ListAddressesRequest], compute.AddressList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("AddressesRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import AutoscalersClient
 
-__all__ = ("AutoscalersClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "AutoscalersAsyncClient":
+        from .async_client import AutoscalersAsyncClient
+
+        return AutoscalersAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "AutoscalersClient",
+    "AutoscalersAsyncClient",
+)
@@ -0,0 +1,1010 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from collections import OrderedDict
+import functools
+import re
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
+
+from google.api_core.client_options import ClientOptions
+from google.api_core import exceptions as core_exceptions
+from google.api_core import gapic_v1
+from google.api_core import retry_async as retries
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.oauth2 import service_account  # type: ignore
+
+try:
+    OptionalRetry = Union[retries.AsyncRetry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.AsyncRetry, object]  # type: ignore
+
+from google.cloud.compute_v1.services.autoscalers import pagers
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1.types import compute
+from .transports.base import AutoscalersTransport, DEFAULT_CLIENT_INFO
+from .transports.rest_asyncio import AutoscalersAsyncRestTransport
+from .client import AutoscalersClient
+
+
+class AutoscalersAsyncClient:
+    """The Autoscalers API."""
+
+    _client: AutoscalersClient
+
+    DEFAULT_ENDPOINT = AutoscalersClient.DEFAULT_ENDPOINT
+    DEFAULT_MTLS_ENDPOINT = AutoscalersClient.DEFAULT_MTLS_ENDPOINT
+
+    common_billing_account_path = staticmethod(
+        AutoscalersClient.common_billing_account_path
+    )
+    parse_common_billing_account_path = staticmethod(
+        AutoscalersClient.parse_common_billing_account_path
+    )
+    common_folder_path = staticmethod(AutoscalersClient.common_folder_path)
+    parse_common_folder_path = staticmethod(AutoscalersClient.parse_common_folder_path)
+    common_organization_path = staticmethod(AutoscalersClient.common_organization_path)
+    parse_common_organization_path = staticmethod(
+        AutoscalersClient.parse_common_organization_path
+    )
+    common_project_path = staticmethod(AutoscalersClient.common_project_path)
+    parse_common_project_path = staticmethod(
+        AutoscalersClient.parse_common_project_path
+    )
+    common_location_path = staticmethod(AutoscalersClient.common_location_path)
+    parse_common_location_path = staticmethod(
+        AutoscalersClient.parse_common_location_path
+    )
+
+    @classmethod
+    def from_service_account_info(cls, info: dict, *args, **kwargs):
+        """Creates an instance of this client using the provided credentials
+            info.
+
+        Args:
+            info (dict): The service account private key info.
+            args: Additional arguments to pass to the constructor.
+            kwargs: Additional arguments to pass to the constructor.
+
+        Returns:
+            AutoscalersAsyncClient: The constructed client.
+        """
+        return AutoscalersClient.from_service_account_info.__func__(AutoscalersAsyncClient, info, *args, **kwargs)  # type: ignore
+
+    @classmethod
+    def from_service_account_file(cls, filename: str, *args, **kwargs):
+        """Creates an instance of this client using the provided credentials
+            file.
+
+        Args:
+            filename (str): The path to the service account private key json
+                file.
+            args: Additional arguments to pass to the constructor.
+            kwargs: Additional arguments to pass to the constructor.
+
+        Returns:
+            AutoscalersAsyncClient: The constructed client.
+        """
+        return AutoscalersClient.from_service_account_file.__func__(AutoscalersAsyncClient, filename, *args, **kwargs)  # type: ignore
+
+    from_service_account_json = from_service_account_file
+
+    @classmethod
+    def get_mtls_endpoint_and_cert_source(
+        cls, client_options: Optional[ClientOptions] = None
+    ):
+        """Return the API endpoint and client cert source for mutual TLS.
+
+        See :meth:`AutoscalersClient.get_mtls_endpoint_and_cert_source` for
+        the resolution order.
+
+        Args:
+            client_options (google.api_core.client_options.ClientOptions): Custom options for the
+                client. Only the `api_endpoint` and `client_cert_source` properties may be used
+                in this method.
+
+        Returns:
+            Tuple[str, Callable[[], Tuple[bytes, bytes]]]: returns the API endpoint and the
+                client cert source to use.
+
+        Raises:
+            google.auth.exceptions.MutualTLSChannelError: If any errors happen.
+        """
+        return AutoscalersClient.get_mtls_endpoint_and_cert_source(client_options)  # type: ignore
+
+    @property
+    def transport(self) -> AutoscalersTransport:
+        """Returns the transport used by the client instance.
+
+        Returns:
+            AutoscalersTransport: The transport used by the client instance.
+        """
+        return self._client.transport
+
+    # The async transports are only registered with the async client, so
+    # that the sync client does not import them.
+    _transport_registry = OrderedDict()  # type: Dict[str, Type[AutoscalersTransport]]
+    _transport_registry["rest_asyncio"] = AutoscalersAsyncRestTransport
+
+    @classmethod
+    def get_transport_class(cls, label: str = None,) -> Type[AutoscalersTransport]:
+        """Returns an appropriate transport class.
+
+        Args:
+            label: The name of the desired transport. If none is
+                provided, then the first transport in the registry is used.
+
+        Returns:
+            The transport class to use.
+        """
+        # If a specific transport is requested, return that one.
+        if label:
+            return cls._transport_registry[label]
+
+        # No transport is requested; return the default (that is, the first one
+        # in the dictionary).
+        return next(iter(cls._transport_registry.values()))
+
+    def __init__(
+        self,
+        *,
+        credentials: ga_credentials.Credentials = None,
+        transport: Union[
+            str, AutoscalersTransport, Callable[..., AutoscalersTransport]
+        ] = "rest_asyncio",
+        client_options: ClientOptions = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+    ) -> None:
+        """Instantiates the autoscalers client.
+
+        Args:
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+            transport (Union[str, ~.AutoscalersTransport, Callable[..., ~.AutoscalersTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the AutoscalersTransport constructor. If set to None, a transport
+                is chosen automatically.
+            client_options (ClientOptions): Custom options for the client. It
+                won't take effect if a ``transport`` instance is provided.
+                (1) The ``api_endpoint`` property can be used to override the
+                default endpoint provided by the client. GOOGLE_API_USE_MTLS_ENDPOINT
+                environment variable can also be used to override the endpoint:
+                "always" (always use the default mTLS endpoint), "never" (always
+                use the default regular endpoint) and "auto" (auto switch to the
+                default mTLS endpoint if client certificate is present, this is
+                the default value). However, the ``api_endpoint`` property takes
+                precedence if provided.
+                (2) If GOOGLE_API_USE_CLIENT_CERTIFICATE environment variable
+                is "true", then the ``client_cert_source`` property can be used
+                to provide client certificate for mutual TLS transport. If
+                not provided, the default SSL client certificate will be used if
+                present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
+                set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                :class:`~google.cloud.compute_v1._async_session.AsyncAuthorizedSession`.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
+
+        Raises:
+            google.auth.exceptions.MutualTlsChannelError: If mutual TLS transport
+                creation failed for any reason.
+        """
+        if isinstance(transport, str) or transport is None:
+            transport = type(self).get_transport_class(transport)
+        self._client = AutoscalersClient(
+            credentials=credentials,
+            transport=transport,
+            client_options=client_options,
+            client_info=client_info,
+        )
+
+    async def aggregated_list(
+        self,
+        request: Union[compute.AggregatedListAutoscalersRequest, dict] = None,
+        *,
+        project: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
+    ) -> pagers.AggregatedListAsyncPager:
+        r"""Retrieves an aggregated list of autoscalers.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AggregatedListAutoscalersRequest, dict]):
+                The request object. A request message for
+                Autoscalers.AggregatedList. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
+
+        Returns:
+            google.cloud.compute_v1.services.autoscalers.pagers.AggregatedListAsyncPager:
+                Iterating over this object will yield
+                results and resolve additional pages
+                automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.AggregatedListAutoscalersRequest
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.AggregatedListAutoscalersRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.AggregatedListAutoscalersRequest):
+            request = compute.AggregatedListAutoscalersRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[
+            self._client._transport.aggregated_list
+        ]
+
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap_async(rpc)
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.AggregatedListAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def delete_unary(
+        self,
+        request: Union[compute.DeleteAutoscalerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        autoscaler: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Deletes the specified autoscaler.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteAutoscalerRequest, dict]):
+                The request object. A request message for
+                Autoscalers.Delete. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                Name of the zone for this request.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            autoscaler (str):
+                Name of the autoscaler to delete.
+                This corresponds to the ``autoscaler`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, autoscaler])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.DeleteAutoscalerRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.DeleteAutoscalerRequest):
+            request = compute.DeleteAutoscalerRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if autoscaler is not None:
+                request.autoscaler = autoscaler
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[self._client._transport.delete]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    async def get(
+        self,
+        request: Union[compute.GetAutoscalerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        autoscaler: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
+    ) -> compute.Autoscaler:
+        r"""Returns the specified autoscaler resource. Gets a
+        list of available autoscalers by making a list()
+        request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.GetAutoscalerRequest, dict]):
+                The request object. A request message for
+                Autoscalers.Get. See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                Name of the zone for this request.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            autoscaler (str):
+                Name of the autoscaler to return.
+                This corresponds to the ``autoscaler`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
+
+        Returns:
+            google.cloud.compute_v1.types.Autoscaler:
+                Represents an Autoscaler resource. Google Compute Engine
+                has two Autoscaler resources: \*
+                [Zonal](/compute/docs/reference/rest/v1/autoscalers) \*
+                [Regional](/compute/docs/reference/rest/v1/regionAutoscalers)
+                Use autoscalers to automatically add or delete instances
+                from a managed instance group according to your defined
+                autoscaling policy. For more information, read
+                Autoscaling Groups of Instances. For zonal managed
+                instance groups resource, use the autoscaler resource.
+                For regional managed instance groups, use the
+                regionAutoscalers resource.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, autoscaler])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.GetAutoscalerRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.GetAutoscalerRequest):
+            request = compute.GetAutoscalerRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if autoscaler is not None:
+                request.autoscaler = autoscaler
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[self._client._transport.get]
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    async def insert_unary(
+        self,
+        request: Union[compute.InsertAutoscalerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        autoscaler_resource: compute.Autoscaler = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Creates an autoscaler in the specified project using
+        the data included in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertAutoscalerRequest, dict]):
+                The request object. A request message for
+                Autoscalers.Insert. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                Name of the zone for this request.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            autoscaler_resource (google.cloud.compute_v1.types.Autoscaler):
+                The body resource for this request
+                This corresponds to the ``autoscaler_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, autoscaler_resource])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.InsertAutoscalerRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.InsertAutoscalerRequest):
+            request = compute.InsertAutoscalerRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if autoscaler_resource is not None:
+                request.autoscaler_resource = autoscaler_resource
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[self._client._transport.insert]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    async def list(
+        self,
+        request: Union[compute.ListAutoscalersRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
+    ) -> pagers.ListAsyncPager:
+        r"""Retrieves a list of autoscalers contained within the
+        specified zone.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ListAutoscalersRequest, dict]):
+                The request object. A request message for
+                Autoscalers.List. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                Name of the zone for this request.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
+
+        Returns:
+            google.cloud.compute_v1.services.autoscalers.pagers.ListAsyncPager:
+                Contains a list of Autoscaler
+                resources.
+                Iterating over this object will yield
+                results and resolve additional pages
+                automatically.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListAutoscalersRequest
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.ListAutoscalersRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.ListAutoscalersRequest):
+            request = compute.ListAutoscalersRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[self._client._transport.list]
+
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap_async(rpc)
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # This method is paged; wrap the response in a pager, which provides
+        # an `__aiter__` convenience method.
+        response = pagers.ListAsyncPager(
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+        )
+
+        # Done; return the response.
+        return response
+
+    async def patch_unary(
+        self,
+        request: Union[compute.PatchAutoscalerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        autoscaler_resource: compute.Autoscaler = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Updates an autoscaler in the specified project using
+        the data included in the request. This method supports
+        PATCH semantics and uses the JSON merge patch format and
+        processing rules.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchAutoscalerRequest, dict]):
+                The request object. A request message for
+                Autoscalers.Patch. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                Name of the zone for this request.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            autoscaler_resource (google.cloud.compute_v1.types.Autoscaler):
+                The body resource for this request
+                This corresponds to the ``autoscaler_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, autoscaler_resource])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.PatchAutoscalerRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.PatchAutoscalerRequest):
+            request = compute.PatchAutoscalerRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if autoscaler_resource is not None:
+                request.autoscaler_resource = autoscaler_resource
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[self._client._transport.patch]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    async def update_unary(
+        self,
+        request: Union[compute.UpdateAutoscalerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        autoscaler_resource: compute.Autoscaler = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Updates an autoscaler in the specified project using
+        the data included in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdateAutoscalerRequest, dict]):
+                The request object. A request message for
+                Autoscalers.Update. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                Name of the zone for this request.
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            autoscaler_resource (google.cloud.compute_v1.types.Autoscaler):
+                The body resource for this request
+                This corresponds to the ``autoscaler_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, autoscaler_resource])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.UpdateAutoscalerRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.UpdateAutoscalerRequest):
+            request = compute.UpdateAutoscalerRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if autoscaler_resource is not None:
+                request.autoscaler_resource = autoscaler_resource
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._client._transport._wrapped_methods[self._client._transport.update]
+
+        # Send the request.
+        response = await rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.transport.close()
+
+
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
+
+
+__all__ = ("AutoscalersAsyncClient",)
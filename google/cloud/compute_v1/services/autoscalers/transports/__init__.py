@@ -24,7 +24,19 @@ from .rest import AutoscalersRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[AutoscalersTransport]]
 _transport_registry["rest"] = AutoscalersRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "AutoscalersAsyncRestTransport":
+        from .rest_asyncio import AutoscalersAsyncRestTransport
+
+        return AutoscalersAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "AutoscalersTransport",
     "AutoscalersRestTransport",
+    "AutoscalersAsyncRestTransport",
 )
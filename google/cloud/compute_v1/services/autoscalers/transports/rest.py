@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,15 +32,18 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import AutoscalersTransport, DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
+from .base import AutoscalersTransport
 
-
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -65,8 +65,6 @@ class AutoscalersRestTransport(AutoscalersTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, AutoscalersRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -79,6 +77,10 @@ class AutoscalersRestTransport(AutoscalersTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -111,22 +113,50 @@ class AutoscalersRestTransport(AutoscalersTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, AutoscalersRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(AutoscalersRestStub):
@@ -143,6 +173,17 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListAutoscalersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/autoscalers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListAutoscalersRequest,
@@ -150,6 +191,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.AutoscalerAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -164,37 +207,21 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AutoscalerAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/autoscalers",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListAutoscalersRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListAutoscalersRequest.to_json(
-                    compute.AggregatedListAutoscalersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -204,7 +231,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -212,8 +239,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AutoscalerAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AutoscalerAggregatedList, response.content, lazy=views
             )
 
     class _Delete(AutoscalersRestStub):
@@ -230,6 +257,17 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteAutoscalerRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteAutoscalerRequest,
@@ -272,29 +310,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteAutoscalerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteAutoscalerRequest.to_json(
-                    compute.DeleteAutoscalerRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -304,7 +321,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -312,9 +329,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(AutoscalersRestStub):
         def __hash__(self):
@@ -330,6 +345,17 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetAutoscalerRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetAutoscalerRequest,
@@ -337,6 +363,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.Autoscaler:
             r"""Call the get method over HTTP.
 
@@ -351,6 +378,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.Autoscaler:
@@ -369,29 +398,10 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
-                },
-            ]
-
-            request_kwargs = compute.GetAutoscalerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetAutoscalerRequest.to_json(
-                    compute.GetAutoscalerRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -401,7 +411,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -409,9 +419,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Autoscaler.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Autoscaler, response.content)
 
     class _Insert(AutoscalersRestStub):
         def __hash__(self):
@@ -427,6 +435,18 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertAutoscalerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertAutoscalerRequest,
@@ -469,36 +489,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                    "body": "autoscaler_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertAutoscalerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Autoscaler.to_json(
-                compute.Autoscaler(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertAutoscalerRequest.to_json(
-                    compute.InsertAutoscalerRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -508,7 +500,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -517,9 +509,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(AutoscalersRestStub):
         def __hash__(self):
@@ -535,6 +525,17 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListAutoscalersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListAutoscalersRequest,
@@ -542,6 +543,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.AutoscalerList:
             r"""Call the list method over HTTP.
 
@@ -556,6 +559,11 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.AutoscalerList:
@@ -564,29 +572,10 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                },
-            ]
-
-            request_kwargs = compute.ListAutoscalersRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListAutoscalersRequest.to_json(
-                    compute.ListAutoscalersRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -596,7 +585,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -604,8 +593,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.AutoscalerList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.AutoscalerList, response.content, lazy=views
             )
 
     class _Patch(AutoscalersRestStub):
@@ -622,6 +611,18 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchAutoscalerRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchAutoscalerRequest,
@@ -664,36 +665,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                    "body": "autoscaler_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchAutoscalerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Autoscaler.to_json(
-                compute.Autoscaler(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchAutoscalerRequest.to_json(
-                    compute.PatchAutoscalerRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -703,7 +676,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -712,9 +685,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Update(AutoscalersRestStub):
         def __hash__(self):
@@ -730,6 +701,18 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateAutoscalerRequest,
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateAutoscalerRequest,
@@ -772,36 +755,8 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
-                    "body": "autoscaler_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateAutoscalerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Autoscaler.to_json(
-                compute.Autoscaler(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateAutoscalerRequest.to_json(
-                    compute.UpdateAutoscalerRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -811,7 +766,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -820,9 +775,7 @@ class AutoscalersRestTransport(AutoscalersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def aggregated_list(
@@ -830,9 +783,9 @@ class AutoscalersRestTransport(AutoscalersTransport):
     ) -> Callable[
         [compute.AggregatedListAutoscalersRequest], compute.AutoscalerAggregatedList
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -840,25 +793,25 @@ class AutoscalersRestTransport(AutoscalersTransport):
 
     @property
     def delete(self) -> Callable[[compute.DeleteAutoscalerRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
     @property
     def get(self) -> Callable[[compute.GetAutoscalerRequest], compute.Autoscaler]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
     @property
     def insert(self) -> Callable[[compute.InsertAutoscalerRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -866,30 +819,31 @@ class AutoscalersRestTransport(AutoscalersTransport):
     def list(
         self,
     ) -> Callable[[compute.ListAutoscalersRequest], compute.AutoscalerList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
     @property
     def patch(self) -> Callable[[compute.PatchAutoscalerRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
     @property
     def update(self) -> Callable[[compute.UpdateAutoscalerRequest], compute.Operation]:
-        stub = self._STUBS.get("update")
+        stub = self._stubs.get("update")
         if not stub:
-            stub = self._STUBS["update"] = self._Update(self._session, self._host)
+            stub = self._stubs["update"] = self._Update(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("AutoscalersRestTransport",)
@@ -0,0 +1,851 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry_async as retries
+from google.api_core import gapic_v1
+import dataclasses
+from typing import Awaitable, Callable, Dict, Optional, Sequence, Tuple, Union
+
+try:
+    OptionalRetry = Union[retries.AsyncRetry, gapic_v1.method._MethodDefault]
+except AttributeError:  # pragma: NO COVER
+    OptionalRetry = Union[retries.AsyncRetry, object]  # type: ignore
+
+
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
+from google.cloud.compute_v1.types import compute
+
+from .base import AutoscalersTransport
+from .rest import DEFAULT_CLIENT_INFO
+
+
+@dataclasses.dataclass
+class AutoscalersAsyncRestStub:
+    _session: AsyncAuthorizedSession
+    _host: str
+
+
+class AutoscalersAsyncRestTransport(AutoscalersTransport):
+    """Asynchronous REST backend transport for Autoscalers.
+
+    The Autoscalers API.
+
+    This class defines the same methods as the primary client, so the
+    primary client can load the underlying transport implementation
+    and call it.
+
+    It sends JSON representations of protocol buffers over HTTP/1.1
+    from an asyncio event loop, so many requests can be in flight on a
+    single thread. Connections are drawn from the bounded pool of the
+    :class:`~google.cloud.compute_v1._async_session.AsyncAuthorizedSession`.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str = "compute.googleapis.com",
+        credentials: ga_credentials.Credentials = None,
+        credentials_file: str = None,
+        scopes: Sequence[str] = None,
+        client_cert_source_for_mtls: Callable[[], Tuple[bytes, bytes]] = None,
+        quota_project_id: Optional[str] = None,
+        client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
+        always_use_jwt_access: Optional[bool] = False,
+        url_scheme: str = "https",
+        session: Optional[AsyncAuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
+    ) -> None:
+        """Instantiate the transport.
+
+        Args:
+            host (Optional[str]):
+                 The hostname to connect to.
+            credentials (Optional[google.auth.credentials.Credentials]): The
+                authorization credentials to attach to requests. These
+                credentials identify the application to the service; if none
+                are specified, the client will attempt to ascertain the
+                credentials from the environment.
+
+            credentials_file (Optional[str]): A file with credentials that can
+                be loaded with :func:`google.auth.load_credentials_from_file`.
+                This argument is ignored if ``channel`` is provided.
+            scopes (Optional(Sequence[str])): A list of scopes. This argument is
+                ignored if ``channel`` is provided.
+            client_cert_source_for_mtls (Callable[[], Tuple[bytes, bytes]]): Client
+                certificate to configure mutual TLS HTTP channel. It is ignored
+                if ``channel`` is provided.
+            quota_project_id (Optional[str]): An optional project to use for billing
+                and quota.
+            client_info (google.api_core.gapic_v1.client_info.ClientInfo):
+                The client info used to send a user-agent string along with
+                API requests. If ``None``, then default info will be used.
+                Generally, you only need to set this if you are developing
+                your own client library.
+            always_use_jwt_access (Optional[bool]): Whether self signed JWT should
+                be used for service account credentials.
+            url_scheme: the protocol scheme for the API endpoint.  Normally
+                "https", but for testing or local servers,
+                "http" can be specified.
+            session (Optional[google.cloud.compute_v1._async_session.AsyncAuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one bounded connection
+                pool. A shared session is not closed by :meth:`close`. If
+                ``None``, a session with the default pool size is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
+        """
+        # Run the base constructor
+        # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
+        # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
+        # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
+        super().__init__(
+            host=host,
+            credentials=credentials,
+            client_info=client_info,
+            always_use_jwt_access=always_use_jwt_access,
+        )
+        self._owns_session = session is None
+        if session is None:
+            session = AsyncAuthorizedSession(self._credentials)
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, AutoscalersAsyncRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
+        self._prep_wrapped_messages(client_info)
+
+    class _AggregatedList(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("AggregatedList")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListAutoscalersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/autoscalers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.AggregatedListAutoscalersRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
+        ) -> compute.AutoscalerAggregatedList:
+            r"""Call the aggregated list method over HTTP.
+
+            Args:
+                request (~.compute.AggregatedListAutoscalersRequest):
+                    The request object. A request message for
+                Autoscalers.AggregatedList. See the
+                method description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
+
+            Returns:
+                ~.compute.AutoscalerAggregatedList:
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(
+                compute.AutoscalerAggregatedList, response.content, lazy=views
+            )
+
+    class _Delete(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("Delete")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteAutoscalerRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.DeleteAutoscalerRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> compute.Operation:
+            r"""Call the delete method over HTTP.
+
+            Args:
+                request (~.compute.DeleteAutoscalerRequest):
+                    The request object. A request message for
+                Autoscalers.Delete. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                ~.compute.Operation:
+                    Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                `Global </compute/docs/reference/rest/v1/globalOperations>`__
+                \*
+                `Regional </compute/docs/reference/rest/v1/regionOperations>`__
+                \*
+                `Zonal </compute/docs/reference/rest/v1/zoneOperations>`__
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the ``globalOperations``
+                resource. - For regional operations, use the
+                ``regionOperations`` resource. - For zonal operations,
+                use the ``zonalOperations`` resource. For more
+                information, read Global, Regional, and Zonal Resources.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(compute.Operation, response.content)
+
+    class _Get(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("Get")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetAutoscalerRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers/{autoscaler}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.GetAutoscalerRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
+        ) -> compute.Autoscaler:
+            r"""Call the get method over HTTP.
+
+            Args:
+                request (~.compute.GetAutoscalerRequest):
+                    The request object. A request message for
+                Autoscalers.Get. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
+
+            Returns:
+                ~.compute.Autoscaler:
+                    Represents an Autoscaler resource. Google Compute Engine
+                has two Autoscaler resources: \*
+                `Zonal </compute/docs/reference/rest/v1/autoscalers>`__
+                \*
+                `Regional </compute/docs/reference/rest/v1/regionAutoscalers>`__
+                Use autoscalers to automatically add or delete instances
+                from a managed instance group according to your defined
+                autoscaling policy. For more information, read
+                Autoscaling Groups of Instances. For zonal managed
+                instance groups resource, use the autoscaler resource.
+                For regional managed instance groups, use the
+                regionAutoscalers resource.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(compute.Autoscaler, response.content)
+
+    class _Insert(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("Insert")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertAutoscalerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.InsertAutoscalerRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> compute.Operation:
+            r"""Call the insert method over HTTP.
+
+            Args:
+                request (~.compute.InsertAutoscalerRequest):
+                    The request object. A request message for
+                Autoscalers.Insert. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                ~.compute.Operation:
+                    Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                `Global </compute/docs/reference/rest/v1/globalOperations>`__
+                \*
+                `Regional </compute/docs/reference/rest/v1/regionOperations>`__
+                \*
+                `Zonal </compute/docs/reference/rest/v1/zoneOperations>`__
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the ``globalOperations``
+                resource. - For regional operations, use the
+                ``regionOperations`` resource. - For zonal operations,
+                use the ``zonalOperations`` resource. For more
+                information, read Global, Regional, and Zonal Resources.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+                data=body,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(compute.Operation, response.content)
+
+    class _List(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("List")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListAutoscalersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.ListAutoscalersRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
+        ) -> compute.AutoscalerList:
+            r"""Call the list method over HTTP.
+
+            Args:
+                request (~.compute.ListAutoscalersRequest):
+                    The request object. A request message for
+                Autoscalers.List. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
+
+            Returns:
+                ~.compute.AutoscalerList:
+                    Contains a list of Autoscaler
+                resources.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(
+                compute.AutoscalerList, response.content, lazy=views
+            )
+
+    class _Patch(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("Patch")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchAutoscalerRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.PatchAutoscalerRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> compute.Operation:
+            r"""Call the patch method over HTTP.
+
+            Args:
+                request (~.compute.PatchAutoscalerRequest):
+                    The request object. A request message for
+                Autoscalers.Patch. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                ~.compute.Operation:
+                    Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                `Global </compute/docs/reference/rest/v1/globalOperations>`__
+                \*
+                `Regional </compute/docs/reference/rest/v1/regionOperations>`__
+                \*
+                `Zonal </compute/docs/reference/rest/v1/zoneOperations>`__
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the ``globalOperations``
+                resource. - For regional operations, use the
+                ``regionOperations`` resource. - For zonal operations,
+                use the ``zonalOperations`` resource. For more
+                information, read Global, Regional, and Zonal Resources.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+                data=body,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(compute.Operation, response.content)
+
+    class _Update(AutoscalersAsyncRestStub):
+        def __hash__(self):
+            return hash("Update")
+
+        __REQUIRED_FIELDS_DEFAULT_VALUES = {}
+
+        @classmethod
+        def _get_unset_required_fields(cls, message_dict):
+            return {
+                k: v
+                for k, v in cls.__REQUIRED_FIELDS_DEFAULT_VALUES.items()
+                if k not in message_dict
+            }
+
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateAutoscalerRequest,
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/autoscalers",
+                    "body": "autoscaler_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
+        async def __call__(
+            self,
+            request: compute.UpdateAutoscalerRequest,
+            *,
+            retry: OptionalRetry = gapic_v1.method.DEFAULT,
+            timeout: float = None,
+            metadata: Sequence[Tuple[str, str]] = (),
+        ) -> compute.Operation:
+            r"""Call the update method over HTTP.
+
+            Args:
+                request (~.compute.UpdateAutoscalerRequest):
+                    The request object. A request message for
+                Autoscalers.Update. See the method
+                description for details.
+
+                retry (google.api_core.retry_async.AsyncRetry): Designation of what errors, if any,
+                    should be retried.
+                timeout (float): The timeout for this request.
+                metadata (Sequence[Tuple[str, str]]): Strings which should be
+                    sent along with the request as metadata.
+
+            Returns:
+                ~.compute.Operation:
+                    Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                `Global </compute/docs/reference/rest/v1/globalOperations>`__
+                \*
+                `Regional </compute/docs/reference/rest/v1/regionOperations>`__
+                \*
+                `Zonal </compute/docs/reference/rest/v1/zoneOperations>`__
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the ``globalOperations``
+                resource. - For regional operations, use the
+                ``regionOperations`` resource. - For zonal operations,
+                use the ``zonalOperations`` resource. For more
+                information, read Global, Regional, and Zonal Resources.
+
+            """
+
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+
+            # Send the request
+            headers = dict(metadata)
+            headers["Content-Type"] = "application/json"
+            response = await getattr(self._session, method)(
+                # Replace with proper schema configuration (http/https) logic
+                "https://{host}{uri}".format(host=self._host, uri=uri),
+                timeout=timeout,
+                headers=headers,
+                params=query_params,
+                data=body,
+            )
+
+            # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
+            # subclass.
+            if response.status_code >= 400:
+                raise core_exceptions.from_http_response(response)
+            # Return the response
+            return response_decoding.from_json(compute.Operation, response.content)
+
+    @property
+    def aggregated_list(
+        self,
+    ) -> Callable[
+        [compute.AggregatedListAutoscalersRequest],
+        Awaitable[compute.AutoscalerAggregatedList],
+    ]:
+        stub = self._stubs.get("aggregated_list")
+        if not stub:
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
+                self._session, self._host
+            )
+
+        return stub
+
+    @property
+    def delete(
+        self,
+    ) -> Callable[[compute.DeleteAutoscalerRequest], Awaitable[compute.Operation]]:
+        stub = self._stubs.get("delete")
+        if not stub:
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
+
+        return stub
+
+    @property
+    def get(
+        self,
+    ) -> Callable[[compute.GetAutoscalerRequest], Awaitable[compute.Autoscaler]]:
+        stub = self._stubs.get("get")
+        if not stub:
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
+
+        return stub
+
+    @property
+    def insert(
+        self,
+    ) -> Callable[[compute.InsertAutoscalerRequest], Awaitable[compute.Operation]]:
+        stub = self._stubs.get("insert")
+        if not stub:
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
+
+        return stub
+
+    @property
+    def list(
+        self,
+    ) -> Callable[[compute.ListAutoscalersRequest], Awaitable[compute.AutoscalerList]]:
+        stub = self._stubs.get("list")
+        if not stub:
+            stub = self._stubs["list"] = self._List(self._session, self._host)
+
+        return stub
+
+    @property
+    def patch(
+        self,
+    ) -> Callable[[compute.PatchAutoscalerRequest], Awaitable[compute.Operation]]:
+        stub = self._stubs.get("patch")
+        if not stub:
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
+
+        return stub
+
+    @property
+    def update(
+        self,
+    ) -> Callable[[compute.UpdateAutoscalerRequest], Awaitable[compute.Operation]]:
+        stub = self._stubs.get("update")
+        if not stub:
+            stub = self._stubs["update"] = self._Update(self._session, self._host)
+
+        return stub
+
+    async def close(self):
+        if self._owns_session:
+            await self._session.close()
+
+
+__all__ = ("AutoscalersAsyncRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import BackendBucketsClient
 
-__all__ = ("BackendBucketsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "BackendBucketsAsyncClient":
+        from .async_client import BackendBucketsAsyncClient
+
+        return BackendBucketsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "BackendBucketsClient",
+    "BackendBucketsAsyncClient",
+)
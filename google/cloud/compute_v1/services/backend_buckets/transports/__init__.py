@@ -24,7 +24,19 @@ from .rest import BackendBucketsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[BackendBucketsTransport]]
 _transport_registry["rest"] = BackendBucketsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "BackendBucketsAsyncRestTransport":
+        from .rest_asyncio import BackendBucketsAsyncRestTransport
+
+        return BackendBucketsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "BackendBucketsTransport",
     "BackendBucketsRestTransport",
+    "BackendBucketsAsyncRestTransport",
 )
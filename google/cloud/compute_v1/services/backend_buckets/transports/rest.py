@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    BackendBucketsTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import BackendBucketsTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, BackendBucketsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, BackendBucketsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddSignedUrlKey(BackendBucketsRestStub):
@@ -146,6 +174,18 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddSignedUrlKeyBackendBucketRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/addSignedUrlKey",
+                    "body": "signed_url_key_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddSignedUrlKeyBackendBucketRequest,
@@ -188,40 +228,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/addSignedUrlKey",
-                    "body": "signed_url_key_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddSignedUrlKeyBackendBucketRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SignedUrlKey.to_json(
-                compute.SignedUrlKey(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddSignedUrlKeyBackendBucketRequest.to_json(
-                    compute.AddSignedUrlKeyBackendBucketRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -231,7 +239,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -240,9 +248,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(BackendBucketsRestStub):
         def __hash__(self):
@@ -258,6 +264,17 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteBackendBucketRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteBackendBucketRequest,
@@ -300,31 +317,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteBackendBucketRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteBackendBucketRequest.to_json(
-                    compute.DeleteBackendBucketRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -334,7 +328,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -342,9 +336,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeleteSignedUrlKey(BackendBucketsRestStub):
         def __hash__(self):
@@ -362,6 +354,17 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteSignedUrlKeyBackendBucketRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/deleteSignedUrlKey",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteSignedUrlKeyBackendBucketRequest,
@@ -404,33 +407,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}/deleteSignedUrlKey",
-                },
-            ]
-
-            request_kwargs = compute.DeleteSignedUrlKeyBackendBucketRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteSignedUrlKeyBackendBucketRequest.to_json(
-                    compute.DeleteSignedUrlKeyBackendBucketRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -440,7 +418,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -448,9 +426,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(BackendBucketsRestStub):
         def __hash__(self):
@@ -466,6 +442,17 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetBackendBucketRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetBackendBucketRequest,
@@ -473,6 +460,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.BackendBucket:
             r"""Call the get method over HTTP.
 
@@ -487,6 +475,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.BackendBucket:
@@ -498,29 +488,10 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                },
-            ]
-
-            request_kwargs = compute.GetBackendBucketRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetBackendBucketRequest.to_json(
-                    compute.GetBackendBucketRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -530,7 +501,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -538,9 +509,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.BackendBucket.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.BackendBucket, response.content)
 
     class _Insert(BackendBucketsRestStub):
         def __hash__(self):
@@ -556,6 +525,18 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertBackendBucketRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
+                    "body": "backend_bucket_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertBackendBucketRequest,
@@ -598,38 +579,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
-                    "body": "backend_bucket_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertBackendBucketRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BackendBucket.to_json(
-                compute.BackendBucket(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertBackendBucketRequest.to_json(
-                    compute.InsertBackendBucketRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -639,7 +590,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -648,9 +599,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(BackendBucketsRestStub):
         def __hash__(self):
@@ -666,6 +615,17 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListBackendBucketsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListBackendBucketsRequest,
@@ -673,6 +633,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.BackendBucketList:
             r"""Call the list method over HTTP.
 
@@ -687,6 +649,11 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.BackendBucketList:
@@ -695,31 +662,10 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets",
-                },
-            ]
-
-            request_kwargs = compute.ListBackendBucketsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListBackendBucketsRequest.to_json(
-                    compute.ListBackendBucketsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -729,7 +675,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -737,8 +683,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.BackendBucketList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.BackendBucketList, response.content, lazy=views
             )
 
     class _Patch(BackendBucketsRestStub):
@@ -755,6 +701,18 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchBackendBucketRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                    "body": "backend_bucket_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchBackendBucketRequest,
@@ -797,38 +755,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                    "body": "backend_bucket_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchBackendBucketRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BackendBucket.to_json(
-                compute.BackendBucket(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchBackendBucketRequest.to_json(
-                    compute.PatchBackendBucketRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -838,7 +766,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -847,9 +775,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Update(BackendBucketsRestStub):
         def __hash__(self):
@@ -865,6 +791,18 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateBackendBucketRequest,
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
+                    "body": "backend_bucket_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateBackendBucketRequest,
@@ -907,38 +845,8 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/global/backendBuckets/{backend_bucket}",
-                    "body": "backend_bucket_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateBackendBucketRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BackendBucket.to_json(
-                compute.BackendBucket(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateBackendBucketRequest.to_json(
-                    compute.UpdateBackendBucketRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -948,7 +856,7 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -957,17 +865,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def add_signed_url_key(
         self,
     ) -> Callable[[compute.AddSignedUrlKeyBackendBucketRequest], compute.Operation]:
-        stub = self._STUBS.get("add_signed_url_key")
+        stub = self._stubs.get("add_signed_url_key")
         if not stub:
-            stub = self._STUBS["add_signed_url_key"] = self._AddSignedUrlKey(
+            stub = self._stubs["add_signed_url_key"] = self._AddSignedUrlKey(
                 self._session, self._host
             )
 
@@ -977,9 +883,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteBackendBucketRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -987,9 +893,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     def delete_signed_url_key(
         self,
     ) -> Callable[[compute.DeleteSignedUrlKeyBackendBucketRequest], compute.Operation]:
-        stub = self._STUBS.get("delete_signed_url_key")
+        stub = self._stubs.get("delete_signed_url_key")
         if not stub:
-            stub = self._STUBS["delete_signed_url_key"] = self._DeleteSignedUrlKey(
+            stub = self._stubs["delete_signed_url_key"] = self._DeleteSignedUrlKey(
                 self._session, self._host
             )
 
@@ -997,9 +903,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
 
     @property
     def get(self) -> Callable[[compute.GetBackendBucketRequest], compute.BackendBucket]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1007,9 +913,9 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertBackendBucketRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1017,17 +923,17 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     def list(
         self,
     ) -> Callable[[compute.ListBackendBucketsRequest], compute.BackendBucketList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
     @property
     def patch(self) -> Callable[[compute.PatchBackendBucketRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -1035,14 +941,15 @@ class BackendBucketsRestTransport(BackendBucketsTransport):
     def update(
         self,
     ) -> Callable[[compute.UpdateBackendBucketRequest], compute.Operation]:
-        stub = self._STUBS.get("update")
+        stub = self._stubs.get("update")
         if not stub:
-            stub = self._STUBS["update"] = self._Update(self._session, self._host)
+            stub = self._stubs["update"] = self._Update(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("BackendBucketsRestTransport",)
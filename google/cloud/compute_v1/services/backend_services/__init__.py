@@ -15,4 +15,18 @@
 #
 from .client import BackendServicesClient
 
-__all__ = ("BackendServicesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "BackendServicesAsyncClient":
+        from .async_client import BackendServicesAsyncClient
+
+        return BackendServicesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "BackendServicesClient",
+    "BackendServicesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import BackendServicesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[BackendServicesTransport]]
 _transport_registry["rest"] = BackendServicesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "BackendServicesAsyncRestTransport":
+        from .rest_asyncio import BackendServicesAsyncRestTransport
+
+        return BackendServicesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "BackendServicesTransport",
     "BackendServicesRestTransport",
+    "BackendServicesAsyncRestTransport",
 )
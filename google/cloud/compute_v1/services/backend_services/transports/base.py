@@ -15,7 +15,6 @@
 #
 import abc
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Union
-import pkg_resources
 
 import google.auth  # type: ignore
 import google.api_core
@@ -25,14 +24,13 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import coalescing
+from google.cloud.compute_v1 import rate_limiting
+from google.cloud.compute_v1 import retry_policy
 from google.cloud.compute_v1.types import compute
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 class BackendServicesTransport(abc.ABC):
@@ -45,6 +43,13 @@ class BackendServicesTransport(abc.ABC):
 
     DEFAULT_HOST: str = "compute.googleapis.com"
 
+    # The default retry and timeout of each method.
+    _retry_policy = retry_policy.DEFAULT_RETRY_POLICY
+    # The limiter that paces the calls, if any.
+    _rate_limiter = None
+    # The coalescer of identical reads in flight, if any.
+    _coalescer = None
+
     def __init__(
         self,
         *,
@@ -121,40 +126,107 @@ class BackendServicesTransport(abc.ABC):
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.add_signed_url_key: gapic_v1.method.wrap_method(
-                self.add_signed_url_key, default_timeout=None, client_info=client_info,
+            self.add_signed_url_key: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.add_signed_url_key, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "add_signed_url_key",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.aggregated_list: gapic_v1.method.wrap_method(
-                self.aggregated_list, default_timeout=None, client_info=client_info,
+            self.aggregated_list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.aggregated_list, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "aggregated_list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.delete: gapic_v1.method.wrap_method(
-                self.delete, default_timeout=None, client_info=client_info,
+            self.delete: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.delete, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "delete",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.delete_signed_url_key: gapic_v1.method.wrap_method(
-                self.delete_signed_url_key,
-                default_timeout=None,
+            self.delete_signed_url_key: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.delete_signed_url_key,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "delete_signed_url_key",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get, default_timeout=None, client_info=client_info,
+            self.get: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_health: gapic_v1.method.wrap_method(
-                self.get_health, default_timeout=None, client_info=client_info,
+            self.get_health: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.get_health, self._rate_limiter, rate_limiting.READ
+                ),
+                "get_health",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.insert: gapic_v1.method.wrap_method(
-                self.insert, default_timeout=None, client_info=client_info,
+            self.insert: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.insert, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "insert",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.list: gapic_v1.method.wrap_method(
-                self.list, default_timeout=None, client_info=client_info,
+            self.list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.list, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.patch: gapic_v1.method.wrap_method(
-                self.patch, default_timeout=None, client_info=client_info,
+            self.patch: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.patch, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "patch",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_security_policy: gapic_v1.method.wrap_method(
-                self.set_security_policy, default_timeout=None, client_info=client_info,
+            self.set_security_policy: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_security_policy, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_security_policy",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.update: gapic_v1.method.wrap_method(
-                self.update, default_timeout=None, client_info=client_info,
+            self.update: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.update, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "update",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
         }
 
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    BackendServicesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import BackendServicesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class BackendServicesRestTransport(BackendServicesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, BackendServicesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class BackendServicesRestTransport(BackendServicesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class BackendServicesRestTransport(BackendServicesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, BackendServicesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddSignedUrlKey(BackendServicesRestStub):
@@ -146,6 +174,18 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddSignedUrlKeyBackendServiceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/addSignedUrlKey",
+                    "body": "signed_url_key_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddSignedUrlKeyBackendServiceRequest,
@@ -188,40 +228,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/addSignedUrlKey",
-                    "body": "signed_url_key_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddSignedUrlKeyBackendServiceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SignedUrlKey.to_json(
-                compute.SignedUrlKey(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddSignedUrlKeyBackendServiceRequest.to_json(
-                    compute.AddSignedUrlKeyBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -231,7 +239,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -240,9 +248,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AggregatedList(BackendServicesRestStub):
         def __hash__(self):
@@ -258,6 +264,17 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListBackendServicesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/backendServices",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListBackendServicesRequest,
@@ -265,6 +282,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.BackendServiceAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -279,6 +298,11 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.BackendServiceAggregatedList:
@@ -287,33 +311,10 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/backendServices",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListBackendServicesRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListBackendServicesRequest.to_json(
-                    compute.AggregatedListBackendServicesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -323,7 +324,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -331,8 +332,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.BackendServiceAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.BackendServiceAggregatedList, response.content, lazy=views
             )
 
     class _Delete(BackendServicesRestStub):
@@ -349,6 +350,17 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteBackendServiceRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteBackendServiceRequest,
@@ -391,31 +403,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteBackendServiceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteBackendServiceRequest.to_json(
-                    compute.DeleteBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -425,7 +414,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -433,9 +422,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeleteSignedUrlKey(BackendServicesRestStub):
         def __hash__(self):
@@ -453,6 +440,17 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteSignedUrlKeyBackendServiceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/deleteSignedUrlKey",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteSignedUrlKeyBackendServiceRequest,
@@ -495,33 +493,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/deleteSignedUrlKey",
-                },
-            ]
-
-            request_kwargs = compute.DeleteSignedUrlKeyBackendServiceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteSignedUrlKeyBackendServiceRequest.to_json(
-                    compute.DeleteSignedUrlKeyBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -531,7 +504,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -539,9 +512,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(BackendServicesRestStub):
         def __hash__(self):
@@ -557,6 +528,17 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetBackendServiceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetBackendServiceRequest,
@@ -564,6 +546,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.BackendService:
             r"""Call the get method over HTTP.
 
@@ -578,6 +561,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.BackendService:
@@ -599,31 +584,10 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                },
-            ]
-
-            request_kwargs = compute.GetBackendServiceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetBackendServiceRequest.to_json(
-                    compute.GetBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -633,7 +597,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -641,9 +605,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.BackendService.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.BackendService, response.content)
 
     class _GetHealth(BackendServicesRestStub):
         def __hash__(self):
@@ -659,6 +621,18 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetHealthBackendServiceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/getHealth",
+                    "body": "resource_group_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetHealthBackendServiceRequest,
@@ -686,38 +660,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/getHealth",
-                    "body": "resource_group_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.GetHealthBackendServiceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ResourceGroupReference.to_json(
-                compute.ResourceGroupReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetHealthBackendServiceRequest.to_json(
-                    compute.GetHealthBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -727,7 +671,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -736,8 +680,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.BackendServiceGroupHealth.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.BackendServiceGroupHealth, response.content
             )
 
     class _Insert(BackendServicesRestStub):
@@ -754,6 +698,18 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertBackendServiceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices",
+                    "body": "backend_service_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertBackendServiceRequest,
@@ -796,38 +752,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices",
-                    "body": "backend_service_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertBackendServiceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BackendService.to_json(
-                compute.BackendService(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertBackendServiceRequest.to_json(
-                    compute.InsertBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -837,7 +763,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -846,9 +772,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(BackendServicesRestStub):
         def __hash__(self):
@@ -864,6 +788,17 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListBackendServicesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListBackendServicesRequest,
@@ -871,6 +806,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.BackendServiceList:
             r"""Call the list method over HTTP.
 
@@ -885,6 +822,11 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.BackendServiceList:
@@ -893,31 +835,10 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices",
-                },
-            ]
-
-            request_kwargs = compute.ListBackendServicesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListBackendServicesRequest.to_json(
-                    compute.ListBackendServicesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -927,7 +848,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -935,8 +856,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.BackendServiceList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.BackendServiceList, response.content, lazy=views
             )
 
     class _Patch(BackendServicesRestStub):
@@ -953,6 +874,18 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchBackendServiceRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                    "body": "backend_service_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchBackendServiceRequest,
@@ -995,38 +928,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                    "body": "backend_service_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchBackendServiceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BackendService.to_json(
-                compute.BackendService(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchBackendServiceRequest.to_json(
-                    compute.PatchBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1036,7 +939,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1045,9 +948,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetSecurityPolicy(BackendServicesRestStub):
         def __hash__(self):
@@ -1063,6 +964,18 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetSecurityPolicyBackendServiceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/setSecurityPolicy",
+                    "body": "security_policy_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetSecurityPolicyBackendServiceRequest,
@@ -1105,40 +1018,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}/setSecurityPolicy",
-                    "body": "security_policy_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetSecurityPolicyBackendServiceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SecurityPolicyReference.to_json(
-                compute.SecurityPolicyReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetSecurityPolicyBackendServiceRequest.to_json(
-                    compute.SetSecurityPolicyBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1148,7 +1029,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1157,9 +1038,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Update(BackendServicesRestStub):
         def __hash__(self):
@@ -1175,6 +1054,18 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateBackendServiceRequest,
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
+                    "body": "backend_service_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateBackendServiceRequest,
@@ -1217,38 +1108,8 @@ class BackendServicesRestTransport(BackendServicesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/global/backendServices/{backend_service}",
-                    "body": "backend_service_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateBackendServiceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BackendService.to_json(
-                compute.BackendService(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateBackendServiceRequest.to_json(
-                    compute.UpdateBackendServiceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1258,7 +1119,7 @@ class BackendServicesRestTransport(BackendServicesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1267,17 +1128,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def add_signed_url_key(
         self,
     ) -> Callable[[compute.AddSignedUrlKeyBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("add_signed_url_key")
+        stub = self._stubs.get("add_signed_url_key")
         if not stub:
-            stub = self._STUBS["add_signed_url_key"] = self._AddSignedUrlKey(
+            stub = self._stubs["add_signed_url_key"] = self._AddSignedUrlKey(
                 self._session, self._host
             )
 
@@ -1290,9 +1149,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
         [compute.AggregatedListBackendServicesRequest],
         compute.BackendServiceAggregatedList,
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -1302,9 +1161,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -1312,9 +1171,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def delete_signed_url_key(
         self,
     ) -> Callable[[compute.DeleteSignedUrlKeyBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("delete_signed_url_key")
+        stub = self._stubs.get("delete_signed_url_key")
         if not stub:
-            stub = self._STUBS["delete_signed_url_key"] = self._DeleteSignedUrlKey(
+            stub = self._stubs["delete_signed_url_key"] = self._DeleteSignedUrlKey(
                 self._session, self._host
             )
 
@@ -1324,9 +1183,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetBackendServiceRequest], compute.BackendService]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1336,9 +1195,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     ) -> Callable[
         [compute.GetHealthBackendServiceRequest], compute.BackendServiceGroupHealth
     ]:
-        stub = self._STUBS.get("get_health")
+        stub = self._stubs.get("get_health")
         if not stub:
-            stub = self._STUBS["get_health"] = self._GetHealth(
+            stub = self._stubs["get_health"] = self._GetHealth(
                 self._session, self._host
             )
 
@@ -1348,9 +1207,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1358,9 +1217,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def list(
         self,
     ) -> Callable[[compute.ListBackendServicesRequest], compute.BackendServiceList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1368,9 +1227,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def patch(
         self,
     ) -> Callable[[compute.PatchBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -1378,9 +1237,9 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def set_security_policy(
         self,
     ) -> Callable[[compute.SetSecurityPolicyBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_security_policy")
+        stub = self._stubs.get("set_security_policy")
         if not stub:
-            stub = self._STUBS["set_security_policy"] = self._SetSecurityPolicy(
+            stub = self._stubs["set_security_policy"] = self._SetSecurityPolicy(
                 self._session, self._host
             )
 
@@ -1390,14 +1249,15 @@ class BackendServicesRestTransport(BackendServicesTransport):
     def update(
         self,
     ) -> Callable[[compute.UpdateBackendServiceRequest], compute.Operation]:
-        stub = self._STUBS.get("update")
+        stub = self._stubs.get("update")
         if not stub:
-            stub = self._STUBS["update"] = self._Update(self._session, self._host)
+            stub = self._stubs["update"] = self._Update(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("BackendServicesRestTransport",)
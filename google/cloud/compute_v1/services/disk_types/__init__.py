@@ -15,4 +15,18 @@
 #
 from .client import DiskTypesClient
 
-__all__ = ("DiskTypesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "DiskTypesAsyncClient":
+        from .async_client import DiskTypesAsyncClient
+
+        return DiskTypesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "DiskTypesClient",
+    "DiskTypesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import DiskTypesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[DiskTypesTransport]]
 _transport_registry["rest"] = DiskTypesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "DiskTypesAsyncRestTransport":
+        from .rest_asyncio import DiskTypesAsyncRestTransport
+
+        return DiskTypesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "DiskTypesTransport",
     "DiskTypesRestTransport",
+    "DiskTypesAsyncRestTransport",
 )
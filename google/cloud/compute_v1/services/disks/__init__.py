@@ -15,4 +15,18 @@
 #
 from .client import DisksClient
 
-__all__ = ("DisksClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "DisksAsyncClient":
+        from .async_client import DisksAsyncClient
+
+        return DisksAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "DisksClient",
+    "DisksAsyncClient",
+)
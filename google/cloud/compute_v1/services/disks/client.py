@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,13 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.disks import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _scatter
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import DisksTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import DisksRestTransport
@@ -285,7 +292,9 @@ class DisksClient(metaclass=DisksClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, DisksTransport, None] = None,
+        transport: Union[
+            str, DisksTransport, Callable[..., DisksTransport], None
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -297,9 +306,13 @@ class DisksClient(metaclass=DisksClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, DisksTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, DisksTransport, Callable[..., DisksTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the DisksTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -316,6 +329,22 @@ class DisksClient(metaclass=DisksClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -327,7 +356,7 @@ class DisksClient(metaclass=DisksClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -341,6 +370,11 @@ class DisksClient(metaclass=DisksClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -356,6 +390,26 @@ class DisksClient(metaclass=DisksClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -367,8 +421,26 @@ class DisksClient(metaclass=DisksClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[DisksTransport], Callable[..., DisksTransport]
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -377,6 +449,7 @@ class DisksClient(metaclass=DisksClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def add_resource_policies_unary(
@@ -388,7 +461,7 @@ class DisksClient(metaclass=DisksClientMeta):
         disk: str = None,
         disks_add_resource_policies_request_resource: compute.DisksAddResourcePoliciesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Adds existing resource policies to a disk. You can
@@ -488,14 +561,87 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def add_resource_policies(
+        self,
+        request: Union[compute.AddResourcePoliciesDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        disk: str = None,
+        disks_add_resource_policies_request_resource: compute.DisksAddResourcePoliciesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Adds existing resource policies to a disk. You can
+        only add one policy which will be applied to this disk
+        for scheduling snapshot creation.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AddResourcePoliciesDiskRequest, dict]):
+                The request object. A request message for
+                Disks.AddResourcePolicies. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk (str):
+                The disk name for this request.
+                This corresponds to the ``disk`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disks_add_resource_policies_request_resource (google.cloud.compute_v1.types.DisksAddResourcePoliciesRequest):
+                The body resource for this request
+                This corresponds to the ``disks_add_resource_policies_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.add_resource_policies_unary(
+            request,
+            project=project,
+            zone=zone,
+            disk=disk,
+            disks_add_resource_policies_request_resource=disks_add_resource_policies_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def aggregated_list(
         self,
         request: Union[compute.AggregatedListDisksRequest, dict] = None,
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        parallel: int = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of persistent disks.
 
@@ -514,6 +660,38 @@ class DisksClient(metaclass=DisksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            parallel (int): If set, list the zones and regions named by
+                the first page with up to this many concurrent ``list``
+                requests instead of requesting the following pages, and
+                yield each zone or region as a page of its own once it is
+                complete, in no particular order. ``retry``, ``timeout``,
+                ``metadata``, ``prefetch`` and ``page_sizer`` apply to the
+                ``list`` requests of each zone and region. Cannot be
+                combined with ``views`` or ``fields``.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.disks.pagers.AggregatedListPager:
@@ -532,6 +710,33 @@ class DisksClient(metaclass=DisksClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.AggregatedListDisksRequest
+            )
+
+        if parallel is not None:
+            if parallel < 1:
+                raise ValueError("The `parallel` argument must be at least 1.")
+            if views or fields is not None:
+                raise ValueError(
+                    "The `parallel` argument cannot be combined with "
+                    "`views` or `fields`."
+                )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.AggregatedListDisksRequest.
         # There's no risk of modifying the input as we've already verified
@@ -543,17 +748,54 @@ class DisksClient(metaclass=DisksClientMeta):
             if project is not None:
                 request.project = project
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.aggregated_list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        scatter = None
+        if parallel is not None:
+            # List the zones and regions concurrently after the first page.
+            scatter = _scatter.scatter(
+                self._transport,
+                "disks",
+                parallel,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                prefetch=prefetch,
+                page_sizer=page_sizer,
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.AggregatedListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+            scatter=scatter,
         )
 
         # Done; return the response.
@@ -568,7 +810,7 @@ class DisksClient(metaclass=DisksClientMeta):
         disk: str = None,
         snapshot_resource: compute.Snapshot = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates a snapshot of a specified persistent disk.
@@ -664,6 +906,73 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def create_snapshot(
+        self,
+        request: Union[compute.CreateSnapshotDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        disk: str = None,
+        snapshot_resource: compute.Snapshot = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates a snapshot of a specified persistent disk.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.CreateSnapshotDiskRequest, dict]):
+                The request object. A request message for
+                Disks.CreateSnapshot. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk (str):
+                Name of the persistent disk to
+                snapshot.
+
+                This corresponds to the ``disk`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            snapshot_resource (google.cloud.compute_v1.types.Snapshot):
+                The body resource for this request
+                This corresponds to the ``snapshot_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.create_snapshot_unary(
+            request,
+            project=project,
+            zone=zone,
+            disk=disk,
+            snapshot_resource=snapshot_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_unary(
         self,
         request: Union[compute.DeleteDiskRequest, dict] = None,
@@ -672,7 +981,7 @@ class DisksClient(metaclass=DisksClientMeta):
         zone: str = None,
         disk: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes the specified persistent disk. Deleting a
@@ -764,6 +1073,69 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def delete(
+        self,
+        request: Union[compute.DeleteDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        disk: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes the specified persistent disk. Deleting a
+        disk removes its data permanently and is irreversible.
+        However, deleting a disk does not delete any snapshots
+        previously made from the disk. You must separately
+        delete snapshots.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteDiskRequest, dict]):
+                The request object. A request message for Disks.Delete.
+                See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk (str):
+                Name of the persistent disk to
+                delete.
+
+                This corresponds to the ``disk`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_unary(
+            request,
+            project=project,
+            zone=zone,
+            disk=disk,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetDiskRequest, dict] = None,
@@ -772,8 +1144,9 @@ class DisksClient(metaclass=DisksClientMeta):
         zone: str = None,
         disk: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.Disk:
         r"""Returns a specified persistent disk. Gets a list of
         available persistent disks by making a list() request.
@@ -806,6 +1179,10 @@ class DisksClient(metaclass=DisksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.Disk:
@@ -852,6 +1229,10 @@ class DisksClient(metaclass=DisksClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -866,7 +1247,7 @@ class DisksClient(metaclass=DisksClientMeta):
         zone: str = None,
         resource: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Policy:
         r"""Gets the access control policy for a resource. May be
@@ -988,7 +1369,7 @@ class DisksClient(metaclass=DisksClientMeta):
         zone: str = None,
         disk_resource: compute.Disk = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates a persistent disk in the specified project
@@ -1080,6 +1461,69 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def insert(
+        self,
+        request: Union[compute.InsertDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        disk_resource: compute.Disk = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates a persistent disk in the specified project
+        using the data in the request. You can create a disk
+        from a source (sourceImage, sourceSnapshot, or
+        sourceDisk) or create an empty 500 GB data disk by
+        omitting all properties. You can also create a disk that
+        is larger than the default size by specifying the sizeGb
+        property.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertDiskRequest, dict]):
+                The request object. A request message for Disks.Insert.
+                See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk_resource (google.cloud.compute_v1.types.Disk):
+                The body resource for this request
+                This corresponds to the ``disk_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.insert_unary(
+            request,
+            project=project,
+            zone=zone,
+            disk_resource=disk_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def list(
         self,
         request: Union[compute.ListDisksRequest, dict] = None,
@@ -1087,8 +1531,13 @@ class DisksClient(metaclass=DisksClientMeta):
         project: str = None,
         zone: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Retrieves a list of persistent disks contained within
         the specified zone.
@@ -1114,6 +1563,30 @@ class DisksClient(metaclass=DisksClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.disks.pagers.ListPager:
@@ -1133,6 +1606,22 @@ class DisksClient(metaclass=DisksClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(resume_from, compute.ListDisksRequest)
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListDisksRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1146,17 +1635,39 @@ class DisksClient(metaclass=DisksClientMeta):
             if zone is not None:
                 request.zone = zone
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1171,7 +1682,7 @@ class DisksClient(metaclass=DisksClientMeta):
         disk: str = None,
         disks_remove_resource_policies_request_resource: compute.DisksRemoveResourcePoliciesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Removes resource policies from a disk.
@@ -1269,6 +1780,71 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def remove_resource_policies(
+        self,
+        request: Union[compute.RemoveResourcePoliciesDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        disk: str = None,
+        disks_remove_resource_policies_request_resource: compute.DisksRemoveResourcePoliciesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Removes resource policies from a disk.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.RemoveResourcePoliciesDiskRequest, dict]):
+                The request object. A request message for
+                Disks.RemoveResourcePolicies. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk (str):
+                The disk name for this request.
+                This corresponds to the ``disk`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disks_remove_resource_policies_request_resource (google.cloud.compute_v1.types.DisksRemoveResourcePoliciesRequest):
+                The body resource for this request
+                This corresponds to the ``disks_remove_resource_policies_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.remove_resource_policies_unary(
+            request,
+            project=project,
+            zone=zone,
+            disk=disk,
+            disks_remove_resource_policies_request_resource=disks_remove_resource_policies_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def resize_unary(
         self,
         request: Union[compute.ResizeDiskRequest, dict] = None,
@@ -1278,7 +1854,7 @@ class DisksClient(metaclass=DisksClientMeta):
         disk: str = None,
         disks_resize_request_resource: compute.DisksResizeRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Resizes the specified persistent disk. You can only
@@ -1372,6 +1948,71 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def resize(
+        self,
+        request: Union[compute.ResizeDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        disk: str = None,
+        disks_resize_request_resource: compute.DisksResizeRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Resizes the specified persistent disk. You can only
+        increase the size of the disk.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ResizeDiskRequest, dict]):
+                The request object. A request message for Disks.Resize.
+                See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk (str):
+                The name of the persistent disk.
+                This corresponds to the ``disk`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disks_resize_request_resource (google.cloud.compute_v1.types.DisksResizeRequest):
+                The body resource for this request
+                This corresponds to the ``disks_resize_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.resize_unary(
+            request,
+            project=project,
+            zone=zone,
+            disk=disk,
+            disks_resize_request_resource=disks_resize_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_iam_policy(
         self,
         request: Union[compute.SetIamPolicyDiskRequest, dict] = None,
@@ -1381,7 +2022,7 @@ class DisksClient(metaclass=DisksClientMeta):
         resource: str = None,
         zone_set_policy_request_resource: compute.ZoneSetPolicyRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Policy:
         r"""Sets the access control policy on the specified
@@ -1515,7 +2156,7 @@ class DisksClient(metaclass=DisksClientMeta):
         resource: str = None,
         zone_set_labels_request_resource: compute.ZoneSetLabelsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets the labels on a disk. To learn more about
@@ -1615,6 +2256,73 @@ class DisksClient(metaclass=DisksClientMeta):
         # Done; return the response.
         return response
 
+    def set_labels(
+        self,
+        request: Union[compute.SetLabelsDiskRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        resource: str = None,
+        zone_set_labels_request_resource: compute.ZoneSetLabelsRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets the labels on a disk. To learn more about
+        labels, read the Labeling Resources documentation.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetLabelsDiskRequest, dict]):
+                The request object. A request message for
+                Disks.SetLabels. See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            resource (str):
+                Name or id of the resource for this
+                request.
+
+                This corresponds to the ``resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone_set_labels_request_resource (google.cloud.compute_v1.types.ZoneSetLabelsRequest):
+                The body resource for this request
+                This corresponds to the ``zone_set_labels_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_labels_unary(
+            request,
+            project=project,
+            zone=zone,
+            resource=resource,
+            zone_set_labels_request_resource=zone_set_labels_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def test_iam_permissions(
         self,
         request: Union[compute.TestIamPermissionsDiskRequest, dict] = None,
@@ -1624,7 +2332,7 @@ class DisksClient(metaclass=DisksClientMeta):
         resource: str = None,
         test_permissions_request_resource: compute.TestPermissionsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.TestPermissionsResponse:
         r"""Returns permissions that a caller has on the
@@ -1724,12 +2432,7 @@ class DisksClient(metaclass=DisksClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("DisksClient",)
@@ -24,7 +24,19 @@ from .rest import DisksRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[DisksTransport]]
 _transport_registry["rest"] = DisksRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "DisksAsyncRestTransport":
+        from .rest_asyncio import DisksAsyncRestTransport
+
+        return DisksAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "DisksTransport",
     "DisksRestTransport",
+    "DisksAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,15 +32,18 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import DisksTransport, DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
+from .base import DisksTransport
 
-
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -65,8 +65,6 @@ class DisksRestTransport(DisksTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, DisksRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -79,6 +77,10 @@ class DisksRestTransport(DisksTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -111,22 +113,50 @@ class DisksRestTransport(DisksTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, DisksRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddResourcePolicies(DisksRestStub):
@@ -143,6 +173,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddResourcePoliciesDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/addResourcePolicies",
+                    "body": "disks_add_resource_policies_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddResourcePoliciesDiskRequest,
@@ -185,38 +227,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/addResourcePolicies",
-                    "body": "disks_add_resource_policies_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddResourcePoliciesDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.DisksAddResourcePoliciesRequest.to_json(
-                compute.DisksAddResourcePoliciesRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddResourcePoliciesDiskRequest.to_json(
-                    compute.AddResourcePoliciesDiskRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -226,7 +238,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -235,9 +247,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AggregatedList(DisksRestStub):
         def __hash__(self):
@@ -253,6 +263,17 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListDisksRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/disks",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListDisksRequest,
@@ -260,6 +281,8 @@ class DisksRestTransport(DisksTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.DiskAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -274,37 +297,21 @@ class DisksRestTransport(DisksTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.DiskAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/disks",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListDisksRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListDisksRequest.to_json(
-                    compute.AggregatedListDisksRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -314,7 +321,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -322,8 +329,8 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.DiskAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.DiskAggregatedList, response.content, lazy=views
             )
 
     class _CreateSnapshot(DisksRestStub):
@@ -340,6 +347,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.CreateSnapshotDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/createSnapshot",
+                    "body": "snapshot_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.CreateSnapshotDiskRequest,
@@ -382,38 +401,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/createSnapshot",
-                    "body": "snapshot_resource",
-                },
-            ]
-
-            request_kwargs = compute.CreateSnapshotDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Snapshot.to_json(
-                compute.Snapshot(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.CreateSnapshotDiskRequest.to_json(
-                    compute.CreateSnapshotDiskRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -423,7 +412,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -432,9 +421,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(DisksRestStub):
         def __hash__(self):
@@ -450,6 +437,17 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteDiskRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteDiskRequest,
@@ -491,29 +489,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteDiskRequest.to_json(
-                    compute.DeleteDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -523,7 +500,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -531,9 +508,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(DisksRestStub):
         def __hash__(self):
@@ -549,6 +524,17 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetDiskRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetDiskRequest,
@@ -556,6 +542,7 @@ class DisksRestTransport(DisksTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.Disk:
             r"""Call the get method over HTTP.
 
@@ -569,6 +556,8 @@ class DisksRestTransport(DisksTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.Disk:
@@ -587,29 +576,10 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}",
-                },
-            ]
-
-            request_kwargs = compute.GetDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetDiskRequest.to_json(
-                    compute.GetDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -619,7 +589,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -627,7 +597,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Disk.from_json(response.content, ignore_unknown_fields=True)
+            return response_decoding.from_json(compute.Disk, response.content)
 
     class _GetIamPolicy(DisksRestStub):
         def __hash__(self):
@@ -643,6 +613,17 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetIamPolicyDiskRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/getIamPolicy",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetIamPolicyDiskRequest,
@@ -710,29 +691,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/getIamPolicy",
-                },
-            ]
-
-            request_kwargs = compute.GetIamPolicyDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetIamPolicyDiskRequest.to_json(
-                    compute.GetIamPolicyDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -742,7 +702,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -750,9 +710,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _Insert(DisksRestStub):
         def __hash__(self):
@@ -768,6 +726,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks",
+                    "body": "disk_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertDiskRequest,
@@ -809,36 +779,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks",
-                    "body": "disk_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Disk.to_json(
-                compute.Disk(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertDiskRequest.to_json(
-                    compute.InsertDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -848,7 +790,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -857,9 +799,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(DisksRestStub):
         def __hash__(self):
@@ -875,6 +815,17 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListDisksRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListDisksRequest,
@@ -882,6 +833,8 @@ class DisksRestTransport(DisksTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.DiskList:
             r"""Call the list method over HTTP.
 
@@ -895,35 +848,21 @@ class DisksRestTransport(DisksTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.DiskList:
                     A list of Disk resources.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks",
-                },
-            ]
-
-            request_kwargs = compute.ListDisksRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListDisksRequest.to_json(
-                    compute.ListDisksRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -933,7 +872,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -941,8 +880,8 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.DiskList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.DiskList, response.content, lazy=views
             )
 
     class _RemoveResourcePolicies(DisksRestStub):
@@ -959,6 +898,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveResourcePoliciesDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/removeResourcePolicies",
+                    "body": "disks_remove_resource_policies_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveResourcePoliciesDiskRequest,
@@ -1001,38 +952,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/removeResourcePolicies",
-                    "body": "disks_remove_resource_policies_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RemoveResourcePoliciesDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.DisksRemoveResourcePoliciesRequest.to_json(
-                compute.DisksRemoveResourcePoliciesRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveResourcePoliciesDiskRequest.to_json(
-                    compute.RemoveResourcePoliciesDiskRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1042,7 +963,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1051,9 +972,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Resize(DisksRestStub):
         def __hash__(self):
@@ -1069,6 +988,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ResizeDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/resize",
+                    "body": "disks_resize_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ResizeDiskRequest,
@@ -1110,36 +1041,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{disk}/resize",
-                    "body": "disks_resize_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ResizeDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.DisksResizeRequest.to_json(
-                compute.DisksResizeRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ResizeDiskRequest.to_json(
-                    compute.ResizeDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1149,7 +1052,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1158,9 +1061,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetIamPolicy(DisksRestStub):
         def __hash__(self):
@@ -1176,6 +1077,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetIamPolicyDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/setIamPolicy",
+                    "body": "zone_set_policy_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetIamPolicyDiskRequest,
@@ -1243,36 +1156,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/setIamPolicy",
-                    "body": "zone_set_policy_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetIamPolicyDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ZoneSetPolicyRequest.to_json(
-                compute.ZoneSetPolicyRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetIamPolicyDiskRequest.to_json(
-                    compute.SetIamPolicyDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1282,7 +1167,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1291,9 +1176,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _SetLabels(DisksRestStub):
         def __hash__(self):
@@ -1309,6 +1192,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetLabelsDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/setLabels",
+                    "body": "zone_set_labels_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetLabelsDiskRequest,
@@ -1351,36 +1246,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/setLabels",
-                    "body": "zone_set_labels_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetLabelsDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ZoneSetLabelsRequest.to_json(
-                compute.ZoneSetLabelsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetLabelsDiskRequest.to_json(
-                    compute.SetLabelsDiskRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1390,7 +1257,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1399,9 +1266,7 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _TestIamPermissions(DisksRestStub):
         def __hash__(self):
@@ -1417,6 +1282,18 @@ class DisksRestTransport(DisksTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.TestIamPermissionsDiskRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsDiskRequest,
@@ -1444,38 +1321,8 @@ class DisksRestTransport(DisksTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/disks/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.TestIamPermissionsDiskRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TestPermissionsRequest.to_json(
-                compute.TestPermissionsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.TestIamPermissionsDiskRequest.to_json(
-                    compute.TestIamPermissionsDiskRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1485,7 +1332,7 @@ class DisksRestTransport(DisksTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1494,17 +1341,17 @@ class DisksRestTransport(DisksTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TestPermissionsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TestPermissionsResponse, response.content
             )
 
     @property
     def add_resource_policies(
         self,
     ) -> Callable[[compute.AddResourcePoliciesDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("add_resource_policies")
+        stub = self._stubs.get("add_resource_policies")
         if not stub:
-            stub = self._STUBS["add_resource_policies"] = self._AddResourcePolicies(
+            stub = self._stubs["add_resource_policies"] = self._AddResourcePolicies(
                 self._session, self._host
             )
 
@@ -1514,9 +1361,9 @@ class DisksRestTransport(DisksTransport):
     def aggregated_list(
         self,
     ) -> Callable[[compute.AggregatedListDisksRequest], compute.DiskAggregatedList]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -1526,9 +1373,9 @@ class DisksRestTransport(DisksTransport):
     def create_snapshot(
         self,
     ) -> Callable[[compute.CreateSnapshotDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("create_snapshot")
+        stub = self._stubs.get("create_snapshot")
         if not stub:
-            stub = self._STUBS["create_snapshot"] = self._CreateSnapshot(
+            stub = self._stubs["create_snapshot"] = self._CreateSnapshot(
                 self._session, self._host
             )
 
@@ -1536,17 +1383,17 @@ class DisksRestTransport(DisksTransport):
 
     @property
     def delete(self) -> Callable[[compute.DeleteDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
     @property
     def get(self) -> Callable[[compute.GetDiskRequest], compute.Disk]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1554,9 +1401,9 @@ class DisksRestTransport(DisksTransport):
     def get_iam_policy(
         self,
     ) -> Callable[[compute.GetIamPolicyDiskRequest], compute.Policy]:
-        stub = self._STUBS.get("get_iam_policy")
+        stub = self._stubs.get("get_iam_policy")
         if not stub:
-            stub = self._STUBS["get_iam_policy"] = self._GetIamPolicy(
+            stub = self._stubs["get_iam_policy"] = self._GetIamPolicy(
                 self._session, self._host
             )
 
@@ -1564,17 +1411,17 @@ class DisksRestTransport(DisksTransport):
 
     @property
     def insert(self) -> Callable[[compute.InsertDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
     @property
     def list(self) -> Callable[[compute.ListDisksRequest], compute.DiskList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1582,9 +1429,9 @@ class DisksRestTransport(DisksTransport):
     def remove_resource_policies(
         self,
     ) -> Callable[[compute.RemoveResourcePoliciesDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_resource_policies")
+        stub = self._stubs.get("remove_resource_policies")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "remove_resource_policies"
             ] = self._RemoveResourcePolicies(self._session, self._host)
 
@@ -1592,9 +1439,9 @@ class DisksRestTransport(DisksTransport):
 
     @property
     def resize(self) -> Callable[[compute.ResizeDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("resize")
+        stub = self._stubs.get("resize")
         if not stub:
-            stub = self._STUBS["resize"] = self._Resize(self._session, self._host)
+            stub = self._stubs["resize"] = self._Resize(self._session, self._host)
 
         return stub
 
@@ -1602,9 +1449,9 @@ class DisksRestTransport(DisksTransport):
     def set_iam_policy(
         self,
     ) -> Callable[[compute.SetIamPolicyDiskRequest], compute.Policy]:
-        stub = self._STUBS.get("set_iam_policy")
+        stub = self._stubs.get("set_iam_policy")
         if not stub:
-            stub = self._STUBS["set_iam_policy"] = self._SetIamPolicy(
+            stub = self._stubs["set_iam_policy"] = self._SetIamPolicy(
                 self._session, self._host
             )
 
@@ -1612,9 +1459,9 @@ class DisksRestTransport(DisksTransport):
 
     @property
     def set_labels(self) -> Callable[[compute.SetLabelsDiskRequest], compute.Operation]:
-        stub = self._STUBS.get("set_labels")
+        stub = self._stubs.get("set_labels")
         if not stub:
-            stub = self._STUBS["set_labels"] = self._SetLabels(
+            stub = self._stubs["set_labels"] = self._SetLabels(
                 self._session, self._host
             )
 
@@ -1626,16 +1473,17 @@ class DisksRestTransport(DisksTransport):
     ) -> Callable[
         [compute.TestIamPermissionsDiskRequest], compute.TestPermissionsResponse
     ]:
-        stub = self._STUBS.get("test_iam_permissions")
+        stub = self._stubs.get("test_iam_permissions")
         if not stub:
-            stub = self._STUBS["test_iam_permissions"] = self._TestIamPermissions(
+            stub = self._stubs["test_iam_permissions"] = self._TestIamPermissions(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("DisksRestTransport",)
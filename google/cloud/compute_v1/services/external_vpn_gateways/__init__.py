@@ -15,4 +15,18 @@
 #
 from .client import ExternalVpnGatewaysClient
 
-__all__ = ("ExternalVpnGatewaysClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ExternalVpnGatewaysAsyncClient":
+        from .async_client import ExternalVpnGatewaysAsyncClient
+
+        return ExternalVpnGatewaysAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ExternalVpnGatewaysClient",
+    "ExternalVpnGatewaysAsyncClient",
+)
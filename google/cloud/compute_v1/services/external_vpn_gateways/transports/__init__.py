@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[ExternalVpnGatewaysTransport]]
 _transport_registry["rest"] = ExternalVpnGatewaysRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ExternalVpnGatewaysAsyncRestTransport":
+        from .rest_asyncio import ExternalVpnGatewaysAsyncRestTransport
+
+        return ExternalVpnGatewaysAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ExternalVpnGatewaysTransport",
     "ExternalVpnGatewaysRestTransport",
+    "ExternalVpnGatewaysAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    ExternalVpnGatewaysTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import ExternalVpnGatewaysTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, ExternalVpnGatewaysRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, ExternalVpnGatewaysRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _Delete(ExternalVpnGatewaysRestStub):
@@ -146,6 +174,17 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteExternalVpnGatewayRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{external_vpn_gateway}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteExternalVpnGatewayRequest,
@@ -188,31 +227,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{external_vpn_gateway}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteExternalVpnGatewayRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteExternalVpnGatewayRequest.to_json(
-                    compute.DeleteExternalVpnGatewayRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -222,7 +238,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -230,9 +246,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(ExternalVpnGatewaysRestStub):
         def __hash__(self):
@@ -248,6 +262,17 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetExternalVpnGatewayRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{external_vpn_gateway}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetExternalVpnGatewayRequest,
@@ -255,6 +280,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.ExternalVpnGateway:
             r"""Call the get method over HTTP.
 
@@ -269,6 +295,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.ExternalVpnGateway:
@@ -289,31 +317,10 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{external_vpn_gateway}",
-                },
-            ]
-
-            request_kwargs = compute.GetExternalVpnGatewayRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetExternalVpnGatewayRequest.to_json(
-                    compute.GetExternalVpnGatewayRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -323,7 +330,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -331,8 +338,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.ExternalVpnGateway.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.ExternalVpnGateway, response.content
             )
 
     class _Insert(ExternalVpnGatewaysRestStub):
@@ -349,6 +356,18 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertExternalVpnGatewayRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways",
+                    "body": "external_vpn_gateway_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertExternalVpnGatewayRequest,
@@ -391,38 +410,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways",
-                    "body": "external_vpn_gateway_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertExternalVpnGatewayRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ExternalVpnGateway.to_json(
-                compute.ExternalVpnGateway(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertExternalVpnGatewayRequest.to_json(
-                    compute.InsertExternalVpnGatewayRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -432,7 +421,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -441,9 +430,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(ExternalVpnGatewaysRestStub):
         def __hash__(self):
@@ -459,6 +446,17 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListExternalVpnGatewaysRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListExternalVpnGatewaysRequest,
@@ -466,6 +464,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.ExternalVpnGatewayList:
             r"""Call the list method over HTTP.
 
@@ -480,6 +480,11 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.ExternalVpnGatewayList:
@@ -488,31 +493,10 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways",
-                },
-            ]
-
-            request_kwargs = compute.ListExternalVpnGatewaysRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListExternalVpnGatewaysRequest.to_json(
-                    compute.ListExternalVpnGatewaysRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -522,7 +506,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -530,8 +514,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.ExternalVpnGatewayList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.ExternalVpnGatewayList, response.content, lazy=views
             )
 
     class _SetLabels(ExternalVpnGatewaysRestStub):
@@ -548,6 +532,18 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetLabelsExternalVpnGatewayRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{resource}/setLabels",
+                    "body": "global_set_labels_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetLabelsExternalVpnGatewayRequest,
@@ -590,38 +586,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{resource}/setLabels",
-                    "body": "global_set_labels_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetLabelsExternalVpnGatewayRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.GlobalSetLabelsRequest.to_json(
-                compute.GlobalSetLabelsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetLabelsExternalVpnGatewayRequest.to_json(
-                    compute.SetLabelsExternalVpnGatewayRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -631,7 +597,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -640,9 +606,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _TestIamPermissions(ExternalVpnGatewaysRestStub):
         def __hash__(self):
@@ -658,6 +622,18 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.TestIamPermissionsExternalVpnGatewayRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsExternalVpnGatewayRequest,
@@ -685,40 +661,8 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/externalVpnGateways/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.TestIamPermissionsExternalVpnGatewayRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TestPermissionsRequest.to_json(
-                compute.TestPermissionsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.TestIamPermissionsExternalVpnGatewayRequest.to_json(
-                    compute.TestIamPermissionsExternalVpnGatewayRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -728,7 +672,7 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -737,17 +681,17 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TestPermissionsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TestPermissionsResponse, response.content
             )
 
     @property
     def delete(
         self,
     ) -> Callable[[compute.DeleteExternalVpnGatewayRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -755,9 +699,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     def get(
         self,
     ) -> Callable[[compute.GetExternalVpnGatewayRequest], compute.ExternalVpnGateway]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -765,9 +709,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertExternalVpnGatewayRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -777,9 +721,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     ) -> Callable[
         [compute.ListExternalVpnGatewaysRequest], compute.ExternalVpnGatewayList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -787,9 +731,9 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
     def set_labels(
         self,
     ) -> Callable[[compute.SetLabelsExternalVpnGatewayRequest], compute.Operation]:
-        stub = self._STUBS.get("set_labels")
+        stub = self._stubs.get("set_labels")
         if not stub:
-            stub = self._STUBS["set_labels"] = self._SetLabels(
+            stub = self._stubs["set_labels"] = self._SetLabels(
                 self._session, self._host
             )
 
@@ -802,16 +746,17 @@ class ExternalVpnGatewaysRestTransport(ExternalVpnGatewaysTransport):
         [compute.TestIamPermissionsExternalVpnGatewayRequest],
         compute.TestPermissionsResponse,
     ]:
-        stub = self._STUBS.get("test_iam_permissions")
+        stub = self._stubs.get("test_iam_permissions")
         if not stub:
-            stub = self._STUBS["test_iam_permissions"] = self._TestIamPermissions(
+            stub = self._stubs["test_iam_permissions"] = self._TestIamPermissions(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("ExternalVpnGatewaysRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import FirewallPoliciesClient
 
-__all__ = ("FirewallPoliciesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "FirewallPoliciesAsyncClient":
+        from .async_client import FirewallPoliciesAsyncClient
+
+        return FirewallPoliciesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "FirewallPoliciesClient",
+    "FirewallPoliciesAsyncClient",
+)
@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,12 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.firewall_policies import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import FirewallPoliciesTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import FirewallPoliciesRestTransport
@@ -287,7 +293,12 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, FirewallPoliciesTransport, None] = None,
+        transport: Union[
+            str,
+            FirewallPoliciesTransport,
+            Callable[..., FirewallPoliciesTransport],
+            None,
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -299,9 +310,13 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, FirewallPoliciesTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, FirewallPoliciesTransport, Callable[..., FirewallPoliciesTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the FirewallPoliciesTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -318,6 +333,22 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -329,7 +360,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -343,6 +374,11 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -358,6 +394,26 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -369,8 +425,27 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[FirewallPoliciesTransport],
+                Callable[..., FirewallPoliciesTransport],
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -379,6 +454,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def add_association_unary(
@@ -388,7 +464,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         firewall_policy: str = None,
         firewall_policy_association_resource: compute.FirewallPolicyAssociation = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Inserts an association for the specified firewall
@@ -473,6 +549,58 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def add_association(
+        self,
+        request: Union[compute.AddAssociationFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        firewall_policy_association_resource: compute.FirewallPolicyAssociation = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Inserts an association for the specified firewall
+        policy.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AddAssociationFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.AddAssociation. See the method
+                description for details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            firewall_policy_association_resource (google.cloud.compute_v1.types.FirewallPolicyAssociation):
+                The body resource for this request
+                This corresponds to the ``firewall_policy_association_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.add_association_unary(
+            request,
+            firewall_policy=firewall_policy,
+            firewall_policy_association_resource=firewall_policy_association_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def add_rule_unary(
         self,
         request: Union[compute.AddRuleFirewallPolicyRequest, dict] = None,
@@ -480,7 +608,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         firewall_policy: str = None,
         firewall_policy_rule_resource: compute.FirewallPolicyRule = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Inserts a rule into a firewall policy.
@@ -560,13 +688,64 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def add_rule(
+        self,
+        request: Union[compute.AddRuleFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        firewall_policy_rule_resource: compute.FirewallPolicyRule = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Inserts a rule into a firewall policy.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AddRuleFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.AddRule. See the method description for
+                details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            firewall_policy_rule_resource (google.cloud.compute_v1.types.FirewallPolicyRule):
+                The body resource for this request
+                This corresponds to the ``firewall_policy_rule_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.add_rule_unary(
+            request,
+            firewall_policy=firewall_policy,
+            firewall_policy_rule_resource=firewall_policy_rule_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def clone_rules_unary(
         self,
         request: Union[compute.CloneRulesFirewallPolicyRequest, dict] = None,
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Copies rules to the specified firewall policy.
@@ -639,13 +818,57 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def clone_rules(
+        self,
+        request: Union[compute.CloneRulesFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Copies rules to the specified firewall policy.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.CloneRulesFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.CloneRules. See the method description
+                for details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.clone_rules_unary(
+            request,
+            firewall_policy=firewall_policy,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_unary(
         self,
         request: Union[compute.DeleteFirewallPolicyRequest, dict] = None,
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes the specified policy.
@@ -718,14 +941,59 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def delete(
+        self,
+        request: Union[compute.DeleteFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes the specified policy.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.Delete. See the method description for
+                details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                delete.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_unary(
+            request,
+            firewall_policy=firewall_policy,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetFirewallPolicyRequest, dict] = None,
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.FirewallPolicy:
         r"""Returns the specified firewall policy.
 
@@ -744,6 +1012,10 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.FirewallPolicy:
@@ -776,6 +1048,10 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -788,7 +1064,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.FirewallPolicyAssociation:
         r"""Gets an association with the specified name.
@@ -852,7 +1128,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         *,
         resource: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Policy:
         r"""Gets the access control policy for a resource. May be
@@ -956,7 +1232,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.FirewallPolicyRule:
         r"""Gets a rule of the specified priority.
@@ -1025,7 +1301,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         parent_id: str = None,
         firewall_policy_resource: compute.FirewallPolicy = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates a new policy in the specified project using
@@ -1108,13 +1384,72 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def insert(
+        self,
+        request: Union[compute.InsertFirewallPolicyRequest, dict] = None,
+        *,
+        parent_id: str = None,
+        firewall_policy_resource: compute.FirewallPolicy = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates a new policy in the specified project using
+        the data included in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.Insert. See the method description for
+                details.
+            parent_id (str):
+                Parent ID for this request. The ID can be either be
+                "folders/[FOLDER_ID]" if the parent is a folder or
+                "organizations/[ORGANIZATION_ID]" if the parent is an
+                organization.
+
+                This corresponds to the ``parent_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            firewall_policy_resource (google.cloud.compute_v1.types.FirewallPolicy):
+                The body resource for this request
+                This corresponds to the ``firewall_policy_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.insert_unary(
+            request,
+            parent_id=parent_id,
+            firewall_policy_resource=firewall_policy_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def list(
         self,
         request: Union[compute.ListFirewallPoliciesRequest, dict] = None,
         *,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Lists all the policies that have been configured for
         the specified folder or organization.
@@ -1129,6 +1464,30 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.firewall_policies.pagers.ListPager:
@@ -1137,6 +1496,23 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
                 automatically.
 
         """
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with `request`."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListFirewallPoliciesRequest
+            )
+
         # Create or coerce a protobuf request object.
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListFirewallPoliciesRequest.
@@ -1145,17 +1521,39 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         if not isinstance(request, compute.ListFirewallPoliciesRequest):
             request = compute.ListFirewallPoliciesRequest(request)
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1166,7 +1564,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         request: Union[compute.ListAssociationsFirewallPolicyRequest, dict] = None,
         *,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.FirewallPoliciesListAssociationsResponse:
         r"""Lists associations of a specified target, i.e.,
@@ -1212,7 +1610,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         firewall_policy: str = None,
         parent_id: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Moves the specified firewall policy.
@@ -1294,6 +1692,59 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def move(
+        self,
+        request: Union[compute.MoveFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        parent_id: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Moves the specified firewall policy.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.MoveFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.Move. See the method description for
+                details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            parent_id (str):
+                The new parent of the firewall
+                policy.
+
+                This corresponds to the ``parent_id`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.move_unary(
+            request,
+            firewall_policy=firewall_policy,
+            parent_id=parent_id,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def patch_unary(
         self,
         request: Union[compute.PatchFirewallPolicyRequest, dict] = None,
@@ -1301,7 +1752,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         firewall_policy: str = None,
         firewall_policy_resource: compute.FirewallPolicy = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Patches the specified policy with the data included
@@ -1382,6 +1833,58 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def patch(
+        self,
+        request: Union[compute.PatchFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        firewall_policy_resource: compute.FirewallPolicy = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Patches the specified policy with the data included
+        in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.Patch. See the method description for
+                details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            firewall_policy_resource (google.cloud.compute_v1.types.FirewallPolicy):
+                The body resource for this request
+                This corresponds to the ``firewall_policy_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.patch_unary(
+            request,
+            firewall_policy=firewall_policy,
+            firewall_policy_resource=firewall_policy_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def patch_rule_unary(
         self,
         request: Union[compute.PatchRuleFirewallPolicyRequest, dict] = None,
@@ -1389,7 +1892,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         firewall_policy: str = None,
         firewall_policy_rule_resource: compute.FirewallPolicyRule = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Patches a rule of the specified priority.
@@ -1469,13 +1972,64 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def patch_rule(
+        self,
+        request: Union[compute.PatchRuleFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        firewall_policy_rule_resource: compute.FirewallPolicyRule = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Patches a rule of the specified priority.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchRuleFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.PatchRule. See the method description
+                for details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            firewall_policy_rule_resource (google.cloud.compute_v1.types.FirewallPolicyRule):
+                The body resource for this request
+                This corresponds to the ``firewall_policy_rule_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.patch_rule_unary(
+            request,
+            firewall_policy=firewall_policy,
+            firewall_policy_rule_resource=firewall_policy_rule_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def remove_association_unary(
         self,
         request: Union[compute.RemoveAssociationFirewallPolicyRequest, dict] = None,
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Removes an association for the specified firewall
@@ -1549,13 +2103,58 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def remove_association(
+        self,
+        request: Union[compute.RemoveAssociationFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Removes an association for the specified firewall
+        policy.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.RemoveAssociationFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.RemoveAssociation. See the method
+                description for details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.remove_association_unary(
+            request,
+            firewall_policy=firewall_policy,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def remove_rule_unary(
         self,
         request: Union[compute.RemoveRuleFirewallPolicyRequest, dict] = None,
         *,
         firewall_policy: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes a rule of the specified priority.
@@ -1628,6 +2227,50 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         # Done; return the response.
         return response
 
+    def remove_rule(
+        self,
+        request: Union[compute.RemoveRuleFirewallPolicyRequest, dict] = None,
+        *,
+        firewall_policy: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes a rule of the specified priority.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.RemoveRuleFirewallPolicyRequest, dict]):
+                The request object. A request message for
+                FirewallPolicies.RemoveRule. See the method description
+                for details.
+            firewall_policy (str):
+                Name of the firewall policy to
+                update.
+
+                This corresponds to the ``firewall_policy`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.remove_rule_unary(
+            request,
+            firewall_policy=firewall_policy,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_iam_policy(
         self,
         request: Union[compute.SetIamPolicyFirewallPolicyRequest, dict] = None,
@@ -1635,7 +2278,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         resource: str = None,
         global_organization_set_policy_request_resource: compute.GlobalOrganizationSetPolicyRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Policy:
         r"""Sets the access control policy on the specified
@@ -1751,7 +2394,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         resource: str = None,
         test_permissions_request_resource: compute.TestPermissionsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.TestPermissionsResponse:
         r"""Returns permissions that a caller has on the
@@ -1833,12 +2476,7 @@ class FirewallPoliciesClient(metaclass=FirewallPoliciesClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("FirewallPoliciesClient",)
@@ -24,7 +24,19 @@ from .rest import FirewallPoliciesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[FirewallPoliciesTransport]]
 _transport_registry["rest"] = FirewallPoliciesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "FirewallPoliciesAsyncRestTransport":
+        from .rest_asyncio import FirewallPoliciesAsyncRestTransport
+
+        return FirewallPoliciesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "FirewallPoliciesTransport",
     "FirewallPoliciesRestTransport",
+    "FirewallPoliciesAsyncRestTransport",
 )
@@ -15,7 +15,6 @@
 #
 import abc
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Union
-import pkg_resources
 
 import google.auth  # type: ignore
 import google.api_core
@@ -25,14 +24,13 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import coalescing
+from google.cloud.compute_v1 import rate_limiting
+from google.cloud.compute_v1 import retry_policy
 from google.cloud.compute_v1.types import compute
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 class FirewallPoliciesTransport(abc.ABC):
@@ -45,6 +43,13 @@ class FirewallPoliciesTransport(abc.ABC):
 
     DEFAULT_HOST: str = "compute.googleapis.com"
 
+    # The default retry and timeout of each method.
+    _retry_policy = retry_policy.DEFAULT_RETRY_POLICY
+    # The limiter that paces the calls, if any.
+    _rate_limiter = None
+    # The coalescer of identical reads in flight, if any.
+    _coalescer = None
+
     def __init__(
         self,
         *,
@@ -121,60 +126,172 @@ class FirewallPoliciesTransport(abc.ABC):
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.add_association: gapic_v1.method.wrap_method(
-                self.add_association, default_timeout=None, client_info=client_info,
+            self.add_association: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.add_association, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "add_association",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.add_rule: gapic_v1.method.wrap_method(
-                self.add_rule, default_timeout=None, client_info=client_info,
+            self.add_rule: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.add_rule, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "add_rule",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.clone_rules: gapic_v1.method.wrap_method(
-                self.clone_rules, default_timeout=None, client_info=client_info,
+            self.clone_rules: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.clone_rules, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "clone_rules",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.delete: gapic_v1.method.wrap_method(
-                self.delete, default_timeout=None, client_info=client_info,
+            self.delete: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.delete, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "delete",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get, default_timeout=None, client_info=client_info,
+            self.get: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_association: gapic_v1.method.wrap_method(
-                self.get_association, default_timeout=None, client_info=client_info,
+            self.get_association: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_association, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_association",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy, default_timeout=None, client_info=client_info,
+            self.get_iam_policy: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_iam_policy, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_iam_policy",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_rule: gapic_v1.method.wrap_method(
-                self.get_rule, default_timeout=None, client_info=client_info,
+            self.get_rule: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_rule, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_rule",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.insert: gapic_v1.method.wrap_method(
-                self.insert, default_timeout=None, client_info=client_info,
+            self.insert: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.insert, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "insert",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.list: gapic_v1.method.wrap_method(
-                self.list, default_timeout=None, client_info=client_info,
+            self.list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.list, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.list_associations: gapic_v1.method.wrap_method(
-                self.list_associations, default_timeout=None, client_info=client_info,
+            self.list_associations: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.list_associations, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "list_associations",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.move: gapic_v1.method.wrap_method(
-                self.move, default_timeout=None, client_info=client_info,
+            self.move: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.move, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "move",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.patch: gapic_v1.method.wrap_method(
-                self.patch, default_timeout=None, client_info=client_info,
+            self.patch: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.patch, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "patch",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.patch_rule: gapic_v1.method.wrap_method(
-                self.patch_rule, default_timeout=None, client_info=client_info,
+            self.patch_rule: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.patch_rule, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "patch_rule",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.remove_association: gapic_v1.method.wrap_method(
-                self.remove_association, default_timeout=None, client_info=client_info,
+            self.remove_association: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.remove_association, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "remove_association",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.remove_rule: gapic_v1.method.wrap_method(
-                self.remove_rule, default_timeout=None, client_info=client_info,
+            self.remove_rule: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.remove_rule, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "remove_rule",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy, default_timeout=None, client_info=client_info,
+            self.set_iam_policy: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_iam_policy, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_iam_policy",
+                retry_policy.UNKEYED_MUTATION,
+                client_info=client_info,
             ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
+            self.test_iam_permissions: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.test_iam_permissions, self._rate_limiter, rate_limiting.READ
+                ),
+                "test_iam_permissions",
+                retry_policy.READ,
                 client_info=client_info,
             ),
         }
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    FirewallPoliciesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import FirewallPoliciesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, FirewallPoliciesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, FirewallPoliciesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddAssociation(FirewallPoliciesRestStub):
@@ -146,6 +174,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddAssociationFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/addAssociation",
+                    "body": "firewall_policy_association_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddAssociationFirewallPolicyRequest,
@@ -188,40 +228,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/addAssociation",
-                    "body": "firewall_policy_association_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddAssociationFirewallPolicyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.FirewallPolicyAssociation.to_json(
-                compute.FirewallPolicyAssociation(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddAssociationFirewallPolicyRequest.to_json(
-                    compute.AddAssociationFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -231,7 +239,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -240,9 +248,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AddRule(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -258,6 +264,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddRuleFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/addRule",
+                    "body": "firewall_policy_rule_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddRuleFirewallPolicyRequest,
@@ -300,38 +318,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/addRule",
-                    "body": "firewall_policy_rule_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddRuleFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.FirewallPolicyRule.to_json(
-                compute.FirewallPolicyRule(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddRuleFirewallPolicyRequest.to_json(
-                    compute.AddRuleFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -341,7 +329,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -350,9 +338,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _CloneRules(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -368,6 +354,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.CloneRulesFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/cloneRules",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.CloneRulesFirewallPolicyRequest,
@@ -410,31 +407,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/cloneRules",
-                },
-            ]
-
-            request_kwargs = compute.CloneRulesFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.CloneRulesFirewallPolicyRequest.to_json(
-                    compute.CloneRulesFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -444,7 +418,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -452,9 +426,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -470,6 +442,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteFirewallPolicyRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteFirewallPolicyRequest,
@@ -512,31 +495,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteFirewallPolicyRequest.to_json(
-                    compute.DeleteFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -546,7 +506,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -554,9 +514,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -572,6 +530,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetFirewallPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetFirewallPolicyRequest,
@@ -579,6 +548,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.FirewallPolicy:
             r"""Call the get method over HTTP.
 
@@ -593,6 +563,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.FirewallPolicy:
@@ -601,31 +573,10 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}",
-                },
-            ]
-
-            request_kwargs = compute.GetFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetFirewallPolicyRequest.to_json(
-                    compute.GetFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -635,7 +586,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -643,9 +594,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.FirewallPolicy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.FirewallPolicy, response.content)
 
     class _GetAssociation(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -661,6 +610,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetAssociationFirewallPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/getAssociation",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetAssociationFirewallPolicyRequest,
@@ -688,33 +648,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/getAssociation",
-                },
-            ]
-
-            request_kwargs = compute.GetAssociationFirewallPolicyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetAssociationFirewallPolicyRequest.to_json(
-                    compute.GetAssociationFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -724,7 +659,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -732,8 +667,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.FirewallPolicyAssociation.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.FirewallPolicyAssociation, response.content
             )
 
     class _GetIamPolicy(FirewallPoliciesRestStub):
@@ -750,6 +685,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetIamPolicyFirewallPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{resource}/getIamPolicy",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetIamPolicyFirewallPolicyRequest,
@@ -817,31 +763,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{resource}/getIamPolicy",
-                },
-            ]
-
-            request_kwargs = compute.GetIamPolicyFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetIamPolicyFirewallPolicyRequest.to_json(
-                    compute.GetIamPolicyFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -851,7 +774,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -859,9 +782,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _GetRule(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -877,6 +798,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetRuleFirewallPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/getRule",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetRuleFirewallPolicyRequest,
@@ -908,31 +840,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/getRule",
-                },
-            ]
-
-            request_kwargs = compute.GetRuleFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetRuleFirewallPolicyRequest.to_json(
-                    compute.GetRuleFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -942,7 +851,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -950,8 +859,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.FirewallPolicyRule.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.FirewallPolicyRule, response.content
             )
 
     class _Insert(FirewallPoliciesRestStub):
@@ -970,6 +879,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies",
+                    "body": "firewall_policy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertFirewallPolicyRequest,
@@ -1012,38 +933,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies",
-                    "body": "firewall_policy_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.FirewallPolicy.to_json(
-                compute.FirewallPolicy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertFirewallPolicyRequest.to_json(
-                    compute.InsertFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1053,7 +944,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1062,14 +953,22 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(FirewallPoliciesRestStub):
         def __hash__(self):
             return hash("List")
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListFirewallPoliciesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/firewallPolicies",
+                },
+            ],
+        )
+
         def __call__(
             self,
             request: compute.ListFirewallPoliciesRequest,
@@ -1077,6 +976,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.FirewallPolicyList:
             r"""Call the list method over HTTP.
 
@@ -1091,35 +992,21 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.FirewallPolicyList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/firewallPolicies",
-                },
-            ]
-
-            request_kwargs = compute.ListFirewallPoliciesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListFirewallPoliciesRequest.to_json(
-                    compute.ListFirewallPoliciesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -1129,7 +1016,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1137,14 +1024,24 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.FirewallPolicyList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.FirewallPolicyList, response.content, lazy=views
             )
 
     class _ListAssociations(FirewallPoliciesRestStub):
         def __hash__(self):
             return hash("ListAssociations")
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListAssociationsFirewallPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/listAssociations",
+                },
+            ],
+        )
+
         def __call__(
             self,
             request: compute.ListAssociationsFirewallPolicyRequest,
@@ -1172,31 +1069,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/listAssociations",
-                },
-            ]
-
-            request_kwargs = compute.ListAssociationsFirewallPolicyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListAssociationsFirewallPolicyRequest.to_json(
-                    compute.ListAssociationsFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1206,7 +1080,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1214,8 +1088,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.FirewallPoliciesListAssociationsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.FirewallPoliciesListAssociationsResponse, response.content
             )
 
     class _Move(FirewallPoliciesRestStub):
@@ -1234,6 +1108,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.MoveFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/move",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.MoveFirewallPolicyRequest,
@@ -1276,31 +1161,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/move",
-                },
-            ]
-
-            request_kwargs = compute.MoveFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.MoveFirewallPolicyRequest.to_json(
-                    compute.MoveFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1310,7 +1172,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1318,9 +1180,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Patch(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -1336,6 +1196,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchFirewallPolicyRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}",
+                    "body": "firewall_policy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchFirewallPolicyRequest,
@@ -1378,38 +1250,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}",
-                    "body": "firewall_policy_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.FirewallPolicy.to_json(
-                compute.FirewallPolicy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchFirewallPolicyRequest.to_json(
-                    compute.PatchFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1419,7 +1261,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1428,9 +1270,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _PatchRule(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -1446,6 +1286,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchRuleFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/patchRule",
+                    "body": "firewall_policy_rule_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchRuleFirewallPolicyRequest,
@@ -1488,38 +1340,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/patchRule",
-                    "body": "firewall_policy_rule_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchRuleFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.FirewallPolicyRule.to_json(
-                compute.FirewallPolicyRule(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchRuleFirewallPolicyRequest.to_json(
-                    compute.PatchRuleFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1529,7 +1351,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1538,9 +1360,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _RemoveAssociation(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -1556,6 +1376,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveAssociationFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/removeAssociation",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveAssociationFirewallPolicyRequest,
@@ -1598,33 +1429,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/removeAssociation",
-                },
-            ]
-
-            request_kwargs = compute.RemoveAssociationFirewallPolicyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveAssociationFirewallPolicyRequest.to_json(
-                    compute.RemoveAssociationFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1634,7 +1440,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1642,9 +1448,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _RemoveRule(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -1660,6 +1464,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveRuleFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/removeRule",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveRuleFirewallPolicyRequest,
@@ -1702,31 +1517,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{firewall_policy}/removeRule",
-                },
-            ]
-
-            request_kwargs = compute.RemoveRuleFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveRuleFirewallPolicyRequest.to_json(
-                    compute.RemoveRuleFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1736,7 +1528,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1744,9 +1536,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetIamPolicy(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -1762,6 +1552,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetIamPolicyFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{resource}/setIamPolicy",
+                    "body": "global_organization_set_policy_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetIamPolicyFirewallPolicyRequest,
@@ -1829,38 +1631,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{resource}/setIamPolicy",
-                    "body": "global_organization_set_policy_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetIamPolicyFirewallPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.GlobalOrganizationSetPolicyRequest.to_json(
-                compute.GlobalOrganizationSetPolicyRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetIamPolicyFirewallPolicyRequest.to_json(
-                    compute.SetIamPolicyFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1870,7 +1642,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1879,9 +1651,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _TestIamPermissions(FirewallPoliciesRestStub):
         def __hash__(self):
@@ -1897,6 +1667,18 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.TestIamPermissionsFirewallPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/locations/global/firewallPolicies/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsFirewallPolicyRequest,
@@ -1924,40 +1706,8 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/locations/global/firewallPolicies/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.TestIamPermissionsFirewallPolicyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TestPermissionsRequest.to_json(
-                compute.TestPermissionsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.TestIamPermissionsFirewallPolicyRequest.to_json(
-                    compute.TestIamPermissionsFirewallPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1967,7 +1717,7 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1976,17 +1726,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TestPermissionsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TestPermissionsResponse, response.content
             )
 
     @property
     def add_association(
         self,
     ) -> Callable[[compute.AddAssociationFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("add_association")
+        stub = self._stubs.get("add_association")
         if not stub:
-            stub = self._STUBS["add_association"] = self._AddAssociation(
+            stub = self._stubs["add_association"] = self._AddAssociation(
                 self._session, self._host
             )
 
@@ -1996,9 +1746,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def add_rule(
         self,
     ) -> Callable[[compute.AddRuleFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("add_rule")
+        stub = self._stubs.get("add_rule")
         if not stub:
-            stub = self._STUBS["add_rule"] = self._AddRule(self._session, self._host)
+            stub = self._stubs["add_rule"] = self._AddRule(self._session, self._host)
 
         return stub
 
@@ -2006,9 +1756,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def clone_rules(
         self,
     ) -> Callable[[compute.CloneRulesFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("clone_rules")
+        stub = self._stubs.get("clone_rules")
         if not stub:
-            stub = self._STUBS["clone_rules"] = self._CloneRules(
+            stub = self._stubs["clone_rules"] = self._CloneRules(
                 self._session, self._host
             )
 
@@ -2018,9 +1768,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -2028,9 +1778,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetFirewallPolicyRequest], compute.FirewallPolicy]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -2040,9 +1790,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     ) -> Callable[
         [compute.GetAssociationFirewallPolicyRequest], compute.FirewallPolicyAssociation
     ]:
-        stub = self._STUBS.get("get_association")
+        stub = self._stubs.get("get_association")
         if not stub:
-            stub = self._STUBS["get_association"] = self._GetAssociation(
+            stub = self._stubs["get_association"] = self._GetAssociation(
                 self._session, self._host
             )
 
@@ -2052,9 +1802,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def get_iam_policy(
         self,
     ) -> Callable[[compute.GetIamPolicyFirewallPolicyRequest], compute.Policy]:
-        stub = self._STUBS.get("get_iam_policy")
+        stub = self._stubs.get("get_iam_policy")
         if not stub:
-            stub = self._STUBS["get_iam_policy"] = self._GetIamPolicy(
+            stub = self._stubs["get_iam_policy"] = self._GetIamPolicy(
                 self._session, self._host
             )
 
@@ -2064,9 +1814,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def get_rule(
         self,
     ) -> Callable[[compute.GetRuleFirewallPolicyRequest], compute.FirewallPolicyRule]:
-        stub = self._STUBS.get("get_rule")
+        stub = self._stubs.get("get_rule")
         if not stub:
-            stub = self._STUBS["get_rule"] = self._GetRule(self._session, self._host)
+            stub = self._stubs["get_rule"] = self._GetRule(self._session, self._host)
 
         return stub
 
@@ -2074,9 +1824,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -2084,9 +1834,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def list(
         self,
     ) -> Callable[[compute.ListFirewallPoliciesRequest], compute.FirewallPolicyList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -2097,9 +1847,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
         [compute.ListAssociationsFirewallPolicyRequest],
         compute.FirewallPoliciesListAssociationsResponse,
     ]:
-        stub = self._STUBS.get("list_associations")
+        stub = self._stubs.get("list_associations")
         if not stub:
-            stub = self._STUBS["list_associations"] = self._ListAssociations(
+            stub = self._stubs["list_associations"] = self._ListAssociations(
                 self._session, self._host
             )
 
@@ -2107,9 +1857,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
 
     @property
     def move(self) -> Callable[[compute.MoveFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("move")
+        stub = self._stubs.get("move")
         if not stub:
-            stub = self._STUBS["move"] = self._Move(self._session, self._host)
+            stub = self._stubs["move"] = self._Move(self._session, self._host)
 
         return stub
 
@@ -2117,9 +1867,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def patch(
         self,
     ) -> Callable[[compute.PatchFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -2127,9 +1877,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def patch_rule(
         self,
     ) -> Callable[[compute.PatchRuleFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("patch_rule")
+        stub = self._stubs.get("patch_rule")
         if not stub:
-            stub = self._STUBS["patch_rule"] = self._PatchRule(
+            stub = self._stubs["patch_rule"] = self._PatchRule(
                 self._session, self._host
             )
 
@@ -2139,9 +1889,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def remove_association(
         self,
     ) -> Callable[[compute.RemoveAssociationFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_association")
+        stub = self._stubs.get("remove_association")
         if not stub:
-            stub = self._STUBS["remove_association"] = self._RemoveAssociation(
+            stub = self._stubs["remove_association"] = self._RemoveAssociation(
                 self._session, self._host
             )
 
@@ -2151,9 +1901,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def remove_rule(
         self,
     ) -> Callable[[compute.RemoveRuleFirewallPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_rule")
+        stub = self._stubs.get("remove_rule")
         if not stub:
-            stub = self._STUBS["remove_rule"] = self._RemoveRule(
+            stub = self._stubs["remove_rule"] = self._RemoveRule(
                 self._session, self._host
             )
 
@@ -2163,9 +1913,9 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
     def set_iam_policy(
         self,
     ) -> Callable[[compute.SetIamPolicyFirewallPolicyRequest], compute.Policy]:
-        stub = self._STUBS.get("set_iam_policy")
+        stub = self._stubs.get("set_iam_policy")
         if not stub:
-            stub = self._STUBS["set_iam_policy"] = self._SetIamPolicy(
+            stub = self._stubs["set_iam_policy"] = self._SetIamPolicy(
                 self._session, self._host
             )
 
@@ -2178,16 +1928,17 @@ class FirewallPoliciesRestTransport(FirewallPoliciesTransport):
         [compute.TestIamPermissionsFirewallPolicyRequest],
         compute.TestPermissionsResponse,
     ]:
-        stub = self._STUBS.get("test_iam_permissions")
+        stub = self._stubs.get("test_iam_permissions")
         if not stub:
-            stub = self._STUBS["test_iam_permissions"] = self._TestIamPermissions(
+            stub = self._stubs["test_iam_permissions"] = self._TestIamPermissions(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("FirewallPoliciesRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import FirewallsClient
 
-__all__ = ("FirewallsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "FirewallsAsyncClient":
+        from .async_client import FirewallsAsyncClient
+
+        return FirewallsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "FirewallsClient",
+    "FirewallsAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import FirewallsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[FirewallsTransport]]
 _transport_registry["rest"] = FirewallsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "FirewallsAsyncRestTransport":
+        from .rest_asyncio import FirewallsAsyncRestTransport
+
+        return FirewallsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "FirewallsTransport",
     "FirewallsRestTransport",
+    "FirewallsAsyncRestTransport",
 )
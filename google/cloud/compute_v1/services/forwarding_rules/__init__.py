@@ -15,4 +15,18 @@
 #
 from .client import ForwardingRulesClient
 
-__all__ = ("ForwardingRulesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ForwardingRulesAsyncClient":
+        from .async_client import ForwardingRulesAsyncClient
+
+        return ForwardingRulesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ForwardingRulesClient",
+    "ForwardingRulesAsyncClient",
+)
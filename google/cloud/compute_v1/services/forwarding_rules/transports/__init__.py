@@ -24,7 +24,19 @@ from .rest import ForwardingRulesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ForwardingRulesTransport]]
 _transport_registry["rest"] = ForwardingRulesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ForwardingRulesAsyncRestTransport":
+        from .rest_asyncio import ForwardingRulesAsyncRestTransport
+
+        return ForwardingRulesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ForwardingRulesTransport",
     "ForwardingRulesRestTransport",
+    "ForwardingRulesAsyncRestTransport",
 )
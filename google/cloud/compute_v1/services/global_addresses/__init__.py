@@ -15,4 +15,18 @@
 #
 from .client import GlobalAddressesClient
 
-__all__ = ("GlobalAddressesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "GlobalAddressesAsyncClient":
+        from .async_client import GlobalAddressesAsyncClient
+
+        return GlobalAddressesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "GlobalAddressesClient",
+    "GlobalAddressesAsyncClient",
+)
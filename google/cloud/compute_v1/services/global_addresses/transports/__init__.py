@@ -24,7 +24,19 @@ from .rest import GlobalAddressesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[GlobalAddressesTransport]]
 _transport_registry["rest"] = GlobalAddressesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "GlobalAddressesAsyncRestTransport":
+        from .rest_asyncio import GlobalAddressesAsyncRestTransport
+
+        return GlobalAddressesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "GlobalAddressesTransport",
     "GlobalAddressesRestTransport",
+    "GlobalAddressesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import GlobalForwardingRulesClient
 
-__all__ = ("GlobalForwardingRulesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "GlobalForwardingRulesAsyncClient":
+        from .async_client import GlobalForwardingRulesAsyncClient
+
+        return GlobalForwardingRulesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "GlobalForwardingRulesClient",
+    "GlobalForwardingRulesAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[GlobalForwardingRulesTransport]]
 _transport_registry["rest"] = GlobalForwardingRulesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "GlobalForwardingRulesAsyncRestTransport":
+        from .rest_asyncio import GlobalForwardingRulesAsyncRestTransport
+
+        return GlobalForwardingRulesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "GlobalForwardingRulesTransport",
     "GlobalForwardingRulesRestTransport",
+    "GlobalForwardingRulesAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    GlobalForwardingRulesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import GlobalForwardingRulesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, GlobalForwardingRulesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, GlobalForwardingRulesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _Delete(GlobalForwardingRulesRestStub):
@@ -146,6 +174,17 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteGlobalForwardingRuleRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteGlobalForwardingRuleRequest,
@@ -188,31 +227,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteGlobalForwardingRuleRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteGlobalForwardingRuleRequest.to_json(
-                    compute.DeleteGlobalForwardingRuleRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -222,7 +238,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -230,9 +246,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(GlobalForwardingRulesRestStub):
         def __hash__(self):
@@ -248,6 +262,17 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetGlobalForwardingRuleRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetGlobalForwardingRuleRequest,
@@ -255,6 +280,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.ForwardingRule:
             r"""Call the get method over HTTP.
 
@@ -269,6 +295,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.ForwardingRule:
@@ -287,31 +315,10 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}",
-                },
-            ]
-
-            request_kwargs = compute.GetGlobalForwardingRuleRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetGlobalForwardingRuleRequest.to_json(
-                    compute.GetGlobalForwardingRuleRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -321,7 +328,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -329,9 +336,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.ForwardingRule.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.ForwardingRule, response.content)
 
     class _Insert(GlobalForwardingRulesRestStub):
         def __hash__(self):
@@ -347,6 +352,18 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertGlobalForwardingRuleRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules",
+                    "body": "forwarding_rule_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertGlobalForwardingRuleRequest,
@@ -389,38 +406,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules",
-                    "body": "forwarding_rule_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertGlobalForwardingRuleRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ForwardingRule.to_json(
-                compute.ForwardingRule(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertGlobalForwardingRuleRequest.to_json(
-                    compute.InsertGlobalForwardingRuleRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -430,7 +417,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -439,9 +426,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(GlobalForwardingRulesRestStub):
         def __hash__(self):
@@ -457,6 +442,17 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListGlobalForwardingRulesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListGlobalForwardingRulesRequest,
@@ -464,6 +460,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.ForwardingRuleList:
             r"""Call the list method over HTTP.
 
@@ -478,6 +476,11 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.ForwardingRuleList:
@@ -486,31 +489,10 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules",
-                },
-            ]
-
-            request_kwargs = compute.ListGlobalForwardingRulesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListGlobalForwardingRulesRequest.to_json(
-                    compute.ListGlobalForwardingRulesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -520,7 +502,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -528,8 +510,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.ForwardingRuleList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.ForwardingRuleList, response.content, lazy=views
             )
 
     class _Patch(GlobalForwardingRulesRestStub):
@@ -546,6 +528,18 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchGlobalForwardingRuleRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}",
+                    "body": "forwarding_rule_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchGlobalForwardingRuleRequest,
@@ -588,38 +582,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}",
-                    "body": "forwarding_rule_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchGlobalForwardingRuleRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ForwardingRule.to_json(
-                compute.ForwardingRule(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchGlobalForwardingRuleRequest.to_json(
-                    compute.PatchGlobalForwardingRuleRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -629,7 +593,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -638,9 +602,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetLabels(GlobalForwardingRulesRestStub):
         def __hash__(self):
@@ -656,6 +618,18 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetLabelsGlobalForwardingRuleRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{resource}/setLabels",
+                    "body": "global_set_labels_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetLabelsGlobalForwardingRuleRequest,
@@ -698,40 +672,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{resource}/setLabels",
-                    "body": "global_set_labels_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetLabelsGlobalForwardingRuleRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.GlobalSetLabelsRequest.to_json(
-                compute.GlobalSetLabelsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetLabelsGlobalForwardingRuleRequest.to_json(
-                    compute.SetLabelsGlobalForwardingRuleRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -741,7 +683,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -750,9 +692,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetTarget(GlobalForwardingRulesRestStub):
         def __hash__(self):
@@ -768,6 +708,18 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetTargetGlobalForwardingRuleRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}/setTarget",
+                    "body": "target_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetTargetGlobalForwardingRuleRequest,
@@ -810,40 +762,8 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/forwardingRules/{forwarding_rule}/setTarget",
-                    "body": "target_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetTargetGlobalForwardingRuleRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetReference.to_json(
-                compute.TargetReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetTargetGlobalForwardingRuleRequest.to_json(
-                    compute.SetTargetGlobalForwardingRuleRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -853,7 +773,7 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -862,17 +782,15 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def delete(
         self,
     ) -> Callable[[compute.DeleteGlobalForwardingRuleRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -880,9 +798,9 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetGlobalForwardingRuleRequest], compute.ForwardingRule]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -890,9 +808,9 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertGlobalForwardingRuleRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -902,9 +820,9 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     ) -> Callable[
         [compute.ListGlobalForwardingRulesRequest], compute.ForwardingRuleList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -912,9 +830,9 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     def patch(
         self,
     ) -> Callable[[compute.PatchGlobalForwardingRuleRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -922,9 +840,9 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     def set_labels(
         self,
     ) -> Callable[[compute.SetLabelsGlobalForwardingRuleRequest], compute.Operation]:
-        stub = self._STUBS.get("set_labels")
+        stub = self._stubs.get("set_labels")
         if not stub:
-            stub = self._STUBS["set_labels"] = self._SetLabels(
+            stub = self._stubs["set_labels"] = self._SetLabels(
                 self._session, self._host
             )
 
@@ -934,16 +852,17 @@ class GlobalForwardingRulesRestTransport(GlobalForwardingRulesTransport):
     def set_target(
         self,
     ) -> Callable[[compute.SetTargetGlobalForwardingRuleRequest], compute.Operation]:
-        stub = self._STUBS.get("set_target")
+        stub = self._stubs.get("set_target")
         if not stub:
-            stub = self._STUBS["set_target"] = self._SetTarget(
+            stub = self._stubs["set_target"] = self._SetTarget(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("GlobalForwardingRulesRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import GlobalNetworkEndpointGroupsClient
 
-__all__ = ("GlobalNetworkEndpointGroupsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "GlobalNetworkEndpointGroupsAsyncClient":
+        from .async_client import GlobalNetworkEndpointGroupsAsyncClient
+
+        return GlobalNetworkEndpointGroupsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "GlobalNetworkEndpointGroupsClient",
+    "GlobalNetworkEndpointGroupsAsyncClient",
+)
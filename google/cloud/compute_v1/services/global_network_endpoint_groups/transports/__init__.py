@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[GlobalNetworkEndpointGroupsTransport]]
 _transport_registry["rest"] = GlobalNetworkEndpointGroupsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "GlobalNetworkEndpointGroupsAsyncRestTransport":
+        from .rest_asyncio import GlobalNetworkEndpointGroupsAsyncRestTransport
+
+        return GlobalNetworkEndpointGroupsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "GlobalNetworkEndpointGroupsTransport",
     "GlobalNetworkEndpointGroupsRestTransport",
+    "GlobalNetworkEndpointGroupsAsyncRestTransport",
 )
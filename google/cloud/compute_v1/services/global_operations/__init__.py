@@ -15,4 +15,18 @@
 #
 from .client import GlobalOperationsClient
 
-__all__ = ("GlobalOperationsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "GlobalOperationsAsyncClient":
+        from .async_client import GlobalOperationsAsyncClient
+
+        return GlobalOperationsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "GlobalOperationsClient",
+    "GlobalOperationsAsyncClient",
+)
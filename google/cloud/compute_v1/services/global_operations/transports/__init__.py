@@ -24,7 +24,19 @@ from .rest import GlobalOperationsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[GlobalOperationsTransport]]
 _transport_registry["rest"] = GlobalOperationsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "GlobalOperationsAsyncRestTransport":
+        from .rest_asyncio import GlobalOperationsAsyncRestTransport
+
+        return GlobalOperationsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "GlobalOperationsTransport",
     "GlobalOperationsRestTransport",
+    "GlobalOperationsAsyncRestTransport",
 )
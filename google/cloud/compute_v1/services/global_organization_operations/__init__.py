@@ -15,4 +15,18 @@
 #
 from .client import GlobalOrganizationOperationsClient
 
-__all__ = ("GlobalOrganizationOperationsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "GlobalOrganizationOperationsAsyncClient":
+        from .async_client import GlobalOrganizationOperationsAsyncClient
+
+        return GlobalOrganizationOperationsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "GlobalOrganizationOperationsClient",
+    "GlobalOrganizationOperationsAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[GlobalOrganizationOperationsTransport]]
 _transport_registry["rest"] = GlobalOrganizationOperationsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "GlobalOrganizationOperationsAsyncRestTransport":
+        from .rest_asyncio import GlobalOrganizationOperationsAsyncRestTransport
+
+        return GlobalOrganizationOperationsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "GlobalOrganizationOperationsTransport",
     "GlobalOrganizationOperationsRestTransport",
+    "GlobalOrganizationOperationsAsyncRestTransport",
 )
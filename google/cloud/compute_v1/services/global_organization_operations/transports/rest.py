@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    GlobalOrganizationOperationsTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import GlobalOrganizationOperationsTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, GlobalOrganizationOperationsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, GlobalOrganizationOperationsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _Delete(GlobalOrganizationOperationsRestStub):
@@ -146,6 +174,17 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteGlobalOrganizationOperationRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/locations/global/operations/{operation}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteGlobalOrganizationOperationRequest,
@@ -176,33 +215,8 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/locations/global/operations/{operation}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteGlobalOrganizationOperationRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteGlobalOrganizationOperationRequest.to_json(
-                    compute.DeleteGlobalOrganizationOperationRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -212,7 +226,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -220,8 +234,8 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.DeleteGlobalOrganizationOperationResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.DeleteGlobalOrganizationOperationResponse, response.content
             )
 
     class _Get(GlobalOrganizationOperationsRestStub):
@@ -238,6 +252,17 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetGlobalOrganizationOperationRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/locations/global/operations/{operation}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetGlobalOrganizationOperationRequest,
@@ -245,6 +270,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.Operation:
             r"""Call the get method over HTTP.
 
@@ -259,6 +285,8 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.Operation:
@@ -280,33 +308,10 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/locations/global/operations/{operation}",
-                },
-            ]
-
-            request_kwargs = compute.GetGlobalOrganizationOperationRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetGlobalOrganizationOperationRequest.to_json(
-                    compute.GetGlobalOrganizationOperationRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -316,7 +321,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -324,14 +329,17 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(GlobalOrganizationOperationsRestStub):
         def __hash__(self):
             return hash("List")
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListGlobalOrganizationOperationsRequest,
+            [{"method": "get", "uri": "/compute/v1/locations/global/operations",},],
+        )
+
         def __call__(
             self,
             request: compute.ListGlobalOrganizationOperationsRequest,
@@ -339,6 +347,8 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.OperationList:
             r"""Call the list method over HTTP.
 
@@ -353,6 +363,11 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.OperationList:
@@ -361,28 +376,10 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
 
             """
 
-            http_options = [
-                {"method": "get", "uri": "/compute/v1/locations/global/operations",},
-            ]
-
-            request_kwargs = compute.ListGlobalOrganizationOperationsRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListGlobalOrganizationOperationsRequest.to_json(
-                    compute.ListGlobalOrganizationOperationsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -392,7 +389,7 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -400,8 +397,8 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.OperationList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.OperationList, response.content, lazy=views
             )
 
     @property
@@ -411,9 +408,9 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
         [compute.DeleteGlobalOrganizationOperationRequest],
         compute.DeleteGlobalOrganizationOperationResponse,
     ]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -421,9 +418,9 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
     def get(
         self,
     ) -> Callable[[compute.GetGlobalOrganizationOperationRequest], compute.Operation]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -433,14 +430,15 @@ class GlobalOrganizationOperationsRestTransport(GlobalOrganizationOperationsTran
     ) -> Callable[
         [compute.ListGlobalOrganizationOperationsRequest], compute.OperationList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("GlobalOrganizationOperationsRestTransport",)
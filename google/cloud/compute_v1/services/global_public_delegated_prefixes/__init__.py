@@ -15,4 +15,18 @@
 #
 from .client import GlobalPublicDelegatedPrefixesClient
 
-__all__ = ("GlobalPublicDelegatedPrefixesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "GlobalPublicDelegatedPrefixesAsyncClient":
+        from .async_client import GlobalPublicDelegatedPrefixesAsyncClient
+
+        return GlobalPublicDelegatedPrefixesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "GlobalPublicDelegatedPrefixesClient",
+    "GlobalPublicDelegatedPrefixesAsyncClient",
+)
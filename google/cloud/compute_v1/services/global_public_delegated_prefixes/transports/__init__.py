@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[GlobalPublicDelegatedPrefixesTransport]]
 _transport_registry["rest"] = GlobalPublicDelegatedPrefixesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "GlobalPublicDelegatedPrefixesAsyncRestTransport":
+        from .rest_asyncio import GlobalPublicDelegatedPrefixesAsyncRestTransport
+
+        return GlobalPublicDelegatedPrefixesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "GlobalPublicDelegatedPrefixesTransport",
     "GlobalPublicDelegatedPrefixesRestTransport",
+    "GlobalPublicDelegatedPrefixesAsyncRestTransport",
 )
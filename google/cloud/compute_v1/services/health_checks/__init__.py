@@ -15,4 +15,18 @@
 #
 from .client import HealthChecksClient
 
-__all__ = ("HealthChecksClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "HealthChecksAsyncClient":
+        from .async_client import HealthChecksAsyncClient
+
+        return HealthChecksAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "HealthChecksClient",
+    "HealthChecksAsyncClient",
+)
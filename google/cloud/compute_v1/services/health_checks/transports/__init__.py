@@ -24,7 +24,19 @@ from .rest import HealthChecksRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[HealthChecksTransport]]
 _transport_registry["rest"] = HealthChecksRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "HealthChecksAsyncRestTransport":
+        from .rest_asyncio import HealthChecksAsyncRestTransport
+
+        return HealthChecksAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "HealthChecksTransport",
     "HealthChecksRestTransport",
+    "HealthChecksAsyncRestTransport",
 )
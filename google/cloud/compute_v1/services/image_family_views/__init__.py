@@ -15,4 +15,18 @@
 #
 from .client import ImageFamilyViewsClient
 
-__all__ = ("ImageFamilyViewsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ImageFamilyViewsAsyncClient":
+        from .async_client import ImageFamilyViewsAsyncClient
+
+        return ImageFamilyViewsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ImageFamilyViewsClient",
+    "ImageFamilyViewsAsyncClient",
+)
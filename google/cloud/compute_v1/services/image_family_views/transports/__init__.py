@@ -24,7 +24,19 @@ from .rest import ImageFamilyViewsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ImageFamilyViewsTransport]]
 _transport_registry["rest"] = ImageFamilyViewsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ImageFamilyViewsAsyncRestTransport":
+        from .rest_asyncio import ImageFamilyViewsAsyncRestTransport
+
+        return ImageFamilyViewsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ImageFamilyViewsTransport",
     "ImageFamilyViewsRestTransport",
+    "ImageFamilyViewsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import ImagesClient
 
-__all__ = ("ImagesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ImagesAsyncClient":
+        from .async_client import ImagesAsyncClient
+
+        return ImagesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ImagesClient",
+    "ImagesAsyncClient",
+)
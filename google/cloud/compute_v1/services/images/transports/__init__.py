@@ -24,7 +24,19 @@ from .rest import ImagesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ImagesTransport]]
 _transport_registry["rest"] = ImagesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ImagesAsyncRestTransport":
+        from .rest_asyncio import ImagesAsyncRestTransport
+
+        return ImagesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ImagesTransport",
     "ImagesRestTransport",
+    "ImagesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import InstanceGroupManagersClient
 
-__all__ = ("InstanceGroupManagersClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InstanceGroupManagersAsyncClient":
+        from .async_client import InstanceGroupManagersAsyncClient
+
+        return InstanceGroupManagersAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InstanceGroupManagersClient",
+    "InstanceGroupManagersAsyncClient",
+)
@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,13 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.instance_group_managers import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _scatter
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import InstanceGroupManagersTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import InstanceGroupManagersRestTransport
@@ -289,7 +296,12 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, InstanceGroupManagersTransport, None] = None,
+        transport: Union[
+            str,
+            InstanceGroupManagersTransport,
+            Callable[..., InstanceGroupManagersTransport],
+            None,
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -301,9 +313,13 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, InstanceGroupManagersTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, InstanceGroupManagersTransport, Callable[..., InstanceGroupManagersTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the InstanceGroupManagersTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -320,6 +336,22 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -331,7 +363,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -345,6 +377,11 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -360,6 +397,26 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -371,8 +428,27 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[InstanceGroupManagersTransport],
+                Callable[..., InstanceGroupManagersTransport],
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -381,6 +457,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def abandon_instances_unary(
@@ -394,7 +471,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_abandon_instances_request_resource: compute.InstanceGroupManagersAbandonInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Flags the specified instances to be removed from the
@@ -515,14 +592,105 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def abandon_instances(
+        self,
+        request: Union[
+            compute.AbandonInstancesInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_abandon_instances_request_resource: compute.InstanceGroupManagersAbandonInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Flags the specified instances to be removed from the
+        managed instance group. Abandoning an instance does not
+        delete the instance, but it does remove the instance
+        from any target pools that are applied by the managed
+        instance group. This method reduces the targetSize of
+        the managed instance group by the number of instances
+        that you abandon. This operation is marked as DONE when
+        the action is scheduled even if the instances have not
+        yet been removed from the group. You must separately
+        verify the status of the abandoning action with the
+        listmanagedinstances method. If the group is part of a
+        backend service that has enabled connection draining, it
+        can take up to 60 seconds after the connection draining
+        duration has elapsed before the VM instance is removed
+        or deleted. You can specify a maximum of 1000 instances
+        with this method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AbandonInstancesInstanceGroupManagerRequest, dict]):
+                The request object. Messages
+                A request message for
+                InstanceGroupManagers.AbandonInstances. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_abandon_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersAbandonInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_abandon_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.abandon_instances_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_abandon_instances_request_resource=instance_group_managers_abandon_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def aggregated_list(
         self,
         request: Union[compute.AggregatedListInstanceGroupManagersRequest, dict] = None,
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        parallel: int = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves the list of managed instance groups and
         groups them by zone.
@@ -542,6 +710,38 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            parallel (int): If set, list the zones and regions named by
+                the first page with up to this many concurrent ``list``
+                requests instead of requesting the following pages, and
+                yield each zone or region as a page of its own once it is
+                complete, in no particular order. ``retry``, ``timeout``,
+                ``metadata``, ``prefetch`` and ``page_sizer`` apply to the
+                ``list`` requests of each zone and region. Cannot be
+                combined with ``views`` or ``fields``.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.AggregatedListPager:
@@ -560,6 +760,33 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.AggregatedListInstanceGroupManagersRequest
+            )
+
+        if parallel is not None:
+            if parallel < 1:
+                raise ValueError("The `parallel` argument must be at least 1.")
+            if views or fields is not None:
+                raise ValueError(
+                    "The `parallel` argument cannot be combined with "
+                    "`views` or `fields`."
+                )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.AggregatedListInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -571,17 +798,54 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             if project is not None:
                 request.project = project
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.aggregated_list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        scatter = None
+        if parallel is not None:
+            # List the zones and regions concurrently after the first page.
+            scatter = _scatter.scatter(
+                self._transport,
+                "instance_group_managers",
+                parallel,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                prefetch=prefetch,
+                page_sizer=page_sizer,
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.AggregatedListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+            scatter=scatter,
         )
 
         # Done; return the response.
@@ -598,7 +862,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_apply_updates_request_resource: compute.InstanceGroupManagersApplyUpdatesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Applies changes to selected instances on the managed
@@ -712,6 +976,78 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def apply_updates_to_instances(
+        self,
+        request: Union[
+            compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_apply_updates_request_resource: compute.InstanceGroupManagersApplyUpdatesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Applies changes to selected instances on the managed
+        instance group. This method can be used to apply new
+        overrides and/or new versions.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ApplyUpdatesToInstancesInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.ApplyUpdatesToInstances. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+                Should conform to RFC1035.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group, should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_apply_updates_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersApplyUpdatesRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_apply_updates_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.apply_updates_to_instances_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_apply_updates_request_resource=instance_group_managers_apply_updates_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def create_instances_unary(
         self,
         request: Union[compute.CreateInstancesInstanceGroupManagerRequest, dict] = None,
@@ -721,7 +1057,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_create_instances_request_resource: compute.InstanceGroupManagersCreateInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates instances with per-instance configs in this
@@ -834,6 +1170,81 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def create_instances(
+        self,
+        request: Union[compute.CreateInstancesInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_create_instances_request_resource: compute.InstanceGroupManagersCreateInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates instances with per-instance configs in this
+        managed instance group. Instances are created using the
+        current instance template. The create instances
+        operation is marked DONE if the createInstances request
+        is successful. The underlying actions take additional
+        time. You must separately verify the status of the
+        creating or actions with the listmanagedinstances
+        method.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.CreateInstancesInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.CreateInstances. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located. It
+                should conform to RFC1035.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_create_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersCreateInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_create_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.create_instances_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_create_instances_request_resource=instance_group_managers_create_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_unary(
         self,
         request: Union[compute.DeleteInstanceGroupManagerRequest, dict] = None,
@@ -842,7 +1253,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         zone: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes the specified managed instance group and all
@@ -934,39 +1345,27 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
-    def delete_instances_unary(
+    def delete(
         self,
-        request: Union[compute.DeleteInstancesInstanceGroupManagerRequest, dict] = None,
+        request: Union[compute.DeleteInstanceGroupManagerRequest, dict] = None,
         *,
         project: str = None,
         zone: str = None,
         instance_group_manager: str = None,
-        instance_group_managers_delete_instances_request_resource: compute.InstanceGroupManagersDeleteInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Flags the specified instances in the managed instance
-        group for immediate deletion. The instances are also
-        removed from any target pools of which they were a
-        member. This method reduces the targetSize of the
-        managed instance group by the number of instances that
-        you delete. This operation is marked as DONE when the
-        action is scheduled even if the instances are still
-        being deleted. You must separately verify the status of
-        the deleting action with the listmanagedinstances
-        method. If the group is part of a backend service that
-        has enabled connection draining, it can take up to 60
-        seconds after the connection draining duration has
-        elapsed before the VM instance is removed or deleted.
-        You can specify a maximum of 1000 instances with this
-        method per request.
+    ) -> operations.OperationFuture:
+        r"""Deletes the specified managed instance group and all
+        of the instances in that group. Note that the instance
+        group must not belong to a backend service. Read
+        Deleting an instance group for more information.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.DeleteInstancesInstanceGroupManagerRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.DeleteInstanceGroupManagerRequest, dict]):
                 The request object. A request message for
-                InstanceGroupManagers.DeleteInstances. See the method
-                description for details.
+                InstanceGroupManagers.Delete. See the method description
+                for details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -981,16 +1380,11 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 should not be set.
             instance_group_manager (str):
                 The name of the managed instance
-                group.
+                group to delete.
 
                 This corresponds to the ``instance_group_manager`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
-            instance_group_managers_delete_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersDeleteInstancesRequest):
-                The body resource for this request
-                This corresponds to the ``instance_group_managers_delete_instances_request_resource`` field
-                on the ``request`` instance; if ``request`` is provided, this
-                should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
@@ -998,12 +1392,92 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 sent along with the request as metadata.
 
         Returns:
-            google.cloud.compute_v1.types.Operation:
-                Represents an Operation resource. Google Compute Engine
-                has three Operation resources: \*
-                [Global](/compute/docs/reference/rest/v1/globalOperations)
-                \*
-                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def delete_instances_unary(
+        self,
+        request: Union[compute.DeleteInstancesInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_delete_instances_request_resource: compute.InstanceGroupManagersDeleteInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Flags the specified instances in the managed instance
+        group for immediate deletion. The instances are also
+        removed from any target pools of which they were a
+        member. This method reduces the targetSize of the
+        managed instance group by the number of instances that
+        you delete. This operation is marked as DONE when the
+        action is scheduled even if the instances are still
+        being deleted. You must separately verify the status of
+        the deleting action with the listmanagedinstances
+        method. If the group is part of a backend service that
+        has enabled connection draining, it can take up to 60
+        seconds after the connection draining duration has
+        elapsed before the VM instance is removed or deleted.
+        You can specify a maximum of 1000 instances with this
+        method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteInstancesInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.DeleteInstances. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_delete_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersDeleteInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_delete_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
                 \*
                 [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
                 You can use an operation resource to manage asynchronous
@@ -1062,6 +1536,87 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def delete_instances(
+        self,
+        request: Union[compute.DeleteInstancesInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_delete_instances_request_resource: compute.InstanceGroupManagersDeleteInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Flags the specified instances in the managed instance
+        group for immediate deletion. The instances are also
+        removed from any target pools of which they were a
+        member. This method reduces the targetSize of the
+        managed instance group by the number of instances that
+        you delete. This operation is marked as DONE when the
+        action is scheduled even if the instances are still
+        being deleted. You must separately verify the status of
+        the deleting action with the listmanagedinstances
+        method. If the group is part of a backend service that
+        has enabled connection draining, it can take up to 60
+        seconds after the connection draining duration has
+        elapsed before the VM instance is removed or deleted.
+        You can specify a maximum of 1000 instances with this
+        method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteInstancesInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.DeleteInstances. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_delete_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersDeleteInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_delete_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_instances_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_delete_instances_request_resource=instance_group_managers_delete_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_per_instance_configs_unary(
         self,
         request: Union[
@@ -1073,7 +1628,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_delete_per_instance_configs_req_resource: compute.InstanceGroupManagersDeletePerInstanceConfigsReq = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes selected per-instance configs for the managed
@@ -1189,6 +1744,77 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def delete_per_instance_configs(
+        self,
+        request: Union[
+            compute.DeletePerInstanceConfigsInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_delete_per_instance_configs_req_resource: compute.InstanceGroupManagersDeletePerInstanceConfigsReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes selected per-instance configs for the managed
+        instance group.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeletePerInstanceConfigsInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.DeletePerInstanceConfigs. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located. It
+                should conform to RFC1035.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_delete_per_instance_configs_req_resource (google.cloud.compute_v1.types.InstanceGroupManagersDeletePerInstanceConfigsReq):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_delete_per_instance_configs_req_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_per_instance_configs_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_delete_per_instance_configs_req_resource=instance_group_managers_delete_per_instance_configs_req_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetInstanceGroupManagerRequest, dict] = None,
@@ -1197,8 +1823,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         zone: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.InstanceGroupManager:
         r"""Returns all of the details about the specified
         managed instance group. Gets a list of available managed
@@ -1233,6 +1860,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.InstanceGroupManager:
@@ -1276,6 +1907,10 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -1290,7 +1925,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         zone: str = None,
         instance_group_manager_resource: compute.InstanceGroupManager = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates a managed instance group using the
@@ -1389,6 +2024,74 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def insert(
+        self,
+        request: Union[compute.InsertInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager_resource: compute.InstanceGroupManager = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates a managed instance group using the
+        information that you specify in the request. After the
+        group is created, instances in the group are created
+        using the specified instance template. This operation is
+        marked as DONE when the group is created even if the
+        instances in the group have not yet been created. You
+        must separately verify the status of the individual
+        instances with the listmanagedinstances method. A
+        managed instance group can have up to 1000 VM instances
+        per group. Please contact Cloud Support if you need an
+        increase in this limit.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.Insert. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where you want
+                to create the managed instance group.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+                The body resource for this request
+                This corresponds to the ``instance_group_manager_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.insert_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager_resource=instance_group_manager_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def list(
         self,
         request: Union[compute.ListInstanceGroupManagersRequest, dict] = None,
@@ -1396,8 +2099,13 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         project: str = None,
         zone: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Retrieves a list of managed instance groups that are
         contained within the specified project and zone.
@@ -1424,6 +2132,30 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListPager:
@@ -1443,6 +2175,24 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListInstanceGroupManagersRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1456,17 +2206,39 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             if zone is not None:
                 request.zone = zone
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
+        # Send the request.
+        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1480,8 +2252,11 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         zone: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListErrorsPager:
         r"""Lists all errors thrown by actions on instances for a
         given managed instance group. The filter and orderBy
@@ -1519,6 +2294,19 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListErrorsPager:
@@ -1537,6 +2325,24 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListErrorsInstanceGroupManagersRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListErrorsInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1552,17 +2358,29 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_errors]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListErrorsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1578,8 +2396,11 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         zone: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListManagedInstancesPager:
         r"""Lists all of the instances in the managed instance
         group. Each instance in the list has a currentAction,
@@ -1619,6 +2440,19 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListManagedInstancesPager:
@@ -1637,6 +2471,24 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListManagedInstancesInstanceGroupManagersRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListManagedInstancesInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1654,17 +2506,29 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_managed_instances]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListManagedInstancesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1680,8 +2544,11 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         zone: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPerInstanceConfigsPager:
         r"""Lists all of the per-instance configs defined for the
         managed instance group. The orderBy query parameter is
@@ -1717,6 +2584,19 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instance_group_managers.pagers.ListPerInstanceConfigsPager:
@@ -1735,6 +2615,24 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListPerInstanceConfigsInstanceGroupManagersRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListPerInstanceConfigsInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1754,19 +2652,31 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[
             self._transport.list_per_instance_configs
         ]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPerInstanceConfigsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1781,7 +2691,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_manager_resource: compute.InstanceGroupManager = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Updates a managed instance group using the
@@ -1894,6 +2804,86 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def patch(
+        self,
+        request: Union[compute.PatchInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_manager_resource: compute.InstanceGroupManager = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Updates a managed instance group using the
+        information that you specify in the request. This
+        operation is marked as DONE when the group is patched
+        even if the instances in the group are still in the
+        process of being patched. You must separately verify the
+        status of the individual instances with the
+        listManagedInstances method. This method supports PATCH
+        semantics and uses the JSON merge patch format and
+        processing rules. If you update your group to specify a
+        new template or instance configuration, it's possible
+        that your intended specification for each VM in the
+        group is different from the current state of that VM. To
+        learn how to apply an updated configuration to the VMs
+        in a MIG, see Updating instances in a MIG.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.Patch. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where you want
+                to create the managed instance group.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the instance group
+                manager.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+                The body resource for this request
+                This corresponds to the ``instance_group_manager_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.patch_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_manager_resource=instance_group_manager_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def patch_per_instance_configs_unary(
         self,
         request: Union[
@@ -1905,7 +2895,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_patch_per_instance_configs_req_resource: compute.InstanceGroupManagersPatchPerInstanceConfigsReq = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Inserts or patches per-instance configs for the
@@ -2023,6 +3013,79 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def patch_per_instance_configs(
+        self,
+        request: Union[
+            compute.PatchPerInstanceConfigsInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_patch_per_instance_configs_req_resource: compute.InstanceGroupManagersPatchPerInstanceConfigsReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Inserts or patches per-instance configs for the
+        managed instance group. perInstanceConfig.name serves as
+        a key used to distinguish whether to perform insert or
+        patch.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchPerInstanceConfigsInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.PatchPerInstanceConfigs. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located. It
+                should conform to RFC1035.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_patch_per_instance_configs_req_resource (google.cloud.compute_v1.types.InstanceGroupManagersPatchPerInstanceConfigsReq):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_patch_per_instance_configs_req_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.patch_per_instance_configs_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_patch_per_instance_configs_req_resource=instance_group_managers_patch_per_instance_configs_req_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def recreate_instances_unary(
         self,
         request: Union[
@@ -2034,7 +3097,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_recreate_instances_request_resource: compute.InstanceGroupManagersRecreateInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Flags the specified VM instances in the managed
@@ -2109,14 +3172,230 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Create or coerce a protobuf request object.
         # Sanity check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [
-                project,
-                zone,
-                instance_group_manager,
-                instance_group_managers_recreate_instances_request_resource,
-            ]
-        )
+        has_flattened_params = any(
+            [
+                project,
+                zone,
+                instance_group_manager,
+                instance_group_managers_recreate_instances_request_resource,
+            ]
+        )
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.RecreateInstancesInstanceGroupManagerRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(
+            request, compute.RecreateInstancesInstanceGroupManagerRequest
+        ):
+            request = compute.RecreateInstancesInstanceGroupManagerRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if instance_group_manager is not None:
+                request.instance_group_manager = instance_group_manager
+            if instance_group_managers_recreate_instances_request_resource is not None:
+                request.instance_group_managers_recreate_instances_request_resource = (
+                    instance_group_managers_recreate_instances_request_resource
+                )
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._transport._wrapped_methods[self._transport.recreate_instances]
+
+        # Send the request.
+        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    def recreate_instances(
+        self,
+        request: Union[
+            compute.RecreateInstancesInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_recreate_instances_request_resource: compute.InstanceGroupManagersRecreateInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Flags the specified VM instances in the managed
+        instance group to be immediately recreated. Each
+        instance is recreated using the group's current
+        configuration. This operation is marked as DONE when the
+        flag is set even if the instances have not yet been
+        recreated. You must separately verify the status of each
+        instance by checking its currentAction field; for more
+        information, see Checking the status of managed
+        instances. If the group is part of a backend service
+        that has enabled connection draining, it can take up to
+        60 seconds after the connection draining duration has
+        elapsed before the VM instance is removed or deleted.
+        You can specify a maximum of 1000 instances with this
+        method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.RecreateInstancesInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.RecreateInstances. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_recreate_instances_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersRecreateInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_recreate_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.recreate_instances_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_recreate_instances_request_resource=instance_group_managers_recreate_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def resize_unary(
+        self,
+        request: Union[compute.ResizeInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        size: int = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Resizes the managed instance group. If you increase
+        the size, the group creates new instances using the
+        current instance template. If you decrease the size, the
+        group deletes instances. The resize operation is marked
+        DONE when the resize actions are scheduled even if the
+        group has not yet added or deleted any instances. You
+        must separately verify the status of the creating or
+        deleting actions with the listmanagedinstances method.
+        When resizing down, the instance group arbitrarily
+        chooses the order in which VMs are deleted. The group
+        takes into account some VM attributes when making the
+        selection including: + The status of the VM instance. +
+        The health of the VM instance. + The instance template
+        version the VM is based on. + For regional managed
+        instance groups, the location of the VM instance. This
+        list is subject to change. If the group is part of a
+        backend service that has enabled connection draining, it
+        can take up to 60 seconds after the connection draining
+        duration has elapsed before the VM instance is removed
+        or deleted.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ResizeInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.Resize. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            size (int):
+                The number of running instances that
+                the managed instance group should
+                maintain at any given time. The group
+                automatically adds or removes instances
+                to maintain the number of instances
+                specified by this parameter.
+
+                This corresponds to the ``size`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, instance_group_manager, size])
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
@@ -2124,13 +3403,11 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
             )
 
         # Minor optimization to avoid making a copy if the user passes
-        # in a compute.RecreateInstancesInstanceGroupManagerRequest.
+        # in a compute.ResizeInstanceGroupManagerRequest.
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
-        if not isinstance(
-            request, compute.RecreateInstancesInstanceGroupManagerRequest
-        ):
-            request = compute.RecreateInstancesInstanceGroupManagerRequest(request)
+        if not isinstance(request, compute.ResizeInstanceGroupManagerRequest):
+            request = compute.ResizeInstanceGroupManagerRequest(request)
             # If we have keyword arguments corresponding to fields on the
             # request, apply these.
             if project is not None:
@@ -2139,14 +3416,12 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 request.zone = zone
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
-            if instance_group_managers_recreate_instances_request_resource is not None:
-                request.instance_group_managers_recreate_instances_request_resource = (
-                    instance_group_managers_recreate_instances_request_resource
-                )
+            if size is not None:
+                request.size = size
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.recreate_instances]
+        rpc = self._transport._wrapped_methods[self._transport.resize]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
@@ -2154,7 +3429,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
-    def resize_unary(
+    def resize(
         self,
         request: Union[compute.ResizeInstanceGroupManagerRequest, dict] = None,
         *,
@@ -2163,9 +3438,9 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         size: int = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
+    ) -> operations.OperationFuture:
         r"""Resizes the managed instance group. If you increase
         the size, the group creates new instances using the
         current instance template. If you decrease the size, the
@@ -2229,60 +3504,22 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
                 sent along with the request as metadata.
 
         Returns:
-            google.cloud.compute_v1.types.Operation:
-                Represents an Operation resource. Google Compute Engine
-                has three Operation resources: \*
-                [Global](/compute/docs/reference/rest/v1/globalOperations)
-                \*
-                [Regional](/compute/docs/reference/rest/v1/regionOperations)
-                \*
-                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
-                You can use an operation resource to manage asynchronous
-                API requests. For more information, read Handling API
-                responses. Operations can be global, regional or zonal.
-                - For global operations, use the globalOperations
-                resource. - For regional operations, use the
-                regionOperations resource. - For zonal operations, use
-                the zonalOperations resource. For more information, read
-                Global, Regional, and Zonal Resources.
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
 
         """
-        # Create or coerce a protobuf request object.
-        # Sanity check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project, zone, instance_group_manager, size])
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a compute.ResizeInstanceGroupManagerRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, compute.ResizeInstanceGroupManagerRequest):
-            request = compute.ResizeInstanceGroupManagerRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project is not None:
-                request.project = project
-            if zone is not None:
-                request.zone = zone
-            if instance_group_manager is not None:
-                request.instance_group_manager = instance_group_manager
-            if size is not None:
-                request.size = size
-
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.resize]
-
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
-
-        # Done; return the response.
-        return response
+        operation = self.resize_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            size=size,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
 
     def set_instance_template_unary(
         self,
@@ -2295,7 +3532,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_set_instance_template_request_resource: compute.InstanceGroupManagersSetInstanceTemplateRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Specifies the instance template to use when creating
@@ -2409,6 +3646,79 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def set_instance_template(
+        self,
+        request: Union[
+            compute.SetInstanceTemplateInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_set_instance_template_request_resource: compute.InstanceGroupManagersSetInstanceTemplateRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Specifies the instance template to use when creating
+        new instances in this group. The templates for existing
+        instances in the group do not change unless you run
+        recreateInstances, run applyUpdatesToInstances, or set
+        the group's updatePolicy.type to PROACTIVE.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetInstanceTemplateInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.SetInstanceTemplate. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_set_instance_template_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersSetInstanceTemplateRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_set_instance_template_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_instance_template_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_set_instance_template_request_resource=instance_group_managers_set_instance_template_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_target_pools_unary(
         self,
         request: Union[compute.SetTargetPoolsInstanceGroupManagerRequest, dict] = None,
@@ -2418,7 +3728,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_set_target_pools_request_resource: compute.InstanceGroupManagersSetTargetPoolsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Modifies the target pools to which all instances in
@@ -2530,6 +3840,80 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def set_target_pools(
+        self,
+        request: Union[compute.SetTargetPoolsInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_set_target_pools_request_resource: compute.InstanceGroupManagersSetTargetPoolsRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Modifies the target pools to which all instances in
+        this managed instance group are assigned. The target
+        pools automatically apply to all of the instances in the
+        managed instance group. This operation is marked DONE
+        when you make the request even if the instances have not
+        yet been added to their target pools. The change might
+        take some time to apply to all of the instances in the
+        group depending on the size of the group.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetTargetPoolsInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.SetTargetPools. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_set_target_pools_request_resource (google.cloud.compute_v1.types.InstanceGroupManagersSetTargetPoolsRequest):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_set_target_pools_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_target_pools_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_set_target_pools_request_resource=instance_group_managers_set_target_pools_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def update_per_instance_configs_unary(
         self,
         request: Union[
@@ -2541,7 +3925,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         instance_group_manager: str = None,
         instance_group_managers_update_per_instance_configs_req_resource: compute.InstanceGroupManagersUpdatePerInstanceConfigsReq = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Inserts or updates per-instance configs for the
@@ -2659,6 +4043,79 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         # Done; return the response.
         return response
 
+    def update_per_instance_configs(
+        self,
+        request: Union[
+            compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_group_manager: str = None,
+        instance_group_managers_update_per_instance_configs_req_resource: compute.InstanceGroupManagersUpdatePerInstanceConfigsReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Inserts or updates per-instance configs for the
+        managed instance group. perInstanceConfig.name serves as
+        a key used to distinguish whether to perform insert or
+        patch.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdatePerInstanceConfigsInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                InstanceGroupManagers.UpdatePerInstanceConfigs. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone where the
+                managed instance group is located. It
+                should conform to RFC1035.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_managers_update_per_instance_configs_req_resource (google.cloud.compute_v1.types.InstanceGroupManagersUpdatePerInstanceConfigsReq):
+                The body resource for this request
+                This corresponds to the ``instance_group_managers_update_per_instance_configs_req_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.update_per_instance_configs_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_group_manager=instance_group_manager,
+            instance_group_managers_update_per_instance_configs_req_resource=instance_group_managers_update_per_instance_configs_req_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def __enter__(self):
         return self
 
@@ -2673,12 +4130,7 @@ class InstanceGroupManagersClient(metaclass=InstanceGroupManagersClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("InstanceGroupManagersClient",)
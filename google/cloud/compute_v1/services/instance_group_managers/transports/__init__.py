@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[InstanceGroupManagersTransport]]
 _transport_registry["rest"] = InstanceGroupManagersRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InstanceGroupManagersAsyncRestTransport":
+        from .rest_asyncio import InstanceGroupManagersAsyncRestTransport
+
+        return InstanceGroupManagersAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InstanceGroupManagersTransport",
     "InstanceGroupManagersRestTransport",
+    "InstanceGroupManagersAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    InstanceGroupManagersTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import InstanceGroupManagersTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, InstanceGroupManagersRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, InstanceGroupManagersRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AbandonInstances(InstanceGroupManagersRestStub):
@@ -146,6 +174,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AbandonInstancesInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/abandonInstances",
+                    "body": "instance_group_managers_abandon_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AbandonInstancesInstanceGroupManagerRequest,
@@ -189,42 +229,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/abandonInstances",
-                    "body": "instance_group_managers_abandon_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AbandonInstancesInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersAbandonInstancesRequest.to_json(
-                compute.InstanceGroupManagersAbandonInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AbandonInstancesInstanceGroupManagerRequest.to_json(
-                    compute.AbandonInstancesInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -234,7 +240,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -243,9 +249,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AggregatedList(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -261,6 +265,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/instanceGroupManagers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListInstanceGroupManagersRequest,
@@ -268,6 +283,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroupManagerAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -282,39 +299,21 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroupManagerAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/instanceGroupManagers",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListInstanceGroupManagersRequest.to_json(
-                    compute.AggregatedListInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -324,7 +323,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -332,8 +331,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManagerAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManagerAggregatedList, response.content, lazy=views
             )
 
     class _ApplyUpdatesToInstances(InstanceGroupManagersRestStub):
@@ -350,6 +349,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/applyUpdatesToInstances",
+                    "body": "instance_group_managers_apply_updates_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest,
@@ -393,42 +404,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/applyUpdatesToInstances",
-                    "body": "instance_group_managers_apply_updates_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersApplyUpdatesRequest.to_json(
-                compute.InstanceGroupManagersApplyUpdatesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest.to_json(
-                    compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -438,7 +415,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -447,9 +424,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _CreateInstances(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -465,6 +440,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.CreateInstancesInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/createInstances",
+                    "body": "instance_group_managers_create_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.CreateInstancesInstanceGroupManagerRequest,
@@ -507,42 +494,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/createInstances",
-                    "body": "instance_group_managers_create_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.CreateInstancesInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersCreateInstancesRequest.to_json(
-                compute.InstanceGroupManagersCreateInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.CreateInstancesInstanceGroupManagerRequest.to_json(
-                    compute.CreateInstancesInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -552,7 +505,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -561,9 +514,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -579,6 +530,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteInstanceGroupManagerRequest,
@@ -621,31 +583,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteInstanceGroupManagerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteInstanceGroupManagerRequest.to_json(
-                    compute.DeleteInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -655,7 +594,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -663,9 +602,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeleteInstances(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -681,6 +618,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteInstancesInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/deleteInstances",
+                    "body": "instance_group_managers_delete_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteInstancesInstanceGroupManagerRequest,
@@ -723,42 +672,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/deleteInstances",
-                    "body": "instance_group_managers_delete_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.DeleteInstancesInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersDeleteInstancesRequest.to_json(
-                compute.InstanceGroupManagersDeleteInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteInstancesInstanceGroupManagerRequest.to_json(
-                    compute.DeleteInstancesInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -768,7 +683,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -777,9 +692,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeletePerInstanceConfigs(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -795,6 +708,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeletePerInstanceConfigsInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/deletePerInstanceConfigs",
+                    "body": "instance_group_managers_delete_per_instance_configs_req_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeletePerInstanceConfigsInstanceGroupManagerRequest,
@@ -838,42 +763,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/deletePerInstanceConfigs",
-                    "body": "instance_group_managers_delete_per_instance_configs_req_resource",
-                },
-            ]
-
-            request_kwargs = compute.DeletePerInstanceConfigsInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersDeletePerInstanceConfigsReq.to_json(
-                compute.InstanceGroupManagersDeletePerInstanceConfigsReq(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeletePerInstanceConfigsInstanceGroupManagerRequest.to_json(
-                    compute.DeletePerInstanceConfigsInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -883,7 +774,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -892,9 +783,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -910,6 +799,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetInstanceGroupManagerRequest,
@@ -917,6 +817,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroupManager:
             r"""Call the get method over HTTP.
 
@@ -931,6 +832,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroupManager:
@@ -946,31 +849,10 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}",
-                },
-            ]
-
-            request_kwargs = compute.GetInstanceGroupManagerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetInstanceGroupManagerRequest.to_json(
-                    compute.GetInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -980,7 +862,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -988,8 +870,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManager.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManager, response.content
             )
 
     class _Insert(InstanceGroupManagersRestStub):
@@ -1006,6 +888,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers",
+                    "body": "instance_group_manager_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertInstanceGroupManagerRequest,
@@ -1048,38 +942,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers",
-                    "body": "instance_group_manager_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertInstanceGroupManagerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManager.to_json(
-                compute.InstanceGroupManager(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertInstanceGroupManagerRequest.to_json(
-                    compute.InsertInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1089,7 +953,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1098,9 +962,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1116,6 +978,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListInstanceGroupManagersRequest,
@@ -1123,6 +996,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroupManagerList:
             r"""Call the list method over HTTP.
 
@@ -1137,37 +1012,21 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroupManagerList:
                     [Output Only] A list of managed instance groups.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers",
-                },
-            ]
-
-            request_kwargs = compute.ListInstanceGroupManagersRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListInstanceGroupManagersRequest.to_json(
-                    compute.ListInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -1177,7 +1036,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1185,8 +1044,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManagerList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManagerList, response.content, lazy=views
             )
 
     class _ListErrors(InstanceGroupManagersRestStub):
@@ -1203,6 +1062,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListErrorsInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/listErrors",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListErrorsInstanceGroupManagersRequest,
@@ -1230,33 +1100,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/listErrors",
-                },
-            ]
-
-            request_kwargs = compute.ListErrorsInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListErrorsInstanceGroupManagersRequest.to_json(
-                    compute.ListErrorsInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1266,7 +1111,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1274,8 +1119,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManagersListErrorsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManagersListErrorsResponse, response.content
             )
 
     class _ListManagedInstances(InstanceGroupManagersRestStub):
@@ -1292,6 +1137,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListManagedInstancesInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/listManagedInstances",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListManagedInstancesInstanceGroupManagersRequest,
@@ -1319,33 +1175,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/listManagedInstances",
-                },
-            ]
-
-            request_kwargs = compute.ListManagedInstancesInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListManagedInstancesInstanceGroupManagersRequest.to_json(
-                    compute.ListManagedInstancesInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1355,7 +1186,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1363,8 +1194,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManagersListManagedInstancesResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManagersListManagedInstancesResponse,
+                response.content,
             )
 
     class _ListPerInstanceConfigs(InstanceGroupManagersRestStub):
@@ -1381,6 +1213,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListPerInstanceConfigsInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/listPerInstanceConfigs",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListPerInstanceConfigsInstanceGroupManagersRequest,
@@ -1408,33 +1251,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/listPerInstanceConfigs",
-                },
-            ]
-
-            request_kwargs = compute.ListPerInstanceConfigsInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListPerInstanceConfigsInstanceGroupManagersRequest.to_json(
-                    compute.ListPerInstanceConfigsInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1444,7 +1262,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1452,8 +1270,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManagersListPerInstanceConfigsResp.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManagersListPerInstanceConfigsResp,
+                response.content,
             )
 
     class _Patch(InstanceGroupManagersRestStub):
@@ -1470,6 +1289,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}",
+                    "body": "instance_group_manager_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchInstanceGroupManagerRequest,
@@ -1512,38 +1343,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}",
-                    "body": "instance_group_manager_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchInstanceGroupManagerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManager.to_json(
-                compute.InstanceGroupManager(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchInstanceGroupManagerRequest.to_json(
-                    compute.PatchInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1553,7 +1354,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1562,9 +1363,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _PatchPerInstanceConfigs(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1580,6 +1379,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchPerInstanceConfigsInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/patchPerInstanceConfigs",
+                    "body": "instance_group_managers_patch_per_instance_configs_req_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchPerInstanceConfigsInstanceGroupManagerRequest,
@@ -1623,42 +1434,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/patchPerInstanceConfigs",
-                    "body": "instance_group_managers_patch_per_instance_configs_req_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchPerInstanceConfigsInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersPatchPerInstanceConfigsReq.to_json(
-                compute.InstanceGroupManagersPatchPerInstanceConfigsReq(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchPerInstanceConfigsInstanceGroupManagerRequest.to_json(
-                    compute.PatchPerInstanceConfigsInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1668,7 +1445,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1677,9 +1454,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _RecreateInstances(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1695,6 +1470,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RecreateInstancesInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/recreateInstances",
+                    "body": "instance_group_managers_recreate_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RecreateInstancesInstanceGroupManagerRequest,
@@ -1737,42 +1524,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/recreateInstances",
-                    "body": "instance_group_managers_recreate_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RecreateInstancesInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersRecreateInstancesRequest.to_json(
-                compute.InstanceGroupManagersRecreateInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RecreateInstancesInstanceGroupManagerRequest.to_json(
-                    compute.RecreateInstancesInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1782,7 +1535,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1791,9 +1544,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Resize(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1811,6 +1562,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ResizeInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/resize",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ResizeInstanceGroupManagerRequest,
@@ -1853,31 +1615,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/resize",
-                },
-            ]
-
-            request_kwargs = compute.ResizeInstanceGroupManagerRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ResizeInstanceGroupManagerRequest.to_json(
-                    compute.ResizeInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1887,7 +1626,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1895,9 +1634,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetInstanceTemplate(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1913,6 +1650,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetInstanceTemplateInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/setInstanceTemplate",
+                    "body": "instance_group_managers_set_instance_template_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetInstanceTemplateInstanceGroupManagerRequest,
@@ -1955,42 +1704,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/setInstanceTemplate",
-                    "body": "instance_group_managers_set_instance_template_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetInstanceTemplateInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersSetInstanceTemplateRequest.to_json(
-                compute.InstanceGroupManagersSetInstanceTemplateRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetInstanceTemplateInstanceGroupManagerRequest.to_json(
-                    compute.SetInstanceTemplateInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2000,7 +1715,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2009,9 +1724,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetTargetPools(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -2027,6 +1740,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetTargetPoolsInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/setTargetPools",
+                    "body": "instance_group_managers_set_target_pools_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetTargetPoolsInstanceGroupManagerRequest,
@@ -2069,42 +1794,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/setTargetPools",
-                    "body": "instance_group_managers_set_target_pools_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetTargetPoolsInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersSetTargetPoolsRequest.to_json(
-                compute.InstanceGroupManagersSetTargetPoolsRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetTargetPoolsInstanceGroupManagerRequest.to_json(
-                    compute.SetTargetPoolsInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2114,7 +1805,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2123,9 +1814,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _UpdatePerInstanceConfigs(InstanceGroupManagersRestStub):
         def __hash__(self):
@@ -2141,6 +1830,18 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/updatePerInstanceConfigs",
+                    "body": "instance_group_managers_update_per_instance_configs_req_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest,
@@ -2184,42 +1885,8 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroupManagers/{instance_group_manager}/updatePerInstanceConfigs",
-                    "body": "instance_group_managers_update_per_instance_configs_req_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManagersUpdatePerInstanceConfigsReq.to_json(
-                compute.InstanceGroupManagersUpdatePerInstanceConfigsReq(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest.to_json(
-                    compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2229,7 +1896,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2238,9 +1905,7 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def abandon_instances(
@@ -2248,9 +1913,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.AbandonInstancesInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("abandon_instances")
+        stub = self._stubs.get("abandon_instances")
         if not stub:
-            stub = self._STUBS["abandon_instances"] = self._AbandonInstances(
+            stub = self._stubs["abandon_instances"] = self._AbandonInstances(
                 self._session, self._host
             )
 
@@ -2263,9 +1928,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
         [compute.AggregatedListInstanceGroupManagersRequest],
         compute.InstanceGroupManagerAggregatedList,
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -2277,9 +1942,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.ApplyUpdatesToInstancesInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("apply_updates_to_instances")
+        stub = self._stubs.get("apply_updates_to_instances")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "apply_updates_to_instances"
             ] = self._ApplyUpdatesToInstances(self._session, self._host)
 
@@ -2291,9 +1956,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.CreateInstancesInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("create_instances")
+        stub = self._stubs.get("create_instances")
         if not stub:
-            stub = self._STUBS["create_instances"] = self._CreateInstances(
+            stub = self._stubs["create_instances"] = self._CreateInstances(
                 self._session, self._host
             )
 
@@ -2303,9 +1968,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -2315,9 +1980,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.DeleteInstancesInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("delete_instances")
+        stub = self._stubs.get("delete_instances")
         if not stub:
-            stub = self._STUBS["delete_instances"] = self._DeleteInstances(
+            stub = self._stubs["delete_instances"] = self._DeleteInstances(
                 self._session, self._host
             )
 
@@ -2329,9 +1994,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.DeletePerInstanceConfigsInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("delete_per_instance_configs")
+        stub = self._stubs.get("delete_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "delete_per_instance_configs"
             ] = self._DeletePerInstanceConfigs(self._session, self._host)
 
@@ -2343,9 +2008,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.GetInstanceGroupManagerRequest], compute.InstanceGroupManager
     ]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -2353,9 +2018,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -2365,9 +2030,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.ListInstanceGroupManagersRequest], compute.InstanceGroupManagerList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -2378,9 +2043,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
         [compute.ListErrorsInstanceGroupManagersRequest],
         compute.InstanceGroupManagersListErrorsResponse,
     ]:
-        stub = self._STUBS.get("list_errors")
+        stub = self._stubs.get("list_errors")
         if not stub:
-            stub = self._STUBS["list_errors"] = self._ListErrors(
+            stub = self._stubs["list_errors"] = self._ListErrors(
                 self._session, self._host
             )
 
@@ -2393,9 +2058,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
         [compute.ListManagedInstancesInstanceGroupManagersRequest],
         compute.InstanceGroupManagersListManagedInstancesResponse,
     ]:
-        stub = self._STUBS.get("list_managed_instances")
+        stub = self._stubs.get("list_managed_instances")
         if not stub:
-            stub = self._STUBS["list_managed_instances"] = self._ListManagedInstances(
+            stub = self._stubs["list_managed_instances"] = self._ListManagedInstances(
                 self._session, self._host
             )
 
@@ -2408,9 +2073,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
         [compute.ListPerInstanceConfigsInstanceGroupManagersRequest],
         compute.InstanceGroupManagersListPerInstanceConfigsResp,
     ]:
-        stub = self._STUBS.get("list_per_instance_configs")
+        stub = self._stubs.get("list_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "list_per_instance_configs"
             ] = self._ListPerInstanceConfigs(self._session, self._host)
 
@@ -2420,9 +2085,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     def patch(
         self,
     ) -> Callable[[compute.PatchInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -2432,9 +2097,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.PatchPerInstanceConfigsInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("patch_per_instance_configs")
+        stub = self._stubs.get("patch_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "patch_per_instance_configs"
             ] = self._PatchPerInstanceConfigs(self._session, self._host)
 
@@ -2446,9 +2111,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.RecreateInstancesInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("recreate_instances")
+        stub = self._stubs.get("recreate_instances")
         if not stub:
-            stub = self._STUBS["recreate_instances"] = self._RecreateInstances(
+            stub = self._stubs["recreate_instances"] = self._RecreateInstances(
                 self._session, self._host
             )
 
@@ -2458,9 +2123,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     def resize(
         self,
     ) -> Callable[[compute.ResizeInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("resize")
+        stub = self._stubs.get("resize")
         if not stub:
-            stub = self._STUBS["resize"] = self._Resize(self._session, self._host)
+            stub = self._stubs["resize"] = self._Resize(self._session, self._host)
 
         return stub
 
@@ -2470,9 +2135,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.SetInstanceTemplateInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("set_instance_template")
+        stub = self._stubs.get("set_instance_template")
         if not stub:
-            stub = self._STUBS["set_instance_template"] = self._SetInstanceTemplate(
+            stub = self._stubs["set_instance_template"] = self._SetInstanceTemplate(
                 self._session, self._host
             )
 
@@ -2484,9 +2149,9 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.SetTargetPoolsInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("set_target_pools")
+        stub = self._stubs.get("set_target_pools")
         if not stub:
-            stub = self._STUBS["set_target_pools"] = self._SetTargetPools(
+            stub = self._stubs["set_target_pools"] = self._SetTargetPools(
                 self._session, self._host
             )
 
@@ -2498,16 +2163,17 @@ class InstanceGroupManagersRestTransport(InstanceGroupManagersTransport):
     ) -> Callable[
         [compute.UpdatePerInstanceConfigsInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("update_per_instance_configs")
+        stub = self._stubs.get("update_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "update_per_instance_configs"
             ] = self._UpdatePerInstanceConfigs(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("InstanceGroupManagersRestTransport",)
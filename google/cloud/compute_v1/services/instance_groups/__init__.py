@@ -15,4 +15,18 @@
 #
 from .client import InstanceGroupsClient
 
-__all__ = ("InstanceGroupsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InstanceGroupsAsyncClient":
+        from .async_client import InstanceGroupsAsyncClient
+
+        return InstanceGroupsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InstanceGroupsClient",
+    "InstanceGroupsAsyncClient",
+)
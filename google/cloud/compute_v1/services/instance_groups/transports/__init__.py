@@ -24,7 +24,19 @@ from .rest import InstanceGroupsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[InstanceGroupsTransport]]
 _transport_registry["rest"] = InstanceGroupsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InstanceGroupsAsyncRestTransport":
+        from .rest_asyncio import InstanceGroupsAsyncRestTransport
+
+        return InstanceGroupsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InstanceGroupsTransport",
     "InstanceGroupsRestTransport",
+    "InstanceGroupsAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    InstanceGroupsTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import InstanceGroupsTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, InstanceGroupsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, InstanceGroupsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddInstances(InstanceGroupsRestStub):
@@ -146,6 +174,18 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddInstancesInstanceGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/addInstances",
+                    "body": "instance_groups_add_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddInstancesInstanceGroupRequest,
@@ -188,38 +228,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/addInstances",
-                    "body": "instance_groups_add_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddInstancesInstanceGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupsAddInstancesRequest.to_json(
-                compute.InstanceGroupsAddInstancesRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddInstancesInstanceGroupRequest.to_json(
-                    compute.AddInstancesInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -229,7 +239,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -238,9 +248,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AggregatedList(InstanceGroupsRestStub):
         def __hash__(self):
@@ -256,6 +264,17 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListInstanceGroupsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/instanceGroups",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListInstanceGroupsRequest,
@@ -263,6 +282,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroupAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -277,39 +298,21 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroupAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/instanceGroups",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListInstanceGroupsRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListInstanceGroupsRequest.to_json(
-                    compute.AggregatedListInstanceGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -319,7 +322,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -327,8 +330,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupAggregatedList, response.content, lazy=views
             )
 
     class _Delete(InstanceGroupsRestStub):
@@ -345,6 +348,17 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteInstanceGroupRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteInstanceGroupRequest,
@@ -387,31 +401,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteInstanceGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteInstanceGroupRequest.to_json(
-                    compute.DeleteInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -421,7 +412,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -429,9 +420,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(InstanceGroupsRestStub):
         def __hash__(self):
@@ -447,6 +436,17 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetInstanceGroupRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetInstanceGroupRequest,
@@ -454,6 +454,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroup:
             r"""Call the get method over HTTP.
 
@@ -468,6 +469,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroup:
@@ -488,29 +491,10 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}",
-                },
-            ]
-
-            request_kwargs = compute.GetInstanceGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetInstanceGroupRequest.to_json(
-                    compute.GetInstanceGroupRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -520,7 +504,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -528,9 +512,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroup.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.InstanceGroup, response.content)
 
     class _Insert(InstanceGroupsRestStub):
         def __hash__(self):
@@ -546,6 +528,18 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertInstanceGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups",
+                    "body": "instance_group_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertInstanceGroupRequest,
@@ -588,38 +582,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups",
-                    "body": "instance_group_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertInstanceGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroup.to_json(
-                compute.InstanceGroup(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertInstanceGroupRequest.to_json(
-                    compute.InsertInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -629,7 +593,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -638,9 +602,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(InstanceGroupsRestStub):
         def __hash__(self):
@@ -656,6 +618,17 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListInstanceGroupsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListInstanceGroupsRequest,
@@ -663,6 +636,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroupList:
             r"""Call the list method over HTTP.
 
@@ -677,37 +652,21 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroupList:
                     A list of InstanceGroup resources.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups",
-                },
-            ]
-
-            request_kwargs = compute.ListInstanceGroupsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListInstanceGroupsRequest.to_json(
-                    compute.ListInstanceGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -717,7 +676,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -725,8 +684,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupList, response.content, lazy=views
             )
 
     class _ListInstances(InstanceGroupsRestStub):
@@ -743,6 +702,18 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListInstancesInstanceGroupsRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/listInstances",
+                    "body": "instance_groups_list_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListInstancesInstanceGroupsRequest,
@@ -770,38 +741,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/listInstances",
-                    "body": "instance_groups_list_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ListInstancesInstanceGroupsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupsListInstancesRequest.to_json(
-                compute.InstanceGroupsListInstancesRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListInstancesInstanceGroupsRequest.to_json(
-                    compute.ListInstancesInstanceGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -811,7 +752,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -820,8 +761,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupsListInstances.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupsListInstances, response.content
             )
 
     class _RemoveInstances(InstanceGroupsRestStub):
@@ -838,6 +779,18 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveInstancesInstanceGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/removeInstances",
+                    "body": "instance_groups_remove_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveInstancesInstanceGroupRequest,
@@ -880,42 +833,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/removeInstances",
-                    "body": "instance_groups_remove_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RemoveInstancesInstanceGroupRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupsRemoveInstancesRequest.to_json(
-                compute.InstanceGroupsRemoveInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveInstancesInstanceGroupRequest.to_json(
-                    compute.RemoveInstancesInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -925,7 +844,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -934,9 +853,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetNamedPorts(InstanceGroupsRestStub):
         def __hash__(self):
@@ -952,6 +869,18 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetNamedPortsInstanceGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/setNamedPorts",
+                    "body": "instance_groups_set_named_ports_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetNamedPortsInstanceGroupRequest,
@@ -994,38 +923,8 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instanceGroups/{instance_group}/setNamedPorts",
-                    "body": "instance_groups_set_named_ports_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetNamedPortsInstanceGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupsSetNamedPortsRequest.to_json(
-                compute.InstanceGroupsSetNamedPortsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetNamedPortsInstanceGroupRequest.to_json(
-                    compute.SetNamedPortsInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1035,7 +934,7 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1044,17 +943,15 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def add_instances(
         self,
     ) -> Callable[[compute.AddInstancesInstanceGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("add_instances")
+        stub = self._stubs.get("add_instances")
         if not stub:
-            stub = self._STUBS["add_instances"] = self._AddInstances(
+            stub = self._stubs["add_instances"] = self._AddInstances(
                 self._session, self._host
             )
 
@@ -1067,9 +964,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
         [compute.AggregatedListInstanceGroupsRequest],
         compute.InstanceGroupAggregatedList,
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -1079,17 +976,17 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteInstanceGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
     @property
     def get(self) -> Callable[[compute.GetInstanceGroupRequest], compute.InstanceGroup]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1097,9 +994,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertInstanceGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1107,9 +1004,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     def list(
         self,
     ) -> Callable[[compute.ListInstanceGroupsRequest], compute.InstanceGroupList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1120,9 +1017,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
         [compute.ListInstancesInstanceGroupsRequest],
         compute.InstanceGroupsListInstances,
     ]:
-        stub = self._STUBS.get("list_instances")
+        stub = self._stubs.get("list_instances")
         if not stub:
-            stub = self._STUBS["list_instances"] = self._ListInstances(
+            stub = self._stubs["list_instances"] = self._ListInstances(
                 self._session, self._host
             )
 
@@ -1132,9 +1029,9 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     def remove_instances(
         self,
     ) -> Callable[[compute.RemoveInstancesInstanceGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_instances")
+        stub = self._stubs.get("remove_instances")
         if not stub:
-            stub = self._STUBS["remove_instances"] = self._RemoveInstances(
+            stub = self._stubs["remove_instances"] = self._RemoveInstances(
                 self._session, self._host
             )
 
@@ -1144,16 +1041,17 @@ class InstanceGroupsRestTransport(InstanceGroupsTransport):
     def set_named_ports(
         self,
     ) -> Callable[[compute.SetNamedPortsInstanceGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("set_named_ports")
+        stub = self._stubs.get("set_named_ports")
         if not stub:
-            stub = self._STUBS["set_named_ports"] = self._SetNamedPorts(
+            stub = self._stubs["set_named_ports"] = self._SetNamedPorts(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("InstanceGroupsRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import InstanceTemplatesClient
 
-__all__ = ("InstanceTemplatesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InstanceTemplatesAsyncClient":
+        from .async_client import InstanceTemplatesAsyncClient
+
+        return InstanceTemplatesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InstanceTemplatesClient",
+    "InstanceTemplatesAsyncClient",
+)
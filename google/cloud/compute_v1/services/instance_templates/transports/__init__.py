@@ -24,7 +24,19 @@ from .rest import InstanceTemplatesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[InstanceTemplatesTransport]]
 _transport_registry["rest"] = InstanceTemplatesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InstanceTemplatesAsyncRestTransport":
+        from .rest_asyncio import InstanceTemplatesAsyncRestTransport
+
+        return InstanceTemplatesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InstanceTemplatesTransport",
     "InstanceTemplatesRestTransport",
+    "InstanceTemplatesAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    InstanceTemplatesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import InstanceTemplatesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, InstanceTemplatesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, InstanceTemplatesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _Delete(InstanceTemplatesRestStub):
@@ -146,6 +174,17 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteInstanceTemplateRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{instance_template}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteInstanceTemplateRequest,
@@ -188,31 +227,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{instance_template}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteInstanceTemplateRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteInstanceTemplateRequest.to_json(
-                    compute.DeleteInstanceTemplateRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -222,7 +238,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -230,9 +246,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(InstanceTemplatesRestStub):
         def __hash__(self):
@@ -248,6 +262,17 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetInstanceTemplateRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{instance_template}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetInstanceTemplateRequest,
@@ -255,6 +280,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.InstanceTemplate:
             r"""Call the get method over HTTP.
 
@@ -269,6 +295,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceTemplate:
@@ -280,31 +308,10 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{instance_template}",
-                },
-            ]
-
-            request_kwargs = compute.GetInstanceTemplateRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetInstanceTemplateRequest.to_json(
-                    compute.GetInstanceTemplateRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -314,7 +321,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -322,8 +329,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceTemplate.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceTemplate, response.content
             )
 
     class _GetIamPolicy(InstanceTemplatesRestStub):
@@ -340,6 +347,17 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetIamPolicyInstanceTemplateRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{resource}/getIamPolicy",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetIamPolicyInstanceTemplateRequest,
@@ -407,33 +425,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{resource}/getIamPolicy",
-                },
-            ]
-
-            request_kwargs = compute.GetIamPolicyInstanceTemplateRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetIamPolicyInstanceTemplateRequest.to_json(
-                    compute.GetIamPolicyInstanceTemplateRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -443,7 +436,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -451,9 +444,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _Insert(InstanceTemplatesRestStub):
         def __hash__(self):
@@ -469,6 +460,18 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertInstanceTemplateRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates",
+                    "body": "instance_template_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertInstanceTemplateRequest,
@@ -511,38 +514,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates",
-                    "body": "instance_template_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertInstanceTemplateRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceTemplate.to_json(
-                compute.InstanceTemplate(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertInstanceTemplateRequest.to_json(
-                    compute.InsertInstanceTemplateRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -552,7 +525,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -561,9 +534,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(InstanceTemplatesRestStub):
         def __hash__(self):
@@ -579,6 +550,17 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListInstanceTemplatesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListInstanceTemplatesRequest,
@@ -586,6 +568,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceTemplateList:
             r"""Call the list method over HTTP.
 
@@ -600,37 +584,21 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceTemplateList:
                     A list of instance templates.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates",
-                },
-            ]
-
-            request_kwargs = compute.ListInstanceTemplatesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListInstanceTemplatesRequest.to_json(
-                    compute.ListInstanceTemplatesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -640,7 +608,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -648,8 +616,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceTemplateList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceTemplateList, response.content, lazy=views
             )
 
     class _SetIamPolicy(InstanceTemplatesRestStub):
@@ -666,6 +634,18 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetIamPolicyInstanceTemplateRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{resource}/setIamPolicy",
+                    "body": "global_set_policy_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetIamPolicyInstanceTemplateRequest,
@@ -733,40 +713,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{resource}/setIamPolicy",
-                    "body": "global_set_policy_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetIamPolicyInstanceTemplateRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.GlobalSetPolicyRequest.to_json(
-                compute.GlobalSetPolicyRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetIamPolicyInstanceTemplateRequest.to_json(
-                    compute.SetIamPolicyInstanceTemplateRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -776,7 +724,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -785,9 +733,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _TestIamPermissions(InstanceTemplatesRestStub):
         def __hash__(self):
@@ -803,6 +749,18 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.TestIamPermissionsInstanceTemplateRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsInstanceTemplateRequest,
@@ -830,40 +788,8 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/instanceTemplates/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.TestIamPermissionsInstanceTemplateRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TestPermissionsRequest.to_json(
-                compute.TestPermissionsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.TestIamPermissionsInstanceTemplateRequest.to_json(
-                    compute.TestIamPermissionsInstanceTemplateRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -873,7 +799,7 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -882,17 +808,17 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TestPermissionsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TestPermissionsResponse, response.content
             )
 
     @property
     def delete(
         self,
     ) -> Callable[[compute.DeleteInstanceTemplateRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -900,9 +826,9 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetInstanceTemplateRequest], compute.InstanceTemplate]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -910,9 +836,9 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
     def get_iam_policy(
         self,
     ) -> Callable[[compute.GetIamPolicyInstanceTemplateRequest], compute.Policy]:
-        stub = self._STUBS.get("get_iam_policy")
+        stub = self._stubs.get("get_iam_policy")
         if not stub:
-            stub = self._STUBS["get_iam_policy"] = self._GetIamPolicy(
+            stub = self._stubs["get_iam_policy"] = self._GetIamPolicy(
                 self._session, self._host
             )
 
@@ -922,9 +848,9 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertInstanceTemplateRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -932,9 +858,9 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
     def list(
         self,
     ) -> Callable[[compute.ListInstanceTemplatesRequest], compute.InstanceTemplateList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -942,9 +868,9 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
     def set_iam_policy(
         self,
     ) -> Callable[[compute.SetIamPolicyInstanceTemplateRequest], compute.Policy]:
-        stub = self._STUBS.get("set_iam_policy")
+        stub = self._stubs.get("set_iam_policy")
         if not stub:
-            stub = self._STUBS["set_iam_policy"] = self._SetIamPolicy(
+            stub = self._stubs["set_iam_policy"] = self._SetIamPolicy(
                 self._session, self._host
             )
 
@@ -957,16 +883,17 @@ class InstanceTemplatesRestTransport(InstanceTemplatesTransport):
         [compute.TestIamPermissionsInstanceTemplateRequest],
         compute.TestPermissionsResponse,
     ]:
-        stub = self._STUBS.get("test_iam_permissions")
+        stub = self._stubs.get("test_iam_permissions")
         if not stub:
-            stub = self._STUBS["test_iam_permissions"] = self._TestIamPermissions(
+            stub = self._stubs["test_iam_permissions"] = self._TestIamPermissions(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("InstanceTemplatesRestTransport",)
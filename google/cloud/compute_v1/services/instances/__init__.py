@@ -15,4 +15,18 @@
 #
 from .client import InstancesClient
 
-__all__ = ("InstancesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InstancesAsyncClient":
+        from .async_client import InstancesAsyncClient
+
+        return InstancesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InstancesClient",
+    "InstancesAsyncClient",
+)
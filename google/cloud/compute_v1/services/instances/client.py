@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,13 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.instances import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _scatter
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import InstancesTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import InstancesRestTransport
@@ -285,7 +292,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, InstancesTransport, None] = None,
+        transport: Union[
+            str, InstancesTransport, Callable[..., InstancesTransport], None
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -297,9 +306,13 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, InstancesTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, InstancesTransport, Callable[..., InstancesTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the InstancesTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -316,6 +329,22 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -327,7 +356,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -341,6 +370,11 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -356,6 +390,26 @@ class InstancesClient(metaclass=InstancesClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -367,8 +421,26 @@ class InstancesClient(metaclass=InstancesClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[InstancesTransport], Callable[..., InstancesTransport]
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -377,6 +449,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def add_access_config_unary(
@@ -389,7 +462,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         network_interface: str = None,
         access_config_resource: compute.AccessConfig = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Adds an access config to an instance's network
@@ -495,6 +568,81 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def add_access_config(
+        self,
+        request: Union[compute.AddAccessConfigInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        network_interface: str = None,
+        access_config_resource: compute.AccessConfig = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Adds an access config to an instance's network
+        interface.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AddAccessConfigInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.AddAccessConfig. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            network_interface (str):
+                The name of the network interface to
+                add to this instance.
+
+                This corresponds to the ``network_interface`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            access_config_resource (google.cloud.compute_v1.types.AccessConfig):
+                The body resource for this request
+                This corresponds to the ``access_config_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.add_access_config_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            network_interface=network_interface,
+            access_config_resource=access_config_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def add_resource_policies_unary(
         self,
         request: Union[compute.AddResourcePoliciesInstanceRequest, dict] = None,
@@ -504,7 +652,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_add_resource_policies_request_resource: compute.InstancesAddResourcePoliciesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Adds existing resource policies to an instance. You
@@ -604,14 +752,87 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def add_resource_policies(
+        self,
+        request: Union[compute.AddResourcePoliciesInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instances_add_resource_policies_request_resource: compute.InstancesAddResourcePoliciesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Adds existing resource policies to an instance. You
+        can only add one policy right now which will be applied
+        to this instance for scheduling live migrations.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AddResourcePoliciesInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.AddResourcePolicies. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_add_resource_policies_request_resource (google.cloud.compute_v1.types.InstancesAddResourcePoliciesRequest):
+                The body resource for this request
+                This corresponds to the ``instances_add_resource_policies_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.add_resource_policies_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_add_resource_policies_request_resource=instances_add_resource_policies_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def aggregated_list(
         self,
         request: Union[compute.AggregatedListInstancesRequest, dict] = None,
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        parallel: int = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.AggregatedListPager:
         r"""Retrieves an aggregated list of all of the instances
         in your project across all regions and zones. The
@@ -634,6 +855,38 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            parallel (int): If set, list the zones and regions named by
+                the first page with up to this many concurrent ``list``
+                requests instead of requesting the following pages, and
+                yield each zone or region as a page of its own once it is
+                complete, in no particular order. ``retry``, ``timeout``,
+                ``metadata``, ``prefetch`` and ``page_sizer`` apply to the
+                ``list`` requests of each zone and region. Cannot be
+                combined with ``views`` or ``fields``.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instances.pagers.AggregatedListPager:
@@ -652,6 +905,33 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.AggregatedListInstancesRequest
+            )
+
+        if parallel is not None:
+            if parallel < 1:
+                raise ValueError("The `parallel` argument must be at least 1.")
+            if views or fields is not None:
+                raise ValueError(
+                    "The `parallel` argument cannot be combined with "
+                    "`views` or `fields`."
+                )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.AggregatedListInstancesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -663,17 +943,54 @@ class InstancesClient(metaclass=InstancesClientMeta):
             if project is not None:
                 request.project = project
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.aggregated_list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        scatter = None
+        if parallel is not None:
+            # List the zones and regions concurrently after the first page.
+            scatter = _scatter.scatter(
+                self._transport,
+                "instances",
+                parallel,
+                retry=retry,
+                timeout=timeout,
+                metadata=metadata,
+                prefetch=prefetch,
+                page_sizer=page_sizer,
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.AggregatedListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
+            scatter=scatter,
         )
 
         # Done; return the response.
@@ -688,7 +1005,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         attached_disk_resource: compute.AttachedDisk = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Attaches an existing Disk resource to an instance.
@@ -786,6 +1103,75 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def attach_disk(
+        self,
+        request: Union[compute.AttachDiskInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        attached_disk_resource: compute.AttachedDisk = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Attaches an existing Disk resource to an instance.
+        You must first create the disk before you can attach it.
+        It is not possible to create and attach a disk at the
+        same time. For more information, read Adding a
+        persistent disk to your instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AttachDiskInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.AttachDisk. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            attached_disk_resource (google.cloud.compute_v1.types.AttachedDisk):
+                The body resource for this request
+                This corresponds to the ``attached_disk_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.attach_disk_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            attached_disk_resource=attached_disk_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def bulk_insert_unary(
         self,
         request: Union[compute.BulkInsertInstanceRequest, dict] = None,
@@ -794,7 +1180,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         bulk_insert_instance_resource_resource: compute.BulkInsertInstanceResource = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates multiple instances. Count specifies the
@@ -886,6 +1272,65 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def bulk_insert(
+        self,
+        request: Union[compute.BulkInsertInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        bulk_insert_instance_resource_resource: compute.BulkInsertInstanceResource = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates multiple instances. Count specifies the
+        number of instances to create.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.BulkInsertInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.BulkInsert. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            bulk_insert_instance_resource_resource (google.cloud.compute_v1.types.BulkInsertInstanceResource):
+                The body resource for this request
+                This corresponds to the ``bulk_insert_instance_resource_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.bulk_insert_unary(
+            request,
+            project=project,
+            zone=zone,
+            bulk_insert_instance_resource_resource=bulk_insert_instance_resource_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_unary(
         self,
         request: Union[compute.DeleteInstanceRequest, dict] = None,
@@ -894,7 +1339,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes the specified Instance resource. For more
@@ -984,27 +1429,25 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
-    def delete_access_config_unary(
+    def delete(
         self,
-        request: Union[compute.DeleteAccessConfigInstanceRequest, dict] = None,
+        request: Union[compute.DeleteInstanceRequest, dict] = None,
         *,
         project: str = None,
         zone: str = None,
         instance: str = None,
-        access_config: str = None,
-        network_interface: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Deletes an access config from an instance's network
-        interface.
+    ) -> operations.OperationFuture:
+        r"""Deletes the specified Instance resource. For more
+        information, see Deleting an instance.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.DeleteAccessConfigInstanceRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.DeleteInstanceRequest, dict]):
                 The request object. A request message for
-                Instances.DeleteAccessConfig. See the method description
-                for details.
+                Instances.Delete. See the method description for
+                details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -1018,11 +1461,74 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
             instance (str):
-                The instance name for this request.
+                Name of the instance resource to
+                delete.
+
                 This corresponds to the ``instance`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
-            access_config (str):
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def delete_access_config_unary(
+        self,
+        request: Union[compute.DeleteAccessConfigInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        access_config: str = None,
+        network_interface: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Deletes an access config from an instance's network
+        interface.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteAccessConfigInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.DeleteAccessConfig. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            access_config (str):
                 The name of the access config to
                 delete.
 
@@ -1100,6 +1606,81 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def delete_access_config(
+        self,
+        request: Union[compute.DeleteAccessConfigInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        access_config: str = None,
+        network_interface: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes an access config from an instance's network
+        interface.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteAccessConfigInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.DeleteAccessConfig. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            access_config (str):
+                The name of the access config to
+                delete.
+
+                This corresponds to the ``access_config`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            network_interface (str):
+                The name of the network interface.
+                This corresponds to the ``network_interface`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_access_config_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            access_config=access_config,
+            network_interface=network_interface,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def detach_disk_unary(
         self,
         request: Union[compute.DetachDiskInstanceRequest, dict] = None,
@@ -1109,7 +1690,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         device_name: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Detaches a disk from an instance.
@@ -1207,6 +1788,75 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def detach_disk(
+        self,
+        request: Union[compute.DetachDiskInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        device_name: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Detaches a disk from an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DetachDiskInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.DetachDisk. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            device_name (str):
+                The device name of the disk to
+                detach. Make a get() request on the
+                instance to view currently attached
+                disks and device names.
+
+                This corresponds to the ``device_name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.detach_disk_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            device_name=device_name,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetInstanceRequest, dict] = None,
@@ -1215,8 +1865,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.Instance:
         r"""Returns the specified Instance resource. Gets a list
         of available instances by making a list() request.
@@ -1249,6 +1900,10 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.Instance:
@@ -1288,6 +1943,10 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -1303,7 +1962,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         network_interface: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.InstancesGetEffectiveFirewallsResponse:
         r"""Returns effective firewalls applied to an interface
@@ -1395,7 +2054,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.GuestAttributes:
         r"""Returns the specified guest attributes entry.
@@ -1477,7 +2136,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         resource: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Policy:
         r"""Gets the access control policy for a resource. May be
@@ -1599,7 +2258,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Screenshot:
         r"""Returns the screenshot from the specified instance.
@@ -1681,7 +2340,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.SerialPortOutput:
         r"""Returns the last 1 MB of serial port output from the
@@ -1764,7 +2423,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.ShieldedInstanceIdentity:
         r"""Returns the Shielded Instance Identity of an instance
@@ -1848,7 +2507,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance_resource: compute.Instance = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates an instance resource in the specified project
@@ -1936,6 +2595,65 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def insert(
+        self,
+        request: Union[compute.InsertInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance_resource: compute.Instance = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates an instance resource in the specified project
+        using the data included in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.Insert. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_resource (google.cloud.compute_v1.types.Instance):
+                The body resource for this request
+                This corresponds to the ``instance_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.insert_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance_resource=instance_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def list(
         self,
         request: Union[compute.ListInstancesRequest, dict] = None,
@@ -1943,8 +2661,13 @@ class InstancesClient(metaclass=InstancesClientMeta):
         project: str = None,
         zone: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Retrieves the list of instances contained within the
         specified zone.
@@ -1970,6 +2693,30 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instances.pagers.ListPager:
@@ -1989,6 +2736,24 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListInstancesRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListInstancesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -2002,17 +2767,39 @@ class InstancesClient(metaclass=InstancesClientMeta):
             if zone is not None:
                 request.zone = zone
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -2026,8 +2813,11 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListReferrersPager:
         r"""Retrieves a list of resources that refer to the VM
         instance specified in the request. For example, if the
@@ -2067,6 +2857,19 @@ class InstancesClient(metaclass=InstancesClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.instances.pagers.ListReferrersPager:
@@ -2087,6 +2890,24 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListReferrersInstancesRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListReferrersInstancesRequest.
         # There's no risk of modifying the input as we've already verified
@@ -2102,17 +2923,29 @@ class InstancesClient(metaclass=InstancesClientMeta):
             if instance is not None:
                 request.instance = instance
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_referrers]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListReferrersPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -2127,7 +2960,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_remove_resource_policies_request_resource: compute.InstancesRemoveResourcePoliciesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Removes resource policies from an instance.
@@ -2230,25 +3063,25 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
-    def reset_unary(
+    def remove_resource_policies(
         self,
-        request: Union[compute.ResetInstanceRequest, dict] = None,
+        request: Union[compute.RemoveResourcePoliciesInstanceRequest, dict] = None,
         *,
         project: str = None,
         zone: str = None,
         instance: str = None,
+        instances_remove_resource_policies_request_resource: compute.InstancesRemoveResourcePoliciesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Performs a reset on the instance. This is a hard
-        reset the VM does not do a graceful shutdown. For more
-        information, see Resetting an instance.
+    ) -> operations.OperationFuture:
+        r"""Removes resource policies from an instance.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.ResetInstanceRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.RemoveResourcePoliciesInstanceRequest, dict]):
                 The request object. A request message for
-                Instances.Reset. See the method description for details.
+                Instances.RemoveResourcePolicies. See the method
+                description for details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -2262,12 +3095,15 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
             instance (str):
-                Name of the instance scoping this
-                request.
-
+                The instance name for this request.
                 This corresponds to the ``instance`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
+            instances_remove_resource_policies_request_resource (google.cloud.compute_v1.types.InstancesRemoveResourcePoliciesRequest):
+                The body resource for this request
+                This corresponds to the ``instances_remove_resource_policies_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
@@ -2275,15 +3111,77 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 sent along with the request as metadata.
 
         Returns:
-            google.cloud.compute_v1.types.Operation:
-                Represents an Operation resource. Google Compute Engine
-                has three Operation resources: \*
-                [Global](/compute/docs/reference/rest/v1/globalOperations)
-                \*
-                [Regional](/compute/docs/reference/rest/v1/regionOperations)
-                \*
-                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
-                You can use an operation resource to manage asynchronous
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.remove_resource_policies_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_remove_resource_policies_request_resource=instances_remove_resource_policies_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def reset_unary(
+        self,
+        request: Union[compute.ResetInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Performs a reset on the instance. This is a hard
+        reset the VM does not do a graceful shutdown. For more
+        information, see Resetting an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ResetInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.Reset. See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
                 API requests. For more information, read Handling API
                 responses. Operations can be global, regional or zonal.
                 - For global operations, use the globalOperations
@@ -2328,6 +3226,67 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def reset(
+        self,
+        request: Union[compute.ResetInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Performs a reset on the instance. This is a hard
+        reset the VM does not do a graceful shutdown. For more
+        information, see Resetting an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ResetInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.Reset. See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.reset_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def send_diagnostic_interrupt(
         self,
         request: Union[compute.SendDiagnosticInterruptInstanceRequest, dict] = None,
@@ -2336,7 +3295,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.SendDiagnosticInterruptInstanceResponse:
         r"""Sends diagnostic interrupt to the instance.
@@ -2423,7 +3382,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         resource: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets deletion protection on the instance.
@@ -2512,6 +3471,66 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_deletion_protection(
+        self,
+        request: Union[compute.SetDeletionProtectionInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        resource: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets deletion protection on the instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetDeletionProtectionInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetDeletionProtection. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            resource (str):
+                Name or id of the resource for this
+                request.
+
+                This corresponds to the ``resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_deletion_protection_unary(
+            request,
+            project=project,
+            zone=zone,
+            resource=resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_disk_auto_delete_unary(
         self,
         request: Union[compute.SetDiskAutoDeleteInstanceRequest, dict] = None,
@@ -2522,7 +3541,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         auto_delete: bool = None,
         device_name: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets the auto-delete flag for a disk attached to an
@@ -2630,6 +3649,85 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_disk_auto_delete(
+        self,
+        request: Union[compute.SetDiskAutoDeleteInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        auto_delete: bool = None,
+        device_name: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets the auto-delete flag for a disk attached to an
+        instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetDiskAutoDeleteInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetDiskAutoDelete. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            auto_delete (bool):
+                Whether to auto-delete the disk when
+                the instance is deleted.
+
+                This corresponds to the ``auto_delete`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            device_name (str):
+                The device name of the disk to
+                modify. Make a get() request on the
+                instance to view currently attached
+                disks and device names.
+
+                This corresponds to the ``device_name`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_disk_auto_delete_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            auto_delete=auto_delete,
+            device_name=device_name,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_iam_policy(
         self,
         request: Union[compute.SetIamPolicyInstanceRequest, dict] = None,
@@ -2639,7 +3737,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         resource: str = None,
         zone_set_policy_request_resource: compute.ZoneSetPolicyRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Policy:
         r"""Sets the access control policy on the specified
@@ -2773,7 +3871,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_set_labels_request_resource: compute.InstancesSetLabelsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets labels on an instance. To learn more about
@@ -2874,26 +3972,26 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
-    def set_machine_resources_unary(
+    def set_labels(
         self,
-        request: Union[compute.SetMachineResourcesInstanceRequest, dict] = None,
+        request: Union[compute.SetLabelsInstanceRequest, dict] = None,
         *,
         project: str = None,
         zone: str = None,
         instance: str = None,
-        instances_set_machine_resources_request_resource: compute.InstancesSetMachineResourcesRequest = None,
+        instances_set_labels_request_resource: compute.InstancesSetLabelsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Changes the number and/or type of accelerator for a
-        stopped instance to the values specified in the request.
+    ) -> operations.OperationFuture:
+        r"""Sets labels on an instance. To learn more about
+        labels, read the Labeling Resources documentation.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.SetMachineResourcesInstanceRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.SetLabelsInstanceRequest, dict]):
                 The request object. A request message for
-                Instances.SetMachineResources. See the method
-                description for details.
+                Instances.SetLabels. See the method description for
+                details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -2913,9 +4011,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 This corresponds to the ``instance`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
-            instances_set_machine_resources_request_resource (google.cloud.compute_v1.types.InstancesSetMachineResourcesRequest):
+            instances_set_labels_request_resource (google.cloud.compute_v1.types.InstancesSetLabelsRequest):
                 The body resource for this request
-                This corresponds to the ``instances_set_machine_resources_request_resource`` field
+                This corresponds to the ``instances_set_labels_request_resource`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
@@ -2925,35 +4023,103 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 sent along with the request as metadata.
 
         Returns:
-            google.cloud.compute_v1.types.Operation:
-                Represents an Operation resource. Google Compute Engine
-                has three Operation resources: \*
-                [Global](/compute/docs/reference/rest/v1/globalOperations)
-                \*
-                [Regional](/compute/docs/reference/rest/v1/regionOperations)
-                \*
-                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
-                You can use an operation resource to manage asynchronous
-                API requests. For more information, read Handling API
-                responses. Operations can be global, regional or zonal.
-                - For global operations, use the globalOperations
-                resource. - For regional operations, use the
-                regionOperations resource. - For zonal operations, use
-                the zonalOperations resource. For more information, read
-                Global, Regional, and Zonal Resources.
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
 
         """
-        # Create or coerce a protobuf request object.
-        # Sanity check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project, zone, instance, instances_set_machine_resources_request_resource]
+        operation = self.set_labels_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_set_labels_request_resource=instances_set_labels_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
+        return operations.OperationFuture(operation, self._transport)
+
+    def set_machine_resources_unary(
+        self,
+        request: Union[compute.SetMachineResourcesInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instances_set_machine_resources_request_resource: compute.InstancesSetMachineResourcesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Changes the number and/or type of accelerator for a
+        stopped instance to the values specified in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetMachineResourcesInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetMachineResources. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_set_machine_resources_request_resource (google.cloud.compute_v1.types.InstancesSetMachineResourcesRequest):
+                The body resource for this request
+                This corresponds to the ``instances_set_machine_resources_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any(
+            [project, zone, instance, instances_set_machine_resources_request_resource]
+        )
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
 
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.SetMachineResourcesInstanceRequest.
@@ -2984,6 +4150,74 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_machine_resources(
+        self,
+        request: Union[compute.SetMachineResourcesInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instances_set_machine_resources_request_resource: compute.InstancesSetMachineResourcesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Changes the number and/or type of accelerator for a
+        stopped instance to the values specified in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetMachineResourcesInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetMachineResources. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_set_machine_resources_request_resource (google.cloud.compute_v1.types.InstancesSetMachineResourcesRequest):
+                The body resource for this request
+                This corresponds to the ``instances_set_machine_resources_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_machine_resources_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_set_machine_resources_request_resource=instances_set_machine_resources_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_machine_type_unary(
         self,
         request: Union[compute.SetMachineTypeInstanceRequest, dict] = None,
@@ -2993,7 +4227,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_set_machine_type_request_resource: compute.InstancesSetMachineTypeRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Changes the machine type for a stopped instance to
@@ -3094,6 +4328,74 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_machine_type(
+        self,
+        request: Union[compute.SetMachineTypeInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instances_set_machine_type_request_resource: compute.InstancesSetMachineTypeRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Changes the machine type for a stopped instance to
+        the machine type specified in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetMachineTypeInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetMachineType. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_set_machine_type_request_resource (google.cloud.compute_v1.types.InstancesSetMachineTypeRequest):
+                The body resource for this request
+                This corresponds to the ``instances_set_machine_type_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_machine_type_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_set_machine_type_request_resource=instances_set_machine_type_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_metadata_unary(
         self,
         request: Union[compute.SetMetadataInstanceRequest, dict] = None,
@@ -3103,7 +4405,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         metadata_resource: compute.Metadata = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets metadata for the specified instance to the data
@@ -3200,6 +4502,74 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_metadata(
+        self,
+        request: Union[compute.SetMetadataInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        metadata_resource: compute.Metadata = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets metadata for the specified instance to the data
+        included in the request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetMetadataInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetMetadata. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            metadata_resource (google.cloud.compute_v1.types.Metadata):
+                The body resource for this request
+                This corresponds to the ``metadata_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_metadata_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            metadata_resource=metadata_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_min_cpu_platform_unary(
         self,
         request: Union[compute.SetMinCpuPlatformInstanceRequest, dict] = None,
@@ -3209,7 +4579,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_set_min_cpu_platform_request_resource: compute.InstancesSetMinCpuPlatformRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Changes the minimum CPU platform that this instance
@@ -3312,28 +4682,98 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
-    def set_scheduling_unary(
+    def set_min_cpu_platform(
         self,
-        request: Union[compute.SetSchedulingInstanceRequest, dict] = None,
+        request: Union[compute.SetMinCpuPlatformInstanceRequest, dict] = None,
         *,
         project: str = None,
         zone: str = None,
         instance: str = None,
-        scheduling_resource: compute.Scheduling = None,
+        instances_set_min_cpu_platform_request_resource: compute.InstancesSetMinCpuPlatformRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Sets an instance's scheduling options. You can only call this
-        method on a stopped instance, that is, a VM instance that is in
-        a ``TERMINATED`` state. See Instance Life Cycle for more
-        information on the possible instance states.
+    ) -> operations.OperationFuture:
+        r"""Changes the minimum CPU platform that this instance
+        should use. This method can only be called on a stopped
+        instance. For more information, read Specifying a
+        Minimum CPU Platform.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.SetSchedulingInstanceRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.SetMinCpuPlatformInstanceRequest, dict]):
                 The request object. A request message for
-                Instances.SetScheduling. See the method description for
-                details.
+                Instances.SetMinCpuPlatform. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_set_min_cpu_platform_request_resource (google.cloud.compute_v1.types.InstancesSetMinCpuPlatformRequest):
+                The body resource for this request
+                This corresponds to the ``instances_set_min_cpu_platform_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_min_cpu_platform_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_set_min_cpu_platform_request_resource=instances_set_min_cpu_platform_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def set_scheduling_unary(
+        self,
+        request: Union[compute.SetSchedulingInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        scheduling_resource: compute.Scheduling = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Sets an instance's scheduling options. You can only call this
+        method on a stopped instance, that is, a VM instance that is in
+        a ``TERMINATED`` state. See Instance Life Cycle for more
+        information on the possible instance states.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetSchedulingInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetScheduling. See the method description for
+                details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -3418,6 +4858,74 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_scheduling(
+        self,
+        request: Union[compute.SetSchedulingInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        scheduling_resource: compute.Scheduling = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets an instance's scheduling options. You can only call this
+        method on a stopped instance, that is, a VM instance that is in
+        a ``TERMINATED`` state. See Instance Life Cycle for more
+        information on the possible instance states.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetSchedulingInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetScheduling. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            scheduling_resource (google.cloud.compute_v1.types.Scheduling):
+                The body resource for this request
+                This corresponds to the ``scheduling_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_scheduling_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            scheduling_resource=scheduling_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_service_account_unary(
         self,
         request: Union[compute.SetServiceAccountInstanceRequest, dict] = None,
@@ -3427,7 +4935,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_set_service_account_request_resource: compute.InstancesSetServiceAccountRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets the service account on the instance. For more
@@ -3529,6 +5037,75 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_service_account(
+        self,
+        request: Union[compute.SetServiceAccountInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instances_set_service_account_request_resource: compute.InstancesSetServiceAccountRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets the service account on the instance. For more
+        information, read Changing the service account and
+        access scopes for an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetServiceAccountInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetServiceAccount. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance resource to
+                start.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_set_service_account_request_resource (google.cloud.compute_v1.types.InstancesSetServiceAccountRequest):
+                The body resource for this request
+                This corresponds to the ``instances_set_service_account_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_service_account_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_set_service_account_request_resource=instances_set_service_account_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_shielded_instance_integrity_policy_unary(
         self,
         request: Union[
@@ -3540,7 +5117,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         shielded_instance_integrity_policy_resource: compute.ShieldedInstanceIntegrityPolicy = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets the Shielded Instance integrity policy for an
@@ -3647,6 +5224,78 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def set_shielded_instance_integrity_policy(
+        self,
+        request: Union[
+            compute.SetShieldedInstanceIntegrityPolicyInstanceRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        shielded_instance_integrity_policy_resource: compute.ShieldedInstanceIntegrityPolicy = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets the Shielded Instance integrity policy for an
+        instance. You can only use this method on a running
+        instance. This method supports PATCH semantics and uses
+        the JSON merge patch format and processing rules.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetShieldedInstanceIntegrityPolicyInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SetShieldedInstanceIntegrityPolicy. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name or id of the instance scoping
+                this request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            shielded_instance_integrity_policy_resource (google.cloud.compute_v1.types.ShieldedInstanceIntegrityPolicy):
+                The body resource for this request
+                This corresponds to the ``shielded_instance_integrity_policy_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_shielded_instance_integrity_policy_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            shielded_instance_integrity_policy_resource=shielded_instance_integrity_policy_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_tags_unary(
         self,
         request: Union[compute.SetTagsInstanceRequest, dict] = None,
@@ -3656,7 +5305,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         tags_resource: compute.Tags = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets network tags for the specified instance to the
@@ -3753,24 +5402,26 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
-    def simulate_maintenance_event_unary(
+    def set_tags(
         self,
-        request: Union[compute.SimulateMaintenanceEventInstanceRequest, dict] = None,
+        request: Union[compute.SetTagsInstanceRequest, dict] = None,
         *,
         project: str = None,
         zone: str = None,
         instance: str = None,
+        tags_resource: compute.Tags = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Simulates a maintenance event on the instance.
+    ) -> operations.OperationFuture:
+        r"""Sets network tags for the specified instance to the
+        data included in the request.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.SimulateMaintenanceEventInstanceRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.SetTagsInstanceRequest, dict]):
                 The request object. A request message for
-                Instances.SimulateMaintenanceEvent. See the method
-                description for details.
+                Instances.SetTags. See the method description for
+                details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -3790,6 +5441,11 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 This corresponds to the ``instance`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
+            tags_resource (google.cloud.compute_v1.types.Tags):
+                The body resource for this request
+                This corresponds to the ``tags_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
                 should be retried.
             timeout (float): The timeout for this request.
@@ -3797,28 +5453,89 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 sent along with the request as metadata.
 
         Returns:
-            google.cloud.compute_v1.types.Operation:
-                Represents an Operation resource. Google Compute Engine
-                has three Operation resources: \*
-                [Global](/compute/docs/reference/rest/v1/globalOperations)
-                \*
-                [Regional](/compute/docs/reference/rest/v1/regionOperations)
-                \*
-                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
-                You can use an operation resource to manage asynchronous
-                API requests. For more information, read Handling API
-                responses. Operations can be global, regional or zonal.
-                - For global operations, use the globalOperations
-                resource. - For regional operations, use the
-                regionOperations resource. - For zonal operations, use
-                the zonalOperations resource. For more information, read
-                Global, Regional, and Zonal Resources.
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
 
         """
-        # Create or coerce a protobuf request object.
-        # Sanity check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project, zone, instance])
+        operation = self.set_tags_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            tags_resource=tags_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def simulate_maintenance_event_unary(
+        self,
+        request: Union[compute.SimulateMaintenanceEventInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Simulates a maintenance event on the instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SimulateMaintenanceEventInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SimulateMaintenanceEvent. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, instance])
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
@@ -3852,6 +5569,66 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def simulate_maintenance_event(
+        self,
+        request: Union[compute.SimulateMaintenanceEventInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Simulates a maintenance event on the instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SimulateMaintenanceEventInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.SimulateMaintenanceEvent. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.simulate_maintenance_event_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def start_unary(
         self,
         request: Union[compute.StartInstanceRequest, dict] = None,
@@ -3860,7 +5637,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Starts an instance that was stopped using the
@@ -3950,6 +5727,67 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def start(
+        self,
+        request: Union[compute.StartInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Starts an instance that was stopped using the
+        instances().stop method. For more information, see
+        Restart an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.StartInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.Start. See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance resource to
+                start.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.start_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def start_with_encryption_key_unary(
         self,
         request: Union[compute.StartWithEncryptionKeyInstanceRequest, dict] = None,
@@ -3959,7 +5797,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instances_start_with_encryption_key_request_resource: compute.InstancesStartWithEncryptionKeyRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Starts an instance that was stopped using the
@@ -4068,6 +5906,75 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def start_with_encryption_key(
+        self,
+        request: Union[compute.StartWithEncryptionKeyInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instances_start_with_encryption_key_request_resource: compute.InstancesStartWithEncryptionKeyRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Starts an instance that was stopped using the
+        instances().stop method. For more information, see
+        Restart an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.StartWithEncryptionKeyInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.StartWithEncryptionKey. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance resource to
+                start.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instances_start_with_encryption_key_request_resource (google.cloud.compute_v1.types.InstancesStartWithEncryptionKeyRequest):
+                The body resource for this request
+                This corresponds to the ``instances_start_with_encryption_key_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.start_with_encryption_key_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instances_start_with_encryption_key_request_resource=instances_start_with_encryption_key_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def stop_unary(
         self,
         request: Union[compute.StopInstanceRequest, dict] = None,
@@ -4076,7 +5983,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         zone: str = None,
         instance: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Stops a running instance, shutting it down cleanly,
@@ -4170,6 +6077,71 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def stop(
+        self,
+        request: Union[compute.StopInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Stops a running instance, shutting it down cleanly,
+        and allows you to restart the instance at a later time.
+        Stopped instances do not incur VM usage charges while
+        they are stopped. However, resources that the VM is
+        using, such as persistent disks and static IP addresses,
+        will continue to be charged until they are deleted. For
+        more information, see Stopping an instance.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.StopInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.Stop. See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance resource to
+                stop.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.stop_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def test_iam_permissions(
         self,
         request: Union[compute.TestIamPermissionsInstanceRequest, dict] = None,
@@ -4179,7 +6151,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         resource: str = None,
         test_permissions_request_resource: compute.TestPermissionsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.TestPermissionsResponse:
         r"""Returns permissions that a caller has on the
@@ -4274,7 +6246,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         instance_resource: compute.Instance = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Updates an instance only if the necessary resources
@@ -4303,12 +6275,196 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 Name of the instance resource to
                 update.
 
-                This corresponds to the ``instance`` field
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_resource (google.cloud.compute_v1.types.Instance):
+                The body resource for this request
+                This corresponds to the ``instance_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.types.Operation:
+                Represents an Operation resource. Google Compute Engine
+                has three Operation resources: \*
+                [Global](/compute/docs/reference/rest/v1/globalOperations)
+                \*
+                [Regional](/compute/docs/reference/rest/v1/regionOperations)
+                \*
+                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
+                You can use an operation resource to manage asynchronous
+                API requests. For more information, read Handling API
+                responses. Operations can be global, regional or zonal.
+                - For global operations, use the globalOperations
+                resource. - For regional operations, use the
+                regionOperations resource. - For zonal operations, use
+                the zonalOperations resource. For more information, read
+                Global, Regional, and Zonal Resources.
+
+        """
+        # Create or coerce a protobuf request object.
+        # Sanity check: If we got a request object, we should *not* have
+        # gotten any keyword arguments that map to the request.
+        has_flattened_params = any([project, zone, instance, instance_resource])
+        if request is not None and has_flattened_params:
+            raise ValueError(
+                "If the `request` argument is set, then none of "
+                "the individual field arguments should be set."
+            )
+
+        # Minor optimization to avoid making a copy if the user passes
+        # in a compute.UpdateInstanceRequest.
+        # There's no risk of modifying the input as we've already verified
+        # there are no flattened fields.
+        if not isinstance(request, compute.UpdateInstanceRequest):
+            request = compute.UpdateInstanceRequest(request)
+            # If we have keyword arguments corresponding to fields on the
+            # request, apply these.
+            if project is not None:
+                request.project = project
+            if zone is not None:
+                request.zone = zone
+            if instance is not None:
+                request.instance = instance
+            if instance_resource is not None:
+                request.instance_resource = instance_resource
+
+        # Wrap the RPC method; this adds retry and timeout information,
+        # and friendly error handling.
+        rpc = self._transport._wrapped_methods[self._transport.update]
+
+        # Send the request.
+        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
+
+        # Done; return the response.
+        return response
+
+    def update(
+        self,
+        request: Union[compute.UpdateInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        instance_resource: compute.Instance = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Updates an instance only if the necessary resources
+        are available. This method can update only a specific
+        set of instance properties. See Updating a running
+        instance for a list of updatable instance properties.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdateInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.Update. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance resource to
+                update.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_resource (google.cloud.compute_v1.types.Instance):
+                The body resource for this request
+                This corresponds to the ``instance_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.update_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            instance_resource=instance_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def update_access_config_unary(
+        self,
+        request: Union[compute.UpdateAccessConfigInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        network_interface: str = None,
+        access_config_resource: compute.AccessConfig = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Updates the specified access config from an
+        instance's network interface with the data included in
+        the request. This method supports PATCH semantics and
+        uses the JSON merge patch format and processing rules.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdateAccessConfigInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.UpdateAccessConfig. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            network_interface (str):
+                The name of the network interface
+                where the access config is attached.
+
+                This corresponds to the ``network_interface`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
-            instance_resource (google.cloud.compute_v1.types.Instance):
+            access_config_resource (google.cloud.compute_v1.types.AccessConfig):
                 The body resource for this request
-                This corresponds to the ``instance_resource`` field
+                This corresponds to the ``access_config_resource`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
             retry (google.api_core.retry.Retry): Designation of what errors, if any,
@@ -4339,7 +6495,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Create or coerce a protobuf request object.
         # Sanity check: If we got a request object, we should *not* have
         # gotten any keyword arguments that map to the request.
-        has_flattened_params = any([project, zone, instance, instance_resource])
+        has_flattened_params = any(
+            [project, zone, instance, network_interface, access_config_resource]
+        )
         if request is not None and has_flattened_params:
             raise ValueError(
                 "If the `request` argument is set, then none of "
@@ -4347,11 +6505,11 @@ class InstancesClient(metaclass=InstancesClientMeta):
             )
 
         # Minor optimization to avoid making a copy if the user passes
-        # in a compute.UpdateInstanceRequest.
+        # in a compute.UpdateAccessConfigInstanceRequest.
         # There's no risk of modifying the input as we've already verified
         # there are no flattened fields.
-        if not isinstance(request, compute.UpdateInstanceRequest):
-            request = compute.UpdateInstanceRequest(request)
+        if not isinstance(request, compute.UpdateAccessConfigInstanceRequest):
+            request = compute.UpdateAccessConfigInstanceRequest(request)
             # If we have keyword arguments corresponding to fields on the
             # request, apply these.
             if project is not None:
@@ -4360,12 +6518,14 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 request.zone = zone
             if instance is not None:
                 request.instance = instance
-            if instance_resource is not None:
-                request.instance_resource = instance_resource
+            if network_interface is not None:
+                request.network_interface = network_interface
+            if access_config_resource is not None:
+                request.access_config_resource = access_config_resource
 
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update]
+        rpc = self._transport._wrapped_methods[self._transport.update_access_config]
 
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
@@ -4373,7 +6533,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
-    def update_access_config_unary(
+    def update_access_config(
         self,
         request: Union[compute.UpdateAccessConfigInstanceRequest, dict] = None,
         *,
@@ -4383,9 +6543,9 @@ class InstancesClient(metaclass=InstancesClientMeta):
         network_interface: str = None,
         access_config_resource: compute.AccessConfig = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
+    ) -> operations.OperationFuture:
         r"""Updates the specified access config from an
         instance's network interface with the data included in
         the request. This method supports PATCH semantics and
@@ -4432,64 +6592,23 @@ class InstancesClient(metaclass=InstancesClientMeta):
                 sent along with the request as metadata.
 
         Returns:
-            google.cloud.compute_v1.types.Operation:
-                Represents an Operation resource. Google Compute Engine
-                has three Operation resources: \*
-                [Global](/compute/docs/reference/rest/v1/globalOperations)
-                \*
-                [Regional](/compute/docs/reference/rest/v1/regionOperations)
-                \*
-                [Zonal](/compute/docs/reference/rest/v1/zoneOperations)
-                You can use an operation resource to manage asynchronous
-                API requests. For more information, read Handling API
-                responses. Operations can be global, regional or zonal.
-                - For global operations, use the globalOperations
-                resource. - For regional operations, use the
-                regionOperations resource. - For zonal operations, use
-                the zonalOperations resource. For more information, read
-                Global, Regional, and Zonal Resources.
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
 
         """
-        # Create or coerce a protobuf request object.
-        # Sanity check: If we got a request object, we should *not* have
-        # gotten any keyword arguments that map to the request.
-        has_flattened_params = any(
-            [project, zone, instance, network_interface, access_config_resource]
+        operation = self.update_access_config_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            network_interface=network_interface,
+            access_config_resource=access_config_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
         )
-        if request is not None and has_flattened_params:
-            raise ValueError(
-                "If the `request` argument is set, then none of "
-                "the individual field arguments should be set."
-            )
-
-        # Minor optimization to avoid making a copy if the user passes
-        # in a compute.UpdateAccessConfigInstanceRequest.
-        # There's no risk of modifying the input as we've already verified
-        # there are no flattened fields.
-        if not isinstance(request, compute.UpdateAccessConfigInstanceRequest):
-            request = compute.UpdateAccessConfigInstanceRequest(request)
-            # If we have keyword arguments corresponding to fields on the
-            # request, apply these.
-            if project is not None:
-                request.project = project
-            if zone is not None:
-                request.zone = zone
-            if instance is not None:
-                request.instance = instance
-            if network_interface is not None:
-                request.network_interface = network_interface
-            if access_config_resource is not None:
-                request.access_config_resource = access_config_resource
-
-        # Wrap the RPC method; this adds retry and timeout information,
-        # and friendly error handling.
-        rpc = self._transport._wrapped_methods[self._transport.update_access_config]
-
-        # Send the request.
-        response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
-
-        # Done; return the response.
-        return response
+        return operations.OperationFuture(operation, self._transport)
 
     def update_display_device_unary(
         self,
@@ -4500,7 +6619,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         display_device_resource: compute.DisplayDevice = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Updates the Display config for a VM instance. You can
@@ -4599,6 +6718,76 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def update_display_device(
+        self,
+        request: Union[compute.UpdateDisplayDeviceInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        display_device_resource: compute.DisplayDevice = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Updates the Display config for a VM instance. You can
+        only use this method on a stopped VM instance. This
+        method supports PATCH semantics and uses the JSON merge
+        patch format and processing rules.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdateDisplayDeviceInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.UpdateDisplayDevice. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name of the instance scoping this
+                request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            display_device_resource (google.cloud.compute_v1.types.DisplayDevice):
+                The body resource for this request
+                This corresponds to the ``display_device_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.update_display_device_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            display_device_resource=display_device_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def update_network_interface_unary(
         self,
         request: Union[compute.UpdateNetworkInterfaceInstanceRequest, dict] = None,
@@ -4609,7 +6798,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         network_interface: str = None,
         network_interface_resource: compute.NetworkInterface = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Updates an instance's network interface. This method
@@ -4720,6 +6909,86 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def update_network_interface(
+        self,
+        request: Union[compute.UpdateNetworkInterfaceInstanceRequest, dict] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        network_interface: str = None,
+        network_interface_resource: compute.NetworkInterface = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Updates an instance's network interface. This method
+        can only update an interface's alias IP range and
+        attached network. See Modifying alias IP ranges for an
+        existing instance for instructions on changing alias IP
+        ranges. See Migrating a VM between networks for
+        instructions on migrating an interface. This method
+        follows PATCH semantics.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdateNetworkInterfaceInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.UpdateNetworkInterface. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                The instance name for this request.
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            network_interface (str):
+                The name of the network interface to
+                update.
+
+                This corresponds to the ``network_interface`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            network_interface_resource (google.cloud.compute_v1.types.NetworkInterface):
+                The body resource for this request
+                This corresponds to the ``network_interface_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.update_network_interface_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            network_interface=network_interface,
+            network_interface_resource=network_interface_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def update_shielded_instance_config_unary(
         self,
         request: Union[
@@ -4731,7 +7000,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         instance: str = None,
         shielded_instance_config_resource: compute.ShieldedInstanceConfig = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Updates the Shielded Instance config for an instance.
@@ -4836,6 +7105,78 @@ class InstancesClient(metaclass=InstancesClientMeta):
         # Done; return the response.
         return response
 
+    def update_shielded_instance_config(
+        self,
+        request: Union[
+            compute.UpdateShieldedInstanceConfigInstanceRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        zone: str = None,
+        instance: str = None,
+        shielded_instance_config_resource: compute.ShieldedInstanceConfig = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Updates the Shielded Instance config for an instance.
+        You can only use this method on a stopped instance. This
+        method supports PATCH semantics and uses the JSON merge
+        patch format and processing rules.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdateShieldedInstanceConfigInstanceRequest, dict]):
+                The request object. A request message for
+                Instances.UpdateShieldedInstanceConfig. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            zone (str):
+                The name of the zone for this
+                request.
+
+                This corresponds to the ``zone`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance (str):
+                Name or id of the instance scoping
+                this request.
+
+                This corresponds to the ``instance`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            shielded_instance_config_resource (google.cloud.compute_v1.types.ShieldedInstanceConfig):
+                The body resource for this request
+                This corresponds to the ``shielded_instance_config_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.update_shielded_instance_config_unary(
+            request,
+            project=project,
+            zone=zone,
+            instance=instance,
+            shielded_instance_config_resource=shielded_instance_config_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def __enter__(self):
         return self
 
@@ -4850,12 +7191,7 @@ class InstancesClient(metaclass=InstancesClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("InstancesClient",)
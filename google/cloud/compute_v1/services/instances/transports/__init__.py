@@ -24,7 +24,19 @@ from .rest import InstancesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[InstancesTransport]]
 _transport_registry["rest"] = InstancesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InstancesAsyncRestTransport":
+        from .rest_asyncio import InstancesAsyncRestTransport
+
+        return InstancesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InstancesTransport",
     "InstancesRestTransport",
+    "InstancesAsyncRestTransport",
 )
@@ -15,7 +15,6 @@
 #
 import abc
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Union
-import pkg_resources
 
 import google.auth  # type: ignore
 import google.api_core
@@ -25,14 +24,13 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import coalescing
+from google.cloud.compute_v1 import rate_limiting
+from google.cloud.compute_v1 import retry_policy
 from google.cloud.compute_v1.types import compute
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 class InstancesTransport(abc.ABC):
@@ -45,6 +43,13 @@ class InstancesTransport(abc.ABC):
 
     DEFAULT_HOST: str = "compute.googleapis.com"
 
+    # The default retry and timeout of each method.
+    _retry_policy = retry_policy.DEFAULT_RETRY_POLICY
+    # The limiter that paces the calls, if any.
+    _rate_limiter = None
+    # The coalescer of identical reads in flight, if any.
+    _coalescer = None
+
     def __init__(
         self,
         *,
@@ -121,173 +126,422 @@ class InstancesTransport(abc.ABC):
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.add_access_config: gapic_v1.method.wrap_method(
-                self.add_access_config, default_timeout=None, client_info=client_info,
+            self.add_access_config: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.add_access_config, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "add_access_config",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.add_resource_policies: gapic_v1.method.wrap_method(
-                self.add_resource_policies,
-                default_timeout=None,
+            self.add_resource_policies: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.add_resource_policies,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "add_resource_policies",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.aggregated_list: gapic_v1.method.wrap_method(
-                self.aggregated_list, default_timeout=None, client_info=client_info,
+            self.aggregated_list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.aggregated_list, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "aggregated_list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.attach_disk: gapic_v1.method.wrap_method(
-                self.attach_disk, default_timeout=None, client_info=client_info,
+            self.attach_disk: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.attach_disk, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "attach_disk",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.bulk_insert: gapic_v1.method.wrap_method(
-                self.bulk_insert, default_timeout=None, client_info=client_info,
+            self.bulk_insert: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.bulk_insert, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "bulk_insert",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.delete: gapic_v1.method.wrap_method(
-                self.delete, default_timeout=None, client_info=client_info,
+            self.delete: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.delete, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "delete",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.delete_access_config: gapic_v1.method.wrap_method(
-                self.delete_access_config,
-                default_timeout=None,
+            self.delete_access_config: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.delete_access_config,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "delete_access_config",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.detach_disk: gapic_v1.method.wrap_method(
-                self.detach_disk, default_timeout=None, client_info=client_info,
+            self.detach_disk: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.detach_disk, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "detach_disk",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get, default_timeout=None, client_info=client_info,
+            self.get: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_effective_firewalls: gapic_v1.method.wrap_method(
-                self.get_effective_firewalls,
-                default_timeout=None,
+            self.get_effective_firewalls: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_effective_firewalls,
+                        self._rate_limiter,
+                        rate_limiting.READ,
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_effective_firewalls",
+                retry_policy.READ,
                 client_info=client_info,
             ),
-            self.get_guest_attributes: gapic_v1.method.wrap_method(
-                self.get_guest_attributes,
-                default_timeout=None,
+            self.get_guest_attributes: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_guest_attributes,
+                        self._rate_limiter,
+                        rate_limiting.READ,
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_guest_attributes",
+                retry_policy.READ,
                 client_info=client_info,
             ),
-            self.get_iam_policy: gapic_v1.method.wrap_method(
-                self.get_iam_policy, default_timeout=None, client_info=client_info,
+            self.get_iam_policy: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_iam_policy, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_iam_policy",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_screenshot: gapic_v1.method.wrap_method(
-                self.get_screenshot, default_timeout=None, client_info=client_info,
+            self.get_screenshot: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_screenshot, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_screenshot",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_serial_port_output: gapic_v1.method.wrap_method(
-                self.get_serial_port_output,
-                default_timeout=None,
+            self.get_serial_port_output: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_serial_port_output,
+                        self._rate_limiter,
+                        rate_limiting.READ,
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_serial_port_output",
+                retry_policy.READ,
                 client_info=client_info,
             ),
-            self.get_shielded_instance_identity: gapic_v1.method.wrap_method(
-                self.get_shielded_instance_identity,
-                default_timeout=None,
+            self.get_shielded_instance_identity: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.get_shielded_instance_identity,
+                    self._rate_limiter,
+                    rate_limiting.READ,
+                ),
+                "get_shielded_instance_identity",
+                retry_policy.READ,
                 client_info=client_info,
             ),
-            self.insert: gapic_v1.method.wrap_method(
-                self.insert, default_timeout=None, client_info=client_info,
+            self.insert: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.insert, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "insert",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.list: gapic_v1.method.wrap_method(
-                self.list, default_timeout=None, client_info=client_info,
+            self.list: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.list, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "list",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.list_referrers: gapic_v1.method.wrap_method(
-                self.list_referrers, default_timeout=None, client_info=client_info,
+            self.list_referrers: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.list_referrers, self._rate_limiter, rate_limiting.LIST
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "list_referrers",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.remove_resource_policies: gapic_v1.method.wrap_method(
-                self.remove_resource_policies,
-                default_timeout=None,
+            self.remove_resource_policies: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.remove_resource_policies,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "remove_resource_policies",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.reset: gapic_v1.method.wrap_method(
-                self.reset, default_timeout=None, client_info=client_info,
+            self.reset: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.reset, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "reset",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.send_diagnostic_interrupt: gapic_v1.method.wrap_method(
-                self.send_diagnostic_interrupt,
-                default_timeout=None,
+            self.send_diagnostic_interrupt: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.send_diagnostic_interrupt,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "send_diagnostic_interrupt",
+                retry_policy.UNKEYED_MUTATION,
                 client_info=client_info,
             ),
-            self.set_deletion_protection: gapic_v1.method.wrap_method(
-                self.set_deletion_protection,
-                default_timeout=None,
+            self.set_deletion_protection: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_deletion_protection,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_deletion_protection",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_disk_auto_delete: gapic_v1.method.wrap_method(
-                self.set_disk_auto_delete,
-                default_timeout=None,
+            self.set_disk_auto_delete: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_disk_auto_delete,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_disk_auto_delete",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_iam_policy: gapic_v1.method.wrap_method(
-                self.set_iam_policy, default_timeout=None, client_info=client_info,
+            self.set_iam_policy: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_iam_policy, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_iam_policy",
+                retry_policy.UNKEYED_MUTATION,
+                client_info=client_info,
             ),
-            self.set_labels: gapic_v1.method.wrap_method(
-                self.set_labels, default_timeout=None, client_info=client_info,
+            self.set_labels: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_labels, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_labels",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_machine_resources: gapic_v1.method.wrap_method(
-                self.set_machine_resources,
-                default_timeout=None,
+            self.set_machine_resources: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_machine_resources,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_machine_resources",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_machine_type: gapic_v1.method.wrap_method(
-                self.set_machine_type, default_timeout=None, client_info=client_info,
+            self.set_machine_type: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_machine_type, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_machine_type",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_metadata: gapic_v1.method.wrap_method(
-                self.set_metadata, default_timeout=None, client_info=client_info,
+            self.set_metadata: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_metadata, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_metadata",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_min_cpu_platform: gapic_v1.method.wrap_method(
-                self.set_min_cpu_platform,
-                default_timeout=None,
+            self.set_min_cpu_platform: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_min_cpu_platform,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_min_cpu_platform",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_scheduling: gapic_v1.method.wrap_method(
-                self.set_scheduling, default_timeout=None, client_info=client_info,
+            self.set_scheduling: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_scheduling, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_scheduling",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_service_account: gapic_v1.method.wrap_method(
-                self.set_service_account, default_timeout=None, client_info=client_info,
+            self.set_service_account: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_service_account, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_service_account",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_shielded_instance_integrity_policy: gapic_v1.method.wrap_method(
-                self.set_shielded_instance_integrity_policy,
-                default_timeout=None,
+            self.set_shielded_instance_integrity_policy: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_shielded_instance_integrity_policy,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_shielded_instance_integrity_policy",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_tags: gapic_v1.method.wrap_method(
-                self.set_tags, default_timeout=None, client_info=client_info,
+            self.set_tags: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_tags, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "set_tags",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.simulate_maintenance_event: gapic_v1.method.wrap_method(
-                self.simulate_maintenance_event,
-                default_timeout=None,
+            self.simulate_maintenance_event: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.simulate_maintenance_event,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "simulate_maintenance_event",
+                retry_policy.UNKEYED_MUTATION,
                 client_info=client_info,
             ),
-            self.start: gapic_v1.method.wrap_method(
-                self.start, default_timeout=None, client_info=client_info,
+            self.start: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.start, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "start",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.start_with_encryption_key: gapic_v1.method.wrap_method(
-                self.start_with_encryption_key,
-                default_timeout=None,
+            self.start_with_encryption_key: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.start_with_encryption_key,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "start_with_encryption_key",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.stop: gapic_v1.method.wrap_method(
-                self.stop, default_timeout=None, client_info=client_info,
+            self.stop: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.stop, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "stop",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.test_iam_permissions: gapic_v1.method.wrap_method(
-                self.test_iam_permissions,
-                default_timeout=None,
+            self.test_iam_permissions: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.test_iam_permissions, self._rate_limiter, rate_limiting.READ
+                ),
+                "test_iam_permissions",
+                retry_policy.READ,
                 client_info=client_info,
             ),
-            self.update: gapic_v1.method.wrap_method(
-                self.update, default_timeout=None, client_info=client_info,
+            self.update: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.update, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "update",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.update_access_config: gapic_v1.method.wrap_method(
-                self.update_access_config,
-                default_timeout=None,
+            self.update_access_config: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.update_access_config,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "update_access_config",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.update_display_device: gapic_v1.method.wrap_method(
-                self.update_display_device,
-                default_timeout=None,
+            self.update_display_device: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.update_display_device,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "update_display_device",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.update_network_interface: gapic_v1.method.wrap_method(
-                self.update_network_interface,
-                default_timeout=None,
+            self.update_network_interface: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.update_network_interface,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "update_network_interface",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.update_shielded_instance_config: gapic_v1.method.wrap_method(
-                self.update_shielded_instance_config,
-                default_timeout=None,
+            self.update_shielded_instance_config: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.update_shielded_instance_config,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "update_shielded_instance_config",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
         }
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,15 +32,18 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import InstancesTransport, DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
+from .base import InstancesTransport
 
-
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -65,8 +65,6 @@ class InstancesRestTransport(InstancesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, InstancesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -79,6 +77,10 @@ class InstancesRestTransport(InstancesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -111,22 +113,50 @@ class InstancesRestTransport(InstancesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, InstancesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddAccessConfig(InstancesRestStub):
@@ -145,6 +175,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddAccessConfigInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/addAccessConfig",
+                    "body": "access_config_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddAccessConfigInstanceRequest,
@@ -187,38 +229,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/addAccessConfig",
-                    "body": "access_config_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddAccessConfigInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.AccessConfig.to_json(
-                compute.AccessConfig(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddAccessConfigInstanceRequest.to_json(
-                    compute.AddAccessConfigInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -228,7 +240,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -237,9 +249,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AddResourcePolicies(InstancesRestStub):
         def __hash__(self):
@@ -255,6 +265,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddResourcePoliciesInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/addResourcePolicies",
+                    "body": "instances_add_resource_policies_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddResourcePoliciesInstanceRequest,
@@ -297,38 +319,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/addResourcePolicies",
-                    "body": "instances_add_resource_policies_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddResourcePoliciesInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesAddResourcePoliciesRequest.to_json(
-                compute.InstancesAddResourcePoliciesRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddResourcePoliciesInstanceRequest.to_json(
-                    compute.AddResourcePoliciesInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -338,7 +330,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -347,9 +339,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AggregatedList(InstancesRestStub):
         def __hash__(self):
@@ -365,6 +355,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListInstancesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/instances",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListInstancesRequest,
@@ -372,6 +373,8 @@ class InstancesRestTransport(InstancesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -386,37 +389,21 @@ class InstancesRestTransport(InstancesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/instances",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListInstancesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListInstancesRequest.to_json(
-                    compute.AggregatedListInstancesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -426,7 +413,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -434,8 +421,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceAggregatedList, response.content, lazy=views
             )
 
     class _AttachDisk(InstancesRestStub):
@@ -452,6 +439,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AttachDiskInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/attachDisk",
+                    "body": "attached_disk_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AttachDiskInstanceRequest,
@@ -494,38 +493,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/attachDisk",
-                    "body": "attached_disk_resource",
-                },
-            ]
-
-            request_kwargs = compute.AttachDiskInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.AttachedDisk.to_json(
-                compute.AttachedDisk(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AttachDiskInstanceRequest.to_json(
-                    compute.AttachDiskInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -535,7 +504,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -544,9 +513,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _BulkInsert(InstancesRestStub):
         def __hash__(self):
@@ -562,6 +529,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.BulkInsertInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/bulkInsert",
+                    "body": "bulk_insert_instance_resource_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.BulkInsertInstanceRequest,
@@ -604,38 +583,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/bulkInsert",
-                    "body": "bulk_insert_instance_resource_resource",
-                },
-            ]
-
-            request_kwargs = compute.BulkInsertInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.BulkInsertInstanceResource.to_json(
-                compute.BulkInsertInstanceResource(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.BulkInsertInstanceRequest.to_json(
-                    compute.BulkInsertInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -645,7 +594,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -654,9 +603,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(InstancesRestStub):
         def __hash__(self):
@@ -672,6 +619,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteInstanceRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteInstanceRequest,
@@ -714,29 +672,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteInstanceRequest.to_json(
-                    compute.DeleteInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -746,7 +683,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -754,9 +691,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeleteAccessConfig(InstancesRestStub):
         def __hash__(self):
@@ -775,6 +710,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteAccessConfigInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/deleteAccessConfig",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteAccessConfigInstanceRequest,
@@ -817,31 +763,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/deleteAccessConfig",
-                },
-            ]
-
-            request_kwargs = compute.DeleteAccessConfigInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteAccessConfigInstanceRequest.to_json(
-                    compute.DeleteAccessConfigInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -851,7 +774,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -859,9 +782,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DetachDisk(InstancesRestStub):
         def __hash__(self):
@@ -879,6 +800,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DetachDiskInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/detachDisk",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DetachDiskInstanceRequest,
@@ -921,31 +853,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/detachDisk",
-                },
-            ]
-
-            request_kwargs = compute.DetachDiskInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DetachDiskInstanceRequest.to_json(
-                    compute.DetachDiskInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -955,7 +864,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -963,9 +872,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(InstancesRestStub):
         def __hash__(self):
@@ -981,6 +888,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetInstanceRequest,
@@ -988,6 +906,7 @@ class InstancesRestTransport(InstancesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.Instance:
             r"""Call the get method over HTTP.
 
@@ -1001,6 +920,8 @@ class InstancesRestTransport(InstancesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.Instance:
@@ -1012,29 +933,10 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
-                },
-            ]
-
-            request_kwargs = compute.GetInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetInstanceRequest.to_json(
-                    compute.GetInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -1044,7 +946,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1052,9 +954,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Instance.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Instance, response.content)
 
     class _GetEffectiveFirewalls(InstancesRestStub):
         def __hash__(self):
@@ -1072,6 +972,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetEffectiveFirewallsInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/getEffectiveFirewalls",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetEffectiveFirewallsInstanceRequest,
@@ -1099,33 +1010,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/getEffectiveFirewalls",
-                },
-            ]
-
-            request_kwargs = compute.GetEffectiveFirewallsInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetEffectiveFirewallsInstanceRequest.to_json(
-                    compute.GetEffectiveFirewallsInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1135,7 +1021,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1143,8 +1029,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstancesGetEffectiveFirewallsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstancesGetEffectiveFirewallsResponse, response.content
             )
 
     class _GetGuestAttributes(InstancesRestStub):
@@ -1161,6 +1047,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetGuestAttributesInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/getGuestAttributes",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetGuestAttributesInstanceRequest,
@@ -1188,31 +1085,8 @@ class InstancesRestTransport(InstancesTransport):
                     A guest attributes entry.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/getGuestAttributes",
-                },
-            ]
-
-            request_kwargs = compute.GetGuestAttributesInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetGuestAttributesInstanceRequest.to_json(
-                    compute.GetGuestAttributesInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1222,7 +1096,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1230,8 +1104,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.GuestAttributes.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.GuestAttributes, response.content
             )
 
     class _GetIamPolicy(InstancesRestStub):
@@ -1248,6 +1122,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetIamPolicyInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/getIamPolicy",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetIamPolicyInstanceRequest,
@@ -1315,31 +1200,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/getIamPolicy",
-                },
-            ]
-
-            request_kwargs = compute.GetIamPolicyInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetIamPolicyInstanceRequest.to_json(
-                    compute.GetIamPolicyInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1349,7 +1211,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1357,9 +1219,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _GetScreenshot(InstancesRestStub):
         def __hash__(self):
@@ -1375,6 +1235,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetScreenshotInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/screenshot",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetScreenshotInstanceRequest,
@@ -1402,31 +1273,8 @@ class InstancesRestTransport(InstancesTransport):
                     An instance's screenshot.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/screenshot",
-                },
-            ]
-
-            request_kwargs = compute.GetScreenshotInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetScreenshotInstanceRequest.to_json(
-                    compute.GetScreenshotInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1436,7 +1284,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1444,9 +1292,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Screenshot.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Screenshot, response.content)
 
     class _GetSerialPortOutput(InstancesRestStub):
         def __hash__(self):
@@ -1462,6 +1308,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetSerialPortOutputInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/serialPort",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetSerialPortOutputInstanceRequest,
@@ -1489,31 +1346,8 @@ class InstancesRestTransport(InstancesTransport):
                     An instance serial console output.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/serialPort",
-                },
-            ]
-
-            request_kwargs = compute.GetSerialPortOutputInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetSerialPortOutputInstanceRequest.to_json(
-                    compute.GetSerialPortOutputInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1523,7 +1357,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1531,8 +1365,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.SerialPortOutput.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.SerialPortOutput, response.content
             )
 
     class _GetShieldedInstanceIdentity(InstancesRestStub):
@@ -1549,6 +1383,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetShieldedInstanceIdentityInstanceRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/getShieldedInstanceIdentity",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetShieldedInstanceIdentityInstanceRequest,
@@ -1577,33 +1422,8 @@ class InstancesRestTransport(InstancesTransport):
                     A Shielded Instance Identity.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/getShieldedInstanceIdentity",
-                },
-            ]
-
-            request_kwargs = compute.GetShieldedInstanceIdentityInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetShieldedInstanceIdentityInstanceRequest.to_json(
-                    compute.GetShieldedInstanceIdentityInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1613,7 +1433,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1621,8 +1441,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.ShieldedInstanceIdentity.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.ShieldedInstanceIdentity, response.content
             )
 
     class _Insert(InstancesRestStub):
@@ -1639,6 +1459,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances",
+                    "body": "instance_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertInstanceRequest,
@@ -1681,36 +1513,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances",
-                    "body": "instance_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Instance.to_json(
-                compute.Instance(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertInstanceRequest.to_json(
-                    compute.InsertInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1720,7 +1524,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1729,9 +1533,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(InstancesRestStub):
         def __hash__(self):
@@ -1747,6 +1549,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListInstancesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListInstancesRequest,
@@ -1754,6 +1567,8 @@ class InstancesRestTransport(InstancesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.InstanceList:
             r"""Call the list method over HTTP.
 
@@ -1767,35 +1582,21 @@ class InstancesRestTransport(InstancesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceList:
                     Contains a list of instances.
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances",
-                },
-            ]
-
-            request_kwargs = compute.ListInstancesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListInstancesRequest.to_json(
-                    compute.ListInstancesRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -1805,7 +1606,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1813,8 +1614,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceList, response.content, lazy=views
             )
 
     class _ListReferrers(InstancesRestStub):
@@ -1831,6 +1632,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListReferrersInstancesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/referrers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListReferrersInstancesRequest,
@@ -1860,31 +1672,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/referrers",
-                },
-            ]
-
-            request_kwargs = compute.ListReferrersInstancesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListReferrersInstancesRequest.to_json(
-                    compute.ListReferrersInstancesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1894,7 +1683,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1902,8 +1691,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceListReferrers.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceListReferrers, response.content
             )
 
     class _RemoveResourcePolicies(InstancesRestStub):
@@ -1920,6 +1709,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveResourcePoliciesInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/removeResourcePolicies",
+                    "body": "instances_remove_resource_policies_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveResourcePoliciesInstanceRequest,
@@ -1962,42 +1763,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/removeResourcePolicies",
-                    "body": "instances_remove_resource_policies_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RemoveResourcePoliciesInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesRemoveResourcePoliciesRequest.to_json(
-                compute.InstancesRemoveResourcePoliciesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveResourcePoliciesInstanceRequest.to_json(
-                    compute.RemoveResourcePoliciesInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2007,7 +1774,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2016,9 +1783,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Reset(InstancesRestStub):
         def __hash__(self):
@@ -2034,6 +1799,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ResetInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/reset",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ResetInstanceRequest,
@@ -2076,29 +1852,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/reset",
-                },
-            ]
-
-            request_kwargs = compute.ResetInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ResetInstanceRequest.to_json(
-                    compute.ResetInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2108,7 +1863,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2116,9 +1871,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SendDiagnosticInterrupt(InstancesRestStub):
         def __hash__(self):
@@ -2134,6 +1887,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SendDiagnosticInterruptInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/sendDiagnosticInterrupt",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SendDiagnosticInterruptInstanceRequest,
@@ -2164,33 +1928,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/sendDiagnosticInterrupt",
-                },
-            ]
-
-            request_kwargs = compute.SendDiagnosticInterruptInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SendDiagnosticInterruptInstanceRequest.to_json(
-                    compute.SendDiagnosticInterruptInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2200,7 +1939,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2208,8 +1947,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.SendDiagnosticInterruptInstanceResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.SendDiagnosticInterruptInstanceResponse, response.content
             )
 
     class _SetDeletionProtection(InstancesRestStub):
@@ -2226,6 +1965,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetDeletionProtectionInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/setDeletionProtection",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetDeletionProtectionInstanceRequest,
@@ -2268,33 +2018,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/setDeletionProtection",
-                },
-            ]
-
-            request_kwargs = compute.SetDeletionProtectionInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetDeletionProtectionInstanceRequest.to_json(
-                    compute.SetDeletionProtectionInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2304,7 +2029,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2312,9 +2037,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetDiskAutoDelete(InstancesRestStub):
         def __hash__(self):
@@ -2333,6 +2056,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetDiskAutoDeleteInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setDiskAutoDelete",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetDiskAutoDeleteInstanceRequest,
@@ -2375,31 +2109,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setDiskAutoDelete",
-                },
-            ]
-
-            request_kwargs = compute.SetDiskAutoDeleteInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetDiskAutoDeleteInstanceRequest.to_json(
-                    compute.SetDiskAutoDeleteInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2409,7 +2120,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -2417,9 +2128,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetIamPolicy(InstancesRestStub):
         def __hash__(self):
@@ -2435,6 +2144,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetIamPolicyInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/setIamPolicy",
+                    "body": "zone_set_policy_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetIamPolicyInstanceRequest,
@@ -2502,38 +2223,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/setIamPolicy",
-                    "body": "zone_set_policy_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetIamPolicyInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ZoneSetPolicyRequest.to_json(
-                compute.ZoneSetPolicyRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetIamPolicyInstanceRequest.to_json(
-                    compute.SetIamPolicyInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2543,7 +2234,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2552,9 +2243,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Policy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Policy, response.content)
 
     class _SetLabels(InstancesRestStub):
         def __hash__(self):
@@ -2570,6 +2259,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetLabelsInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setLabels",
+                    "body": "instances_set_labels_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetLabelsInstanceRequest,
@@ -2612,38 +2313,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setLabels",
-                    "body": "instances_set_labels_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetLabelsInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesSetLabelsRequest.to_json(
-                compute.InstancesSetLabelsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetLabelsInstanceRequest.to_json(
-                    compute.SetLabelsInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2653,7 +2324,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2662,9 +2333,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetMachineResources(InstancesRestStub):
         def __hash__(self):
@@ -2680,6 +2349,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetMachineResourcesInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMachineResources",
+                    "body": "instances_set_machine_resources_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetMachineResourcesInstanceRequest,
@@ -2722,38 +2403,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMachineResources",
-                    "body": "instances_set_machine_resources_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetMachineResourcesInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesSetMachineResourcesRequest.to_json(
-                compute.InstancesSetMachineResourcesRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetMachineResourcesInstanceRequest.to_json(
-                    compute.SetMachineResourcesInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2763,7 +2414,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2772,9 +2423,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetMachineType(InstancesRestStub):
         def __hash__(self):
@@ -2790,6 +2439,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetMachineTypeInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMachineType",
+                    "body": "instances_set_machine_type_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetMachineTypeInstanceRequest,
@@ -2832,38 +2493,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMachineType",
-                    "body": "instances_set_machine_type_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetMachineTypeInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesSetMachineTypeRequest.to_json(
-                compute.InstancesSetMachineTypeRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetMachineTypeInstanceRequest.to_json(
-                    compute.SetMachineTypeInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2873,7 +2504,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2882,9 +2513,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetMetadata(InstancesRestStub):
         def __hash__(self):
@@ -2900,6 +2529,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetMetadataInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMetadata",
+                    "body": "metadata_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetMetadataInstanceRequest,
@@ -2942,38 +2583,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMetadata",
-                    "body": "metadata_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetMetadataInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Metadata.to_json(
-                compute.Metadata(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetMetadataInstanceRequest.to_json(
-                    compute.SetMetadataInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2983,7 +2594,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2992,9 +2603,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetMinCpuPlatform(InstancesRestStub):
         def __hash__(self):
@@ -3010,6 +2619,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetMinCpuPlatformInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMinCpuPlatform",
+                    "body": "instances_set_min_cpu_platform_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetMinCpuPlatformInstanceRequest,
@@ -3052,38 +2673,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setMinCpuPlatform",
-                    "body": "instances_set_min_cpu_platform_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetMinCpuPlatformInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesSetMinCpuPlatformRequest.to_json(
-                compute.InstancesSetMinCpuPlatformRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetMinCpuPlatformInstanceRequest.to_json(
-                    compute.SetMinCpuPlatformInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3093,7 +2684,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -3102,9 +2693,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetScheduling(InstancesRestStub):
         def __hash__(self):
@@ -3120,6 +2709,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetSchedulingInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setScheduling",
+                    "body": "scheduling_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetSchedulingInstanceRequest,
@@ -3162,38 +2763,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setScheduling",
-                    "body": "scheduling_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetSchedulingInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Scheduling.to_json(
-                compute.Scheduling(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetSchedulingInstanceRequest.to_json(
-                    compute.SetSchedulingInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3203,7 +2774,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -3212,9 +2783,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetServiceAccount(InstancesRestStub):
         def __hash__(self):
@@ -3230,6 +2799,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetServiceAccountInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setServiceAccount",
+                    "body": "instances_set_service_account_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetServiceAccountInstanceRequest,
@@ -3272,38 +2853,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setServiceAccount",
-                    "body": "instances_set_service_account_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetServiceAccountInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesSetServiceAccountRequest.to_json(
-                compute.InstancesSetServiceAccountRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetServiceAccountInstanceRequest.to_json(
-                    compute.SetServiceAccountInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3313,7 +2864,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -3322,9 +2873,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetShieldedInstanceIntegrityPolicy(InstancesRestStub):
         def __hash__(self):
@@ -3340,6 +2889,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetShieldedInstanceIntegrityPolicyInstanceRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setShieldedInstanceIntegrityPolicy",
+                    "body": "shielded_instance_integrity_policy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetShieldedInstanceIntegrityPolicyInstanceRequest,
@@ -3383,40 +2944,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setShieldedInstanceIntegrityPolicy",
-                    "body": "shielded_instance_integrity_policy_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetShieldedInstanceIntegrityPolicyInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ShieldedInstanceIntegrityPolicy.to_json(
-                compute.ShieldedInstanceIntegrityPolicy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetShieldedInstanceIntegrityPolicyInstanceRequest.to_json(
-                    compute.SetShieldedInstanceIntegrityPolicyInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3426,7 +2955,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -3435,9 +2964,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetTags(InstancesRestStub):
         def __hash__(self):
@@ -3453,6 +2980,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetTagsInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setTags",
+                    "body": "tags_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetTagsInstanceRequest,
@@ -3495,36 +3034,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/setTags",
-                    "body": "tags_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetTagsInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Tags.to_json(
-                compute.Tags(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetTagsInstanceRequest.to_json(
-                    compute.SetTagsInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3534,7 +3045,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -3543,9 +3054,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SimulateMaintenanceEvent(InstancesRestStub):
         def __hash__(self):
@@ -3561,6 +3070,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SimulateMaintenanceEventInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/simulateMaintenanceEvent",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SimulateMaintenanceEventInstanceRequest,
@@ -3604,33 +3124,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/simulateMaintenanceEvent",
-                },
-            ]
-
-            request_kwargs = compute.SimulateMaintenanceEventInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SimulateMaintenanceEventInstanceRequest.to_json(
-                    compute.SimulateMaintenanceEventInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3640,7 +3135,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3648,9 +3143,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Start(InstancesRestStub):
         def __hash__(self):
@@ -3666,6 +3159,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.StartInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/start",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.StartInstanceRequest,
@@ -3708,29 +3212,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/start",
-                },
-            ]
-
-            request_kwargs = compute.StartInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.StartInstanceRequest.to_json(
-                    compute.StartInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3740,7 +3223,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3748,9 +3231,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _StartWithEncryptionKey(InstancesRestStub):
         def __hash__(self):
@@ -3766,6 +3247,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.StartWithEncryptionKeyInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/startWithEncryptionKey",
+                    "body": "instances_start_with_encryption_key_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.StartWithEncryptionKeyInstanceRequest,
@@ -3808,42 +3301,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/startWithEncryptionKey",
-                    "body": "instances_start_with_encryption_key_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.StartWithEncryptionKeyInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstancesStartWithEncryptionKeyRequest.to_json(
-                compute.InstancesStartWithEncryptionKeyRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.StartWithEncryptionKeyInstanceRequest.to_json(
-                    compute.StartWithEncryptionKeyInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3853,7 +3312,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -3862,9 +3321,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Stop(InstancesRestStub):
         def __hash__(self):
@@ -3880,6 +3337,17 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.StopInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/stop",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.StopInstanceRequest,
@@ -3921,29 +3389,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/stop",
-                },
-            ]
-
-            request_kwargs = compute.StopInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.StopInstanceRequest.to_json(
-                    compute.StopInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -3953,7 +3400,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -3961,9 +3408,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _TestIamPermissions(InstancesRestStub):
         def __hash__(self):
@@ -3979,6 +3424,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.TestIamPermissionsInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsInstanceRequest,
@@ -4006,38 +3463,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.TestIamPermissionsInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TestPermissionsRequest.to_json(
-                compute.TestPermissionsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.TestIamPermissionsInstanceRequest.to_json(
-                    compute.TestIamPermissionsInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -4047,7 +3474,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -4056,8 +3483,8 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TestPermissionsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TestPermissionsResponse, response.content
             )
 
     class _Update(InstancesRestStub):
@@ -4074,6 +3501,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateInstanceRequest,
+            [
+                {
+                    "method": "put",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
+                    "body": "instance_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateInstanceRequest,
@@ -4116,36 +3555,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "put",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}",
-                    "body": "instance_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Instance.to_json(
-                compute.Instance(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateInstanceRequest.to_json(
-                    compute.UpdateInstanceRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -4155,7 +3566,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -4164,9 +3575,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _UpdateAccessConfig(InstancesRestStub):
         def __hash__(self):
@@ -4184,6 +3593,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateAccessConfigInstanceRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateAccessConfig",
+                    "body": "access_config_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateAccessConfigInstanceRequest,
@@ -4226,38 +3647,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateAccessConfig",
-                    "body": "access_config_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateAccessConfigInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.AccessConfig.to_json(
-                compute.AccessConfig(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateAccessConfigInstanceRequest.to_json(
-                    compute.UpdateAccessConfigInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -4267,7 +3658,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -4276,9 +3667,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _UpdateDisplayDevice(InstancesRestStub):
         def __hash__(self):
@@ -4294,6 +3683,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateDisplayDeviceInstanceRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateDisplayDevice",
+                    "body": "display_device_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateDisplayDeviceInstanceRequest,
@@ -4336,38 +3737,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateDisplayDevice",
-                    "body": "display_device_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateDisplayDeviceInstanceRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.DisplayDevice.to_json(
-                compute.DisplayDevice(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateDisplayDeviceInstanceRequest.to_json(
-                    compute.UpdateDisplayDeviceInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -4377,7 +3748,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -4386,9 +3757,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _UpdateNetworkInterface(InstancesRestStub):
         def __hash__(self):
@@ -4406,6 +3775,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateNetworkInterfaceInstanceRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateNetworkInterface",
+                    "body": "network_interface_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateNetworkInterfaceInstanceRequest,
@@ -4448,40 +3829,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateNetworkInterface",
-                    "body": "network_interface_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateNetworkInterfaceInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.NetworkInterface.to_json(
-                compute.NetworkInterface(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateNetworkInterfaceInstanceRequest.to_json(
-                    compute.UpdateNetworkInterfaceInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -4491,7 +3840,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -4500,9 +3849,7 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _UpdateShieldedInstanceConfig(InstancesRestStub):
         def __hash__(self):
@@ -4518,6 +3865,18 @@ class InstancesRestTransport(InstancesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdateShieldedInstanceConfigInstanceRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateShieldedInstanceConfig",
+                    "body": "shielded_instance_config_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdateShieldedInstanceConfigInstanceRequest,
@@ -4561,40 +3920,8 @@ class InstancesRestTransport(InstancesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/instances/{instance}/updateShieldedInstanceConfig",
-                    "body": "shielded_instance_config_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdateShieldedInstanceConfigInstanceRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ShieldedInstanceConfig.to_json(
-                compute.ShieldedInstanceConfig(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdateShieldedInstanceConfigInstanceRequest.to_json(
-                    compute.UpdateShieldedInstanceConfigInstanceRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -4604,7 +3931,7 @@ class InstancesRestTransport(InstancesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -4613,17 +3940,15 @@ class InstancesRestTransport(InstancesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def add_access_config(
         self,
     ) -> Callable[[compute.AddAccessConfigInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("add_access_config")
+        stub = self._stubs.get("add_access_config")
         if not stub:
-            stub = self._STUBS["add_access_config"] = self._AddAccessConfig(
+            stub = self._stubs["add_access_config"] = self._AddAccessConfig(
                 self._session, self._host
             )
 
@@ -4633,9 +3958,9 @@ class InstancesRestTransport(InstancesTransport):
     def add_resource_policies(
         self,
     ) -> Callable[[compute.AddResourcePoliciesInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("add_resource_policies")
+        stub = self._stubs.get("add_resource_policies")
         if not stub:
-            stub = self._STUBS["add_resource_policies"] = self._AddResourcePolicies(
+            stub = self._stubs["add_resource_policies"] = self._AddResourcePolicies(
                 self._session, self._host
             )
 
@@ -4647,9 +3972,9 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[
         [compute.AggregatedListInstancesRequest], compute.InstanceAggregatedList
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -4659,9 +3984,9 @@ class InstancesRestTransport(InstancesTransport):
     def attach_disk(
         self,
     ) -> Callable[[compute.AttachDiskInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("attach_disk")
+        stub = self._stubs.get("attach_disk")
         if not stub:
-            stub = self._STUBS["attach_disk"] = self._AttachDisk(
+            stub = self._stubs["attach_disk"] = self._AttachDisk(
                 self._session, self._host
             )
 
@@ -4671,9 +3996,9 @@ class InstancesRestTransport(InstancesTransport):
     def bulk_insert(
         self,
     ) -> Callable[[compute.BulkInsertInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("bulk_insert")
+        stub = self._stubs.get("bulk_insert")
         if not stub:
-            stub = self._STUBS["bulk_insert"] = self._BulkInsert(
+            stub = self._stubs["bulk_insert"] = self._BulkInsert(
                 self._session, self._host
             )
 
@@ -4681,9 +4006,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def delete(self) -> Callable[[compute.DeleteInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -4691,9 +4016,9 @@ class InstancesRestTransport(InstancesTransport):
     def delete_access_config(
         self,
     ) -> Callable[[compute.DeleteAccessConfigInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("delete_access_config")
+        stub = self._stubs.get("delete_access_config")
         if not stub:
-            stub = self._STUBS["delete_access_config"] = self._DeleteAccessConfig(
+            stub = self._stubs["delete_access_config"] = self._DeleteAccessConfig(
                 self._session, self._host
             )
 
@@ -4703,9 +4028,9 @@ class InstancesRestTransport(InstancesTransport):
     def detach_disk(
         self,
     ) -> Callable[[compute.DetachDiskInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("detach_disk")
+        stub = self._stubs.get("detach_disk")
         if not stub:
-            stub = self._STUBS["detach_disk"] = self._DetachDisk(
+            stub = self._stubs["detach_disk"] = self._DetachDisk(
                 self._session, self._host
             )
 
@@ -4713,9 +4038,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def get(self) -> Callable[[compute.GetInstanceRequest], compute.Instance]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -4726,9 +4051,9 @@ class InstancesRestTransport(InstancesTransport):
         [compute.GetEffectiveFirewallsInstanceRequest],
         compute.InstancesGetEffectiveFirewallsResponse,
     ]:
-        stub = self._STUBS.get("get_effective_firewalls")
+        stub = self._stubs.get("get_effective_firewalls")
         if not stub:
-            stub = self._STUBS["get_effective_firewalls"] = self._GetEffectiveFirewalls(
+            stub = self._stubs["get_effective_firewalls"] = self._GetEffectiveFirewalls(
                 self._session, self._host
             )
 
@@ -4738,9 +4063,9 @@ class InstancesRestTransport(InstancesTransport):
     def get_guest_attributes(
         self,
     ) -> Callable[[compute.GetGuestAttributesInstanceRequest], compute.GuestAttributes]:
-        stub = self._STUBS.get("get_guest_attributes")
+        stub = self._stubs.get("get_guest_attributes")
         if not stub:
-            stub = self._STUBS["get_guest_attributes"] = self._GetGuestAttributes(
+            stub = self._stubs["get_guest_attributes"] = self._GetGuestAttributes(
                 self._session, self._host
             )
 
@@ -4750,9 +4075,9 @@ class InstancesRestTransport(InstancesTransport):
     def get_iam_policy(
         self,
     ) -> Callable[[compute.GetIamPolicyInstanceRequest], compute.Policy]:
-        stub = self._STUBS.get("get_iam_policy")
+        stub = self._stubs.get("get_iam_policy")
         if not stub:
-            stub = self._STUBS["get_iam_policy"] = self._GetIamPolicy(
+            stub = self._stubs["get_iam_policy"] = self._GetIamPolicy(
                 self._session, self._host
             )
 
@@ -4762,9 +4087,9 @@ class InstancesRestTransport(InstancesTransport):
     def get_screenshot(
         self,
     ) -> Callable[[compute.GetScreenshotInstanceRequest], compute.Screenshot]:
-        stub = self._STUBS.get("get_screenshot")
+        stub = self._stubs.get("get_screenshot")
         if not stub:
-            stub = self._STUBS["get_screenshot"] = self._GetScreenshot(
+            stub = self._stubs["get_screenshot"] = self._GetScreenshot(
                 self._session, self._host
             )
 
@@ -4776,9 +4101,9 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[
         [compute.GetSerialPortOutputInstanceRequest], compute.SerialPortOutput
     ]:
-        stub = self._STUBS.get("get_serial_port_output")
+        stub = self._stubs.get("get_serial_port_output")
         if not stub:
-            stub = self._STUBS["get_serial_port_output"] = self._GetSerialPortOutput(
+            stub = self._stubs["get_serial_port_output"] = self._GetSerialPortOutput(
                 self._session, self._host
             )
 
@@ -4791,9 +4116,9 @@ class InstancesRestTransport(InstancesTransport):
         [compute.GetShieldedInstanceIdentityInstanceRequest],
         compute.ShieldedInstanceIdentity,
     ]:
-        stub = self._STUBS.get("get_shielded_instance_identity")
+        stub = self._stubs.get("get_shielded_instance_identity")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "get_shielded_instance_identity"
             ] = self._GetShieldedInstanceIdentity(self._session, self._host)
 
@@ -4801,17 +4126,17 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def insert(self) -> Callable[[compute.InsertInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
     @property
     def list(self) -> Callable[[compute.ListInstancesRequest], compute.InstanceList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -4821,9 +4146,9 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[
         [compute.ListReferrersInstancesRequest], compute.InstanceListReferrers
     ]:
-        stub = self._STUBS.get("list_referrers")
+        stub = self._stubs.get("list_referrers")
         if not stub:
-            stub = self._STUBS["list_referrers"] = self._ListReferrers(
+            stub = self._stubs["list_referrers"] = self._ListReferrers(
                 self._session, self._host
             )
 
@@ -4833,9 +4158,9 @@ class InstancesRestTransport(InstancesTransport):
     def remove_resource_policies(
         self,
     ) -> Callable[[compute.RemoveResourcePoliciesInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_resource_policies")
+        stub = self._stubs.get("remove_resource_policies")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "remove_resource_policies"
             ] = self._RemoveResourcePolicies(self._session, self._host)
 
@@ -4843,9 +4168,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def reset(self) -> Callable[[compute.ResetInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("reset")
+        stub = self._stubs.get("reset")
         if not stub:
-            stub = self._STUBS["reset"] = self._Reset(self._session, self._host)
+            stub = self._stubs["reset"] = self._Reset(self._session, self._host)
 
         return stub
 
@@ -4856,9 +4181,9 @@ class InstancesRestTransport(InstancesTransport):
         [compute.SendDiagnosticInterruptInstanceRequest],
         compute.SendDiagnosticInterruptInstanceResponse,
     ]:
-        stub = self._STUBS.get("send_diagnostic_interrupt")
+        stub = self._stubs.get("send_diagnostic_interrupt")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "send_diagnostic_interrupt"
             ] = self._SendDiagnosticInterrupt(self._session, self._host)
 
@@ -4868,9 +4193,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_deletion_protection(
         self,
     ) -> Callable[[compute.SetDeletionProtectionInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_deletion_protection")
+        stub = self._stubs.get("set_deletion_protection")
         if not stub:
-            stub = self._STUBS["set_deletion_protection"] = self._SetDeletionProtection(
+            stub = self._stubs["set_deletion_protection"] = self._SetDeletionProtection(
                 self._session, self._host
             )
 
@@ -4880,9 +4205,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_disk_auto_delete(
         self,
     ) -> Callable[[compute.SetDiskAutoDeleteInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_disk_auto_delete")
+        stub = self._stubs.get("set_disk_auto_delete")
         if not stub:
-            stub = self._STUBS["set_disk_auto_delete"] = self._SetDiskAutoDelete(
+            stub = self._stubs["set_disk_auto_delete"] = self._SetDiskAutoDelete(
                 self._session, self._host
             )
 
@@ -4892,9 +4217,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_iam_policy(
         self,
     ) -> Callable[[compute.SetIamPolicyInstanceRequest], compute.Policy]:
-        stub = self._STUBS.get("set_iam_policy")
+        stub = self._stubs.get("set_iam_policy")
         if not stub:
-            stub = self._STUBS["set_iam_policy"] = self._SetIamPolicy(
+            stub = self._stubs["set_iam_policy"] = self._SetIamPolicy(
                 self._session, self._host
             )
 
@@ -4904,9 +4229,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_labels(
         self,
     ) -> Callable[[compute.SetLabelsInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_labels")
+        stub = self._stubs.get("set_labels")
         if not stub:
-            stub = self._STUBS["set_labels"] = self._SetLabels(
+            stub = self._stubs["set_labels"] = self._SetLabels(
                 self._session, self._host
             )
 
@@ -4916,9 +4241,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_machine_resources(
         self,
     ) -> Callable[[compute.SetMachineResourcesInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_machine_resources")
+        stub = self._stubs.get("set_machine_resources")
         if not stub:
-            stub = self._STUBS["set_machine_resources"] = self._SetMachineResources(
+            stub = self._stubs["set_machine_resources"] = self._SetMachineResources(
                 self._session, self._host
             )
 
@@ -4928,9 +4253,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_machine_type(
         self,
     ) -> Callable[[compute.SetMachineTypeInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_machine_type")
+        stub = self._stubs.get("set_machine_type")
         if not stub:
-            stub = self._STUBS["set_machine_type"] = self._SetMachineType(
+            stub = self._stubs["set_machine_type"] = self._SetMachineType(
                 self._session, self._host
             )
 
@@ -4940,9 +4265,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_metadata(
         self,
     ) -> Callable[[compute.SetMetadataInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_metadata")
+        stub = self._stubs.get("set_metadata")
         if not stub:
-            stub = self._STUBS["set_metadata"] = self._SetMetadata(
+            stub = self._stubs["set_metadata"] = self._SetMetadata(
                 self._session, self._host
             )
 
@@ -4952,9 +4277,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_min_cpu_platform(
         self,
     ) -> Callable[[compute.SetMinCpuPlatformInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_min_cpu_platform")
+        stub = self._stubs.get("set_min_cpu_platform")
         if not stub:
-            stub = self._STUBS["set_min_cpu_platform"] = self._SetMinCpuPlatform(
+            stub = self._stubs["set_min_cpu_platform"] = self._SetMinCpuPlatform(
                 self._session, self._host
             )
 
@@ -4964,9 +4289,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_scheduling(
         self,
     ) -> Callable[[compute.SetSchedulingInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_scheduling")
+        stub = self._stubs.get("set_scheduling")
         if not stub:
-            stub = self._STUBS["set_scheduling"] = self._SetScheduling(
+            stub = self._stubs["set_scheduling"] = self._SetScheduling(
                 self._session, self._host
             )
 
@@ -4976,9 +4301,9 @@ class InstancesRestTransport(InstancesTransport):
     def set_service_account(
         self,
     ) -> Callable[[compute.SetServiceAccountInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_service_account")
+        stub = self._stubs.get("set_service_account")
         if not stub:
-            stub = self._STUBS["set_service_account"] = self._SetServiceAccount(
+            stub = self._stubs["set_service_account"] = self._SetServiceAccount(
                 self._session, self._host
             )
 
@@ -4990,9 +4315,9 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[
         [compute.SetShieldedInstanceIntegrityPolicyInstanceRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("set_shielded_instance_integrity_policy")
+        stub = self._stubs.get("set_shielded_instance_integrity_policy")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "set_shielded_instance_integrity_policy"
             ] = self._SetShieldedInstanceIntegrityPolicy(self._session, self._host)
 
@@ -5000,9 +4325,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def set_tags(self) -> Callable[[compute.SetTagsInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("set_tags")
+        stub = self._stubs.get("set_tags")
         if not stub:
-            stub = self._STUBS["set_tags"] = self._SetTags(self._session, self._host)
+            stub = self._stubs["set_tags"] = self._SetTags(self._session, self._host)
 
         return stub
 
@@ -5010,9 +4335,9 @@ class InstancesRestTransport(InstancesTransport):
     def simulate_maintenance_event(
         self,
     ) -> Callable[[compute.SimulateMaintenanceEventInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("simulate_maintenance_event")
+        stub = self._stubs.get("simulate_maintenance_event")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "simulate_maintenance_event"
             ] = self._SimulateMaintenanceEvent(self._session, self._host)
 
@@ -5020,9 +4345,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def start(self) -> Callable[[compute.StartInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("start")
+        stub = self._stubs.get("start")
         if not stub:
-            stub = self._STUBS["start"] = self._Start(self._session, self._host)
+            stub = self._stubs["start"] = self._Start(self._session, self._host)
 
         return stub
 
@@ -5030,9 +4355,9 @@ class InstancesRestTransport(InstancesTransport):
     def start_with_encryption_key(
         self,
     ) -> Callable[[compute.StartWithEncryptionKeyInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("start_with_encryption_key")
+        stub = self._stubs.get("start_with_encryption_key")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "start_with_encryption_key"
             ] = self._StartWithEncryptionKey(self._session, self._host)
 
@@ -5040,9 +4365,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def stop(self) -> Callable[[compute.StopInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("stop")
+        stub = self._stubs.get("stop")
         if not stub:
-            stub = self._STUBS["stop"] = self._Stop(self._session, self._host)
+            stub = self._stubs["stop"] = self._Stop(self._session, self._host)
 
         return stub
 
@@ -5052,9 +4377,9 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[
         [compute.TestIamPermissionsInstanceRequest], compute.TestPermissionsResponse
     ]:
-        stub = self._STUBS.get("test_iam_permissions")
+        stub = self._stubs.get("test_iam_permissions")
         if not stub:
-            stub = self._STUBS["test_iam_permissions"] = self._TestIamPermissions(
+            stub = self._stubs["test_iam_permissions"] = self._TestIamPermissions(
                 self._session, self._host
             )
 
@@ -5062,9 +4387,9 @@ class InstancesRestTransport(InstancesTransport):
 
     @property
     def update(self) -> Callable[[compute.UpdateInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("update")
+        stub = self._stubs.get("update")
         if not stub:
-            stub = self._STUBS["update"] = self._Update(self._session, self._host)
+            stub = self._stubs["update"] = self._Update(self._session, self._host)
 
         return stub
 
@@ -5072,9 +4397,9 @@ class InstancesRestTransport(InstancesTransport):
     def update_access_config(
         self,
     ) -> Callable[[compute.UpdateAccessConfigInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("update_access_config")
+        stub = self._stubs.get("update_access_config")
         if not stub:
-            stub = self._STUBS["update_access_config"] = self._UpdateAccessConfig(
+            stub = self._stubs["update_access_config"] = self._UpdateAccessConfig(
                 self._session, self._host
             )
 
@@ -5084,9 +4409,9 @@ class InstancesRestTransport(InstancesTransport):
     def update_display_device(
         self,
     ) -> Callable[[compute.UpdateDisplayDeviceInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("update_display_device")
+        stub = self._stubs.get("update_display_device")
         if not stub:
-            stub = self._STUBS["update_display_device"] = self._UpdateDisplayDevice(
+            stub = self._stubs["update_display_device"] = self._UpdateDisplayDevice(
                 self._session, self._host
             )
 
@@ -5096,9 +4421,9 @@ class InstancesRestTransport(InstancesTransport):
     def update_network_interface(
         self,
     ) -> Callable[[compute.UpdateNetworkInterfaceInstanceRequest], compute.Operation]:
-        stub = self._STUBS.get("update_network_interface")
+        stub = self._stubs.get("update_network_interface")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "update_network_interface"
             ] = self._UpdateNetworkInterface(self._session, self._host)
 
@@ -5110,16 +4435,17 @@ class InstancesRestTransport(InstancesTransport):
     ) -> Callable[
         [compute.UpdateShieldedInstanceConfigInstanceRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("update_shielded_instance_config")
+        stub = self._stubs.get("update_shielded_instance_config")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "update_shielded_instance_config"
             ] = self._UpdateShieldedInstanceConfig(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("InstancesRestTransport",)
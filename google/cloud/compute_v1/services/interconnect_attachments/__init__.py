@@ -15,4 +15,18 @@
 #
 from .client import InterconnectAttachmentsClient
 
-__all__ = ("InterconnectAttachmentsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InterconnectAttachmentsAsyncClient":
+        from .async_client import InterconnectAttachmentsAsyncClient
+
+        return InterconnectAttachmentsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InterconnectAttachmentsClient",
+    "InterconnectAttachmentsAsyncClient",
+)
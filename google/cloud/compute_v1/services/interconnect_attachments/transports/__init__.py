@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[InterconnectAttachmentsTransport]]
 _transport_registry["rest"] = InterconnectAttachmentsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InterconnectAttachmentsAsyncRestTransport":
+        from .rest_asyncio import InterconnectAttachmentsAsyncRestTransport
+
+        return InterconnectAttachmentsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InterconnectAttachmentsTransport",
     "InterconnectAttachmentsRestTransport",
+    "InterconnectAttachmentsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import InterconnectLocationsClient
 
-__all__ = ("InterconnectLocationsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InterconnectLocationsAsyncClient":
+        from .async_client import InterconnectLocationsAsyncClient
+
+        return InterconnectLocationsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InterconnectLocationsClient",
+    "InterconnectLocationsAsyncClient",
+)
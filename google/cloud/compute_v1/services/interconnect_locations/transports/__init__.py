@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[InterconnectLocationsTransport]]
 _transport_registry["rest"] = InterconnectLocationsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InterconnectLocationsAsyncRestTransport":
+        from .rest_asyncio import InterconnectLocationsAsyncRestTransport
+
+        return InterconnectLocationsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InterconnectLocationsTransport",
     "InterconnectLocationsRestTransport",
+    "InterconnectLocationsAsyncRestTransport",
 )
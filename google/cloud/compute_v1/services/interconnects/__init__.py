@@ -15,4 +15,18 @@
 #
 from .client import InterconnectsClient
 
-__all__ = ("InterconnectsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "InterconnectsAsyncClient":
+        from .async_client import InterconnectsAsyncClient
+
+        return InterconnectsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "InterconnectsClient",
+    "InterconnectsAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import InterconnectsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[InterconnectsTransport]]
 _transport_registry["rest"] = InterconnectsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "InterconnectsAsyncRestTransport":
+        from .rest_asyncio import InterconnectsAsyncRestTransport
+
+        return InterconnectsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "InterconnectsTransport",
     "InterconnectsRestTransport",
+    "InterconnectsAsyncRestTransport",
 )
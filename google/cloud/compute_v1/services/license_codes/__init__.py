@@ -15,4 +15,18 @@
 #
 from .client import LicenseCodesClient
 
-__all__ = ("LicenseCodesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "LicenseCodesAsyncClient":
+        from .async_client import LicenseCodesAsyncClient
+
+        return LicenseCodesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "LicenseCodesClient",
+    "LicenseCodesAsyncClient",
+)
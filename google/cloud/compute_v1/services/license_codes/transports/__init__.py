@@ -24,7 +24,19 @@ from .rest import LicenseCodesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[LicenseCodesTransport]]
 _transport_registry["rest"] = LicenseCodesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "LicenseCodesAsyncRestTransport":
+        from .rest_asyncio import LicenseCodesAsyncRestTransport
+
+        return LicenseCodesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "LicenseCodesTransport",
     "LicenseCodesRestTransport",
+    "LicenseCodesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import LicensesClient
 
-__all__ = ("LicensesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "LicensesAsyncClient":
+        from .async_client import LicensesAsyncClient
+
+        return LicensesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "LicensesClient",
+    "LicensesAsyncClient",
+)
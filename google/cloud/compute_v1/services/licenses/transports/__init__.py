@@ -24,7 +24,19 @@ from .rest import LicensesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[LicensesTransport]]
 _transport_registry["rest"] = LicensesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "LicensesAsyncRestTransport":
+        from .rest_asyncio import LicensesAsyncRestTransport
+
+        return LicensesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "LicensesTransport",
     "LicensesRestTransport",
+    "LicensesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import MachineTypesClient
 
-__all__ = ("MachineTypesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "MachineTypesAsyncClient":
+        from .async_client import MachineTypesAsyncClient
+
+        return MachineTypesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "MachineTypesClient",
+    "MachineTypesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import MachineTypesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[MachineTypesTransport]]
 _transport_registry["rest"] = MachineTypesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "MachineTypesAsyncRestTransport":
+        from .rest_asyncio import MachineTypesAsyncRestTransport
+
+        return MachineTypesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "MachineTypesTransport",
     "MachineTypesRestTransport",
+    "MachineTypesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import NetworkEndpointGroupsClient
 
-__all__ = ("NetworkEndpointGroupsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "NetworkEndpointGroupsAsyncClient":
+        from .async_client import NetworkEndpointGroupsAsyncClient
+
+        return NetworkEndpointGroupsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "NetworkEndpointGroupsClient",
+    "NetworkEndpointGroupsAsyncClient",
+)
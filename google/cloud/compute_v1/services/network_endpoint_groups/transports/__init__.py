@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[NetworkEndpointGroupsTransport]]
 _transport_registry["rest"] = NetworkEndpointGroupsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "NetworkEndpointGroupsAsyncRestTransport":
+        from .rest_asyncio import NetworkEndpointGroupsAsyncRestTransport
+
+        return NetworkEndpointGroupsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "NetworkEndpointGroupsTransport",
     "NetworkEndpointGroupsRestTransport",
+    "NetworkEndpointGroupsAsyncRestTransport",
 )
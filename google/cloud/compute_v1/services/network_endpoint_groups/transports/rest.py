@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    NetworkEndpointGroupsTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import NetworkEndpointGroupsTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, NetworkEndpointGroupsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, NetworkEndpointGroupsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(NetworkEndpointGroupsRestStub):
@@ -146,6 +174,17 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListNetworkEndpointGroupsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/networkEndpointGroups",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListNetworkEndpointGroupsRequest,
@@ -153,6 +192,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.NetworkEndpointGroupAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -167,39 +208,21 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.NetworkEndpointGroupAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/networkEndpointGroups",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListNetworkEndpointGroupsRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListNetworkEndpointGroupsRequest.to_json(
-                    compute.AggregatedListNetworkEndpointGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -209,7 +232,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -217,8 +240,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.NetworkEndpointGroupAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.NetworkEndpointGroupAggregatedList, response.content, lazy=views
             )
 
     class _AttachNetworkEndpoints(NetworkEndpointGroupsRestStub):
@@ -235,6 +258,18 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AttachNetworkEndpointsNetworkEndpointGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}/attachNetworkEndpoints",
+                    "body": "network_endpoint_groups_attach_endpoints_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AttachNetworkEndpointsNetworkEndpointGroupRequest,
@@ -277,42 +312,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}/attachNetworkEndpoints",
-                    "body": "network_endpoint_groups_attach_endpoints_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AttachNetworkEndpointsNetworkEndpointGroupRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.NetworkEndpointGroupsAttachEndpointsRequest.to_json(
-                compute.NetworkEndpointGroupsAttachEndpointsRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AttachNetworkEndpointsNetworkEndpointGroupRequest.to_json(
-                    compute.AttachNetworkEndpointsNetworkEndpointGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -322,7 +323,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -331,9 +332,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(NetworkEndpointGroupsRestStub):
         def __hash__(self):
@@ -349,6 +348,17 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteNetworkEndpointGroupRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteNetworkEndpointGroupRequest,
@@ -391,31 +401,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteNetworkEndpointGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteNetworkEndpointGroupRequest.to_json(
-                    compute.DeleteNetworkEndpointGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -425,7 +412,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -433,9 +420,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DetachNetworkEndpoints(NetworkEndpointGroupsRestStub):
         def __hash__(self):
@@ -451,6 +436,18 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DetachNetworkEndpointsNetworkEndpointGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}/detachNetworkEndpoints",
+                    "body": "network_endpoint_groups_detach_endpoints_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DetachNetworkEndpointsNetworkEndpointGroupRequest,
@@ -493,42 +490,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}/detachNetworkEndpoints",
-                    "body": "network_endpoint_groups_detach_endpoints_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.DetachNetworkEndpointsNetworkEndpointGroupRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.NetworkEndpointGroupsDetachEndpointsRequest.to_json(
-                compute.NetworkEndpointGroupsDetachEndpointsRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DetachNetworkEndpointsNetworkEndpointGroupRequest.to_json(
-                    compute.DetachNetworkEndpointsNetworkEndpointGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -538,7 +501,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -547,9 +510,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(NetworkEndpointGroupsRestStub):
         def __hash__(self):
@@ -565,6 +526,17 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetNetworkEndpointGroupRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetNetworkEndpointGroupRequest,
@@ -572,6 +544,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.NetworkEndpointGroup:
             r"""Call the get method over HTTP.
 
@@ -586,6 +559,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.NetworkEndpointGroup:
@@ -603,31 +578,10 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}",
-                },
-            ]
-
-            request_kwargs = compute.GetNetworkEndpointGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetNetworkEndpointGroupRequest.to_json(
-                    compute.GetNetworkEndpointGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -637,7 +591,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -645,8 +599,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.NetworkEndpointGroup.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.NetworkEndpointGroup, response.content
             )
 
     class _Insert(NetworkEndpointGroupsRestStub):
@@ -663,6 +617,18 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertNetworkEndpointGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups",
+                    "body": "network_endpoint_group_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertNetworkEndpointGroupRequest,
@@ -705,38 +671,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups",
-                    "body": "network_endpoint_group_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertNetworkEndpointGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.NetworkEndpointGroup.to_json(
-                compute.NetworkEndpointGroup(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertNetworkEndpointGroupRequest.to_json(
-                    compute.InsertNetworkEndpointGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -746,7 +682,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -755,9 +691,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(NetworkEndpointGroupsRestStub):
         def __hash__(self):
@@ -773,6 +707,17 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListNetworkEndpointGroupsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListNetworkEndpointGroupsRequest,
@@ -780,6 +725,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.NetworkEndpointGroupList:
             r"""Call the list method over HTTP.
 
@@ -794,37 +741,21 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.NetworkEndpointGroupList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups",
-                },
-            ]
-
-            request_kwargs = compute.ListNetworkEndpointGroupsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListNetworkEndpointGroupsRequest.to_json(
-                    compute.ListNetworkEndpointGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -834,7 +765,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -842,8 +773,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.NetworkEndpointGroupList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.NetworkEndpointGroupList, response.content, lazy=views
             )
 
     class _ListNetworkEndpoints(NetworkEndpointGroupsRestStub):
@@ -860,6 +791,18 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListNetworkEndpointsNetworkEndpointGroupsRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}/listNetworkEndpoints",
+                    "body": "network_endpoint_groups_list_endpoints_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListNetworkEndpointsNetworkEndpointGroupsRequest,
@@ -887,42 +830,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{network_endpoint_group}/listNetworkEndpoints",
-                    "body": "network_endpoint_groups_list_endpoints_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ListNetworkEndpointsNetworkEndpointGroupsRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.NetworkEndpointGroupsListEndpointsRequest.to_json(
-                compute.NetworkEndpointGroupsListEndpointsRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListNetworkEndpointsNetworkEndpointGroupsRequest.to_json(
-                    compute.ListNetworkEndpointsNetworkEndpointGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -932,7 +841,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -941,8 +850,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.NetworkEndpointGroupsListNetworkEndpoints.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.NetworkEndpointGroupsListNetworkEndpoints, response.content
             )
 
     class _TestIamPermissions(NetworkEndpointGroupsRestStub):
@@ -959,6 +868,18 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.TestIamPermissionsNetworkEndpointGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{resource}/testIamPermissions",
+                    "body": "test_permissions_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.TestIamPermissionsNetworkEndpointGroupRequest,
@@ -986,40 +907,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/zones/{zone}/networkEndpointGroups/{resource}/testIamPermissions",
-                    "body": "test_permissions_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.TestIamPermissionsNetworkEndpointGroupRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TestPermissionsRequest.to_json(
-                compute.TestPermissionsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.TestIamPermissionsNetworkEndpointGroupRequest.to_json(
-                    compute.TestIamPermissionsNetworkEndpointGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1029,7 +918,7 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1038,8 +927,8 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TestPermissionsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TestPermissionsResponse, response.content
             )
 
     @property
@@ -1049,9 +938,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
         [compute.AggregatedListNetworkEndpointGroupsRequest],
         compute.NetworkEndpointGroupAggregatedList,
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -1063,9 +952,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ) -> Callable[
         [compute.AttachNetworkEndpointsNetworkEndpointGroupRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("attach_network_endpoints")
+        stub = self._stubs.get("attach_network_endpoints")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "attach_network_endpoints"
             ] = self._AttachNetworkEndpoints(self._session, self._host)
 
@@ -1075,9 +964,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteNetworkEndpointGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -1087,9 +976,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ) -> Callable[
         [compute.DetachNetworkEndpointsNetworkEndpointGroupRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("detach_network_endpoints")
+        stub = self._stubs.get("detach_network_endpoints")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "detach_network_endpoints"
             ] = self._DetachNetworkEndpoints(self._session, self._host)
 
@@ -1101,9 +990,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ) -> Callable[
         [compute.GetNetworkEndpointGroupRequest], compute.NetworkEndpointGroup
     ]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1111,9 +1000,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertNetworkEndpointGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1123,9 +1012,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
     ) -> Callable[
         [compute.ListNetworkEndpointGroupsRequest], compute.NetworkEndpointGroupList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1136,9 +1025,9 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
         [compute.ListNetworkEndpointsNetworkEndpointGroupsRequest],
         compute.NetworkEndpointGroupsListNetworkEndpoints,
     ]:
-        stub = self._STUBS.get("list_network_endpoints")
+        stub = self._stubs.get("list_network_endpoints")
         if not stub:
-            stub = self._STUBS["list_network_endpoints"] = self._ListNetworkEndpoints(
+            stub = self._stubs["list_network_endpoints"] = self._ListNetworkEndpoints(
                 self._session, self._host
             )
 
@@ -1151,16 +1040,17 @@ class NetworkEndpointGroupsRestTransport(NetworkEndpointGroupsTransport):
         [compute.TestIamPermissionsNetworkEndpointGroupRequest],
         compute.TestPermissionsResponse,
     ]:
-        stub = self._STUBS.get("test_iam_permissions")
+        stub = self._stubs.get("test_iam_permissions")
         if not stub:
-            stub = self._STUBS["test_iam_permissions"] = self._TestIamPermissions(
+            stub = self._stubs["test_iam_permissions"] = self._TestIamPermissions(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("NetworkEndpointGroupsRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import NetworksClient
 
-__all__ = ("NetworksClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "NetworksAsyncClient":
+        from .async_client import NetworksAsyncClient
+
+        return NetworksAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "NetworksClient",
+    "NetworksAsyncClient",
+)
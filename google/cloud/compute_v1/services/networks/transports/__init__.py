@@ -24,7 +24,19 @@ from .rest import NetworksRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[NetworksTransport]]
 _transport_registry["rest"] = NetworksRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "NetworksAsyncRestTransport":
+        from .rest_asyncio import NetworksAsyncRestTransport
+
+        return NetworksAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "NetworksTransport",
     "NetworksRestTransport",
+    "NetworksAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import NodeGroupsClient
 
-__all__ = ("NodeGroupsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "NodeGroupsAsyncClient":
+        from .async_client import NodeGroupsAsyncClient
+
+        return NodeGroupsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "NodeGroupsClient",
+    "NodeGroupsAsyncClient",
+)
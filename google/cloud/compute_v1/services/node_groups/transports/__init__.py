@@ -24,7 +24,19 @@ from .rest import NodeGroupsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[NodeGroupsTransport]]
 _transport_registry["rest"] = NodeGroupsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "NodeGroupsAsyncRestTransport":
+        from .rest_asyncio import NodeGroupsAsyncRestTransport
+
+        return NodeGroupsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "NodeGroupsTransport",
     "NodeGroupsRestTransport",
+    "NodeGroupsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import NodeTemplatesClient
 
-__all__ = ("NodeTemplatesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "NodeTemplatesAsyncClient":
+        from .async_client import NodeTemplatesAsyncClient
+
+        return NodeTemplatesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "NodeTemplatesClient",
+    "NodeTemplatesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import NodeTemplatesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[NodeTemplatesTransport]]
 _transport_registry["rest"] = NodeTemplatesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "NodeTemplatesAsyncRestTransport":
+        from .rest_asyncio import NodeTemplatesAsyncRestTransport
+
+        return NodeTemplatesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "NodeTemplatesTransport",
     "NodeTemplatesRestTransport",
+    "NodeTemplatesAsyncRestTransport",
 )
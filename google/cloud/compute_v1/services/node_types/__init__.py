@@ -15,4 +15,18 @@
 #
 from .client import NodeTypesClient
 
-__all__ = ("NodeTypesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "NodeTypesAsyncClient":
+        from .async_client import NodeTypesAsyncClient
+
+        return NodeTypesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "NodeTypesClient",
+    "NodeTypesAsyncClient",
+)
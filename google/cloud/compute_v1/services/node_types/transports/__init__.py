@@ -24,7 +24,19 @@ from .rest import NodeTypesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[NodeTypesTransport]]
 _transport_registry["rest"] = NodeTypesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "NodeTypesAsyncRestTransport":
+        from .rest_asyncio import NodeTypesAsyncRestTransport
+
+        return NodeTypesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "NodeTypesTransport",
     "NodeTypesRestTransport",
+    "NodeTypesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import PacketMirroringsClient
 
-__all__ = ("PacketMirroringsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "PacketMirroringsAsyncClient":
+        from .async_client import PacketMirroringsAsyncClient
+
+        return PacketMirroringsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "PacketMirroringsClient",
+    "PacketMirroringsAsyncClient",
+)
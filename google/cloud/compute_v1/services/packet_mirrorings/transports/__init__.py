@@ -24,7 +24,19 @@ from .rest import PacketMirroringsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[PacketMirroringsTransport]]
 _transport_registry["rest"] = PacketMirroringsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "PacketMirroringsAsyncRestTransport":
+        from .rest_asyncio import PacketMirroringsAsyncRestTransport
+
+        return PacketMirroringsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "PacketMirroringsTransport",
     "PacketMirroringsRestTransport",
+    "PacketMirroringsAsyncRestTransport",
 )
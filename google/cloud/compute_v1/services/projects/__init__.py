@@ -15,4 +15,18 @@
 #
 from .client import ProjectsClient
 
-__all__ = ("ProjectsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ProjectsAsyncClient":
+        from .async_client import ProjectsAsyncClient
+
+        return ProjectsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ProjectsClient",
+    "ProjectsAsyncClient",
+)
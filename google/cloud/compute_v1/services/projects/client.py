@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,12 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.projects import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import ProjectsTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import ProjectsRestTransport
@@ -285,7 +291,9 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, ProjectsTransport, None] = None,
+        transport: Union[
+            str, ProjectsTransport, Callable[..., ProjectsTransport], None
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -297,9 +305,13 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, ProjectsTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, ProjectsTransport, Callable[..., ProjectsTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the ProjectsTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -316,6 +328,22 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -327,7 +355,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -341,6 +369,11 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -356,6 +389,26 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -367,8 +420,26 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[ProjectsTransport], Callable[..., ProjectsTransport]
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -377,6 +448,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def disable_xpn_host_unary(
@@ -385,7 +457,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Disable this project as a shared VPC host project.
@@ -456,6 +528,44 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def disable_xpn_host(
+        self,
+        request: Union[compute.DisableXpnHostProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Disable this project as a shared VPC host project.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DisableXpnHostProjectRequest, dict]):
+                The request object. A request message for
+                Projects.DisableXpnHost. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.disable_xpn_host_unary(
+            request, project=project, retry=retry, timeout=timeout, metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def disable_xpn_resource_unary(
         self,
         request: Union[compute.DisableXpnResourceProjectRequest, dict] = None,
@@ -463,7 +573,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         projects_disable_xpn_resource_request_resource: compute.ProjectsDisableXpnResourceRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Disable a service resource (also known as service
@@ -546,13 +656,63 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def disable_xpn_resource(
+        self,
+        request: Union[compute.DisableXpnResourceProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        projects_disable_xpn_resource_request_resource: compute.ProjectsDisableXpnResourceRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Disable a service resource (also known as service
+        project) associated with this host project.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DisableXpnResourceProjectRequest, dict]):
+                The request object. A request message for
+                Projects.DisableXpnResource. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            projects_disable_xpn_resource_request_resource (google.cloud.compute_v1.types.ProjectsDisableXpnResourceRequest):
+                The body resource for this request
+                This corresponds to the ``projects_disable_xpn_resource_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.disable_xpn_resource_unary(
+            request,
+            project=project,
+            projects_disable_xpn_resource_request_resource=projects_disable_xpn_resource_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def enable_xpn_host_unary(
         self,
         request: Union[compute.EnableXpnHostProjectRequest, dict] = None,
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Enable this project as a shared VPC host project.
@@ -623,6 +783,44 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def enable_xpn_host(
+        self,
+        request: Union[compute.EnableXpnHostProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Enable this project as a shared VPC host project.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.EnableXpnHostProjectRequest, dict]):
+                The request object. A request message for
+                Projects.EnableXpnHost. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.enable_xpn_host_unary(
+            request, project=project, retry=retry, timeout=timeout, metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def enable_xpn_resource_unary(
         self,
         request: Union[compute.EnableXpnResourceProjectRequest, dict] = None,
@@ -630,7 +828,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         projects_enable_xpn_resource_request_resource: compute.ProjectsEnableXpnResourceRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Enable service resource (a.k.a service project) for a
@@ -714,14 +912,66 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def enable_xpn_resource(
+        self,
+        request: Union[compute.EnableXpnResourceProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        projects_enable_xpn_resource_request_resource: compute.ProjectsEnableXpnResourceRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Enable service resource (a.k.a service project) for a
+        host project, so that subnets in the host project can be
+        used by instances in the service project.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.EnableXpnResourceProjectRequest, dict]):
+                The request object. A request message for
+                Projects.EnableXpnResource. See the method description
+                for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            projects_enable_xpn_resource_request_resource (google.cloud.compute_v1.types.ProjectsEnableXpnResourceRequest):
+                The body resource for this request
+                This corresponds to the ``projects_enable_xpn_resource_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.enable_xpn_resource_unary(
+            request,
+            project=project,
+            projects_enable_xpn_resource_request_resource=projects_enable_xpn_resource_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetProjectRequest, dict] = None,
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.Project:
         r"""Returns the specified Project resource.
 
@@ -739,6 +989,10 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.Project:
@@ -774,6 +1028,10 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -786,7 +1044,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Project:
         r"""Gets the shared VPC host project that this project
@@ -854,8 +1112,11 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         *,
         project: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.GetXpnResourcesPager:
         r"""Gets service resources (a.k.a service project)
         associated with this host project.
@@ -875,6 +1136,19 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.projects.pagers.GetXpnResourcesPager:
@@ -893,6 +1167,24 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.GetXpnResourcesProjectsRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.GetXpnResourcesProjectsRequest.
         # There's no risk of modifying the input as we've already verified
@@ -904,17 +1196,29 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
             if project is not None:
                 request.project = project
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get_xpn_resources]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.GetXpnResourcesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -927,8 +1231,11 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         projects_list_xpn_hosts_request_resource: compute.ProjectsListXpnHostsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListXpnHostsPager:
         r"""Lists all shared VPC host projects visible to the
         user in an organization.
@@ -953,6 +1260,19 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.projects.pagers.ListXpnHostsPager:
@@ -971,6 +1291,24 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListXpnHostsProjectsRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListXpnHostsProjectsRequest.
         # There's no risk of modifying the input as we've already verified
@@ -986,17 +1324,29 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
                     projects_list_xpn_hosts_request_resource
                 )
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_xpn_hosts]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListXpnHostsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1009,7 +1359,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         disk_move_request_resource: compute.DiskMoveRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Moves a persistent disk from one zone to another.
@@ -1087,6 +1437,55 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def move_disk(
+        self,
+        request: Union[compute.MoveDiskProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        disk_move_request_resource: compute.DiskMoveRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Moves a persistent disk from one zone to another.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.MoveDiskProjectRequest, dict]):
+                The request object. A request message for
+                Projects.MoveDisk. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            disk_move_request_resource (google.cloud.compute_v1.types.DiskMoveRequest):
+                The body resource for this request
+                This corresponds to the ``disk_move_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.move_disk_unary(
+            request,
+            project=project,
+            disk_move_request_resource=disk_move_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def move_instance_unary(
         self,
         request: Union[compute.MoveInstanceProjectRequest, dict] = None,
@@ -1094,7 +1493,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         instance_move_request_resource: compute.InstanceMoveRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Moves an instance and its attached persistent disks
@@ -1173,6 +1572,56 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def move_instance(
+        self,
+        request: Union[compute.MoveInstanceProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        instance_move_request_resource: compute.InstanceMoveRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Moves an instance and its attached persistent disks
+        from one zone to another.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.MoveInstanceProjectRequest, dict]):
+                The request object. A request message for
+                Projects.MoveInstance. See the method description for
+                details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_move_request_resource (google.cloud.compute_v1.types.InstanceMoveRequest):
+                The body resource for this request
+                This corresponds to the ``instance_move_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.move_instance_unary(
+            request,
+            project=project,
+            instance_move_request_resource=instance_move_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_common_instance_metadata_unary(
         self,
         request: Union[compute.SetCommonInstanceMetadataProjectRequest, dict] = None,
@@ -1180,7 +1629,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         metadata_resource: compute.Metadata = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets metadata common to all instances within the
@@ -1262,6 +1711,57 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def set_common_instance_metadata(
+        self,
+        request: Union[compute.SetCommonInstanceMetadataProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        metadata_resource: compute.Metadata = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets metadata common to all instances within the
+        specified project using the data included in the
+        request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetCommonInstanceMetadataProjectRequest, dict]):
+                The request object. A request message for
+                Projects.SetCommonInstanceMetadata. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            metadata_resource (google.cloud.compute_v1.types.Metadata):
+                The body resource for this request
+                This corresponds to the ``metadata_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_common_instance_metadata_unary(
+            request,
+            project=project,
+            metadata_resource=metadata_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_default_network_tier_unary(
         self,
         request: Union[compute.SetDefaultNetworkTierProjectRequest, dict] = None,
@@ -1269,7 +1769,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         projects_set_default_network_tier_request_resource: compute.ProjectsSetDefaultNetworkTierRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets the default network tier of the project. The
@@ -1354,6 +1854,58 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def set_default_network_tier(
+        self,
+        request: Union[compute.SetDefaultNetworkTierProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        projects_set_default_network_tier_request_resource: compute.ProjectsSetDefaultNetworkTierRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets the default network tier of the project. The
+        default network tier is used when an
+        address/forwardingRule/instance is created without
+        specifying the network tier field.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetDefaultNetworkTierProjectRequest, dict]):
+                The request object. A request message for
+                Projects.SetDefaultNetworkTier. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            projects_set_default_network_tier_request_resource (google.cloud.compute_v1.types.ProjectsSetDefaultNetworkTierRequest):
+                The body resource for this request
+                This corresponds to the ``projects_set_default_network_tier_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_default_network_tier_unary(
+            request,
+            project=project,
+            projects_set_default_network_tier_request_resource=projects_set_default_network_tier_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_usage_export_bucket_unary(
         self,
         request: Union[compute.SetUsageExportBucketProjectRequest, dict] = None,
@@ -1361,7 +1913,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         project: str = None,
         usage_export_location_resource: compute.UsageExportLocation = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Enables the usage export feature and sets the usage
@@ -1442,6 +1994,58 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         # Done; return the response.
         return response
 
+    def set_usage_export_bucket(
+        self,
+        request: Union[compute.SetUsageExportBucketProjectRequest, dict] = None,
+        *,
+        project: str = None,
+        usage_export_location_resource: compute.UsageExportLocation = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Enables the usage export feature and sets the usage
+        export bucket where reports are stored. If you provide
+        an empty request body using this method, the usage
+        export feature will be disabled.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetUsageExportBucketProjectRequest, dict]):
+                The request object. A request message for
+                Projects.SetUsageExportBucket. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            usage_export_location_resource (google.cloud.compute_v1.types.UsageExportLocation):
+                The body resource for this request
+                This corresponds to the ``usage_export_location_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_usage_export_bucket_unary(
+            request,
+            project=project,
+            usage_export_location_resource=usage_export_location_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def __enter__(self):
         return self
 
@@ -1456,12 +2060,7 @@ class ProjectsClient(metaclass=ProjectsClientMeta):
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("ProjectsClient",)
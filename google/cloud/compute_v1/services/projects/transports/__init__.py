@@ -24,7 +24,19 @@ from .rest import ProjectsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ProjectsTransport]]
 _transport_registry["rest"] = ProjectsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ProjectsAsyncRestTransport":
+        from .rest_asyncio import ProjectsAsyncRestTransport
+
+        return ProjectsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ProjectsTransport",
     "ProjectsRestTransport",
+    "ProjectsAsyncRestTransport",
 )
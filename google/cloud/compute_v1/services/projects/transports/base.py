@@ -15,7 +15,6 @@
 #
 import abc
 from typing import Awaitable, Callable, Dict, Optional, Sequence, Union
-import pkg_resources
 
 import google.auth  # type: ignore
 import google.api_core
@@ -25,14 +24,13 @@ from google.api_core import retry as retries
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.oauth2 import service_account  # type: ignore
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import coalescing
+from google.cloud.compute_v1 import rate_limiting
+from google.cloud.compute_v1 import retry_policy
 from google.cloud.compute_v1.types import compute
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 class ProjectsTransport(abc.ABC):
@@ -45,6 +43,13 @@ class ProjectsTransport(abc.ABC):
 
     DEFAULT_HOST: str = "compute.googleapis.com"
 
+    # The default retry and timeout of each method.
+    _retry_policy = retry_policy.DEFAULT_RETRY_POLICY
+    # The limiter that paces the calls, if any.
+    _rate_limiter = None
+    # The coalescer of identical reads in flight, if any.
+    _coalescer = None
+
     def __init__(
         self,
         *,
@@ -121,51 +126,128 @@ class ProjectsTransport(abc.ABC):
     def _prep_wrapped_messages(self, client_info):
         # Precompute the wrapped methods.
         self._wrapped_methods = {
-            self.disable_xpn_host: gapic_v1.method.wrap_method(
-                self.disable_xpn_host, default_timeout=None, client_info=client_info,
+            self.disable_xpn_host: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.disable_xpn_host, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "disable_xpn_host",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.disable_xpn_resource: gapic_v1.method.wrap_method(
-                self.disable_xpn_resource,
-                default_timeout=None,
+            self.disable_xpn_resource: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.disable_xpn_resource,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "disable_xpn_resource",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.enable_xpn_host: gapic_v1.method.wrap_method(
-                self.enable_xpn_host, default_timeout=None, client_info=client_info,
+            self.enable_xpn_host: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.enable_xpn_host, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "enable_xpn_host",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.enable_xpn_resource: gapic_v1.method.wrap_method(
-                self.enable_xpn_resource, default_timeout=None, client_info=client_info,
+            self.enable_xpn_resource: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.enable_xpn_resource, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "enable_xpn_resource",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.get: gapic_v1.method.wrap_method(
-                self.get, default_timeout=None, client_info=client_info,
+            self.get: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_xpn_host: gapic_v1.method.wrap_method(
-                self.get_xpn_host, default_timeout=None, client_info=client_info,
+            self.get_xpn_host: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_xpn_host, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_xpn_host",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.get_xpn_resources: gapic_v1.method.wrap_method(
-                self.get_xpn_resources, default_timeout=None, client_info=client_info,
+            self.get_xpn_resources: self._retry_policy.wrap_method(
+                coalescing.coalesce(
+                    rate_limiting.limit(
+                        self.get_xpn_resources, self._rate_limiter, rate_limiting.READ
+                    ),
+                    self._coalescer,
+                    self,
+                ),
+                "get_xpn_resources",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.list_xpn_hosts: gapic_v1.method.wrap_method(
-                self.list_xpn_hosts, default_timeout=None, client_info=client_info,
+            self.list_xpn_hosts: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.list_xpn_hosts, self._rate_limiter, rate_limiting.LIST
+                ),
+                "list_xpn_hosts",
+                retry_policy.READ,
+                client_info=client_info,
             ),
-            self.move_disk: gapic_v1.method.wrap_method(
-                self.move_disk, default_timeout=None, client_info=client_info,
+            self.move_disk: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.move_disk, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "move_disk",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.move_instance: gapic_v1.method.wrap_method(
-                self.move_instance, default_timeout=None, client_info=client_info,
+            self.move_instance: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.move_instance, self._rate_limiter, rate_limiting.MUTATION
+                ),
+                "move_instance",
+                retry_policy.MUTATION,
+                client_info=client_info,
             ),
-            self.set_common_instance_metadata: gapic_v1.method.wrap_method(
-                self.set_common_instance_metadata,
-                default_timeout=None,
+            self.set_common_instance_metadata: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_common_instance_metadata,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_common_instance_metadata",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_default_network_tier: gapic_v1.method.wrap_method(
-                self.set_default_network_tier,
-                default_timeout=None,
+            self.set_default_network_tier: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_default_network_tier,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_default_network_tier",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
-            self.set_usage_export_bucket: gapic_v1.method.wrap_method(
-                self.set_usage_export_bucket,
-                default_timeout=None,
+            self.set_usage_export_bucket: self._retry_policy.wrap_method(
+                rate_limiting.limit(
+                    self.set_usage_export_bucket,
+                    self._rate_limiter,
+                    rate_limiting.MUTATION,
+                ),
+                "set_usage_export_bucket",
+                retry_policy.MUTATION,
                 client_info=client_info,
             ),
         }
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,15 +32,18 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import ProjectsTransport, DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
+from .base import ProjectsTransport
 
-
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -65,8 +65,6 @@ class ProjectsRestTransport(ProjectsTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, ProjectsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -79,6 +77,10 @@ class ProjectsRestTransport(ProjectsTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -111,22 +113,50 @@ class ProjectsRestTransport(ProjectsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, ProjectsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _DisableXpnHost(ProjectsRestStub):
@@ -143,6 +173,17 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DisableXpnHostProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/disableXpnHost",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DisableXpnHostProjectRequest,
@@ -185,31 +226,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/disableXpnHost",
-                },
-            ]
-
-            request_kwargs = compute.DisableXpnHostProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DisableXpnHostProjectRequest.to_json(
-                    compute.DisableXpnHostProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -219,7 +237,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -227,9 +245,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DisableXpnResource(ProjectsRestStub):
         def __hash__(self):
@@ -245,6 +261,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DisableXpnResourceProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/disableXpnResource",
+                    "body": "projects_disable_xpn_resource_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DisableXpnResourceProjectRequest,
@@ -287,38 +315,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/disableXpnResource",
-                    "body": "projects_disable_xpn_resource_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.DisableXpnResourceProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ProjectsDisableXpnResourceRequest.to_json(
-                compute.ProjectsDisableXpnResourceRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DisableXpnResourceProjectRequest.to_json(
-                    compute.DisableXpnResourceProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -328,7 +326,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -337,9 +335,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _EnableXpnHost(ProjectsRestStub):
         def __hash__(self):
@@ -355,6 +351,17 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.EnableXpnHostProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/enableXpnHost",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.EnableXpnHostProjectRequest,
@@ -397,31 +404,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/enableXpnHost",
-                },
-            ]
-
-            request_kwargs = compute.EnableXpnHostProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.EnableXpnHostProjectRequest.to_json(
-                    compute.EnableXpnHostProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -431,7 +415,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -439,9 +423,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _EnableXpnResource(ProjectsRestStub):
         def __hash__(self):
@@ -457,6 +439,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.EnableXpnResourceProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/enableXpnResource",
+                    "body": "projects_enable_xpn_resource_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.EnableXpnResourceProjectRequest,
@@ -499,38 +493,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/enableXpnResource",
-                    "body": "projects_enable_xpn_resource_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.EnableXpnResourceProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ProjectsEnableXpnResourceRequest.to_json(
-                compute.ProjectsEnableXpnResourceRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.EnableXpnResourceProjectRequest.to_json(
-                    compute.EnableXpnResourceProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -540,7 +504,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -549,9 +513,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(ProjectsRestStub):
         def __hash__(self):
@@ -567,6 +529,12 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetProjectRequest,
+            [{"method": "get", "uri": "/compute/v1/projects/{project}",},],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetProjectRequest,
@@ -574,6 +542,7 @@ class ProjectsRestTransport(ProjectsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.Project:
             r"""Call the get method over HTTP.
 
@@ -587,6 +556,8 @@ class ProjectsRestTransport(ProjectsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.Project:
@@ -598,26 +569,10 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {"method": "get", "uri": "/compute/v1/projects/{project}",},
-            ]
-
-            request_kwargs = compute.GetProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetProjectRequest.to_json(
-                    compute.GetProjectRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -627,7 +582,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -635,9 +590,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Project.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Project, response.content)
 
     class _GetXpnHost(ProjectsRestStub):
         def __hash__(self):
@@ -653,6 +606,12 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetXpnHostProjectRequest,
+            [{"method": "get", "uri": "/compute/v1/projects/{project}/getXpnHost",},],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetXpnHostProjectRequest,
@@ -685,28 +644,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {"method": "get", "uri": "/compute/v1/projects/{project}/getXpnHost",},
-            ]
-
-            request_kwargs = compute.GetXpnHostProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetXpnHostProjectRequest.to_json(
-                    compute.GetXpnHostProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -716,7 +655,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -724,9 +663,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Project.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Project, response.content)
 
     class _GetXpnResources(ProjectsRestStub):
         def __hash__(self):
@@ -742,6 +679,17 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetXpnResourcesProjectsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/getXpnResources",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetXpnResourcesProjectsRequest,
@@ -769,31 +717,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/getXpnResources",
-                },
-            ]
-
-            request_kwargs = compute.GetXpnResourcesProjectsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetXpnResourcesProjectsRequest.to_json(
-                    compute.GetXpnResourcesProjectsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -803,7 +728,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -811,8 +736,8 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.ProjectsGetXpnResources.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.ProjectsGetXpnResources, response.content
             )
 
     class _ListXpnHosts(ProjectsRestStub):
@@ -829,6 +754,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListXpnHostsProjectsRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/listXpnHosts",
+                    "body": "projects_list_xpn_hosts_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListXpnHostsProjectsRequest,
@@ -856,38 +793,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/listXpnHosts",
-                    "body": "projects_list_xpn_hosts_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ListXpnHostsProjectsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ProjectsListXpnHostsRequest.to_json(
-                compute.ProjectsListXpnHostsRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListXpnHostsProjectsRequest.to_json(
-                    compute.ListXpnHostsProjectsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -897,7 +804,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -906,9 +813,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.XpnHostList.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.XpnHostList, response.content)
 
     class _MoveDisk(ProjectsRestStub):
         def __hash__(self):
@@ -924,6 +829,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.MoveDiskProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/moveDisk",
+                    "body": "disk_move_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.MoveDiskProjectRequest,
@@ -966,36 +883,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/moveDisk",
-                    "body": "disk_move_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.MoveDiskProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.DiskMoveRequest.to_json(
-                compute.DiskMoveRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.MoveDiskProjectRequest.to_json(
-                    compute.MoveDiskProjectRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1005,7 +894,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1014,9 +903,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _MoveInstance(ProjectsRestStub):
         def __hash__(self):
@@ -1032,6 +919,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.MoveInstanceProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/moveInstance",
+                    "body": "instance_move_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.MoveInstanceProjectRequest,
@@ -1074,38 +973,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/moveInstance",
-                    "body": "instance_move_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.MoveInstanceProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceMoveRequest.to_json(
-                compute.InstanceMoveRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.MoveInstanceProjectRequest.to_json(
-                    compute.MoveInstanceProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1115,7 +984,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1124,9 +993,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetCommonInstanceMetadata(ProjectsRestStub):
         def __hash__(self):
@@ -1142,6 +1009,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetCommonInstanceMetadataProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/setCommonInstanceMetadata",
+                    "body": "metadata_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetCommonInstanceMetadataProjectRequest,
@@ -1185,40 +1064,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/setCommonInstanceMetadata",
-                    "body": "metadata_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetCommonInstanceMetadataProjectRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.Metadata.to_json(
-                compute.Metadata(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetCommonInstanceMetadataProjectRequest.to_json(
-                    compute.SetCommonInstanceMetadataProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1228,7 +1075,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1237,9 +1084,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetDefaultNetworkTier(ProjectsRestStub):
         def __hash__(self):
@@ -1255,6 +1100,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetDefaultNetworkTierProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/setDefaultNetworkTier",
+                    "body": "projects_set_default_network_tier_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetDefaultNetworkTierProjectRequest,
@@ -1297,42 +1154,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/setDefaultNetworkTier",
-                    "body": "projects_set_default_network_tier_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetDefaultNetworkTierProjectRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.ProjectsSetDefaultNetworkTierRequest.to_json(
-                compute.ProjectsSetDefaultNetworkTierRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetDefaultNetworkTierProjectRequest.to_json(
-                    compute.SetDefaultNetworkTierProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1342,7 +1165,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1351,9 +1174,7 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetUsageExportBucket(ProjectsRestStub):
         def __hash__(self):
@@ -1369,6 +1190,18 @@ class ProjectsRestTransport(ProjectsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetUsageExportBucketProjectRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/setUsageExportBucket",
+                    "body": "usage_export_location_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetUsageExportBucketProjectRequest,
@@ -1411,38 +1244,8 @@ class ProjectsRestTransport(ProjectsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/setUsageExportBucket",
-                    "body": "usage_export_location_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetUsageExportBucketProjectRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.UsageExportLocation.to_json(
-                compute.UsageExportLocation(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetUsageExportBucketProjectRequest.to_json(
-                    compute.SetUsageExportBucketProjectRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1452,7 +1255,7 @@ class ProjectsRestTransport(ProjectsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1461,17 +1264,15 @@ class ProjectsRestTransport(ProjectsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def disable_xpn_host(
         self,
     ) -> Callable[[compute.DisableXpnHostProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("disable_xpn_host")
+        stub = self._stubs.get("disable_xpn_host")
         if not stub:
-            stub = self._STUBS["disable_xpn_host"] = self._DisableXpnHost(
+            stub = self._stubs["disable_xpn_host"] = self._DisableXpnHost(
                 self._session, self._host
             )
 
@@ -1481,9 +1282,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def disable_xpn_resource(
         self,
     ) -> Callable[[compute.DisableXpnResourceProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("disable_xpn_resource")
+        stub = self._stubs.get("disable_xpn_resource")
         if not stub:
-            stub = self._STUBS["disable_xpn_resource"] = self._DisableXpnResource(
+            stub = self._stubs["disable_xpn_resource"] = self._DisableXpnResource(
                 self._session, self._host
             )
 
@@ -1493,9 +1294,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def enable_xpn_host(
         self,
     ) -> Callable[[compute.EnableXpnHostProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("enable_xpn_host")
+        stub = self._stubs.get("enable_xpn_host")
         if not stub:
-            stub = self._STUBS["enable_xpn_host"] = self._EnableXpnHost(
+            stub = self._stubs["enable_xpn_host"] = self._EnableXpnHost(
                 self._session, self._host
             )
 
@@ -1505,9 +1306,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def enable_xpn_resource(
         self,
     ) -> Callable[[compute.EnableXpnResourceProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("enable_xpn_resource")
+        stub = self._stubs.get("enable_xpn_resource")
         if not stub:
-            stub = self._STUBS["enable_xpn_resource"] = self._EnableXpnResource(
+            stub = self._stubs["enable_xpn_resource"] = self._EnableXpnResource(
                 self._session, self._host
             )
 
@@ -1515,9 +1316,9 @@ class ProjectsRestTransport(ProjectsTransport):
 
     @property
     def get(self) -> Callable[[compute.GetProjectRequest], compute.Project]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1525,9 +1326,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def get_xpn_host(
         self,
     ) -> Callable[[compute.GetXpnHostProjectRequest], compute.Project]:
-        stub = self._STUBS.get("get_xpn_host")
+        stub = self._stubs.get("get_xpn_host")
         if not stub:
-            stub = self._STUBS["get_xpn_host"] = self._GetXpnHost(
+            stub = self._stubs["get_xpn_host"] = self._GetXpnHost(
                 self._session, self._host
             )
 
@@ -1539,9 +1340,9 @@ class ProjectsRestTransport(ProjectsTransport):
     ) -> Callable[
         [compute.GetXpnResourcesProjectsRequest], compute.ProjectsGetXpnResources
     ]:
-        stub = self._STUBS.get("get_xpn_resources")
+        stub = self._stubs.get("get_xpn_resources")
         if not stub:
-            stub = self._STUBS["get_xpn_resources"] = self._GetXpnResources(
+            stub = self._stubs["get_xpn_resources"] = self._GetXpnResources(
                 self._session, self._host
             )
 
@@ -1551,9 +1352,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def list_xpn_hosts(
         self,
     ) -> Callable[[compute.ListXpnHostsProjectsRequest], compute.XpnHostList]:
-        stub = self._STUBS.get("list_xpn_hosts")
+        stub = self._stubs.get("list_xpn_hosts")
         if not stub:
-            stub = self._STUBS["list_xpn_hosts"] = self._ListXpnHosts(
+            stub = self._stubs["list_xpn_hosts"] = self._ListXpnHosts(
                 self._session, self._host
             )
 
@@ -1563,9 +1364,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def move_disk(
         self,
     ) -> Callable[[compute.MoveDiskProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("move_disk")
+        stub = self._stubs.get("move_disk")
         if not stub:
-            stub = self._STUBS["move_disk"] = self._MoveDisk(self._session, self._host)
+            stub = self._stubs["move_disk"] = self._MoveDisk(self._session, self._host)
 
         return stub
 
@@ -1573,9 +1374,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def move_instance(
         self,
     ) -> Callable[[compute.MoveInstanceProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("move_instance")
+        stub = self._stubs.get("move_instance")
         if not stub:
-            stub = self._STUBS["move_instance"] = self._MoveInstance(
+            stub = self._stubs["move_instance"] = self._MoveInstance(
                 self._session, self._host
             )
 
@@ -1585,9 +1386,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def set_common_instance_metadata(
         self,
     ) -> Callable[[compute.SetCommonInstanceMetadataProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("set_common_instance_metadata")
+        stub = self._stubs.get("set_common_instance_metadata")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "set_common_instance_metadata"
             ] = self._SetCommonInstanceMetadata(self._session, self._host)
 
@@ -1597,9 +1398,9 @@ class ProjectsRestTransport(ProjectsTransport):
     def set_default_network_tier(
         self,
     ) -> Callable[[compute.SetDefaultNetworkTierProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("set_default_network_tier")
+        stub = self._stubs.get("set_default_network_tier")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "set_default_network_tier"
             ] = self._SetDefaultNetworkTier(self._session, self._host)
 
@@ -1609,16 +1410,17 @@ class ProjectsRestTransport(ProjectsTransport):
     def set_usage_export_bucket(
         self,
     ) -> Callable[[compute.SetUsageExportBucketProjectRequest], compute.Operation]:
-        stub = self._STUBS.get("set_usage_export_bucket")
+        stub = self._stubs.get("set_usage_export_bucket")
         if not stub:
-            stub = self._STUBS["set_usage_export_bucket"] = self._SetUsageExportBucket(
+            stub = self._stubs["set_usage_export_bucket"] = self._SetUsageExportBucket(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("ProjectsRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import PublicAdvertisedPrefixesClient
 
-__all__ = ("PublicAdvertisedPrefixesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "PublicAdvertisedPrefixesAsyncClient":
+        from .async_client import PublicAdvertisedPrefixesAsyncClient
+
+        return PublicAdvertisedPrefixesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "PublicAdvertisedPrefixesClient",
+    "PublicAdvertisedPrefixesAsyncClient",
+)
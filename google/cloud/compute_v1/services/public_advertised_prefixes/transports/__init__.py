@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[PublicAdvertisedPrefixesTransport]]
 _transport_registry["rest"] = PublicAdvertisedPrefixesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "PublicAdvertisedPrefixesAsyncRestTransport":
+        from .rest_asyncio import PublicAdvertisedPrefixesAsyncRestTransport
+
+        return PublicAdvertisedPrefixesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "PublicAdvertisedPrefixesTransport",
     "PublicAdvertisedPrefixesRestTransport",
+    "PublicAdvertisedPrefixesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import PublicDelegatedPrefixesClient
 
-__all__ = ("PublicDelegatedPrefixesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "PublicDelegatedPrefixesAsyncClient":
+        from .async_client import PublicDelegatedPrefixesAsyncClient
+
+        return PublicDelegatedPrefixesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "PublicDelegatedPrefixesClient",
+    "PublicDelegatedPrefixesAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[PublicDelegatedPrefixesTransport]]
 _transport_registry["rest"] = PublicDelegatedPrefixesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "PublicDelegatedPrefixesAsyncRestTransport":
+        from .rest_asyncio import PublicDelegatedPrefixesAsyncRestTransport
+
+        return PublicDelegatedPrefixesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "PublicDelegatedPrefixesTransport",
     "PublicDelegatedPrefixesRestTransport",
+    "PublicDelegatedPrefixesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionAutoscalersClient
 
-__all__ = ("RegionAutoscalersClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionAutoscalersAsyncClient":
+        from .async_client import RegionAutoscalersAsyncClient
+
+        return RegionAutoscalersAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionAutoscalersClient",
+    "RegionAutoscalersAsyncClient",
+)
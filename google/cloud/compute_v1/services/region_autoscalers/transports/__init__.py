@@ -24,7 +24,19 @@ from .rest import RegionAutoscalersRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionAutoscalersTransport]]
 _transport_registry["rest"] = RegionAutoscalersRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionAutoscalersAsyncRestTransport":
+        from .rest_asyncio import RegionAutoscalersAsyncRestTransport
+
+        return RegionAutoscalersAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionAutoscalersTransport",
     "RegionAutoscalersRestTransport",
+    "RegionAutoscalersAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionBackendServicesClient
 
-__all__ = ("RegionBackendServicesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionBackendServicesAsyncClient":
+        from .async_client import RegionBackendServicesAsyncClient
+
+        return RegionBackendServicesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionBackendServicesClient",
+    "RegionBackendServicesAsyncClient",
+)
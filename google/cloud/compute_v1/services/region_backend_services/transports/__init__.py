@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionBackendServicesTransport]]
 _transport_registry["rest"] = RegionBackendServicesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionBackendServicesAsyncRestTransport":
+        from .rest_asyncio import RegionBackendServicesAsyncRestTransport
+
+        return RegionBackendServicesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionBackendServicesTransport",
     "RegionBackendServicesRestTransport",
+    "RegionBackendServicesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionCommitmentsClient
 
-__all__ = ("RegionCommitmentsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionCommitmentsAsyncClient":
+        from .async_client import RegionCommitmentsAsyncClient
+
+        return RegionCommitmentsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionCommitmentsClient",
+    "RegionCommitmentsAsyncClient",
+)
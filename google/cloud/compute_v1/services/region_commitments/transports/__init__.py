@@ -24,7 +24,19 @@ from .rest import RegionCommitmentsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionCommitmentsTransport]]
 _transport_registry["rest"] = RegionCommitmentsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionCommitmentsAsyncRestTransport":
+        from .rest_asyncio import RegionCommitmentsAsyncRestTransport
+
+        return RegionCommitmentsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionCommitmentsTransport",
     "RegionCommitmentsRestTransport",
+    "RegionCommitmentsAsyncRestTransport",
 )
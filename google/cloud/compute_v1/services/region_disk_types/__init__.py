@@ -15,4 +15,18 @@
 #
 from .client import RegionDiskTypesClient
 
-__all__ = ("RegionDiskTypesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionDiskTypesAsyncClient":
+        from .async_client import RegionDiskTypesAsyncClient
+
+        return RegionDiskTypesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionDiskTypesClient",
+    "RegionDiskTypesAsyncClient",
+)
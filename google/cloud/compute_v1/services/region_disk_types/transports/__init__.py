@@ -24,7 +24,19 @@ from .rest import RegionDiskTypesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionDiskTypesTransport]]
 _transport_registry["rest"] = RegionDiskTypesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionDiskTypesAsyncRestTransport":
+        from .rest_asyncio import RegionDiskTypesAsyncRestTransport
+
+        return RegionDiskTypesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionDiskTypesTransport",
     "RegionDiskTypesRestTransport",
+    "RegionDiskTypesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionDisksClient
 
-__all__ = ("RegionDisksClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionDisksAsyncClient":
+        from .async_client import RegionDisksAsyncClient
+
+        return RegionDisksAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionDisksClient",
+    "RegionDisksAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import RegionDisksRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionDisksTransport]]
 _transport_registry["rest"] = RegionDisksRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionDisksAsyncRestTransport":
+        from .rest_asyncio import RegionDisksAsyncRestTransport
+
+        return RegionDisksAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionDisksTransport",
     "RegionDisksRestTransport",
+    "RegionDisksAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionHealthCheckServicesClient
 
-__all__ = ("RegionHealthCheckServicesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionHealthCheckServicesAsyncClient":
+        from .async_client import RegionHealthCheckServicesAsyncClient
+
+        return RegionHealthCheckServicesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionHealthCheckServicesClient",
+    "RegionHealthCheckServicesAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionHealthCheckServicesTransport]]
 _transport_registry["rest"] = RegionHealthCheckServicesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionHealthCheckServicesAsyncRestTransport":
+        from .rest_asyncio import RegionHealthCheckServicesAsyncRestTransport
+
+        return RegionHealthCheckServicesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionHealthCheckServicesTransport",
     "RegionHealthCheckServicesRestTransport",
+    "RegionHealthCheckServicesAsyncRestTransport",
 )
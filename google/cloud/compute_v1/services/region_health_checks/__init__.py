@@ -15,4 +15,18 @@
 #
 from .client import RegionHealthChecksClient
 
-__all__ = ("RegionHealthChecksClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionHealthChecksAsyncClient":
+        from .async_client import RegionHealthChecksAsyncClient
+
+        return RegionHealthChecksAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionHealthChecksClient",
+    "RegionHealthChecksAsyncClient",
+)
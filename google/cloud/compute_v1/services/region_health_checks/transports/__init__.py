@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionHealthChecksTransport]]
 _transport_registry["rest"] = RegionHealthChecksRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionHealthChecksAsyncRestTransport":
+        from .rest_asyncio import RegionHealthChecksAsyncRestTransport
+
+        return RegionHealthChecksAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionHealthChecksTransport",
     "RegionHealthChecksRestTransport",
+    "RegionHealthChecksAsyncRestTransport",
 )
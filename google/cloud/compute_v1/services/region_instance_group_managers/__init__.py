@@ -15,4 +15,18 @@
 #
 from .client import RegionInstanceGroupManagersClient
 
-__all__ = ("RegionInstanceGroupManagersClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionInstanceGroupManagersAsyncClient":
+        from .async_client import RegionInstanceGroupManagersAsyncClient
+
+        return RegionInstanceGroupManagersAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionInstanceGroupManagersClient",
+    "RegionInstanceGroupManagersAsyncClient",
+)
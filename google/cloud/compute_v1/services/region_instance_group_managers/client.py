@@ -14,10 +14,10 @@
 # limitations under the License.
 #
 from collections import OrderedDict
+import functools
 import os
 import re
-from typing import Dict, Optional, Sequence, Tuple, Type, Union
-import pkg_resources
+from typing import Callable, Dict, Optional, Sequence, Tuple, Type, Union
 
 from google.api_core import client_options as client_options_lib
 from google.api_core import exceptions as core_exceptions
@@ -35,6 +35,12 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 from google.cloud.compute_v1.services.region_instance_group_managers import pagers
+from google.cloud.compute_v1 import client_options as compute_client_options
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import page_sizing
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import operations
 from google.cloud.compute_v1.types import compute
 from .transports.base import RegionInstanceGroupManagersTransport, DEFAULT_CLIENT_INFO
 from .transports.rest import RegionInstanceGroupManagersRestTransport
@@ -291,7 +297,12 @@ class RegionInstanceGroupManagersClient(
         self,
         *,
         credentials: Optional[ga_credentials.Credentials] = None,
-        transport: Union[str, RegionInstanceGroupManagersTransport, None] = None,
+        transport: Union[
+            str,
+            RegionInstanceGroupManagersTransport,
+            Callable[..., RegionInstanceGroupManagersTransport],
+            None,
+        ] = None,
         client_options: Optional[client_options_lib.ClientOptions] = None,
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
     ) -> None:
@@ -303,9 +314,13 @@ class RegionInstanceGroupManagersClient(
                 credentials identify the application to the service; if none
                 are specified, the client will attempt to ascertain the
                 credentials from the environment.
-            transport (Union[str, RegionInstanceGroupManagersTransport]): The
-                transport to use. If set to None, a transport is chosen
-                automatically.
+            transport (Union[str, RegionInstanceGroupManagersTransport, Callable[..., RegionInstanceGroupManagersTransport]]): The
+                transport to use, or a callable that constructs and returns a
+                new transport. A callable is invoked with the same arguments
+                as the RegionInstanceGroupManagersTransport constructor, plus ``session``,
+                ``retry_policy``, ``rate_limiter`` and ``coalescer`` when they
+                are set in ``client_options``. If set to None, a transport is
+                chosen automatically.
             client_options (google.api_core.client_options.ClientOptions): Custom options for the
                 client. It won't take effect if a ``transport`` instance is provided.
                 (1) The ``api_endpoint`` property can be used to override the
@@ -322,6 +337,22 @@ class RegionInstanceGroupManagersClient(
                 not provided, the default SSL client certificate will be used if
                 present. If GOOGLE_API_USE_CLIENT_CERTIFICATE is "false" or not
                 set, no client certificate will be used.
+                (3) The ``session`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to send requests through an existing, shared
+                HTTP session instead of opening a new connection pool.
+                (4) The ``retry_policy`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to change the default retry and timeout of the
+                methods; see :mod:`google.cloud.compute_v1.retry_policy`.
+                (5) The ``rate_limiter`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to pace the calls of one or more clients; see
+                :mod:`google.cloud.compute_v1.rate_limiting`.
+                (6) The ``coalescer`` property of
+                :class:`google.cloud.compute_v1.client_options.ClientOptions`
+                can be used to share one call among identical reads in
+                flight; see :mod:`google.cloud.compute_v1.coalescing`.
             client_info (google.api_core.gapic_v1.client_info.ClientInfo):
                 The client info used to send a user-agent string along with
                 API requests. If ``None``, then default info will be used.
@@ -333,7 +364,7 @@ class RegionInstanceGroupManagersClient(
                 creation failed for any reason.
         """
         if isinstance(client_options, dict):
-            client_options = client_options_lib.from_dict(client_options)
+            client_options = compute_client_options.from_dict(client_options)
         if client_options is None:
             client_options = client_options_lib.ClientOptions()
 
@@ -347,6 +378,11 @@ class RegionInstanceGroupManagersClient(
                 "client_options.api_key and credentials are mutually exclusive"
             )
 
+        session = getattr(client_options, "session", None)
+        retry_policy = getattr(client_options, "retry_policy", None)
+        rate_limiter = getattr(client_options, "rate_limiter", None)
+        coalescer = getattr(client_options, "coalescer", None)
+
         # Save or instantiate the transport.
         # Ordinarily, we provide the transport, but allowing a custom transport
         # instance provides an extensibility point for unusual situations.
@@ -362,6 +398,26 @@ class RegionInstanceGroupManagersClient(
                     "When providing a transport instance, provide its scopes "
                     "directly."
                 )
+            if session is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its session "
+                    "directly."
+                )
+            if retry_policy is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its retry "
+                    "policy directly."
+                )
+            if rate_limiter is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its rate "
+                    "limiter directly."
+                )
+            if coalescer is not None:
+                raise ValueError(
+                    "When providing a transport instance, provide its "
+                    "coalescer directly."
+                )
             self._transport = transport
         else:
             import google.auth._default  # type: ignore
@@ -373,8 +429,27 @@ class RegionInstanceGroupManagersClient(
                     api_key_value
                 )
 
-            Transport = type(self).get_transport_class(transport)
-            self._transport = Transport(
+            # Share the caller's HTTP session, if any, rather than opening a
+            # new connection pool for this client.
+            transport_kwargs = {}
+            if session is not None:
+                transport_kwargs["session"] = session
+            if retry_policy is not None:
+                transport_kwargs["retry_policy"] = retry_policy
+            if rate_limiter is not None:
+                transport_kwargs["rate_limiter"] = rate_limiter
+            if coalescer is not None:
+                transport_kwargs["coalescer"] = coalescer
+
+            transport_init: Union[
+                Type[RegionInstanceGroupManagersTransport],
+                Callable[..., RegionInstanceGroupManagersTransport],
+            ] = (
+                type(self).get_transport_class(transport)
+                if isinstance(transport, str) or transport is None
+                else transport
+            )
+            self._transport = transport_init(
                 credentials=credentials,
                 credentials_file=client_options.credentials_file,
                 host=api_endpoint,
@@ -383,6 +458,7 @@ class RegionInstanceGroupManagersClient(
                 quota_project_id=client_options.quota_project_id,
                 client_info=client_info,
                 always_use_jwt_access=True,
+                **transport_kwargs,
             )
 
     def abandon_instances_unary(
@@ -396,7 +472,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_abandon_instances_request_resource: compute.RegionInstanceGroupManagersAbandonInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Flags the specified instances to be immediately
@@ -519,6 +595,88 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def abandon_instances(
+        self,
+        request: Union[
+            compute.AbandonInstancesRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_managers_abandon_instances_request_resource: compute.RegionInstanceGroupManagersAbandonInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Flags the specified instances to be immediately
+        removed from the managed instance group. Abandoning an
+        instance does not delete the instance, but it does
+        remove the instance from any target pools that are
+        applied by the managed instance group. This method
+        reduces the targetSize of the managed instance group by
+        the number of instances that you abandon. This operation
+        is marked as DONE when the action is scheduled even if
+        the instances have not yet been removed from the group.
+        You must separately verify the status of the abandoning
+        action with the listmanagedinstances method. If the
+        group is part of a backend service that has enabled
+        connection draining, it can take up to 60 seconds after
+        the connection draining duration has elapsed before the
+        VM instance is removed or deleted. You can specify a
+        maximum of 1000 instances with this method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.AbandonInstancesRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.AbandonInstances. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                Name of the managed instance group.
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_abandon_instances_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersAbandonInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_abandon_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.abandon_instances_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_abandon_instances_request_resource=region_instance_group_managers_abandon_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def apply_updates_to_instances_unary(
         self,
         request: Union[
@@ -530,7 +688,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_apply_updates_request_resource: compute.RegionInstanceGroupManagersApplyUpdatesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Apply updates to selected instances the managed
@@ -645,6 +803,76 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def apply_updates_to_instances(
+        self,
+        request: Union[
+            compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_managers_apply_updates_request_resource: compute.RegionInstanceGroupManagersApplyUpdatesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Apply updates to selected instances the managed
+        instance group.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.ApplyUpdatesToInstances. See
+                the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request, should conform to RFC1035.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group, should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_apply_updates_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersApplyUpdatesRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_apply_updates_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.apply_updates_to_instances_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_apply_updates_request_resource=region_instance_group_managers_apply_updates_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def create_instances_unary(
         self,
         request: Union[
@@ -656,7 +884,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_create_instances_request_resource: compute.RegionInstanceGroupManagersCreateInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates instances with per-instance configs in this
@@ -774,6 +1002,83 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def create_instances(
+        self,
+        request: Union[
+            compute.CreateInstancesRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_managers_create_instances_request_resource: compute.RegionInstanceGroupManagersCreateInstancesRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates instances with per-instance configs in this
+        regional managed instance group. Instances are created
+        using the current instance template. The create
+        instances operation is marked DONE if the
+        createInstances request is successful. The underlying
+        actions take additional time. You must separately verify
+        the status of the creating or actions with the
+        listmanagedinstances method.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.CreateInstancesRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.CreateInstances. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                The name of the region where the
+                managed instance group is located. It
+                should conform to RFC1035.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_create_instances_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersCreateInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_create_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.create_instances_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_create_instances_request_resource=region_instance_group_managers_create_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_unary(
         self,
         request: Union[compute.DeleteRegionInstanceGroupManagerRequest, dict] = None,
@@ -782,7 +1087,7 @@ class RegionInstanceGroupManagersClient(
         region: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Deletes the specified managed instance group and all
@@ -872,6 +1177,67 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def delete(
+        self,
+        request: Union[compute.DeleteRegionInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes the specified managed instance group and all
+        of the instances in that group.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.Delete. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                Name of the managed instance group to
+                delete.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def delete_instances_unary(
         self,
         request: Union[
@@ -883,7 +1249,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_delete_instances_request_resource: compute.RegionInstanceGroupManagersDeleteInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Flags the specified instances in the managed instance
@@ -1005,30 +1371,111 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
-    def delete_per_instance_configs_unary(
+    def delete_instances(
         self,
         request: Union[
-            compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest, dict
+            compute.DeleteInstancesRegionInstanceGroupManagerRequest, dict
         ] = None,
         *,
         project: str = None,
         region: str = None,
         instance_group_manager: str = None,
-        region_instance_group_manager_delete_instance_config_req_resource: compute.RegionInstanceGroupManagerDeleteInstanceConfigReq = None,
+        region_instance_group_managers_delete_instances_request_resource: compute.RegionInstanceGroupManagersDeleteInstancesRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Deletes selected per-instance configs for the managed
-        instance group.
-
-        Args:
-            request (Union[google.cloud.compute_v1.types.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
-                The request object. A request message for
-                RegionInstanceGroupManagers.DeletePerInstanceConfigs.
-                See the method description for details.
-            project (str):
-                Project ID for this request.
+    ) -> operations.OperationFuture:
+        r"""Flags the specified instances in the managed instance
+        group to be immediately deleted. The instances are also
+        removed from any target pools of which they were a
+        member. This method reduces the targetSize of the
+        managed instance group by the number of instances that
+        you delete. The deleteInstances operation is marked DONE
+        if the deleteInstances request is successful. The
+        underlying actions take additional time. You must
+        separately verify the status of the deleting action with
+        the listmanagedinstances method. If the group is part of
+        a backend service that has enabled connection draining,
+        it can take up to 60 seconds after the connection
+        draining duration has elapsed before the VM instance is
+        removed or deleted. You can specify a maximum of 1000
+        instances with this method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeleteInstancesRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.DeleteInstances. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                Name of the managed instance group.
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_delete_instances_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersDeleteInstancesRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_delete_instances_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_instances_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_delete_instances_request_resource=region_instance_group_managers_delete_instances_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def delete_per_instance_configs_unary(
+        self,
+        request: Union[
+            compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_manager_delete_instance_config_req_resource: compute.RegionInstanceGroupManagerDeleteInstanceConfigReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Deletes selected per-instance configs for the managed
+        instance group.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.DeletePerInstanceConfigs.
+                See the method description for details.
+            project (str):
+                Project ID for this request.
                 This corresponds to the ``project`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
@@ -1131,6 +1578,76 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def delete_per_instance_configs(
+        self,
+        request: Union[
+            compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_manager_delete_instance_config_req_resource: compute.RegionInstanceGroupManagerDeleteInstanceConfigReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Deletes selected per-instance configs for the managed
+        instance group.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.DeletePerInstanceConfigs.
+                See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request, should conform to RFC1035.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_manager_delete_instance_config_req_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagerDeleteInstanceConfigReq):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_manager_delete_instance_config_req_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.delete_per_instance_configs_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_manager_delete_instance_config_req_resource=region_instance_group_manager_delete_instance_config_req_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def get(
         self,
         request: Union[compute.GetRegionInstanceGroupManagerRequest, dict] = None,
@@ -1139,8 +1656,9 @@ class RegionInstanceGroupManagersClient(
         region: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        fields: Union[str, Sequence[str]] = None,
     ) -> compute.InstanceGroupManager:
         r"""Returns all of the details about the specified
         managed instance group.
@@ -1174,6 +1692,10 @@ class RegionInstanceGroupManagersClient(
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                the response, in the syntax of the ``fields`` system
+                parameter, such as ``"name,status"``. A sequence is joined
+                with commas. If ``None``, every field is returned.
 
         Returns:
             google.cloud.compute_v1.types.InstanceGroupManager:
@@ -1217,6 +1739,10 @@ class RegionInstanceGroupManagersClient(
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.get]
 
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(rpc, fields=_partial_response.format_fields(fields))
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
@@ -1231,7 +1757,7 @@ class RegionInstanceGroupManagersClient(
         region: str = None,
         instance_group_manager_resource: compute.InstanceGroupManager = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Creates a managed instance group using the
@@ -1329,6 +1855,73 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def insert(
+        self,
+        request: Union[compute.InsertRegionInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager_resource: compute.InstanceGroupManager = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Creates a managed instance group using the
+        information that you specify in the request. After the
+        group is created, instances in the group are created
+        using the specified instance template. This operation is
+        marked as DONE when the group is created even if the
+        instances in the group have not yet been created. You
+        must separately verify the status of the individual
+        instances with the listmanagedinstances method. A
+        regional managed instance group can contain up to 2000
+        instances.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.InsertRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.Insert. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+                The body resource for this request
+                This corresponds to the ``instance_group_manager_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.insert_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager_resource=instance_group_manager_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def list(
         self,
         request: Union[compute.ListRegionInstanceGroupManagersRequest, dict] = None,
@@ -1336,8 +1929,13 @@ class RegionInstanceGroupManagersClient(
         project: str = None,
         region: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        views: bool = False,
+        fields: Union[str, Sequence[str]] = None,
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPager:
         r"""Retrieves the list of managed instance groups that
         are contained within the specified region.
@@ -1364,6 +1962,30 @@ class RegionInstanceGroupManagersClient(
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            views (bool): If ``True``, yield read-only
+                :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                views that decode each field on first access instead of
+                fully decoded messages. Call ``to_message()`` on a view to
+                decode all of it.
+            fields (Union[str, Sequence[str]]): The fields to include in
+                each page, in the syntax of the ``fields`` system parameter,
+                such as ``"items(name,status)"``. A sequence is joined with
+                commas. ``nextPageToken`` is always requested so that the
+                pager can fetch the following pages. If ``None``, every
+                field is returned.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.region_instance_group_managers.pagers.ListPager:
@@ -1384,6 +2006,24 @@ class RegionInstanceGroupManagersClient(
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListRegionInstanceGroupManagersRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListRegionInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1397,17 +2037,39 @@ class RegionInstanceGroupManagersClient(
             if region is not None:
                 request.region = region
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list]
 
+        if views:
+            # Decode every page into lazy views.
+            rpc = functools.partial(rpc, views=True)
+
+        if fields is not None:
+            # Ask for a partial response.
+            rpc = functools.partial(
+                rpc, fields=_partial_response.format_fields(fields, paged=True)
+            )
+
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1423,8 +2085,11 @@ class RegionInstanceGroupManagersClient(
         region: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListErrorsPager:
         r"""Lists all errors thrown by actions on instances for a
         given regional managed instance group. The filter and
@@ -1461,6 +2126,19 @@ class RegionInstanceGroupManagersClient(
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.region_instance_group_managers.pagers.ListErrorsPager:
@@ -1479,6 +2157,24 @@ class RegionInstanceGroupManagersClient(
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from, compute.ListErrorsRegionInstanceGroupManagersRequest
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListErrorsRegionInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1496,17 +2192,29 @@ class RegionInstanceGroupManagersClient(
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_errors]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListErrorsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1522,8 +2230,11 @@ class RegionInstanceGroupManagersClient(
         region: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListManagedInstancesPager:
         r"""Lists the instances in the managed instance group and
         instances that are scheduled to be created. The list
@@ -1560,6 +2271,19 @@ class RegionInstanceGroupManagersClient(
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.region_instance_group_managers.pagers.ListManagedInstancesPager:
@@ -1578,6 +2302,25 @@ class RegionInstanceGroupManagersClient(
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from,
+                compute.ListManagedInstancesRegionInstanceGroupManagersRequest,
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListManagedInstancesRegionInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1597,17 +2340,29 @@ class RegionInstanceGroupManagersClient(
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[self._transport.list_managed_instances]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListManagedInstancesPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1623,8 +2378,11 @@ class RegionInstanceGroupManagersClient(
         region: str = None,
         instance_group_manager: str = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
+        prefetch: int = 0,
+        resume_from: str = None,
+        page_sizer: page_sizing.AdaptivePageSize = None,
     ) -> pagers.ListPerInstanceConfigsPager:
         r"""Lists all of the per-instance configs defined for the
         managed instance group. The orderBy query parameter is
@@ -1659,6 +2417,19 @@ class RegionInstanceGroupManagersClient(
             timeout (float): The timeout for this request.
             metadata (Sequence[Tuple[str, str]]): Strings which should be
                 sent along with the request as metadata.
+            prefetch (int): The most following pages to request in the
+                background while the current page is used, so that
+                waiting for pages overlaps with using them. If ``0``, each
+                page is requested once the previous one is used.
+            resume_from (str): A checkpoint returned by the
+                ``checkpoint`` method of a pager of this method, to
+                continue its iteration from. Cannot be combined with
+                ``request``, the individual field arguments or
+                ``page_sizer``.
+            page_sizer (google.cloud.compute_v1.page_sizing.AdaptivePageSize):
+                If set, sets ``max_results`` of each page to the size it
+                tunes from the latency and size of the pages before it,
+                instead of ``max_results`` of the request.
 
         Returns:
             google.cloud.compute_v1.services.region_instance_group_managers.pagers.ListPerInstanceConfigsPager:
@@ -1677,6 +2448,25 @@ class RegionInstanceGroupManagersClient(
                 "the individual field arguments should be set."
             )
 
+        offset = 0
+        if resume_from is not None:
+            # Request the page of the checkpoint again.
+            if request is not None or has_flattened_params:
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`request` or the individual field arguments."
+                )
+            if page_sizer is not None:
+                # The pager did not record the size the page was sent with.
+                raise ValueError(
+                    "The `resume_from` argument cannot be combined with "
+                    "`page_sizer`."
+                )
+            request, offset = _checkpoint.loads(
+                resume_from,
+                compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest,
+            )
+
         # Minor optimization to avoid making a copy if the user passes
         # in a compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest.
         # There's no risk of modifying the input as we've already verified
@@ -1696,19 +2486,31 @@ class RegionInstanceGroupManagersClient(
             if instance_group_manager is not None:
                 request.instance_group_manager = instance_group_manager
 
+        if prefetch < 0:
+            raise ValueError("The `prefetch` argument must not be negative.")
+
         # Wrap the RPC method; this adds retry and timeout information,
         # and friendly error handling.
         rpc = self._transport._wrapped_methods[
             self._transport.list_per_instance_configs
         ]
 
+        if page_sizer is not None:
+            # Tune the size of each page.
+            rpc = page_sizer.wrap(rpc)
+
         # Send the request.
         response = rpc(request, retry=retry, timeout=timeout, metadata=metadata,)
 
         # This method is paged; wrap the response in a pager, which provides
         # an `__iter__` convenience method.
         response = pagers.ListPerInstanceConfigsPager(
-            method=rpc, request=request, response=response, metadata=metadata,
+            method=rpc,
+            request=request,
+            response=response,
+            metadata=metadata,
+            prefetch=prefetch,
+            offset=offset,
         )
 
         # Done; return the response.
@@ -1723,7 +2525,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         instance_group_manager_resource: compute.InstanceGroupManager = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Updates a managed instance group using the
@@ -1836,30 +2638,38 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
-    def patch_per_instance_configs_unary(
+    def patch(
         self,
-        request: Union[
-            compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest, dict
-        ] = None,
+        request: Union[compute.PatchRegionInstanceGroupManagerRequest, dict] = None,
         *,
         project: str = None,
         region: str = None,
         instance_group_manager: str = None,
-        region_instance_group_manager_patch_instance_config_req_resource: compute.RegionInstanceGroupManagerPatchInstanceConfigReq = None,
+        instance_group_manager_resource: compute.InstanceGroupManager = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
-    ) -> compute.Operation:
-        r"""Inserts or patches per-instance configs for the
-        managed instance group. perInstanceConfig.name serves as
-        a key used to distinguish whether to perform insert or
-        patch.
+    ) -> operations.OperationFuture:
+        r"""Updates a managed instance group using the
+        information that you specify in the request. This
+        operation is marked as DONE when the group is patched
+        even if the instances in the group are still in the
+        process of being patched. You must separately verify the
+        status of the individual instances with the
+        listmanagedinstances method. This method supports PATCH
+        semantics and uses the JSON merge patch format and
+        processing rules. If you update your group to specify a
+        new template or instance configuration, it's possible
+        that your intended specification for each VM in the
+        group is different from the current state of that VM. To
+        learn how to apply an updated configuration to the VMs
+        in a MIG, see Updating instances in a MIG.
 
         Args:
-            request (Union[google.cloud.compute_v1.types.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
+            request (Union[google.cloud.compute_v1.types.PatchRegionInstanceGroupManagerRequest, dict]):
                 The request object. A request message for
-                RegionInstanceGroupManagers.PatchPerInstanceConfigs. See
-                the method description for details.
+                RegionInstanceGroupManagers.Patch. See the method
+                description for details.
             project (str):
                 Project ID for this request.
                 This corresponds to the ``project`` field
@@ -1867,15 +2677,87 @@ class RegionInstanceGroupManagersClient(
                 should not be set.
             region (str):
                 Name of the region scoping this
-                request, should conform to RFC1035.
+                request.
 
                 This corresponds to the ``region`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
             instance_group_manager (str):
-                The name of the managed instance
-                group. It should conform to RFC1035.
-
+                The name of the instance group
+                manager.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager_resource (google.cloud.compute_v1.types.InstanceGroupManager):
+                The body resource for this request
+                This corresponds to the ``instance_group_manager_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.patch_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            instance_group_manager_resource=instance_group_manager_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
+    def patch_per_instance_configs_unary(
+        self,
+        request: Union[
+            compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_manager_patch_instance_config_req_resource: compute.RegionInstanceGroupManagerPatchInstanceConfigReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> compute.Operation:
+        r"""Inserts or patches per-instance configs for the
+        managed instance group. perInstanceConfig.name serves as
+        a key used to distinguish whether to perform insert or
+        patch.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.PatchPerInstanceConfigs. See
+                the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request, should conform to RFC1035.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
                 This corresponds to the ``instance_group_manager`` field
                 on the ``request`` instance; if ``request`` is provided, this
                 should not be set.
@@ -1964,6 +2846,78 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def patch_per_instance_configs(
+        self,
+        request: Union[
+            compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_manager_patch_instance_config_req_resource: compute.RegionInstanceGroupManagerPatchInstanceConfigReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Inserts or patches per-instance configs for the
+        managed instance group. perInstanceConfig.name serves as
+        a key used to distinguish whether to perform insert or
+        patch.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.PatchPerInstanceConfigs. See
+                the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request, should conform to RFC1035.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_manager_patch_instance_config_req_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagerPatchInstanceConfigReq):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_manager_patch_instance_config_req_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.patch_per_instance_configs_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_manager_patch_instance_config_req_resource=region_instance_group_manager_patch_instance_config_req_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def recreate_instances_unary(
         self,
         request: Union[
@@ -1975,7 +2929,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_recreate_request_resource: compute.RegionInstanceGroupManagersRecreateRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Flags the specified VM instances in the managed
@@ -2095,6 +3049,86 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def recreate_instances(
+        self,
+        request: Union[
+            compute.RecreateInstancesRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_managers_recreate_request_resource: compute.RegionInstanceGroupManagersRecreateRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Flags the specified VM instances in the managed
+        instance group to be immediately recreated. Each
+        instance is recreated using the group's current
+        configuration. This operation is marked as DONE when the
+        flag is set even if the instances have not yet been
+        recreated. You must separately verify the status of each
+        instance by checking its currentAction field; for more
+        information, see Checking the status of managed
+        instances. If the group is part of a backend service
+        that has enabled connection draining, it can take up to
+        60 seconds after the connection draining duration has
+        elapsed before the VM instance is removed or deleted.
+        You can specify a maximum of 1000 instances with this
+        method per request.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.RecreateInstancesRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.RecreateInstances. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                Name of the managed instance group.
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_recreate_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersRecreateRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_recreate_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.recreate_instances_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_recreate_request_resource=region_instance_group_managers_recreate_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def resize_unary(
         self,
         request: Union[compute.ResizeRegionInstanceGroupManagerRequest, dict] = None,
@@ -2104,7 +3138,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         size: int = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Changes the intended size of the managed instance
@@ -2212,6 +3246,85 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def resize(
+        self,
+        request: Union[compute.ResizeRegionInstanceGroupManagerRequest, dict] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        size: int = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Changes the intended size of the managed instance
+        group. If you increase the size, the group creates new
+        instances using the current instance template. If you
+        decrease the size, the group deletes one or more
+        instances. The resize operation is marked DONE if the
+        resize request is successful. The underlying actions
+        take additional time. You must separately verify the
+        status of the creating or deleting actions with the
+        listmanagedinstances method. If the group is part of a
+        backend service that has enabled connection draining, it
+        can take up to 60 seconds after the connection draining
+        duration has elapsed before the VM instance is removed
+        or deleted.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.ResizeRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.Resize. See the method
+                description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                Name of the managed instance group.
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            size (int):
+                Number of instances that should exist
+                in this instance group manager.
+
+                This corresponds to the ``size`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.resize_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            size=size,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_instance_template_unary(
         self,
         request: Union[
@@ -2223,7 +3336,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_set_template_request_resource: compute.RegionInstanceGroupManagersSetTemplateRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Sets the instance template to use when creating new
@@ -2334,6 +3447,77 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def set_instance_template(
+        self,
+        request: Union[
+            compute.SetInstanceTemplateRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_managers_set_template_request_resource: compute.RegionInstanceGroupManagersSetTemplateRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Sets the instance template to use when creating new
+        instances or recreating instances in this group.
+        Existing instances are not affected.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetInstanceTemplateRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.SetInstanceTemplate. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_set_template_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersSetTemplateRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_set_template_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_instance_template_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_set_template_request_resource=region_instance_group_managers_set_template_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def set_target_pools_unary(
         self,
         request: Union[
@@ -2345,7 +3529,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_managers_set_target_pools_request_resource: compute.RegionInstanceGroupManagersSetTargetPoolsRequest = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Modifies the target pools to which all new instances
@@ -2455,6 +3639,75 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def set_target_pools(
+        self,
+        request: Union[
+            compute.SetTargetPoolsRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_managers_set_target_pools_request_resource: compute.RegionInstanceGroupManagersSetTargetPoolsRequest = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Modifies the target pools to which all new instances
+        in this group are assigned. Existing instances in the
+        group are not affected.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.SetTargetPoolsRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.SetTargetPools. See the
+                method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                Name of the managed instance group.
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_managers_set_target_pools_request_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagersSetTargetPoolsRequest):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_managers_set_target_pools_request_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.set_target_pools_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_managers_set_target_pools_request_resource=region_instance_group_managers_set_target_pools_request_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def update_per_instance_configs_unary(
         self,
         request: Union[
@@ -2466,7 +3719,7 @@ class RegionInstanceGroupManagersClient(
         instance_group_manager: str = None,
         region_instance_group_manager_update_instance_config_req_resource: compute.RegionInstanceGroupManagerUpdateInstanceConfigReq = None,
         retry: OptionalRetry = gapic_v1.method.DEFAULT,
-        timeout: float = None,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
         metadata: Sequence[Tuple[str, str]] = (),
     ) -> compute.Operation:
         r"""Inserts or updates per-instance configs for the
@@ -2583,6 +3836,78 @@ class RegionInstanceGroupManagersClient(
         # Done; return the response.
         return response
 
+    def update_per_instance_configs(
+        self,
+        request: Union[
+            compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest, dict
+        ] = None,
+        *,
+        project: str = None,
+        region: str = None,
+        instance_group_manager: str = None,
+        region_instance_group_manager_update_instance_config_req_resource: compute.RegionInstanceGroupManagerUpdateInstanceConfigReq = None,
+        retry: OptionalRetry = gapic_v1.method.DEFAULT,
+        timeout: Union[float, object] = gapic_v1.method.DEFAULT,
+        metadata: Sequence[Tuple[str, str]] = (),
+    ) -> operations.OperationFuture:
+        r"""Inserts or updates per-instance configs for the
+        managed instance group. perInstanceConfig.name serves as
+        a key used to distinguish whether to perform insert or
+        patch.
+
+        Args:
+            request (Union[google.cloud.compute_v1.types.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest, dict]):
+                The request object. A request message for
+                RegionInstanceGroupManagers.UpdatePerInstanceConfigs.
+                See the method description for details.
+            project (str):
+                Project ID for this request.
+                This corresponds to the ``project`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region (str):
+                Name of the region scoping this
+                request, should conform to RFC1035.
+
+                This corresponds to the ``region`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            instance_group_manager (str):
+                The name of the managed instance
+                group. It should conform to RFC1035.
+
+                This corresponds to the ``instance_group_manager`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            region_instance_group_manager_update_instance_config_req_resource (google.cloud.compute_v1.types.RegionInstanceGroupManagerUpdateInstanceConfigReq):
+                The body resource for this request
+                This corresponds to the ``region_instance_group_manager_update_instance_config_req_resource`` field
+                on the ``request`` instance; if ``request`` is provided, this
+                should not be set.
+            retry (google.api_core.retry.Retry): Designation of what errors, if any,
+                should be retried.
+            timeout (float): The timeout for this request.
+            metadata (Sequence[Tuple[str, str]]): Strings which should be
+                sent along with the request as metadata.
+
+        Returns:
+            google.cloud.compute_v1.operations.OperationFuture:
+                A future of the operation, resolved with the
+                operation when it is done.
+
+        """
+        operation = self.update_per_instance_configs_unary(
+            request,
+            project=project,
+            region=region,
+            instance_group_manager=instance_group_manager,
+            region_instance_group_manager_update_instance_config_req_resource=region_instance_group_manager_update_instance_config_req_resource,
+            retry=retry,
+            timeout=timeout,
+            metadata=metadata,
+        )
+        return operations.OperationFuture(operation, self._transport)
+
     def __enter__(self):
         return self
 
@@ -2597,12 +3922,7 @@ class RegionInstanceGroupManagersClient(
         self.transport.close()
 
 
-try:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-        gapic_version=pkg_resources.get_distribution("google-cloud-compute",).version,
-    )
-except pkg_resources.DistributionNotFound:
-    DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo()
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo()
 
 
 __all__ = ("RegionInstanceGroupManagersClient",)
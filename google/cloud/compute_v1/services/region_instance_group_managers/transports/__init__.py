@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionInstanceGroupManagersTransport]]
 _transport_registry["rest"] = RegionInstanceGroupManagersRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionInstanceGroupManagersAsyncRestTransport":
+        from .rest_asyncio import RegionInstanceGroupManagersAsyncRestTransport
+
+        return RegionInstanceGroupManagersAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionInstanceGroupManagersTransport",
     "RegionInstanceGroupManagersRestTransport",
+    "RegionInstanceGroupManagersAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    RegionInstanceGroupManagersTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import RegionInstanceGroupManagersTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, RegionInstanceGroupManagersRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, RegionInstanceGroupManagersRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AbandonInstances(RegionInstanceGroupManagersRestStub):
@@ -146,6 +174,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AbandonInstancesRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/abandonInstances",
+                    "body": "region_instance_group_managers_abandon_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AbandonInstancesRegionInstanceGroupManagerRequest,
@@ -188,42 +228,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/abandonInstances",
-                    "body": "region_instance_group_managers_abandon_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AbandonInstancesRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersAbandonInstancesRequest.to_json(
-                compute.RegionInstanceGroupManagersAbandonInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AbandonInstancesRegionInstanceGroupManagerRequest.to_json(
-                    compute.AbandonInstancesRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -233,7 +239,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -242,9 +248,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _ApplyUpdatesToInstances(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -260,6 +264,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/applyUpdatesToInstances",
+                    "body": "region_instance_group_managers_apply_updates_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest,
@@ -303,42 +319,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/applyUpdatesToInstances",
-                    "body": "region_instance_group_managers_apply_updates_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersApplyUpdatesRequest.to_json(
-                compute.RegionInstanceGroupManagersApplyUpdatesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest.to_json(
-                    compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -348,7 +330,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -357,9 +339,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _CreateInstances(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -375,6 +355,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.CreateInstancesRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/createInstances",
+                    "body": "region_instance_group_managers_create_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.CreateInstancesRegionInstanceGroupManagerRequest,
@@ -417,42 +409,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/createInstances",
-                    "body": "region_instance_group_managers_create_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.CreateInstancesRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersCreateInstancesRequest.to_json(
-                compute.RegionInstanceGroupManagersCreateInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.CreateInstancesRegionInstanceGroupManagerRequest.to_json(
-                    compute.CreateInstancesRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -462,7 +420,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -471,9 +429,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -489,6 +445,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteRegionInstanceGroupManagerRequest,
@@ -531,33 +498,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteRegionInstanceGroupManagerRequest.to_json(
-                    compute.DeleteRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -567,7 +509,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -575,9 +517,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeleteInstances(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -593,6 +533,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteInstancesRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/deleteInstances",
+                    "body": "region_instance_group_managers_delete_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteInstancesRegionInstanceGroupManagerRequest,
@@ -635,42 +587,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/deleteInstances",
-                    "body": "region_instance_group_managers_delete_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.DeleteInstancesRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersDeleteInstancesRequest.to_json(
-                compute.RegionInstanceGroupManagersDeleteInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteInstancesRegionInstanceGroupManagerRequest.to_json(
-                    compute.DeleteInstancesRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -680,7 +598,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -689,9 +607,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _DeletePerInstanceConfigs(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -707,6 +623,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/deletePerInstanceConfigs",
+                    "body": "region_instance_group_manager_delete_instance_config_req_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest,
@@ -750,42 +678,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/deletePerInstanceConfigs",
-                    "body": "region_instance_group_manager_delete_instance_config_req_resource",
-                },
-            ]
-
-            request_kwargs = compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagerDeleteInstanceConfigReq.to_json(
-                compute.RegionInstanceGroupManagerDeleteInstanceConfigReq(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest.to_json(
-                    compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -795,7 +689,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -804,9 +698,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -822,6 +714,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetRegionInstanceGroupManagerRequest,
@@ -829,6 +732,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroupManager:
             r"""Call the get method over HTTP.
 
@@ -843,6 +747,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroupManager:
@@ -858,33 +764,10 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}",
-                },
-            ]
-
-            request_kwargs = compute.GetRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetRegionInstanceGroupManagerRequest.to_json(
-                    compute.GetRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -894,7 +777,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -902,8 +785,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroupManager.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.InstanceGroupManager, response.content
             )
 
     class _Insert(RegionInstanceGroupManagersRestStub):
@@ -920,6 +803,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers",
+                    "body": "instance_group_manager_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertRegionInstanceGroupManagerRequest,
@@ -962,40 +857,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers",
-                    "body": "instance_group_manager_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManager.to_json(
-                compute.InstanceGroupManager(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertRegionInstanceGroupManagerRequest.to_json(
-                    compute.InsertRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1005,7 +868,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1014,9 +877,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1032,6 +893,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListRegionInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListRegionInstanceGroupManagersRequest,
@@ -1039,6 +911,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.RegionInstanceGroupManagerList:
             r"""Call the list method over HTTP.
 
@@ -1053,6 +927,11 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.RegionInstanceGroupManagerList:
@@ -1061,33 +940,10 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers",
-                },
-            ]
-
-            request_kwargs = compute.ListRegionInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListRegionInstanceGroupManagersRequest.to_json(
-                    compute.ListRegionInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -1097,7 +953,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1105,8 +961,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.RegionInstanceGroupManagerList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.RegionInstanceGroupManagerList, response.content, lazy=views
             )
 
     class _ListErrors(RegionInstanceGroupManagersRestStub):
@@ -1123,6 +979,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListErrorsRegionInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/listErrors",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListErrorsRegionInstanceGroupManagersRequest,
@@ -1150,33 +1017,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/listErrors",
-                },
-            ]
-
-            request_kwargs = compute.ListErrorsRegionInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListErrorsRegionInstanceGroupManagersRequest.to_json(
-                    compute.ListErrorsRegionInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1186,7 +1028,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1194,8 +1036,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.RegionInstanceGroupManagersListErrorsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.RegionInstanceGroupManagersListErrorsResponse, response.content
             )
 
     class _ListManagedInstances(RegionInstanceGroupManagersRestStub):
@@ -1212,6 +1054,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListManagedInstancesRegionInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/listManagedInstances",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListManagedInstancesRegionInstanceGroupManagersRequest,
@@ -1239,33 +1092,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/listManagedInstances",
-                },
-            ]
-
-            request_kwargs = compute.ListManagedInstancesRegionInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListManagedInstancesRegionInstanceGroupManagersRequest.to_json(
-                    compute.ListManagedInstancesRegionInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1275,7 +1103,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1283,8 +1111,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.RegionInstanceGroupManagersListInstancesResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.RegionInstanceGroupManagersListInstancesResponse,
+                response.content,
             )
 
     class _ListPerInstanceConfigs(RegionInstanceGroupManagersRestStub):
@@ -1301,6 +1130,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/listPerInstanceConfigs",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest,
@@ -1328,33 +1168,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/listPerInstanceConfigs",
-                },
-            ]
-
-            request_kwargs = compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest.to_json(
-                    compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1364,7 +1179,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1372,8 +1187,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.RegionInstanceGroupManagersListInstanceConfigsResp.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.RegionInstanceGroupManagersListInstanceConfigsResp,
+                response.content,
             )
 
     class _Patch(RegionInstanceGroupManagersRestStub):
@@ -1390,6 +1206,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}",
+                    "body": "instance_group_manager_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchRegionInstanceGroupManagerRequest,
@@ -1432,40 +1260,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}",
-                    "body": "instance_group_manager_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceGroupManager.to_json(
-                compute.InstanceGroupManager(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchRegionInstanceGroupManagerRequest.to_json(
-                    compute.PatchRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1475,7 +1271,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1484,9 +1280,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _PatchPerInstanceConfigs(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1502,6 +1296,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/patchPerInstanceConfigs",
+                    "body": "region_instance_group_manager_patch_instance_config_req_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest,
@@ -1545,42 +1351,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/patchPerInstanceConfigs",
-                    "body": "region_instance_group_manager_patch_instance_config_req_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagerPatchInstanceConfigReq.to_json(
-                compute.RegionInstanceGroupManagerPatchInstanceConfigReq(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest.to_json(
-                    compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1590,7 +1362,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1599,9 +1371,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _RecreateInstances(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1617,6 +1387,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RecreateInstancesRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/recreateInstances",
+                    "body": "region_instance_group_managers_recreate_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RecreateInstancesRegionInstanceGroupManagerRequest,
@@ -1659,42 +1441,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/recreateInstances",
-                    "body": "region_instance_group_managers_recreate_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RecreateInstancesRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersRecreateRequest.to_json(
-                compute.RegionInstanceGroupManagersRecreateRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RecreateInstancesRegionInstanceGroupManagerRequest.to_json(
-                    compute.RecreateInstancesRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1704,7 +1452,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1713,9 +1461,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Resize(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1733,6 +1479,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ResizeRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/resize",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ResizeRegionInstanceGroupManagerRequest,
@@ -1775,33 +1532,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/resize",
-                },
-            ]
-
-            request_kwargs = compute.ResizeRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ResizeRegionInstanceGroupManagerRequest.to_json(
-                    compute.ResizeRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1811,7 +1543,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1819,9 +1551,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetInstanceTemplate(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1837,6 +1567,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetInstanceTemplateRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/setInstanceTemplate",
+                    "body": "region_instance_group_managers_set_template_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetInstanceTemplateRegionInstanceGroupManagerRequest,
@@ -1879,42 +1621,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/setInstanceTemplate",
-                    "body": "region_instance_group_managers_set_template_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetInstanceTemplateRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersSetTemplateRequest.to_json(
-                compute.RegionInstanceGroupManagersSetTemplateRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetInstanceTemplateRegionInstanceGroupManagerRequest.to_json(
-                    compute.SetInstanceTemplateRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1924,7 +1632,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1933,9 +1641,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetTargetPools(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -1951,6 +1657,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetTargetPoolsRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/setTargetPools",
+                    "body": "region_instance_group_managers_set_target_pools_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetTargetPoolsRegionInstanceGroupManagerRequest,
@@ -1993,42 +1711,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/setTargetPools",
-                    "body": "region_instance_group_managers_set_target_pools_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetTargetPoolsRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagersSetTargetPoolsRequest.to_json(
-                compute.RegionInstanceGroupManagersSetTargetPoolsRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetTargetPoolsRegionInstanceGroupManagerRequest.to_json(
-                    compute.SetTargetPoolsRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2038,7 +1722,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2047,9 +1731,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _UpdatePerInstanceConfigs(RegionInstanceGroupManagersRestStub):
         def __hash__(self):
@@ -2065,6 +1747,18 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/updatePerInstanceConfigs",
+                    "body": "region_instance_group_manager_update_instance_config_req_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest,
@@ -2108,42 +1802,8 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroupManagers/{instance_group_manager}/updatePerInstanceConfigs",
-                    "body": "region_instance_group_manager_update_instance_config_req_resource",
-                },
-            ]
-
-            request_kwargs = compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupManagerUpdateInstanceConfigReq.to_json(
-                compute.RegionInstanceGroupManagerUpdateInstanceConfigReq(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest.to_json(
-                    compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -2153,7 +1813,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -2162,9 +1822,7 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def abandon_instances(
@@ -2172,9 +1830,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[
         [compute.AbandonInstancesRegionInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("abandon_instances")
+        stub = self._stubs.get("abandon_instances")
         if not stub:
-            stub = self._STUBS["abandon_instances"] = self._AbandonInstances(
+            stub = self._stubs["abandon_instances"] = self._AbandonInstances(
                 self._session, self._host
             )
 
@@ -2187,9 +1845,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.ApplyUpdatesToInstancesRegionInstanceGroupManagerRequest],
         compute.Operation,
     ]:
-        stub = self._STUBS.get("apply_updates_to_instances")
+        stub = self._stubs.get("apply_updates_to_instances")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "apply_updates_to_instances"
             ] = self._ApplyUpdatesToInstances(self._session, self._host)
 
@@ -2201,9 +1859,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[
         [compute.CreateInstancesRegionInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("create_instances")
+        stub = self._stubs.get("create_instances")
         if not stub:
-            stub = self._STUBS["create_instances"] = self._CreateInstances(
+            stub = self._stubs["create_instances"] = self._CreateInstances(
                 self._session, self._host
             )
 
@@ -2213,9 +1871,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     def delete(
         self,
     ) -> Callable[[compute.DeleteRegionInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -2225,9 +1883,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[
         [compute.DeleteInstancesRegionInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("delete_instances")
+        stub = self._stubs.get("delete_instances")
         if not stub:
-            stub = self._STUBS["delete_instances"] = self._DeleteInstances(
+            stub = self._stubs["delete_instances"] = self._DeleteInstances(
                 self._session, self._host
             )
 
@@ -2240,9 +1898,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.DeletePerInstanceConfigsRegionInstanceGroupManagerRequest],
         compute.Operation,
     ]:
-        stub = self._STUBS.get("delete_per_instance_configs")
+        stub = self._stubs.get("delete_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "delete_per_instance_configs"
             ] = self._DeletePerInstanceConfigs(self._session, self._host)
 
@@ -2254,9 +1912,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[
         [compute.GetRegionInstanceGroupManagerRequest], compute.InstanceGroupManager
     ]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -2264,9 +1922,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     def insert(
         self,
     ) -> Callable[[compute.InsertRegionInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -2277,9 +1935,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.ListRegionInstanceGroupManagersRequest],
         compute.RegionInstanceGroupManagerList,
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -2290,9 +1948,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.ListErrorsRegionInstanceGroupManagersRequest],
         compute.RegionInstanceGroupManagersListErrorsResponse,
     ]:
-        stub = self._STUBS.get("list_errors")
+        stub = self._stubs.get("list_errors")
         if not stub:
-            stub = self._STUBS["list_errors"] = self._ListErrors(
+            stub = self._stubs["list_errors"] = self._ListErrors(
                 self._session, self._host
             )
 
@@ -2305,9 +1963,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.ListManagedInstancesRegionInstanceGroupManagersRequest],
         compute.RegionInstanceGroupManagersListInstancesResponse,
     ]:
-        stub = self._STUBS.get("list_managed_instances")
+        stub = self._stubs.get("list_managed_instances")
         if not stub:
-            stub = self._STUBS["list_managed_instances"] = self._ListManagedInstances(
+            stub = self._stubs["list_managed_instances"] = self._ListManagedInstances(
                 self._session, self._host
             )
 
@@ -2320,9 +1978,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.ListPerInstanceConfigsRegionInstanceGroupManagersRequest],
         compute.RegionInstanceGroupManagersListInstanceConfigsResp,
     ]:
-        stub = self._STUBS.get("list_per_instance_configs")
+        stub = self._stubs.get("list_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "list_per_instance_configs"
             ] = self._ListPerInstanceConfigs(self._session, self._host)
 
@@ -2332,9 +1990,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     def patch(
         self,
     ) -> Callable[[compute.PatchRegionInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -2345,9 +2003,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.PatchPerInstanceConfigsRegionInstanceGroupManagerRequest],
         compute.Operation,
     ]:
-        stub = self._STUBS.get("patch_per_instance_configs")
+        stub = self._stubs.get("patch_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "patch_per_instance_configs"
             ] = self._PatchPerInstanceConfigs(self._session, self._host)
 
@@ -2359,9 +2017,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[
         [compute.RecreateInstancesRegionInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("recreate_instances")
+        stub = self._stubs.get("recreate_instances")
         if not stub:
-            stub = self._STUBS["recreate_instances"] = self._RecreateInstances(
+            stub = self._stubs["recreate_instances"] = self._RecreateInstances(
                 self._session, self._host
             )
 
@@ -2371,9 +2029,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     def resize(
         self,
     ) -> Callable[[compute.ResizeRegionInstanceGroupManagerRequest], compute.Operation]:
-        stub = self._STUBS.get("resize")
+        stub = self._stubs.get("resize")
         if not stub:
-            stub = self._STUBS["resize"] = self._Resize(self._session, self._host)
+            stub = self._stubs["resize"] = self._Resize(self._session, self._host)
 
         return stub
 
@@ -2384,9 +2042,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.SetInstanceTemplateRegionInstanceGroupManagerRequest],
         compute.Operation,
     ]:
-        stub = self._STUBS.get("set_instance_template")
+        stub = self._stubs.get("set_instance_template")
         if not stub:
-            stub = self._STUBS["set_instance_template"] = self._SetInstanceTemplate(
+            stub = self._stubs["set_instance_template"] = self._SetInstanceTemplate(
                 self._session, self._host
             )
 
@@ -2398,9 +2056,9 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
     ) -> Callable[
         [compute.SetTargetPoolsRegionInstanceGroupManagerRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("set_target_pools")
+        stub = self._stubs.get("set_target_pools")
         if not stub:
-            stub = self._STUBS["set_target_pools"] = self._SetTargetPools(
+            stub = self._stubs["set_target_pools"] = self._SetTargetPools(
                 self._session, self._host
             )
 
@@ -2413,16 +2071,17 @@ class RegionInstanceGroupManagersRestTransport(RegionInstanceGroupManagersTransp
         [compute.UpdatePerInstanceConfigsRegionInstanceGroupManagerRequest],
         compute.Operation,
     ]:
-        stub = self._STUBS.get("update_per_instance_configs")
+        stub = self._stubs.get("update_per_instance_configs")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "update_per_instance_configs"
             ] = self._UpdatePerInstanceConfigs(self._session, self._host)
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("RegionInstanceGroupManagersRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import RegionInstanceGroupsClient
 
-__all__ = ("RegionInstanceGroupsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionInstanceGroupsAsyncClient":
+        from .async_client import RegionInstanceGroupsAsyncClient
+
+        return RegionInstanceGroupsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionInstanceGroupsClient",
+    "RegionInstanceGroupsAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionInstanceGroupsTransport]]
 _transport_registry["rest"] = RegionInstanceGroupsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionInstanceGroupsAsyncRestTransport":
+        from .rest_asyncio import RegionInstanceGroupsAsyncRestTransport
+
+        return RegionInstanceGroupsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionInstanceGroupsTransport",
     "RegionInstanceGroupsRestTransport",
+    "RegionInstanceGroupsAsyncRestTransport",
 )
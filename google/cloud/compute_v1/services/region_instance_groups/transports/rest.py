@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    RegionInstanceGroupsTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import RegionInstanceGroupsTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, RegionInstanceGroupsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, RegionInstanceGroupsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _Get(RegionInstanceGroupsRestStub):
@@ -146,6 +174,17 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetRegionInstanceGroupRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups/{instance_group}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetRegionInstanceGroupRequest,
@@ -153,6 +192,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.InstanceGroup:
             r"""Call the get method over HTTP.
 
@@ -167,6 +207,8 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.InstanceGroup:
@@ -187,31 +229,10 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups/{instance_group}",
-                },
-            ]
-
-            request_kwargs = compute.GetRegionInstanceGroupRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetRegionInstanceGroupRequest.to_json(
-                    compute.GetRegionInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -221,7 +242,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -229,9 +250,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.InstanceGroup.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.InstanceGroup, response.content)
 
     class _List(RegionInstanceGroupsRestStub):
         def __hash__(self):
@@ -247,6 +266,17 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListRegionInstanceGroupsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListRegionInstanceGroupsRequest,
@@ -254,6 +284,8 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.RegionInstanceGroupList:
             r"""Call the list method over HTTP.
 
@@ -268,6 +300,11 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.RegionInstanceGroupList:
@@ -276,31 +313,10 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups",
-                },
-            ]
-
-            request_kwargs = compute.ListRegionInstanceGroupsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListRegionInstanceGroupsRequest.to_json(
-                    compute.ListRegionInstanceGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -310,7 +326,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -318,8 +334,8 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.RegionInstanceGroupList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.RegionInstanceGroupList, response.content, lazy=views
             )
 
     class _ListInstances(RegionInstanceGroupsRestStub):
@@ -336,6 +352,18 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListInstancesRegionInstanceGroupsRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups/{instance_group}/listInstances",
+                    "body": "region_instance_groups_list_instances_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListInstancesRegionInstanceGroupsRequest,
@@ -363,42 +391,8 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups/{instance_group}/listInstances",
-                    "body": "region_instance_groups_list_instances_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.ListInstancesRegionInstanceGroupsRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupsListInstancesRequest.to_json(
-                compute.RegionInstanceGroupsListInstancesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListInstancesRegionInstanceGroupsRequest.to_json(
-                    compute.ListInstancesRegionInstanceGroupsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -408,7 +402,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -417,8 +411,8 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.RegionInstanceGroupsListInstances.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.RegionInstanceGroupsListInstances, response.content
             )
 
     class _SetNamedPorts(RegionInstanceGroupsRestStub):
@@ -435,6 +429,18 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetNamedPortsRegionInstanceGroupRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups/{instance_group}/setNamedPorts",
+                    "body": "region_instance_groups_set_named_ports_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetNamedPortsRegionInstanceGroupRequest,
@@ -477,42 +483,8 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/instanceGroups/{instance_group}/setNamedPorts",
-                    "body": "region_instance_groups_set_named_ports_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetNamedPortsRegionInstanceGroupRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.RegionInstanceGroupsSetNamedPortsRequest.to_json(
-                compute.RegionInstanceGroupsSetNamedPortsRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetNamedPortsRegionInstanceGroupRequest.to_json(
-                    compute.SetNamedPortsRegionInstanceGroupRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -522,7 +494,7 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -531,17 +503,15 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def get(
         self,
     ) -> Callable[[compute.GetRegionInstanceGroupRequest], compute.InstanceGroup]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -551,9 +521,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     ) -> Callable[
         [compute.ListRegionInstanceGroupsRequest], compute.RegionInstanceGroupList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -564,9 +534,9 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
         [compute.ListInstancesRegionInstanceGroupsRequest],
         compute.RegionInstanceGroupsListInstances,
     ]:
-        stub = self._STUBS.get("list_instances")
+        stub = self._stubs.get("list_instances")
         if not stub:
-            stub = self._STUBS["list_instances"] = self._ListInstances(
+            stub = self._stubs["list_instances"] = self._ListInstances(
                 self._session, self._host
             )
 
@@ -576,16 +546,17 @@ class RegionInstanceGroupsRestTransport(RegionInstanceGroupsTransport):
     def set_named_ports(
         self,
     ) -> Callable[[compute.SetNamedPortsRegionInstanceGroupRequest], compute.Operation]:
-        stub = self._STUBS.get("set_named_ports")
+        stub = self._stubs.get("set_named_ports")
         if not stub:
-            stub = self._STUBS["set_named_ports"] = self._SetNamedPorts(
+            stub = self._stubs["set_named_ports"] = self._SetNamedPorts(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("RegionInstanceGroupsRestTransport",)
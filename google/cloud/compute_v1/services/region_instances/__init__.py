@@ -15,4 +15,18 @@
 #
 from .client import RegionInstancesClient
 
-__all__ = ("RegionInstancesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionInstancesAsyncClient":
+        from .async_client import RegionInstancesAsyncClient
+
+        return RegionInstancesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionInstancesClient",
+    "RegionInstancesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import RegionInstancesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionInstancesTransport]]
 _transport_registry["rest"] = RegionInstancesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionInstancesAsyncRestTransport":
+        from .rest_asyncio import RegionInstancesAsyncRestTransport
+
+        return RegionInstancesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionInstancesTransport",
     "RegionInstancesRestTransport",
+    "RegionInstancesAsyncRestTransport",
 )
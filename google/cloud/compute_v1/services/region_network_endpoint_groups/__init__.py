@@ -15,4 +15,18 @@
 #
 from .client import RegionNetworkEndpointGroupsClient
 
-__all__ = ("RegionNetworkEndpointGroupsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionNetworkEndpointGroupsAsyncClient":
+        from .async_client import RegionNetworkEndpointGroupsAsyncClient
+
+        return RegionNetworkEndpointGroupsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionNetworkEndpointGroupsClient",
+    "RegionNetworkEndpointGroupsAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionNetworkEndpointGroupsTransport]]
 _transport_registry["rest"] = RegionNetworkEndpointGroupsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionNetworkEndpointGroupsAsyncRestTransport":
+        from .rest_asyncio import RegionNetworkEndpointGroupsAsyncRestTransport
+
+        return RegionNetworkEndpointGroupsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionNetworkEndpointGroupsTransport",
     "RegionNetworkEndpointGroupsRestTransport",
+    "RegionNetworkEndpointGroupsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionNotificationEndpointsClient
 
-__all__ = ("RegionNotificationEndpointsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionNotificationEndpointsAsyncClient":
+        from .async_client import RegionNotificationEndpointsAsyncClient
+
+        return RegionNotificationEndpointsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionNotificationEndpointsClient",
+    "RegionNotificationEndpointsAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionNotificationEndpointsTransport]]
 _transport_registry["rest"] = RegionNotificationEndpointsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionNotificationEndpointsAsyncRestTransport":
+        from .rest_asyncio import RegionNotificationEndpointsAsyncRestTransport
+
+        return RegionNotificationEndpointsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionNotificationEndpointsTransport",
     "RegionNotificationEndpointsRestTransport",
+    "RegionNotificationEndpointsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionOperationsClient
 
-__all__ = ("RegionOperationsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionOperationsAsyncClient":
+        from .async_client import RegionOperationsAsyncClient
+
+        return RegionOperationsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionOperationsClient",
+    "RegionOperationsAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import RegionOperationsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionOperationsTransport]]
 _transport_registry["rest"] = RegionOperationsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionOperationsAsyncRestTransport":
+        from .rest_asyncio import RegionOperationsAsyncRestTransport
+
+        return RegionOperationsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionOperationsTransport",
     "RegionOperationsRestTransport",
+    "RegionOperationsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionSslCertificatesClient
 
-__all__ = ("RegionSslCertificatesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionSslCertificatesAsyncClient":
+        from .async_client import RegionSslCertificatesAsyncClient
+
+        return RegionSslCertificatesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionSslCertificatesClient",
+    "RegionSslCertificatesAsyncClient",
+)
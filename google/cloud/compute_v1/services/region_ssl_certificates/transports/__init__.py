@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionSslCertificatesTransport]]
 _transport_registry["rest"] = RegionSslCertificatesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionSslCertificatesAsyncRestTransport":
+        from .rest_asyncio import RegionSslCertificatesAsyncRestTransport
+
+        return RegionSslCertificatesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionSslCertificatesTransport",
     "RegionSslCertificatesRestTransport",
+    "RegionSslCertificatesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionTargetHttpProxiesClient
 
-__all__ = ("RegionTargetHttpProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionTargetHttpProxiesAsyncClient":
+        from .async_client import RegionTargetHttpProxiesAsyncClient
+
+        return RegionTargetHttpProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionTargetHttpProxiesClient",
+    "RegionTargetHttpProxiesAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionTargetHttpProxiesTransport]]
 _transport_registry["rest"] = RegionTargetHttpProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionTargetHttpProxiesAsyncRestTransport":
+        from .rest_asyncio import RegionTargetHttpProxiesAsyncRestTransport
+
+        return RegionTargetHttpProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionTargetHttpProxiesTransport",
     "RegionTargetHttpProxiesRestTransport",
+    "RegionTargetHttpProxiesAsyncRestTransport",
 )
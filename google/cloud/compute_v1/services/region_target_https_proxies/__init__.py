@@ -15,4 +15,18 @@
 #
 from .client import RegionTargetHttpsProxiesClient
 
-__all__ = ("RegionTargetHttpsProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionTargetHttpsProxiesAsyncClient":
+        from .async_client import RegionTargetHttpsProxiesAsyncClient
+
+        return RegionTargetHttpsProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionTargetHttpsProxiesClient",
+    "RegionTargetHttpsProxiesAsyncClient",
+)
@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[RegionTargetHttpsProxiesTransport]]
 _transport_registry["rest"] = RegionTargetHttpsProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionTargetHttpsProxiesAsyncRestTransport":
+        from .rest_asyncio import RegionTargetHttpsProxiesAsyncRestTransport
+
+        return RegionTargetHttpsProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionTargetHttpsProxiesTransport",
     "RegionTargetHttpsProxiesRestTransport",
+    "RegionTargetHttpsProxiesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RegionUrlMapsClient
 
-__all__ = ("RegionUrlMapsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionUrlMapsAsyncClient":
+        from .async_client import RegionUrlMapsAsyncClient
+
+        return RegionUrlMapsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionUrlMapsClient",
+    "RegionUrlMapsAsyncClient",
+)
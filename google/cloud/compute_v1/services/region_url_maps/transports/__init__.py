@@ -24,7 +24,19 @@ from .rest import RegionUrlMapsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionUrlMapsTransport]]
 _transport_registry["rest"] = RegionUrlMapsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionUrlMapsAsyncRestTransport":
+        from .rest_asyncio import RegionUrlMapsAsyncRestTransport
+
+        return RegionUrlMapsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionUrlMapsTransport",
     "RegionUrlMapsRestTransport",
+    "RegionUrlMapsAsyncRestTransport",
 )
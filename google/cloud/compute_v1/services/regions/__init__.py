@@ -15,4 +15,18 @@
 #
 from .client import RegionsClient
 
-__all__ = ("RegionsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RegionsAsyncClient":
+        from .async_client import RegionsAsyncClient
+
+        return RegionsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RegionsClient",
+    "RegionsAsyncClient",
+)
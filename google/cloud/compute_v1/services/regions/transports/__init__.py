@@ -24,7 +24,19 @@ from .rest import RegionsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RegionsTransport]]
 _transport_registry["rest"] = RegionsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RegionsAsyncRestTransport":
+        from .rest_asyncio import RegionsAsyncRestTransport
+
+        return RegionsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RegionsTransport",
     "RegionsRestTransport",
+    "RegionsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import ReservationsClient
 
-__all__ = ("ReservationsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ReservationsAsyncClient":
+        from .async_client import ReservationsAsyncClient
+
+        return ReservationsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ReservationsClient",
+    "ReservationsAsyncClient",
+)
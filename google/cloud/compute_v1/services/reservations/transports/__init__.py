@@ -24,7 +24,19 @@ from .rest import ReservationsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ReservationsTransport]]
 _transport_registry["rest"] = ReservationsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ReservationsAsyncRestTransport":
+        from .rest_asyncio import ReservationsAsyncRestTransport
+
+        return ReservationsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ReservationsTransport",
     "ReservationsRestTransport",
+    "ReservationsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import ResourcePoliciesClient
 
-__all__ = ("ResourcePoliciesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ResourcePoliciesAsyncClient":
+        from .async_client import ResourcePoliciesAsyncClient
+
+        return ResourcePoliciesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ResourcePoliciesClient",
+    "ResourcePoliciesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import ResourcePoliciesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ResourcePoliciesTransport]]
 _transport_registry["rest"] = ResourcePoliciesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ResourcePoliciesAsyncRestTransport":
+        from .rest_asyncio import ResourcePoliciesAsyncRestTransport
+
+        return ResourcePoliciesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ResourcePoliciesTransport",
     "ResourcePoliciesRestTransport",
+    "ResourcePoliciesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RoutersClient
 
-__all__ = ("RoutersClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RoutersAsyncClient":
+        from .async_client import RoutersAsyncClient
+
+        return RoutersAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RoutersClient",
+    "RoutersAsyncClient",
+)
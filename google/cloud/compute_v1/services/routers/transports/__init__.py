@@ -24,7 +24,19 @@ from .rest import RoutersRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RoutersTransport]]
 _transport_registry["rest"] = RoutersRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RoutersAsyncRestTransport":
+        from .rest_asyncio import RoutersAsyncRestTransport
+
+        return RoutersAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RoutersTransport",
     "RoutersRestTransport",
+    "RoutersAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import RoutesClient
 
-__all__ = ("RoutesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "RoutesAsyncClient":
+        from .async_client import RoutesAsyncClient
+
+        return RoutesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "RoutesClient",
+    "RoutesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import RoutesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[RoutesTransport]]
 _transport_registry["rest"] = RoutesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "RoutesAsyncRestTransport":
+        from .rest_asyncio import RoutesAsyncRestTransport
+
+        return RoutesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "RoutesTransport",
     "RoutesRestTransport",
+    "RoutesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import SecurityPoliciesClient
 
-__all__ = ("SecurityPoliciesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "SecurityPoliciesAsyncClient":
+        from .async_client import SecurityPoliciesAsyncClient
+
+        return SecurityPoliciesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "SecurityPoliciesClient",
+    "SecurityPoliciesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import SecurityPoliciesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[SecurityPoliciesTransport]]
 _transport_registry["rest"] = SecurityPoliciesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "SecurityPoliciesAsyncRestTransport":
+        from .rest_asyncio import SecurityPoliciesAsyncRestTransport
+
+        return SecurityPoliciesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "SecurityPoliciesTransport",
     "SecurityPoliciesRestTransport",
+    "SecurityPoliciesAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    SecurityPoliciesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import SecurityPoliciesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, SecurityPoliciesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, SecurityPoliciesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddRule(SecurityPoliciesRestStub):
@@ -146,6 +174,18 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddRuleSecurityPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/addRule",
+                    "body": "security_policy_rule_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddRuleSecurityPolicyRequest,
@@ -188,38 +228,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/addRule",
-                    "body": "security_policy_rule_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddRuleSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SecurityPolicyRule.to_json(
-                compute.SecurityPolicyRule(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddRuleSecurityPolicyRequest.to_json(
-                    compute.AddRuleSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -229,7 +239,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -238,9 +248,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Delete(SecurityPoliciesRestStub):
         def __hash__(self):
@@ -256,6 +264,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteSecurityPolicyRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteSecurityPolicyRequest,
@@ -298,31 +317,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteSecurityPolicyRequest.to_json(
-                    compute.DeleteSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -332,7 +328,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -340,9 +336,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(SecurityPoliciesRestStub):
         def __hash__(self):
@@ -358,6 +352,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetSecurityPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetSecurityPolicyRequest,
@@ -365,6 +370,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.SecurityPolicy:
             r"""Call the get method over HTTP.
 
@@ -379,6 +385,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.SecurityPolicy:
@@ -391,31 +399,10 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}",
-                },
-            ]
-
-            request_kwargs = compute.GetSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetSecurityPolicyRequest.to_json(
-                    compute.GetSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -425,7 +412,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -433,9 +420,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.SecurityPolicy.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.SecurityPolicy, response.content)
 
     class _GetRule(SecurityPoliciesRestStub):
         def __hash__(self):
@@ -451,6 +436,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetRuleSecurityPolicyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/getRule",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetRuleSecurityPolicyRequest,
@@ -482,31 +478,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/getRule",
-                },
-            ]
-
-            request_kwargs = compute.GetRuleSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetRuleSecurityPolicyRequest.to_json(
-                    compute.GetRuleSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -516,7 +489,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -524,8 +497,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.SecurityPolicyRule.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.SecurityPolicyRule, response.content
             )
 
     class _Insert(SecurityPoliciesRestStub):
@@ -542,6 +515,18 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertSecurityPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies",
+                    "body": "security_policy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertSecurityPolicyRequest,
@@ -584,38 +569,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies",
-                    "body": "security_policy_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SecurityPolicy.to_json(
-                compute.SecurityPolicy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertSecurityPolicyRequest.to_json(
-                    compute.InsertSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -625,7 +580,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -634,9 +589,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(SecurityPoliciesRestStub):
         def __hash__(self):
@@ -652,6 +605,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListSecurityPoliciesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListSecurityPoliciesRequest,
@@ -659,6 +623,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.SecurityPolicyList:
             r"""Call the list method over HTTP.
 
@@ -673,37 +639,21 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.SecurityPolicyList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies",
-                },
-            ]
-
-            request_kwargs = compute.ListSecurityPoliciesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListSecurityPoliciesRequest.to_json(
-                    compute.ListSecurityPoliciesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -713,7 +663,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -721,8 +671,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.SecurityPolicyList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.SecurityPolicyList, response.content, lazy=views
             )
 
     class _ListPreconfiguredExpressionSets(SecurityPoliciesRestStub):
@@ -739,6 +689,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListPreconfiguredExpressionSetsSecurityPoliciesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/listPreconfiguredExpressionSets",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListPreconfiguredExpressionSetsSecurityPoliciesRequest,
@@ -767,33 +728,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/listPreconfiguredExpressionSets",
-                },
-            ]
-
-            request_kwargs = compute.ListPreconfiguredExpressionSetsSecurityPoliciesRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListPreconfiguredExpressionSetsSecurityPoliciesRequest.to_json(
-                    compute.ListPreconfiguredExpressionSetsSecurityPoliciesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -803,7 +739,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -811,8 +747,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.SecurityPoliciesListPreconfiguredExpressionSetsResponse.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.SecurityPoliciesListPreconfiguredExpressionSetsResponse,
+                response.content,
             )
 
     class _Patch(SecurityPoliciesRestStub):
@@ -829,6 +766,18 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchSecurityPolicyRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}",
+                    "body": "security_policy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchSecurityPolicyRequest,
@@ -871,38 +820,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}",
-                    "body": "security_policy_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SecurityPolicy.to_json(
-                compute.SecurityPolicy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchSecurityPolicyRequest.to_json(
-                    compute.PatchSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -912,7 +831,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -921,9 +840,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _PatchRule(SecurityPoliciesRestStub):
         def __hash__(self):
@@ -939,6 +856,18 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchRuleSecurityPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/patchRule",
+                    "body": "security_policy_rule_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchRuleSecurityPolicyRequest,
@@ -981,38 +910,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/patchRule",
-                    "body": "security_policy_rule_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchRuleSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SecurityPolicyRule.to_json(
-                compute.SecurityPolicyRule(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchRuleSecurityPolicyRequest.to_json(
-                    compute.PatchRuleSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1022,7 +921,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1031,9 +930,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _RemoveRule(SecurityPoliciesRestStub):
         def __hash__(self):
@@ -1049,6 +946,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveRuleSecurityPolicyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/removeRule",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveRuleSecurityPolicyRequest,
@@ -1091,31 +999,8 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/securityPolicies/{security_policy}/removeRule",
-                },
-            ]
-
-            request_kwargs = compute.RemoveRuleSecurityPolicyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveRuleSecurityPolicyRequest.to_json(
-                    compute.RemoveRuleSecurityPolicyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1125,7 +1010,7 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -1133,17 +1018,15 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def add_rule(
         self,
     ) -> Callable[[compute.AddRuleSecurityPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("add_rule")
+        stub = self._stubs.get("add_rule")
         if not stub:
-            stub = self._STUBS["add_rule"] = self._AddRule(self._session, self._host)
+            stub = self._stubs["add_rule"] = self._AddRule(self._session, self._host)
 
         return stub
 
@@ -1151,9 +1034,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteSecurityPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -1161,9 +1044,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetSecurityPolicyRequest], compute.SecurityPolicy]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1171,9 +1054,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def get_rule(
         self,
     ) -> Callable[[compute.GetRuleSecurityPolicyRequest], compute.SecurityPolicyRule]:
-        stub = self._STUBS.get("get_rule")
+        stub = self._stubs.get("get_rule")
         if not stub:
-            stub = self._STUBS["get_rule"] = self._GetRule(self._session, self._host)
+            stub = self._stubs["get_rule"] = self._GetRule(self._session, self._host)
 
         return stub
 
@@ -1181,9 +1064,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertSecurityPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1191,9 +1074,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def list(
         self,
     ) -> Callable[[compute.ListSecurityPoliciesRequest], compute.SecurityPolicyList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1204,9 +1087,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
         [compute.ListPreconfiguredExpressionSetsSecurityPoliciesRequest],
         compute.SecurityPoliciesListPreconfiguredExpressionSetsResponse,
     ]:
-        stub = self._STUBS.get("list_preconfigured_expression_sets")
+        stub = self._stubs.get("list_preconfigured_expression_sets")
         if not stub:
-            stub = self._STUBS[
+            stub = self._stubs[
                 "list_preconfigured_expression_sets"
             ] = self._ListPreconfiguredExpressionSets(self._session, self._host)
 
@@ -1216,9 +1099,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def patch(
         self,
     ) -> Callable[[compute.PatchSecurityPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -1226,9 +1109,9 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def patch_rule(
         self,
     ) -> Callable[[compute.PatchRuleSecurityPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("patch_rule")
+        stub = self._stubs.get("patch_rule")
         if not stub:
-            stub = self._STUBS["patch_rule"] = self._PatchRule(
+            stub = self._stubs["patch_rule"] = self._PatchRule(
                 self._session, self._host
             )
 
@@ -1238,16 +1121,17 @@ class SecurityPoliciesRestTransport(SecurityPoliciesTransport):
     def remove_rule(
         self,
     ) -> Callable[[compute.RemoveRuleSecurityPolicyRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_rule")
+        stub = self._stubs.get("remove_rule")
         if not stub:
-            stub = self._STUBS["remove_rule"] = self._RemoveRule(
+            stub = self._stubs["remove_rule"] = self._RemoveRule(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("SecurityPoliciesRestTransport",)
@@ -15,4 +15,18 @@
 #
 from .client import ServiceAttachmentsClient
 
-__all__ = ("ServiceAttachmentsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ServiceAttachmentsAsyncClient":
+        from .async_client import ServiceAttachmentsAsyncClient
+
+        return ServiceAttachmentsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ServiceAttachmentsClient",
+    "ServiceAttachmentsAsyncClient",
+)
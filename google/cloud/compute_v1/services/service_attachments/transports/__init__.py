@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[ServiceAttachmentsTransport]]
 _transport_registry["rest"] = ServiceAttachmentsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ServiceAttachmentsAsyncRestTransport":
+        from .rest_asyncio import ServiceAttachmentsAsyncRestTransport
+
+        return ServiceAttachmentsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ServiceAttachmentsTransport",
     "ServiceAttachmentsRestTransport",
+    "ServiceAttachmentsAsyncRestTransport",
 )
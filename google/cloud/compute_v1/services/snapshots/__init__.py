@@ -15,4 +15,18 @@
 #
 from .client import SnapshotsClient
 
-__all__ = ("SnapshotsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "SnapshotsAsyncClient":
+        from .async_client import SnapshotsAsyncClient
+
+        return SnapshotsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "SnapshotsClient",
+    "SnapshotsAsyncClient",
+)
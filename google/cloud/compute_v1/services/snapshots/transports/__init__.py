@@ -24,7 +24,19 @@ from .rest import SnapshotsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[SnapshotsTransport]]
 _transport_registry["rest"] = SnapshotsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "SnapshotsAsyncRestTransport":
+        from .rest_asyncio import SnapshotsAsyncRestTransport
+
+        return SnapshotsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "SnapshotsTransport",
     "SnapshotsRestTransport",
+    "SnapshotsAsyncRestTransport",
 )
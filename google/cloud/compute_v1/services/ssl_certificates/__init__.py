@@ -15,4 +15,18 @@
 #
 from .client import SslCertificatesClient
 
-__all__ = ("SslCertificatesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "SslCertificatesAsyncClient":
+        from .async_client import SslCertificatesAsyncClient
+
+        return SslCertificatesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "SslCertificatesClient",
+    "SslCertificatesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import SslCertificatesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[SslCertificatesTransport]]
 _transport_registry["rest"] = SslCertificatesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "SslCertificatesAsyncRestTransport":
+        from .rest_asyncio import SslCertificatesAsyncRestTransport
+
+        return SslCertificatesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "SslCertificatesTransport",
     "SslCertificatesRestTransport",
+    "SslCertificatesAsyncRestTransport",
 )
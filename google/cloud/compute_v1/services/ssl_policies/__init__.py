@@ -15,4 +15,18 @@
 #
 from .client import SslPoliciesClient
 
-__all__ = ("SslPoliciesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "SslPoliciesAsyncClient":
+        from .async_client import SslPoliciesAsyncClient
+
+        return SslPoliciesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "SslPoliciesClient",
+    "SslPoliciesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import SslPoliciesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[SslPoliciesTransport]]
 _transport_registry["rest"] = SslPoliciesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "SslPoliciesAsyncRestTransport":
+        from .rest_asyncio import SslPoliciesAsyncRestTransport
+
+        return SslPoliciesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "SslPoliciesTransport",
     "SslPoliciesRestTransport",
+    "SslPoliciesAsyncRestTransport",
 )
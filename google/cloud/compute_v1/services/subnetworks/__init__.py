@@ -15,4 +15,18 @@
 #
 from .client import SubnetworksClient
 
-__all__ = ("SubnetworksClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "SubnetworksAsyncClient":
+        from .async_client import SubnetworksAsyncClient
+
+        return SubnetworksAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "SubnetworksClient",
+    "SubnetworksAsyncClient",
+)
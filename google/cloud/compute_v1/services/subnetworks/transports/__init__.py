@@ -24,7 +24,19 @@ from .rest import SubnetworksRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[SubnetworksTransport]]
 _transport_registry["rest"] = SubnetworksRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "SubnetworksAsyncRestTransport":
+        from .rest_asyncio import SubnetworksAsyncRestTransport
+
+        return SubnetworksAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "SubnetworksTransport",
     "SubnetworksRestTransport",
+    "SubnetworksAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import TargetGrpcProxiesClient
 
-__all__ = ("TargetGrpcProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetGrpcProxiesAsyncClient":
+        from .async_client import TargetGrpcProxiesAsyncClient
+
+        return TargetGrpcProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetGrpcProxiesClient",
+    "TargetGrpcProxiesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import TargetGrpcProxiesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetGrpcProxiesTransport]]
 _transport_registry["rest"] = TargetGrpcProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetGrpcProxiesAsyncRestTransport":
+        from .rest_asyncio import TargetGrpcProxiesAsyncRestTransport
+
+        return TargetGrpcProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetGrpcProxiesTransport",
     "TargetGrpcProxiesRestTransport",
+    "TargetGrpcProxiesAsyncRestTransport",
 )
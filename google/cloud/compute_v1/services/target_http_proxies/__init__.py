@@ -15,4 +15,18 @@
 #
 from .client import TargetHttpProxiesClient
 
-__all__ = ("TargetHttpProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetHttpProxiesAsyncClient":
+        from .async_client import TargetHttpProxiesAsyncClient
+
+        return TargetHttpProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetHttpProxiesClient",
+    "TargetHttpProxiesAsyncClient",
+)
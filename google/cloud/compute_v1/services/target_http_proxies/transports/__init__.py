@@ -24,7 +24,19 @@ from .rest import TargetHttpProxiesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetHttpProxiesTransport]]
 _transport_registry["rest"] = TargetHttpProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetHttpProxiesAsyncRestTransport":
+        from .rest_asyncio import TargetHttpProxiesAsyncRestTransport
+
+        return TargetHttpProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetHttpProxiesTransport",
     "TargetHttpProxiesRestTransport",
+    "TargetHttpProxiesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import TargetHttpsProxiesClient
 
-__all__ = ("TargetHttpsProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetHttpsProxiesAsyncClient":
+        from .async_client import TargetHttpsProxiesAsyncClient
+
+        return TargetHttpsProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetHttpsProxiesClient",
+    "TargetHttpsProxiesAsyncClient",
+)
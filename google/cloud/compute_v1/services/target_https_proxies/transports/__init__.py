@@ -26,7 +26,19 @@ _transport_registry = (
 )  # type: Dict[str, Type[TargetHttpsProxiesTransport]]
 _transport_registry["rest"] = TargetHttpsProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetHttpsProxiesAsyncRestTransport":
+        from .rest_asyncio import TargetHttpsProxiesAsyncRestTransport
+
+        return TargetHttpsProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetHttpsProxiesTransport",
     "TargetHttpsProxiesRestTransport",
+    "TargetHttpsProxiesAsyncRestTransport",
 )
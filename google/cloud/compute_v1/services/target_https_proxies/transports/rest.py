@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,18 +32,19 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import (
-    TargetHttpsProxiesTransport,
-    DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO,
-)
+from .base import TargetHttpsProxiesTransport
 
 
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -68,8 +66,6 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, TargetHttpsProxiesRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -82,6 +78,10 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -114,22 +114,50 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, TargetHttpsProxiesRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AggregatedList(TargetHttpsProxiesRestStub):
@@ -146,6 +174,17 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListTargetHttpsProxiesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/targetHttpsProxies",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListTargetHttpsProxiesRequest,
@@ -153,6 +192,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.TargetHttpsProxyAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -167,39 +208,21 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.TargetHttpsProxyAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/targetHttpsProxies",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListTargetHttpsProxiesRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListTargetHttpsProxiesRequest.to_json(
-                    compute.AggregatedListTargetHttpsProxiesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -209,7 +232,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -217,8 +240,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetHttpsProxyAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TargetHttpsProxyAggregatedList, response.content, lazy=views
             )
 
     class _Delete(TargetHttpsProxiesRestStub):
@@ -235,6 +258,17 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteTargetHttpsProxyRequest,
@@ -277,31 +311,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteTargetHttpsProxyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteTargetHttpsProxyRequest.to_json(
-                    compute.DeleteTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -311,7 +322,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -319,9 +330,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(TargetHttpsProxiesRestStub):
         def __hash__(self):
@@ -337,6 +346,17 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetTargetHttpsProxyRequest,
@@ -344,6 +364,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.TargetHttpsProxy:
             r"""Call the get method over HTTP.
 
@@ -358,6 +379,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.TargetHttpsProxy:
@@ -376,31 +399,10 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}",
-                },
-            ]
-
-            request_kwargs = compute.GetTargetHttpsProxyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetTargetHttpsProxyRequest.to_json(
-                    compute.GetTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -410,7 +412,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -418,8 +420,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetHttpsProxy.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TargetHttpsProxy, response.content
             )
 
     class _Insert(TargetHttpsProxiesRestStub):
@@ -436,6 +438,18 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies",
+                    "body": "target_https_proxy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertTargetHttpsProxyRequest,
@@ -478,38 +492,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies",
-                    "body": "target_https_proxy_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertTargetHttpsProxyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetHttpsProxy.to_json(
-                compute.TargetHttpsProxy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertTargetHttpsProxyRequest.to_json(
-                    compute.InsertTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -519,7 +503,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -528,9 +512,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(TargetHttpsProxiesRestStub):
         def __hash__(self):
@@ -546,6 +528,17 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListTargetHttpsProxiesRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListTargetHttpsProxiesRequest,
@@ -553,6 +546,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.TargetHttpsProxyList:
             r"""Call the list method over HTTP.
 
@@ -567,6 +562,11 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.TargetHttpsProxyList:
@@ -575,31 +575,10 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies",
-                },
-            ]
-
-            request_kwargs = compute.ListTargetHttpsProxiesRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListTargetHttpsProxiesRequest.to_json(
-                    compute.ListTargetHttpsProxiesRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -609,7 +588,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -617,8 +596,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetHttpsProxyList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TargetHttpsProxyList, response.content, lazy=views
             )
 
     class _Patch(TargetHttpsProxiesRestStub):
@@ -635,6 +614,18 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.PatchTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "patch",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}",
+                    "body": "target_https_proxy_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.PatchTargetHttpsProxyRequest,
@@ -677,38 +668,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "patch",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}",
-                    "body": "target_https_proxy_resource",
-                },
-            ]
-
-            request_kwargs = compute.PatchTargetHttpsProxyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetHttpsProxy.to_json(
-                compute.TargetHttpsProxy(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.PatchTargetHttpsProxyRequest.to_json(
-                    compute.PatchTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -718,7 +679,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -727,9 +688,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetQuicOverride(TargetHttpsProxiesRestStub):
         def __hash__(self):
@@ -745,6 +704,18 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetQuicOverrideTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}/setQuicOverride",
+                    "body": "target_https_proxies_set_quic_override_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetQuicOverrideTargetHttpsProxyRequest,
@@ -787,42 +758,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}/setQuicOverride",
-                    "body": "target_https_proxies_set_quic_override_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetQuicOverrideTargetHttpsProxyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetHttpsProxiesSetQuicOverrideRequest.to_json(
-                compute.TargetHttpsProxiesSetQuicOverrideRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetQuicOverrideTargetHttpsProxyRequest.to_json(
-                    compute.SetQuicOverrideTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -832,7 +769,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -841,9 +778,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetSslCertificates(TargetHttpsProxiesRestStub):
         def __hash__(self):
@@ -859,6 +794,18 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetSslCertificatesTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/targetHttpsProxies/{target_https_proxy}/setSslCertificates",
+                    "body": "target_https_proxies_set_ssl_certificates_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetSslCertificatesTargetHttpsProxyRequest,
@@ -901,42 +848,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/targetHttpsProxies/{target_https_proxy}/setSslCertificates",
-                    "body": "target_https_proxies_set_ssl_certificates_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetSslCertificatesTargetHttpsProxyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetHttpsProxiesSetSslCertificatesRequest.to_json(
-                compute.TargetHttpsProxiesSetSslCertificatesRequest(
-                    transcoded_request["body"]
-                ),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetSslCertificatesTargetHttpsProxyRequest.to_json(
-                    compute.SetSslCertificatesTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -946,7 +859,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -955,9 +868,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetSslPolicy(TargetHttpsProxiesRestStub):
         def __hash__(self):
@@ -973,6 +884,18 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetSslPolicyTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}/setSslPolicy",
+                    "body": "ssl_policy_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetSslPolicyTargetHttpsProxyRequest,
@@ -1015,40 +938,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/global/targetHttpsProxies/{target_https_proxy}/setSslPolicy",
-                    "body": "ssl_policy_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetSslPolicyTargetHttpsProxyRequest.to_dict(
-                request
-            )
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.SslPolicyReference.to_json(
-                compute.SslPolicyReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetSslPolicyTargetHttpsProxyRequest.to_json(
-                    compute.SetSslPolicyTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1058,7 +949,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1067,9 +958,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetUrlMap(TargetHttpsProxiesRestStub):
         def __hash__(self):
@@ -1085,6 +974,18 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetUrlMapTargetHttpsProxyRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/targetHttpsProxies/{target_https_proxy}/setUrlMap",
+                    "body": "url_map_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetUrlMapTargetHttpsProxyRequest,
@@ -1127,38 +1028,8 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/targetHttpsProxies/{target_https_proxy}/setUrlMap",
-                    "body": "url_map_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetUrlMapTargetHttpsProxyRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.UrlMapReference.to_json(
-                compute.UrlMapReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetUrlMapTargetHttpsProxyRequest.to_json(
-                    compute.SetUrlMapTargetHttpsProxyRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1168,7 +1039,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1177,9 +1048,7 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def aggregated_list(
@@ -1188,9 +1057,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
         [compute.AggregatedListTargetHttpsProxiesRequest],
         compute.TargetHttpsProxyAggregatedList,
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -1200,9 +1069,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def delete(
         self,
     ) -> Callable[[compute.DeleteTargetHttpsProxyRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
@@ -1210,9 +1079,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def get(
         self,
     ) -> Callable[[compute.GetTargetHttpsProxyRequest], compute.TargetHttpsProxy]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1220,9 +1089,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def insert(
         self,
     ) -> Callable[[compute.InsertTargetHttpsProxyRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1232,9 +1101,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[
         [compute.ListTargetHttpsProxiesRequest], compute.TargetHttpsProxyList
     ]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1242,9 +1111,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def patch(
         self,
     ) -> Callable[[compute.PatchTargetHttpsProxyRequest], compute.Operation]:
-        stub = self._STUBS.get("patch")
+        stub = self._stubs.get("patch")
         if not stub:
-            stub = self._STUBS["patch"] = self._Patch(self._session, self._host)
+            stub = self._stubs["patch"] = self._Patch(self._session, self._host)
 
         return stub
 
@@ -1252,9 +1121,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def set_quic_override(
         self,
     ) -> Callable[[compute.SetQuicOverrideTargetHttpsProxyRequest], compute.Operation]:
-        stub = self._STUBS.get("set_quic_override")
+        stub = self._stubs.get("set_quic_override")
         if not stub:
-            stub = self._STUBS["set_quic_override"] = self._SetQuicOverride(
+            stub = self._stubs["set_quic_override"] = self._SetQuicOverride(
                 self._session, self._host
             )
 
@@ -1266,9 +1135,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     ) -> Callable[
         [compute.SetSslCertificatesTargetHttpsProxyRequest], compute.Operation
     ]:
-        stub = self._STUBS.get("set_ssl_certificates")
+        stub = self._stubs.get("set_ssl_certificates")
         if not stub:
-            stub = self._STUBS["set_ssl_certificates"] = self._SetSslCertificates(
+            stub = self._stubs["set_ssl_certificates"] = self._SetSslCertificates(
                 self._session, self._host
             )
 
@@ -1278,9 +1147,9 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def set_ssl_policy(
         self,
     ) -> Callable[[compute.SetSslPolicyTargetHttpsProxyRequest], compute.Operation]:
-        stub = self._STUBS.get("set_ssl_policy")
+        stub = self._stubs.get("set_ssl_policy")
         if not stub:
-            stub = self._STUBS["set_ssl_policy"] = self._SetSslPolicy(
+            stub = self._stubs["set_ssl_policy"] = self._SetSslPolicy(
                 self._session, self._host
             )
 
@@ -1290,16 +1159,17 @@ class TargetHttpsProxiesRestTransport(TargetHttpsProxiesTransport):
     def set_url_map(
         self,
     ) -> Callable[[compute.SetUrlMapTargetHttpsProxyRequest], compute.Operation]:
-        stub = self._STUBS.get("set_url_map")
+        stub = self._stubs.get("set_url_map")
         if not stub:
-            stub = self._STUBS["set_url_map"] = self._SetUrlMap(
+            stub = self._stubs["set_url_map"] = self._SetUrlMap(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("TargetHttpsProxiesRestTransport",)
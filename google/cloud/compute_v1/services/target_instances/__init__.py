@@ -15,4 +15,18 @@
 #
 from .client import TargetInstancesClient
 
-__all__ = ("TargetInstancesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetInstancesAsyncClient":
+        from .async_client import TargetInstancesAsyncClient
+
+        return TargetInstancesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetInstancesClient",
+    "TargetInstancesAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import TargetInstancesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetInstancesTransport]]
 _transport_registry["rest"] = TargetInstancesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetInstancesAsyncRestTransport":
+        from .rest_asyncio import TargetInstancesAsyncRestTransport
+
+        return TargetInstancesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetInstancesTransport",
     "TargetInstancesRestTransport",
+    "TargetInstancesAsyncRestTransport",
 )
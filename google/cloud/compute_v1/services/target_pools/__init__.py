@@ -15,4 +15,18 @@
 #
 from .client import TargetPoolsClient
 
-__all__ = ("TargetPoolsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetPoolsAsyncClient":
+        from .async_client import TargetPoolsAsyncClient
+
+        return TargetPoolsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetPoolsClient",
+    "TargetPoolsAsyncClient",
+)
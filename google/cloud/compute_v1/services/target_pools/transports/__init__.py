@@ -24,7 +24,19 @@ from .rest import TargetPoolsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetPoolsTransport]]
 _transport_registry["rest"] = TargetPoolsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetPoolsAsyncRestTransport":
+        from .rest_asyncio import TargetPoolsAsyncRestTransport
+
+        return TargetPoolsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetPoolsTransport",
     "TargetPoolsRestTransport",
+    "TargetPoolsAsyncRestTransport",
 )
@@ -15,14 +15,11 @@
 #
 
 from google.auth.transport.requests import AuthorizedSession  # type: ignore
-import json  # type: ignore
 import grpc  # type: ignore
 from google.auth.transport.grpc import SslCredentials  # type: ignore
 from google.auth import credentials as ga_credentials  # type: ignore
 from google.api_core import exceptions as core_exceptions
 from google.api_core import retry as retries
-from google.api_core import rest_helpers
-from google.api_core import path_template
 from google.api_core import gapic_v1
 from requests import __version__ as requests_version
 import dataclasses
@@ -35,15 +32,18 @@ except AttributeError:  # pragma: NO COVER
     OptionalRetry = Union[retries.Retry, object]  # type: ignore
 
 
+from google.cloud.compute_v1 import _client_info
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.coalescing import RequestCoalescer
+from google.cloud.compute_v1.rate_limiting import RateLimiter
+from google.cloud.compute_v1.retry_policy import RetryPolicy
 from google.cloud.compute_v1.types import compute
 
-from .base import TargetPoolsTransport, DEFAULT_CLIENT_INFO as BASE_DEFAULT_CLIENT_INFO
+from .base import TargetPoolsTransport
 
-
-DEFAULT_CLIENT_INFO = gapic_v1.client_info.ClientInfo(
-    gapic_version=BASE_DEFAULT_CLIENT_INFO.gapic_version,
-    grpc_version=None,
-    rest_version=requests_version,
+DEFAULT_CLIENT_INFO = _client_info.ClientInfo(
+    grpc_version=None, rest_version=requests_version,
 )
 
 
@@ -65,8 +65,6 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     It sends JSON representations of protocol buffers over HTTP/1.1
     """
 
-    _STUBS: Dict[str, TargetPoolsRestStub] = {}
-
     def __init__(
         self,
         *,
@@ -79,6 +77,10 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
         client_info: gapic_v1.client_info.ClientInfo = DEFAULT_CLIENT_INFO,
         always_use_jwt_access: Optional[bool] = False,
         url_scheme: str = "https",
+        session: Optional[AuthorizedSession] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        coalescer: Optional[RequestCoalescer] = None,
     ) -> None:
         """Instantiate the transport.
 
@@ -111,22 +113,50 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             url_scheme: the protocol scheme for the API endpoint.  Normally
                 "https", but for testing or local servers,
                 "http" can be specified.
+            session (Optional[google.auth.transport.requests.AuthorizedSession]):
+                An existing session to send requests through. Pass the same
+                session to several transports to share one connection pool
+                and one set of credentials; see
+                :func:`google.cloud.compute_v1.create_session`. A shared
+                session is not closed by :meth:`close`. If ``None``, a new
+                session is created.
+            retry_policy (Optional[google.cloud.compute_v1.retry_policy.RetryPolicy]):
+                The default retry and timeout of each method. If ``None``,
+                :data:`~google.cloud.compute_v1.retry_policy.DEFAULT_RETRY_POLICY`.
+            rate_limiter (Optional[google.cloud.compute_v1.rate_limiting.RateLimiter]):
+                A limiter that paces the calls. Pass the same limiter to
+                several transports to share its budget. If ``None``, calls
+                are not paced.
+            coalescer (Optional[google.cloud.compute_v1.coalescing.RequestCoalescer]):
+                Shares one call among identical reads in flight. Pass the
+                same coalescer to several transports to share calls among
+                them. If ``None``, every call is sent.
         """
         # Run the base constructor
         # TODO(yon-mg): resolve other ctor params i.e. scopes, quota, etc.
         # TODO: When custom host (api_endpoint) is set, `scopes` must *also* be set on the
         # credentials object
+        if session is not None and credentials is None and not credentials_file:
+            credentials = session.credentials
         super().__init__(
             host=host,
             credentials=credentials,
             client_info=client_info,
             always_use_jwt_access=always_use_jwt_access,
         )
-        self._session = AuthorizedSession(
-            self._credentials, default_host=self.DEFAULT_HOST
-        )
-        if client_cert_source_for_mtls:
-            self._session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._owns_session = session is None
+        if session is None:
+            session = AuthorizedSession(
+                self._credentials, default_host=self.DEFAULT_HOST
+            )
+            if client_cert_source_for_mtls:
+                session.configure_mtls_channel(client_cert_source_for_mtls)
+        self._session = session
+        self._stubs: Dict[str, TargetPoolsRestStub] = {}
+        if retry_policy is not None:
+            self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._coalescer = coalescer
         self._prep_wrapped_messages(client_info)
 
     class _AddHealthCheck(TargetPoolsRestStub):
@@ -143,6 +173,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddHealthCheckTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/addHealthCheck",
+                    "body": "target_pools_add_health_check_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddHealthCheckTargetPoolRequest,
@@ -185,38 +227,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/addHealthCheck",
-                    "body": "target_pools_add_health_check_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddHealthCheckTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetPoolsAddHealthCheckRequest.to_json(
-                compute.TargetPoolsAddHealthCheckRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddHealthCheckTargetPoolRequest.to_json(
-                    compute.AddHealthCheckTargetPoolRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -226,7 +238,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -235,9 +247,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AddInstance(TargetPoolsRestStub):
         def __hash__(self):
@@ -253,6 +263,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AddInstanceTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/addInstance",
+                    "body": "target_pools_add_instance_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AddInstanceTargetPoolRequest,
@@ -295,38 +317,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/addInstance",
-                    "body": "target_pools_add_instance_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.AddInstanceTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetPoolsAddInstanceRequest.to_json(
-                compute.TargetPoolsAddInstanceRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AddInstanceTargetPoolRequest.to_json(
-                    compute.AddInstanceTargetPoolRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -336,7 +328,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -345,9 +337,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _AggregatedList(TargetPoolsRestStub):
         def __hash__(self):
@@ -363,6 +353,17 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.AggregatedListTargetPoolsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/aggregated/targetPools",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.AggregatedListTargetPoolsRequest,
@@ -370,6 +371,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.TargetPoolAggregatedList:
             r"""Call the aggregated list method over HTTP.
 
@@ -384,37 +387,21 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.TargetPoolAggregatedList:
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/aggregated/targetPools",
-                },
-            ]
-
-            request_kwargs = compute.AggregatedListTargetPoolsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.AggregatedListTargetPoolsRequest.to_json(
-                    compute.AggregatedListTargetPoolsRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -424,7 +411,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -432,8 +419,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetPoolAggregatedList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TargetPoolAggregatedList, response.content, lazy=views
             )
 
     class _Delete(TargetPoolsRestStub):
@@ -450,6 +437,17 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.DeleteTargetPoolRequest,
+            [
+                {
+                    "method": "delete",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.DeleteTargetPoolRequest,
@@ -492,29 +490,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "delete",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}",
-                },
-            ]
-
-            request_kwargs = compute.DeleteTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.DeleteTargetPoolRequest.to_json(
-                    compute.DeleteTargetPoolRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -524,7 +501,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -532,9 +509,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _Get(TargetPoolsRestStub):
         def __hash__(self):
@@ -550,6 +525,17 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetTargetPoolRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetTargetPoolRequest,
@@ -557,6 +543,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            fields: Optional[str] = None,
         ) -> compute.TargetPool:
             r"""Call the get method over HTTP.
 
@@ -571,6 +558,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.TargetPool:
@@ -585,29 +574,10 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}",
-                },
-            ]
-
-            request_kwargs = compute.GetTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetTargetPoolRequest.to_json(
-                    compute.GetTargetPoolRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -617,7 +587,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -625,9 +595,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetPool.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.TargetPool, response.content)
 
     class _GetHealth(TargetPoolsRestStub):
         def __hash__(self):
@@ -643,6 +611,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.GetHealthTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/getHealth",
+                    "body": "instance_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.GetHealthTargetPoolRequest,
@@ -670,38 +650,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/getHealth",
-                    "body": "instance_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.GetHealthTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.InstanceReference.to_json(
-                compute.InstanceReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.GetHealthTargetPoolRequest.to_json(
-                    compute.GetHealthTargetPoolRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -711,7 +661,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -720,8 +670,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetPoolInstanceHealth.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TargetPoolInstanceHealth, response.content
             )
 
     class _Insert(TargetPoolsRestStub):
@@ -738,6 +688,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.InsertTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools",
+                    "body": "target_pool_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.InsertTargetPoolRequest,
@@ -780,36 +742,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools",
-                    "body": "target_pool_resource",
-                },
-            ]
-
-            request_kwargs = compute.InsertTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetPool.to_json(
-                compute.TargetPool(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.InsertTargetPoolRequest.to_json(
-                    compute.InsertTargetPoolRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -819,7 +753,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -828,9 +762,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _List(TargetPoolsRestStub):
         def __hash__(self):
@@ -846,6 +778,17 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.ListTargetPoolsRequest,
+            [
+                {
+                    "method": "get",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.ListTargetPoolsRequest,
@@ -853,6 +796,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             retry: OptionalRetry = gapic_v1.method.DEFAULT,
             timeout: float = None,
             metadata: Sequence[Tuple[str, str]] = (),
+            views: bool = False,
+            fields: Optional[str] = None,
         ) -> compute.TargetPoolList:
             r"""Call the list method over HTTP.
 
@@ -867,6 +812,11 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 timeout (float): The timeout for this request.
                 metadata (Sequence[Tuple[str, str]]): Strings which should be
                     sent along with the request as metadata.
+                views (bool): Whether to return a
+                    :class:`~google.cloud.compute_v1.response_decoding.LazyMessage`
+                    view of the response instead of a message.
+                fields (str): The ``fields`` system parameter that selects
+                    the fields of a partial response.
 
             Returns:
                 ~.compute.TargetPoolList:
@@ -875,29 +825,10 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "get",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools",
-                },
-            ]
-
-            request_kwargs = compute.ListTargetPoolsRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.ListTargetPoolsRequest.to_json(
-                    compute.ListTargetPoolsRequest(transcoded_request["query_params"]),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
+            if fields:
+                query_params.append(("fields", fields))
 
             # Send the request
             headers = dict(metadata)
@@ -907,7 +838,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
             )
 
             # In case of error, raise the appropriate core_exceptions.GoogleAPICallError exception
@@ -915,8 +846,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.TargetPoolList.from_json(
-                response.content, ignore_unknown_fields=True
+            return response_decoding.from_json(
+                compute.TargetPoolList, response.content, lazy=views
             )
 
     class _RemoveHealthCheck(TargetPoolsRestStub):
@@ -933,6 +864,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveHealthCheckTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/removeHealthCheck",
+                    "body": "target_pools_remove_health_check_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveHealthCheckTargetPoolRequest,
@@ -975,38 +918,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/removeHealthCheck",
-                    "body": "target_pools_remove_health_check_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RemoveHealthCheckTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetPoolsRemoveHealthCheckRequest.to_json(
-                compute.TargetPoolsRemoveHealthCheckRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveHealthCheckTargetPoolRequest.to_json(
-                    compute.RemoveHealthCheckTargetPoolRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1016,7 +929,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1025,9 +938,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _RemoveInstance(TargetPoolsRestStub):
         def __hash__(self):
@@ -1043,6 +954,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.RemoveInstanceTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/removeInstance",
+                    "body": "target_pools_remove_instance_request_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.RemoveInstanceTargetPoolRequest,
@@ -1085,38 +1008,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/removeInstance",
-                    "body": "target_pools_remove_instance_request_resource",
-                },
-            ]
-
-            request_kwargs = compute.RemoveInstanceTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetPoolsRemoveInstanceRequest.to_json(
-                compute.TargetPoolsRemoveInstanceRequest(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.RemoveInstanceTargetPoolRequest.to_json(
-                    compute.RemoveInstanceTargetPoolRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1126,7 +1019,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1135,9 +1028,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     class _SetBackup(TargetPoolsRestStub):
         def __hash__(self):
@@ -1153,6 +1044,18 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 if k not in message_dict
             }
 
+        _PLAN = _request_plan.RequestPlan(
+            compute.SetBackupTargetPoolRequest,
+            [
+                {
+                    "method": "post",
+                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/setBackup",
+                    "body": "target_reference_resource",
+                },
+            ],
+            required_fields_default_values=__REQUIRED_FIELDS_DEFAULT_VALUES,
+        )
+
         def __call__(
             self,
             request: compute.SetBackupTargetPoolRequest,
@@ -1195,38 +1098,8 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
             """
 
-            http_options = [
-                {
-                    "method": "post",
-                    "uri": "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/setBackup",
-                    "body": "target_reference_resource",
-                },
-            ]
-
-            request_kwargs = compute.SetBackupTargetPoolRequest.to_dict(request)
-            transcoded_request = path_template.transcode(http_options, **request_kwargs)
-
-            # Jsonify the request body
-            body = compute.TargetReference.to_json(
-                compute.TargetReference(transcoded_request["body"]),
-                including_default_value_fields=False,
-                use_integers_for_enums=False,
-            )
-            uri = transcoded_request["uri"]
-            method = transcoded_request["method"]
-
-            # Jsonify the query params
-            query_params = json.loads(
-                compute.SetBackupTargetPoolRequest.to_json(
-                    compute.SetBackupTargetPoolRequest(
-                        transcoded_request["query_params"]
-                    ),
-                    including_default_value_fields=False,
-                    use_integers_for_enums=False,
-                )
-            )
-
-            query_params.update(self._get_unset_required_fields(query_params))
+            method, uri, body = self._PLAN.expand(request)
+            query_params = self._PLAN.query_params(request)
 
             # Send the request
             headers = dict(metadata)
@@ -1236,7 +1109,7 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
                 "https://{host}{uri}".format(host=self._host, uri=uri),
                 timeout=timeout,
                 headers=headers,
-                params=rest_helpers.flatten_query_params(query_params),
+                params=query_params,
                 data=body,
             )
 
@@ -1245,17 +1118,15 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
             if response.status_code >= 400:
                 raise core_exceptions.from_http_response(response)
             # Return the response
-            return compute.Operation.from_json(
-                response.content, ignore_unknown_fields=True
-            )
+            return response_decoding.from_json(compute.Operation, response.content)
 
     @property
     def add_health_check(
         self,
     ) -> Callable[[compute.AddHealthCheckTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("add_health_check")
+        stub = self._stubs.get("add_health_check")
         if not stub:
-            stub = self._STUBS["add_health_check"] = self._AddHealthCheck(
+            stub = self._stubs["add_health_check"] = self._AddHealthCheck(
                 self._session, self._host
             )
 
@@ -1265,9 +1136,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     def add_instance(
         self,
     ) -> Callable[[compute.AddInstanceTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("add_instance")
+        stub = self._stubs.get("add_instance")
         if not stub:
-            stub = self._STUBS["add_instance"] = self._AddInstance(
+            stub = self._stubs["add_instance"] = self._AddInstance(
                 self._session, self._host
             )
 
@@ -1279,9 +1150,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[
         [compute.AggregatedListTargetPoolsRequest], compute.TargetPoolAggregatedList
     ]:
-        stub = self._STUBS.get("aggregated_list")
+        stub = self._stubs.get("aggregated_list")
         if not stub:
-            stub = self._STUBS["aggregated_list"] = self._AggregatedList(
+            stub = self._stubs["aggregated_list"] = self._AggregatedList(
                 self._session, self._host
             )
 
@@ -1289,17 +1160,17 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
     @property
     def delete(self) -> Callable[[compute.DeleteTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("delete")
+        stub = self._stubs.get("delete")
         if not stub:
-            stub = self._STUBS["delete"] = self._Delete(self._session, self._host)
+            stub = self._stubs["delete"] = self._Delete(self._session, self._host)
 
         return stub
 
     @property
     def get(self) -> Callable[[compute.GetTargetPoolRequest], compute.TargetPool]:
-        stub = self._STUBS.get("get")
+        stub = self._stubs.get("get")
         if not stub:
-            stub = self._STUBS["get"] = self._Get(self._session, self._host)
+            stub = self._stubs["get"] = self._Get(self._session, self._host)
 
         return stub
 
@@ -1309,9 +1180,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     ) -> Callable[
         [compute.GetHealthTargetPoolRequest], compute.TargetPoolInstanceHealth
     ]:
-        stub = self._STUBS.get("get_health")
+        stub = self._stubs.get("get_health")
         if not stub:
-            stub = self._STUBS["get_health"] = self._GetHealth(
+            stub = self._stubs["get_health"] = self._GetHealth(
                 self._session, self._host
             )
 
@@ -1319,9 +1190,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
 
     @property
     def insert(self) -> Callable[[compute.InsertTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("insert")
+        stub = self._stubs.get("insert")
         if not stub:
-            stub = self._STUBS["insert"] = self._Insert(self._session, self._host)
+            stub = self._stubs["insert"] = self._Insert(self._session, self._host)
 
         return stub
 
@@ -1329,9 +1200,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     def list(
         self,
     ) -> Callable[[compute.ListTargetPoolsRequest], compute.TargetPoolList]:
-        stub = self._STUBS.get("list")
+        stub = self._stubs.get("list")
         if not stub:
-            stub = self._STUBS["list"] = self._List(self._session, self._host)
+            stub = self._stubs["list"] = self._List(self._session, self._host)
 
         return stub
 
@@ -1339,9 +1210,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     def remove_health_check(
         self,
     ) -> Callable[[compute.RemoveHealthCheckTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_health_check")
+        stub = self._stubs.get("remove_health_check")
         if not stub:
-            stub = self._STUBS["remove_health_check"] = self._RemoveHealthCheck(
+            stub = self._stubs["remove_health_check"] = self._RemoveHealthCheck(
                 self._session, self._host
             )
 
@@ -1351,9 +1222,9 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     def remove_instance(
         self,
     ) -> Callable[[compute.RemoveInstanceTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("remove_instance")
+        stub = self._stubs.get("remove_instance")
         if not stub:
-            stub = self._STUBS["remove_instance"] = self._RemoveInstance(
+            stub = self._stubs["remove_instance"] = self._RemoveInstance(
                 self._session, self._host
             )
 
@@ -1363,16 +1234,17 @@ class TargetPoolsRestTransport(TargetPoolsTransport):
     def set_backup(
         self,
     ) -> Callable[[compute.SetBackupTargetPoolRequest], compute.Operation]:
-        stub = self._STUBS.get("set_backup")
+        stub = self._stubs.get("set_backup")
         if not stub:
-            stub = self._STUBS["set_backup"] = self._SetBackup(
+            stub = self._stubs["set_backup"] = self._SetBackup(
                 self._session, self._host
             )
 
         return stub
 
     def close(self):
-        self._session.close()
+        if self._owns_session:
+            self._session.close()
 
 
 __all__ = ("TargetPoolsRestTransport",)
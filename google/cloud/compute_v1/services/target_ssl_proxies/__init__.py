@@ -15,4 +15,18 @@
 #
 from .client import TargetSslProxiesClient
 
-__all__ = ("TargetSslProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetSslProxiesAsyncClient":
+        from .async_client import TargetSslProxiesAsyncClient
+
+        return TargetSslProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetSslProxiesClient",
+    "TargetSslProxiesAsyncClient",
+)
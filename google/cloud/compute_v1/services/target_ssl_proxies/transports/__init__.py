@@ -24,7 +24,19 @@ from .rest import TargetSslProxiesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetSslProxiesTransport]]
 _transport_registry["rest"] = TargetSslProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetSslProxiesAsyncRestTransport":
+        from .rest_asyncio import TargetSslProxiesAsyncRestTransport
+
+        return TargetSslProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetSslProxiesTransport",
     "TargetSslProxiesRestTransport",
+    "TargetSslProxiesAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import TargetTcpProxiesClient
 
-__all__ = ("TargetTcpProxiesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetTcpProxiesAsyncClient":
+        from .async_client import TargetTcpProxiesAsyncClient
+
+        return TargetTcpProxiesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetTcpProxiesClient",
+    "TargetTcpProxiesAsyncClient",
+)
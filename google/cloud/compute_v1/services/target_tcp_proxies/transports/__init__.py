@@ -24,7 +24,19 @@ from .rest import TargetTcpProxiesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetTcpProxiesTransport]]
 _transport_registry["rest"] = TargetTcpProxiesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetTcpProxiesAsyncRestTransport":
+        from .rest_asyncio import TargetTcpProxiesAsyncRestTransport
+
+        return TargetTcpProxiesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetTcpProxiesTransport",
     "TargetTcpProxiesRestTransport",
+    "TargetTcpProxiesAsyncRestTransport",
 )
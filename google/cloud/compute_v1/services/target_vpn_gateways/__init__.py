@@ -15,4 +15,18 @@
 #
 from .client import TargetVpnGatewaysClient
 
-__all__ = ("TargetVpnGatewaysClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "TargetVpnGatewaysAsyncClient":
+        from .async_client import TargetVpnGatewaysAsyncClient
+
+        return TargetVpnGatewaysAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "TargetVpnGatewaysClient",
+    "TargetVpnGatewaysAsyncClient",
+)
@@ -24,7 +24,19 @@ from .rest import TargetVpnGatewaysRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[TargetVpnGatewaysTransport]]
 _transport_registry["rest"] = TargetVpnGatewaysRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "TargetVpnGatewaysAsyncRestTransport":
+        from .rest_asyncio import TargetVpnGatewaysAsyncRestTransport
+
+        return TargetVpnGatewaysAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "TargetVpnGatewaysTransport",
     "TargetVpnGatewaysRestTransport",
+    "TargetVpnGatewaysAsyncRestTransport",
 )
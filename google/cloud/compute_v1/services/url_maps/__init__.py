@@ -15,4 +15,18 @@
 #
 from .client import UrlMapsClient
 
-__all__ = ("UrlMapsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "UrlMapsAsyncClient":
+        from .async_client import UrlMapsAsyncClient
+
+        return UrlMapsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "UrlMapsClient",
+    "UrlMapsAsyncClient",
+)
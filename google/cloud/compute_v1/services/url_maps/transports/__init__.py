@@ -24,7 +24,19 @@ from .rest import UrlMapsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[UrlMapsTransport]]
 _transport_registry["rest"] = UrlMapsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "UrlMapsAsyncRestTransport":
+        from .rest_asyncio import UrlMapsAsyncRestTransport
+
+        return UrlMapsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "UrlMapsTransport",
     "UrlMapsRestTransport",
+    "UrlMapsAsyncRestTransport",
 )
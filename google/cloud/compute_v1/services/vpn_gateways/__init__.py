@@ -15,4 +15,18 @@
 #
 from .client import VpnGatewaysClient
 
-__all__ = ("VpnGatewaysClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "VpnGatewaysAsyncClient":
+        from .async_client import VpnGatewaysAsyncClient
+
+        return VpnGatewaysAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "VpnGatewaysClient",
+    "VpnGatewaysAsyncClient",
+)
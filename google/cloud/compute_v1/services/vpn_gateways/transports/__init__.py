@@ -24,7 +24,19 @@ from .rest import VpnGatewaysRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[VpnGatewaysTransport]]
 _transport_registry["rest"] = VpnGatewaysRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "VpnGatewaysAsyncRestTransport":
+        from .rest_asyncio import VpnGatewaysAsyncRestTransport
+
+        return VpnGatewaysAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "VpnGatewaysTransport",
     "VpnGatewaysRestTransport",
+    "VpnGatewaysAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import VpnTunnelsClient
 
-__all__ = ("VpnTunnelsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "VpnTunnelsAsyncClient":
+        from .async_client import VpnTunnelsAsyncClient
+
+        return VpnTunnelsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "VpnTunnelsClient",
+    "VpnTunnelsAsyncClient",
+)
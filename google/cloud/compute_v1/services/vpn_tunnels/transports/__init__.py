@@ -24,7 +24,19 @@ from .rest import VpnTunnelsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[VpnTunnelsTransport]]
 _transport_registry["rest"] = VpnTunnelsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "VpnTunnelsAsyncRestTransport":
+        from .rest_asyncio import VpnTunnelsAsyncRestTransport
+
+        return VpnTunnelsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "VpnTunnelsTransport",
     "VpnTunnelsRestTransport",
+    "VpnTunnelsAsyncRestTransport",
 )
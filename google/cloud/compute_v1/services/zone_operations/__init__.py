@@ -15,4 +15,18 @@
 #
 from .client import ZoneOperationsClient
 
-__all__ = ("ZoneOperationsClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ZoneOperationsAsyncClient":
+        from .async_client import ZoneOperationsAsyncClient
+
+        return ZoneOperationsAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ZoneOperationsClient",
+    "ZoneOperationsAsyncClient",
+)
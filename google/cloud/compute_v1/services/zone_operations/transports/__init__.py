@@ -24,7 +24,19 @@ from .rest import ZoneOperationsRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ZoneOperationsTransport]]
 _transport_registry["rest"] = ZoneOperationsRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ZoneOperationsAsyncRestTransport":
+        from .rest_asyncio import ZoneOperationsAsyncRestTransport
+
+        return ZoneOperationsAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ZoneOperationsTransport",
     "ZoneOperationsRestTransport",
+    "ZoneOperationsAsyncRestTransport",
 )
@@ -15,4 +15,18 @@
 #
 from .client import ZonesClient
 
-__all__ = ("ZonesClient",)
+
+def __getattr__(name):
+    # The async client is imported on first use, so that importing the sync
+    # client does not import the async transports.
+    if name == "ZonesAsyncClient":
+        from .async_client import ZonesAsyncClient
+
+        return ZonesAsyncClient
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+__all__ = (
+    "ZonesClient",
+    "ZonesAsyncClient",
+)
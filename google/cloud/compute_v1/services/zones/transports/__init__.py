@@ -24,7 +24,19 @@ from .rest import ZonesRestTransport
 _transport_registry = OrderedDict()  # type: Dict[str, Type[ZonesTransport]]
 _transport_registry["rest"] = ZonesRestTransport
 
+
+def __getattr__(name):
+    # The async transport is imported on first use, so that importing the
+    # sync transports does not import it.
+    if name == "ZonesAsyncRestTransport":
+        from .rest_asyncio import ZonesAsyncRestTransport
+
+        return ZonesAsyncRestTransport
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
 __all__ = (
     "ZonesTransport",
     "ZonesRestTransport",
+    "ZonesAsyncRestTransport",
 )
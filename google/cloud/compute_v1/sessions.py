@@ -0,0 +1,179 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Pooled HTTP sessions that can be shared between Compute Engine clients.
+
+Every REST transport normally opens its own
+:class:`~google.auth.transport.requests.AuthorizedSession`, so each client
+in a process gets a separate connection pool and refreshes its own access
+token. Create one session with :func:`create_session` and hand it to every
+client through :class:`~google.cloud.compute_v1.client_options.ClientOptions`
+to reuse warm connections and a single set of credentials:
+
+.. code-block:: python
+
+    from google.cloud import compute_v1
+
+    session = compute_v1.create_session(pool_maxsize=32)
+    options = compute_v1.ClientOptions(session=session)
+
+    instances = compute_v1.InstancesClient(client_options=options)
+    disks = compute_v1.DisksClient(client_options=options)
+"""
+
+import socket
+from typing import Optional, Sequence
+
+import google.auth  # type: ignore
+from google.auth import credentials as ga_credentials  # type: ignore
+from google.auth.transport.requests import AuthorizedSession  # type: ignore
+from requests import adapters
+from urllib3.connection import HTTPConnection  # type: ignore
+
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1._async_session import DEFAULT_KEEPALIVE_TIMEOUT
+from google.cloud.compute_v1._async_session import DEFAULT_MAX_CONNECTIONS
+
+
+DEFAULT_HOST = "compute.googleapis.com"
+DEFAULT_SCOPES = (
+    "https://www.googleapis.com/auth/compute",
+    "https://www.googleapis.com/auth/cloud-platform",
+)
+DEFAULT_POOL_CONNECTIONS = adapters.DEFAULT_POOLSIZE
+DEFAULT_POOL_MAXSIZE = adapters.DEFAULT_POOLSIZE
+
+
+class _PooledHTTPAdapter(adapters.HTTPAdapter):
+    """An :class:`~requests.adapters.HTTPAdapter` with optional TCP keep-alive."""
+
+    __attrs__ = adapters.HTTPAdapter.__attrs__ + ["_tcp_keepalive"]
+
+    def __init__(self, *, tcp_keepalive: bool = True, **kwargs):
+        self._tcp_keepalive = tcp_keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._tcp_keepalive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            ]
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _default_credentials(
+    credentials: Optional[ga_credentials.Credentials],
+    scopes: Optional[Sequence[str]],
+    quota_project_id: Optional[str],
+) -> ga_credentials.Credentials:
+    if credentials is not None:
+        return credentials
+    credentials, _ = google.auth.default(
+        scopes=scopes, default_scopes=DEFAULT_SCOPES, quota_project_id=quota_project_id
+    )
+    return credentials
+
+
+def create_session(
+    credentials: Optional[ga_credentials.Credentials] = None,
+    *,
+    scopes: Optional[Sequence[str]] = None,
+    quota_project_id: Optional[str] = None,
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    pool_block: bool = False,
+    tcp_keepalive: bool = True,
+) -> AuthorizedSession:
+    """Create an authorized session suitable for sharing between clients.
+
+    Args:
+        credentials (Optional[google.auth.credentials.Credentials]): The
+            credentials to attach to requests. If none are specified, they
+            are ascertained from the environment.
+        scopes (Optional[Sequence[str]]): Scopes to request when the
+            credentials are ascertained from the environment.
+        quota_project_id (Optional[str]): An optional project to use for
+            billing and quota.
+        pool_connections (int): The number of per-host connection pools to
+            cache.
+        pool_maxsize (int): The maximum number of connections kept open to
+            a single host. Size this to the number of threads that issue
+            requests concurrently.
+        pool_block (bool): Whether to wait for a free connection when the
+            pool is exhausted instead of opening a connection that is
+            discarded after use.
+        tcp_keepalive (bool): Whether to enable TCP keep-alive probes on
+            pooled connections, so idle connections survive middleboxes
+            that drop silent flows.
+
+    Returns:
+        google.auth.transport.requests.AuthorizedSession: The session.
+    """
+    credentials = _default_credentials(credentials, scopes, quota_project_id)
+    session = AuthorizedSession(credentials, default_host=DEFAULT_HOST)
+    adapter = _PooledHTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=tcp_keepalive,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def create_async_session(
+    credentials: Optional[ga_credentials.Credentials] = None,
+    *,
+    scopes: Optional[Sequence[str]] = None,
+    quota_project_id: Optional[str] = None,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_connections_per_host: int = 0,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+) -> AsyncAuthorizedSession:
+    """Create an asyncio session suitable for sharing between async clients.
+
+    Args:
+        credentials (Optional[google.auth.credentials.Credentials]): The
+            credentials to attach to requests. If none are specified, they
+            are ascertained from the environment.
+        scopes (Optional[Sequence[str]]): Scopes to request when the
+            credentials are ascertained from the environment.
+        quota_project_id (Optional[str]): An optional project to use for
+            billing and quota.
+        max_connections (int): The maximum number of simultaneous
+            connections. ``0`` means unbounded.
+        max_connections_per_host (int): The maximum number of simultaneous
+            connections to a single host. ``0`` means unbounded.
+        keepalive_timeout (float): Seconds an idle connection is kept open
+            for reuse.
+
+    Returns:
+        google.cloud.compute_v1._async_session.AsyncAuthorizedSession: The
+            session.
+    """
+    credentials = _default_credentials(credentials, scopes, quota_project_id)
+    return AsyncAuthorizedSession(
+        credentials,
+        max_connections=max_connections,
+        max_connections_per_host=max_connections_per_host,
+        keepalive_timeout=keepalive_timeout,
+    )
+
+
+__all__ = (
+    "create_async_session",
+    "create_session",
+)
@@ -0,0 +1,426 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the accelerator_types service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_07
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AcceleratorType",
+        "AcceleratorTypeAggregatedList",
+        "AcceleratorTypeList",
+        "AcceleratorTypesScopedList",
+        "AggregatedListAcceleratorTypesRequest",
+        "GetAcceleratorTypeRequest",
+        "ListAcceleratorTypesRequest",
+    },
+)
+
+
+class AcceleratorType(proto.Message):
+    r"""Represents an Accelerator Type resource. Google Cloud
+    Platform provides graphics processing units (accelerators) that
+    you can add to VM instances to improve or accelerate performance
+    when working with intensive workloads. For more information,
+    read GPUs on Compute Engine.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        deprecated (google.cloud.compute_v1.types.DeprecationStatus):
+            [Output Only] The deprecation status associated with this
+            accelerator type.
+
+            This field is a member of `oneof`_ ``_deprecated``.
+        description (str):
+            [Output Only] An optional textual description of the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] The type of the resource. Always
+            compute#acceleratorType for accelerator types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        maximum_cards_per_instance (int):
+            [Output Only] Maximum number of accelerator cards allowed
+            per instance.
+
+            This field is a member of `oneof`_ ``_maximum_cards_per_instance``.
+        name (str):
+            [Output Only] Name of the resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        self_link (str):
+            [Output Only] Server-defined, fully qualified URL for this
+            resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        zone (str):
+            [Output Only] The name of the zone where the accelerator
+            type resides, such as us-central1-a. You must specify this
+            field as part of the HTTP request URL. It is not settable as
+            a field in the request body.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    deprecated = proto.Field(
+        proto.MESSAGE,
+        number=515138995,
+        optional=True,
+        message=shared_07.DeprecationStatus,
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    maximum_cards_per_instance = proto.Field(
+        proto.INT32, number=263814482, optional=True,
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684, optional=True,)
+
+
+class AcceleratorTypeAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.AcceleratorTypeAggregatedList.ItemsEntry]):
+            A list of AcceleratorTypesScopedList
+            resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#acceleratorTypeAggregatedList for aggregated lists
+            of accelerator types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="AcceleratorTypesScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class AcceleratorTypeList(proto.Message):
+    r"""Contains a list of accelerator types.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.AcceleratorType]):
+            A list of AcceleratorType resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#acceleratorTypeList for lists of accelerator types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="AcceleratorType",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class AcceleratorTypesScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        accelerator_types (Sequence[google.cloud.compute_v1.types.AcceleratorType]):
+            [Output Only] A list of accelerator types contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] An informational warning that appears when the
+            accelerator types list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    accelerator_types = proto.RepeatedField(
+        proto.MESSAGE, number=520872357, message="AcceleratorType",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class AggregatedListAcceleratorTypesRequest(proto.Message):
+    r"""A request message for AcceleratorTypes.AggregatedList. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class GetAcceleratorTypeRequest(proto.Message):
+    r"""A request message for AcceleratorTypes.Get. See the method
+    description for details.
+
+    Attributes:
+        accelerator_type (str):
+            Name of the accelerator type to return.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    accelerator_type = proto.Field(proto.STRING, number=138031246,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class ListAcceleratorTypesRequest(proto.Message):
+    r"""A request message for AcceleratorTypes.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,607 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the backend_services service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_34
+from google.cloud.compute_v1.types._shards import shared_35
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddSignedUrlKeyBackendServiceRequest",
+        "AggregatedListBackendServicesRequest",
+        "BackendServiceAggregatedList",
+        "BackendServicesScopedList",
+        "DeleteBackendServiceRequest",
+        "DeleteSignedUrlKeyBackendServiceRequest",
+        "GetBackendServiceRequest",
+        "GetHealthBackendServiceRequest",
+        "InsertBackendServiceRequest",
+        "ListBackendServicesRequest",
+        "PatchBackendServiceRequest",
+        "SecurityPolicyReference",
+        "SetSecurityPolicyBackendServiceRequest",
+        "UpdateBackendServiceRequest",
+    },
+)
+
+
+class AddSignedUrlKeyBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.AddSignedUrlKey. See
+    the method description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to which
+            the Signed URL Key should be added. The name
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        signed_url_key_resource (google.cloud.compute_v1.types.SignedUrlKey):
+            The body resource for this request
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    signed_url_key_resource = proto.Field(
+        proto.MESSAGE, number=457625985, message=shared_34.SignedUrlKey,
+    )
+
+
+class AggregatedListBackendServicesRequest(proto.Message):
+    r"""A request message for BackendServices.AggregatedList. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Name of the project scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class BackendServiceAggregatedList(proto.Message):
+    r"""Contains a list of BackendServicesScopedList.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.BackendServiceAggregatedList.ItemsEntry]):
+            A list of BackendServicesScopedList
+            resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="BackendServicesScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class BackendServicesScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        backend_services (Sequence[google.cloud.compute_v1.types.BackendService]):
+            A list of BackendServices contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of backend services when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    backend_services = proto.RepeatedField(
+        proto.MESSAGE, number=388522409, message=shared_35.BackendService,
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class DeleteBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.Delete. See the method
+    description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to
+            delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class DeleteSignedUrlKeyBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.DeleteSignedUrlKey. See
+    the method description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to which
+            the Signed URL Key should be added. The name
+            should conform to RFC1035.
+        key_name (str):
+            The name of the Signed URL Key to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    key_name = proto.Field(proto.STRING, number=500938859,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.Get. See the method
+    description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to
+            return.
+        project (str):
+            Project ID for this request.
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class GetHealthBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.GetHealth. See the
+    method description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to which
+            the queried instance belongs.
+        project (str):
+
+        resource_group_reference_resource (google.cloud.compute_v1.types.ResourceGroupReference):
+            The body resource for this request
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource_group_reference_resource = proto.Field(
+        proto.MESSAGE, number=112951123, message=shared_35.ResourceGroupReference,
+    )
+
+
+class InsertBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.Insert. See the method
+    description for details.
+
+    Attributes:
+        backend_service_resource (google.cloud.compute_v1.types.BackendService):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_service_resource = proto.Field(
+        proto.MESSAGE, number=347586723, message=shared_35.BackendService,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListBackendServicesRequest(proto.Message):
+    r"""A request message for BackendServices.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.Patch. See the method
+    description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to patch.
+        backend_service_resource (google.cloud.compute_v1.types.BackendService):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    backend_service_resource = proto.Field(
+        proto.MESSAGE, number=347586723, message=shared_35.BackendService,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class SecurityPolicyReference(proto.Message):
+    r"""
+
+    Attributes:
+        security_policy (str):
+
+            This field is a member of `oneof`_ ``_security_policy``.
+    """
+
+    security_policy = proto.Field(proto.STRING, number=171082513, optional=True,)
+
+
+class SetSecurityPolicyBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.SetSecurityPolicy. See
+    the method description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to which
+            the security policy should be set. The name
+            should conform to RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        security_policy_reference_resource (google.cloud.compute_v1.types.SecurityPolicyReference):
+            The body resource for this request
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    security_policy_reference_resource = proto.Field(
+        proto.MESSAGE, number=204135024, message="SecurityPolicyReference",
+    )
+
+
+class UpdateBackendServiceRequest(proto.Message):
+    r"""A request message for BackendServices.Update. See the method
+    description for details.
+
+    Attributes:
+        backend_service (str):
+            Name of the BackendService resource to
+            update.
+        backend_service_resource (google.cloud.compute_v1.types.BackendService):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058,)
+    backend_service_resource = proto.Field(
+        proto.MESSAGE, number=347586723, message=shared_35.BackendService,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
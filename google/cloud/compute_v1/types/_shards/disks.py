@@ -0,0 +1,741 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the disks service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_15
+from google.cloud.compute_v1.types._shards import shared_24
+from google.cloud.compute_v1.types._shards import shared_37
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddResourcePoliciesDiskRequest",
+        "AggregatedListDisksRequest",
+        "CreateSnapshotDiskRequest",
+        "DeleteDiskRequest",
+        "DiskAggregatedList",
+        "DisksAddResourcePoliciesRequest",
+        "DisksRemoveResourcePoliciesRequest",
+        "DisksResizeRequest",
+        "DisksScopedList",
+        "GetDiskRequest",
+        "GetIamPolicyDiskRequest",
+        "InsertDiskRequest",
+        "ListDisksRequest",
+        "RemoveResourcePoliciesDiskRequest",
+        "ResizeDiskRequest",
+        "SetIamPolicyDiskRequest",
+        "SetLabelsDiskRequest",
+        "TestIamPermissionsDiskRequest",
+        "ZoneSetLabelsRequest",
+    },
+)
+
+
+class AddResourcePoliciesDiskRequest(proto.Message):
+    r"""A request message for Disks.AddResourcePolicies. See the
+    method description for details.
+
+    Attributes:
+        disk (str):
+            The disk name for this request.
+        disks_add_resource_policies_request_resource (google.cloud.compute_v1.types.DisksAddResourcePoliciesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    disks_add_resource_policies_request_resource = proto.Field(
+        proto.MESSAGE, number=496483363, message="DisksAddResourcePoliciesRequest",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class AggregatedListDisksRequest(proto.Message):
+    r"""A request message for Disks.AggregatedList. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class CreateSnapshotDiskRequest(proto.Message):
+    r"""A request message for Disks.CreateSnapshot. See the method
+    description for details.
+
+    Attributes:
+        disk (str):
+            Name of the persistent disk to snapshot.
+        guest_flush (bool):
+            [Input Only] Whether to attempt an application consistent
+            snapshot by informing the OS to prepare for the snapshot
+            process. Currently only supported on Windows instances using
+            the Volume Shadow Copy Service (VSS).
+
+            This field is a member of `oneof`_ ``_guest_flush``.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        snapshot_resource (google.cloud.compute_v1.types.Snapshot):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    guest_flush = proto.Field(proto.BOOL, number=385550813, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    snapshot_resource = proto.Field(
+        proto.MESSAGE, number=481319977, message=shared_24.Snapshot,
+    )
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class DeleteDiskRequest(proto.Message):
+    r"""A request message for Disks.Delete. See the method
+    description for details.
+
+    Attributes:
+        disk (str):
+            Name of the persistent disk to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class DiskAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.DiskAggregatedList.ItemsEntry]):
+            A list of DisksScopedList resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#diskAggregatedList for aggregated lists of
+            persistent disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=100526016, message="DisksScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class DisksAddResourcePoliciesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (Sequence[str]):
+            Full or relative path to the resource policy
+            to be added to this disk. You can only specify
+            one resource policy.
+    """
+
+    resource_policies = proto.RepeatedField(proto.STRING, number=22220385,)
+
+
+class DisksRemoveResourcePoliciesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (Sequence[str]):
+            Resource policies to be removed from this
+            disk.
+    """
+
+    resource_policies = proto.RepeatedField(proto.STRING, number=22220385,)
+
+
+class DisksResizeRequest(proto.Message):
+    r"""
+
+    Attributes:
+        size_gb (int):
+            The new size of the persistent disk, which is
+            specified in GB.
+
+            This field is a member of `oneof`_ ``_size_gb``.
+    """
+
+    size_gb = proto.Field(proto.INT64, number=494929369, optional=True,)
+
+
+class DisksScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        disks (Sequence[google.cloud.compute_v1.types.Disk]):
+            [Output Only] A list of disks contained in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning which replaces the list
+            of disks when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    disks = proto.RepeatedField(proto.MESSAGE, number=95594102, message=shared_37.Disk,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class GetDiskRequest(proto.Message):
+    r"""A request message for Disks.Get. See the method description
+    for details.
+
+    Attributes:
+        disk (str):
+            Name of the persistent disk to return.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class GetIamPolicyDiskRequest(proto.Message):
+    r"""A request message for Disks.GetIamPolicy. See the method
+    description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class InsertDiskRequest(proto.Message):
+    r"""A request message for Disks.Insert. See the method
+    description for details.
+
+    Attributes:
+        disk_resource (google.cloud.compute_v1.types.Disk):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        source_image (str):
+            Source image to restore onto a disk. This
+            field is optional.
+
+            This field is a member of `oneof`_ ``_source_image``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk_resource = proto.Field(proto.MESSAGE, number=25880688, message=shared_37.Disk,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    source_image = proto.Field(proto.STRING, number=50443319, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class ListDisksRequest(proto.Message):
+    r"""A request message for Disks.List. See the method description
+    for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class RemoveResourcePoliciesDiskRequest(proto.Message):
+    r"""A request message for Disks.RemoveResourcePolicies. See the
+    method description for details.
+
+    Attributes:
+        disk (str):
+            The disk name for this request.
+        disks_remove_resource_policies_request_resource (google.cloud.compute_v1.types.DisksRemoveResourcePoliciesRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    disks_remove_resource_policies_request_resource = proto.Field(
+        proto.MESSAGE, number=436756718, message="DisksRemoveResourcePoliciesRequest",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class ResizeDiskRequest(proto.Message):
+    r"""A request message for Disks.Resize. See the method
+    description for details.
+
+    Attributes:
+        disk (str):
+            The name of the persistent disk.
+        disks_resize_request_resource (google.cloud.compute_v1.types.DisksResizeRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    disks_resize_request_resource = proto.Field(
+        proto.MESSAGE, number=78307616, message="DisksResizeRequest",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class SetIamPolicyDiskRequest(proto.Message):
+    r"""A request message for Disks.SetIamPolicy. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+        zone_set_policy_request_resource (google.cloud.compute_v1.types.ZoneSetPolicyRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+    zone_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=382082107, message=shared_15.ZoneSetPolicyRequest,
+    )
+
+
+class SetLabelsDiskRequest(proto.Message):
+    r"""A request message for Disks.SetLabels. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource (str):
+            Name or id of the resource for this request.
+        zone (str):
+            The name of the zone for this request.
+        zone_set_labels_request_resource (google.cloud.compute_v1.types.ZoneSetLabelsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+    zone_set_labels_request_resource = proto.Field(
+        proto.MESSAGE, number=364950798, message="ZoneSetLabelsRequest",
+    )
+
+
+class TestIamPermissionsDiskRequest(proto.Message):
+    r"""A request message for Disks.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class ZoneSetLabelsRequest(proto.Message):
+    r"""
+
+    Attributes:
+        label_fingerprint (str):
+            The fingerprint of the previous set of labels
+            for this resource, used to detect conflicts. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an up-
+            to-date fingerprint hash in order to update or
+            change labels. Make a get() request to the
+            resource to get the latest fingerprint.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (Sequence[google.cloud.compute_v1.types.ZoneSetLabelsRequest.LabelsEntry]):
+            The labels to set for this resource.
+    """
+
+    label_fingerprint = proto.Field(proto.STRING, number=178124825, optional=True,)
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
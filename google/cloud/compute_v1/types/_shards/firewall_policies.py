@@ -0,0 +1,879 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the firewall_policies service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_06
+from google.cloud.compute_v1.types._shards import shared_25
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddAssociationFirewallPolicyRequest",
+        "AddRuleFirewallPolicyRequest",
+        "CloneRulesFirewallPolicyRequest",
+        "DeleteFirewallPolicyRequest",
+        "FirewallPoliciesListAssociationsResponse",
+        "FirewallPolicy",
+        "FirewallPolicyAssociation",
+        "FirewallPolicyList",
+        "GetAssociationFirewallPolicyRequest",
+        "GetFirewallPolicyRequest",
+        "GetIamPolicyFirewallPolicyRequest",
+        "GetRuleFirewallPolicyRequest",
+        "GlobalOrganizationSetPolicyRequest",
+        "InsertFirewallPolicyRequest",
+        "ListAssociationsFirewallPolicyRequest",
+        "ListFirewallPoliciesRequest",
+        "MoveFirewallPolicyRequest",
+        "PatchFirewallPolicyRequest",
+        "PatchRuleFirewallPolicyRequest",
+        "RemoveAssociationFirewallPolicyRequest",
+        "RemoveRuleFirewallPolicyRequest",
+        "SetIamPolicyFirewallPolicyRequest",
+        "TestIamPermissionsFirewallPolicyRequest",
+    },
+)
+
+
+class AddAssociationFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.AddAssociation. See
+    the method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_association_resource (google.cloud.compute_v1.types.FirewallPolicyAssociation):
+            The body resource for this request
+        replace_existing_association (bool):
+            Indicates whether or not to replace it if an
+            association of the attachment already exists.
+            This is false by default, in which case an error
+            will be returned if an association already
+            exists.
+
+            This field is a member of `oneof`_ ``_replace_existing_association``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    firewall_policy_association_resource = proto.Field(
+        proto.MESSAGE, number=259546170, message="FirewallPolicyAssociation",
+    )
+    replace_existing_association = proto.Field(
+        proto.BOOL, number=209541240, optional=True,
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class AddRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.AddRule. See the
+    method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_rule_resource (google.cloud.compute_v1.types.FirewallPolicyRule):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    firewall_policy_rule_resource = proto.Field(
+        proto.MESSAGE, number=250523523, message=shared_25.FirewallPolicyRule,
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class CloneRulesFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.CloneRules. See the
+    method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        source_firewall_policy (str):
+            The firewall policy from which to copy rules.
+
+            This field is a member of `oneof`_ ``_source_firewall_policy``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    source_firewall_policy = proto.Field(proto.STRING, number=25013549, optional=True,)
+
+
+class DeleteFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Delete. See the method
+    description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to delete.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class FirewallPoliciesListAssociationsResponse(proto.Message):
+    r"""
+
+    Attributes:
+        associations (Sequence[google.cloud.compute_v1.types.FirewallPolicyAssociation]):
+            A list of associations.
+        kind (str):
+            [Output Only] Type of firewallPolicy associations. Always
+            compute#FirewallPoliciesListAssociations for lists of
+            firewallPolicy associations.
+
+            This field is a member of `oneof`_ ``_kind``.
+    """
+
+    associations = proto.RepeatedField(
+        proto.MESSAGE, number=508736530, message="FirewallPolicyAssociation",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+
+
+class FirewallPolicy(proto.Message):
+    r"""Represents a Firewall Policy resource.
+
+    Attributes:
+        associations (Sequence[google.cloud.compute_v1.types.FirewallPolicyAssociation]):
+            A list of associations that belong to this
+            firewall policy.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        display_name (str):
+            Deprecated, please use short name instead. User-provided
+            name of the Organization firewall policy. The name should be
+            unique in the organization in which the firewall policy is
+            created. This name must be set on creation and cannot be
+            changed. The name must be 1-63 characters long, and comply
+            with RFC1035. Specifically, the name must be 1-63 characters
+            long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_display_name``.
+        fingerprint (str):
+            Specifies a fingerprint for this resource,
+            which is essentially a hash of the metadata's
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update metadata. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change metadata, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make get() request to the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#firewallPolicyfor firewall policies
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] Name of the resource. It is a numeric ID
+            allocated by GCP which uniquely identifies the Firewall
+            Policy.
+
+            This field is a member of `oneof`_ ``_name``.
+        parent (str):
+            [Output Only] The parent of the firewall policy.
+
+            This field is a member of `oneof`_ ``_parent``.
+        rule_tuple_count (int):
+            [Output Only] Total count of all firewall policy rule
+            tuples. A firewall policy can not exceed a set number of
+            tuples.
+
+            This field is a member of `oneof`_ ``_rule_tuple_count``.
+        rules (Sequence[google.cloud.compute_v1.types.FirewallPolicyRule]):
+            A list of rules that belong to this policy. There must
+            always be a default rule (rule with priority 2147483647 and
+            match "*"). If no rules are provided when creating a
+            firewall policy, a default rule with action "allow" will be
+            added.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        self_link_with_id (str):
+            [Output Only] Server-defined URL for this resource with the
+            resource id.
+
+            This field is a member of `oneof`_ ``_self_link_with_id``.
+        short_name (str):
+            User-provided name of the Organization firewall plicy. The
+            name should be unique in the organization in which the
+            firewall policy is created. This name must be set on
+            creation and cannot be changed. The name must be 1-63
+            characters long, and comply with RFC1035. Specifically, the
+            name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_short_name``.
+    """
+
+    associations = proto.RepeatedField(
+        proto.MESSAGE, number=508736530, message="FirewallPolicyAssociation",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    display_name = proto.Field(proto.STRING, number=4473832, optional=True,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    parent = proto.Field(proto.STRING, number=78317738, optional=True,)
+    rule_tuple_count = proto.Field(proto.INT32, number=388342037, optional=True,)
+    rules = proto.RepeatedField(
+        proto.MESSAGE, number=108873975, message=shared_25.FirewallPolicyRule,
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    self_link_with_id = proto.Field(proto.STRING, number=44520962, optional=True,)
+    short_name = proto.Field(proto.STRING, number=492051566, optional=True,)
+
+
+class FirewallPolicyAssociation(proto.Message):
+    r"""
+
+    Attributes:
+        attachment_target (str):
+            The target that the firewall policy is
+            attached to.
+
+            This field is a member of `oneof`_ ``_attachment_target``.
+        display_name (str):
+            [Output Only] Deprecated, please use short name instead. The
+            display name of the firewall policy of the association.
+
+            This field is a member of `oneof`_ ``_display_name``.
+        firewall_policy_id (str):
+            [Output Only] The firewall policy ID of the association.
+
+            This field is a member of `oneof`_ ``_firewall_policy_id``.
+        name (str):
+            The name for an association.
+
+            This field is a member of `oneof`_ ``_name``.
+        short_name (str):
+            [Output Only] The short name of the firewall policy of the
+            association.
+
+            This field is a member of `oneof`_ ``_short_name``.
+    """
+
+    attachment_target = proto.Field(proto.STRING, number=175773741, optional=True,)
+    display_name = proto.Field(proto.STRING, number=4473832, optional=True,)
+    firewall_policy_id = proto.Field(proto.STRING, number=357211849, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    short_name = proto.Field(proto.STRING, number=492051566, optional=True,)
+
+
+class FirewallPolicyList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.FirewallPolicy]):
+            A list of FirewallPolicy resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#firewallPolicyList for listsof FirewallPolicies
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="FirewallPolicy",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class GetAssociationFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.GetAssociation. See
+    the method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to which the
+            queried rule belongs.
+        name (str):
+            The name of the association to get from the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+
+
+class GetFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Get. See the method
+    description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to get.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+
+
+class GetIamPolicyFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.GetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.GetRule. See the
+    method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to which the
+            queried rule belongs.
+        priority (int):
+            The priority of the rule to get from the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_priority``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+
+
+class GlobalOrganizationSetPolicyRequest(proto.Message):
+    r"""
+
+    Attributes:
+        bindings (Sequence[google.cloud.compute_v1.types.Binding]):
+            Flatten Policy to create a backward
+            compatible wire-format. Deprecated. Use 'policy'
+            to specify bindings.
+        etag (str):
+            Flatten Policy to create a backward
+            compatible wire-format. Deprecated. Use 'policy'
+            to specify the etag.
+
+            This field is a member of `oneof`_ ``_etag``.
+        policy (google.cloud.compute_v1.types.Policy):
+            REQUIRED: The complete policy to be applied
+            to the 'resource'. The size of the policy is
+            limited to a few 10s of KB. An empty policy is
+            in general a valid policy but certain services
+            (like Projects) might reject them.
+
+            This field is a member of `oneof`_ ``_policy``.
+    """
+
+    bindings = proto.RepeatedField(
+        proto.MESSAGE, number=403251854, message=shared_06.Binding,
+    )
+    etag = proto.Field(proto.STRING, number=3123477, optional=True,)
+    policy = proto.Field(
+        proto.MESSAGE, number=91071794, optional=True, message=shared_06.Policy,
+    )
+
+
+class InsertFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Insert. See the method
+    description for details.
+
+    Attributes:
+        firewall_policy_resource (google.cloud.compute_v1.types.FirewallPolicy):
+            The body resource for this request
+        parent_id (str):
+            Parent ID for this request. The ID can be either be
+            "folders/[FOLDER_ID]" if the parent is a folder or
+            "organizations/[ORGANIZATION_ID]" if the parent is an
+            organization.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy_resource = proto.Field(
+        proto.MESSAGE, number=495049532, message="FirewallPolicy",
+    )
+    parent_id = proto.Field(proto.STRING, number=459714768,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListAssociationsFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.ListAssociations. See
+    the method description for details.
+
+    Attributes:
+        target_resource (str):
+            The target resource to list associations. It
+            is an organization, or a folder.
+
+            This field is a member of `oneof`_ ``_target_resource``.
+    """
+
+    target_resource = proto.Field(proto.STRING, number=467318524, optional=True,)
+
+
+class ListFirewallPoliciesRequest(proto.Message):
+    r"""A request message for FirewallPolicies.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        parent_id (str):
+            Parent ID for this request.
+
+            This field is a member of `oneof`_ ``_parent_id``.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    parent_id = proto.Field(proto.STRING, number=459714768, optional=True,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class MoveFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Move. See the method
+    description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        parent_id (str):
+            The new parent of the firewall policy.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    parent_id = proto.Field(proto.STRING, number=459714768,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class PatchFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.Patch. See the method
+    description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_resource (google.cloud.compute_v1.types.FirewallPolicy):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    firewall_policy_resource = proto.Field(
+        proto.MESSAGE, number=495049532, message="FirewallPolicy",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class PatchRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.PatchRule. See the
+    method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        firewall_policy_rule_resource (google.cloud.compute_v1.types.FirewallPolicyRule):
+            The body resource for this request
+        priority (int):
+            The priority of the rule to patch.
+
+            This field is a member of `oneof`_ ``_priority``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    firewall_policy_rule_resource = proto.Field(
+        proto.MESSAGE, number=250523523, message=shared_25.FirewallPolicyRule,
+    )
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class RemoveAssociationFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.RemoveAssociation. See
+    the method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        name (str):
+            Name for the attachment that will be removed.
+
+            This field is a member of `oneof`_ ``_name``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class RemoveRuleFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.RemoveRule. See the
+    method description for details.
+
+    Attributes:
+        firewall_policy (str):
+            Name of the firewall policy to update.
+        priority (int):
+            The priority of the rule to remove from the
+            firewall policy.
+
+            This field is a member of `oneof`_ ``_priority``.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    firewall_policy = proto.Field(proto.STRING, number=498173265,)
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class SetIamPolicyFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        global_organization_set_policy_request_resource (google.cloud.compute_v1.types.GlobalOrganizationSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_organization_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=177408606, message="GlobalOrganizationSetPolicyRequest",
+    )
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class TestIamPermissionsFirewallPolicyRequest(proto.Message):
+    r"""A request message for FirewallPolicies.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the global_forwarding_rules service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_16
+from google.cloud.compute_v1.types._shards import shared_27
+from google.cloud.compute_v1.types._shards import shared_38
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteGlobalForwardingRuleRequest",
+        "GetGlobalForwardingRuleRequest",
+        "InsertGlobalForwardingRuleRequest",
+        "ListGlobalForwardingRulesRequest",
+        "PatchGlobalForwardingRuleRequest",
+        "SetLabelsGlobalForwardingRuleRequest",
+        "SetTargetGlobalForwardingRuleRequest",
+    },
+)
+
+
+class DeleteGlobalForwardingRuleRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.Delete. See the
+    method description for details.
+
+    Attributes:
+        forwarding_rule (str):
+            Name of the ForwardingRule resource to
+            delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    forwarding_rule = proto.Field(proto.STRING, number=269964030,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetGlobalForwardingRuleRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.Get. See the
+    method description for details.
+
+    Attributes:
+        forwarding_rule (str):
+            Name of the ForwardingRule resource to
+            return.
+        project (str):
+            Project ID for this request.
+    """
+
+    forwarding_rule = proto.Field(proto.STRING, number=269964030,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class InsertGlobalForwardingRuleRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.Insert. See the
+    method description for details.
+
+    Attributes:
+        forwarding_rule_resource (google.cloud.compute_v1.types.ForwardingRule):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    forwarding_rule_resource = proto.Field(
+        proto.MESSAGE, number=301211695, message=shared_38.ForwardingRule,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListGlobalForwardingRulesRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.List. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchGlobalForwardingRuleRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.Patch. See the
+    method description for details.
+
+    Attributes:
+        forwarding_rule (str):
+            Name of the ForwardingRule resource to patch.
+        forwarding_rule_resource (google.cloud.compute_v1.types.ForwardingRule):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    forwarding_rule = proto.Field(proto.STRING, number=269964030,)
+    forwarding_rule_resource = proto.Field(
+        proto.MESSAGE, number=301211695, message=shared_38.ForwardingRule,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class SetLabelsGlobalForwardingRuleRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.SetLabels. See
+    the method description for details.
+
+    Attributes:
+        global_set_labels_request_resource (google.cloud.compute_v1.types.GlobalSetLabelsRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_labels_request_resource = proto.Field(
+        proto.MESSAGE, number=319917189, message=shared_16.GlobalSetLabelsRequest,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class SetTargetGlobalForwardingRuleRequest(proto.Message):
+    r"""A request message for GlobalForwardingRules.SetTarget. See
+    the method description for details.
+
+    Attributes:
+        forwarding_rule (str):
+            Name of the ForwardingRule resource in which
+            target is to be set.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_reference_resource (google.cloud.compute_v1.types.TargetReference):
+            The body resource for this request
+    """
+
+    forwarding_rule = proto.Field(proto.STRING, number=269964030,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_reference_resource = proto.Field(
+        proto.MESSAGE, number=523721712, message=shared_27.TargetReference,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
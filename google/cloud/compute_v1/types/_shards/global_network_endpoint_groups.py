@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the global_network_endpoint_groups service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_29
+from google.cloud.compute_v1.types._shards import shared_39
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AttachNetworkEndpointsGlobalNetworkEndpointGroupRequest",
+        "DeleteGlobalNetworkEndpointGroupRequest",
+        "DetachNetworkEndpointsGlobalNetworkEndpointGroupRequest",
+        "GetGlobalNetworkEndpointGroupRequest",
+        "GlobalNetworkEndpointGroupsAttachEndpointsRequest",
+        "GlobalNetworkEndpointGroupsDetachEndpointsRequest",
+        "InsertGlobalNetworkEndpointGroupRequest",
+        "ListGlobalNetworkEndpointGroupsRequest",
+        "ListNetworkEndpointsGlobalNetworkEndpointGroupsRequest",
+    },
+)
+
+
+class AttachNetworkEndpointsGlobalNetworkEndpointGroupRequest(proto.Message):
+    r"""A request message for
+    GlobalNetworkEndpointGroups.AttachNetworkEndpoints. See the
+    method description for details.
+
+    Attributes:
+        global_network_endpoint_groups_attach_endpoints_request_resource (google.cloud.compute_v1.types.GlobalNetworkEndpointGroupsAttachEndpointsRequest):
+            The body resource for this request
+        network_endpoint_group (str):
+            The name of the network endpoint group where
+            you are attaching network endpoints to. It
+            should comply with RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    global_network_endpoint_groups_attach_endpoints_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=30691563,
+        message="GlobalNetworkEndpointGroupsAttachEndpointsRequest",
+    )
+    network_endpoint_group = proto.Field(proto.STRING, number=433907078,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class DeleteGlobalNetworkEndpointGroupRequest(proto.Message):
+    r"""A request message for GlobalNetworkEndpointGroups.Delete. See
+    the method description for details.
+
+    Attributes:
+        network_endpoint_group (str):
+            The name of the network endpoint group to
+            delete. It should comply with RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network_endpoint_group = proto.Field(proto.STRING, number=433907078,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class DetachNetworkEndpointsGlobalNetworkEndpointGroupRequest(proto.Message):
+    r"""A request message for
+    GlobalNetworkEndpointGroups.DetachNetworkEndpoints. See the
+    method description for details.
+
+    Attributes:
+        global_network_endpoint_groups_detach_endpoints_request_resource (google.cloud.compute_v1.types.GlobalNetworkEndpointGroupsDetachEndpointsRequest):
+            The body resource for this request
+        network_endpoint_group (str):
+            The name of the network endpoint group where
+            you are removing network endpoints. It should
+            comply with RFC1035.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    global_network_endpoint_groups_detach_endpoints_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=8898269,
+        message="GlobalNetworkEndpointGroupsDetachEndpointsRequest",
+    )
+    network_endpoint_group = proto.Field(proto.STRING, number=433907078,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetGlobalNetworkEndpointGroupRequest(proto.Message):
+    r"""A request message for GlobalNetworkEndpointGroups.Get. See
+    the method description for details.
+
+    Attributes:
+        network_endpoint_group (str):
+            The name of the network endpoint group. It
+            should comply with RFC1035.
+        project (str):
+            Project ID for this request.
+    """
+
+    network_endpoint_group = proto.Field(proto.STRING, number=433907078,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class GlobalNetworkEndpointGroupsAttachEndpointsRequest(proto.Message):
+    r"""
+
+    Attributes:
+        network_endpoints (Sequence[google.cloud.compute_v1.types.NetworkEndpoint]):
+            The list of network endpoints to be attached.
+    """
+
+    network_endpoints = proto.RepeatedField(
+        proto.MESSAGE, number=149850285, message=shared_39.NetworkEndpoint,
+    )
+
+
+class GlobalNetworkEndpointGroupsDetachEndpointsRequest(proto.Message):
+    r"""
+
+    Attributes:
+        network_endpoints (Sequence[google.cloud.compute_v1.types.NetworkEndpoint]):
+            The list of network endpoints to be detached.
+    """
+
+    network_endpoints = proto.RepeatedField(
+        proto.MESSAGE, number=149850285, message=shared_39.NetworkEndpoint,
+    )
+
+
+class InsertGlobalNetworkEndpointGroupRequest(proto.Message):
+    r"""A request message for GlobalNetworkEndpointGroups.Insert. See
+    the method description for details.
+
+    Attributes:
+        network_endpoint_group_resource (google.cloud.compute_v1.types.NetworkEndpointGroup):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    network_endpoint_group_resource = proto.Field(
+        proto.MESSAGE, number=525788839, message=shared_29.NetworkEndpointGroup,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListGlobalNetworkEndpointGroupsRequest(proto.Message):
+    r"""A request message for GlobalNetworkEndpointGroups.List. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class ListNetworkEndpointsGlobalNetworkEndpointGroupsRequest(proto.Message):
+    r"""A request message for
+    GlobalNetworkEndpointGroups.ListNetworkEndpoints. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        network_endpoint_group (str):
+            The name of the network endpoint group from
+            which you want to generate a list of included
+            network endpoints. It should comply with
+            RFC1035.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    network_endpoint_group = proto.Field(proto.STRING, number=433907078,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
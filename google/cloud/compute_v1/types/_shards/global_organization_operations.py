@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the global_organization_operations service."""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteGlobalOrganizationOperationRequest",
+        "DeleteGlobalOrganizationOperationResponse",
+        "GetGlobalOrganizationOperationRequest",
+        "ListGlobalOrganizationOperationsRequest",
+    },
+)
+
+
+class DeleteGlobalOrganizationOperationRequest(proto.Message):
+    r"""A request message for GlobalOrganizationOperations.Delete.
+    See the method description for details.
+
+    Attributes:
+        operation (str):
+            Name of the Operations resource to delete.
+        parent_id (str):
+            Parent ID for this request.
+
+            This field is a member of `oneof`_ ``_parent_id``.
+    """
+
+    operation = proto.Field(proto.STRING, number=52090215,)
+    parent_id = proto.Field(proto.STRING, number=459714768, optional=True,)
+
+
+class DeleteGlobalOrganizationOperationResponse(proto.Message):
+    r"""A response message for GlobalOrganizationOperations.Delete.
+    See the method description for details.
+
+    """
+
+
+class GetGlobalOrganizationOperationRequest(proto.Message):
+    r"""A request message for GlobalOrganizationOperations.Get. See
+    the method description for details.
+
+    Attributes:
+        operation (str):
+            Name of the Operations resource to return.
+        parent_id (str):
+            Parent ID for this request.
+
+            This field is a member of `oneof`_ ``_parent_id``.
+    """
+
+    operation = proto.Field(proto.STRING, number=52090215,)
+    parent_id = proto.Field(proto.STRING, number=459714768, optional=True,)
+
+
+class ListGlobalOrganizationOperationsRequest(proto.Message):
+    r"""A request message for GlobalOrganizationOperations.List. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        parent_id (str):
+            Parent ID for this request.
+
+            This field is a member of `oneof`_ ``_parent_id``.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    parent_id = proto.Field(proto.STRING, number=459714768, optional=True,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the image_family_views service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_42
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={"GetImageFamilyViewRequest", "ImageFamilyView",},
+)
+
+
+class GetImageFamilyViewRequest(proto.Message):
+    r"""A request message for ImageFamilyViews.Get. See the method
+    description for details.
+
+    Attributes:
+        family (str):
+            Name of the image family to search for.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    family = proto.Field(proto.STRING, number=328751972,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class ImageFamilyView(proto.Message):
+    r"""
+
+    Attributes:
+        image (google.cloud.compute_v1.types.Image):
+            The latest image that is part of the
+            specified image family in the requested
+            location, and that is not deprecated.
+
+            This field is a member of `oneof`_ ``_image``.
+    """
+
+    image = proto.Field(
+        proto.MESSAGE, number=100313435, optional=True, message=shared_42.Image,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
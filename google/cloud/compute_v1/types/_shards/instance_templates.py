@@ -0,0 +1,495 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the instance_templates service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_19
+from google.cloud.compute_v1.types._shards import shared_31
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteInstanceTemplateRequest",
+        "DiskInstantiationConfig",
+        "GetIamPolicyInstanceTemplateRequest",
+        "GetInstanceTemplateRequest",
+        "InsertInstanceTemplateRequest",
+        "InstanceTemplate",
+        "InstanceTemplateList",
+        "ListInstanceTemplatesRequest",
+        "SetIamPolicyInstanceTemplateRequest",
+        "SourceInstanceParams",
+        "TestIamPermissionsInstanceTemplateRequest",
+    },
+)
+
+
+class DeleteInstanceTemplateRequest(proto.Message):
+    r"""A request message for InstanceTemplates.Delete. See the
+    method description for details.
+
+    Attributes:
+        instance_template (str):
+            The name of the instance template to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_template = proto.Field(proto.STRING, number=309248228,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class DiskInstantiationConfig(proto.Message):
+    r"""A specification of the desired way to instantiate a disk in
+    the instance template when its created from a source instance.
+
+    Attributes:
+        auto_delete (bool):
+            Specifies whether the disk will be auto-
+            eleted when the instance is deleted (but not
+            when the disk is detached from the instance).
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        custom_image (str):
+            The custom source image to be used to restore
+            this disk when instantiating this instance
+            template.
+
+            This field is a member of `oneof`_ ``_custom_image``.
+        device_name (str):
+            Specifies the device name of the disk to
+            which the configurations apply to.
+
+            This field is a member of `oneof`_ ``_device_name``.
+        instantiate_from (str):
+            Specifies whether to include the disk and
+            what image to use. Possible values are: -
+            source-image: to use the same image that was
+            used to create the source instance's
+            corresponding disk. Applicable to the boot disk
+            and additional read-write disks. - source-image-
+            family: to use the same image family that was
+            used to create the source instance's
+            corresponding disk. Applicable to the boot disk
+            and additional read-write disks. - custom-image:
+            to use a user-provided image url for disk
+            creation. Applicable to the boot disk and
+            additional read-write disks. - attach-read-only:
+            to attach a read-only disk. Applicable to read-
+            only disks. - do-not-include: to exclude a disk
+            from the template. Applicable to additional
+            read-write disks, local SSDs, and read-only
+            disks. Check the InstantiateFrom enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_instantiate_from``.
+    """
+
+    class InstantiateFrom(proto.Enum):
+        r"""Specifies whether to include the disk and what image to use.
+        Possible values are: - source-image: to use the same image that
+        was used to create the source instance's corresponding disk.
+        Applicable to the boot disk and additional read-write disks. -
+        source-image-family: to use the same image family that was used
+        to create the source instance's corresponding disk. Applicable
+        to the boot disk and additional read-write disks. - custom-
+        image: to use a user-provided image url for disk creation.
+        Applicable to the boot disk and additional read-write disks. -
+        attach-read-only: to attach a read-only disk. Applicable to
+        read-only disks. - do-not-include: to exclude a disk from the
+        template. Applicable to additional read-write disks, local SSDs,
+        and read-only disks.
+        """
+        UNDEFINED_INSTANTIATE_FROM = 0
+        ATTACH_READ_ONLY = 513775419
+        BLANK = 63281460
+        CUSTOM_IMAGE = 196311789
+        DEFAULT = 115302945
+        DO_NOT_INCLUDE = 104218952
+        SOURCE_IMAGE = 62631959
+        SOURCE_IMAGE_FAMILY = 76850316
+
+    auto_delete = proto.Field(proto.BOOL, number=464761403, optional=True,)
+    custom_image = proto.Field(proto.STRING, number=184123149, optional=True,)
+    device_name = proto.Field(proto.STRING, number=67541716, optional=True,)
+    instantiate_from = proto.Field(proto.STRING, number=393383903, optional=True,)
+
+
+class GetIamPolicyInstanceTemplateRequest(proto.Message):
+    r"""A request message for InstanceTemplates.GetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetInstanceTemplateRequest(proto.Message):
+    r"""A request message for InstanceTemplates.Get. See the method
+    description for details.
+
+    Attributes:
+        instance_template (str):
+            The name of the instance template.
+        project (str):
+            Project ID for this request.
+    """
+
+    instance_template = proto.Field(proto.STRING, number=309248228,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class InsertInstanceTemplateRequest(proto.Message):
+    r"""A request message for InstanceTemplates.Insert. See the
+    method description for details.
+
+    Attributes:
+        instance_template_resource (google.cloud.compute_v1.types.InstanceTemplate):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_template_resource = proto.Field(
+        proto.MESSAGE, number=10679561, message="InstanceTemplate",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class InstanceTemplate(proto.Message):
+    r"""Represents an Instance Template resource. You can use
+    instance templates to create VM instances and managed instance
+    groups. For more information, read Instance Templates.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] The creation timestamp for this instance
+            template in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] A unique identifier for this instance
+            template. The server defines this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceTemplate for instance templates.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        properties (google.cloud.compute_v1.types.InstanceProperties):
+            The instance properties for this instance
+            template.
+
+            This field is a member of `oneof`_ ``_properties``.
+        self_link (str):
+            [Output Only] The URL for this instance template. The server
+            defines this URL.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        source_instance (str):
+            The source instance used to create the
+            template. You can provide this as a partial or
+            full URL to the resource. For example, the
+            following are valid values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /instances/instance -
+            projects/project/zones/zone/instances/instance
+
+            This field is a member of `oneof`_ ``_source_instance``.
+        source_instance_params (google.cloud.compute_v1.types.SourceInstanceParams):
+            The source instance params to use to create
+            this instance template.
+
+            This field is a member of `oneof`_ ``_source_instance_params``.
+    """
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    properties = proto.Field(
+        proto.MESSAGE,
+        number=147688755,
+        optional=True,
+        message=shared_31.InstanceProperties,
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    source_instance = proto.Field(proto.STRING, number=396315705, optional=True,)
+    source_instance_params = proto.Field(
+        proto.MESSAGE, number=135342156, optional=True, message="SourceInstanceParams",
+    )
+
+
+class InstanceTemplateList(proto.Message):
+    r"""A list of instance templates.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.InstanceTemplate]):
+            A list of InstanceTemplate resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceTemplatesListResponse for instance template
+            lists.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="InstanceTemplate",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ListInstanceTemplatesRequest(proto.Message):
+    r"""A request message for InstanceTemplates.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class SetIamPolicyInstanceTemplateRequest(proto.Message):
+    r"""A request message for InstanceTemplates.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        global_set_policy_request_resource (google.cloud.compute_v1.types.GlobalSetPolicyRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=337048498, message=shared_19.GlobalSetPolicyRequest,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class SourceInstanceParams(proto.Message):
+    r"""A specification of the parameters to use when creating the
+    instance template from a source instance.
+
+    Attributes:
+        disk_configs (Sequence[google.cloud.compute_v1.types.DiskInstantiationConfig]):
+            Attached disks configuration. If not
+            provided, defaults are applied: For boot disk
+            and any other R/W disks, new custom images will
+            be created from each disk. For read-only disks,
+            they will be attached in read-only mode. Local
+            SSD disks will be created as blank volumes.
+    """
+
+    disk_configs = proto.RepeatedField(
+        proto.MESSAGE, number=235580623, message="DiskInstantiationConfig",
+    )
+
+
+class TestIamPermissionsInstanceTemplateRequest(proto.Message):
+    r"""A request message for InstanceTemplates.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,958 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the interconnect_attachments service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListInterconnectAttachmentsRequest",
+        "DeleteInterconnectAttachmentRequest",
+        "GetInterconnectAttachmentRequest",
+        "InsertInterconnectAttachmentRequest",
+        "InterconnectAttachment",
+        "InterconnectAttachmentAggregatedList",
+        "InterconnectAttachmentList",
+        "InterconnectAttachmentPartnerMetadata",
+        "InterconnectAttachmentPrivateInfo",
+        "InterconnectAttachmentsScopedList",
+        "ListInterconnectAttachmentsRequest",
+        "PatchInterconnectAttachmentRequest",
+    },
+)
+
+
+class AggregatedListInterconnectAttachmentsRequest(proto.Message):
+    r"""A request message for InterconnectAttachments.AggregatedList.
+    See the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeleteInterconnectAttachmentRequest(proto.Message):
+    r"""A request message for InterconnectAttachments.Delete. See the
+    method description for details.
+
+    Attributes:
+        interconnect_attachment (str):
+            Name of the interconnect attachment to
+            delete.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    interconnect_attachment = proto.Field(proto.STRING, number=308135284,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetInterconnectAttachmentRequest(proto.Message):
+    r"""A request message for InterconnectAttachments.Get. See the
+    method description for details.
+
+    Attributes:
+        interconnect_attachment (str):
+            Name of the interconnect attachment to
+            return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+    """
+
+    interconnect_attachment = proto.Field(proto.STRING, number=308135284,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class InsertInterconnectAttachmentRequest(proto.Message):
+    r"""A request message for InterconnectAttachments.Insert. See the
+    method description for details.
+
+    Attributes:
+        interconnect_attachment_resource (google.cloud.compute_v1.types.InterconnectAttachment):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        validate_only (bool):
+            If true, the request will not be committed.
+
+            This field is a member of `oneof`_ ``_validate_only``.
+    """
+
+    interconnect_attachment_resource = proto.Field(
+        proto.MESSAGE, number=212341369, message="InterconnectAttachment",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    validate_only = proto.Field(proto.BOOL, number=242744629, optional=True,)
+
+
+class InterconnectAttachment(proto.Message):
+    r"""Represents an Interconnect Attachment (VLAN) resource. You
+    can use Interconnect attachments (VLANS) to connect your Virtual
+    Private Cloud networks to your on-premises networks through an
+    Interconnect. For more information, read Creating VLAN
+    Attachments.
+
+    Attributes:
+        admin_enabled (bool):
+            Determines whether this Attachment will carry packets. Not
+            present for PARTNER_PROVIDER.
+
+            This field is a member of `oneof`_ ``_admin_enabled``.
+        bandwidth (str):
+            Provisioned bandwidth capacity for the interconnect
+            attachment. For attachments of type DEDICATED, the user can
+            set the bandwidth. For attachments of type PARTNER, the
+            Google Partner that is operating the interconnect must set
+            the bandwidth. Output only for PARTNER type, mutable for
+            PARTNER_PROVIDER and DEDICATED, and can take one of the
+            following values: - BPS_50M: 50 Mbit/s - BPS_100M: 100
+            Mbit/s - BPS_200M: 200 Mbit/s - BPS_300M: 300 Mbit/s -
+            BPS_400M: 400 Mbit/s - BPS_500M: 500 Mbit/s - BPS_1G: 1
+            Gbit/s - BPS_2G: 2 Gbit/s - BPS_5G: 5 Gbit/s - BPS_10G: 10
+            Gbit/s - BPS_20G: 20 Gbit/s - BPS_50G: 50 Gbit/s Check the
+            Bandwidth enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_bandwidth``.
+        candidate_subnets (Sequence[str]):
+            Up to 16 candidate prefixes that can be used
+            to restrict the allocation of
+            cloudRouterIpAddress and customerRouterIpAddress
+            for this attachment. All prefixes must be within
+            link-local address space (169.254.0.0/16) and
+            must be /29 or shorter (/28, /27, etc). Google
+            will attempt to select an unused /29 from the
+            supplied candidate prefix(es). The request will
+            fail if all possible /29s are in use on Google's
+            edge. If not supplied, Google will randomly
+            select an unused /29 from all of link-local
+            space.
+        cloud_router_ip_address (str):
+            [Output Only] IPv4 address + prefix length to be configured
+            on Cloud Router Interface for this interconnect attachment.
+
+            This field is a member of `oneof`_ ``_cloud_router_ip_address``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        customer_router_ip_address (str):
+            [Output Only] IPv4 address + prefix length to be configured
+            on the customer router subinterface for this interconnect
+            attachment.
+
+            This field is a member of `oneof`_ ``_customer_router_ip_address``.
+        dataplane_version (int):
+            [Output Only] Dataplane version for this
+            InterconnectAttachment.
+
+            This field is a member of `oneof`_ ``_dataplane_version``.
+        description (str):
+            An optional description of this resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        edge_availability_domain (str):
+            Desired availability domain for the attachment. Only
+            available for type PARTNER, at creation time, and can take
+            one of the following values: - AVAILABILITY_DOMAIN_ANY -
+            AVAILABILITY_DOMAIN_1 - AVAILABILITY_DOMAIN_2 For improved
+            reliability, customers should configure a pair of
+            attachments, one per availability domain. The selected
+            availability domain will be provided to the Partner via the
+            pairing key, so that the provisioned circuit will lie in the
+            specified domain. If not specified, the value will default
+            to AVAILABILITY_DOMAIN_ANY. Check the EdgeAvailabilityDomain
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_edge_availability_domain``.
+        encryption (str):
+            Indicates the user-supplied encryption option of this VLAN
+            attachment (interconnectAttachment). Can only be specified
+            at attachment creation for PARTNER or DEDICATED attachments.
+            Possible values are: - NONE - This is the default value,
+            which means that the VLAN attachment carries unencrypted
+            traffic. VMs are able to send traffic to, or receive traffic
+            from, such a VLAN attachment. - IPSEC - The VLAN attachment
+            carries only encrypted traffic that is encrypted by an IPsec
+            device, such as an HA VPN gateway or third-party IPsec VPN.
+            VMs cannot directly send traffic to, or receive traffic
+            from, such a VLAN attachment. To use *IPsec-encrypted Cloud
+            Interconnect*, the VLAN attachment must be created with this
+            option. Not currently available publicly. Check the
+            Encryption enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_encryption``.
+        google_reference_id (str):
+            [Output Only] Google reference ID, to be used when raising
+            support tickets with Google or otherwise to debug backend
+            connectivity issues. [Deprecated] This field is not used.
+
+            This field is a member of `oneof`_ ``_google_reference_id``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        interconnect (str):
+            URL of the underlying Interconnect object
+            that this attachment's traffic will traverse
+            through.
+
+            This field is a member of `oneof`_ ``_interconnect``.
+        ipsec_internal_addresses (Sequence[str]):
+            A list of URLs of addresses that have been
+            reserved for the VLAN attachment. Used only for
+            the VLAN attachment that has the encryption
+            option as IPSEC. The addresses must be regional
+            internal IP address ranges. When creating an HA
+            VPN gateway over the VLAN attachment, if the
+            attachment is configured to use a regional
+            internal IP address, then the VPN gateway's IP
+            address is allocated from the IP address range
+            specified here. For example, if the HA VPN
+            gateway's interface 0 is paired to this VLAN
+            attachment, then a regional internal IP address
+            for the VPN gateway interface 0 will be
+            allocated from the IP address specified for this
+            VLAN attachment. If this field is not specified
+            when creating the VLAN attachment, then later on
+            when creating an HA VPN gateway on this VLAN
+            attachment, the HA VPN gateway's IP address is
+            allocated from the regional external IP address
+            pool. Not currently available publicly.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#interconnectAttachment for interconnect attachments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        mtu (int):
+            Maximum Transmission Unit (MTU), in bytes, of
+            packets passing through this interconnect
+            attachment. Only 1440 and 1500 are allowed. If
+            not specified, the value will default to 1440.
+
+            This field is a member of `oneof`_ ``_mtu``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        operational_status (str):
+            [Output Only] The current status of whether or not this
+            interconnect attachment is functional, which can take one of
+            the following values: - OS_ACTIVE: The attachment has been
+            turned up and is ready to use. - OS_UNPROVISIONED: The
+            attachment is not ready to use yet, because turnup is not
+            complete. Check the OperationalStatus enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_operational_status``.
+        pairing_key (str):
+            [Output only for type PARTNER. Input only for
+            PARTNER_PROVIDER. Not present for DEDICATED]. The opaque
+            identifier of an PARTNER attachment used to initiate
+            provisioning with a selected partner. Of the form
+            "XXXXX/region/domain".
+
+            This field is a member of `oneof`_ ``_pairing_key``.
+        partner_asn (int):
+            Optional BGP ASN for the router supplied by a Layer 3
+            Partner if they configured BGP on behalf of the customer.
+            Output only for PARTNER type, input only for
+            PARTNER_PROVIDER, not available for DEDICATED.
+
+            This field is a member of `oneof`_ ``_partner_asn``.
+        partner_metadata (google.cloud.compute_v1.types.InterconnectAttachmentPartnerMetadata):
+            Informational metadata about Partner attachments from
+            Partners to display to customers. Output only for for
+            PARTNER type, mutable for PARTNER_PROVIDER, not available
+            for DEDICATED.
+
+            This field is a member of `oneof`_ ``_partner_metadata``.
+        private_interconnect_info (google.cloud.compute_v1.types.InterconnectAttachmentPrivateInfo):
+            [Output Only] Information specific to an
+            InterconnectAttachment. This property is populated if the
+            interconnect that this is attached to is of type DEDICATED.
+
+            This field is a member of `oneof`_ ``_private_interconnect_info``.
+        region (str):
+            [Output Only] URL of the region where the regional
+            interconnect attachment resides. You must specify this field
+            as part of the HTTP request URL. It is not settable as a
+            field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        router (str):
+            URL of the Cloud Router to be used for
+            dynamic routing. This router must be in the same
+            region as this InterconnectAttachment. The
+            InterconnectAttachment will automatically
+            connect the Interconnect to the network & region
+            within which the Cloud Router is configured.
+
+            This field is a member of `oneof`_ ``_router``.
+        satisfies_pzs (bool):
+            [Output Only] Set to true if the resource satisfies the zone
+            separation organization policy constraints and false
+            otherwise. Defaults to false if the field is not present.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        state (str):
+            [Output Only] The current state of this attachment's
+            functionality. Enum values ACTIVE and UNPROVISIONED are
+            shared by DEDICATED/PRIVATE, PARTNER, and PARTNER_PROVIDER
+            interconnect attachments, while enum values PENDING_PARTNER,
+            PARTNER_REQUEST_RECEIVED, and PENDING_CUSTOMER are used for
+            only PARTNER and PARTNER_PROVIDER interconnect attachments.
+            This state can take one of the following values: - ACTIVE:
+            The attachment has been turned up and is ready to use. -
+            UNPROVISIONED: The attachment is not ready to use yet,
+            because turnup is not complete. - PENDING_PARTNER: A
+            newly-created PARTNER attachment that has not yet been
+            configured on the Partner side. - PARTNER_REQUEST_RECEIVED:
+            A PARTNER attachment is in the process of provisioning after
+            a PARTNER_PROVIDER attachment was created that references
+            it. - PENDING_CUSTOMER: A PARTNER or PARTNER_PROVIDER
+            attachment that is waiting for a customer to activate it. -
+            DEFUNCT: The attachment was deleted externally and is no
+            longer functional. This could be because the associated
+            Interconnect was removed, or because the other side of a
+            Partner attachment was deleted. Check the State enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+        type_ (str):
+            The type of interconnect attachment this is, which can take
+            one of the following values: - DEDICATED: an attachment to a
+            Dedicated Interconnect. - PARTNER: an attachment to a
+            Partner Interconnect, created by the customer. -
+            PARTNER_PROVIDER: an attachment to a Partner Interconnect,
+            created by the partner. Check the Type enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+        vlan_tag8021q (int):
+            The IEEE 802.1Q VLAN tag for this attachment,
+            in the range 2-4094. Only specified at creation
+            time.
+
+            This field is a member of `oneof`_ ``_vlan_tag8021q``.
+    """
+
+    class Bandwidth(proto.Enum):
+        r"""Provisioned bandwidth capacity for the interconnect attachment. For
+        attachments of type DEDICATED, the user can set the bandwidth. For
+        attachments of type PARTNER, the Google Partner that is operating
+        the interconnect must set the bandwidth. Output only for PARTNER
+        type, mutable for PARTNER_PROVIDER and DEDICATED, and can take one
+        of the following values: - BPS_50M: 50 Mbit/s - BPS_100M: 100 Mbit/s
+        - BPS_200M: 200 Mbit/s - BPS_300M: 300 Mbit/s - BPS_400M: 400 Mbit/s
+        - BPS_500M: 500 Mbit/s - BPS_1G: 1 Gbit/s - BPS_2G: 2 Gbit/s -
+        BPS_5G: 5 Gbit/s - BPS_10G: 10 Gbit/s - BPS_20G: 20 Gbit/s -
+        BPS_50G: 50 Gbit/s
+        """
+        UNDEFINED_BANDWIDTH = 0
+        BPS_100M = 49547958
+        BPS_10G = 278693006
+        BPS_1G = 355358448
+        BPS_200M = 49577749
+        BPS_20G = 278693967
+        BPS_2G = 355358479
+        BPS_300M = 49607540
+        BPS_400M = 49637331
+        BPS_500M = 49667122
+        BPS_50G = 278696850
+        BPS_50M = 278696856
+        BPS_5G = 355358572
+
+    class EdgeAvailabilityDomain(proto.Enum):
+        r"""Desired availability domain for the attachment. Only available for
+        type PARTNER, at creation time, and can take one of the following
+        values: - AVAILABILITY_DOMAIN_ANY - AVAILABILITY_DOMAIN_1 -
+        AVAILABILITY_DOMAIN_2 For improved reliability, customers should
+        configure a pair of attachments, one per availability domain. The
+        selected availability domain will be provided to the Partner via the
+        pairing key, so that the provisioned circuit will lie in the
+        specified domain. If not specified, the value will default to
+        AVAILABILITY_DOMAIN_ANY.
+        """
+        UNDEFINED_EDGE_AVAILABILITY_DOMAIN = 0
+        AVAILABILITY_DOMAIN_1 = 349552090
+        AVAILABILITY_DOMAIN_2 = 349552091
+        AVAILABILITY_DOMAIN_ANY = 375256373
+
+    class Encryption(proto.Enum):
+        r"""Indicates the user-supplied encryption option of this VLAN
+        attachment (interconnectAttachment). Can only be specified at
+        attachment creation for PARTNER or DEDICATED attachments. Possible
+        values are: - NONE - This is the default value, which means that the
+        VLAN attachment carries unencrypted traffic. VMs are able to send
+        traffic to, or receive traffic from, such a VLAN attachment. - IPSEC
+        - The VLAN attachment carries only encrypted traffic that is
+        encrypted by an IPsec device, such as an HA VPN gateway or
+        third-party IPsec VPN. VMs cannot directly send traffic to, or
+        receive traffic from, such a VLAN attachment. To use
+        *IPsec-encrypted Cloud Interconnect*, the VLAN attachment must be
+        created with this option. Not currently available publicly.
+        """
+        UNDEFINED_ENCRYPTION = 0
+        IPSEC = 69882282
+        NONE = 2402104
+
+    class OperationalStatus(proto.Enum):
+        r"""[Output Only] The current status of whether or not this interconnect
+        attachment is functional, which can take one of the following
+        values: - OS_ACTIVE: The attachment has been turned up and is ready
+        to use. - OS_UNPROVISIONED: The attachment is not ready to use yet,
+        because turnup is not complete.
+        """
+        UNDEFINED_OPERATIONAL_STATUS = 0
+        OS_ACTIVE = 55721409
+        OS_UNPROVISIONED = 239771840
+
+    class State(proto.Enum):
+        r"""[Output Only] The current state of this attachment's functionality.
+        Enum values ACTIVE and UNPROVISIONED are shared by
+        DEDICATED/PRIVATE, PARTNER, and PARTNER_PROVIDER interconnect
+        attachments, while enum values PENDING_PARTNER,
+        PARTNER_REQUEST_RECEIVED, and PENDING_CUSTOMER are used for only
+        PARTNER and PARTNER_PROVIDER interconnect attachments. This state
+        can take one of the following values: - ACTIVE: The attachment has
+        been turned up and is ready to use. - UNPROVISIONED: The attachment
+        is not ready to use yet, because turnup is not complete. -
+        PENDING_PARTNER: A newly-created PARTNER attachment that has not yet
+        been configured on the Partner side. - PARTNER_REQUEST_RECEIVED: A
+        PARTNER attachment is in the process of provisioning after a
+        PARTNER_PROVIDER attachment was created that references it. -
+        PENDING_CUSTOMER: A PARTNER or PARTNER_PROVIDER attachment that is
+        waiting for a customer to activate it. - DEFUNCT: The attachment was
+        deleted externally and is no longer functional. This could be
+        because the associated Interconnect was removed, or because the
+        other side of a Partner attachment was deleted.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        DEFUNCT = 115891759
+        PARTNER_REQUEST_RECEIVED = 513587304
+        PENDING_CUSTOMER = 167494054
+        PENDING_PARTNER = 387890656
+        STATE_UNSPECIFIED = 470755401
+        UNPROVISIONED = 517333979
+
+    class Type(proto.Enum):
+        r"""The type of interconnect attachment this is, which can take one of
+        the following values: - DEDICATED: an attachment to a Dedicated
+        Interconnect. - PARTNER: an attachment to a Partner Interconnect,
+        created by the customer. - PARTNER_PROVIDER: an attachment to a
+        Partner Interconnect, created by the partner.
+        """
+        UNDEFINED_TYPE = 0
+        DEDICATED = 258411983
+        PARTNER = 461924520
+        PARTNER_PROVIDER = 483261352
+
+    admin_enabled = proto.Field(proto.BOOL, number=445675089, optional=True,)
+    bandwidth = proto.Field(proto.STRING, number=181715121, optional=True,)
+    candidate_subnets = proto.RepeatedField(proto.STRING, number=237842938,)
+    cloud_router_ip_address = proto.Field(
+        proto.STRING, number=287392776, optional=True,
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    customer_router_ip_address = proto.Field(
+        proto.STRING, number=332475761, optional=True,
+    )
+    dataplane_version = proto.Field(proto.INT32, number=34920075, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    edge_availability_domain = proto.Field(
+        proto.STRING, number=71289510, optional=True,
+    )
+    encryption = proto.Field(proto.STRING, number=97980291, optional=True,)
+    google_reference_id = proto.Field(proto.STRING, number=534944469, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    interconnect = proto.Field(proto.STRING, number=224601230, optional=True,)
+    ipsec_internal_addresses = proto.RepeatedField(proto.STRING, number=407648565,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    mtu = proto.Field(proto.INT32, number=108462, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    operational_status = proto.Field(proto.STRING, number=201070847, optional=True,)
+    pairing_key = proto.Field(proto.STRING, number=439695464, optional=True,)
+    partner_asn = proto.Field(proto.INT64, number=438166149, optional=True,)
+    partner_metadata = proto.Field(
+        proto.MESSAGE,
+        number=65908934,
+        optional=True,
+        message="InterconnectAttachmentPartnerMetadata",
+    )
+    private_interconnect_info = proto.Field(
+        proto.MESSAGE,
+        number=237270531,
+        optional=True,
+        message="InterconnectAttachmentPrivateInfo",
+    )
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    router = proto.Field(proto.STRING, number=148608841, optional=True,)
+    satisfies_pzs = proto.Field(proto.BOOL, number=480964267, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    state = proto.Field(proto.STRING, number=109757585, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+    vlan_tag8021q = proto.Field(proto.INT32, number=119927836, optional=True,)
+
+
+class InterconnectAttachmentAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.InterconnectAttachmentAggregatedList.ItemsEntry]):
+            A list of InterconnectAttachmentsScopedList
+            resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#interconnectAttachmentAggregatedList for aggregated
+            lists of interconnect attachments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="InterconnectAttachmentsScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class InterconnectAttachmentList(proto.Message):
+    r"""Response to the list request, and contains a list of
+    interconnect attachments.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.InterconnectAttachment]):
+            A list of InterconnectAttachment resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#interconnectAttachmentList for lists of interconnect
+            attachments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="InterconnectAttachment",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class InterconnectAttachmentPartnerMetadata(proto.Message):
+    r"""Informational metadata about Partner attachments from Partners to
+    display to customers. These fields are propagated from
+    PARTNER_PROVIDER attachments to their corresponding PARTNER
+    attachments.
+
+    Attributes:
+        interconnect_name (str):
+            Plain text name of the Interconnect this
+            attachment is connected to, as displayed in the
+            Partner's portal. For instance "Chicago 1". This
+            value may be validated to match approved Partner
+            values.
+
+            This field is a member of `oneof`_ ``_interconnect_name``.
+        partner_name (str):
+            Plain text name of the Partner providing this
+            attachment. This value may be validated to match
+            approved Partner values.
+
+            This field is a member of `oneof`_ ``_partner_name``.
+        portal_url (str):
+            URL of the Partner's portal for this
+            Attachment. Partners may customise this to be a
+            deep link to the specific resource on the
+            Partner portal. This value may be validated to
+            match approved Partner values.
+
+            This field is a member of `oneof`_ ``_portal_url``.
+    """
+
+    interconnect_name = proto.Field(proto.STRING, number=514963356, optional=True,)
+    partner_name = proto.Field(proto.STRING, number=161747874, optional=True,)
+    portal_url = proto.Field(proto.STRING, number=269182748, optional=True,)
+
+
+class InterconnectAttachmentPrivateInfo(proto.Message):
+    r"""Information for an interconnect attachment when this belongs
+    to an interconnect of type DEDICATED.
+
+    Attributes:
+        tag8021q (int):
+            [Output Only] 802.1q encapsulation tag to be used for
+            traffic between Google and the customer, going to and from
+            this network and region.
+
+            This field is a member of `oneof`_ ``_tag8021q``.
+    """
+
+    tag8021q = proto.Field(proto.UINT32, number=271820992, optional=True,)
+
+
+class InterconnectAttachmentsScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        interconnect_attachments (Sequence[google.cloud.compute_v1.types.InterconnectAttachment]):
+            A list of interconnect attachments contained
+            in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of addresses when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    interconnect_attachments = proto.RepeatedField(
+        proto.MESSAGE, number=425388415, message="InterconnectAttachment",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ListInterconnectAttachmentsRequest(proto.Message):
+    r"""A request message for InterconnectAttachments.List. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchInterconnectAttachmentRequest(proto.Message):
+    r"""A request message for InterconnectAttachments.Patch. See the
+    method description for details.
+
+    Attributes:
+        interconnect_attachment (str):
+            Name of the interconnect attachment to patch.
+        interconnect_attachment_resource (google.cloud.compute_v1.types.InterconnectAttachment):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    interconnect_attachment = proto.Field(proto.STRING, number=308135284,)
+    interconnect_attachment_resource = proto.Field(
+        proto.MESSAGE, number=212341369, message="InterconnectAttachment",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,361 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the interconnect_locations service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GetInterconnectLocationRequest",
+        "InterconnectLocation",
+        "InterconnectLocationList",
+        "InterconnectLocationRegionInfo",
+        "ListInterconnectLocationsRequest",
+    },
+)
+
+
+class GetInterconnectLocationRequest(proto.Message):
+    r"""A request message for InterconnectLocations.Get. See the
+    method description for details.
+
+    Attributes:
+        interconnect_location (str):
+            Name of the interconnect location to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    interconnect_location = proto.Field(proto.STRING, number=492235846,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class InterconnectLocation(proto.Message):
+    r"""Represents an Interconnect Attachment (VLAN) Location
+    resource. You can use this resource to find location details
+    about an Interconnect attachment (VLAN). For more information
+    about interconnect attachments, read Creating VLAN Attachments.
+
+    Attributes:
+        address (str):
+            [Output Only] The postal address of the Point of Presence,
+            each line in the address is separated by a newline
+            character.
+
+            This field is a member of `oneof`_ ``_address``.
+        availability_zone (str):
+            [Output Only] Availability zone for this
+            InterconnectLocation. Within a metropolitan area (metro),
+            maintenance will not be simultaneously scheduled in more
+            than one availability zone. Example: "zone1" or "zone2".
+
+            This field is a member of `oneof`_ ``_availability_zone``.
+        city (str):
+            [Output Only] Metropolitan area designator that indicates
+            which city an interconnect is located. For example:
+            "Chicago, IL", "Amsterdam, Netherlands".
+
+            This field is a member of `oneof`_ ``_city``.
+        continent (str):
+            [Output Only] Continent for this location, which can take
+            one of the following values: - AFRICA - ASIA_PAC - EUROPE -
+            NORTH_AMERICA - SOUTH_AMERICA Check the Continent enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_continent``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            [Output Only] An optional description of the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        facility_provider (str):
+            [Output Only] The name of the provider for this facility
+            (e.g., EQUINIX).
+
+            This field is a member of `oneof`_ ``_facility_provider``.
+        facility_provider_facility_id (str):
+            [Output Only] A provider-assigned Identifier for this
+            facility (e.g., Ashburn-DC1).
+
+            This field is a member of `oneof`_ ``_facility_provider_facility_id``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#interconnectLocation for interconnect locations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] Name of the resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        peeringdb_facility_id (str):
+            [Output Only] The peeringdb identifier for this facility
+            (corresponding with a netfac type in peeringdb).
+
+            This field is a member of `oneof`_ ``_peeringdb_facility_id``.
+        region_infos (Sequence[google.cloud.compute_v1.types.InterconnectLocationRegionInfo]):
+            [Output Only] A list of InterconnectLocation.RegionInfo
+            objects, that describe parameters pertaining to the relation
+            between this InterconnectLocation and various Google Cloud
+            regions.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of this InterconnectLocation, which
+            can take one of the following values: - CLOSED: The
+            InterconnectLocation is closed and is unavailable for
+            provisioning new Interconnects. - AVAILABLE: The
+            InterconnectLocation is available for provisioning new
+            Interconnects. Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        supports_pzs (bool):
+            [Output Only] Set to true for locations that support
+            physical zone separation. Defaults to false if the field is
+            not present.
+
+            This field is a member of `oneof`_ ``_supports_pzs``.
+    """
+
+    class Continent(proto.Enum):
+        r"""[Output Only] Continent for this location, which can take one of the
+        following values: - AFRICA - ASIA_PAC - EUROPE - NORTH_AMERICA -
+        SOUTH_AMERICA
+        """
+        UNDEFINED_CONTINENT = 0
+        AFRICA = 317443706
+        ASIA_PAC = 119782269
+        C_AFRICA = 71993846
+        C_ASIA_PAC = 465668089
+        C_EUROPE = 200369438
+        C_NORTH_AMERICA = 275697048
+        C_SOUTH_AMERICA = 397149792
+        EUROPE = 445819298
+        NORTH_AMERICA = 448015508
+        SOUTH_AMERICA = 32597340
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of this InterconnectLocation, which can
+        take one of the following values: - CLOSED: The InterconnectLocation
+        is closed and is unavailable for provisioning new Interconnects. -
+        AVAILABLE: The InterconnectLocation is available for provisioning
+        new Interconnects.
+        """
+        UNDEFINED_STATUS = 0
+        AVAILABLE = 442079913
+        CLOSED = 380163436
+
+    address = proto.Field(proto.STRING, number=462920692, optional=True,)
+    availability_zone = proto.Field(proto.STRING, number=158459920, optional=True,)
+    city = proto.Field(proto.STRING, number=3053931, optional=True,)
+    continent = proto.Field(proto.STRING, number=133442996, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    facility_provider = proto.Field(proto.STRING, number=533303309, optional=True,)
+    facility_provider_facility_id = proto.Field(
+        proto.STRING, number=87269125, optional=True,
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    peeringdb_facility_id = proto.Field(proto.STRING, number=536567094, optional=True,)
+    region_infos = proto.RepeatedField(
+        proto.MESSAGE, number=312194170, message="InterconnectLocationRegionInfo",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    supports_pzs = proto.Field(proto.BOOL, number=83983214, optional=True,)
+
+
+class InterconnectLocationList(proto.Message):
+    r"""Response to the list request, and contains a list of
+    interconnect locations.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.InterconnectLocation]):
+            A list of InterconnectLocation resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#interconnectLocationList for lists of interconnect
+            locations.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="InterconnectLocation",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class InterconnectLocationRegionInfo(proto.Message):
+    r"""Information about any potential InterconnectAttachments
+    between an Interconnect at a specific InterconnectLocation, and
+    a specific Cloud Region.
+
+    Attributes:
+        expected_rtt_ms (int):
+            Expected round-trip time in milliseconds,
+            from this InterconnectLocation to a VM in this
+            region.
+
+            This field is a member of `oneof`_ ``_expected_rtt_ms``.
+        location_presence (str):
+            Identifies the network presence of this
+            location. Check the LocationPresence enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_location_presence``.
+        region (str):
+            URL for the region of this location.
+
+            This field is a member of `oneof`_ ``_region``.
+    """
+
+    class LocationPresence(proto.Enum):
+        r"""Identifies the network presence of this location."""
+        UNDEFINED_LOCATION_PRESENCE = 0
+        GLOBAL = 494663587
+        LOCAL_REGION = 403535464
+        LP_GLOBAL = 429584062
+        LP_LOCAL_REGION = 488598851
+
+    expected_rtt_ms = proto.Field(proto.INT64, number=422543866, optional=True,)
+    location_presence = proto.Field(proto.STRING, number=101517893, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+
+
+class ListInterconnectLocationsRequest(proto.Message):
+    r"""A request message for InterconnectLocations.List. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the license_codes service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_04
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GetLicenseCodeRequest",
+        "LicenseCode",
+        "LicenseCodeLicenseAlias",
+        "TestIamPermissionsLicenseCodeRequest",
+    },
+)
+
+
+class GetLicenseCodeRequest(proto.Message):
+    r"""A request message for LicenseCodes.Get. See the method
+    description for details.
+
+    Attributes:
+        license_code (str):
+            Number corresponding to the License code
+            resource to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    license_code = proto.Field(proto.STRING, number=1467179,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class LicenseCode(proto.Message):
+    r"""Represents a License Code resource. A License Code is a unique
+    identifier used to represent a license resource. *Caution* This
+    resource is intended for use only by third-party partners who are
+    creating Cloud Marketplace images.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            [Output Only] Description of this License Code.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always compute#licenseCode
+            for licenses.
+
+            This field is a member of `oneof`_ ``_kind``.
+        license_alias (Sequence[google.cloud.compute_v1.types.LicenseCodeLicenseAlias]):
+            [Output Only] URL and description aliases of Licenses with
+            the same License Code.
+        name (str):
+            [Output Only] Name of the resource. The name is 1-20
+            characters long and must be a valid 64 bit integer.
+
+            This field is a member of `oneof`_ ``_name``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        state (str):
+            [Output Only] Current state of this License Code. Check the
+            State enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+        transferable (bool):
+            [Output Only] If true, the license will remain attached when
+            creating images or snapshots from disks. Otherwise, the
+            license is not transferred.
+
+            This field is a member of `oneof`_ ``_transferable``.
+    """
+
+    class State(proto.Enum):
+        r"""[Output Only] Current state of this License Code."""
+        UNDEFINED_STATE = 0
+        DISABLED = 516696700
+        ENABLED = 182130465
+        RESTRICTED = 261551195
+        STATE_UNSPECIFIED = 470755401
+        TERMINATED = 250018339
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    license_alias = proto.RepeatedField(
+        proto.MESSAGE, number=43550930, message="LicenseCodeLicenseAlias",
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    state = proto.Field(proto.STRING, number=109757585, optional=True,)
+    transferable = proto.Field(proto.BOOL, number=4349893, optional=True,)
+
+
+class LicenseCodeLicenseAlias(proto.Message):
+    r"""
+
+    Attributes:
+        description (str):
+            [Output Only] Description of this License Code.
+
+            This field is a member of `oneof`_ ``_description``.
+        self_link (str):
+            [Output Only] URL of license corresponding to this License
+            Code.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+
+
+class TestIamPermissionsLicenseCodeRequest(proto.Message):
+    r"""A request message for LicenseCodes.TestIamPermissions. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the licenses service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_19
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteLicenseRequest",
+        "GetIamPolicyLicenseRequest",
+        "GetLicenseRequest",
+        "InsertLicenseRequest",
+        "License",
+        "LicenseResourceRequirements",
+        "LicensesListResponse",
+        "ListLicensesRequest",
+        "SetIamPolicyLicenseRequest",
+        "TestIamPermissionsLicenseRequest",
+    },
+)
+
+
+class DeleteLicenseRequest(proto.Message):
+    r"""A request message for Licenses.Delete. See the method
+    description for details.
+
+    Attributes:
+        license_ (str):
+            Name of the license resource to delete.
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    license_ = proto.Field(proto.STRING, number=166757441,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetIamPolicyLicenseRequest(proto.Message):
+    r"""A request message for Licenses.GetIamPolicy. See the method
+    description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetLicenseRequest(proto.Message):
+    r"""A request message for Licenses.Get. See the method
+    description for details.
+
+    Attributes:
+        license_ (str):
+            Name of the License resource to return.
+        project (str):
+            Project ID for this request.
+    """
+
+    license_ = proto.Field(proto.STRING, number=166757441,)
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class InsertLicenseRequest(proto.Message):
+    r"""A request message for Licenses.Insert. See the method
+    description for details.
+
+    Attributes:
+        license_resource (google.cloud.compute_v1.types.License):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    license_resource = proto.Field(proto.MESSAGE, number=437955148, message="License",)
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class License(proto.Message):
+    r"""Represents a License resource. A License represents billing and
+    aggregate usage data for public and marketplace images. *Caution*
+    This resource is intended for use only by third-party partners who
+    are creating Cloud Marketplace images.
+
+    Attributes:
+        charges_use_fee (bool):
+            [Output Only] Deprecated. This field no longer reflects
+            whether a license charges a usage fee.
+
+            This field is a member of `oneof`_ ``_charges_use_fee``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional textual description of the
+            resource; provided by the client when the
+            resource is created.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always compute#license for
+            licenses.
+
+            This field is a member of `oneof`_ ``_kind``.
+        license_code (int):
+            [Output Only] The unique code used to attach this license to
+            images, snapshots, and disks.
+
+            This field is a member of `oneof`_ ``_license_code``.
+        name (str):
+            Name of the resource. The name must be 1-63
+            characters long and comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        resource_requirements (google.cloud.compute_v1.types.LicenseResourceRequirements):
+
+            This field is a member of `oneof`_ ``_resource_requirements``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        transferable (bool):
+            If false, licenses will not be copied from
+            the source resource when creating an image from
+            a disk, disk from snapshot, or snapshot from
+            disk.
+
+            This field is a member of `oneof`_ ``_transferable``.
+    """
+
+    charges_use_fee = proto.Field(proto.BOOL, number=372412622, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    license_code = proto.Field(proto.UINT64, number=1467179, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    resource_requirements = proto.Field(
+        proto.MESSAGE,
+        number=214292769,
+        optional=True,
+        message="LicenseResourceRequirements",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    transferable = proto.Field(proto.BOOL, number=4349893, optional=True,)
+
+
+class LicenseResourceRequirements(proto.Message):
+    r"""
+
+    Attributes:
+        min_guest_cpu_count (int):
+            Minimum number of guest cpus required to use
+            the Instance. Enforced at Instance creation and
+            Instance start.
+
+            This field is a member of `oneof`_ ``_min_guest_cpu_count``.
+        min_memory_mb (int):
+            Minimum memory required to use the Instance.
+            Enforced at Instance creation and Instance
+            start.
+
+            This field is a member of `oneof`_ ``_min_memory_mb``.
+    """
+
+    min_guest_cpu_count = proto.Field(proto.INT32, number=477964836, optional=True,)
+    min_memory_mb = proto.Field(proto.INT32, number=504785894, optional=True,)
+
+
+class LicensesListResponse(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.License]):
+            A list of License resources.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="License",)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ListLicensesRequest(proto.Message):
+    r"""A request message for Licenses.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class SetIamPolicyLicenseRequest(proto.Message):
+    r"""A request message for Licenses.SetIamPolicy. See the method
+    description for details.
+
+    Attributes:
+        global_set_policy_request_resource (google.cloud.compute_v1.types.GlobalSetPolicyRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    global_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=337048498, message=shared_19.GlobalSetPolicyRequest,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class TestIamPermissionsLicenseRequest(proto.Message):
+    r"""A request message for Licenses.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,494 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the machine_types service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_07
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "Accelerators",
+        "AggregatedListMachineTypesRequest",
+        "GetMachineTypeRequest",
+        "ListMachineTypesRequest",
+        "MachineType",
+        "MachineTypeAggregatedList",
+        "MachineTypeList",
+        "MachineTypesScopedList",
+        "ScratchDisks",
+    },
+)
+
+
+class Accelerators(proto.Message):
+    r"""
+
+    Attributes:
+        guest_accelerator_count (int):
+            Number of accelerator cards exposed to the
+            guest.
+
+            This field is a member of `oneof`_ ``_guest_accelerator_count``.
+        guest_accelerator_type (str):
+            The accelerator type resource name, not a
+            full URL, e.g. 'nvidia-tesla-k80'.
+
+            This field is a member of `oneof`_ ``_guest_accelerator_type``.
+    """
+
+    guest_accelerator_count = proto.Field(proto.INT32, number=479079316, optional=True,)
+    guest_accelerator_type = proto.Field(proto.STRING, number=293064725, optional=True,)
+
+
+class AggregatedListMachineTypesRequest(proto.Message):
+    r"""A request message for MachineTypes.AggregatedList. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class GetMachineTypeRequest(proto.Message):
+    r"""A request message for MachineTypes.Get. See the method
+    description for details.
+
+    Attributes:
+        machine_type (str):
+            Name of the machine type to return.
+        project (str):
+            Project ID for this request.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    machine_type = proto.Field(proto.STRING, number=227711026,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class ListMachineTypesRequest(proto.Message):
+    r"""A request message for MachineTypes.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        zone (str):
+            The name of the zone for this request.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684,)
+
+
+class MachineType(proto.Message):
+    r"""Represents a Machine Type resource. You can use specific
+    machine types for your VM instances based on performance and
+    pricing requirements. For more information, read Machine Types.
+
+    Attributes:
+        accelerators (Sequence[google.cloud.compute_v1.types.Accelerators]):
+            [Output Only] A list of accelerator configurations assigned
+            to this machine type.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        deprecated (google.cloud.compute_v1.types.DeprecationStatus):
+            [Output Only] The deprecation status associated with this
+            machine type. Only applicable if the machine type is
+            unavailable.
+
+            This field is a member of `oneof`_ ``_deprecated``.
+        description (str):
+            [Output Only] An optional textual description of the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        guest_cpus (int):
+            [Output Only] The number of virtual CPUs that are available
+            to the instance.
+
+            This field is a member of `oneof`_ ``_guest_cpus``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        image_space_gb (int):
+            [Deprecated] This property is deprecated and will never be
+            populated with any relevant values.
+
+            This field is a member of `oneof`_ ``_image_space_gb``.
+        is_shared_cpu (bool):
+            [Output Only] Whether this machine type has a shared CPU.
+            See Shared-core machine types for more information.
+
+            This field is a member of `oneof`_ ``_is_shared_cpu``.
+        kind (str):
+            [Output Only] The type of the resource. Always
+            compute#machineType for machine types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        maximum_persistent_disks (int):
+            [Output Only] Maximum persistent disks allowed.
+
+            This field is a member of `oneof`_ ``_maximum_persistent_disks``.
+        maximum_persistent_disks_size_gb (int):
+            [Output Only] Maximum total persistent disks size (GB)
+            allowed.
+
+            This field is a member of `oneof`_ ``_maximum_persistent_disks_size_gb``.
+        memory_mb (int):
+            [Output Only] The amount of physical memory available to the
+            instance, defined in MB.
+
+            This field is a member of `oneof`_ ``_memory_mb``.
+        name (str):
+            [Output Only] Name of the resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        scratch_disks (Sequence[google.cloud.compute_v1.types.ScratchDisks]):
+            [Output Only] A list of extended scratch disks assigned to
+            the instance.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        zone (str):
+            [Output Only] The name of the zone where the machine type
+            resides, such as us-central1-a.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    accelerators = proto.RepeatedField(
+        proto.MESSAGE, number=269577064, message="Accelerators",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    deprecated = proto.Field(
+        proto.MESSAGE,
+        number=515138995,
+        optional=True,
+        message=shared_07.DeprecationStatus,
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    guest_cpus = proto.Field(proto.INT32, number=393356754, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    image_space_gb = proto.Field(proto.INT32, number=75331864, optional=True,)
+    is_shared_cpu = proto.Field(proto.BOOL, number=521399555, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    maximum_persistent_disks = proto.Field(
+        proto.INT32, number=496220941, optional=True,
+    )
+    maximum_persistent_disks_size_gb = proto.Field(
+        proto.INT64, number=154274471, optional=True,
+    )
+    memory_mb = proto.Field(proto.INT32, number=116001171, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    scratch_disks = proto.RepeatedField(
+        proto.MESSAGE, number=480778481, message="ScratchDisks",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684, optional=True,)
+
+
+class MachineTypeAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.MachineTypeAggregatedList.ItemsEntry]):
+            A list of MachineTypesScopedList resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#machineTypeAggregatedList for aggregated lists of
+            machine types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=100526016, message="MachineTypesScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class MachineTypeList(proto.Message):
+    r"""Contains a list of machine types.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.MachineType]):
+            A list of MachineType resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#machineTypeList for lists of machine types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="MachineType",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class MachineTypesScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        machine_types (Sequence[google.cloud.compute_v1.types.MachineType]):
+            [Output Only] A list of machine types contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] An informational warning that appears when the
+            machine types list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    machine_types = proto.RepeatedField(
+        proto.MESSAGE, number=79720065, message="MachineType",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ScratchDisks(proto.Message):
+    r"""
+
+    Attributes:
+        disk_gb (int):
+            Size of the scratch disk, defined in GB.
+
+            This field is a member of `oneof`_ ``_disk_gb``.
+    """
+
+    disk_gb = proto.Field(proto.INT32, number=60990141, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
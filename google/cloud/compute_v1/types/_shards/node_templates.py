@@ -0,0 +1,668 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the node_templates service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_10
+from google.cloud.compute_v1.types._shards import shared_13
+from google.cloud.compute_v1.types._shards import shared_47
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListNodeTemplatesRequest",
+        "DeleteNodeTemplateRequest",
+        "GetIamPolicyNodeTemplateRequest",
+        "GetNodeTemplateRequest",
+        "InsertNodeTemplateRequest",
+        "ListNodeTemplatesRequest",
+        "NodeTemplate",
+        "NodeTemplateAggregatedList",
+        "NodeTemplateList",
+        "NodeTemplateNodeTypeFlexibility",
+        "NodeTemplatesScopedList",
+        "SetIamPolicyNodeTemplateRequest",
+        "TestIamPermissionsNodeTemplateRequest",
+    },
+)
+
+
+class AggregatedListNodeTemplatesRequest(proto.Message):
+    r"""A request message for NodeTemplates.AggregatedList. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeleteNodeTemplateRequest(proto.Message):
+    r"""A request message for NodeTemplates.Delete. See the method
+    description for details.
+
+    Attributes:
+        node_template (str):
+            Name of the NodeTemplate resource to delete.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    node_template = proto.Field(proto.STRING, number=323154455,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetIamPolicyNodeTemplateRequest(proto.Message):
+    r"""A request message for NodeTemplates.GetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetNodeTemplateRequest(proto.Message):
+    r"""A request message for NodeTemplates.Get. See the method
+    description for details.
+
+    Attributes:
+        node_template (str):
+            Name of the node template to return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+    """
+
+    node_template = proto.Field(proto.STRING, number=323154455,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class InsertNodeTemplateRequest(proto.Message):
+    r"""A request message for NodeTemplates.Insert. See the method
+    description for details.
+
+    Attributes:
+        node_template_resource (google.cloud.compute_v1.types.NodeTemplate):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    node_template_resource = proto.Field(
+        proto.MESSAGE, number=127364406, message="NodeTemplate",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListNodeTemplatesRequest(proto.Message):
+    r"""A request message for NodeTemplates.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class NodeTemplate(proto.Message):
+    r"""Represent a sole-tenant Node Template resource. You can use a
+    template to define properties for nodes in a node group. For
+    more information, read Creating node groups and instances.
+
+    Attributes:
+        accelerators (Sequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+
+        cpu_overcommit_type (str):
+            CPU overcommit.
+            Check the CpuOvercommitType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_cpu_overcommit_type``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        disks (Sequence[google.cloud.compute_v1.types.LocalDisk]):
+
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] The type of the resource. Always
+            compute#nodeTemplate for node templates.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The resource name must be
+            1-63 characters long, and comply with RFC1035. Specifically,
+            the name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        node_affinity_labels (Sequence[google.cloud.compute_v1.types.NodeTemplate.NodeAffinityLabelsEntry]):
+            Labels to use for node affinity, which will
+            be used in instance scheduling.
+        node_type (str):
+            The node type to use for nodes group that are
+            created from this template.
+
+            This field is a member of `oneof`_ ``_node_type``.
+        node_type_flexibility (google.cloud.compute_v1.types.NodeTemplateNodeTypeFlexibility):
+            The flexible properties of the desired node type. Node
+            groups that use this node template will create nodes of a
+            type that matches these properties. This field is mutually
+            exclusive with the node_type property; you can only define
+            one or the other, but not both.
+
+            This field is a member of `oneof`_ ``_node_type_flexibility``.
+        region (str):
+            [Output Only] The name of the region where the node template
+            resides, such as us-central1.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        server_binding (google.cloud.compute_v1.types.ServerBinding):
+            Sets the binding properties for the physical server. Valid
+            values include: - *[Default]* RESTART_NODE_ON_ANY_SERVER:
+            Restarts VMs on any available physical server -
+            RESTART_NODE_ON_MINIMAL_SERVER: Restarts VMs on the same
+            physical server whenever possible See Sole-tenant node
+            options for more information.
+
+            This field is a member of `oneof`_ ``_server_binding``.
+        status (str):
+            [Output Only] The status of the node template. One of the
+            following values: CREATING, READY, and DELETING. Check the
+            Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_message (str):
+            [Output Only] An optional, human-readable explanation of the
+            status.
+
+            This field is a member of `oneof`_ ``_status_message``.
+    """
+
+    class CpuOvercommitType(proto.Enum):
+        r"""CPU overcommit."""
+        UNDEFINED_CPU_OVERCOMMIT_TYPE = 0
+        CPU_OVERCOMMIT_TYPE_UNSPECIFIED = 520665615
+        ENABLED = 182130465
+        NONE = 2402104
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the node template. One of the following
+        values: CREATING, READY, and DELETING.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        INVALID = 530283991
+        READY = 77848963
+
+    accelerators = proto.RepeatedField(
+        proto.MESSAGE, number=269577064, message=shared_10.AcceleratorConfig,
+    )
+    cpu_overcommit_type = proto.Field(proto.STRING, number=247727959, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    disks = proto.RepeatedField(
+        proto.MESSAGE, number=95594102, message=shared_47.LocalDisk,
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    node_affinity_labels = proto.MapField(proto.STRING, proto.STRING, number=339007161,)
+    node_type = proto.Field(proto.STRING, number=465832791, optional=True,)
+    node_type_flexibility = proto.Field(
+        proto.MESSAGE,
+        number=315257905,
+        optional=True,
+        message="NodeTemplateNodeTypeFlexibility",
+    )
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    server_binding = proto.Field(
+        proto.MESSAGE, number=208179593, optional=True, message=shared_47.ServerBinding,
+    )
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    status_message = proto.Field(proto.STRING, number=297428154, optional=True,)
+
+
+class NodeTemplateAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.NodeTemplateAggregatedList.ItemsEntry]):
+            A list of NodeTemplatesScopedList resources.
+        kind (str):
+            [Output Only] Type of resource.Always
+            compute#nodeTemplateAggregatedList for aggregated lists of
+            node templates.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="NodeTemplatesScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class NodeTemplateList(proto.Message):
+    r"""Contains a list of node templates.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.NodeTemplate]):
+            A list of NodeTemplate resources.
+        kind (str):
+            [Output Only] Type of resource.Always
+            compute#nodeTemplateList for lists of node templates.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="NodeTemplate",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class NodeTemplateNodeTypeFlexibility(proto.Message):
+    r"""
+
+    Attributes:
+        cpus (str):
+
+            This field is a member of `oneof`_ ``_cpus``.
+        local_ssd (str):
+
+            This field is a member of `oneof`_ ``_local_ssd``.
+        memory (str):
+
+            This field is a member of `oneof`_ ``_memory``.
+    """
+
+    cpus = proto.Field(proto.STRING, number=3060683, optional=True,)
+    local_ssd = proto.Field(proto.STRING, number=405741360, optional=True,)
+    memory = proto.Field(proto.STRING, number=532856065, optional=True,)
+
+
+class NodeTemplatesScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        node_templates (Sequence[google.cloud.compute_v1.types.NodeTemplate]):
+            [Output Only] A list of node templates contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] An informational warning that appears when the
+            node templates list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    node_templates = proto.RepeatedField(
+        proto.MESSAGE, number=354111804, message="NodeTemplate",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SetIamPolicyNodeTemplateRequest(proto.Message):
+    r"""A request message for NodeTemplates.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_set_policy_request_resource (google.cloud.compute_v1.types.RegionSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=276489091, message=shared_13.RegionSetPolicyRequest,
+    )
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class TestIamPermissionsNodeTemplateRequest(proto.Message):
+    r"""A request message for NodeTemplates.TestIamPermissions. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
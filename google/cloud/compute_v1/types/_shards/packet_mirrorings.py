@@ -0,0 +1,804 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the packet_mirrorings service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListPacketMirroringsRequest",
+        "DeletePacketMirroringRequest",
+        "GetPacketMirroringRequest",
+        "InsertPacketMirroringRequest",
+        "ListPacketMirroringsRequest",
+        "PacketMirroring",
+        "PacketMirroringAggregatedList",
+        "PacketMirroringFilter",
+        "PacketMirroringForwardingRuleInfo",
+        "PacketMirroringList",
+        "PacketMirroringMirroredResourceInfo",
+        "PacketMirroringMirroredResourceInfoInstanceInfo",
+        "PacketMirroringMirroredResourceInfoSubnetInfo",
+        "PacketMirroringNetworkInfo",
+        "PacketMirroringsScopedList",
+        "PatchPacketMirroringRequest",
+        "TestIamPermissionsPacketMirroringRequest",
+    },
+)
+
+
+class AggregatedListPacketMirroringsRequest(proto.Message):
+    r"""A request message for PacketMirrorings.AggregatedList. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeletePacketMirroringRequest(proto.Message):
+    r"""A request message for PacketMirrorings.Delete. See the method
+    description for details.
+
+    Attributes:
+        packet_mirroring (str):
+            Name of the PacketMirroring resource to
+            delete.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    packet_mirroring = proto.Field(proto.STRING, number=22305996,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetPacketMirroringRequest(proto.Message):
+    r"""A request message for PacketMirrorings.Get. See the method
+    description for details.
+
+    Attributes:
+        packet_mirroring (str):
+            Name of the PacketMirroring resource to
+            return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+    """
+
+    packet_mirroring = proto.Field(proto.STRING, number=22305996,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class InsertPacketMirroringRequest(proto.Message):
+    r"""A request message for PacketMirrorings.Insert. See the method
+    description for details.
+
+    Attributes:
+        packet_mirroring_resource (google.cloud.compute_v1.types.PacketMirroring):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    packet_mirroring_resource = proto.Field(
+        proto.MESSAGE, number=493501985, message="PacketMirroring",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListPacketMirroringsRequest(proto.Message):
+    r"""A request message for PacketMirrorings.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PacketMirroring(proto.Message):
+    r"""Represents a Packet Mirroring resource. Packet Mirroring
+    clones the traffic of specified instances in your Virtual
+    Private Cloud (VPC) network and forwards it to a collector
+    destination, such as an instance group of an internal TCP/UDP
+    load balancer, for analysis or examination. For more information
+    about setting up Packet Mirroring, see Using Packet Mirroring.
+
+    Attributes:
+        collector_ilb (google.cloud.compute_v1.types.PacketMirroringForwardingRuleInfo):
+            The Forwarding Rule resource of type
+            loadBalancingScheme=INTERNAL that will be used
+            as collector for mirrored traffic. The specified
+            forwarding rule must have isMirroringCollector
+            set to true.
+
+            This field is a member of `oneof`_ ``_collector_ilb``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        enable (str):
+            Indicates whether or not this packet
+            mirroring takes effect. If set to FALSE, this
+            packet mirroring policy will not be enforced on
+            the network. The default is TRUE. Check the
+            Enable enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_enable``.
+        filter (google.cloud.compute_v1.types.PacketMirroringFilter):
+            Filter for mirrored traffic. If unspecified,
+            all traffic is mirrored.
+
+            This field is a member of `oneof`_ ``_filter``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#packetMirroring for packet mirrorings.
+
+            This field is a member of `oneof`_ ``_kind``.
+        mirrored_resources (google.cloud.compute_v1.types.PacketMirroringMirroredResourceInfo):
+            PacketMirroring mirroredResourceInfos.
+            MirroredResourceInfo specifies a set of mirrored
+            VM instances, subnetworks and/or tags for which
+            traffic from/to all VM instances will be
+            mirrored.
+
+            This field is a member of `oneof`_ ``_mirrored_resources``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (google.cloud.compute_v1.types.PacketMirroringNetworkInfo):
+            Specifies the mirrored VPC network. Only
+            packets in this network will be mirrored. All
+            mirrored VMs should have a NIC in the given
+            network. All mirrored subnetworks should belong
+            to the given network.
+
+            This field is a member of `oneof`_ ``_network``.
+        priority (int):
+            The priority of applying this configuration.
+            Priority is used to break ties in cases where
+            there is more than one matching rule. In the
+            case of two rules that apply for a given
+            Instance, the one with the lowest-numbered
+            priority value wins. Default value is 1000.
+            Valid range is 0 through 65535.
+
+            This field is a member of `oneof`_ ``_priority``.
+        region (str):
+            [Output Only] URI of the region where the packetMirroring
+            resides.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    class Enable(proto.Enum):
+        r"""Indicates whether or not this packet mirroring takes effect.
+        If set to FALSE, this packet mirroring policy will not be
+        enforced on the network. The default is TRUE.
+        """
+        UNDEFINED_ENABLE = 0
+        FALSE = 66658563
+        TRUE = 2583950
+
+    collector_ilb = proto.Field(
+        proto.MESSAGE,
+        number=426607853,
+        optional=True,
+        message="PacketMirroringForwardingRuleInfo",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    enable = proto.Field(proto.STRING, number=311764355, optional=True,)
+    filter = proto.Field(
+        proto.MESSAGE, number=336120696, optional=True, message="PacketMirroringFilter",
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    mirrored_resources = proto.Field(
+        proto.MESSAGE,
+        number=124817348,
+        optional=True,
+        message="PacketMirroringMirroredResourceInfo",
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network = proto.Field(
+        proto.MESSAGE,
+        number=232872494,
+        optional=True,
+        message="PacketMirroringNetworkInfo",
+    )
+    priority = proto.Field(proto.UINT32, number=445151652, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+
+
+class PacketMirroringAggregatedList(proto.Message):
+    r"""Contains a list of packetMirrorings.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.PacketMirroringAggregatedList.ItemsEntry]):
+            A list of PacketMirroring resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="PacketMirroringsScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class PacketMirroringFilter(proto.Message):
+    r"""
+
+    Attributes:
+        I_p_protocols (Sequence[str]):
+            Protocols that apply as filter on mirrored
+            traffic. If no protocols are specified, all
+            traffic that matches the specified CIDR ranges
+            is mirrored. If neither cidrRanges nor
+            IPProtocols is specified, all traffic is
+            mirrored.
+        cidr_ranges (Sequence[str]):
+            IP CIDR ranges that apply as filter on the
+            source (ingress) or destination (egress) IP in
+            the IP header. Only IPv4 is supported. If no
+            ranges are specified, all traffic that matches
+            the specified IPProtocols is mirrored. If
+            neither cidrRanges nor IPProtocols is specified,
+            all traffic is mirrored.
+        direction (str):
+            Direction of traffic to mirror, either
+            INGRESS, EGRESS, or BOTH. The default is BOTH.
+            Check the Direction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_direction``.
+    """
+
+    class Direction(proto.Enum):
+        r"""Direction of traffic to mirror, either INGRESS, EGRESS, or
+        BOTH. The default is BOTH.
+        """
+        UNDEFINED_DIRECTION = 0
+        BOTH = 2044801
+        EGRESS = 432880501
+        INGRESS = 516931221
+
+    I_p_protocols = proto.RepeatedField(proto.STRING, number=98544854,)
+    cidr_ranges = proto.RepeatedField(proto.STRING, number=487901697,)
+    direction = proto.Field(proto.STRING, number=111150975, optional=True,)
+
+
+class PacketMirroringForwardingRuleInfo(proto.Message):
+    r"""
+
+    Attributes:
+        canonical_url (str):
+            [Output Only] Unique identifier for the forwarding rule;
+            defined by the server.
+
+            This field is a member of `oneof`_ ``_canonical_url``.
+        url (str):
+            Resource URL to the forwarding rule
+            representing the ILB configured as destination
+            of the mirrored traffic.
+
+            This field is a member of `oneof`_ ``_url``.
+    """
+
+    canonical_url = proto.Field(proto.STRING, number=512294820, optional=True,)
+    url = proto.Field(proto.STRING, number=116079, optional=True,)
+
+
+class PacketMirroringList(proto.Message):
+    r"""Contains a list of PacketMirroring resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.PacketMirroring]):
+            A list of PacketMirroring resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#packetMirroring for packetMirrorings.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="PacketMirroring",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class PacketMirroringMirroredResourceInfo(proto.Message):
+    r"""
+
+    Attributes:
+        instances (Sequence[google.cloud.compute_v1.types.PacketMirroringMirroredResourceInfoInstanceInfo]):
+            A set of virtual machine instances that are
+            being mirrored. They must live in zones
+            contained in the same region as this
+            packetMirroring. Note that this config will
+            apply only to those network interfaces of the
+            Instances that belong to the network specified
+            in this packetMirroring. You may specify a
+            maximum of 50 Instances.
+        subnetworks (Sequence[google.cloud.compute_v1.types.PacketMirroringMirroredResourceInfoSubnetInfo]):
+            A set of subnetworks for which traffic
+            from/to all VM instances will be mirrored. They
+            must live in the same region as this
+            packetMirroring. You may specify a maximum of 5
+            subnetworks.
+        tags (Sequence[str]):
+            A set of mirrored tags. Traffic from/to all
+            VM instances that have one or more of these tags
+            will be mirrored.
+    """
+
+    instances = proto.RepeatedField(
+        proto.MESSAGE,
+        number=29097598,
+        message="PacketMirroringMirroredResourceInfoInstanceInfo",
+    )
+    subnetworks = proto.RepeatedField(
+        proto.MESSAGE,
+        number=415853125,
+        message="PacketMirroringMirroredResourceInfoSubnetInfo",
+    )
+    tags = proto.RepeatedField(proto.STRING, number=3552281,)
+
+
+class PacketMirroringMirroredResourceInfoInstanceInfo(proto.Message):
+    r"""
+
+    Attributes:
+        canonical_url (str):
+            [Output Only] Unique identifier for the instance; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_canonical_url``.
+        url (str):
+            Resource URL to the virtual machine instance
+            which is being mirrored.
+
+            This field is a member of `oneof`_ ``_url``.
+    """
+
+    canonical_url = proto.Field(proto.STRING, number=512294820, optional=True,)
+    url = proto.Field(proto.STRING, number=116079, optional=True,)
+
+
+class PacketMirroringMirroredResourceInfoSubnetInfo(proto.Message):
+    r"""
+
+    Attributes:
+        canonical_url (str):
+            [Output Only] Unique identifier for the subnetwork; defined
+            by the server.
+
+            This field is a member of `oneof`_ ``_canonical_url``.
+        url (str):
+            Resource URL to the subnetwork for which
+            traffic from/to all VM instances will be
+            mirrored.
+
+            This field is a member of `oneof`_ ``_url``.
+    """
+
+    canonical_url = proto.Field(proto.STRING, number=512294820, optional=True,)
+    url = proto.Field(proto.STRING, number=116079, optional=True,)
+
+
+class PacketMirroringNetworkInfo(proto.Message):
+    r"""
+
+    Attributes:
+        canonical_url (str):
+            [Output Only] Unique identifier for the network; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_canonical_url``.
+        url (str):
+            URL of the network resource.
+
+            This field is a member of `oneof`_ ``_url``.
+    """
+
+    canonical_url = proto.Field(proto.STRING, number=512294820, optional=True,)
+    url = proto.Field(proto.STRING, number=116079, optional=True,)
+
+
+class PacketMirroringsScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        packet_mirrorings (Sequence[google.cloud.compute_v1.types.PacketMirroring]):
+            A list of packetMirrorings contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of packetMirrorings when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    packet_mirrorings = proto.RepeatedField(
+        proto.MESSAGE, number=154615079, message="PacketMirroring",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class PatchPacketMirroringRequest(proto.Message):
+    r"""A request message for PacketMirrorings.Patch. See the method
+    description for details.
+
+    Attributes:
+        packet_mirroring (str):
+            Name of the PacketMirroring resource to
+            patch.
+        packet_mirroring_resource (google.cloud.compute_v1.types.PacketMirroring):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    packet_mirroring = proto.Field(proto.STRING, number=22305996,)
+    packet_mirroring_resource = proto.Field(
+        proto.MESSAGE, number=493501985, message="PacketMirroring",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class TestIamPermissionsPacketMirroringRequest(proto.Message):
+    r"""A request message for PacketMirrorings.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,938 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the projects service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_21
+from google.cloud.compute_v1.types._shards import shared_48
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DisableXpnHostProjectRequest",
+        "DisableXpnResourceProjectRequest",
+        "DiskMoveRequest",
+        "EnableXpnHostProjectRequest",
+        "EnableXpnResourceProjectRequest",
+        "GetProjectRequest",
+        "GetXpnHostProjectRequest",
+        "GetXpnResourcesProjectsRequest",
+        "InstanceMoveRequest",
+        "ListXpnHostsProjectsRequest",
+        "MoveDiskProjectRequest",
+        "MoveInstanceProjectRequest",
+        "Project",
+        "ProjectsDisableXpnResourceRequest",
+        "ProjectsEnableXpnResourceRequest",
+        "ProjectsGetXpnResources",
+        "ProjectsListXpnHostsRequest",
+        "ProjectsSetDefaultNetworkTierRequest",
+        "SetCommonInstanceMetadataProjectRequest",
+        "SetDefaultNetworkTierProjectRequest",
+        "SetUsageExportBucketProjectRequest",
+        "UsageExportLocation",
+        "XpnHostList",
+        "XpnResourceId",
+    },
+)
+
+
+class DisableXpnHostProjectRequest(proto.Message):
+    r"""A request message for Projects.DisableXpnHost. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class DisableXpnResourceProjectRequest(proto.Message):
+    r"""A request message for Projects.DisableXpnResource. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        projects_disable_xpn_resource_request_resource (google.cloud.compute_v1.types.ProjectsDisableXpnResourceRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    projects_disable_xpn_resource_request_resource = proto.Field(
+        proto.MESSAGE, number=209136170, message="ProjectsDisableXpnResourceRequest",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class DiskMoveRequest(proto.Message):
+    r"""
+
+    Attributes:
+        destination_zone (str):
+            The URL of the destination zone to move the
+            disk. This can be a full or partial URL. For
+            example, the following are all valid URLs to a
+            zone: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            - projects/project/zones/zone - zones/zone
+
+            This field is a member of `oneof`_ ``_destination_zone``.
+        target_disk (str):
+            The URL of the target disk to move. This can
+            be a full or partial URL. For example, the
+            following are all valid URLs to a disk: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /disks/disk -
+            projects/project/zones/zone/disks/disk -
+            zones/zone/disks/disk
+
+            This field is a member of `oneof`_ ``_target_disk``.
+    """
+
+    destination_zone = proto.Field(proto.STRING, number=131854653, optional=True,)
+    target_disk = proto.Field(proto.STRING, number=62433163, optional=True,)
+
+
+class EnableXpnHostProjectRequest(proto.Message):
+    r"""A request message for Projects.EnableXpnHost. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class EnableXpnResourceProjectRequest(proto.Message):
+    r"""A request message for Projects.EnableXpnResource. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        projects_enable_xpn_resource_request_resource (google.cloud.compute_v1.types.ProjectsEnableXpnResourceRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    projects_enable_xpn_resource_request_resource = proto.Field(
+        proto.MESSAGE, number=421980207, message="ProjectsEnableXpnResourceRequest",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetProjectRequest(proto.Message):
+    r"""A request message for Projects.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class GetXpnHostProjectRequest(proto.Message):
+    r"""A request message for Projects.GetXpnHost. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+
+
+class GetXpnResourcesProjectsRequest(proto.Message):
+    r"""A request message for Projects.GetXpnResources. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class InstanceMoveRequest(proto.Message):
+    r"""
+
+    Attributes:
+        destination_zone (str):
+            The URL of the destination zone to move the
+            instance. This can be a full or partial URL. For
+            example, the following are all valid URLs to a
+            zone: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            - projects/project/zones/zone - zones/zone
+
+            This field is a member of `oneof`_ ``_destination_zone``.
+        target_instance (str):
+            The URL of the target instance to move. This
+            can be a full or partial URL. For example, the
+            following are all valid URLs to an instance: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /instances/instance -
+            projects/project/zones/zone/instances/instance -
+            zones/zone/instances/instance
+
+            This field is a member of `oneof`_ ``_target_instance``.
+    """
+
+    destination_zone = proto.Field(proto.STRING, number=131854653, optional=True,)
+    target_instance = proto.Field(proto.STRING, number=289769347, optional=True,)
+
+
+class ListXpnHostsProjectsRequest(proto.Message):
+    r"""A request message for Projects.ListXpnHosts. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        projects_list_xpn_hosts_request_resource (google.cloud.compute_v1.types.ProjectsListXpnHostsRequest):
+            The body resource for this request
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    projects_list_xpn_hosts_request_resource = proto.Field(
+        proto.MESSAGE, number=238266391, message="ProjectsListXpnHostsRequest",
+    )
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class MoveDiskProjectRequest(proto.Message):
+    r"""A request message for Projects.MoveDisk. See the method
+    description for details.
+
+    Attributes:
+        disk_move_request_resource (google.cloud.compute_v1.types.DiskMoveRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    disk_move_request_resource = proto.Field(
+        proto.MESSAGE, number=313008458, message="DiskMoveRequest",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class MoveInstanceProjectRequest(proto.Message):
+    r"""A request message for Projects.MoveInstance. See the method
+    description for details.
+
+    Attributes:
+        instance_move_request_resource (google.cloud.compute_v1.types.InstanceMoveRequest):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    instance_move_request_resource = proto.Field(
+        proto.MESSAGE, number=311664194, message="InstanceMoveRequest",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class Project(proto.Message):
+    r"""Represents a Project resource. A project is used to organize
+    resources in a Google Cloud Platform environment. For more
+    information, read about the Resource Hierarchy.
+
+    Attributes:
+        common_instance_metadata (google.cloud.compute_v1.types.Metadata):
+            Metadata key/value pairs available to all
+            instances contained in this project. See Custom
+            metadata for more information.
+
+            This field is a member of `oneof`_ ``_common_instance_metadata``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        default_network_tier (str):
+            This signifies the default network tier used
+            for configuring resources of the project and can
+            only take the following values: PREMIUM,
+            STANDARD. Initially the default network tier is
+            PREMIUM. Check the DefaultNetworkTier enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_default_network_tier``.
+        default_service_account (str):
+            [Output Only] Default service account used by VMs running in
+            this project.
+
+            This field is a member of `oneof`_ ``_default_service_account``.
+        description (str):
+            An optional textual description of the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        enabled_features (Sequence[str]):
+            Restricted features enabled for use on this
+            project.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server. This is *not* the
+            project ID, and is just a unique ID used by Compute Engine
+            to identify resources.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#project
+            for projects.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The project ID. For example: my-example-
+            roject. Use the project ID to make requests to
+            Compute Engine.
+
+            This field is a member of `oneof`_ ``_name``.
+        quotas (Sequence[google.cloud.compute_v1.types.Quota]):
+            [Output Only] Quotas assigned to this project.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        usage_export_location (google.cloud.compute_v1.types.UsageExportLocation):
+            The naming prefix for daily usage reports and
+            the Google Cloud Storage bucket where they are
+            stored.
+
+            This field is a member of `oneof`_ ``_usage_export_location``.
+        xpn_project_status (str):
+            [Output Only] The role this project has in a shared VPC
+            configuration. Currently, only projects with the host role,
+            which is specified by the value HOST, are differentiated.
+            Check the XpnProjectStatus enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_xpn_project_status``.
+    """
+
+    class DefaultNetworkTier(proto.Enum):
+        r"""This signifies the default network tier used for configuring
+        resources of the project and can only take the following values:
+        PREMIUM, STANDARD. Initially the default network tier is
+        PREMIUM.
+        """
+        UNDEFINED_DEFAULT_NETWORK_TIER = 0
+        PREMIUM = 399530551
+        STANDARD = 484642493
+
+    class XpnProjectStatus(proto.Enum):
+        r"""[Output Only] The role this project has in a shared VPC
+        configuration. Currently, only projects with the host role, which is
+        specified by the value HOST, are differentiated.
+        """
+        UNDEFINED_XPN_PROJECT_STATUS = 0
+        HOST = 2223528
+        UNSPECIFIED_XPN_PROJECT_STATUS = 340393257
+
+    common_instance_metadata = proto.Field(
+        proto.MESSAGE, number=185794117, optional=True, message=shared_21.Metadata,
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    default_network_tier = proto.Field(proto.STRING, number=471753361, optional=True,)
+    default_service_account = proto.Field(
+        proto.STRING, number=298712229, optional=True,
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    enabled_features = proto.RepeatedField(proto.STRING, number=469017467,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    quotas = proto.RepeatedField(
+        proto.MESSAGE, number=125341947, message=shared_48.Quota,
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    usage_export_location = proto.Field(
+        proto.MESSAGE, number=347543874, optional=True, message="UsageExportLocation",
+    )
+    xpn_project_status = proto.Field(proto.STRING, number=228419265, optional=True,)
+
+
+class ProjectsDisableXpnResourceRequest(proto.Message):
+    r"""
+
+    Attributes:
+        xpn_resource (google.cloud.compute_v1.types.XpnResourceId):
+            Service resource (a.k.a service project) ID.
+
+            This field is a member of `oneof`_ ``_xpn_resource``.
+    """
+
+    xpn_resource = proto.Field(
+        proto.MESSAGE, number=133384631, optional=True, message="XpnResourceId",
+    )
+
+
+class ProjectsEnableXpnResourceRequest(proto.Message):
+    r"""
+
+    Attributes:
+        xpn_resource (google.cloud.compute_v1.types.XpnResourceId):
+            Service resource (a.k.a service project) ID.
+
+            This field is a member of `oneof`_ ``_xpn_resource``.
+    """
+
+    xpn_resource = proto.Field(
+        proto.MESSAGE, number=133384631, optional=True, message="XpnResourceId",
+    )
+
+
+class ProjectsGetXpnResources(proto.Message):
+    r"""
+
+    Attributes:
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#projectsGetXpnResources for lists of service
+            resources (a.k.a service projects)
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        resources (Sequence[google.cloud.compute_v1.types.XpnResourceId]):
+            Service resources (a.k.a service projects)
+            attached to this project as their shared VPC
+            host.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    resources = proto.RepeatedField(
+        proto.MESSAGE, number=164412965, message="XpnResourceId",
+    )
+
+
+class ProjectsListXpnHostsRequest(proto.Message):
+    r"""
+
+    Attributes:
+        organization (str):
+            Optional organization ID managed by Cloud
+            Resource Manager, for which to list shared VPC
+            host projects. If not specified, the
+            organization will be inferred from the project.
+
+            This field is a member of `oneof`_ ``_organization``.
+    """
+
+    organization = proto.Field(proto.STRING, number=105180467, optional=True,)
+
+
+class ProjectsSetDefaultNetworkTierRequest(proto.Message):
+    r"""
+
+    Attributes:
+        network_tier (str):
+            Default network tier to be set.
+            Check the NetworkTier enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_network_tier``.
+    """
+
+    class NetworkTier(proto.Enum):
+        r"""Default network tier to be set."""
+        UNDEFINED_NETWORK_TIER = 0
+        PREMIUM = 399530551
+        STANDARD = 484642493
+
+    network_tier = proto.Field(proto.STRING, number=517397843, optional=True,)
+
+
+class SetCommonInstanceMetadataProjectRequest(proto.Message):
+    r"""A request message for Projects.SetCommonInstanceMetadata. See
+    the method description for details.
+
+    Attributes:
+        metadata_resource (google.cloud.compute_v1.types.Metadata):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    metadata_resource = proto.Field(
+        proto.MESSAGE, number=291086110, message=shared_21.Metadata,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class SetDefaultNetworkTierProjectRequest(proto.Message):
+    r"""A request message for Projects.SetDefaultNetworkTier. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        projects_set_default_network_tier_request_resource (google.cloud.compute_v1.types.ProjectsSetDefaultNetworkTierRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    projects_set_default_network_tier_request_resource = proto.Field(
+        proto.MESSAGE, number=126410762, message="ProjectsSetDefaultNetworkTierRequest",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class SetUsageExportBucketProjectRequest(proto.Message):
+    r"""A request message for Projects.SetUsageExportBucket. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        usage_export_location_resource (google.cloud.compute_v1.types.UsageExportLocation):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    usage_export_location_resource = proto.Field(
+        proto.MESSAGE, number=20260459, message="UsageExportLocation",
+    )
+
+
+class UsageExportLocation(proto.Message):
+    r"""The location in Cloud Storage and naming method of the daily usage
+    report. Contains bucket_name and report_name prefix.
+
+    Attributes:
+        bucket_name (str):
+            The name of an existing bucket in Cloud
+            Storage where the usage report object is stored.
+            The Google Service Account is granted write
+            access to this bucket. This can either be the
+            bucket name by itself, such as example-bucket,
+            or the bucket name with gs:// or
+            https://storage.googleapis.com/ in front of it,
+            such as gs://example-bucket.
+
+            This field is a member of `oneof`_ ``_bucket_name``.
+        report_name_prefix (str):
+            An optional prefix for the name of the usage report object
+            stored in bucketName. If not supplied, defaults to
+            usage_gce. The report is stored as a CSV file named
+            report_name_prefix_gce_YYYYMMDD.csv where YYYYMMDD is the
+            day of the usage according to Pacific Time. If you supply a
+            prefix, it should conform to Cloud Storage object naming
+            conventions.
+
+            This field is a member of `oneof`_ ``_report_name_prefix``.
+    """
+
+    bucket_name = proto.Field(proto.STRING, number=283610048, optional=True,)
+    report_name_prefix = proto.Field(proto.STRING, number=320198715, optional=True,)
+
+
+class XpnHostList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.Project]):
+            [Output Only] A list of shared VPC host project URLs.
+        kind (str):
+            [Output Only] Type of resource. Always compute#xpnHostList
+            for lists of shared VPC hosts.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="Project",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class XpnResourceId(proto.Message):
+    r"""Service resource (a.k.a service project) ID.
+
+    Attributes:
+        id (str):
+            The ID of the service resource. In the case
+            of projects, this field supports project id
+            (e.g., my-project-123) and project number (e.g.
+            12345678).
+
+            This field is a member of `oneof`_ ``_id``.
+        type_ (str):
+            The type of the service resource.
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""The type of the service resource."""
+        UNDEFINED_TYPE = 0
+        PROJECT = 408671993
+        XPN_RESOURCE_TYPE_UNSPECIFIED = 151607034
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
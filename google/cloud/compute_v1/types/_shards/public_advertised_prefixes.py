@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the public_advertised_prefixes service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeletePublicAdvertisedPrefixeRequest",
+        "GetPublicAdvertisedPrefixeRequest",
+        "InsertPublicAdvertisedPrefixeRequest",
+        "ListPublicAdvertisedPrefixesRequest",
+        "PatchPublicAdvertisedPrefixeRequest",
+        "PublicAdvertisedPrefix",
+        "PublicAdvertisedPrefixList",
+        "PublicAdvertisedPrefixPublicDelegatedPrefix",
+    },
+)
+
+
+class DeletePublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Delete. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            Name of the PublicAdvertisedPrefix resource
+            to delete.
+        request_id (str):
+            An optional request ID to identify requests. Specify a
+            unique request ID so that if you must retry your request,
+            the server will know to ignore the request if it has already
+            been completed. For example, consider a situation where you
+            make an initial request and the request times out. If you
+            make the request again with the same request ID, the server
+            can check if original operation with the same request ID was
+            received, and if so, will ignore the second request. This
+            prevents clients from accidentally creating duplicate
+            commitments. The request ID must be a valid UUID with the
+            exception that zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000). end_interface:
+            MixerMutationRequestBuilder
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    public_advertised_prefix = proto.Field(proto.STRING, number=101874590,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Get. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            Name of the PublicAdvertisedPrefix resource
+            to return.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    public_advertised_prefix = proto.Field(proto.STRING, number=101874590,)
+
+
+class InsertPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Insert. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix_resource (google.cloud.compute_v1.types.PublicAdvertisedPrefix):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests. Specify a
+            unique request ID so that if you must retry your request,
+            the server will know to ignore the request if it has already
+            been completed. For example, consider a situation where you
+            make an initial request and the request times out. If you
+            make the request again with the same request ID, the server
+            can check if original operation with the same request ID was
+            received, and if so, will ignore the second request. This
+            prevents clients from accidentally creating duplicate
+            commitments. The request ID must be a valid UUID with the
+            exception that zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000). end_interface:
+            MixerMutationRequestBuilder
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    public_advertised_prefix_resource = proto.Field(
+        proto.MESSAGE, number=233614223, message="PublicAdvertisedPrefix",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListPublicAdvertisedPrefixesRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.List. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchPublicAdvertisedPrefixeRequest(proto.Message):
+    r"""A request message for PublicAdvertisedPrefixes.Patch. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        public_advertised_prefix (str):
+            Name of the PublicAdvertisedPrefix resource
+            to patch.
+        public_advertised_prefix_resource (google.cloud.compute_v1.types.PublicAdvertisedPrefix):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests. Specify a
+            unique request ID so that if you must retry your request,
+            the server will know to ignore the request if it has already
+            been completed. For example, consider a situation where you
+            make an initial request and the request times out. If you
+            make the request again with the same request ID, the server
+            can check if original operation with the same request ID was
+            received, and if so, will ignore the second request. This
+            prevents clients from accidentally creating duplicate
+            commitments. The request ID must be a valid UUID with the
+            exception that zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000). end_interface:
+            MixerMutationRequestBuilder
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    public_advertised_prefix = proto.Field(proto.STRING, number=101874590,)
+    public_advertised_prefix_resource = proto.Field(
+        proto.MESSAGE, number=233614223, message="PublicAdvertisedPrefix",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class PublicAdvertisedPrefix(proto.Message):
+    r"""A public advertised prefix represents an aggregated IP prefix
+    or netblock which customers bring to cloud. The IP prefix is a
+    single unit of route advertisement and is announced globally to
+    the internet.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        dns_verification_ip (str):
+            The IPv4 address to be used for reverse DNS
+            verification.
+
+            This field is a member of `oneof`_ ``_dns_verification_ip``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a new
+            PublicAdvertisedPrefix. An up-to-date
+            fingerprint must be provided in order to update
+            the PublicAdvertisedPrefix, otherwise the
+            request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve a
+            PublicAdvertisedPrefix.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource type.
+            The server generates this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_cidr_range (str):
+            The IPv4 address range, in CIDR format,
+            represented by this public advertised prefix.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#publicAdvertisedPrefix for public advertised
+            prefixes.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        public_delegated_prefixs (Sequence[google.cloud.compute_v1.types.PublicAdvertisedPrefixPublicDelegatedPrefix]):
+            [Output Only] The list of public delegated prefixes that
+            exist for this public advertised prefix.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        shared_secret (str):
+            [Output Only] The shared secret to be used for reverse DNS
+            verification.
+
+            This field is a member of `oneof`_ ``_shared_secret``.
+        status (str):
+            The status of the public advertised prefix.
+            Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""The status of the public advertised prefix."""
+        UNDEFINED_STATUS = 0
+        INITIAL = 518841124
+        PREFIX_CONFIGURATION_COMPLETE = 480889551
+        PREFIX_CONFIGURATION_IN_PROGRESS = 378550961
+        PREFIX_REMOVAL_IN_PROGRESS = 284375783
+        PTR_CONFIGURED = 513497167
+        REVERSE_DNS_LOOKUP_FAILED = 295755183
+        VALIDATED = 66197998
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    dns_verification_ip = proto.Field(proto.STRING, number=241011381, optional=True,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    public_delegated_prefixs = proto.RepeatedField(
+        proto.MESSAGE,
+        number=425811723,
+        message="PublicAdvertisedPrefixPublicDelegatedPrefix",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    shared_secret = proto.Field(proto.STRING, number=381932490, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+
+
+class PublicAdvertisedPrefixList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.PublicAdvertisedPrefix]):
+            A list of PublicAdvertisedPrefix resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#publicAdvertisedPrefix for public advertised
+            prefixes.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="PublicAdvertisedPrefix",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class PublicAdvertisedPrefixPublicDelegatedPrefix(proto.Message):
+    r"""Represents a CIDR range which can be used to assign
+    addresses.
+
+    Attributes:
+        ip_range (str):
+            The IP address range of the public delegated
+            prefix
+
+            This field is a member of `oneof`_ ``_ip_range``.
+        name (str):
+            The name of the public delegated prefix
+
+            This field is a member of `oneof`_ ``_name``.
+        project (str):
+            The project number of the public delegated
+            prefix
+
+            This field is a member of `oneof`_ ``_project``.
+        region (str):
+            The region of the public delegated prefix if
+            it is regional. If absent, the prefix is global.
+
+            This field is a member of `oneof`_ ``_region``.
+        status (str):
+            The status of the public delegated prefix.
+            Possible values are: INITIALIZING: The public
+            delegated prefix is being initialized and
+            addresses cannot be created yet. ANNOUNCED: The
+            public delegated prefix is active.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    ip_range = proto.Field(proto.STRING, number=145092645, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,646 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the region_commitments service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_49
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListRegionCommitmentsRequest",
+        "Commitment",
+        "CommitmentAggregatedList",
+        "CommitmentList",
+        "CommitmentsScopedList",
+        "GetRegionCommitmentRequest",
+        "InsertRegionCommitmentRequest",
+        "LicenseResourceCommitment",
+        "ListRegionCommitmentsRequest",
+        "ResourceCommitment",
+    },
+)
+
+
+class AggregatedListRegionCommitmentsRequest(proto.Message):
+    r"""A request message for RegionCommitments.AggregatedList. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class Commitment(proto.Message):
+    r"""Represents a regional Commitment resource. Creating a
+    commitment resource means that you are purchasing a committed
+    use contract with an explicit start and end time. You can create
+    commitments based on vCPUs and memory usage and receive
+    discounted rates. For full details, read Signing Up for
+    Committed Use Discounts.
+
+    Attributes:
+        category (str):
+            The category of the commitment. Category
+            MACHINE specifies commitments composed of
+            machine resources such as VCPU or MEMORY, listed
+            in resources. Category LICENSE specifies
+            commitments composed of software licenses,
+            listed in licenseResources. Note that only
+            MACHINE commitments should have a Type
+            specified. Check the Category enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_category``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        end_timestamp (str):
+            [Output Only] Commitment end time in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_end_timestamp``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#commitment for commitments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        license_resource (google.cloud.compute_v1.types.LicenseResourceCommitment):
+            The license specification required as part of
+            a license commitment.
+
+            This field is a member of `oneof`_ ``_license_resource``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        plan (str):
+            The plan for this commitment, which determines duration and
+            discount rate. The currently supported plans are
+            TWELVE_MONTH (1 year), and THIRTY_SIX_MONTH (3 years). Check
+            the Plan enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_plan``.
+        region (str):
+            [Output Only] URL of the region where this commitment may be
+            used.
+
+            This field is a member of `oneof`_ ``_region``.
+        reservations (Sequence[google.cloud.compute_v1.types.Reservation]):
+            List of reservations in this commitment.
+        resources (Sequence[google.cloud.compute_v1.types.ResourceCommitment]):
+            A list of commitment amounts for particular
+            resources. Note that VCPU and MEMORY resource
+            commitments must occur together.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        start_timestamp (str):
+            [Output Only] Commitment start time in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_start_timestamp``.
+        status (str):
+            [Output Only] Status of the commitment with regards to
+            eventual expiration (each commitment has an end date
+            defined). One of the following values: NOT_YET_ACTIVE,
+            ACTIVE, EXPIRED. Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_message (str):
+            [Output Only] An optional, human-readable explanation of the
+            status.
+
+            This field is a member of `oneof`_ ``_status_message``.
+        type_ (str):
+            The type of commitment, which affects the discount rate and
+            the eligible resources. Type MEMORY_OPTIMIZED specifies a
+            commitment that will only apply to memory optimized
+            machines. Type ACCELERATOR_OPTIMIZED specifies a commitment
+            that will only apply to accelerator optimized machines.
+            Check the Type enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Category(proto.Enum):
+        r"""The category of the commitment. Category MACHINE specifies
+        commitments composed of machine resources such as VCPU or
+        MEMORY, listed in resources. Category LICENSE specifies
+        commitments composed of software licenses, listed in
+        licenseResources. Note that only MACHINE commitments should have
+        a Type specified.
+        """
+        UNDEFINED_CATEGORY = 0
+        CATEGORY_UNSPECIFIED = 509189462
+        LICENSE = 347869217
+        MACHINE = 469553191
+
+    class Plan(proto.Enum):
+        r"""The plan for this commitment, which determines duration and discount
+        rate. The currently supported plans are TWELVE_MONTH (1 year), and
+        THIRTY_SIX_MONTH (3 years).
+        """
+        UNDEFINED_PLAN = 0
+        INVALID = 530283991
+        THIRTY_SIX_MONTH = 266295942
+        TWELVE_MONTH = 173083962
+
+    class Status(proto.Enum):
+        r"""[Output Only] Status of the commitment with regards to eventual
+        expiration (each commitment has an end date defined). One of the
+        following values: NOT_YET_ACTIVE, ACTIVE, EXPIRED.
+        """
+        UNDEFINED_STATUS = 0
+        ACTIVE = 314733318
+        CREATING = 455564985
+        EXPIRED = 482489093
+        NOT_YET_ACTIVE = 20607337
+
+    class Type(proto.Enum):
+        r"""The type of commitment, which affects the discount rate and the
+        eligible resources. Type MEMORY_OPTIMIZED specifies a commitment
+        that will only apply to memory optimized machines. Type
+        ACCELERATOR_OPTIMIZED specifies a commitment that will only apply to
+        accelerator optimized machines.
+        """
+        UNDEFINED_TYPE = 0
+        ACCELERATOR_OPTIMIZED = 280848403
+        COMPUTE_OPTIMIZED = 158349023
+        GENERAL_PURPOSE = 299793543
+        GENERAL_PURPOSE_E2 = 301911877
+        GENERAL_PURPOSE_N2 = 301912156
+        GENERAL_PURPOSE_N2D = 232471400
+        MEMORY_OPTIMIZED = 281753417
+        TYPE_UNSPECIFIED = 437714322
+
+    category = proto.Field(proto.STRING, number=50511102, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    end_timestamp = proto.Field(proto.STRING, number=468096690, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    license_resource = proto.Field(
+        proto.MESSAGE,
+        number=437955148,
+        optional=True,
+        message="LicenseResourceCommitment",
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    plan = proto.Field(proto.STRING, number=3443497, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    reservations = proto.RepeatedField(
+        proto.MESSAGE, number=399717927, message=shared_49.Reservation,
+    )
+    resources = proto.RepeatedField(
+        proto.MESSAGE, number=164412965, message="ResourceCommitment",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    start_timestamp = proto.Field(proto.STRING, number=83645817, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    status_message = proto.Field(proto.STRING, number=297428154, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+class CommitmentAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.CommitmentAggregatedList.ItemsEntry]):
+            A list of CommitmentsScopedList resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#commitmentAggregatedList for aggregated lists of
+            commitments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=100526016, message="CommitmentsScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class CommitmentList(proto.Message):
+    r"""Contains a list of Commitment resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.Commitment]):
+            A list of Commitment resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#commitmentList for lists of commitments.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="Commitment",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class CommitmentsScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        commitments (Sequence[google.cloud.compute_v1.types.Commitment]):
+            [Output Only] A list of commitments contained in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning which replaces the list
+            of commitments when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    commitments = proto.RepeatedField(
+        proto.MESSAGE, number=450664446, message="Commitment",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class GetRegionCommitmentRequest(proto.Message):
+    r"""A request message for RegionCommitments.Get. See the method
+    description for details.
+
+    Attributes:
+        commitment (str):
+            Name of the commitment to return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+    """
+
+    commitment = proto.Field(proto.STRING, number=482134805,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class InsertRegionCommitmentRequest(proto.Message):
+    r"""A request message for RegionCommitments.Insert. See the
+    method description for details.
+
+    Attributes:
+        commitment_resource (google.cloud.compute_v1.types.Commitment):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    commitment_resource = proto.Field(
+        proto.MESSAGE, number=244240888, message="Commitment",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class LicenseResourceCommitment(proto.Message):
+    r"""Commitment for a particular license resource.
+
+    Attributes:
+        amount (int):
+            The number of licenses purchased.
+
+            This field is a member of `oneof`_ ``_amount``.
+        cores_per_license (str):
+            Specifies the core range of the instance for
+            which this license applies.
+
+            This field is a member of `oneof`_ ``_cores_per_license``.
+        license_ (str):
+            Any applicable license URI.
+
+            This field is a member of `oneof`_ ``_license``.
+    """
+
+    amount = proto.Field(proto.INT64, number=196759640, optional=True,)
+    cores_per_license = proto.Field(proto.STRING, number=32482324, optional=True,)
+    license_ = proto.Field(proto.STRING, number=166757441, optional=True,)
+
+
+class ListRegionCommitmentsRequest(proto.Message):
+    r"""A request message for RegionCommitments.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class ResourceCommitment(proto.Message):
+    r"""Commitment for a particular resource (a Commitment is
+    composed of one or more of these).
+
+    Attributes:
+        accelerator_type (str):
+            Name of the accelerator type resource.
+            Applicable only when the type is ACCELERATOR.
+
+            This field is a member of `oneof`_ ``_accelerator_type``.
+        amount (int):
+            The amount of the resource purchased (in a
+            type-dependent unit, such as bytes). For vCPUs,
+            this can just be an integer. For memory, this
+            must be provided in MB. Memory must be a
+            multiple of 256 MB, with up to 6.5GB of memory
+            per every vCPU.
+
+            This field is a member of `oneof`_ ``_amount``.
+        type_ (str):
+            Type of resource for which this commitment
+            applies. Possible values are VCPU and MEMORY
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""Type of resource for which this commitment applies. Possible
+        values are VCPU and MEMORY
+        """
+        UNDEFINED_TYPE = 0
+        ACCELERATOR = 429815371
+        LOCAL_SSD = 508934896
+        MEMORY = 123056385
+        UNSPECIFIED = 526786327
+        VCPU = 2628978
+
+    accelerator_type = proto.Field(proto.STRING, number=138031246, optional=True,)
+    amount = proto.Field(proto.INT64, number=196759640, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,549 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the region_disks service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_13
+from google.cloud.compute_v1.types._shards import shared_24
+from google.cloud.compute_v1.types._shards import shared_28
+from google.cloud.compute_v1.types._shards import shared_37
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddResourcePoliciesRegionDiskRequest",
+        "CreateSnapshotRegionDiskRequest",
+        "DeleteRegionDiskRequest",
+        "GetIamPolicyRegionDiskRequest",
+        "GetRegionDiskRequest",
+        "InsertRegionDiskRequest",
+        "ListRegionDisksRequest",
+        "RegionDisksAddResourcePoliciesRequest",
+        "RegionDisksRemoveResourcePoliciesRequest",
+        "RegionDisksResizeRequest",
+        "RemoveResourcePoliciesRegionDiskRequest",
+        "ResizeRegionDiskRequest",
+        "SetIamPolicyRegionDiskRequest",
+        "SetLabelsRegionDiskRequest",
+        "TestIamPermissionsRegionDiskRequest",
+    },
+)
+
+
+class AddResourcePoliciesRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.AddResourcePolicies. See
+    the method description for details.
+
+    Attributes:
+        disk (str):
+            The disk name for this request.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_disks_add_resource_policies_request_resource (google.cloud.compute_v1.types.RegionDisksAddResourcePoliciesRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_disks_add_resource_policies_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=284196750,
+        message="RegionDisksAddResourcePoliciesRequest",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class CreateSnapshotRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.CreateSnapshot. See the
+    method description for details.
+
+    Attributes:
+        disk (str):
+            Name of the regional persistent disk to
+            snapshot.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        snapshot_resource (google.cloud.compute_v1.types.Snapshot):
+            The body resource for this request
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    snapshot_resource = proto.Field(
+        proto.MESSAGE, number=481319977, message=shared_24.Snapshot,
+    )
+
+
+class DeleteRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.Delete. See the method
+    description for details.
+
+    Attributes:
+        disk (str):
+            Name of the regional persistent disk to
+            delete.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetIamPolicyRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.GetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.Get. See the method
+    description for details.
+
+    Attributes:
+        disk (str):
+            Name of the regional persistent disk to
+            return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class InsertRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.Insert. See the method
+    description for details.
+
+    Attributes:
+        disk_resource (google.cloud.compute_v1.types.Disk):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        source_image (str):
+            Source image to restore onto a disk. This
+            field is optional.
+
+            This field is a member of `oneof`_ ``_source_image``.
+    """
+
+    disk_resource = proto.Field(proto.MESSAGE, number=25880688, message=shared_37.Disk,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    source_image = proto.Field(proto.STRING, number=50443319, optional=True,)
+
+
+class ListRegionDisksRequest(proto.Message):
+    r"""A request message for RegionDisks.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class RegionDisksAddResourcePoliciesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (Sequence[str]):
+            Resource policies to be added to this disk.
+    """
+
+    resource_policies = proto.RepeatedField(proto.STRING, number=22220385,)
+
+
+class RegionDisksRemoveResourcePoliciesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (Sequence[str]):
+            Resource policies to be removed from this
+            disk.
+    """
+
+    resource_policies = proto.RepeatedField(proto.STRING, number=22220385,)
+
+
+class RegionDisksResizeRequest(proto.Message):
+    r"""
+
+    Attributes:
+        size_gb (int):
+            The new size of the regional persistent disk,
+            which is specified in GB.
+
+            This field is a member of `oneof`_ ``_size_gb``.
+    """
+
+    size_gb = proto.Field(proto.INT64, number=494929369, optional=True,)
+
+
+class RemoveResourcePoliciesRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.RemoveResourcePolicies. See
+    the method description for details.
+
+    Attributes:
+        disk (str):
+            The disk name for this request.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_disks_remove_resource_policies_request_resource (google.cloud.compute_v1.types.RegionDisksRemoveResourcePoliciesRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_disks_remove_resource_policies_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=8741283,
+        message="RegionDisksRemoveResourcePoliciesRequest",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ResizeRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.Resize. See the method
+    description for details.
+
+    Attributes:
+        disk (str):
+            Name of the regional persistent disk.
+        project (str):
+            The project ID for this request.
+        region (str):
+            Name of the region for this request.
+        region_disks_resize_request_resource (google.cloud.compute_v1.types.RegionDisksResizeRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    disk = proto.Field(proto.STRING, number=3083677,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_disks_resize_request_resource = proto.Field(
+        proto.MESSAGE, number=446633237, message="RegionDisksResizeRequest",
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class SetIamPolicyRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_set_policy_request_resource (google.cloud.compute_v1.types.RegionSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=276489091, message=shared_13.RegionSetPolicyRequest,
+    )
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class SetLabelsRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.SetLabels. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The region for this request.
+        region_set_labels_request_resource (google.cloud.compute_v1.types.RegionSetLabelsRequest):
+            The body resource for this request
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_set_labels_request_resource = proto.Field(
+        proto.MESSAGE, number=259357782, message=shared_28.RegionSetLabelsRequest,
+    )
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class TestIamPermissionsRegionDiskRequest(proto.Message):
+    r"""A request message for RegionDisks.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
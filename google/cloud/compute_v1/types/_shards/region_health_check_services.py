@@ -0,0 +1,436 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the region_health_check_services service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteRegionHealthCheckServiceRequest",
+        "GetRegionHealthCheckServiceRequest",
+        "HealthCheckService",
+        "HealthCheckServicesList",
+        "InsertRegionHealthCheckServiceRequest",
+        "ListRegionHealthCheckServicesRequest",
+        "PatchRegionHealthCheckServiceRequest",
+    },
+)
+
+
+class DeleteRegionHealthCheckServiceRequest(proto.Message):
+    r"""A request message for RegionHealthCheckServices.Delete. See
+    the method description for details.
+
+    Attributes:
+        health_check_service (str):
+            Name of the HealthCheckService to delete. The
+            name must be 1-63 characters long, and comply
+            with RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    health_check_service = proto.Field(proto.STRING, number=408374747,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetRegionHealthCheckServiceRequest(proto.Message):
+    r"""A request message for RegionHealthCheckServices.Get. See the
+    method description for details.
+
+    Attributes:
+        health_check_service (str):
+            Name of the HealthCheckService to update. The
+            name must be 1-63 characters long, and comply
+            with RFC1035.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+    """
+
+    health_check_service = proto.Field(proto.STRING, number=408374747,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class HealthCheckService(proto.Message):
+    r"""Represents a Health-Check as a Service resource.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a HealthCheckService. An
+            up-to-date fingerprint must be provided in order
+            to patch/update the HealthCheckService;
+            Otherwise, the request will fail with error 412
+            conditionNotMet. To see the latest fingerprint,
+            make a get() request to retrieve the
+            HealthCheckService.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        health_checks (Sequence[str]):
+            A list of URLs to the HealthCheck resources. Must have at
+            least one HealthCheck, and not more than 10. HealthCheck
+            resources must have portSpecification=USE_SERVING_PORT or
+            portSpecification=USE_FIXED_PORT. For regional
+            HealthCheckService, the HealthCheck must be regional and in
+            the same region. For global HealthCheckService, HealthCheck
+            must be global. Mix of regional and global HealthChecks is
+            not supported. Multiple regional HealthChecks must belong to
+            the same region. Regional HealthChecks must belong to the
+            same region as zones of NEGs.
+        health_status_aggregation_policy (str):
+            Optional. Policy for how the results from multiple health
+            checks for the same endpoint are aggregated. Defaults to
+            NO_AGGREGATION if unspecified. - NO_AGGREGATION. An
+            EndpointHealth message is returned for each pair in the
+            health check service. - AND. If any health check of an
+            endpoint reports UNHEALTHY, then UNHEALTHY is the
+            HealthState of the endpoint. If all health checks report
+            HEALTHY, the HealthState of the endpoint is HEALTHY. . Check
+            the HealthStatusAggregationPolicy enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_health_status_aggregation_policy``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#healthCheckServicefor health check services.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network_endpoint_groups (Sequence[str]):
+            A list of URLs to the NetworkEndpointGroup
+            resources. Must not have more than 100. For
+            regional HealthCheckService, NEGs must be in
+            zones in the region of the HealthCheckService.
+        notification_endpoints (Sequence[str]):
+            A list of URLs to the NotificationEndpoint
+            resources. Must not have more than 10. A list of
+            endpoints for receiving notifications of change
+            in health status. For regional
+            HealthCheckService, NotificationEndpoint must be
+            regional and in the same region. For global
+            HealthCheckService, NotificationEndpoint must be
+            global.
+        region (str):
+            [Output Only] URL of the region where the health check
+            service resides. This field is not applicable to global
+            health check services. You must specify this field as part
+            of the HTTP request URL. It is not settable as a field in
+            the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    class HealthStatusAggregationPolicy(proto.Enum):
+        r"""Optional. Policy for how the results from multiple health checks for
+        the same endpoint are aggregated. Defaults to NO_AGGREGATION if
+        unspecified. - NO_AGGREGATION. An EndpointHealth message is returned
+        for each pair in the health check service. - AND. If any health
+        check of an endpoint reports UNHEALTHY, then UNHEALTHY is the
+        HealthState of the endpoint. If all health checks report HEALTHY,
+        the HealthState of the endpoint is HEALTHY. .
+        """
+        UNDEFINED_HEALTH_STATUS_AGGREGATION_POLICY = 0
+        AND = 64951
+        NO_AGGREGATION = 426445124
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    health_checks = proto.RepeatedField(proto.STRING, number=448370606,)
+    health_status_aggregation_policy = proto.Field(
+        proto.STRING, number=253163129, optional=True,
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network_endpoint_groups = proto.RepeatedField(proto.STRING, number=29346733,)
+    notification_endpoints = proto.RepeatedField(proto.STRING, number=406728490,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+
+
+class HealthCheckServicesList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.HealthCheckService]):
+            A list of HealthCheckService resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#healthCheckServicesList for lists of
+            HealthCheckServices.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="HealthCheckService",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class InsertRegionHealthCheckServiceRequest(proto.Message):
+    r"""A request message for RegionHealthCheckServices.Insert. See
+    the method description for details.
+
+    Attributes:
+        health_check_service_resource (google.cloud.compute_v1.types.HealthCheckService):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    health_check_service_resource = proto.Field(
+        proto.MESSAGE, number=477367794, message="HealthCheckService",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListRegionHealthCheckServicesRequest(proto.Message):
+    r"""A request message for RegionHealthCheckServices.List. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchRegionHealthCheckServiceRequest(proto.Message):
+    r"""A request message for RegionHealthCheckServices.Patch. See
+    the method description for details.
+
+    Attributes:
+        health_check_service (str):
+            Name of the HealthCheckService to update. The
+            name must be 1-63 characters long, and comply
+            with RFC1035.
+        health_check_service_resource (google.cloud.compute_v1.types.HealthCheckService):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    health_check_service = proto.Field(proto.STRING, number=408374747,)
+    health_check_service_resource = proto.Field(
+        proto.MESSAGE, number=477367794, message="HealthCheckService",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
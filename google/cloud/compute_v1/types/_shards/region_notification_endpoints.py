@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the region_notification_endpoints service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_11
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteRegionNotificationEndpointRequest",
+        "GetRegionNotificationEndpointRequest",
+        "InsertRegionNotificationEndpointRequest",
+        "ListRegionNotificationEndpointsRequest",
+        "NotificationEndpoint",
+        "NotificationEndpointGrpcSettings",
+        "NotificationEndpointList",
+    },
+)
+
+
+class DeleteRegionNotificationEndpointRequest(proto.Message):
+    r"""A request message for RegionNotificationEndpoints.Delete. See
+    the method description for details.
+
+    Attributes:
+        notification_endpoint (str):
+            Name of the NotificationEndpoint resource to
+            delete.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests. Specify a
+            unique request ID so that if you must retry your request,
+            the server will know to ignore the request if it has already
+            been completed. For example, consider a situation where you
+            make an initial request and the request times out. If you
+            make the request again with the same request ID, the server
+            can check if original operation with the same request ID was
+            received, and if so, will ignore the second request. This
+            prevents clients from accidentally creating duplicate
+            commitments. The request ID must be a valid UUID with the
+            exception that zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000). end_interface:
+            MixerMutationRequestBuilder
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    notification_endpoint = proto.Field(proto.STRING, number=376807017,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class GetRegionNotificationEndpointRequest(proto.Message):
+    r"""A request message for RegionNotificationEndpoints.Get. See
+    the method description for details.
+
+    Attributes:
+        notification_endpoint (str):
+            Name of the NotificationEndpoint resource to
+            return.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+    """
+
+    notification_endpoint = proto.Field(proto.STRING, number=376807017,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+
+
+class InsertRegionNotificationEndpointRequest(proto.Message):
+    r"""A request message for RegionNotificationEndpoints.Insert. See
+    the method description for details.
+
+    Attributes:
+        notification_endpoint_resource (google.cloud.compute_v1.types.NotificationEndpoint):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests. Specify a
+            unique request ID so that if you must retry your request,
+            the server will know to ignore the request if it has already
+            been completed. For example, consider a situation where you
+            make an initial request and the request times out. If you
+            make the request again with the same request ID, the server
+            can check if original operation with the same request ID was
+            received, and if so, will ignore the second request. This
+            prevents clients from accidentally creating duplicate
+            commitments. The request ID must be a valid UUID with the
+            exception that zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000). end_interface:
+            MixerMutationRequestBuilder
+
+            This field is a member of `oneof`_ ``_request_id``.
+    """
+
+    notification_endpoint_resource = proto.Field(
+        proto.MESSAGE, number=338459940, message="NotificationEndpoint",
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+
+
+class ListRegionNotificationEndpointsRequest(proto.Message):
+    r"""A request message for RegionNotificationEndpoints.List. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class NotificationEndpoint(proto.Message):
+    r"""Represents a notification endpoint. A notification endpoint
+    resource defines an endpoint to receive notifications when there
+    are status changes detected by the associated health check
+    service. For more information, see Health checks overview.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        grpc_settings (google.cloud.compute_v1.types.NotificationEndpointGrpcSettings):
+            Settings of the gRPC notification endpoint
+            including the endpoint URL and the retry
+            duration.
+
+            This field is a member of `oneof`_ ``_grpc_settings``.
+        id (int):
+            [Output Only] A unique identifier for this resource type.
+            The server generates this identifier.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#notificationEndpoint for notification endpoints.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+            [Output Only] URL of the region where the notification
+            endpoint resides. This field applies only to the regional
+            resource. You must specify this field as part of the HTTP
+            request URL. It is not settable as a field in the request
+            body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    grpc_settings = proto.Field(
+        proto.MESSAGE,
+        number=456139556,
+        optional=True,
+        message="NotificationEndpointGrpcSettings",
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+
+
+class NotificationEndpointGrpcSettings(proto.Message):
+    r"""Represents a gRPC setting that describes one gRPC
+    notification endpoint and the retry duration attempting to send
+    notification to this endpoint.
+
+    Attributes:
+        authority (str):
+            Optional. If specified, this field is used to
+            set the authority header by the sender of
+            notifications. See
+            https://tools.ietf.org/html/rfc7540#section-8.1.2.3
+
+            This field is a member of `oneof`_ ``_authority``.
+        endpoint (str):
+            Endpoint to which gRPC notifications are
+            sent. This must be a valid gRPCLB DNS name.
+
+            This field is a member of `oneof`_ ``_endpoint``.
+        payload_name (str):
+            Optional. If specified, this field is used to
+            populate the "name" field in gRPC requests.
+
+            This field is a member of `oneof`_ ``_payload_name``.
+        resend_interval (google.cloud.compute_v1.types.Duration):
+            Optional. This field is used to configure how
+            often to send a full update of all non-healthy
+            backends. If unspecified, full updates are not
+            sent. If specified, must be in the range between
+            600 seconds to 3600 seconds. Nanos are
+            disallowed.
+
+            This field is a member of `oneof`_ ``_resend_interval``.
+        retry_duration_sec (int):
+            How much time (in seconds) is spent
+            attempting notification retries until a
+            successful response is received. Default is 30s.
+            Limit is 20m (1200s). Must be a positive number.
+
+            This field is a member of `oneof`_ ``_retry_duration_sec``.
+    """
+
+    authority = proto.Field(proto.STRING, number=401868611, optional=True,)
+    endpoint = proto.Field(proto.STRING, number=130489749, optional=True,)
+    payload_name = proto.Field(proto.STRING, number=300358300, optional=True,)
+    resend_interval = proto.Field(
+        proto.MESSAGE, number=478288969, optional=True, message=shared_11.Duration,
+    )
+    retry_duration_sec = proto.Field(proto.UINT32, number=115681117, optional=True,)
+
+
+class NotificationEndpointList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.NotificationEndpoint]):
+            A list of NotificationEndpoint resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#notificationEndpoint for notification endpoints.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="NotificationEndpoint",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the region_url_maps service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_53
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteRegionUrlMapRequest",
+        "GetRegionUrlMapRequest",
+        "InsertRegionUrlMapRequest",
+        "ListRegionUrlMapsRequest",
+        "PatchRegionUrlMapRequest",
+        "RegionUrlMapsValidateRequest",
+        "UpdateRegionUrlMapRequest",
+        "ValidateRegionUrlMapRequest",
+    },
+)
+
+
+class DeleteRegionUrlMapRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            begin_interface: MixerMutationRequestBuilder Request ID to
+            support idempotency.
+
+            This field is a member of `oneof`_ ``_request_id``.
+        url_map (str):
+            Name of the UrlMap resource to delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    url_map = proto.Field(proto.STRING, number=367020684,)
+
+
+class GetRegionUrlMapRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        url_map (str):
+            Name of the UrlMap resource to return.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    url_map = proto.Field(proto.STRING, number=367020684,)
+
+
+class InsertRegionUrlMapRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            begin_interface: MixerMutationRequestBuilder Request ID to
+            support idempotency.
+
+            This field is a member of `oneof`_ ``_request_id``.
+        url_map_resource (google.cloud.compute_v1.types.UrlMap):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    url_map_resource = proto.Field(
+        proto.MESSAGE, number=168675425, message=shared_53.UrlMap,
+    )
+
+
+class ListRegionUrlMapsRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchRegionUrlMapRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.Patch. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            begin_interface: MixerMutationRequestBuilder Request ID to
+            support idempotency.
+
+            This field is a member of `oneof`_ ``_request_id``.
+        url_map (str):
+            Name of the UrlMap resource to patch.
+        url_map_resource (google.cloud.compute_v1.types.UrlMap):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    url_map = proto.Field(proto.STRING, number=367020684,)
+    url_map_resource = proto.Field(
+        proto.MESSAGE, number=168675425, message=shared_53.UrlMap,
+    )
+
+
+class RegionUrlMapsValidateRequest(proto.Message):
+    r"""
+
+    Attributes:
+        resource (google.cloud.compute_v1.types.UrlMap):
+            Content of the UrlMap to be validated.
+
+            This field is a member of `oneof`_ ``_resource``.
+    """
+
+    resource = proto.Field(
+        proto.MESSAGE, number=195806222, optional=True, message=shared_53.UrlMap,
+    )
+
+
+class UpdateRegionUrlMapRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.Update. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            begin_interface: MixerMutationRequestBuilder Request ID to
+            support idempotency.
+
+            This field is a member of `oneof`_ ``_request_id``.
+        url_map (str):
+            Name of the UrlMap resource to update.
+        url_map_resource (google.cloud.compute_v1.types.UrlMap):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    url_map = proto.Field(proto.STRING, number=367020684,)
+    url_map_resource = proto.Field(
+        proto.MESSAGE, number=168675425, message=shared_53.UrlMap,
+    )
+
+
+class ValidateRegionUrlMapRequest(proto.Message):
+    r"""A request message for RegionUrlMaps.Validate. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        region_url_maps_validate_request_resource (google.cloud.compute_v1.types.RegionUrlMapsValidateRequest):
+            The body resource for this request
+        url_map (str):
+            Name of the UrlMap resource to be validated
+            as.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_url_maps_validate_request_resource = proto.Field(
+        proto.MESSAGE, number=56632858, message="RegionUrlMapsValidateRequest",
+    )
+    url_map = proto.Field(proto.STRING, number=367020684,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,1041 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the resource_policies service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_13
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListResourcePoliciesRequest",
+        "DeleteResourcePolicyRequest",
+        "GetIamPolicyResourcePolicyRequest",
+        "GetResourcePolicyRequest",
+        "InsertResourcePolicyRequest",
+        "ListResourcePoliciesRequest",
+        "ResourcePoliciesScopedList",
+        "ResourcePolicy",
+        "ResourcePolicyAggregatedList",
+        "ResourcePolicyDailyCycle",
+        "ResourcePolicyGroupPlacementPolicy",
+        "ResourcePolicyHourlyCycle",
+        "ResourcePolicyInstanceSchedulePolicy",
+        "ResourcePolicyInstanceSchedulePolicySchedule",
+        "ResourcePolicyList",
+        "ResourcePolicyResourceStatus",
+        "ResourcePolicyResourceStatusInstanceSchedulePolicyStatus",
+        "ResourcePolicySnapshotSchedulePolicy",
+        "ResourcePolicySnapshotSchedulePolicyRetentionPolicy",
+        "ResourcePolicySnapshotSchedulePolicySchedule",
+        "ResourcePolicySnapshotSchedulePolicySnapshotProperties",
+        "ResourcePolicyWeeklyCycle",
+        "ResourcePolicyWeeklyCycleDayOfWeek",
+        "SetIamPolicyResourcePolicyRequest",
+        "TestIamPermissionsResourcePolicyRequest",
+    },
+)
+
+
+class AggregatedListResourcePoliciesRequest(proto.Message):
+    r"""A request message for ResourcePolicies.AggregatedList. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeleteResourcePolicyRequest(proto.Message):
+    r"""A request message for ResourcePolicies.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource_policy (str):
+            Name of the resource policy to delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    resource_policy = proto.Field(proto.STRING, number=159240835,)
+
+
+class GetIamPolicyResourcePolicyRequest(proto.Message):
+    r"""A request message for ResourcePolicies.GetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetResourcePolicyRequest(proto.Message):
+    r"""A request message for ResourcePolicies.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        resource_policy (str):
+            Name of the resource policy to retrieve.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource_policy = proto.Field(proto.STRING, number=159240835,)
+
+
+class InsertResourcePolicyRequest(proto.Message):
+    r"""A request message for ResourcePolicies.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        resource_policy_resource (google.cloud.compute_v1.types.ResourcePolicy):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    resource_policy_resource = proto.Field(
+        proto.MESSAGE, number=76826186, message="ResourcePolicy",
+    )
+
+
+class ListResourcePoliciesRequest(proto.Message):
+    r"""A request message for ResourcePolicies.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class ResourcePoliciesScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        resource_policies (Sequence[google.cloud.compute_v1.types.ResourcePolicy]):
+            A list of resourcePolicies contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of resourcePolicies when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    resource_policies = proto.RepeatedField(
+        proto.MESSAGE, number=22220385, message="ResourcePolicy",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ResourcePolicy(proto.Message):
+    r"""Represents a Resource Policy resource. You can use resource
+    policies to schedule actions for some Compute Engine resources.
+    For example, you can use them to schedule persistent disk
+    snapshots.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+
+            This field is a member of `oneof`_ ``_description``.
+        group_placement_policy (google.cloud.compute_v1.types.ResourcePolicyGroupPlacementPolicy):
+            Resource policy for instances for placement
+            configuration.
+
+            This field is a member of `oneof`_ ``_group_placement_policy``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        instance_schedule_policy (google.cloud.compute_v1.types.ResourcePolicyInstanceSchedulePolicy):
+            Resource policy for scheduling instance
+            operations.
+
+            This field is a member of `oneof`_ ``_instance_schedule_policy``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#resource_policies for resource policies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The resource name must be
+            1-63 characters long, and comply with RFC1035. Specifically,
+            the name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+
+            This field is a member of `oneof`_ ``_region``.
+        resource_status (google.cloud.compute_v1.types.ResourcePolicyResourceStatus):
+            [Output Only] The system status of the resource policy.
+
+            This field is a member of `oneof`_ ``_resource_status``.
+        self_link (str):
+            [Output Only] Server-defined fully-qualified URL for this
+            resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        snapshot_schedule_policy (google.cloud.compute_v1.types.ResourcePolicySnapshotSchedulePolicy):
+            Resource policy for persistent disks for
+            creating snapshots.
+
+            This field is a member of `oneof`_ ``_snapshot_schedule_policy``.
+        status (str):
+            [Output Only] The status of resource policy creation. Check
+            the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of resource policy creation."""
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        EXPIRED = 482489093
+        INVALID = 530283991
+        READY = 77848963
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    group_placement_policy = proto.Field(
+        proto.MESSAGE,
+        number=10931596,
+        optional=True,
+        message="ResourcePolicyGroupPlacementPolicy",
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    instance_schedule_policy = proto.Field(
+        proto.MESSAGE,
+        number=344877104,
+        optional=True,
+        message="ResourcePolicyInstanceSchedulePolicy",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    resource_status = proto.Field(
+        proto.MESSAGE,
+        number=249429315,
+        optional=True,
+        message="ResourcePolicyResourceStatus",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    snapshot_schedule_policy = proto.Field(
+        proto.MESSAGE,
+        number=218131295,
+        optional=True,
+        message="ResourcePolicySnapshotSchedulePolicy",
+    )
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+
+
+class ResourcePolicyAggregatedList(proto.Message):
+    r"""Contains a list of resourcePolicies.
+
+    Attributes:
+        etag (str):
+
+            This field is a member of `oneof`_ ``_etag``.
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.ResourcePolicyAggregatedList.ItemsEntry]):
+            A list of ResourcePolicy resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    etag = proto.Field(proto.STRING, number=3123477, optional=True,)
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=100526016,
+        message="ResourcePoliciesScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ResourcePolicyDailyCycle(proto.Message):
+    r"""Time window specified for daily operations.
+
+    Attributes:
+        days_in_cycle (int):
+            Defines a schedule with units measured in
+            months. The value determines how many months
+            pass between the start of each cycle.
+
+            This field is a member of `oneof`_ ``_days_in_cycle``.
+        duration (str):
+            [Output only] A predetermined duration for the window,
+            automatically chosen to be the smallest possible in the
+            given scenario.
+
+            This field is a member of `oneof`_ ``_duration``.
+        start_time (str):
+            Start time of the window. This must be in UTC
+            format that resolves to one of 00:00, 04:00,
+            08:00, 12:00, 16:00, or 20:00. For example, both
+            13:00-5 and 08:00 are valid.
+
+            This field is a member of `oneof`_ ``_start_time``.
+    """
+
+    days_in_cycle = proto.Field(proto.INT32, number=369790004, optional=True,)
+    duration = proto.Field(proto.STRING, number=155471252, optional=True,)
+    start_time = proto.Field(proto.STRING, number=37467274, optional=True,)
+
+
+class ResourcePolicyGroupPlacementPolicy(proto.Message):
+    r"""A GroupPlacementPolicy specifies resource placement
+    configuration. It specifies the failure bucket separation as
+    well as network locality
+
+    Attributes:
+        availability_domain_count (int):
+            The number of availability domains instances
+            will be spread across. If two instances are in
+            different availability domain, they will not be
+            put in the same low latency network
+
+            This field is a member of `oneof`_ ``_availability_domain_count``.
+        collocation (str):
+            Specifies network collocation
+            Check the Collocation enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_collocation``.
+        vm_count (int):
+            Number of vms in this placement group
+
+            This field is a member of `oneof`_ ``_vm_count``.
+    """
+
+    class Collocation(proto.Enum):
+        r"""Specifies network collocation"""
+        UNDEFINED_COLLOCATION = 0
+        COLLOCATED = 103257554
+        UNSPECIFIED_COLLOCATION = 464308205
+
+    availability_domain_count = proto.Field(
+        proto.INT32, number=12453432, optional=True,
+    )
+    collocation = proto.Field(proto.STRING, number=511156533, optional=True,)
+    vm_count = proto.Field(proto.INT32, number=261463431, optional=True,)
+
+
+class ResourcePolicyHourlyCycle(proto.Message):
+    r"""Time window specified for hourly operations.
+
+    Attributes:
+        duration (str):
+            [Output only] Duration of the time window, automatically
+            chosen to be smallest possible in the given scenario.
+
+            This field is a member of `oneof`_ ``_duration``.
+        hours_in_cycle (int):
+            Defines a schedule with units measured in
+            hours. The value determines how many hours pass
+            between the start of each cycle.
+
+            This field is a member of `oneof`_ ``_hours_in_cycle``.
+        start_time (str):
+            Time within the window to start the operations. It must be
+            in format "HH:MM", where HH : [00-23] and MM : [00-00] GMT.
+
+            This field is a member of `oneof`_ ``_start_time``.
+    """
+
+    duration = proto.Field(proto.STRING, number=155471252, optional=True,)
+    hours_in_cycle = proto.Field(proto.INT32, number=526763132, optional=True,)
+    start_time = proto.Field(proto.STRING, number=37467274, optional=True,)
+
+
+class ResourcePolicyInstanceSchedulePolicy(proto.Message):
+    r"""An InstanceSchedulePolicy specifies when and how frequent
+    certain operations are performed on the instance.
+
+    Attributes:
+        expiration_time (str):
+            The expiration time of the schedule. The
+            timestamp is an RFC3339 string.
+
+            This field is a member of `oneof`_ ``_expiration_time``.
+        start_time (str):
+            The start time of the schedule. The timestamp
+            is an RFC3339 string.
+
+            This field is a member of `oneof`_ ``_start_time``.
+        time_zone (str):
+            Specifies the time zone to be used in interpreting
+            Schedule.schedule. The value of this field must be a time
+            zone name from the tz database:
+            http://en.wikipedia.org/wiki/Tz_database.
+
+            This field is a member of `oneof`_ ``_time_zone``.
+        vm_start_schedule (google.cloud.compute_v1.types.ResourcePolicyInstanceSchedulePolicySchedule):
+            Specifies the schedule for starting
+            instances.
+
+            This field is a member of `oneof`_ ``_vm_start_schedule``.
+        vm_stop_schedule (google.cloud.compute_v1.types.ResourcePolicyInstanceSchedulePolicySchedule):
+            Specifies the schedule for stopping
+            instances.
+
+            This field is a member of `oneof`_ ``_vm_stop_schedule``.
+    """
+
+    expiration_time = proto.Field(proto.STRING, number=230299229, optional=True,)
+    start_time = proto.Field(proto.STRING, number=37467274, optional=True,)
+    time_zone = proto.Field(proto.STRING, number=36848094, optional=True,)
+    vm_start_schedule = proto.Field(
+        proto.MESSAGE,
+        number=17762396,
+        optional=True,
+        message="ResourcePolicyInstanceSchedulePolicySchedule",
+    )
+    vm_stop_schedule = proto.Field(
+        proto.MESSAGE,
+        number=426242732,
+        optional=True,
+        message="ResourcePolicyInstanceSchedulePolicySchedule",
+    )
+
+
+class ResourcePolicyInstanceSchedulePolicySchedule(proto.Message):
+    r"""Schedule for an instance operation.
+
+    Attributes:
+        schedule (str):
+            Specifies the frequency for the operation,
+            using the unix-cron format.
+
+            This field is a member of `oneof`_ ``_schedule``.
+    """
+
+    schedule = proto.Field(proto.STRING, number=375820951, optional=True,)
+
+
+class ResourcePolicyList(proto.Message):
+    r"""
+
+    Attributes:
+        etag (str):
+
+            This field is a member of `oneof`_ ``_etag``.
+        id (str):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.ResourcePolicy]):
+            [Output Only] A list of ResourcePolicy resources.
+        kind (str):
+            [Output Only] Type of resource.Always
+            compute#resourcePoliciesList for listsof resourcePolicies
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    etag = proto.Field(proto.STRING, number=3123477, optional=True,)
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="ResourcePolicy",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class ResourcePolicyResourceStatus(proto.Message):
+    r"""Contains output only fields. Use this sub-message for all
+    output fields set on ResourcePolicy. The internal structure of
+    this "status" field should mimic the structure of ResourcePolicy
+    proto specification.
+
+    Attributes:
+        instance_schedule_policy (google.cloud.compute_v1.types.ResourcePolicyResourceStatusInstanceSchedulePolicyStatus):
+            [Output Only] Specifies a set of output values reffering to
+            the instance_schedule_policy system status. This field
+            should have the same name as corresponding policy field.
+
+            This field is a member of `oneof`_ ``_instance_schedule_policy``.
+    """
+
+    instance_schedule_policy = proto.Field(
+        proto.MESSAGE,
+        number=344877104,
+        optional=True,
+        message="ResourcePolicyResourceStatusInstanceSchedulePolicyStatus",
+    )
+
+
+class ResourcePolicyResourceStatusInstanceSchedulePolicyStatus(proto.Message):
+    r"""
+
+    Attributes:
+        last_run_start_time (str):
+            [Output Only] The last time the schedule successfully ran.
+            The timestamp is an RFC3339 string.
+
+            This field is a member of `oneof`_ ``_last_run_start_time``.
+        next_run_start_time (str):
+            [Output Only] The next time the schedule is planned to run.
+            The actual time might be slightly different. The timestamp
+            is an RFC3339 string.
+
+            This field is a member of `oneof`_ ``_next_run_start_time``.
+    """
+
+    last_run_start_time = proto.Field(proto.STRING, number=303069063, optional=True,)
+    next_run_start_time = proto.Field(proto.STRING, number=318642570, optional=True,)
+
+
+class ResourcePolicySnapshotSchedulePolicy(proto.Message):
+    r"""A snapshot schedule policy specifies when and how frequently
+    snapshots are to be created for the target disk. Also specifies
+    how many and how long these scheduled snapshots should be
+    retained.
+
+    Attributes:
+        retention_policy (google.cloud.compute_v1.types.ResourcePolicySnapshotSchedulePolicyRetentionPolicy):
+            Retention policy applied to snapshots created
+            by this resource policy.
+
+            This field is a member of `oneof`_ ``_retention_policy``.
+        schedule (google.cloud.compute_v1.types.ResourcePolicySnapshotSchedulePolicySchedule):
+            A Vm Maintenance Policy specifies what kind
+            of infrastructure maintenance we are allowed to
+            perform on this VM and when. Schedule that is
+            applied to disks covered by this policy.
+
+            This field is a member of `oneof`_ ``_schedule``.
+        snapshot_properties (google.cloud.compute_v1.types.ResourcePolicySnapshotSchedulePolicySnapshotProperties):
+            Properties with which snapshots are created
+            such as labels, encryption keys.
+
+            This field is a member of `oneof`_ ``_snapshot_properties``.
+    """
+
+    retention_policy = proto.Field(
+        proto.MESSAGE,
+        number=68625779,
+        optional=True,
+        message="ResourcePolicySnapshotSchedulePolicyRetentionPolicy",
+    )
+    schedule = proto.Field(
+        proto.MESSAGE,
+        number=375820951,
+        optional=True,
+        message="ResourcePolicySnapshotSchedulePolicySchedule",
+    )
+    snapshot_properties = proto.Field(
+        proto.MESSAGE,
+        number=185371278,
+        optional=True,
+        message="ResourcePolicySnapshotSchedulePolicySnapshotProperties",
+    )
+
+
+class ResourcePolicySnapshotSchedulePolicyRetentionPolicy(proto.Message):
+    r"""Policy for retention of scheduled snapshots.
+
+    Attributes:
+        max_retention_days (int):
+            Maximum age of the snapshot that is allowed
+            to be kept.
+
+            This field is a member of `oneof`_ ``_max_retention_days``.
+        on_source_disk_delete (str):
+            Specifies the behavior to apply to scheduled
+            snapshots when the source disk is deleted. Check
+            the OnSourceDiskDelete enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_on_source_disk_delete``.
+    """
+
+    class OnSourceDiskDelete(proto.Enum):
+        r"""Specifies the behavior to apply to scheduled snapshots when
+        the source disk is deleted.
+        """
+        UNDEFINED_ON_SOURCE_DISK_DELETE = 0
+        APPLY_RETENTION_POLICY = 535071332
+        KEEP_AUTO_SNAPSHOTS = 258925689
+        UNSPECIFIED_ON_SOURCE_DISK_DELETE = 239140769
+
+    max_retention_days = proto.Field(proto.INT32, number=324296979, optional=True,)
+    on_source_disk_delete = proto.Field(proto.STRING, number=321955529, optional=True,)
+
+
+class ResourcePolicySnapshotSchedulePolicySchedule(proto.Message):
+    r"""A schedule for disks where the schedueled operations are
+    performed.
+
+    Attributes:
+        daily_schedule (google.cloud.compute_v1.types.ResourcePolicyDailyCycle):
+
+            This field is a member of `oneof`_ ``_daily_schedule``.
+        hourly_schedule (google.cloud.compute_v1.types.ResourcePolicyHourlyCycle):
+
+            This field is a member of `oneof`_ ``_hourly_schedule``.
+        weekly_schedule (google.cloud.compute_v1.types.ResourcePolicyWeeklyCycle):
+
+            This field is a member of `oneof`_ ``_weekly_schedule``.
+    """
+
+    daily_schedule = proto.Field(
+        proto.MESSAGE,
+        number=86159869,
+        optional=True,
+        message="ResourcePolicyDailyCycle",
+    )
+    hourly_schedule = proto.Field(
+        proto.MESSAGE,
+        number=38328485,
+        optional=True,
+        message="ResourcePolicyHourlyCycle",
+    )
+    weekly_schedule = proto.Field(
+        proto.MESSAGE,
+        number=359548053,
+        optional=True,
+        message="ResourcePolicyWeeklyCycle",
+    )
+
+
+class ResourcePolicySnapshotSchedulePolicySnapshotProperties(proto.Message):
+    r"""Specified snapshot properties for scheduled snapshots created
+    by this policy.
+
+    Attributes:
+        chain_name (str):
+            Chain name that the snapshot is created in.
+
+            This field is a member of `oneof`_ ``_chain_name``.
+        guest_flush (bool):
+            Indication to perform a 'guest aware'
+            snapshot.
+
+            This field is a member of `oneof`_ ``_guest_flush``.
+        labels (Sequence[google.cloud.compute_v1.types.ResourcePolicySnapshotSchedulePolicySnapshotProperties.LabelsEntry]):
+            Labels to apply to scheduled snapshots. These
+            can be later modified by the setLabels method.
+            Label values may be empty.
+        storage_locations (Sequence[str]):
+            Cloud Storage bucket storage location of the
+            auto snapshot (regional or multi-regional).
+    """
+
+    chain_name = proto.Field(proto.STRING, number=68644169, optional=True,)
+    guest_flush = proto.Field(proto.BOOL, number=385550813, optional=True,)
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+    storage_locations = proto.RepeatedField(proto.STRING, number=328005274,)
+
+
+class ResourcePolicyWeeklyCycle(proto.Message):
+    r"""Time window specified for weekly operations.
+
+    Attributes:
+        day_of_weeks (Sequence[google.cloud.compute_v1.types.ResourcePolicyWeeklyCycleDayOfWeek]):
+            Up to 7 intervals/windows, one for each day
+            of the week.
+    """
+
+    day_of_weeks = proto.RepeatedField(
+        proto.MESSAGE, number=257871834, message="ResourcePolicyWeeklyCycleDayOfWeek",
+    )
+
+
+class ResourcePolicyWeeklyCycleDayOfWeek(proto.Message):
+    r"""
+
+    Attributes:
+        day (str):
+            Defines a schedule that runs on specific days
+            of the week. Specify one or more days. The
+            following options are available: MONDAY,
+            TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY,
+            SUNDAY. Check the Day enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_day``.
+        duration (str):
+            [Output only] Duration of the time window, automatically
+            chosen to be smallest possible in the given scenario.
+
+            This field is a member of `oneof`_ ``_duration``.
+        start_time (str):
+            Time within the window to start the operations. It must be
+            in format "HH:MM", where HH : [00-23] and MM : [00-00] GMT.
+
+            This field is a member of `oneof`_ ``_start_time``.
+    """
+
+    class Day(proto.Enum):
+        r"""Defines a schedule that runs on specific days of the week.
+        Specify one or more days. The following options are available:
+        MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY.
+        """
+        UNDEFINED_DAY = 0
+        FRIDAY = 471398751
+        INVALID = 530283991
+        MONDAY = 132310288
+        SATURDAY = 279037881
+        SUNDAY = 309626320
+        THURSDAY = 207198682
+        TUESDAY = 277509677
+        WEDNESDAY = 422029110
+
+    day = proto.Field(proto.STRING, number=99228, optional=True,)
+    duration = proto.Field(proto.STRING, number=155471252, optional=True,)
+    start_time = proto.Field(proto.STRING, number=37467274, optional=True,)
+
+
+class SetIamPolicyResourcePolicyRequest(proto.Message):
+    r"""A request message for ResourcePolicies.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_set_policy_request_resource (google.cloud.compute_v1.types.RegionSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=276489091, message=shared_13.RegionSetPolicyRequest,
+    )
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class TestIamPermissionsResourcePolicyRequest(proto.Message):
+    r"""A request message for ResourcePolicies.TestIamPermissions.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,1854 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the routers service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_54
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListRoutersRequest",
+        "DeleteRouterRequest",
+        "GetNatMappingInfoRoutersRequest",
+        "GetRouterRequest",
+        "GetRouterStatusRouterRequest",
+        "InsertRouterRequest",
+        "ListRoutersRequest",
+        "PatchRouterRequest",
+        "PreviewRouterRequest",
+        "Router",
+        "RouterAdvertisedIpRange",
+        "RouterAggregatedList",
+        "RouterBgp",
+        "RouterBgpPeer",
+        "RouterBgpPeerBfd",
+        "RouterInterface",
+        "RouterList",
+        "RouterNat",
+        "RouterNatLogConfig",
+        "RouterNatRule",
+        "RouterNatRuleAction",
+        "RouterNatSubnetworkToNat",
+        "RouterStatus",
+        "RouterStatusBgpPeerStatus",
+        "RouterStatusNatStatus",
+        "RouterStatusNatStatusNatRuleStatus",
+        "RouterStatusResponse",
+        "RoutersPreviewResponse",
+        "RoutersScopedList",
+        "UpdateRouterRequest",
+        "VmEndpointNatMappings",
+        "VmEndpointNatMappingsInterfaceNatMappings",
+        "VmEndpointNatMappingsList",
+    },
+)
+
+
+class AggregatedListRoutersRequest(proto.Message):
+    r"""A request message for Routers.AggregatedList. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeleteRouterRequest(proto.Message):
+    r"""A request message for Routers.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router (str):
+            Name of the Router resource to delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    router = proto.Field(proto.STRING, number=148608841,)
+
+
+class GetNatMappingInfoRoutersRequest(proto.Message):
+    r"""A request message for Routers.GetNatMappingInfo. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+        router (str):
+            Name of the Router resource to query for Nat
+            Mapping information of VM endpoints.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+    router = proto.Field(proto.STRING, number=148608841,)
+
+
+class GetRouterRequest(proto.Message):
+    r"""A request message for Routers.Get. See the method description
+    for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to return.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    router = proto.Field(proto.STRING, number=148608841,)
+
+
+class GetRouterStatusRouterRequest(proto.Message):
+    r"""A request message for Routers.GetRouterStatus. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to query.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    router = proto.Field(proto.STRING, number=148608841,)
+
+
+class InsertRouterRequest(proto.Message):
+    r"""A request message for Routers.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    router_resource = proto.Field(proto.MESSAGE, number=155222084, message="Router",)
+
+
+class ListRoutersRequest(proto.Message):
+    r"""A request message for Routers.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchRouterRequest(proto.Message):
+    r"""A request message for Routers.Patch. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router (str):
+            Name of the Router resource to patch.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    router = proto.Field(proto.STRING, number=148608841,)
+    router_resource = proto.Field(proto.MESSAGE, number=155222084, message="Router",)
+
+
+class PreviewRouterRequest(proto.Message):
+    r"""A request message for Routers.Preview. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        router (str):
+            Name of the Router resource to query.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    router = proto.Field(proto.STRING, number=148608841,)
+    router_resource = proto.Field(proto.MESSAGE, number=155222084, message="Router",)
+
+
+class Router(proto.Message):
+    r"""Represents a Cloud Router resource. For more information
+    about Cloud Router, read the Cloud Router overview.
+
+    Attributes:
+        bgp (google.cloud.compute_v1.types.RouterBgp):
+            BGP information specific to this router.
+
+            This field is a member of `oneof`_ ``_bgp``.
+        bgp_peers (Sequence[google.cloud.compute_v1.types.RouterBgpPeer]):
+            BGP information that must be configured into
+            the routing stack to establish BGP peering. This
+            information must specify the peer ASN and either
+            the interface name, IP address, or peer IP
+            address. Please refer to RFC4273.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        encrypted_interconnect_router (bool):
+            Indicates if a router is dedicated for use
+            with encrypted VLAN attachments
+            (interconnectAttachments). Not currently
+            available publicly.
+
+            This field is a member of `oneof`_ ``_encrypted_interconnect_router``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        interfaces (Sequence[google.cloud.compute_v1.types.RouterInterface]):
+            Router interfaces. Each interface requires
+            either one linked resource, (for example,
+            linkedVpnTunnel), or IP address and IP address
+            range (for example, ipRange), or both.
+        kind (str):
+            [Output Only] Type of resource. Always compute#router for
+            routers.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        nats (Sequence[google.cloud.compute_v1.types.RouterNat]):
+            A list of NAT services created in this
+            router.
+        network (str):
+            URI of the network to which this router
+            belongs.
+
+            This field is a member of `oneof`_ ``_network``.
+        region (str):
+            [Output Only] URI of the region where the router resides.
+            You must specify this field as part of the HTTP request URL.
+            It is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    bgp = proto.Field(proto.MESSAGE, number=97483, optional=True, message="RouterBgp",)
+    bgp_peers = proto.RepeatedField(
+        proto.MESSAGE, number=452695773, message="RouterBgpPeer",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    encrypted_interconnect_router = proto.Field(
+        proto.BOOL, number=297996575, optional=True,
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    interfaces = proto.RepeatedField(
+        proto.MESSAGE, number=12073562, message="RouterInterface",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    nats = proto.RepeatedField(proto.MESSAGE, number=3373938, message="RouterNat",)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+
+
+class RouterAdvertisedIpRange(proto.Message):
+    r"""Description-tagged IP ranges for the router to advertise.
+
+    Attributes:
+        description (str):
+            User-specified description for the IP range.
+
+            This field is a member of `oneof`_ ``_description``.
+        range_ (str):
+            The IP range to advertise. The value must be
+            a CIDR-formatted string.
+
+            This field is a member of `oneof`_ ``_range``.
+    """
+
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    range_ = proto.Field(proto.STRING, number=108280125, optional=True,)
+
+
+class RouterAggregatedList(proto.Message):
+    r"""Contains a list of routers.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.RouterAggregatedList.ItemsEntry]):
+            A list of Router resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=100526016, message="RoutersScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class RouterBgp(proto.Message):
+    r"""
+
+    Attributes:
+        advertise_mode (str):
+            User-specified flag to indicate which mode to
+            use for advertisement. The options are DEFAULT
+            or CUSTOM. Check the AdvertiseMode enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_advertise_mode``.
+        advertised_groups (Sequence[str]):
+            User-specified list of prefix groups to advertise in custom
+            mode. This field can only be populated if advertise_mode is
+            CUSTOM and is advertised to all peers of the router. These
+            groups will be advertised in addition to any specified
+            prefixes. Leave this field blank to advertise no custom
+            groups. Check the AdvertisedGroups enum for the list of
+            possible values.
+        advertised_ip_ranges (Sequence[google.cloud.compute_v1.types.RouterAdvertisedIpRange]):
+            User-specified list of individual IP ranges to advertise in
+            custom mode. This field can only be populated if
+            advertise_mode is CUSTOM and is advertised to all peers of
+            the router. These IP ranges will be advertised in addition
+            to any specified groups. Leave this field blank to advertise
+            no custom IP ranges.
+        asn (int):
+            Local BGP Autonomous System Number (ASN).
+            Must be an RFC6996 private ASN, either 16-bit or
+            32-bit. The value will be fixed for this router
+            resource. All VPN tunnels that link to this
+            router will have the same local ASN.
+
+            This field is a member of `oneof`_ ``_asn``.
+        keepalive_interval (int):
+            The interval in seconds between BGP keepalive
+            messages that are sent to the peer. Hold time is
+            three times the interval at which keepalive
+            messages are sent, and the hold time is the
+            maximum number of seconds allowed to elapse
+            between successive keepalive messages that BGP
+            receives from a peer. BGP will use the smaller
+            of either the local hold time value or the
+            peer's hold time value as the hold time for the
+            BGP connection between the two peers. If set,
+            this value must be between 20 and 60. The
+            default is 20.
+
+            This field is a member of `oneof`_ ``_keepalive_interval``.
+    """
+
+    class AdvertiseMode(proto.Enum):
+        r"""User-specified flag to indicate which mode to use for
+        advertisement. The options are DEFAULT or CUSTOM.
+        """
+        UNDEFINED_ADVERTISE_MODE = 0
+        CUSTOM = 388595569
+        DEFAULT = 115302945
+
+    class AdvertisedGroups(proto.Enum):
+        r""""""
+        UNDEFINED_ADVERTISED_GROUPS = 0
+        ALL_SUBNETS = 3622872
+
+    advertise_mode = proto.Field(proto.STRING, number=312134331, optional=True,)
+    advertised_groups = proto.RepeatedField(proto.STRING, number=21065526,)
+    advertised_ip_ranges = proto.RepeatedField(
+        proto.MESSAGE, number=35449932, message="RouterAdvertisedIpRange",
+    )
+    asn = proto.Field(proto.UINT32, number=96892, optional=True,)
+    keepalive_interval = proto.Field(proto.UINT32, number=276771516, optional=True,)
+
+
+class RouterBgpPeer(proto.Message):
+    r"""
+
+    Attributes:
+        advertise_mode (str):
+            User-specified flag to indicate which mode to
+            use for advertisement. Check the AdvertiseMode
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_advertise_mode``.
+        advertised_groups (Sequence[str]):
+            User-specified list of prefix groups to advertise in custom
+            mode, which can take one of the following options: -
+            ALL_SUBNETS: Advertises all available subnets, including
+            peer VPC subnets. - ALL_VPC_SUBNETS: Advertises the router's
+            own VPC subnets. Note that this field can only be populated
+            if advertise_mode is CUSTOM and overrides the list defined
+            for the router (in the "bgp" message). These groups are
+            advertised in addition to any specified prefixes. Leave this
+            field blank to advertise no custom groups. Check the
+            AdvertisedGroups enum for the list of possible values.
+        advertised_ip_ranges (Sequence[google.cloud.compute_v1.types.RouterAdvertisedIpRange]):
+            User-specified list of individual IP ranges to advertise in
+            custom mode. This field can only be populated if
+            advertise_mode is CUSTOM and overrides the list defined for
+            the router (in the "bgp" message). These IP ranges are
+            advertised in addition to any specified groups. Leave this
+            field blank to advertise no custom IP ranges.
+        advertised_route_priority (int):
+            The priority of routes advertised to this BGP
+            peer. Where there is more than one matching
+            route of maximum length, the routes with the
+            lowest priority value win.
+
+            This field is a member of `oneof`_ ``_advertised_route_priority``.
+        bfd (google.cloud.compute_v1.types.RouterBgpPeerBfd):
+            BFD configuration for the BGP peering.
+
+            This field is a member of `oneof`_ ``_bfd``.
+        enable (str):
+            The status of the BGP peer connection. If set
+            to FALSE, any active session with the peer is
+            terminated and all associated routing
+            information is removed. If set to TRUE, the peer
+            connection can be established with routing
+            information. The default is TRUE. Check the
+            Enable enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_enable``.
+        interface_name (str):
+            Name of the interface the BGP peer is
+            associated with.
+
+            This field is a member of `oneof`_ ``_interface_name``.
+        ip_address (str):
+            IP address of the interface inside Google
+            Cloud Platform. Only IPv4 is supported.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        management_type (str):
+            [Output Only] The resource that configures and manages this
+            BGP peer. - MANAGED_BY_USER is the default value and can be
+            managed by you or other users - MANAGED_BY_ATTACHMENT is a
+            BGP peer that is configured and managed by Cloud
+            Interconnect, specifically by an InterconnectAttachment of
+            type PARTNER. Google automatically creates, updates, and
+            deletes this type of BGP peer when the PARTNER
+            InterconnectAttachment is created, updated, or deleted.
+            Check the ManagementType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_management_type``.
+        name (str):
+            Name of this BGP peer. The name must be 1-63 characters
+            long, and comply with RFC1035. Specifically, the name must
+            be 1-63 characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        peer_asn (int):
+            Peer BGP Autonomous System Number (ASN). Each
+            BGP interface may use a different value.
+
+            This field is a member of `oneof`_ ``_peer_asn``.
+        peer_ip_address (str):
+            IP address of the BGP interface outside
+            Google Cloud Platform. Only IPv4 is supported.
+
+            This field is a member of `oneof`_ ``_peer_ip_address``.
+        router_appliance_instance (str):
+            URI of the VM instance that is used as third-
+            arty router appliances such as Next Gen
+            Firewalls, Virtual Routers, or Router
+            Appliances. The VM instance must be located in
+            zones contained in the same region as this Cloud
+            Router. The VM instance is the peer side of the
+            BGP session.
+
+            This field is a member of `oneof`_ ``_router_appliance_instance``.
+    """
+
+    class AdvertiseMode(proto.Enum):
+        r"""User-specified flag to indicate which mode to use for
+        advertisement.
+        """
+        UNDEFINED_ADVERTISE_MODE = 0
+        CUSTOM = 388595569
+        DEFAULT = 115302945
+
+    class AdvertisedGroups(proto.Enum):
+        r""""""
+        UNDEFINED_ADVERTISED_GROUPS = 0
+        ALL_SUBNETS = 3622872
+
+    class Enable(proto.Enum):
+        r"""The status of the BGP peer connection. If set to FALSE, any
+        active session with the peer is terminated and all associated
+        routing information is removed. If set to TRUE, the peer
+        connection can be established with routing information. The
+        default is TRUE.
+        """
+        UNDEFINED_ENABLE = 0
+        FALSE = 66658563
+        TRUE = 2583950
+
+    class ManagementType(proto.Enum):
+        r"""[Output Only] The resource that configures and manages this BGP
+        peer. - MANAGED_BY_USER is the default value and can be managed by
+        you or other users - MANAGED_BY_ATTACHMENT is a BGP peer that is
+        configured and managed by Cloud Interconnect, specifically by an
+        InterconnectAttachment of type PARTNER. Google automatically
+        creates, updates, and deletes this type of BGP peer when the PARTNER
+        InterconnectAttachment is created, updated, or deleted.
+        """
+        UNDEFINED_MANAGEMENT_TYPE = 0
+        MANAGED_BY_ATTACHMENT = 458926411
+        MANAGED_BY_USER = 317294067
+
+    advertise_mode = proto.Field(proto.STRING, number=312134331, optional=True,)
+    advertised_groups = proto.RepeatedField(proto.STRING, number=21065526,)
+    advertised_ip_ranges = proto.RepeatedField(
+        proto.MESSAGE, number=35449932, message="RouterAdvertisedIpRange",
+    )
+    advertised_route_priority = proto.Field(
+        proto.UINT32, number=186486332, optional=True,
+    )
+    bfd = proto.Field(
+        proto.MESSAGE, number=97440, optional=True, message="RouterBgpPeerBfd",
+    )
+    enable = proto.Field(proto.STRING, number=311764355, optional=True,)
+    interface_name = proto.Field(proto.STRING, number=437854673, optional=True,)
+    ip_address = proto.Field(proto.STRING, number=406272220, optional=True,)
+    management_type = proto.Field(proto.STRING, number=173703606, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    peer_asn = proto.Field(proto.UINT32, number=69573151, optional=True,)
+    peer_ip_address = proto.Field(proto.STRING, number=207735769, optional=True,)
+    router_appliance_instance = proto.Field(
+        proto.STRING, number=468312989, optional=True,
+    )
+
+
+class RouterBgpPeerBfd(proto.Message):
+    r"""
+
+    Attributes:
+        min_receive_interval (int):
+            The minimum interval, in milliseconds,
+            between BFD control packets received from the
+            peer router. The actual value is negotiated
+            between the two routers and is equal to the
+            greater of this value and the transmit interval
+            of the other router. If set, this value must be
+            between 1000 and 30000. The default is 1000.
+
+            This field is a member of `oneof`_ ``_min_receive_interval``.
+        min_transmit_interval (int):
+            The minimum interval, in milliseconds,
+            between BFD control packets transmitted to the
+            peer router. The actual value is negotiated
+            between the two routers and is equal to the
+            greater of this value and the corresponding
+            receive interval of the other router. If set,
+            this value must be between 1000 and 30000. The
+            default is 1000.
+
+            This field is a member of `oneof`_ ``_min_transmit_interval``.
+        multiplier (int):
+            The number of consecutive BFD packets that
+            must be missed before BFD declares that a peer
+            is unavailable. If set, the value must be a
+            value between 5 and 16. The default is 5.
+
+            This field is a member of `oneof`_ ``_multiplier``.
+        session_initialization_mode (str):
+            The BFD session initialization mode for this
+            BGP peer. If set to ACTIVE, the Cloud Router
+            will initiate the BFD session for this BGP peer.
+            If set to PASSIVE, the Cloud Router will wait
+            for the peer router to initiate the BFD session
+            for this BGP peer. If set to DISABLED, BFD is
+            disabled for this BGP peer. The default is
+            PASSIVE. Check the SessionInitializationMode
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_session_initialization_mode``.
+    """
+
+    class SessionInitializationMode(proto.Enum):
+        r"""The BFD session initialization mode for this BGP peer. If set
+        to ACTIVE, the Cloud Router will initiate the BFD session for
+        this BGP peer. If set to PASSIVE, the Cloud Router will wait for
+        the peer router to initiate the BFD session for this BGP peer.
+        If set to DISABLED, BFD is disabled for this BGP peer. The
+        default is PASSIVE.
+        """
+        UNDEFINED_SESSION_INITIALIZATION_MODE = 0
+        ACTIVE = 314733318
+        DISABLED = 516696700
+        PASSIVE = 462813959
+
+    min_receive_interval = proto.Field(proto.UINT32, number=186981614, optional=True,)
+    min_transmit_interval = proto.Field(proto.UINT32, number=523282631, optional=True,)
+    multiplier = proto.Field(proto.UINT32, number=191331777, optional=True,)
+    session_initialization_mode = proto.Field(
+        proto.STRING, number=105957049, optional=True,
+    )
+
+
+class RouterInterface(proto.Message):
+    r"""
+
+    Attributes:
+        ip_range (str):
+            IP address and range of the interface. The IP
+            range must be in the RFC3927 link-local IP
+            address space. The value must be a CIDR-
+            formatted string, for example: 169.254.0.1/30.
+            NOTE: Do not truncate the address as it
+            represents the IP address of the interface.
+
+            This field is a member of `oneof`_ ``_ip_range``.
+        linked_interconnect_attachment (str):
+            URI of the linked Interconnect attachment. It
+            must be in the same region as the router. Each
+            interface can have one linked resource, which
+            can be a VPN tunnel, an Interconnect attachment,
+            or a virtual machine instance.
+
+            This field is a member of `oneof`_ ``_linked_interconnect_attachment``.
+        linked_vpn_tunnel (str):
+            URI of the linked VPN tunnel, which must be
+            in the same region as the router. Each interface
+            can have one linked resource, which can be a VPN
+            tunnel, an Interconnect attachment, or a virtual
+            machine instance.
+
+            This field is a member of `oneof`_ ``_linked_vpn_tunnel``.
+        management_type (str):
+            [Output Only] The resource that configures and manages this
+            interface. - MANAGED_BY_USER is the default value and can be
+            managed directly by users. - MANAGED_BY_ATTACHMENT is an
+            interface that is configured and managed by Cloud
+            Interconnect, specifically, by an InterconnectAttachment of
+            type PARTNER. Google automatically creates, updates, and
+            deletes this type of interface when the PARTNER
+            InterconnectAttachment is created, updated, or deleted.
+            Check the ManagementType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_management_type``.
+        name (str):
+            Name of this interface entry. The name must be 1-63
+            characters long, and comply with RFC1035. Specifically, the
+            name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        private_ip_address (str):
+            The regional private internal IP address that
+            is used to establish BGP sessions to a VM
+            instance acting as a third-party Router
+            Appliance, such as a Next Gen Firewall, a
+            Virtual Router, or an SD-WAN VM.
+
+            This field is a member of `oneof`_ ``_private_ip_address``.
+        redundant_interface (str):
+            Name of the interface that will be redundant with the
+            current interface you are creating. The redundantInterface
+            must belong to the same Cloud Router as the interface here.
+            To establish the BGP session to a Router Appliance VM, you
+            must create two BGP peers. The two BGP peers must be
+            attached to two separate interfaces that are redundant with
+            each other. The redundant_interface must be 1-63 characters
+            long, and comply with RFC1035. Specifically, the
+            redundant_interface must be 1-63 characters long and match
+            the regular expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which
+            means the first character must be a lowercase letter, and
+            all following characters must be a dash, lowercase letter,
+            or digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_redundant_interface``.
+        subnetwork (str):
+            The URI of the subnetwork resource that this
+            interface belongs to, which must be in the same
+            region as the Cloud Router. When you establish a
+            BGP session to a VM instance using this
+            interface, the VM instance must belong to the
+            same subnetwork as the subnetwork specified
+            here.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+    """
+
+    class ManagementType(proto.Enum):
+        r"""[Output Only] The resource that configures and manages this
+        interface. - MANAGED_BY_USER is the default value and can be managed
+        directly by users. - MANAGED_BY_ATTACHMENT is an interface that is
+        configured and managed by Cloud Interconnect, specifically, by an
+        InterconnectAttachment of type PARTNER. Google automatically
+        creates, updates, and deletes this type of interface when the
+        PARTNER InterconnectAttachment is created, updated, or deleted.
+        """
+        UNDEFINED_MANAGEMENT_TYPE = 0
+        MANAGED_BY_ATTACHMENT = 458926411
+        MANAGED_BY_USER = 317294067
+
+    ip_range = proto.Field(proto.STRING, number=145092645, optional=True,)
+    linked_interconnect_attachment = proto.Field(
+        proto.STRING, number=501085518, optional=True,
+    )
+    linked_vpn_tunnel = proto.Field(proto.STRING, number=352296953, optional=True,)
+    management_type = proto.Field(proto.STRING, number=173703606, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    private_ip_address = proto.Field(proto.STRING, number=100854040, optional=True,)
+    redundant_interface = proto.Field(proto.STRING, number=523187303, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694, optional=True,)
+
+
+class RouterList(proto.Message):
+    r"""Contains a list of Router resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.Router]):
+            A list of Router resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#router for
+            routers.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="Router",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class RouterNat(proto.Message):
+    r"""Represents a Nat resource. It enables the VMs within the
+    specified subnetworks to access Internet without external IP
+    addresses. It specifies a list of subnetworks (and the ranges
+    within) that want to use NAT. Customers can also provide the
+    external IPs that would be used for NAT. GCP would auto-allocate
+    ephemeral IPs if no external IPs are provided.
+
+    Attributes:
+        drain_nat_ips (Sequence[str]):
+            A list of URLs of the IP resources to be
+            drained. These IPs must be valid static external
+            IPs that have been assigned to the NAT. These
+            IPs should be used for updating/patching a NAT
+            only.
+        enable_endpoint_independent_mapping (bool):
+
+            This field is a member of `oneof`_ ``_enable_endpoint_independent_mapping``.
+        icmp_idle_timeout_sec (int):
+            Timeout (in seconds) for ICMP connections.
+            Defaults to 30s if not set.
+
+            This field is a member of `oneof`_ ``_icmp_idle_timeout_sec``.
+        log_config (google.cloud.compute_v1.types.RouterNatLogConfig):
+            Configure logging on this NAT.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        min_ports_per_vm (int):
+            Minimum number of ports allocated to a VM
+            from this NAT config. If not set, a default
+            number of ports is allocated to a VM. This is
+            rounded up to the nearest power of 2. For
+            example, if the value of this field is 50, at
+            least 64 ports are allocated to a VM.
+
+            This field is a member of `oneof`_ ``_min_ports_per_vm``.
+        name (str):
+            Unique name of this Nat service. The name
+            must be 1-63 characters long and comply with
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        nat_ip_allocate_option (str):
+            Specify the NatIpAllocateOption, which can take one of the
+            following values: - MANUAL_ONLY: Uses only Nat IP addresses
+            provided by customers. When there are not enough specified
+            Nat IPs, the Nat service fails for new VMs. - AUTO_ONLY: Nat
+            IPs are allocated by Google Cloud Platform; customers can't
+            specify any Nat IPs. When choosing AUTO_ONLY, then nat_ip
+            should be empty. Check the NatIpAllocateOption enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_nat_ip_allocate_option``.
+        nat_ips (Sequence[str]):
+            A list of URLs of the IP resources used for
+            this Nat service. These IP addresses must be
+            valid static external IP addresses assigned to
+            the project.
+        rules (Sequence[google.cloud.compute_v1.types.RouterNatRule]):
+            A list of rules associated with this NAT.
+        source_subnetwork_ip_ranges_to_nat (str):
+            Specify the Nat option, which can take one of the following
+            values: - ALL_SUBNETWORKS_ALL_IP_RANGES: All of the IP
+            ranges in every Subnetwork are allowed to Nat. -
+            ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES: All of the primary IP
+            ranges in every Subnetwork are allowed to Nat. -
+            LIST_OF_SUBNETWORKS: A list of Subnetworks are allowed to
+            Nat (specified in the field subnetwork below) The default is
+            SUBNETWORK_IP_RANGE_TO_NAT_OPTION_UNSPECIFIED. Note that if
+            this field contains ALL_SUBNETWORKS_ALL_IP_RANGES or
+            ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES, then there should not
+            be any other Router.Nat section in any Router for this
+            network in this region. Check the
+            SourceSubnetworkIpRangesToNat enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_source_subnetwork_ip_ranges_to_nat``.
+        subnetworks (Sequence[google.cloud.compute_v1.types.RouterNatSubnetworkToNat]):
+            A list of Subnetwork resources whose traffic should be
+            translated by NAT Gateway. It is used only when
+            LIST_OF_SUBNETWORKS is selected for the
+            SubnetworkIpRangeToNatOption above.
+        tcp_established_idle_timeout_sec (int):
+            Timeout (in seconds) for TCP established
+            connections. Defaults to 1200s if not set.
+
+            This field is a member of `oneof`_ ``_tcp_established_idle_timeout_sec``.
+        tcp_time_wait_timeout_sec (int):
+            Timeout (in seconds) for TCP connections that are in
+            TIME_WAIT state. Defaults to 120s if not set.
+
+            This field is a member of `oneof`_ ``_tcp_time_wait_timeout_sec``.
+        tcp_transitory_idle_timeout_sec (int):
+            Timeout (in seconds) for TCP transitory
+            connections. Defaults to 30s if not set.
+
+            This field is a member of `oneof`_ ``_tcp_transitory_idle_timeout_sec``.
+        udp_idle_timeout_sec (int):
+            Timeout (in seconds) for UDP connections.
+            Defaults to 30s if not set.
+
+            This field is a member of `oneof`_ ``_udp_idle_timeout_sec``.
+    """
+
+    class NatIpAllocateOption(proto.Enum):
+        r"""Specify the NatIpAllocateOption, which can take one of the following
+        values: - MANUAL_ONLY: Uses only Nat IP addresses provided by
+        customers. When there are not enough specified Nat IPs, the Nat
+        service fails for new VMs. - AUTO_ONLY: Nat IPs are allocated by
+        Google Cloud Platform; customers can't specify any Nat IPs. When
+        choosing AUTO_ONLY, then nat_ip should be empty.
+        """
+        UNDEFINED_NAT_IP_ALLOCATE_OPTION = 0
+        AUTO_ONLY = 182333500
+        MANUAL_ONLY = 261251205
+
+    class SourceSubnetworkIpRangesToNat(proto.Enum):
+        r"""Specify the Nat option, which can take one of the following values:
+        - ALL_SUBNETWORKS_ALL_IP_RANGES: All of the IP ranges in every
+        Subnetwork are allowed to Nat. -
+        ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES: All of the primary IP ranges
+        in every Subnetwork are allowed to Nat. - LIST_OF_SUBNETWORKS: A
+        list of Subnetworks are allowed to Nat (specified in the field
+        subnetwork below) The default is
+        SUBNETWORK_IP_RANGE_TO_NAT_OPTION_UNSPECIFIED. Note that if this
+        field contains ALL_SUBNETWORKS_ALL_IP_RANGES or
+        ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES, then there should not be any
+        other Router.Nat section in any Router for this network in this
+        region.
+        """
+        UNDEFINED_SOURCE_SUBNETWORK_IP_RANGES_TO_NAT = 0
+        ALL_SUBNETWORKS_ALL_IP_RANGES = 179964376
+        ALL_SUBNETWORKS_ALL_PRIMARY_IP_RANGES = 185573819
+        LIST_OF_SUBNETWORKS = 517542270
+
+    drain_nat_ips = proto.RepeatedField(proto.STRING, number=504078535,)
+    enable_endpoint_independent_mapping = proto.Field(
+        proto.BOOL, number=259441819, optional=True,
+    )
+    icmp_idle_timeout_sec = proto.Field(proto.INT32, number=3647562, optional=True,)
+    log_config = proto.Field(
+        proto.MESSAGE, number=351299741, optional=True, message="RouterNatLogConfig",
+    )
+    min_ports_per_vm = proto.Field(proto.INT32, number=186193587, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    nat_ip_allocate_option = proto.Field(proto.STRING, number=429726845, optional=True,)
+    nat_ips = proto.RepeatedField(proto.STRING, number=117635086,)
+    rules = proto.RepeatedField(
+        proto.MESSAGE, number=108873975, message="RouterNatRule",
+    )
+    source_subnetwork_ip_ranges_to_nat = proto.Field(
+        proto.STRING, number=252213211, optional=True,
+    )
+    subnetworks = proto.RepeatedField(
+        proto.MESSAGE, number=415853125, message="RouterNatSubnetworkToNat",
+    )
+    tcp_established_idle_timeout_sec = proto.Field(
+        proto.INT32, number=223098349, optional=True,
+    )
+    tcp_time_wait_timeout_sec = proto.Field(
+        proto.INT32, number=513596925, optional=True,
+    )
+    tcp_transitory_idle_timeout_sec = proto.Field(
+        proto.INT32, number=205028774, optional=True,
+    )
+    udp_idle_timeout_sec = proto.Field(proto.INT32, number=64919878, optional=True,)
+
+
+class RouterNatLogConfig(proto.Message):
+    r"""Configuration of logging on a NAT.
+
+    Attributes:
+        enable (bool):
+            Indicates whether or not to export logs. This
+            is false by default.
+
+            This field is a member of `oneof`_ ``_enable``.
+        filter (str):
+            Specify the desired filtering of logs on this NAT. If
+            unspecified, logs are exported for all connections handled
+            by this NAT. This option can take one of the following
+            values: - ERRORS_ONLY: Export logs only for connection
+            failures. - TRANSLATIONS_ONLY: Export logs only for
+            successful connections. - ALL: Export logs for all
+            connections, successful and unsuccessful. Check the Filter
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_filter``.
+    """
+
+    class Filter(proto.Enum):
+        r"""Specify the desired filtering of logs on this NAT. If unspecified,
+        logs are exported for all connections handled by this NAT. This
+        option can take one of the following values: - ERRORS_ONLY: Export
+        logs only for connection failures. - TRANSLATIONS_ONLY: Export logs
+        only for successful connections. - ALL: Export logs for all
+        connections, successful and unsuccessful.
+        """
+        UNDEFINED_FILTER = 0
+        ALL = 64897
+        ERRORS_ONLY = 307484672
+        TRANSLATIONS_ONLY = 357212649
+
+    enable = proto.Field(proto.BOOL, number=311764355, optional=True,)
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+
+
+class RouterNatRule(proto.Message):
+    r"""
+
+    Attributes:
+        action (google.cloud.compute_v1.types.RouterNatRuleAction):
+            The action to be enforced for traffic that
+            matches this rule.
+
+            This field is a member of `oneof`_ ``_action``.
+        description (str):
+            An optional description of this rule.
+
+            This field is a member of `oneof`_ ``_description``.
+        match (str):
+            CEL expression that specifies the match condition that
+            egress traffic from a VM is evaluated against. If it
+            evaluates to true, the corresponding ``action`` is enforced.
+            The following examples are valid match expressions for
+            public NAT: "inIpRange(destination.ip, '1.1.0.0/16') \|\|
+            inIpRange(destination.ip, '2.2.0.0/16')" "destination.ip ==
+            '1.1.0.1' \|\| destination.ip == '8.8.8.8'" The following
+            example is a valid match expression for private NAT:
+            "nexthop.hub == '/projects/my-project/global/hub/hub-1'".
+
+            This field is a member of `oneof`_ ``_match``.
+        rule_number (int):
+            An integer uniquely identifying a rule in the
+            list. The rule number must be a positive value
+            between 0 and 65000, and must be unique among
+            rules within a NAT.
+
+            This field is a member of `oneof`_ ``_rule_number``.
+    """
+
+    action = proto.Field(
+        proto.MESSAGE, number=187661878, optional=True, message="RouterNatRuleAction",
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    match = proto.Field(proto.STRING, number=103668165, optional=True,)
+    rule_number = proto.Field(proto.UINT32, number=535211500, optional=True,)
+
+
+class RouterNatRuleAction(proto.Message):
+    r"""
+
+    Attributes:
+        source_nat_active_ips (Sequence[str]):
+            A list of URLs of the IP resources used for
+            this NAT rule. These IP addresses must be valid
+            static external IP addresses assigned to the
+            project. This field is used for public NAT.
+        source_nat_drain_ips (Sequence[str]):
+            A list of URLs of the IP resources to be
+            drained. These IPs must be valid static external
+            IPs that have been assigned to the NAT. These
+            IPs should be used for updating/patching a NAT
+            rule only. This field is used for public NAT.
+    """
+
+    source_nat_active_ips = proto.RepeatedField(proto.STRING, number=210378229,)
+    source_nat_drain_ips = proto.RepeatedField(proto.STRING, number=340812451,)
+
+
+class RouterNatSubnetworkToNat(proto.Message):
+    r"""Defines the IP ranges that want to use NAT for a subnetwork.
+
+    Attributes:
+        name (str):
+            URL for the subnetwork resource that will use
+            NAT.
+
+            This field is a member of `oneof`_ ``_name``.
+        secondary_ip_range_names (Sequence[str]):
+            A list of the secondary ranges of the Subnetwork that are
+            allowed to use NAT. This can be populated only if
+            "LIST_OF_SECONDARY_IP_RANGES" is one of the values in
+            source_ip_ranges_to_nat.
+        source_ip_ranges_to_nat (Sequence[str]):
+            Specify the options for NAT ranges in the Subnetwork. All
+            options of a single value are valid except
+            NAT_IP_RANGE_OPTION_UNSPECIFIED. The only valid option with
+            multiple values is: ["PRIMARY_IP_RANGE",
+            "LIST_OF_SECONDARY_IP_RANGES"] Default: [ALL_IP_RANGES]
+            Check the SourceIpRangesToNat enum for the list of possible
+            values.
+    """
+
+    class SourceIpRangesToNat(proto.Enum):
+        r""""""
+        UNDEFINED_SOURCE_IP_RANGES_TO_NAT = 0
+        ALL_IP_RANGES = 35608496
+        LIST_OF_SECONDARY_IP_RANGES = 192289308
+        PRIMARY_IP_RANGE = 297109954
+
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    secondary_ip_range_names = proto.RepeatedField(proto.STRING, number=264315097,)
+    source_ip_ranges_to_nat = proto.RepeatedField(proto.STRING, number=388310386,)
+
+
+class RouterStatus(proto.Message):
+    r"""
+
+    Attributes:
+        best_routes (Sequence[google.cloud.compute_v1.types.Route]):
+            Best routes for this router's network.
+        best_routes_for_router (Sequence[google.cloud.compute_v1.types.Route]):
+            Best routes learned by this router.
+        bgp_peer_status (Sequence[google.cloud.compute_v1.types.RouterStatusBgpPeerStatus]):
+
+        nat_status (Sequence[google.cloud.compute_v1.types.RouterStatusNatStatus]):
+
+        network (str):
+            URI of the network to which this router
+            belongs.
+
+            This field is a member of `oneof`_ ``_network``.
+    """
+
+    best_routes = proto.RepeatedField(
+        proto.MESSAGE, number=395826693, message=shared_54.Route,
+    )
+    best_routes_for_router = proto.RepeatedField(
+        proto.MESSAGE, number=119389689, message=shared_54.Route,
+    )
+    bgp_peer_status = proto.RepeatedField(
+        proto.MESSAGE, number=218459131, message="RouterStatusBgpPeerStatus",
+    )
+    nat_status = proto.RepeatedField(
+        proto.MESSAGE, number=63098064, message="RouterStatusNatStatus",
+    )
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+
+
+class RouterStatusBgpPeerStatus(proto.Message):
+    r"""
+
+    Attributes:
+        advertised_routes (Sequence[google.cloud.compute_v1.types.Route]):
+            Routes that were advertised to the remote BGP
+            peer
+        ip_address (str):
+            IP address of the local BGP interface.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        linked_vpn_tunnel (str):
+            URL of the VPN tunnel that this BGP peer
+            controls.
+
+            This field is a member of `oneof`_ ``_linked_vpn_tunnel``.
+        name (str):
+            Name of this BGP peer. Unique within the
+            Routers resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        num_learned_routes (int):
+            Number of routes learned from the remote BGP
+            Peer.
+
+            This field is a member of `oneof`_ ``_num_learned_routes``.
+        peer_ip_address (str):
+            IP address of the remote BGP interface.
+
+            This field is a member of `oneof`_ ``_peer_ip_address``.
+        router_appliance_instance (str):
+            [Output only] URI of the VM instance that is used as
+            third-party router appliances such as Next Gen Firewalls,
+            Virtual Routers, or Router Appliances. The VM instance is
+            the peer side of the BGP session.
+
+            This field is a member of `oneof`_ ``_router_appliance_instance``.
+        state (str):
+            BGP state as specified in RFC1771.
+
+            This field is a member of `oneof`_ ``_state``.
+        status (str):
+            Status of the BGP peer: {UP, DOWN}
+            Check the Status enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_status``.
+        uptime (str):
+            Time this session has been up. Format: 14
+            years, 51 weeks, 6 days, 23 hours, 59 minutes,
+            59 seconds
+
+            This field is a member of `oneof`_ ``_uptime``.
+        uptime_seconds (str):
+            Time this session has been up, in seconds.
+            Format: 145
+
+            This field is a member of `oneof`_ ``_uptime_seconds``.
+    """
+
+    class Status(proto.Enum):
+        r"""Status of the BGP peer: {UP, DOWN}"""
+        UNDEFINED_STATUS = 0
+        DOWN = 2104482
+        UNKNOWN = 433141802
+        UP = 2715
+
+    advertised_routes = proto.RepeatedField(
+        proto.MESSAGE, number=333393068, message=shared_54.Route,
+    )
+    ip_address = proto.Field(proto.STRING, number=406272220, optional=True,)
+    linked_vpn_tunnel = proto.Field(proto.STRING, number=352296953, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    num_learned_routes = proto.Field(proto.UINT32, number=135457535, optional=True,)
+    peer_ip_address = proto.Field(proto.STRING, number=207735769, optional=True,)
+    router_appliance_instance = proto.Field(
+        proto.STRING, number=468312989, optional=True,
+    )
+    state = proto.Field(proto.STRING, number=109757585, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    uptime = proto.Field(proto.STRING, number=235379688, optional=True,)
+    uptime_seconds = proto.Field(proto.STRING, number=104736040, optional=True,)
+
+
+class RouterStatusNatStatus(proto.Message):
+    r"""Status of a NAT contained in this router.
+
+    Attributes:
+        auto_allocated_nat_ips (Sequence[str]):
+            A list of IPs auto-allocated for NAT. Example: ["1.1.1.1",
+            "129.2.16.89"]
+        drain_auto_allocated_nat_ips (Sequence[str]):
+            A list of IPs auto-allocated for NAT that are in drain mode.
+            Example: ["1.1.1.1", "179.12.26.133"].
+        drain_user_allocated_nat_ips (Sequence[str]):
+            A list of IPs user-allocated for NAT that are in drain mode.
+            Example: ["1.1.1.1", "179.12.26.133"].
+        min_extra_nat_ips_needed (int):
+            The number of extra IPs to allocate. This will be greater
+            than 0 only if user-specified IPs are NOT enough to allow
+            all configured VMs to use NAT. This value is meaningful only
+            when auto-allocation of NAT IPs is *not* used.
+
+            This field is a member of `oneof`_ ``_min_extra_nat_ips_needed``.
+        name (str):
+            Unique name of this NAT.
+
+            This field is a member of `oneof`_ ``_name``.
+        num_vm_endpoints_with_nat_mappings (int):
+            Number of VM endpoints (i.e., Nics) that can
+            use NAT.
+
+            This field is a member of `oneof`_ ``_num_vm_endpoints_with_nat_mappings``.
+        rule_status (Sequence[google.cloud.compute_v1.types.RouterStatusNatStatusNatRuleStatus]):
+            Status of rules in this NAT.
+        user_allocated_nat_ip_resources (Sequence[str]):
+            A list of fully qualified URLs of reserved IP
+            address resources.
+        user_allocated_nat_ips (Sequence[str]):
+            A list of IPs user-allocated for NAT. They
+            will be raw IP strings like "179.12.26.133".
+    """
+
+    auto_allocated_nat_ips = proto.RepeatedField(proto.STRING, number=510794246,)
+    drain_auto_allocated_nat_ips = proto.RepeatedField(proto.STRING, number=309184557,)
+    drain_user_allocated_nat_ips = proto.RepeatedField(proto.STRING, number=305268553,)
+    min_extra_nat_ips_needed = proto.Field(
+        proto.INT32, number=365786338, optional=True,
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    num_vm_endpoints_with_nat_mappings = proto.Field(
+        proto.INT32, number=512367468, optional=True,
+    )
+    rule_status = proto.RepeatedField(
+        proto.MESSAGE, number=140223125, message="RouterStatusNatStatusNatRuleStatus",
+    )
+    user_allocated_nat_ip_resources = proto.RepeatedField(
+        proto.STRING, number=212776151,
+    )
+    user_allocated_nat_ips = proto.RepeatedField(proto.STRING, number=506878242,)
+
+
+class RouterStatusNatStatusNatRuleStatus(proto.Message):
+    r"""Status of a NAT Rule contained in this NAT.
+
+    Attributes:
+        active_nat_ips (Sequence[str]):
+            A list of active IPs for NAT. Example: ["1.1.1.1",
+            "179.12.26.133"].
+        drain_nat_ips (Sequence[str]):
+            A list of IPs for NAT that are in drain mode. Example:
+            ["1.1.1.1", "179.12.26.133"].
+        min_extra_ips_needed (int):
+            The number of extra IPs to allocate. This
+            will be greater than 0 only if the existing IPs
+            in this NAT Rule are NOT enough to allow all
+            configured VMs to use NAT.
+
+            This field is a member of `oneof`_ ``_min_extra_ips_needed``.
+        num_vm_endpoints_with_nat_mappings (int):
+            Number of VM endpoints (i.e., NICs) that have
+            NAT Mappings from this NAT Rule.
+
+            This field is a member of `oneof`_ ``_num_vm_endpoints_with_nat_mappings``.
+        rule_number (int):
+            Rule number of the rule.
+
+            This field is a member of `oneof`_ ``_rule_number``.
+    """
+
+    active_nat_ips = proto.RepeatedField(proto.STRING, number=208517077,)
+    drain_nat_ips = proto.RepeatedField(proto.STRING, number=504078535,)
+    min_extra_ips_needed = proto.Field(proto.INT32, number=353002756, optional=True,)
+    num_vm_endpoints_with_nat_mappings = proto.Field(
+        proto.INT32, number=512367468, optional=True,
+    )
+    rule_number = proto.Field(proto.INT32, number=535211500, optional=True,)
+
+
+class RouterStatusResponse(proto.Message):
+    r"""
+
+    Attributes:
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        result (google.cloud.compute_v1.types.RouterStatus):
+
+            This field is a member of `oneof`_ ``_result``.
+    """
+
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    result = proto.Field(
+        proto.MESSAGE, number=139315229, optional=True, message="RouterStatus",
+    )
+
+
+class RoutersPreviewResponse(proto.Message):
+    r"""
+
+    Attributes:
+        resource (google.cloud.compute_v1.types.Router):
+            Preview of given router.
+
+            This field is a member of `oneof`_ ``_resource``.
+    """
+
+    resource = proto.Field(
+        proto.MESSAGE, number=195806222, optional=True, message="Router",
+    )
+
+
+class RoutersScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        routers (Sequence[google.cloud.compute_v1.types.Router]):
+            A list of routers contained in this scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of routers when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    routers = proto.RepeatedField(proto.MESSAGE, number=311906890, message="Router",)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class UpdateRouterRequest(proto.Message):
+    r"""A request message for Routers.Update. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        router (str):
+            Name of the Router resource to update.
+        router_resource (google.cloud.compute_v1.types.Router):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    router = proto.Field(proto.STRING, number=148608841,)
+    router_resource = proto.Field(proto.MESSAGE, number=155222084, message="Router",)
+
+
+class VmEndpointNatMappings(proto.Message):
+    r"""Contain information of Nat mapping for a VM endpoint (i.e.,
+    NIC).
+
+    Attributes:
+        instance_name (str):
+            Name of the VM instance which the endpoint
+            belongs to
+
+            This field is a member of `oneof`_ ``_instance_name``.
+        interface_nat_mappings (Sequence[google.cloud.compute_v1.types.VmEndpointNatMappingsInterfaceNatMappings]):
+
+    """
+
+    instance_name = proto.Field(proto.STRING, number=227947509, optional=True,)
+    interface_nat_mappings = proto.RepeatedField(
+        proto.MESSAGE,
+        number=256196617,
+        message="VmEndpointNatMappingsInterfaceNatMappings",
+    )
+
+
+class VmEndpointNatMappingsInterfaceNatMappings(proto.Message):
+    r"""Contain information of Nat mapping for an interface of this
+    endpoint.
+
+    Attributes:
+        drain_nat_ip_port_ranges (Sequence[str]):
+            List of all drain IP:port-range mappings assigned to this
+            interface. These ranges are inclusive, that is, both the
+            first and the last ports can be used for NAT. Example:
+            ["2.2.2.2:12345-12355", "1.1.1.1:2234-2234"].
+        nat_ip_port_ranges (Sequence[str]):
+            A list of all IP:port-range mappings assigned to this
+            interface. These ranges are inclusive, that is, both the
+            first and the last ports can be used for NAT. Example:
+            ["2.2.2.2:12345-12355", "1.1.1.1:2234-2234"].
+        num_total_drain_nat_ports (int):
+            Total number of drain ports across all NAT IPs allocated to
+            this interface. It equals to the aggregated port number in
+            the field drain_nat_ip_port_ranges.
+
+            This field is a member of `oneof`_ ``_num_total_drain_nat_ports``.
+        num_total_nat_ports (int):
+            Total number of ports across all NAT IPs allocated to this
+            interface. It equals to the aggregated port number in the
+            field nat_ip_port_ranges.
+
+            This field is a member of `oneof`_ ``_num_total_nat_ports``.
+        source_alias_ip_range (str):
+            Alias IP range for this interface endpoint.
+            It will be a private (RFC 1918) IP range.
+            Examples: "10.33.4.55/32", or "192.168.5.0/24".
+
+            This field is a member of `oneof`_ ``_source_alias_ip_range``.
+        source_virtual_ip (str):
+            Primary IP of the VM for this NIC.
+
+            This field is a member of `oneof`_ ``_source_virtual_ip``.
+    """
+
+    drain_nat_ip_port_ranges = proto.RepeatedField(proto.STRING, number=395440577,)
+    nat_ip_port_ranges = proto.RepeatedField(proto.STRING, number=531830810,)
+    num_total_drain_nat_ports = proto.Field(
+        proto.INT32, number=335532793, optional=True,
+    )
+    num_total_nat_ports = proto.Field(proto.INT32, number=299904384, optional=True,)
+    source_alias_ip_range = proto.Field(proto.STRING, number=440340952, optional=True,)
+    source_virtual_ip = proto.Field(proto.STRING, number=149836159, optional=True,)
+
+
+class VmEndpointNatMappingsList(proto.Message):
+    r"""Contains a list of VmEndpointNatMappings.
+
+    Attributes:
+        id (str):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#vmEndpointNatMappingsList for lists of Nat mappings
+            of VM endpoints.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        result (Sequence[google.cloud.compute_v1.types.VmEndpointNatMappings]):
+            [Output Only] A list of Nat mapping information of VM
+            endpoints.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    result = proto.RepeatedField(
+        proto.MESSAGE, number=139315229, message="VmEndpointNatMappings",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,850 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the security_policies service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_05
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddRuleSecurityPolicyRequest",
+        "DeleteSecurityPolicyRequest",
+        "GetRuleSecurityPolicyRequest",
+        "GetSecurityPolicyRequest",
+        "InsertSecurityPolicyRequest",
+        "ListPreconfiguredExpressionSetsSecurityPoliciesRequest",
+        "ListSecurityPoliciesRequest",
+        "PatchRuleSecurityPolicyRequest",
+        "PatchSecurityPolicyRequest",
+        "PreconfiguredWafSet",
+        "RemoveRuleSecurityPolicyRequest",
+        "SecurityPoliciesListPreconfiguredExpressionSetsResponse",
+        "SecurityPoliciesWafConfig",
+        "SecurityPolicy",
+        "SecurityPolicyAdaptiveProtectionConfig",
+        "SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig",
+        "SecurityPolicyAdvancedOptionsConfig",
+        "SecurityPolicyList",
+        "SecurityPolicyRule",
+        "SecurityPolicyRuleMatcher",
+        "SecurityPolicyRuleMatcherConfig",
+        "WafExpressionSet",
+        "WafExpressionSetExpression",
+    },
+)
+
+
+class AddRuleSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.AddRule. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        security_policy (str):
+            Name of the security policy to update.
+        security_policy_rule_resource (google.cloud.compute_v1.types.SecurityPolicyRule):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+    security_policy_rule_resource = proto.Field(
+        proto.MESSAGE, number=402693443, message="SecurityPolicyRule",
+    )
+
+
+class DeleteSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        security_policy (str):
+            Name of the security policy to delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+
+
+class GetRuleSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.GetRule. See the
+    method description for details.
+
+    Attributes:
+        priority (int):
+            The priority of the rule to get from the
+            security policy.
+
+            This field is a member of `oneof`_ ``_priority``.
+        project (str):
+            Project ID for this request.
+        security_policy (str):
+            Name of the security policy to which the
+            queried rule belongs.
+    """
+
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+
+
+class GetSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        security_policy (str):
+            Name of the security policy to get.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+
+
+class InsertSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        security_policy_resource (google.cloud.compute_v1.types.SecurityPolicy):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    security_policy_resource = proto.Field(
+        proto.MESSAGE, number=216159612, message="SecurityPolicy",
+    )
+
+
+class ListPreconfiguredExpressionSetsSecurityPoliciesRequest(proto.Message):
+    r"""A request message for
+    SecurityPolicies.ListPreconfiguredExpressionSets. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class ListSecurityPoliciesRequest(proto.Message):
+    r"""A request message for SecurityPolicies.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchRuleSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.PatchRule. See the
+    method description for details.
+
+    Attributes:
+        priority (int):
+            The priority of the rule to patch.
+
+            This field is a member of `oneof`_ ``_priority``.
+        project (str):
+            Project ID for this request.
+        security_policy (str):
+            Name of the security policy to update.
+        security_policy_rule_resource (google.cloud.compute_v1.types.SecurityPolicyRule):
+            The body resource for this request
+    """
+
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+    security_policy_rule_resource = proto.Field(
+        proto.MESSAGE, number=402693443, message="SecurityPolicyRule",
+    )
+
+
+class PatchSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.Patch. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        security_policy (str):
+            Name of the security policy to update.
+        security_policy_resource (google.cloud.compute_v1.types.SecurityPolicy):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+    security_policy_resource = proto.Field(
+        proto.MESSAGE, number=216159612, message="SecurityPolicy",
+    )
+
+
+class PreconfiguredWafSet(proto.Message):
+    r"""
+
+    Attributes:
+        expression_sets (Sequence[google.cloud.compute_v1.types.WafExpressionSet]):
+            List of entities that are currently supported
+            for WAF rules.
+    """
+
+    expression_sets = proto.RepeatedField(
+        proto.MESSAGE, number=474011032, message="WafExpressionSet",
+    )
+
+
+class RemoveRuleSecurityPolicyRequest(proto.Message):
+    r"""A request message for SecurityPolicies.RemoveRule. See the
+    method description for details.
+
+    Attributes:
+        priority (int):
+            The priority of the rule to remove from the
+            security policy.
+
+            This field is a member of `oneof`_ ``_priority``.
+        project (str):
+            Project ID for this request.
+        security_policy (str):
+            Name of the security policy to update.
+    """
+
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    security_policy = proto.Field(proto.STRING, number=171082513,)
+
+
+class SecurityPoliciesListPreconfiguredExpressionSetsResponse(proto.Message):
+    r"""
+
+    Attributes:
+        preconfigured_expression_sets (google.cloud.compute_v1.types.SecurityPoliciesWafConfig):
+
+            This field is a member of `oneof`_ ``_preconfigured_expression_sets``.
+    """
+
+    preconfigured_expression_sets = proto.Field(
+        proto.MESSAGE,
+        number=536200826,
+        optional=True,
+        message="SecurityPoliciesWafConfig",
+    )
+
+
+class SecurityPoliciesWafConfig(proto.Message):
+    r"""
+
+    Attributes:
+        waf_rules (google.cloud.compute_v1.types.PreconfiguredWafSet):
+
+            This field is a member of `oneof`_ ``_waf_rules``.
+    """
+
+    waf_rules = proto.Field(
+        proto.MESSAGE, number=74899924, optional=True, message="PreconfiguredWafSet",
+    )
+
+
+class SecurityPolicy(proto.Message):
+    r"""Represents a Google Cloud Armor security policy resource.
+    Only external backend services that use load balancers can
+    reference a security policy. For more information, see Google
+    Cloud Armor security policy overview.
+
+    Attributes:
+        adaptive_protection_config (google.cloud.compute_v1.types.SecurityPolicyAdaptiveProtectionConfig):
+
+            This field is a member of `oneof`_ ``_adaptive_protection_config``.
+        advanced_options_config (google.cloud.compute_v1.types.SecurityPolicyAdvancedOptionsConfig):
+
+            This field is a member of `oneof`_ ``_advanced_options_config``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            Specifies a fingerprint for this resource,
+            which is essentially a hash of the metadata's
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update metadata. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change metadata, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make get() request to the
+            security policy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#securityPolicyfor security policies
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        rules (Sequence[google.cloud.compute_v1.types.SecurityPolicyRule]):
+            A list of rules that belong to this policy. There must
+            always be a default rule (rule with priority 2147483647 and
+            match "*"). If no rules are provided when creating a
+            security policy, a default rule with action "allow" will be
+            added.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+    """
+
+    adaptive_protection_config = proto.Field(
+        proto.MESSAGE,
+        number=150240735,
+        optional=True,
+        message="SecurityPolicyAdaptiveProtectionConfig",
+    )
+    advanced_options_config = proto.Field(
+        proto.MESSAGE,
+        number=449276352,
+        optional=True,
+        message="SecurityPolicyAdvancedOptionsConfig",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    rules = proto.RepeatedField(
+        proto.MESSAGE, number=108873975, message="SecurityPolicyRule",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+
+
+class SecurityPolicyAdaptiveProtectionConfig(proto.Message):
+    r"""Configuration options for Cloud Armor Adaptive Protection
+    (CAAP).
+
+    Attributes:
+        layer7_ddos_defense_config (google.cloud.compute_v1.types.SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig):
+            If set to true, enables Cloud Armor Machine
+            Learning.
+
+            This field is a member of `oneof`_ ``_layer7_ddos_defense_config``.
+    """
+
+    layer7_ddos_defense_config = proto.Field(
+        proto.MESSAGE,
+        number=437316771,
+        optional=True,
+        message="SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig",
+    )
+
+
+class SecurityPolicyAdaptiveProtectionConfigLayer7DdosDefenseConfig(proto.Message):
+    r"""Configuration options for L7 DDoS detection.
+
+    Attributes:
+        enable (bool):
+            If set to true, enables CAAP for L7 DDoS
+            detection.
+
+            This field is a member of `oneof`_ ``_enable``.
+        rule_visibility (str):
+            Rule visibility can be one of the following:
+            STANDARD - opaque rules. (default) PREMIUM -
+            transparent rules. Check the RuleVisibility enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_rule_visibility``.
+    """
+
+    class RuleVisibility(proto.Enum):
+        r"""Rule visibility can be one of the following: STANDARD -
+        opaque rules. (default) PREMIUM - transparent rules.
+        """
+        UNDEFINED_RULE_VISIBILITY = 0
+        PREMIUM = 399530551
+        STANDARD = 484642493
+
+    enable = proto.Field(proto.BOOL, number=311764355, optional=True,)
+    rule_visibility = proto.Field(proto.STRING, number=453258293, optional=True,)
+
+
+class SecurityPolicyAdvancedOptionsConfig(proto.Message):
+    r"""
+
+    Attributes:
+        json_parsing (str):
+            Check the JsonParsing enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_json_parsing``.
+        log_level (str):
+            Check the LogLevel enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_log_level``.
+    """
+
+    class JsonParsing(proto.Enum):
+        r""""""
+        UNDEFINED_JSON_PARSING = 0
+        DISABLED = 516696700
+        STANDARD = 484642493
+
+    class LogLevel(proto.Enum):
+        r""""""
+        UNDEFINED_LOG_LEVEL = 0
+        NORMAL = 161067239
+        VERBOSE = 532219234
+
+    json_parsing = proto.Field(proto.STRING, number=282493529, optional=True,)
+    log_level = proto.Field(proto.STRING, number=140582601, optional=True,)
+
+
+class SecurityPolicyList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.SecurityPolicy]):
+            A list of SecurityPolicy resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#securityPolicyList for listsof securityPolicies
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="SecurityPolicy",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SecurityPolicyRule(proto.Message):
+    r"""Represents a rule that describes one or more match conditions
+    along with the action to be taken when traffic matches this
+    condition (allow or deny).
+
+    Attributes:
+        action (str):
+            The Action to perform when the client
+            connection triggers the rule. Can currently be
+            either "allow" or "deny()" where valid values
+            for status are 403, 404, and 502.
+
+            This field is a member of `oneof`_ ``_action``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#securityPolicyRule for security policy rules
+
+            This field is a member of `oneof`_ ``_kind``.
+        match (google.cloud.compute_v1.types.SecurityPolicyRuleMatcher):
+            A match condition that incoming traffic is
+            evaluated against. If it evaluates to true, the
+            corresponding 'action' is enforced.
+
+            This field is a member of `oneof`_ ``_match``.
+        preview (bool):
+            If set to true, the specified action is not
+            enforced.
+
+            This field is a member of `oneof`_ ``_preview``.
+        priority (int):
+            An integer indicating the priority of a rule
+            in the list. The priority must be a positive
+            value between 0 and 2147483647. Rules are
+            evaluated from highest to lowest priority where
+            0 is the highest priority and 2147483647 is the
+            lowest priority.
+
+            This field is a member of `oneof`_ ``_priority``.
+    """
+
+    action = proto.Field(proto.STRING, number=187661878, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    match = proto.Field(
+        proto.MESSAGE,
+        number=103668165,
+        optional=True,
+        message="SecurityPolicyRuleMatcher",
+    )
+    preview = proto.Field(proto.BOOL, number=218686408, optional=True,)
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+
+
+class SecurityPolicyRuleMatcher(proto.Message):
+    r"""Represents a match condition that incoming traffic is
+    evaluated against. Exactly one field must be specified.
+
+    Attributes:
+        config (google.cloud.compute_v1.types.SecurityPolicyRuleMatcherConfig):
+            The configuration options available when specifying
+            versioned_expr. This field must be specified if
+            versioned_expr is specified and cannot be specified if
+            versioned_expr is not specified.
+
+            This field is a member of `oneof`_ ``_config``.
+        expr (google.cloud.compute_v1.types.Expr):
+            User defined CEVAL expression. A CEVAL expression is used to
+            specify match criteria such as origin.ip, source.region_code
+            and contents in the request header.
+
+            This field is a member of `oneof`_ ``_expr``.
+        versioned_expr (str):
+            Preconfigured versioned expression. If this field is
+            specified, config must also be specified. Available
+            preconfigured expressions along with their requirements are:
+            SRC_IPS_V1 - must specify the corresponding src_ip_range
+            field in config. Check the VersionedExpr enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_versioned_expr``.
+    """
+
+    class VersionedExpr(proto.Enum):
+        r"""Preconfigured versioned expression. If this field is specified,
+        config must also be specified. Available preconfigured expressions
+        along with their requirements are: SRC_IPS_V1 - must specify the
+        corresponding src_ip_range field in config.
+        """
+        UNDEFINED_VERSIONED_EXPR = 0
+        SRC_IPS_V1 = 70925961
+
+    config = proto.Field(
+        proto.MESSAGE,
+        number=255820610,
+        optional=True,
+        message="SecurityPolicyRuleMatcherConfig",
+    )
+    expr = proto.Field(
+        proto.MESSAGE, number=3127797, optional=True, message=shared_05.Expr,
+    )
+    versioned_expr = proto.Field(proto.STRING, number=322286013, optional=True,)
+
+
+class SecurityPolicyRuleMatcherConfig(proto.Message):
+    r"""
+
+    Attributes:
+        src_ip_ranges (Sequence[str]):
+            CIDR IP address range. Maximum number of src_ip_ranges
+            allowed is 10.
+    """
+
+    src_ip_ranges = proto.RepeatedField(proto.STRING, number=432128083,)
+
+
+class WafExpressionSet(proto.Message):
+    r"""
+
+    Attributes:
+        aliases (Sequence[str]):
+            A list of alternate IDs. The format should
+            be: - E.g. XSS-stable Generic suffix like
+            "stable" is particularly useful if a policy
+            likes to avail newer set of expressions without
+            having to change the policy. A given alias name
+            can't be used for more than one entity set.
+        expressions (Sequence[google.cloud.compute_v1.types.WafExpressionSetExpression]):
+            List of available expressions.
+        id (str):
+            Google specified expression set ID. The
+            format should be: - E.g. XSS-20170329 required
+
+            This field is a member of `oneof`_ ``_id``.
+    """
+
+    aliases = proto.RepeatedField(proto.STRING, number=159207166,)
+    expressions = proto.RepeatedField(
+        proto.MESSAGE, number=175554779, message="WafExpressionSetExpression",
+    )
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+
+
+class WafExpressionSetExpression(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            Expression ID should uniquely identify the
+            origin of the expression. E.g. owasp-
+            crs-v020901-id973337 identifies Owasp core rule
+            set version 2.9.1 rule id 973337. The ID could
+            be used to determine the individual attack
+            definition that has been detected. It could also
+            be used to exclude it from the policy in case of
+            false positive. required
+
+            This field is a member of `oneof`_ ``_id``.
+    """
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 78 services:
+
+accelerator_types, addresses, autoscalers, backend_buckets, backend_services,
+disk_types, disks, external_vpn_gateways, firewall_policies, firewalls,
+forwarding_rules, global_addresses, global_forwarding_rules,
+global_network_endpoint_groups, global_operations,
+global_organization_operations, global_public_delegated_prefixes,
+health_checks, images, instance_group_managers, instance_groups,
+instance_templates, instances, interconnect_attachments,
+interconnect_locations, interconnects, licenses, machine_types,
+network_endpoint_groups, networks, node_groups, node_templates, node_types,
+packet_mirrorings, projects, public_advertised_prefixes,
+public_delegated_prefixes, region_autoscalers, region_backend_services,
+region_commitments, region_disk_types, region_disks,
+region_health_check_services, region_health_checks,
+region_instance_group_managers, region_instance_groups, region_instances,
+region_network_endpoint_groups, region_notification_endpoints,
+region_operations, region_ssl_certificates, region_target_http_proxies,
+region_target_https_proxies, region_url_maps, regions, reservations,
+resource_policies, routers, routes, security_policies, service_attachments,
+snapshots, ssl_certificates, ssl_policies, subnetworks, target_grpc_proxies,
+target_http_proxies, target_https_proxies, target_instances, target_pools,
+target_ssl_proxies, target_tcp_proxies, target_vpn_gateways, url_maps,
+vpn_gateways, vpn_tunnels, zone_operations, zones.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"Data",},)
+
+
+class Data(proto.Message):
+    r"""
+
+    Attributes:
+        key (str):
+            [Output Only] A key that provides more detail on the warning
+            being returned. For example, for warnings where there are no
+            results in a list request for a particular zone, this key
+            might be scope and the key value might be the zone name.
+            Other examples might be a key indicating a deprecated
+            resource and a suggested replacement, or a warning about
+            invalid network settings (for example, if an instance
+            attempts to perform IP forwarding but is not enabled for IP
+            forwarding).
+
+            This field is a member of `oneof`_ ``_key``.
+        value (str):
+            [Output Only] A warning data value corresponding to the key.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    key = proto.Field(proto.STRING, number=106079, optional=True,)
+    value = proto.Field(proto.STRING, number=111972721, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
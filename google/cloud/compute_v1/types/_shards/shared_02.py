@@ -0,0 +1,109 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 77 services:
+
+accelerator_types, addresses, autoscalers, backend_buckets, backend_services,
+disk_types, disks, external_vpn_gateways, firewall_policies, firewalls,
+forwarding_rules, global_addresses, global_forwarding_rules,
+global_network_endpoint_groups, global_operations,
+global_organization_operations, global_public_delegated_prefixes,
+health_checks, images, instance_group_managers, instance_groups,
+instance_templates, instances, interconnect_attachments,
+interconnect_locations, interconnects, licenses, machine_types,
+network_endpoint_groups, networks, node_groups, node_templates, node_types,
+packet_mirrorings, projects, public_advertised_prefixes,
+public_delegated_prefixes, region_autoscalers, region_backend_services,
+region_commitments, region_disk_types, region_disks,
+region_health_check_services, region_health_checks,
+region_instance_group_managers, region_instance_groups,
+region_network_endpoint_groups, region_notification_endpoints,
+region_operations, region_ssl_certificates, region_target_http_proxies,
+region_target_https_proxies, region_url_maps, regions, reservations,
+resource_policies, routers, routes, security_policies, service_attachments,
+snapshots, ssl_certificates, ssl_policies, subnetworks, target_grpc_proxies,
+target_http_proxies, target_https_proxies, target_instances, target_pools,
+target_ssl_proxies, target_tcp_proxies, target_vpn_gateways, url_maps,
+vpn_gateways, vpn_tunnels, zone_operations, zones.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_01
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"Warning",},)
+
+
+class Warning(proto.Message):
+    r"""[Output Only] Informational warning message.
+
+    Attributes:
+        code (str):
+            [Output Only] A warning code, if applicable. For example,
+            Compute Engine returns NO_RESULTS_ON_PAGE if there are no
+            results in the response. Check the Code enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_code``.
+        data (Sequence[google.cloud.compute_v1.types.Data]):
+            [Output Only] Metadata about this warning in key: value
+            format. For example: "data": [ { "key": "scope", "value":
+            "zones/us-east1-d" }
+        message (str):
+            [Output Only] A human-readable description of the warning
+            code.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    class Code(proto.Enum):
+        r"""[Output Only] A warning code, if applicable. For example, Compute
+        Engine returns NO_RESULTS_ON_PAGE if there are no results in the
+        response.
+        """
+        UNDEFINED_CODE = 0
+        CLEANUP_FAILED = 150308440
+        DEPRECATED_RESOURCE_USED = 391835586
+        DEPRECATED_TYPE_USED = 346526230
+        DISK_SIZE_LARGER_THAN_IMAGE_SIZE = 369442967
+        EXPERIMENTAL_TYPE_USED = 451954443
+        EXTERNAL_API_WARNING = 175546307
+        FIELD_VALUE_OVERRIDEN = 329669423
+        INJECTED_KERNELS_DEPRECATED = 417377419
+        LARGE_DEPLOYMENT_WARNING = 481440678
+        MISSING_TYPE_DEPENDENCY = 344505463
+        NEXT_HOP_ADDRESS_NOT_ASSIGNED = 324964999
+        NEXT_HOP_CANNOT_IP_FORWARD = 383382887
+        NEXT_HOP_INSTANCE_NOT_FOUND = 464250446
+        NEXT_HOP_INSTANCE_NOT_ON_NETWORK = 243758146
+        NEXT_HOP_NOT_RUNNING = 417081265
+        NOT_CRITICAL_ERROR = 105763924
+        NO_RESULTS_ON_PAGE = 30036744
+        PARTIAL_SUCCESS = 39966469
+        REQUIRED_TOS_AGREEMENT = 3745539
+        RESOURCE_IN_USE_BY_OTHER_RESOURCE_WARNING = 496728641
+        RESOURCE_NOT_DELETED = 168598460
+        SCHEMA_VALIDATION_IGNORED = 275245642
+        SINGLE_INSTANCE_PROPERTY_TEMPLATE = 268305617
+        UNDECLARED_PROPERTIES = 390513439
+        UNREACHABLE = 13328052
+
+    code = proto.Field(proto.STRING, number=3059181, optional=True,)
+    data = proto.RepeatedField(proto.MESSAGE, number=3076010, message=shared_01.Data,)
+    message = proto.Field(proto.STRING, number=418054151, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
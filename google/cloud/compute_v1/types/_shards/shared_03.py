@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 70 services:
+
+addresses, autoscalers, backend_buckets, backend_services, disks,
+external_vpn_gateways, firewall_policies, firewalls, forwarding_rules,
+global_addresses, global_forwarding_rules, global_network_endpoint_groups,
+global_operations, global_organization_operations,
+global_public_delegated_prefixes, health_checks, images,
+instance_group_managers, instance_groups, instance_templates, instances,
+interconnect_attachments, interconnects, licenses, network_endpoint_groups,
+networks, node_groups, node_templates, packet_mirrorings, projects,
+public_advertised_prefixes, public_delegated_prefixes, region_autoscalers,
+region_backend_services, region_commitments, region_disks,
+region_health_check_services, region_health_checks,
+region_instance_group_managers, region_instance_groups, region_instances,
+region_network_endpoint_groups, region_notification_endpoints,
+region_operations, region_ssl_certificates, region_target_http_proxies,
+region_target_https_proxies, region_url_maps, reservations, resource_policies,
+routers, routes, security_policies, service_attachments, snapshots,
+ssl_certificates, ssl_policies, subnetworks, target_grpc_proxies,
+target_http_proxies, target_https_proxies, target_instances, target_pools,
+target_ssl_proxies, target_tcp_proxies, target_vpn_gateways, url_maps,
+vpn_gateways, vpn_tunnels, zone_operations.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_01
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={"Error", "Errors", "Operation", "Warnings",},
+)
+
+
+class Error(proto.Message):
+    r"""[Output Only] If errors are generated during processing of the
+    operation, this field will be populated.
+
+    Attributes:
+        errors (Sequence[google.cloud.compute_v1.types.Errors]):
+            [Output Only] The array of errors encountered while
+            processing this operation.
+    """
+
+    errors = proto.RepeatedField(proto.MESSAGE, number=315977579, message="Errors",)
+
+
+class Errors(proto.Message):
+    r"""
+
+    Attributes:
+        code (str):
+            [Output Only] The error type identifier for this error.
+
+            This field is a member of `oneof`_ ``_code``.
+        location (str):
+            [Output Only] Indicates the field in the request that caused
+            the error. This property is optional.
+
+            This field is a member of `oneof`_ ``_location``.
+        message (str):
+            [Output Only] An optional, human-readable error message.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    code = proto.Field(proto.STRING, number=3059181, optional=True,)
+    location = proto.Field(proto.STRING, number=290430901, optional=True,)
+    message = proto.Field(proto.STRING, number=418054151, optional=True,)
+
+
+class Operation(proto.Message):
+    r"""Represents an Operation resource. Google Compute Engine has three
+    Operation resources: \*
+    `Global </compute/docs/reference/rest/v1/globalOperations>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionOperations>`__ \*
+    `Zonal </compute/docs/reference/rest/v1/zoneOperations>`__ You can
+    use an operation resource to manage asynchronous API requests. For
+    more information, read Handling API responses. Operations can be
+    global, regional or zonal. - For global operations, use the
+    ``globalOperations`` resource. - For regional operations, use the
+    ``regionOperations`` resource. - For zonal operations, use the
+    ``zonalOperations`` resource. For more information, read Global,
+    Regional, and Zonal Resources.
+
+    Attributes:
+        client_operation_id (str):
+            [Output Only] The value of ``requestId`` if you provided it
+            in the request. Not present otherwise.
+
+            This field is a member of `oneof`_ ``_client_operation_id``.
+        creation_timestamp (str):
+            [Deprecated] This field is deprecated.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            [Output Only] A textual description of the operation, which
+            is set when the operation is created.
+
+            This field is a member of `oneof`_ ``_description``.
+        end_time (str):
+            [Output Only] The time that this operation was completed.
+            This value is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_end_time``.
+        error (google.cloud.compute_v1.types.Error):
+            [Output Only] If errors are generated during processing of
+            the operation, this field will be populated.
+
+            This field is a member of `oneof`_ ``_error``.
+        http_error_message (str):
+            [Output Only] If the operation fails, this field contains
+            the HTTP error message that was returned, such as
+            ``NOT FOUND``.
+
+            This field is a member of `oneof`_ ``_http_error_message``.
+        http_error_status_code (int):
+            [Output Only] If the operation fails, this field contains
+            the HTTP error status code that was returned. For example, a
+            ``404`` means the resource was not found.
+
+            This field is a member of `oneof`_ ``_http_error_status_code``.
+        id (int):
+            [Output Only] The unique identifier for the operation. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        insert_time (str):
+            [Output Only] The time that this operation was requested.
+            This value is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_insert_time``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            ``compute#operation`` for Operation resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] Name of the operation.
+
+            This field is a member of `oneof`_ ``_name``.
+        operation_group_id (str):
+            [Output Only] An ID that represents a group of operations,
+            such as when a group of operations results from a
+            ``bulkInsert`` API request.
+
+            This field is a member of `oneof`_ ``_operation_group_id``.
+        operation_type (str):
+            [Output Only] The type of operation, such as ``insert``,
+            ``update``, or ``delete``, and so on.
+
+            This field is a member of `oneof`_ ``_operation_type``.
+        progress (int):
+            [Output Only] An optional progress indicator that ranges
+            from 0 to 100. There is no requirement that this be linear
+            or support any granularity of operations. This should not be
+            used to guess when the operation will be complete. This
+            number should monotonically increase as the operation
+            progresses.
+
+            This field is a member of `oneof`_ ``_progress``.
+        region (str):
+            [Output Only] The URL of the region where the operation
+            resides. Only applicable when performing regional
+            operations.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        start_time (str):
+            [Output Only] The time that this operation was started by
+            the server. This value is in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_start_time``.
+        status (google.cloud.compute_v1.types.Operation.Status):
+            [Output Only] The status of the operation, which can be one
+            of the following: ``PENDING``, ``RUNNING``, or ``DONE``.
+
+            This field is a member of `oneof`_ ``_status``.
+        status_message (str):
+            [Output Only] An optional textual description of the current
+            status of the operation.
+
+            This field is a member of `oneof`_ ``_status_message``.
+        target_id (int):
+            [Output Only] The unique target ID, which identifies a
+            specific incarnation of the target resource.
+
+            This field is a member of `oneof`_ ``_target_id``.
+        target_link (str):
+            [Output Only] The URL of the resource that the operation
+            modifies. For operations related to creating a snapshot,
+            this points to the persistent disk that the snapshot was
+            created from.
+
+            This field is a member of `oneof`_ ``_target_link``.
+        user (str):
+            [Output Only] User who requested the operation, for example:
+            ``user@example.com``.
+
+            This field is a member of `oneof`_ ``_user``.
+        warnings (Sequence[google.cloud.compute_v1.types.Warnings]):
+            [Output Only] If warning messages are generated during
+            processing of the operation, this field will be populated.
+        zone (str):
+            [Output Only] The URL of the zone where the operation
+            resides. Only applicable when performing per-zone
+            operations.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the operation, which can be one of the
+        following: ``PENDING``, ``RUNNING``, or ``DONE``.
+        """
+        UNDEFINED_STATUS = 0
+        DONE = 2104194
+        PENDING = 35394935
+        RUNNING = 121282975
+
+    client_operation_id = proto.Field(proto.STRING, number=297240295, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    end_time = proto.Field(proto.STRING, number=114938801, optional=True,)
+    error = proto.Field(proto.MESSAGE, number=96784904, optional=True, message="Error",)
+    http_error_message = proto.Field(proto.STRING, number=202521945, optional=True,)
+    http_error_status_code = proto.Field(proto.INT32, number=312345196, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    insert_time = proto.Field(proto.STRING, number=433722515, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    operation_group_id = proto.Field(proto.STRING, number=40171187, optional=True,)
+    operation_type = proto.Field(proto.STRING, number=177650450, optional=True,)
+    progress = proto.Field(proto.INT32, number=72663597, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    start_time = proto.Field(proto.STRING, number=37467274, optional=True,)
+    status = proto.Field(proto.ENUM, number=181260274, optional=True, enum=Status,)
+    status_message = proto.Field(proto.STRING, number=297428154, optional=True,)
+    target_id = proto.Field(proto.UINT64, number=258165385, optional=True,)
+    target_link = proto.Field(proto.STRING, number=62671336, optional=True,)
+    user = proto.Field(proto.STRING, number=3599307, optional=True,)
+    warnings = proto.RepeatedField(proto.MESSAGE, number=498091095, message="Warnings",)
+    zone = proto.Field(proto.STRING, number=3744684, optional=True,)
+
+
+class Warnings(proto.Message):
+    r"""
+
+    Attributes:
+        code (str):
+            [Output Only] A warning code, if applicable. For example,
+            Compute Engine returns NO_RESULTS_ON_PAGE if there are no
+            results in the response. Check the Code enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_code``.
+        data (Sequence[google.cloud.compute_v1.types.Data]):
+            [Output Only] Metadata about this warning in key: value
+            format. For example: "data": [ { "key": "scope", "value":
+            "zones/us-east1-d" }
+        message (str):
+            [Output Only] A human-readable description of the warning
+            code.
+
+            This field is a member of `oneof`_ ``_message``.
+    """
+
+    class Code(proto.Enum):
+        r"""[Output Only] A warning code, if applicable. For example, Compute
+        Engine returns NO_RESULTS_ON_PAGE if there are no results in the
+        response.
+        """
+        UNDEFINED_CODE = 0
+        CLEANUP_FAILED = 150308440
+        DEPRECATED_RESOURCE_USED = 391835586
+        DEPRECATED_TYPE_USED = 346526230
+        DISK_SIZE_LARGER_THAN_IMAGE_SIZE = 369442967
+        EXPERIMENTAL_TYPE_USED = 451954443
+        EXTERNAL_API_WARNING = 175546307
+        FIELD_VALUE_OVERRIDEN = 329669423
+        INJECTED_KERNELS_DEPRECATED = 417377419
+        LARGE_DEPLOYMENT_WARNING = 481440678
+        MISSING_TYPE_DEPENDENCY = 344505463
+        NEXT_HOP_ADDRESS_NOT_ASSIGNED = 324964999
+        NEXT_HOP_CANNOT_IP_FORWARD = 383382887
+        NEXT_HOP_INSTANCE_NOT_FOUND = 464250446
+        NEXT_HOP_INSTANCE_NOT_ON_NETWORK = 243758146
+        NEXT_HOP_NOT_RUNNING = 417081265
+        NOT_CRITICAL_ERROR = 105763924
+        NO_RESULTS_ON_PAGE = 30036744
+        PARTIAL_SUCCESS = 39966469
+        REQUIRED_TOS_AGREEMENT = 3745539
+        RESOURCE_IN_USE_BY_OTHER_RESOURCE_WARNING = 496728641
+        RESOURCE_NOT_DELETED = 168598460
+        SCHEMA_VALIDATION_IGNORED = 275245642
+        SINGLE_INSTANCE_PROPERTY_TEMPLATE = 268305617
+        UNDECLARED_PROPERTIES = 390513439
+        UNREACHABLE = 13328052
+
+    code = proto.Field(proto.STRING, number=3059181, optional=True,)
+    data = proto.RepeatedField(proto.MESSAGE, number=3076010, message=shared_01.Data,)
+    message = proto.Field(proto.STRING, number=418054151, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,563 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 14 services:
+
+disks, firewall_policies, images, instance_templates, instances, licenses,
+node_groups, node_templates, region_disks, reservations, resource_policies,
+service_attachments, snapshots, subnetworks.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_05
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AuditConfig",
+        "AuditLogConfig",
+        "AuthorizationLoggingOptions",
+        "Binding",
+        "Condition",
+        "LogConfig",
+        "LogConfigCloudAuditOptions",
+        "LogConfigCounterOptions",
+        "LogConfigCounterOptionsCustomField",
+        "LogConfigDataAccessOptions",
+        "Policy",
+        "Rule",
+    },
+)
+
+
+class AuditConfig(proto.Message):
+    r"""Specifies the audit configuration for a service. The configuration
+    determines which permission types are logged, and what identities,
+    if any, are exempted from logging. An AuditConfig must have one or
+    more AuditLogConfigs. If there are AuditConfigs for both
+    ``allServices`` and a specific service, the union of the two
+    AuditConfigs is used for that service: the log_types specified in
+    each AuditConfig are enabled, and the exempted_members in each
+    AuditLogConfig are exempted. Example Policy with multiple
+    AuditConfigs: { "audit_configs": [ { "service": "allServices",
+    "audit_log_configs": [ { "log_type": "DATA_READ",
+    "exempted_members": [ "user:jose@example.com" ] }, { "log_type":
+    "DATA_WRITE" }, { "log_type": "ADMIN_READ" } ] }, { "service":
+    "sampleservice.googleapis.com", "audit_log_configs": [ { "log_type":
+    "DATA_READ" }, { "log_type": "DATA_WRITE", "exempted_members": [
+    "user:aliya@example.com" ] } ] } ] } For sampleservice, this policy
+    enables DATA_READ, DATA_WRITE and ADMIN_READ logging. It also
+    exempts jose@example.com from DATA_READ logging, and
+    aliya@example.com from DATA_WRITE logging.
+
+    Attributes:
+        audit_log_configs (Sequence[google.cloud.compute_v1.types.AuditLogConfig]):
+            The configuration for logging of each type of
+            permission.
+        exempted_members (Sequence[str]):
+            This is deprecated and has no effect. Do not
+            use.
+        service (str):
+            Specifies a service that will be enabled for audit logging.
+            For example, ``storage.googleapis.com``,
+            ``cloudsql.googleapis.com``. ``allServices`` is a special
+            value that covers all services.
+
+            This field is a member of `oneof`_ ``_service``.
+    """
+
+    audit_log_configs = proto.RepeatedField(
+        proto.MESSAGE, number=488420626, message="AuditLogConfig",
+    )
+    exempted_members = proto.RepeatedField(proto.STRING, number=232615576,)
+    service = proto.Field(proto.STRING, number=373540533, optional=True,)
+
+
+class AuditLogConfig(proto.Message):
+    r"""Provides the configuration for logging a type of permissions.
+    Example: { "audit_log_configs": [ { "log_type": "DATA_READ",
+    "exempted_members": [ "user:jose@example.com" ] }, { "log_type":
+    "DATA_WRITE" } ] } This enables 'DATA_READ' and 'DATA_WRITE'
+    logging, while exempting jose@example.com from DATA_READ logging.
+
+    Attributes:
+        exempted_members (Sequence[str]):
+            Specifies the identities that do not cause
+            logging for this type of permission. Follows the
+            same format of Binding.members.
+        ignore_child_exemptions (bool):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_ignore_child_exemptions``.
+        log_type (str):
+            The log type that this config enables.
+            Check the LogType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_log_type``.
+    """
+
+    class LogType(proto.Enum):
+        r"""The log type that this config enables."""
+        UNDEFINED_LOG_TYPE = 0
+        ADMIN_READ = 128951462
+        DATA_READ = 305224971
+        DATA_WRITE = 340181738
+        LOG_TYPE_UNSPECIFIED = 154527053
+
+    exempted_members = proto.RepeatedField(proto.STRING, number=232615576,)
+    ignore_child_exemptions = proto.Field(proto.BOOL, number=70141850, optional=True,)
+    log_type = proto.Field(proto.STRING, number=403115861, optional=True,)
+
+
+class AuthorizationLoggingOptions(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        permission_type (str):
+            This is deprecated and has no effect. Do not
+            use. Check the PermissionType enum for the list
+            of possible values.
+
+            This field is a member of `oneof`_ ``_permission_type``.
+    """
+
+    class PermissionType(proto.Enum):
+        r"""This is deprecated and has no effect. Do not use."""
+        UNDEFINED_PERMISSION_TYPE = 0
+        ADMIN_READ = 128951462
+        ADMIN_WRITE = 244412079
+        DATA_READ = 305224971
+        DATA_WRITE = 340181738
+        PERMISSION_TYPE_UNSPECIFIED = 440313346
+
+    permission_type = proto.Field(proto.STRING, number=525978538, optional=True,)
+
+
+class Binding(proto.Message):
+    r"""Associates ``members`` with a ``role``.
+
+    Attributes:
+        binding_id (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_binding_id``.
+        condition (google.cloud.compute_v1.types.Expr):
+            The condition that is associated with this binding. If the
+            condition evaluates to ``true``, then this binding applies
+            to the current request. If the condition evaluates to
+            ``false``, then this binding does not apply to the current
+            request. However, a different role binding might grant the
+            same role to one or more of the members in this binding. To
+            learn which resources support conditions in their IAM
+            policies, see the `IAM
+            documentation <https://cloud.google.com/iam/help/conditions/resource-policies>`__.
+
+            This field is a member of `oneof`_ ``_condition``.
+        members (Sequence[str]):
+            Specifies the identities requesting access for a Cloud
+            Platform resource. ``members`` can have the following
+            values: \* ``allUsers``: A special identifier that
+            represents anyone who is on the internet; with or without a
+            Google account. \* ``allAuthenticatedUsers``: A special
+            identifier that represents anyone who is authenticated with
+            a Google account or a service account. \*
+            ``user:{emailid}``: An email address that represents a
+            specific Google account. For example, ``alice@example.com``
+            . \* ``serviceAccount:{emailid}``: An email address that
+            represents a service account. For example,
+            ``my-other-app@appspot.gserviceaccount.com``. \*
+            ``group:{emailid}``: An email address that represents a
+            Google group. For example, ``admins@example.com``. \*
+            ``deleted:user:{emailid}?uid={uniqueid}``: An email address
+            (plus unique identifier) representing a user that has been
+            recently deleted. For example,
+            ``alice@example.com?uid=123456789012345678901``. If the user
+            is recovered, this value reverts to ``user:{emailid}`` and
+            the recovered user retains the role in the binding. \*
+            ``deleted:serviceAccount:{emailid}?uid={uniqueid}``: An
+            email address (plus unique identifier) representing a
+            service account that has been recently deleted. For example,
+            ``my-other-app@appspot.gserviceaccount.com?uid=123456789012345678901``.
+            If the service account is undeleted, this value reverts to
+            ``serviceAccount:{emailid}`` and the undeleted service
+            account retains the role in the binding. \*
+            ``deleted:group:{emailid}?uid={uniqueid}``: An email address
+            (plus unique identifier) representing a Google group that
+            has been recently deleted. For example,
+            ``admins@example.com?uid=123456789012345678901``. If the
+            group is recovered, this value reverts to
+            ``group:{emailid}`` and the recovered group retains the role
+            in the binding. \* ``domain:{domain}``: The G Suite domain
+            (primary) that represents all the users of that domain. For
+            example, ``google.com`` or ``example.com``.
+        role (str):
+            Role that is assigned to ``members``. For example,
+            ``roles/viewer``, ``roles/editor``, or ``roles/owner``.
+
+            This field is a member of `oneof`_ ``_role``.
+    """
+
+    binding_id = proto.Field(proto.STRING, number=441088277, optional=True,)
+    condition = proto.Field(
+        proto.MESSAGE, number=212430107, optional=True, message=shared_05.Expr,
+    )
+    members = proto.RepeatedField(proto.STRING, number=412010777,)
+    role = proto.Field(proto.STRING, number=3506294, optional=True,)
+
+
+class Condition(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        iam (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_iam``.
+        op (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_op``.
+        svc (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_svc``.
+        sys (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_sys``.
+        values (Sequence[str]):
+            This is deprecated and has no effect. Do not
+            use.
+    """
+
+    iam = proto.Field(proto.STRING, number=104021, optional=True,)
+    op = proto.Field(proto.STRING, number=3553, optional=True,)
+    svc = proto.Field(proto.STRING, number=114272, optional=True,)
+    sys = proto.Field(proto.STRING, number=114381, optional=True,)
+    values = proto.RepeatedField(proto.STRING, number=249928994,)
+
+
+class LogConfig(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        cloud_audit (google.cloud.compute_v1.types.LogConfigCloudAuditOptions):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_cloud_audit``.
+        counter (google.cloud.compute_v1.types.LogConfigCounterOptions):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_counter``.
+        data_access (google.cloud.compute_v1.types.LogConfigDataAccessOptions):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_data_access``.
+    """
+
+    cloud_audit = proto.Field(
+        proto.MESSAGE,
+        number=412852561,
+        optional=True,
+        message="LogConfigCloudAuditOptions",
+    )
+    counter = proto.Field(
+        proto.MESSAGE,
+        number=420959740,
+        optional=True,
+        message="LogConfigCounterOptions",
+    )
+    data_access = proto.Field(
+        proto.MESSAGE,
+        number=286633881,
+        optional=True,
+        message="LogConfigDataAccessOptions",
+    )
+
+
+class LogConfigCloudAuditOptions(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        authorization_logging_options (google.cloud.compute_v1.types.AuthorizationLoggingOptions):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_authorization_logging_options``.
+        log_name (str):
+            This is deprecated and has no effect. Do not
+            use. Check the LogName enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_log_name``.
+    """
+
+    class LogName(proto.Enum):
+        r"""This is deprecated and has no effect. Do not use."""
+        UNDEFINED_LOG_NAME = 0
+        ADMIN_ACTIVITY = 427503135
+        DATA_ACCESS = 238070681
+        UNSPECIFIED_LOG_NAME = 410515182
+
+    authorization_logging_options = proto.Field(
+        proto.MESSAGE,
+        number=217861624,
+        optional=True,
+        message="AuthorizationLoggingOptions",
+    )
+    log_name = proto.Field(proto.STRING, number=402913958, optional=True,)
+
+
+class LogConfigCounterOptions(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        custom_fields (Sequence[google.cloud.compute_v1.types.LogConfigCounterOptionsCustomField]):
+            This is deprecated and has no effect. Do not
+            use.
+        field (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_field``.
+        metric (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_metric``.
+    """
+
+    custom_fields = proto.RepeatedField(
+        proto.MESSAGE, number=249651015, message="LogConfigCounterOptionsCustomField",
+    )
+    field = proto.Field(proto.STRING, number=97427706, optional=True,)
+    metric = proto.Field(proto.STRING, number=533067184, optional=True,)
+
+
+class LogConfigCounterOptionsCustomField(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        name (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_name``.
+        value (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    value = proto.Field(proto.STRING, number=111972721, optional=True,)
+
+
+class LogConfigDataAccessOptions(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        log_mode (str):
+            This is deprecated and has no effect. Do not
+            use. Check the LogMode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_log_mode``.
+    """
+
+    class LogMode(proto.Enum):
+        r"""This is deprecated and has no effect. Do not use."""
+        UNDEFINED_LOG_MODE = 0
+        LOG_FAIL_CLOSED = 360469778
+        LOG_MODE_UNSPECIFIED = 88160822
+
+    log_mode = proto.Field(proto.STRING, number=402897342, optional=True,)
+
+
+class Policy(proto.Message):
+    r"""An Identity and Access Management (IAM) policy, which specifies
+    access controls for Google Cloud resources. A ``Policy`` is a
+    collection of ``bindings``. A ``binding`` binds one or more
+    ``members`` to a single ``role``. Members can be user accounts,
+    service accounts, Google groups, and domains (such as G Suite). A
+    ``role`` is a named list of permissions; each ``role`` can be an IAM
+    predefined role or a user-created custom role. For some types of
+    Google Cloud resources, a ``binding`` can also specify a
+    ``condition``, which is a logical expression that allows access to a
+    resource only if the expression evaluates to ``true``. A condition
+    can add constraints based on attributes of the request, the
+    resource, or both. To learn which resources support conditions in
+    their IAM policies, see the `IAM
+    documentation <https://cloud.google.com/iam/help/conditions/resource-policies>`__.
+    **JSON example:** { "bindings": [ { "role":
+    "roles/resourcemanager.organizationAdmin", "members": [
+    "user:mike@example.com", "group:admins@example.com",
+    "domain:google.com",
+    "serviceAccount:my-project-id@appspot.gserviceaccount.com" ] }, {
+    "role": "roles/resourcemanager.organizationViewer", "members": [
+    "user:eve@example.com" ], "condition": { "title": "expirable
+    access", "description": "Does not grant access after Sep 2020",
+    "expression": "request.time <
+    timestamp('2020-10-01T00:00:00.000Z')", } } ], "etag":
+    "BwWWja0YfJA=", "version": 3 } **YAML example:** bindings: -
+    members: - user:mike@example.com - group:admins@example.com -
+    domain:google.com -
+    serviceAccount:my-project-id@appspot.gserviceaccount.com role:
+    roles/resourcemanager.organizationAdmin - members: -
+    user:eve@example.com role: roles/resourcemanager.organizationViewer
+    condition: title: expirable access description: Does not grant
+    access after Sep 2020 expression: request.time <
+    timestamp('2020-10-01T00:00:00.000Z') etag: BwWWja0YfJA= version: 3
+    For a description of IAM and its features, see the `IAM
+    documentation <https://cloud.google.com/iam/docs/>`__.
+
+    Attributes:
+        audit_configs (Sequence[google.cloud.compute_v1.types.AuditConfig]):
+            Specifies cloud audit logging configuration
+            for this policy.
+        bindings (Sequence[google.cloud.compute_v1.types.Binding]):
+            Associates a list of ``members`` to a ``role``. Optionally,
+            may specify a ``condition`` that determines how and when the
+            ``bindings`` are applied. Each of the ``bindings`` must
+            contain at least one member.
+        etag (str):
+            ``etag`` is used for optimistic concurrency control as a way
+            to help prevent simultaneous updates of a policy from
+            overwriting each other. It is strongly suggested that
+            systems make use of the ``etag`` in the read-modify-write
+            cycle to perform policy updates in order to avoid race
+            conditions: An ``etag`` is returned in the response to
+            ``getIamPolicy``, and systems are expected to put that etag
+            in the request to ``setIamPolicy`` to ensure that their
+            change will be applied to the same version of the policy.
+            **Important:** If you use IAM Conditions, you must include
+            the ``etag`` field whenever you call ``setIamPolicy``. If
+            you omit this field, then IAM allows you to overwrite a
+            version ``3`` policy with a version ``1`` policy, and all of
+            the conditions in the version ``3`` policy are lost.
+
+            This field is a member of `oneof`_ ``_etag``.
+        iam_owned (bool):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_iam_owned``.
+        rules (Sequence[google.cloud.compute_v1.types.Rule]):
+            This is deprecated and has no effect. Do not
+            use.
+        version (int):
+            Specifies the format of the policy. Valid values are ``0``,
+            ``1``, and ``3``. Requests that specify an invalid value are
+            rejected. Any operation that affects conditional role
+            bindings must specify version ``3``. This requirement
+            applies to the following operations: \* Getting a policy
+            that includes a conditional role binding \* Adding a
+            conditional role binding to a policy \* Changing a
+            conditional role binding in a policy \* Removing any role
+            binding, with or without a condition, from a policy that
+            includes conditions **Important:** If you use IAM
+            Conditions, you must include the ``etag`` field whenever you
+            call ``setIamPolicy``. If you omit this field, then IAM
+            allows you to overwrite a version ``3`` policy with a
+            version ``1`` policy, and all of the conditions in the
+            version ``3`` policy are lost. If a policy does not include
+            any conditions, operations on that policy may specify any
+            valid version or leave the field unset. To learn which
+            resources support conditions in their IAM policies, see the
+            `IAM
+            documentation <https://cloud.google.com/iam/help/conditions/resource-policies>`__.
+
+            This field is a member of `oneof`_ ``_version``.
+    """
+
+    audit_configs = proto.RepeatedField(
+        proto.MESSAGE, number=328080653, message="AuditConfig",
+    )
+    bindings = proto.RepeatedField(proto.MESSAGE, number=403251854, message="Binding",)
+    etag = proto.Field(proto.STRING, number=3123477, optional=True,)
+    iam_owned = proto.Field(proto.BOOL, number=450566203, optional=True,)
+    rules = proto.RepeatedField(proto.MESSAGE, number=108873975, message="Rule",)
+    version = proto.Field(proto.INT32, number=351608024, optional=True,)
+
+
+class Rule(proto.Message):
+    r"""This is deprecated and has no effect. Do not use.
+
+    Attributes:
+        action (str):
+            This is deprecated and has no effect. Do not
+            use. Check the Action enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_action``.
+        conditions (Sequence[google.cloud.compute_v1.types.Condition]):
+            This is deprecated and has no effect. Do not
+            use.
+        description (str):
+            This is deprecated and has no effect. Do not
+            use.
+
+            This field is a member of `oneof`_ ``_description``.
+        ins (Sequence[str]):
+            This is deprecated and has no effect. Do not
+            use.
+        log_configs (Sequence[google.cloud.compute_v1.types.LogConfig]):
+            This is deprecated and has no effect. Do not
+            use.
+        not_ins (Sequence[str]):
+            This is deprecated and has no effect. Do not
+            use.
+        permissions (Sequence[str]):
+            This is deprecated and has no effect. Do not
+            use.
+    """
+
+    class Action(proto.Enum):
+        r"""This is deprecated and has no effect. Do not use."""
+        UNDEFINED_ACTION = 0
+        ALLOW = 62368553
+        ALLOW_WITH_LOG = 76034177
+        DENY = 2094604
+        DENY_WITH_LOG = 351433982
+        LOG = 75556
+        NO_ACTION = 260643444
+
+    action = proto.Field(proto.STRING, number=187661878, optional=True,)
+    conditions = proto.RepeatedField(
+        proto.MESSAGE, number=142882488, message="Condition",
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    ins = proto.RepeatedField(proto.STRING, number=104430,)
+    log_configs = proto.RepeatedField(
+        proto.MESSAGE, number=152873846, message="LogConfig",
+    )
+    not_ins = proto.RepeatedField(proto.STRING, number=518443138,)
+    permissions = proto.RepeatedField(proto.STRING, number=59962500,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
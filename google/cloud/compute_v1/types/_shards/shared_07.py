@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 9 services:
+
+accelerator_types, disk_types, image_family_views, images, machine_types,
+node_types, region_disk_types, regions, zones.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"DeprecationStatus",},
+)
+
+
+class DeprecationStatus(proto.Message):
+    r"""Deprecation status for a public resource.
+
+    Attributes:
+        deleted (str):
+            An optional RFC3339 timestamp on or after
+            which the state of this resource is intended to
+            change to DELETED. This is only informational
+            and the status will not change unless the client
+            explicitly changes it.
+
+            This field is a member of `oneof`_ ``_deleted``.
+        deprecated (str):
+            An optional RFC3339 timestamp on or after
+            which the state of this resource is intended to
+            change to DEPRECATED. This is only informational
+            and the status will not change unless the client
+            explicitly changes it.
+
+            This field is a member of `oneof`_ ``_deprecated``.
+        obsolete (str):
+            An optional RFC3339 timestamp on or after
+            which the state of this resource is intended to
+            change to OBSOLETE. This is only informational
+            and the status will not change unless the client
+            explicitly changes it.
+
+            This field is a member of `oneof`_ ``_obsolete``.
+        replacement (str):
+            The URL of the suggested replacement for a
+            deprecated resource. The suggested replacement
+            resource must be the same kind of resource as
+            the deprecated resource.
+
+            This field is a member of `oneof`_ ``_replacement``.
+        state (str):
+            The deprecation state of this resource. This
+            can be ACTIVE, DEPRECATED, OBSOLETE, or DELETED.
+            Operations which communicate the end of life
+            date for an image, can use ACTIVE. Operations
+            which create a new resource using a DEPRECATED
+            resource will return successfully, but with a
+            warning indicating the deprecated resource and
+            recommending its replacement. Operations which
+            use OBSOLETE or DELETED resources will be
+            rejected and result in an error. Check the State
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class State(proto.Enum):
+        r"""The deprecation state of this resource. This can be ACTIVE,
+        DEPRECATED, OBSOLETE, or DELETED. Operations which communicate
+        the end of life date for an image, can use ACTIVE. Operations
+        which create a new resource using a DEPRECATED resource will
+        return successfully, but with a warning indicating the
+        deprecated resource and recommending its replacement. Operations
+        which use OBSOLETE or DELETED resources will be rejected and
+        result in an error.
+        """
+        UNDEFINED_STATE = 0
+        ACTIVE = 314733318
+        DELETED = 120962041
+        DEPRECATED = 463360435
+        OBSOLETE = 66532761
+
+    deleted = proto.Field(proto.STRING, number=476721177, optional=True,)
+    deprecated = proto.Field(proto.STRING, number=515138995, optional=True,)
+    obsolete = proto.Field(proto.STRING, number=357647769, optional=True,)
+    replacement = proto.Field(proto.STRING, number=430919186, optional=True,)
+    state = proto.Field(proto.STRING, number=109757585, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 8 services:
+
+disks, image_family_views, images, instance_templates, instances, region_disks,
+region_instances, snapshots.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"CustomerEncryptionKey",},
+)
+
+
+class CustomerEncryptionKey(proto.Message):
+    r"""
+
+    Attributes:
+        kms_key_name (str):
+            The name of the encryption key that is stored in Google
+            Cloud KMS. For example: "kmsKeyName":
+            "projects/kms_project_id/locations/region/keyRings/
+            key_region/cryptoKeys/key
+
+            This field is a member of `oneof`_ ``_kms_key_name``.
+        kms_key_service_account (str):
+            The service account being used for the encryption request
+            for the given KMS key. If absent, the Compute Engine default
+            service account is used. For example:
+            "kmsKeyServiceAccount":
+            "name@project_id.iam.gserviceaccount.com/
+
+            This field is a member of `oneof`_ ``_kms_key_service_account``.
+        raw_key (str):
+            Specifies a 256-bit customer-supplied
+            encryption key, encoded in RFC 4648 base64 to
+            either encrypt or decrypt this resource. You can
+            provide either the rawKey or the
+            rsaEncryptedKey. For example: "rawKey":
+            "SGVsbG8gZnJvbSBHb29nbGUgQ2xvdWQgUGxhdGZvcm0=".
+
+            This field is a member of `oneof`_ ``_raw_key``.
+        rsa_encrypted_key (str):
+            Specifies an RFC 4648 base64 encoded, RSA-
+            rapped 2048-bit customer-supplied encryption key
+            to either encrypt or decrypt this resource. You
+            can provide either the rawKey or the
+            rsaEncryptedKey. For example: "rsaEncryptedKey":
+            "ieCx/NcW06PcT7Ep1X6LUTc/hLvUDYyzSZPPVCVPTVEohpeHASqC8uw5TzyO9U+Fka9JFH
+            z0mBibXUInrC/jEk014kCK/NPjYgEMOyssZ4ZINPKxlUh2zn1bV+MCaTICrdmuSBTWlUUiFoD
+            D6PYznLwh8ZNdaheCeZ8ewEXgFQ8V+sDroLaN3Xs3MDTXQEMMoNUXMCZEIpg9Vtp9x2oe=="
+            The key must meet the following requirements
+            before you can provide it to Compute Engine: 1.
+            The key is wrapped using a RSA public key
+            certificate provided by Google. 2. After being
+            wrapped, the key must be encoded in RFC 4648
+            base64 encoding. Gets the RSA public key
+            certificate provided by Google at:
+            https://cloud-
+            certs.storage.googleapis.com/google-cloud-csek-
+            ingress.pem
+
+            This field is a member of `oneof`_ ``_rsa_encrypted_key``.
+        sha256 (str):
+            [Output only] The RFC 4648 base64 encoded SHA-256 hash of
+            the customer-supplied encryption key that protects this
+            resource.
+
+            This field is a member of `oneof`_ ``_sha256``.
+    """
+
+    kms_key_name = proto.Field(proto.STRING, number=484373913, optional=True,)
+    kms_key_service_account = proto.Field(
+        proto.STRING, number=209986261, optional=True,
+    )
+    raw_key = proto.Field(proto.STRING, number=449196488, optional=True,)
+    rsa_encrypted_key = proto.Field(proto.STRING, number=335487397, optional=True,)
+    sha256 = proto.Field(proto.STRING, number=170112551, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 7 services:
+
+disks, image_family_views, images, instance_templates, instances, region_disks,
+region_instances.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"GuestOsFeature",},
+)
+
+
+class GuestOsFeature(proto.Message):
+    r"""Guest OS features.
+
+    Attributes:
+        type_ (str):
+            The ID of a supported feature. Read Enabling
+            guest operating system features to see a list of
+            available options. Check the Type enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""The ID of a supported feature. Read Enabling guest operating
+        system features to see a list of available options.
+        """
+        UNDEFINED_TYPE = 0
+        FEATURE_TYPE_UNSPECIFIED = 531767259
+        GVNIC = 68209305
+        MULTI_IP_SUBNET = 151776719
+        SECURE_BOOT = 376811194
+        SEV_CAPABLE = 87083793
+        UEFI_COMPATIBLE = 195865408
+        VIRTIO_SCSI_MULTIQUEUE = 201597069
+        WINDOWS = 456863331
+
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
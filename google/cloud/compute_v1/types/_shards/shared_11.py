@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 6 services:
+
+backend_services, node_groups, region_backend_services,
+region_notification_endpoints, region_url_maps, url_maps.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"Duration",},)
+
+
+class Duration(proto.Message):
+    r"""A Duration represents a fixed-length span of time represented
+    as a count of seconds and fractions of seconds at nanosecond
+    resolution. It is independent of any calendar and concepts like
+    "day" or "month". Range is approximately 10,000 years.
+
+    Attributes:
+        nanos (int):
+            Span of time that's a fraction of a second at nanosecond
+            resolution. Durations less than one second are represented
+            with a 0 ``seconds`` field and a positive ``nanos`` field.
+            Must be from 0 to 999,999,999 inclusive.
+
+            This field is a member of `oneof`_ ``_nanos``.
+        seconds (int):
+            Span of time at a resolution of a second. Must be from 0 to
+            315,576,000,000 inclusive. Note: these bounds are computed
+            from: 60 sec/min \* 60 min/hr \* 24 hr/day \* 365.25
+            days/year \* 10000 years
+
+            This field is a member of `oneof`_ ``_seconds``.
+    """
+
+    nanos = proto.Field(proto.INT32, number=104586303, optional=True,)
+    seconds = proto.Field(proto.INT64, number=359484031, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
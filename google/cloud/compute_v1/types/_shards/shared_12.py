@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 5 services:
+
+image_family_views, images, instance_templates, instances, region_instances.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={"FileContentBuffer", "InitialStateConfig",},
+)
+
+
+class FileContentBuffer(proto.Message):
+    r"""
+
+    Attributes:
+        content (str):
+            The raw content in the secure keys file.
+
+            This field is a member of `oneof`_ ``_content``.
+        file_type (str):
+            The file type of source file.
+            Check the FileType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_file_type``.
+    """
+
+    class FileType(proto.Enum):
+        r"""The file type of source file."""
+        UNDEFINED_FILE_TYPE = 0
+        BIN = 65767
+        UNDEFINED = 137851184
+        X509 = 2674086
+
+    content = proto.Field(proto.STRING, number=414659705, optional=True,)
+    file_type = proto.Field(proto.STRING, number=294346781, optional=True,)
+
+
+class InitialStateConfig(proto.Message):
+    r"""Initial State for shielded instance, these are public keys
+    which are safe to store in public
+
+    Attributes:
+        dbs (Sequence[google.cloud.compute_v1.types.FileContentBuffer]):
+            The Key Database (db).
+        dbxs (Sequence[google.cloud.compute_v1.types.FileContentBuffer]):
+            The forbidden key database (dbx).
+        keks (Sequence[google.cloud.compute_v1.types.FileContentBuffer]):
+            The Key Exchange Key (KEK).
+        pk (google.cloud.compute_v1.types.FileContentBuffer):
+            The Platform Key (PK).
+
+            This field is a member of `oneof`_ ``_pk``.
+    """
+
+    dbs = proto.RepeatedField(proto.MESSAGE, number=99253, message="FileContentBuffer",)
+    dbxs = proto.RepeatedField(
+        proto.MESSAGE, number=3077113, message="FileContentBuffer",
+    )
+    keks = proto.RepeatedField(
+        proto.MESSAGE, number=3288130, message="FileContentBuffer",
+    )
+    pk = proto.Field(
+        proto.MESSAGE, number=3579, optional=True, message="FileContentBuffer",
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 5 services:
+
+node_templates, region_disks, resource_policies, service_attachments,
+subnetworks.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_06
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"RegionSetPolicyRequest",},
+)
+
+
+class RegionSetPolicyRequest(proto.Message):
+    r"""
+
+    Attributes:
+        bindings (Sequence[google.cloud.compute_v1.types.Binding]):
+            Flatten Policy to create a backwacd
+            compatible wire-format. Deprecated. Use 'policy'
+            to specify bindings.
+        etag (str):
+            Flatten Policy to create a backward
+            compatible wire-format. Deprecated. Use 'policy'
+            to specify the etag.
+
+            This field is a member of `oneof`_ ``_etag``.
+        policy (google.cloud.compute_v1.types.Policy):
+            REQUIRED: The complete policy to be applied
+            to the 'resource'. The size of the policy is
+            limited to a few 10s of KB. An empty policy is
+            in general a valid policy but certain services
+            (like Projects) might reject them.
+
+            This field is a member of `oneof`_ ``_policy``.
+    """
+
+    bindings = proto.RepeatedField(
+        proto.MESSAGE, number=403251854, message=shared_06.Binding,
+    )
+    etag = proto.Field(proto.STRING, number=3123477, optional=True,)
+    policy = proto.Field(
+        proto.MESSAGE, number=91071794, optional=True, message=shared_06.Policy,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 4 services:
+
+autoscalers, instance_group_managers, region_autoscalers,
+region_instance_group_managers.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"FixedOrPercent",},
+)
+
+
+class FixedOrPercent(proto.Message):
+    r"""Encapsulates numeric value that can be either absolute or
+    relative.
+
+    Attributes:
+        calculated (int):
+            [Output Only] Absolute value of VM instances calculated
+            based on the specific mode. - If the value is fixed, then
+            the calculated value is equal to the fixed value. - If the
+            value is a percent, then the calculated value is percent/100
+            \* targetSize. For example, the calculated value of a 80% of
+            a managed instance group with 150 instances would be (80/100
+            \* 150) = 120 VM instances. If there is a remainder, the
+            number is rounded.
+
+            This field is a member of `oneof`_ ``_calculated``.
+        fixed (int):
+            Specifies a fixed number of VM instances.
+            This must be a positive integer.
+
+            This field is a member of `oneof`_ ``_fixed``.
+        percent (int):
+            Specifies a percentage of instances between 0
+            to 100%, inclusive. For example, specify 80 for
+            80%.
+
+            This field is a member of `oneof`_ ``_percent``.
+    """
+
+    calculated = proto.Field(proto.INT32, number=472082878, optional=True,)
+    fixed = proto.Field(proto.INT32, number=97445748, optional=True,)
+    percent = proto.Field(proto.INT32, number=394814533, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
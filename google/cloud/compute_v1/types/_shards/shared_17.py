@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 4 services:
+
+forwarding_rules, global_forwarding_rules, region_url_maps, url_maps.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={"MetadataFilter", "MetadataFilterLabelMatch",},
+)
+
+
+class MetadataFilter(proto.Message):
+    r"""Opaque filter criteria used by loadbalancers to restrict routing
+    configuration to a limited set of loadbalancing proxies. Proxies and
+    sidecars involved in loadbalancing would typically present metadata
+    to the loadbalancers which need to match criteria specified here. If
+    a match takes place, the relevant configuration is made available to
+    those proxies. For each metadataFilter in this list, if its
+    filterMatchCriteria is set to MATCH_ANY, at least one of the
+    filterLabels must match the corresponding label provided in the
+    metadata. If its filterMatchCriteria is set to MATCH_ALL, then all
+    of its filterLabels must match with corresponding labels provided in
+    the metadata. An example for using metadataFilters would be: if
+    loadbalancing involves Envoys, they will only receive routing
+    configuration when values in metadataFilters match values supplied
+    in of their XDS requests to loadbalancers.
+
+    Attributes:
+        filter_labels (Sequence[google.cloud.compute_v1.types.MetadataFilterLabelMatch]):
+            The list of label value pairs that must match
+            labels in the provided metadata based on
+            filterMatchCriteria This list must not be empty
+            and can have at the most 64 entries.
+        filter_match_criteria (str):
+            Specifies how individual filterLabel matches within the list
+            of filterLabels contribute towards the overall
+            metadataFilter match. Supported values are: - MATCH_ANY: At
+            least one of the filterLabels must have a matching label in
+            the provided metadata. - MATCH_ALL: All filterLabels must
+            have matching labels in the provided metadata. Check the
+            FilterMatchCriteria enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_filter_match_criteria``.
+    """
+
+    class FilterMatchCriteria(proto.Enum):
+        r"""Specifies how individual filterLabel matches within the list of
+        filterLabels contribute towards the overall metadataFilter match.
+        Supported values are: - MATCH_ANY: At least one of the filterLabels
+        must have a matching label in the provided metadata. - MATCH_ALL:
+        All filterLabels must have matching labels in the provided metadata.
+        """
+        UNDEFINED_FILTER_MATCH_CRITERIA = 0
+        MATCH_ALL = 180663271
+        MATCH_ANY = 180663346
+        NOT_SET = 163646646
+
+    filter_labels = proto.RepeatedField(
+        proto.MESSAGE, number=307903142, message="MetadataFilterLabelMatch",
+    )
+    filter_match_criteria = proto.Field(proto.STRING, number=239970368, optional=True,)
+
+
+class MetadataFilterLabelMatch(proto.Message):
+    r"""MetadataFilter label name value pairs that are expected to
+    match corresponding labels presented as metadata to the
+    loadbalancer.
+
+    Attributes:
+        name (str):
+            Name of metadata label. The name can have a
+            maximum length of 1024 characters and must be at
+            least 1 character long.
+
+            This field is a member of `oneof`_ ``_name``.
+        value (str):
+            The value of the label must match the
+            specified value. value can have a maximum length
+            of 1024 characters.
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    value = proto.Field(proto.STRING, number=111972721, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 4 services:
+
+instance_group_managers, instance_groups, region_instance_group_managers,
+region_instance_groups.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"NamedPort",},)
+
+
+class NamedPort(proto.Message):
+    r"""The named port. For example: <"http", 80>.
+
+    Attributes:
+        name (str):
+            The name for this named port. The name must
+            be 1-63 characters long, and comply with
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        port (int):
+            The port number, which can be a value between
+            1 and 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+    """
+
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 4 services:
+
+instance_templates, instances, projects, region_instances.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"Items", "Metadata",},
+)
+
+
+class Items(proto.Message):
+    r"""Metadata
+
+    Attributes:
+        key (str):
+            Key for the metadata entry. Keys must conform to the
+            following regexp: [a-zA-Z0-9-_]+, and be less than 128 bytes
+            in length. This is reflected as part of a URL in the
+            metadata server. Additionally, to avoid ambiguity, keys must
+            not conflict with any other metadata keys for the project.
+
+            This field is a member of `oneof`_ ``_key``.
+        value (str):
+            Value for the metadata entry. These are free-
+            orm strings, and only have meaning as
+            interpreted by the image running in the
+            instance. The only restriction placed on values
+            is that their size must be less than or equal to
+            262144 bytes (256 KiB).
+
+            This field is a member of `oneof`_ ``_value``.
+    """
+
+    key = proto.Field(proto.STRING, number=106079, optional=True,)
+    value = proto.Field(proto.STRING, number=111972721, optional=True,)
+
+
+class Metadata(proto.Message):
+    r"""A metadata key/value entry.
+
+    Attributes:
+        fingerprint (str):
+            Specifies a fingerprint for this request,
+            which is essentially a hash of the metadata's
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update metadata. You must always provide an
+            up-to-date fingerprint hash in order to update
+            or change metadata, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve the resource.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        items (Sequence[google.cloud.compute_v1.types.Items]):
+            Array of key/value pairs. The total size of
+            all keys and values must be less than 512 KB.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#metadata
+            for metadata.
+
+            This field is a member of `oneof`_ ``_kind``.
+    """
+
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="Items",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 4 services:
+
+region_target_http_proxies, region_target_https_proxies, target_http_proxies,
+target_https_proxies.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"UrlMapReference",},
+)
+
+
+class UrlMapReference(proto.Message):
+    r"""
+
+    Attributes:
+        url_map (str):
+
+            This field is a member of `oneof`_ ``_url_map``.
+    """
+
+    url_map = proto.Field(proto.STRING, number=367020684, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 3 services:
+
+disks, region_disks, snapshots.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_08
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"Snapshot",},)
+
+
+class Snapshot(proto.Message):
+    r"""Represents a Persistent Disk Snapshot resource. You can use
+    snapshots to back up data on a regular interval. For more
+    information, read Creating persistent disk snapshots.
+
+    Attributes:
+        auto_created (bool):
+            [Output Only] Set to true if snapshots are automatically
+            created by applying resource policy on the target disk.
+
+            This field is a member of `oneof`_ ``_auto_created``.
+        chain_name (str):
+            Creates the new snapshot in the snapshot
+            chain labeled with the specified name. The chain
+            name must be 1-63 characters long and comply
+            with RFC1035. This is an uncommon option only
+            for advanced service owners who needs to create
+            separate snapshot chains, for example, for
+            chargeback tracking. When you describe your
+            snapshot resource, this field is visible only if
+            it has a non-empty value.
+
+            This field is a member of `oneof`_ ``_chain_name``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        disk_size_gb (int):
+            [Output Only] Size of the source disk, specified in GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        download_bytes (int):
+            [Output Only] Number of bytes downloaded to restore a
+            snapshot to a disk.
+
+            This field is a member of `oneof`_ ``_download_bytes``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#snapshot
+            for Snapshot resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this snapshot, which is essentially a hash of
+            the labels set used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an up-
+            to-date fingerprint hash in order to update or
+            change labels, otherwise the request will fail
+            with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve a snapshot.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (Sequence[google.cloud.compute_v1.types.Snapshot.LabelsEntry]):
+            Labels to apply to this snapshot. These can
+            be later modified by the setLabels method. Label
+            values may be empty.
+        license_codes (Sequence[int]):
+            [Output Only] Integer license codes indicating which
+            licenses are attached to this snapshot.
+        licenses (Sequence[str]):
+            [Output Only] A list of public visible licenses that apply
+            to this snapshot. This can be because the original image had
+            licenses attached (such as a Windows image).
+        location_hint (str):
+            An opaque location hint used to place the
+            snapshot close to other resources. This field is
+            for use by internal tools that use the public
+            API.
+
+            This field is a member of `oneof`_ ``_location_hint``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        snapshot_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts the snapshot using a customer-
+            upplied encryption key. After you encrypt a
+            snapshot using a customer-supplied key, you must
+            provide the same key if you use the snapshot
+            later. For example, you must provide the
+            encryption key when you create a disk from the
+            encrypted snapshot in a future request.
+            Customer-supplied encryption keys do not protect
+            access to metadata of the snapshot. If you do
+            not provide an encryption key when creating the
+            snapshot, then the snapshot will be encrypted
+            using an automatically generated key and you do
+            not need to provide a key to use the snapshot
+            later.
+
+            This field is a member of `oneof`_ ``_snapshot_encryption_key``.
+        source_disk (str):
+            The source disk used to create this snapshot.
+
+            This field is a member of `oneof`_ ``_source_disk``.
+        source_disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source disk. Required if the source disk is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_source_disk_encryption_key``.
+        source_disk_id (str):
+            [Output Only] The ID value of the disk used to create this
+            snapshot. This value may be used to determine whether the
+            snapshot was taken from the current or a previous instance
+            of a given disk name.
+
+            This field is a member of `oneof`_ ``_source_disk_id``.
+        status (str):
+            [Output Only] The status of the snapshot. This can be
+            CREATING, DELETING, FAILED, READY, or UPLOADING. Check the
+            Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        storage_bytes (int):
+            [Output Only] A size of the storage used by the snapshot. As
+            snapshots share storage, this number is expected to change
+            with snapshot creation/deletion.
+
+            This field is a member of `oneof`_ ``_storage_bytes``.
+        storage_bytes_status (str):
+            [Output Only] An indicator whether storageBytes is in a
+            stable state or it is being adjusted as a result of shared
+            storage reallocation. This status can either be UPDATING,
+            meaning the size of the snapshot is being updated, or
+            UP_TO_DATE, meaning the size of the snapshot is up-to-date.
+            Check the StorageBytesStatus enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_storage_bytes_status``.
+        storage_locations (Sequence[str]):
+            Cloud Storage bucket storage location of the
+            snapshot (regional or multi-regional).
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the snapshot. This can be CREATING,
+        DELETING, FAILED, READY, or UPLOADING.
+        """
+        UNDEFINED_STATUS = 0
+        CREATING = 455564985
+        DELETING = 528602024
+        FAILED = 455706685
+        READY = 77848963
+        UPLOADING = 267603489
+
+    class StorageBytesStatus(proto.Enum):
+        r"""[Output Only] An indicator whether storageBytes is in a stable state
+        or it is being adjusted as a result of shared storage reallocation.
+        This status can either be UPDATING, meaning the size of the snapshot
+        is being updated, or UP_TO_DATE, meaning the size of the snapshot is
+        up-to-date.
+        """
+        UNDEFINED_STORAGE_BYTES_STATUS = 0
+        UPDATING = 494614342
+        UP_TO_DATE = 101306702
+
+    auto_created = proto.Field(proto.BOOL, number=463922264, optional=True,)
+    chain_name = proto.Field(proto.STRING, number=68644169, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    disk_size_gb = proto.Field(proto.INT64, number=316263735, optional=True,)
+    download_bytes = proto.Field(proto.INT64, number=435054068, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    label_fingerprint = proto.Field(proto.STRING, number=178124825, optional=True,)
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+    license_codes = proto.RepeatedField(proto.INT64, number=45482664,)
+    licenses = proto.RepeatedField(proto.STRING, number=337642578,)
+    location_hint = proto.Field(proto.STRING, number=350519505, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    satisfies_pzs = proto.Field(proto.BOOL, number=480964267, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    snapshot_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=43334526,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    source_disk = proto.Field(proto.STRING, number=451753793, optional=True,)
+    source_disk_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=531501153,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    source_disk_id = proto.Field(proto.STRING, number=454190809, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    storage_bytes = proto.Field(proto.INT64, number=424631719, optional=True,)
+    storage_bytes_status = proto.Field(proto.STRING, number=490739082, optional=True,)
+    storage_locations = proto.RepeatedField(proto.STRING, number=328005274,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
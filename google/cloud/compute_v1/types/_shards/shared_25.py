@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 3 services:
+
+firewall_policies, instances, networks.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "FirewallPolicyRule",
+        "FirewallPolicyRuleMatcher",
+        "FirewallPolicyRuleMatcherLayer4Config",
+    },
+)
+
+
+class FirewallPolicyRule(proto.Message):
+    r"""Represents a rule that describes one or more match conditions
+    along with the action to be taken when traffic matches this
+    condition (allow or deny).
+
+    Attributes:
+        action (str):
+            The Action to perform when the client
+            connection triggers the rule. Can currently be
+            either "allow" or "deny()" where valid values
+            for status are 403, 404, and 502.
+
+            This field is a member of `oneof`_ ``_action``.
+        description (str):
+            An optional description for this resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        direction (str):
+            The direction in which this rule applies.
+            Check the Direction enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_direction``.
+        disabled (bool):
+            Denotes whether the firewall policy rule is
+            disabled. When set to true, the firewall policy
+            rule is not enforced and traffic behaves as if
+            it did not exist. If this is unspecified, the
+            firewall policy rule will be enabled.
+
+            This field is a member of `oneof`_ ``_disabled``.
+        enable_logging (bool):
+            Denotes whether to enable logging for a particular rule. If
+            logging is enabled, logs will be exported to the configured
+            export destination in Stackdriver. Logs may be exported to
+            BigQuery or Pub/Sub. Note: you cannot enable logging on
+            "goto_next" rules.
+
+            This field is a member of `oneof`_ ``_enable_logging``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#firewallPolicyRule for firewall policy rules
+
+            This field is a member of `oneof`_ ``_kind``.
+        match (google.cloud.compute_v1.types.FirewallPolicyRuleMatcher):
+            A match condition that incoming traffic is
+            evaluated against. If it evaluates to true, the
+            corresponding 'action' is enforced.
+
+            This field is a member of `oneof`_ ``_match``.
+        priority (int):
+            An integer indicating the priority of a rule
+            in the list. The priority must be a positive
+            value between 0 and 2147483647. Rules are
+            evaluated from highest to lowest priority where
+            0 is the highest priority and 2147483647 is the
+            lowest prority.
+
+            This field is a member of `oneof`_ ``_priority``.
+        rule_tuple_count (int):
+            [Output Only] Calculation of the complexity of a single
+            firewall policy rule.
+
+            This field is a member of `oneof`_ ``_rule_tuple_count``.
+        target_resources (Sequence[str]):
+            A list of network resource URLs to which this
+            rule applies. This field allows you to control
+            which network's VMs get this rule. If this field
+            is left blank, all VMs within the organization
+            will receive the rule.
+        target_service_accounts (Sequence[str]):
+            A list of service accounts indicating the
+            sets of instances that are applied with this
+            rule.
+    """
+
+    class Direction(proto.Enum):
+        r"""The direction in which this rule applies."""
+        UNDEFINED_DIRECTION = 0
+        EGRESS = 432880501
+        INGRESS = 516931221
+
+    action = proto.Field(proto.STRING, number=187661878, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    direction = proto.Field(proto.STRING, number=111150975, optional=True,)
+    disabled = proto.Field(proto.BOOL, number=270940796, optional=True,)
+    enable_logging = proto.Field(proto.BOOL, number=295396515, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    match = proto.Field(
+        proto.MESSAGE,
+        number=103668165,
+        optional=True,
+        message="FirewallPolicyRuleMatcher",
+    )
+    priority = proto.Field(proto.INT32, number=445151652, optional=True,)
+    rule_tuple_count = proto.Field(proto.INT32, number=388342037, optional=True,)
+    target_resources = proto.RepeatedField(proto.STRING, number=528230647,)
+    target_service_accounts = proto.RepeatedField(proto.STRING, number=457639710,)
+
+
+class FirewallPolicyRuleMatcher(proto.Message):
+    r"""Represents a match condition that incoming traffic is
+    evaluated against. Exactly one field must be specified.
+
+    Attributes:
+        dest_ip_ranges (Sequence[str]):
+            CIDR IP address range. Maximum number of
+            destination CIDR IP ranges allowed is 5000.
+        layer4_configs (Sequence[google.cloud.compute_v1.types.FirewallPolicyRuleMatcherLayer4Config]):
+            Pairs of IP protocols and ports that the rule
+            should match.
+        src_ip_ranges (Sequence[str]):
+            CIDR IP address range. Maximum number of
+            source CIDR IP ranges allowed is 5000.
+    """
+
+    dest_ip_ranges = proto.RepeatedField(proto.STRING, number=337357713,)
+    layer4_configs = proto.RepeatedField(
+        proto.MESSAGE,
+        number=373534261,
+        message="FirewallPolicyRuleMatcherLayer4Config",
+    )
+    src_ip_ranges = proto.RepeatedField(proto.STRING, number=432128083,)
+
+
+class FirewallPolicyRuleMatcherLayer4Config(proto.Message):
+    r"""
+
+    Attributes:
+        ip_protocol (str):
+            The IP protocol to which this rule applies.
+            The protocol type is required when creating a
+            firewall rule. This value can either be one of
+            the following well known protocol strings (tcp,
+            udp, icmp, esp, ah, ipip, sctp), or the IP
+            protocol number.
+
+            This field is a member of `oneof`_ ``_ip_protocol``.
+        ports (Sequence[str]):
+            An optional list of ports to which this rule applies. This
+            field is only applicable for UDP or TCP protocol. Each entry
+            must be either an integer or a range. If not specified, this
+            rule applies to connections through any port. Example inputs
+            include: ["22"], ["80","443"], and ["12345-12349"].
+    """
+
+    ip_protocol = proto.Field(proto.STRING, number=475958960, optional=True,)
+    ports = proto.RepeatedField(proto.STRING, number=106854418,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 3 services:
+
+forwarding_rules, region_disks, vpn_gateways.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"RegionSetLabelsRequest",},
+)
+
+
+class RegionSetLabelsRequest(proto.Message):
+    r"""
+
+    Attributes:
+        label_fingerprint (str):
+            The fingerprint of the previous set of labels
+            for this resource, used to detect conflicts. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an up-
+            to-date fingerprint hash in order to update or
+            change labels. Make a get() request to the
+            resource to get the latest fingerprint.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (Sequence[google.cloud.compute_v1.types.RegionSetLabelsRequest.LabelsEntry]):
+            The labels to set for this resource.
+    """
+
+    label_fingerprint = proto.Field(proto.STRING, number=178124825, optional=True,)
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
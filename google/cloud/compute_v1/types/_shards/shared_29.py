@@ -0,0 +1,364 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 3 services:
+
+global_network_endpoint_groups, network_endpoint_groups,
+region_network_endpoint_groups.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "NetworkEndpointGroup",
+        "NetworkEndpointGroupAppEngine",
+        "NetworkEndpointGroupCloudFunction",
+        "NetworkEndpointGroupCloudRun",
+        "NetworkEndpointGroupList",
+    },
+)
+
+
+class NetworkEndpointGroup(proto.Message):
+    r"""Represents a collection of network endpoints. A network
+    endpoint group (NEG) defines how a set of endpoints should be
+    reached, whether they are reachable, and where they are located.
+    For more information about using NEGs, see Setting up external
+    HTTP(S) Load Balancing with internet NEGs, Setting up zonal
+    NEGs, or Setting up external HTTP(S) Load Balancing with
+    serverless NEGs.
+
+    Attributes:
+        annotations (Sequence[google.cloud.compute_v1.types.NetworkEndpointGroup.AnnotationsEntry]):
+            Metadata defined as annotations on the
+            network endpoint group.
+        app_engine (google.cloud.compute_v1.types.NetworkEndpointGroupAppEngine):
+            Only valid when networkEndpointType is
+            "SERVERLESS". Only one of cloudRun, appEngine or
+            cloudFunction may be set.
+
+            This field is a member of `oneof`_ ``_app_engine``.
+        cloud_function (google.cloud.compute_v1.types.NetworkEndpointGroupCloudFunction):
+            Only valid when networkEndpointType is
+            "SERVERLESS". Only one of cloudRun, appEngine or
+            cloudFunction may be set.
+
+            This field is a member of `oneof`_ ``_cloud_function``.
+        cloud_run (google.cloud.compute_v1.types.NetworkEndpointGroupCloudRun):
+            Only valid when networkEndpointType is
+            "SERVERLESS". Only one of cloudRun, appEngine or
+            cloudFunction may be set.
+
+            This field is a member of `oneof`_ ``_cloud_run``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        default_port (int):
+            The default port used if the port number is
+            not specified in the network endpoint.
+
+            This field is a member of `oneof`_ ``_default_port``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#networkEndpointGroup for network endpoint group.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network to which all network
+            endpoints in the NEG belong. Uses "default"
+            project network if unspecified.
+
+            This field is a member of `oneof`_ ``_network``.
+        network_endpoint_type (str):
+            Type of network endpoints in this network endpoint group.
+            Can be one of GCE_VM_IP_PORT, NON_GCP_PRIVATE_IP_PORT,
+            INTERNET_FQDN_PORT, INTERNET_IP_PORT, SERVERLESS,
+            PRIVATE_SERVICE_CONNECT. Check the NetworkEndpointType enum
+            for the list of possible values.
+
+            This field is a member of `oneof`_ ``_network_endpoint_type``.
+        region (str):
+            [Output Only] The URL of the region where the network
+            endpoint group is located.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        size (int):
+            [Output only] Number of network endpoints in the network
+            endpoint group.
+
+            This field is a member of `oneof`_ ``_size``.
+        subnetwork (str):
+            Optional URL of the subnetwork to which all
+            network endpoints in the NEG belong.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+        zone (str):
+            [Output Only] The URL of the zone where the network endpoint
+            group is located.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    class NetworkEndpointType(proto.Enum):
+        r"""Type of network endpoints in this network endpoint group. Can be one
+        of GCE_VM_IP_PORT, NON_GCP_PRIVATE_IP_PORT, INTERNET_FQDN_PORT,
+        INTERNET_IP_PORT, SERVERLESS, PRIVATE_SERVICE_CONNECT.
+        """
+        UNDEFINED_NETWORK_ENDPOINT_TYPE = 0
+        GCE_VM_IP = 401880793
+        GCE_VM_IP_PORT = 501838375
+        INTERNET_FQDN_PORT = 404154477
+        INTERNET_IP_PORT = 477719963
+        NON_GCP_PRIVATE_IP_PORT = 336447968
+        SERVERLESS = 270492508
+
+    annotations = proto.MapField(proto.STRING, proto.STRING, number=112032548,)
+    app_engine = proto.Field(
+        proto.MESSAGE,
+        number=340788768,
+        optional=True,
+        message="NetworkEndpointGroupAppEngine",
+    )
+    cloud_function = proto.Field(
+        proto.MESSAGE,
+        number=519893666,
+        optional=True,
+        message="NetworkEndpointGroupCloudFunction",
+    )
+    cloud_run = proto.Field(
+        proto.MESSAGE,
+        number=111060353,
+        optional=True,
+        message="NetworkEndpointGroupCloudRun",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    default_port = proto.Field(proto.INT32, number=423377855, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    network_endpoint_type = proto.Field(proto.STRING, number=118301523, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    size = proto.Field(proto.INT32, number=3530753, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684, optional=True,)
+
+
+class NetworkEndpointGroupAppEngine(proto.Message):
+    r"""Configuration for an App Engine network endpoint group (NEG).
+    The service is optional, may be provided explicitly or in the
+    URL mask. The version is optional and can only be provided
+    explicitly or in the URL mask when service is present. Note: App
+    Engine service must be in the same project and located in the
+    same region as the Serverless NEG.
+
+    Attributes:
+        service (str):
+            Optional serving service. The service name is
+            case-sensitive and must be 1-63 characters long.
+            Example value: "default", "my-service".
+
+            This field is a member of `oneof`_ ``_service``.
+        url_mask (str):
+            A template to parse service and version
+            fields from a request URL. URL mask allows for
+            routing to multiple App Engine services without
+            having to create multiple Network Endpoint
+            Groups and backend services. For example, the
+            request URLs "foo1-dot-appname.appspot.com/v1"
+            and "foo1-dot-appname.appspot.com/v2" can be
+            backed by the same Serverless NEG with URL mask
+            "-dot-appname.appspot.com/". The URL mask will
+            parse them to { service = "foo1", version = "v1"
+            } and { service = "foo1", version = "v2" }
+            respectively.
+
+            This field is a member of `oneof`_ ``_url_mask``.
+        version (str):
+            Optional serving version. The version name is
+            case-sensitive and must be 1-100 characters
+            long. Example value: "v1", "v2".
+
+            This field is a member of `oneof`_ ``_version``.
+    """
+
+    service = proto.Field(proto.STRING, number=373540533, optional=True,)
+    url_mask = proto.Field(proto.STRING, number=103352252, optional=True,)
+    version = proto.Field(proto.STRING, number=351608024, optional=True,)
+
+
+class NetworkEndpointGroupCloudFunction(proto.Message):
+    r"""Configuration for a Cloud Function network endpoint group
+    (NEG). The function must be provided explicitly or in the URL
+    mask. Note: Cloud Function must be in the same project and
+    located in the same region as the Serverless NEG.
+
+    Attributes:
+        function (str):
+            A user-defined name of the Cloud Function.
+            The function name is case-sensitive and must be
+            1-63 characters long. Example value: "func1".
+
+            This field is a member of `oneof`_ ``_function``.
+        url_mask (str):
+            A template to parse function field from a
+            request URL. URL mask allows for routing to
+            multiple Cloud Functions without having to
+            create multiple Network Endpoint Groups and
+            backend services. For example, request URLs "
+            mydomain.com/function1" and
+            "mydomain.com/function2" can be backed by the
+            same Serverless NEG with URL mask "/". The URL
+            mask will parse them to { function = "function1"
+            } and { function = "function2" } respectively.
+
+            This field is a member of `oneof`_ ``_url_mask``.
+    """
+
+    function = proto.Field(proto.STRING, number=307196888, optional=True,)
+    url_mask = proto.Field(proto.STRING, number=103352252, optional=True,)
+
+
+class NetworkEndpointGroupCloudRun(proto.Message):
+    r"""Configuration for a Cloud Run network endpoint group (NEG).
+    The service must be provided explicitly or in the URL mask. The
+    tag is optional, may be provided explicitly or in the URL mask.
+    Note: Cloud Run service must be in the same project and located
+    in the same region as the Serverless NEG.
+
+    Attributes:
+        service (str):
+            Cloud Run service is the main resource of
+            Cloud Run. The service must be 1-63 characters
+            long, and comply with RFC1035. Example value:
+            "run-service".
+
+            This field is a member of `oneof`_ ``_service``.
+        tag (str):
+            Optional Cloud Run tag represents the "named-
+            evision" to provide additional fine-grained
+            traffic routing information. The tag must be
+            1-63 characters long, and comply with RFC1035.
+            Example value: "revision-0010".
+
+            This field is a member of `oneof`_ ``_tag``.
+        url_mask (str):
+            A template to parse service and tag fields
+            from a request URL. URL mask allows for routing
+            to multiple Run services without having to
+            create multiple network endpoint groups and
+            backend services. For example, request URLs
+            "foo1.domain.com/bar1" and
+            "foo1.domain.com/bar2" can be backed by the same
+            Serverless Network Endpoint Group (NEG) with URL
+            mask ".domain.com/". The URL mask will parse
+            them to { service="bar1", tag="foo1" } and {
+            service="bar2", tag="foo2" } respectively.
+
+            This field is a member of `oneof`_ ``_url_mask``.
+    """
+
+    service = proto.Field(proto.STRING, number=373540533, optional=True,)
+    tag = proto.Field(proto.STRING, number=114586, optional=True,)
+    url_mask = proto.Field(proto.STRING, number=103352252, optional=True,)
+
+
+class NetworkEndpointGroupList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.NetworkEndpointGroup]):
+            A list of NetworkEndpointGroup resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#networkEndpointGroupList for network endpoint group
+            lists.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="NetworkEndpointGroup",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
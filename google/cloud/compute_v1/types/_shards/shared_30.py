@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 3 services:
+
+global_network_endpoint_groups, network_endpoint_groups, target_pools.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"HealthCheckReference",},
+)
+
+
+class HealthCheckReference(proto.Message):
+    r"""A full or valid partial URL to a health check. For example,
+    the following are valid URLs: -
+    https://www.googleapis.com/compute/beta/projects/project-
+    id/global/httpHealthChecks/health-check - projects/project-
+    id/global/httpHealthChecks/health-check -
+    global/httpHealthChecks/health-check
+
+    Attributes:
+        health_check (str):
+
+            This field is a member of `oneof`_ ``_health_check``.
+    """
+
+    health_check = proto.Field(proto.STRING, number=308876645, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
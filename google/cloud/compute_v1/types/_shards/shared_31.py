@@ -0,0 +1,1148 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 3 services:
+
+instance_templates, instances, region_instances.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_08
+from google.cloud.compute_v1.types._shards import shared_09
+from google.cloud.compute_v1.types._shards import shared_10
+from google.cloud.compute_v1.types._shards import shared_12
+from google.cloud.compute_v1.types._shards import shared_21
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AccessConfig",
+        "AdvancedMachineFeatures",
+        "AliasIpRange",
+        "AttachedDisk",
+        "AttachedDiskInitializeParams",
+        "ConfidentialInstanceConfig",
+        "InstanceProperties",
+        "NetworkInterface",
+        "ReservationAffinity",
+        "Scheduling",
+        "SchedulingNodeAffinity",
+        "ServiceAccount",
+        "ShieldedInstanceConfig",
+        "Tags",
+    },
+)
+
+
+class AccessConfig(proto.Message):
+    r"""An access configuration attached to an instance's network
+    interface. Only one access config per instance is supported.
+
+    Attributes:
+        external_ipv6 (str):
+            [Output Only] The first IPv6 address of the external IPv6
+            range associated with this instance, prefix length is stored
+            in externalIpv6PrefixLength in ipv6AccessConfig. The field
+            is output only, an IPv6 address from a subnetwork associated
+            with the instance will be allocated dynamically.
+
+            This field is a member of `oneof`_ ``_external_ipv6``.
+        external_ipv6_prefix_length (int):
+            [Output Only] The prefix length of the external IPv6 range.
+
+            This field is a member of `oneof`_ ``_external_ipv6_prefix_length``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#accessConfig for access configs.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The name of this access configuration. The
+            default and recommended name is External NAT,
+            but you can use any arbitrary string, such as My
+            external IP or Network Access.
+
+            This field is a member of `oneof`_ ``_name``.
+        nat_i_p (str):
+            An external IP address associated with this
+            instance. Specify an unused static external IP
+            address available to the project or leave this
+            field undefined to use an IP from a shared
+            ephemeral IP address pool. If you specify a
+            static external IP address, it must live in the
+            same region as the zone of the instance.
+
+            This field is a member of `oneof`_ ``_nat_i_p``.
+        network_tier (str):
+            This signifies the networking tier used for
+            configuring this access configuration and can
+            only take the following values: PREMIUM,
+            STANDARD. If an AccessConfig is specified
+            without a valid external IP address, an
+            ephemeral IP will be created with this
+            networkTier. If an AccessConfig with a valid
+            external IP address is specified, it must match
+            that of the networkTier associated with the
+            Address resource owning that IP. Check the
+            NetworkTier enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_network_tier``.
+        public_ptr_domain_name (str):
+            The DNS domain name for the public PTR record. You can set
+            this field only if the ``setPublicPtr`` field is enabled.
+
+            This field is a member of `oneof`_ ``_public_ptr_domain_name``.
+        set_public_ptr (bool):
+            Specifies whether a public DNS 'PTR' record
+            should be created to map the external IP address
+            of the instance to a DNS domain name.
+
+            This field is a member of `oneof`_ ``_set_public_ptr``.
+        type_ (str):
+            The type of configuration. The default and only option is
+            ONE_TO_ONE_NAT. Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class NetworkTier(proto.Enum):
+        r"""This signifies the networking tier used for configuring this
+        access configuration and can only take the following values:
+        PREMIUM, STANDARD. If an AccessConfig is specified without a
+        valid external IP address, an ephemeral IP will be created with
+        this networkTier. If an AccessConfig with a valid external IP
+        address is specified, it must match that of the networkTier
+        associated with the Address resource owning that IP.
+        """
+        UNDEFINED_NETWORK_TIER = 0
+        PREMIUM = 399530551
+        STANDARD = 484642493
+
+    class Type(proto.Enum):
+        r"""The type of configuration. The default and only option is
+        ONE_TO_ONE_NAT.
+        """
+        UNDEFINED_TYPE = 0
+        DIRECT_IPV6 = 4397213
+        ONE_TO_ONE_NAT = 84090205
+
+    external_ipv6 = proto.Field(proto.STRING, number=532703707, optional=True,)
+    external_ipv6_prefix_length = proto.Field(
+        proto.INT32, number=425672143, optional=True,
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    nat_i_p = proto.Field(proto.STRING, number=117634556, optional=True,)
+    network_tier = proto.Field(proto.STRING, number=517397843, optional=True,)
+    public_ptr_domain_name = proto.Field(proto.STRING, number=316599167, optional=True,)
+    set_public_ptr = proto.Field(proto.BOOL, number=523870229, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+class AdvancedMachineFeatures(proto.Message):
+    r"""Specifies options for controlling advanced machine features.
+    Options that would traditionally be configured in a BIOS belong
+    here. Features that require operating system support may have
+    corresponding entries in the GuestOsFeatures of an Image (e.g.,
+    whether or not the OS in the Image supports nested
+    virtualization being enabled or disabled).
+
+    Attributes:
+        enable_nested_virtualization (bool):
+            Whether to enable nested virtualization or
+            not (default is false).
+
+            This field is a member of `oneof`_ ``_enable_nested_virtualization``.
+        threads_per_core (int):
+            The number of threads per physical core. To
+            disable simultaneous multithreading (SMT) set
+            this to 1. If unset, the maximum number of
+            threads supported per core by the underlying
+            processor is assumed.
+
+            This field is a member of `oneof`_ ``_threads_per_core``.
+    """
+
+    enable_nested_virtualization = proto.Field(
+        proto.BOOL, number=16639365, optional=True,
+    )
+    threads_per_core = proto.Field(proto.INT32, number=352611671, optional=True,)
+
+
+class AliasIpRange(proto.Message):
+    r"""An alias IP range attached to an instance's network
+    interface.
+
+    Attributes:
+        ip_cidr_range (str):
+            The IP alias ranges to allocate for this
+            interface. This IP CIDR range must belong to the
+            specified subnetwork and cannot contain IP
+            addresses reserved by system or used by other
+            network interfaces. This range may be a single
+            IP address (such as 10.2.3.4), a netmask (such
+            as /24) or a CIDR-formatted string (such as
+            10.1.2.0/24).
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        subnetwork_range_name (str):
+            The name of a subnetwork secondary IP range
+            from which to allocate an IP alias range. If not
+            specified, the primary range of the subnetwork
+            is used.
+
+            This field is a member of `oneof`_ ``_subnetwork_range_name``.
+    """
+
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+    subnetwork_range_name = proto.Field(proto.STRING, number=387995966, optional=True,)
+
+
+class AttachedDisk(proto.Message):
+    r"""An instance-attached disk resource.
+
+    Attributes:
+        auto_delete (bool):
+            Specifies whether the disk will be auto-
+            eleted when the instance is deleted (but not
+            when the disk is detached from the instance).
+
+            This field is a member of `oneof`_ ``_auto_delete``.
+        boot (bool):
+            Indicates that this is a boot disk. The
+            virtual machine will use the first partition of
+            the disk for its root filesystem.
+
+            This field is a member of `oneof`_ ``_boot``.
+        device_name (str):
+            Specifies a unique device name of your choice that is
+            reflected into the /dev/disk/by-id/google-\* tree of a Linux
+            operating system running within the instance. This name can
+            be used to reference the device for mounting, resizing, and
+            so on, from within the instance. If not specified, the
+            server chooses a default device name to apply to this disk,
+            in the form persistent-disk-x, where x is a number assigned
+            by Google Compute Engine. This field is only applicable for
+            persistent disks.
+
+            This field is a member of `oneof`_ ``_device_name``.
+        disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts or decrypts a disk using a customer-
+            upplied encryption key. If you are creating a
+            new disk, this field encrypts the new disk using
+            an encryption key that you provide. If you are
+            attaching an existing disk that is already
+            encrypted, this field decrypts the disk using
+            the customer-supplied encryption key. If you
+            encrypt a disk using a customer-supplied key,
+            you must provide the same key again when you
+            attempt to use this resource at a later time.
+            For example, you must provide the key when you
+            create a snapshot or an image from the disk or
+            when you attach the disk to a virtual machine
+            instance. If you do not provide an encryption
+            key, then the disk will be encrypted using an
+            automatically generated key and you do not need
+            to provide a key to use the disk later. Instance
+            templates do not store customer-supplied
+            encryption keys, so you cannot use your own keys
+            to encrypt disks in a managed instance group.
+
+            This field is a member of `oneof`_ ``_disk_encryption_key``.
+        disk_size_gb (int):
+            The size of the disk in GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        guest_os_features (Sequence[google.cloud.compute_v1.types.GuestOsFeature]):
+            A list of features to enable on the guest
+            operating system. Applicable only for bootable
+            images. Read Enabling guest operating system
+            features to see a list of available options.
+        index (int):
+            [Output Only] A zero-based index to this disk, where 0 is
+            reserved for the boot disk. If you have many disks attached
+            to an instance, each disk would have a unique index number.
+
+            This field is a member of `oneof`_ ``_index``.
+        initialize_params (google.cloud.compute_v1.types.AttachedDiskInitializeParams):
+            [Input Only] Specifies the parameters for a new disk that
+            will be created alongside the new instance. Use
+            initialization parameters to create boot disks or local SSDs
+            attached to the new instance. This property is mutually
+            exclusive with the source property; you can only define one
+            or the other, but not both.
+
+            This field is a member of `oneof`_ ``_initialize_params``.
+        interface (str):
+            Specifies the disk interface to use for
+            attaching this disk, which is either SCSI or
+            NVME. The default is SCSI. Persistent disks must
+            always use SCSI and the request will fail if you
+            attempt to attach a persistent disk in any other
+            format than SCSI. Local SSDs can use either NVME
+            or SCSI. For performance characteristics of SCSI
+            over NVMe, see Local SSD performance. Check the
+            Interface enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_interface``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#attachedDisk for attached disks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        licenses (Sequence[str]):
+            [Output Only] Any valid publicly visible licenses.
+        mode (str):
+            The mode in which to attach this disk, either READ_WRITE or
+            READ_ONLY. If not specified, the default is to attach the
+            disk in READ_WRITE mode. Check the Mode enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_mode``.
+        shielded_instance_initial_state (google.cloud.compute_v1.types.InitialStateConfig):
+            [Output Only] shielded vm initial state stored on disk
+
+            This field is a member of `oneof`_ ``_shielded_instance_initial_state``.
+        source (str):
+            Specifies a valid partial or full URL to an
+            existing Persistent Disk resource. When creating
+            a new instance, one of
+            initializeParams.sourceImage or
+            initializeParams.sourceSnapshot or disks.source
+            is required except for local SSD. If desired,
+            you can also attach existing non-root persistent
+            disks using this property. This field is only
+            applicable for persistent disks. Note that for
+            InstanceTemplate, specify the disk name, not the
+            URL for the disk.
+
+            This field is a member of `oneof`_ ``_source``.
+        type_ (str):
+            Specifies the type of the disk, either
+            SCRATCH or PERSISTENT. If not specified, the
+            default is PERSISTENT. Check the Type enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Interface(proto.Enum):
+        r"""Specifies the disk interface to use for attaching this disk,
+        which is either SCSI or NVME. The default is SCSI. Persistent
+        disks must always use SCSI and the request will fail if you
+        attempt to attach a persistent disk in any other format than
+        SCSI. Local SSDs can use either NVME or SCSI. For performance
+        characteristics of SCSI over NVMe, see Local SSD performance.
+        """
+        UNDEFINED_INTERFACE = 0
+        NVME = 2408800
+        SCSI = 2539686
+
+    class Mode(proto.Enum):
+        r"""The mode in which to attach this disk, either READ_WRITE or
+        READ_ONLY. If not specified, the default is to attach the disk in
+        READ_WRITE mode.
+        """
+        UNDEFINED_MODE = 0
+        READ_ONLY = 91950261
+        READ_WRITE = 173607894
+
+    class Type(proto.Enum):
+        r"""Specifies the type of the disk, either SCRATCH or PERSISTENT.
+        If not specified, the default is PERSISTENT.
+        """
+        UNDEFINED_TYPE = 0
+        PERSISTENT = 460683927
+        SCRATCH = 496778970
+
+    auto_delete = proto.Field(proto.BOOL, number=464761403, optional=True,)
+    boot = proto.Field(proto.BOOL, number=3029746, optional=True,)
+    device_name = proto.Field(proto.STRING, number=67541716, optional=True,)
+    disk_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=271660677,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    disk_size_gb = proto.Field(proto.INT64, number=316263735, optional=True,)
+    guest_os_features = proto.RepeatedField(
+        proto.MESSAGE, number=79294545, message=shared_09.GuestOsFeature,
+    )
+    index = proto.Field(proto.INT32, number=100346066, optional=True,)
+    initialize_params = proto.Field(
+        proto.MESSAGE,
+        number=17697045,
+        optional=True,
+        message="AttachedDiskInitializeParams",
+    )
+    interface = proto.Field(proto.STRING, number=502623545, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    licenses = proto.RepeatedField(proto.STRING, number=337642578,)
+    mode = proto.Field(proto.STRING, number=3357091, optional=True,)
+    shielded_instance_initial_state = proto.Field(
+        proto.MESSAGE,
+        number=192356867,
+        optional=True,
+        message=shared_12.InitialStateConfig,
+    )
+    source = proto.Field(proto.STRING, number=177235995, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+class AttachedDiskInitializeParams(proto.Message):
+    r"""[Input Only] Specifies the parameters for a new disk that will be
+    created alongside the new instance. Use initialization parameters to
+    create boot disks or local SSDs attached to the new instance. This
+    property is mutually exclusive with the source property; you can
+    only define one or the other, but not both.
+
+    Attributes:
+        description (str):
+            An optional description. Provide this
+            property when creating the disk.
+
+            This field is a member of `oneof`_ ``_description``.
+        disk_name (str):
+            Specifies the disk name. If not specified,
+            the default is to use the name of the instance.
+            If a disk with the same name already exists in
+            the given region, the existing disk is attached
+            to the new instance and the new disk is not
+            created.
+
+            This field is a member of `oneof`_ ``_disk_name``.
+        disk_size_gb (int):
+            Specifies the size of the disk in base-2 GB.
+            The size must be at least 10 GB. If you specify
+            a sourceImage, which is required for boot disks,
+            the default size is the size of the sourceImage.
+            If you do not specify a sourceImage, the default
+            disk size is 500 GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        disk_type (str):
+            Specifies the disk type to use to create the
+            instance. If not specified, the default is pd-
+            standard, specified using the full URL. For
+            example:
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /diskTypes/pd-standard For a full list of
+            acceptable values, see Persistent disk types. If
+            you define this field, you can provide either
+            the full or partial URL. For example, the
+            following are valid values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /diskTypes/diskType -
+            projects/project/zones/zone/diskTypes/diskType -
+            zones/zone/diskTypes/diskType Note that for
+            InstanceTemplate, this is the name of the disk
+            type, not URL.
+
+            This field is a member of `oneof`_ ``_disk_type``.
+        labels (Sequence[google.cloud.compute_v1.types.AttachedDiskInitializeParams.LabelsEntry]):
+            Labels to apply to this disk. These can be
+            later modified by the disks.setLabels method.
+            This field is only applicable for persistent
+            disks.
+        on_update_action (str):
+            Specifies which action to take on instance
+            update with this disk. Default is to use the
+            existing disk. Check the OnUpdateAction enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_on_update_action``.
+        provisioned_iops (int):
+            Indicates how many IOPS to provision for the
+            disk. This sets the number of I/O operations per
+            second that the disk can handle. Values must be
+            between 10,000 and 120,000. For more details,
+            see the Extreme persistent disk documentation.
+
+            This field is a member of `oneof`_ ``_provisioned_iops``.
+        resource_policies (Sequence[str]):
+            Resource policies applied to this disk for
+            automatic snapshot creations. Specified using
+            the full or partial URL. For instance template,
+            specify only the resource policy name.
+        source_image (str):
+            The source image to create this disk. When
+            creating a new instance, one of
+            initializeParams.sourceImage or
+            initializeParams.sourceSnapshot or disks.source
+            is required except for local SSD. To create a
+            disk with one of the public operating system
+            images, specify the image by its family name.
+            For example, specify family/debian-9 to use the
+            latest Debian 9 image: projects/debian-
+            cloud/global/images/family/debian-9
+            Alternatively, use a specific version of a
+            public operating system image: projects/debian-
+            cloud/global/images/debian-9-stretch-vYYYYMMDD
+            To create a disk with a custom image that you
+            created, specify the image name in the following
+            format: global/images/my-custom-image You can
+            also specify a custom image by its image family,
+            which returns the latest version of the image in
+            that family. Replace the image name with
+            family/family-name: global/images/family/my-
+            image-family If the source image is deleted
+            later, this field will not be set.
+
+            This field is a member of `oneof`_ ``_source_image``.
+        source_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source image. Required if the source image is
+            protected by a customer-supplied encryption key.
+            Instance templates do not store customer-
+            supplied encryption keys, so you cannot create
+            disks for instances in a managed instance group
+            if the source images are encrypted with your own
+            keys.
+
+            This field is a member of `oneof`_ ``_source_image_encryption_key``.
+        source_snapshot (str):
+            The source snapshot to create this disk. When
+            creating a new instance, one of
+            initializeParams.sourceSnapshot or
+            initializeParams.sourceImage or disks.source is
+            required except for local SSD. To create a disk
+            with a snapshot that you created, specify the
+            snapshot name in the following format:
+            global/snapshots/my-backup If the source
+            snapshot is deleted later, this field will not
+            be set.
+
+            This field is a member of `oneof`_ ``_source_snapshot``.
+        source_snapshot_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source snapshot.
+
+            This field is a member of `oneof`_ ``_source_snapshot_encryption_key``.
+    """
+
+    class OnUpdateAction(proto.Enum):
+        r"""Specifies which action to take on instance update with this
+        disk. Default is to use the existing disk.
+        """
+        UNDEFINED_ON_UPDATE_ACTION = 0
+        RECREATE_DISK = 494767853
+        RECREATE_DISK_IF_SOURCE_CHANGED = 398099712
+        USE_EXISTING_DISK = 232682233
+
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    disk_name = proto.Field(proto.STRING, number=92807149, optional=True,)
+    disk_size_gb = proto.Field(proto.INT64, number=316263735, optional=True,)
+    disk_type = proto.Field(proto.STRING, number=93009052, optional=True,)
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+    on_update_action = proto.Field(proto.STRING, number=202451980, optional=True,)
+    provisioned_iops = proto.Field(proto.INT64, number=186769108, optional=True,)
+    resource_policies = proto.RepeatedField(proto.STRING, number=22220385,)
+    source_image = proto.Field(proto.STRING, number=50443319, optional=True,)
+    source_image_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=381503659,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    source_snapshot = proto.Field(proto.STRING, number=126061928, optional=True,)
+    source_snapshot_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=303679322,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+
+
+class ConfidentialInstanceConfig(proto.Message):
+    r"""A set of Confidential Instance options.
+
+    Attributes:
+        enable_confidential_compute (bool):
+            Defines whether the instance should have
+            confidential compute enabled.
+
+            This field is a member of `oneof`_ ``_enable_confidential_compute``.
+    """
+
+    enable_confidential_compute = proto.Field(
+        proto.BOOL, number=102135228, optional=True,
+    )
+
+
+class InstanceProperties(proto.Message):
+    r"""
+
+    Attributes:
+        advanced_machine_features (google.cloud.compute_v1.types.AdvancedMachineFeatures):
+            Controls for advanced machine-related
+            behavior features.
+
+            This field is a member of `oneof`_ ``_advanced_machine_features``.
+        can_ip_forward (bool):
+            Enables instances created based on these
+            properties to send packets with source IP
+            addresses other than their own and receive
+            packets with destination IP addresses other than
+            their own. If these instances will be used as an
+            IP gateway or it will be set as the next-hop in
+            a Route resource, specify true. If unsure, leave
+            this set to false. See the Enable IP forwarding
+            documentation for more information.
+
+            This field is a member of `oneof`_ ``_can_ip_forward``.
+        confidential_instance_config (google.cloud.compute_v1.types.ConfidentialInstanceConfig):
+            Specifies the Confidential Instance options.
+
+            This field is a member of `oneof`_ ``_confidential_instance_config``.
+        description (str):
+            An optional text description for the
+            instances that are created from these
+            properties.
+
+            This field is a member of `oneof`_ ``_description``.
+        disks (Sequence[google.cloud.compute_v1.types.AttachedDisk]):
+            An array of disks that are associated with
+            the instances that are created from these
+            properties.
+        guest_accelerators (Sequence[google.cloud.compute_v1.types.AcceleratorConfig]):
+            A list of guest accelerator cards' type and
+            count to use for instances created from these
+            properties.
+        labels (Sequence[google.cloud.compute_v1.types.InstanceProperties.LabelsEntry]):
+            Labels to apply to instances that are created
+            from these properties.
+        machine_type (str):
+            The machine type to use for instances that
+            are created from these properties.
+
+            This field is a member of `oneof`_ ``_machine_type``.
+        metadata (google.cloud.compute_v1.types.Metadata):
+            The metadata key/value pairs to assign to
+            instances that are created from these
+            properties. These pairs can consist of custom
+            metadata or predefined keys. See Project and
+            instance metadata for more information.
+
+            This field is a member of `oneof`_ ``_metadata``.
+        min_cpu_platform (str):
+            Minimum cpu/platform to be used by instances.
+            The instance may be scheduled on the specified
+            or newer cpu/platform. Applicable values are the
+            friendly names of CPU platforms, such as
+            minCpuPlatform: "Intel Haswell" or
+            minCpuPlatform: "Intel Sandy Bridge". For more
+            information, read Specifying a Minimum CPU
+            Platform.
+
+            This field is a member of `oneof`_ ``_min_cpu_platform``.
+        network_interfaces (Sequence[google.cloud.compute_v1.types.NetworkInterface]):
+            An array of network access configurations for
+            this interface.
+        private_ipv6_google_access (str):
+            The private IPv6 google access type for VMs. If not
+            specified, use INHERIT_FROM_SUBNETWORK as default. Check the
+            PrivateIpv6GoogleAccess enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_private_ipv6_google_access``.
+        reservation_affinity (google.cloud.compute_v1.types.ReservationAffinity):
+            Specifies the reservations that instances can
+            consume from.
+
+            This field is a member of `oneof`_ ``_reservation_affinity``.
+        resource_policies (Sequence[str]):
+            Resource policies (names, not ULRs) applied
+            to instances created from these properties.
+        scheduling (google.cloud.compute_v1.types.Scheduling):
+            Specifies the scheduling options for the
+            instances that are created from these
+            properties.
+
+            This field is a member of `oneof`_ ``_scheduling``.
+        service_accounts (Sequence[google.cloud.compute_v1.types.ServiceAccount]):
+            A list of service accounts with specified
+            scopes. Access tokens for these service accounts
+            are available to the instances that are created
+            from these properties. Use metadata queries to
+            obtain the access tokens for these instances.
+        shielded_instance_config (google.cloud.compute_v1.types.ShieldedInstanceConfig):
+
+            This field is a member of `oneof`_ ``_shielded_instance_config``.
+        tags (google.cloud.compute_v1.types.Tags):
+            A list of tags to apply to the instances that
+            are created from these properties. The tags
+            identify valid sources or targets for network
+            firewalls. The setTags method can modify this
+            list of tags. Each tag within the list must
+            comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_tags``.
+    """
+
+    class PrivateIpv6GoogleAccess(proto.Enum):
+        r"""The private IPv6 google access type for VMs. If not specified, use
+        INHERIT_FROM_SUBNETWORK as default.
+        """
+        UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS = 0
+        ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE = 427975994
+        ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE = 288210263
+        INHERIT_FROM_SUBNETWORK = 530256959
+
+    advanced_machine_features = proto.Field(
+        proto.MESSAGE,
+        number=409646002,
+        optional=True,
+        message="AdvancedMachineFeatures",
+    )
+    can_ip_forward = proto.Field(proto.BOOL, number=467731324, optional=True,)
+    confidential_instance_config = proto.Field(
+        proto.MESSAGE,
+        number=490637685,
+        optional=True,
+        message="ConfidentialInstanceConfig",
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    disks = proto.RepeatedField(proto.MESSAGE, number=95594102, message="AttachedDisk",)
+    guest_accelerators = proto.RepeatedField(
+        proto.MESSAGE, number=463595119, message=shared_10.AcceleratorConfig,
+    )
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+    machine_type = proto.Field(proto.STRING, number=227711026, optional=True,)
+    metadata = proto.Field(
+        proto.MESSAGE, number=86866735, optional=True, message=shared_21.Metadata,
+    )
+    min_cpu_platform = proto.Field(proto.STRING, number=242912759, optional=True,)
+    network_interfaces = proto.RepeatedField(
+        proto.MESSAGE, number=52735243, message="NetworkInterface",
+    )
+    private_ipv6_google_access = proto.Field(
+        proto.STRING, number=48277006, optional=True,
+    )
+    reservation_affinity = proto.Field(
+        proto.MESSAGE, number=157850683, optional=True, message="ReservationAffinity",
+    )
+    resource_policies = proto.RepeatedField(proto.STRING, number=22220385,)
+    scheduling = proto.Field(
+        proto.MESSAGE, number=386688404, optional=True, message="Scheduling",
+    )
+    service_accounts = proto.RepeatedField(
+        proto.MESSAGE, number=277537328, message="ServiceAccount",
+    )
+    shielded_instance_config = proto.Field(
+        proto.MESSAGE, number=12862901, optional=True, message="ShieldedInstanceConfig",
+    )
+    tags = proto.Field(proto.MESSAGE, number=3552281, optional=True, message="Tags",)
+
+
+class NetworkInterface(proto.Message):
+    r"""A network interface resource attached to an instance.
+
+    Attributes:
+        access_configs (Sequence[google.cloud.compute_v1.types.AccessConfig]):
+            An array of configurations for this interface. Currently,
+            only one access config, ONE_TO_ONE_NAT, is supported. If
+            there are no accessConfigs specified, then this instance
+            will have no external internet access.
+        alias_ip_ranges (Sequence[google.cloud.compute_v1.types.AliasIpRange]):
+            An array of alias IP ranges for this network
+            interface. You can only specify this field for
+            network interfaces in VPC networks.
+        fingerprint (str):
+            Fingerprint hash of contents stored in this
+            network interface. This field will be ignored
+            when inserting an Instance or adding a
+            NetworkInterface. An up-to-date fingerprint must
+            be provided in order to update the
+            NetworkInterface. The request will fail with
+            error 400 Bad Request if the fingerprint is not
+            provided, or 412 Precondition Failed if the
+            fingerprint is out of date.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        ipv6_access_configs (Sequence[google.cloud.compute_v1.types.AccessConfig]):
+            An array of IPv6 access configurations for this interface.
+            Currently, only one IPv6 access config, DIRECT_IPV6, is
+            supported. If there is no ipv6AccessConfig specified, then
+            this instance will have no external IPv6 Internet access.
+        ipv6_access_type (str):
+            [Output Only] One of EXTERNAL, INTERNAL to indicate whether
+            the IP can be accessed from the Internet. This field is
+            always inherited from its subnetwork. Valid only if
+            stackType is IPV4_IPV6. Check the Ipv6AccessType enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_ipv6_access_type``.
+        ipv6_address (str):
+            [Output Only] An IPv6 internal network address for this
+            network interface.
+
+            This field is a member of `oneof`_ ``_ipv6_address``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#networkInterface for network interfaces.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] The name of the network interface, which is
+            generated by the server. For network devices, these are
+            eth0, eth1, etc.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            URL of the network resource for this
+            instance. When creating an instance, if neither
+            the network nor the subnetwork is specified, the
+            default network global/networks/default is used;
+            if the network is not specified but the
+            subnetwork is specified, the network is
+            inferred. If you specify this property, you can
+            specify the network as a full or partial URL.
+            For example, the following are all valid URLs: -
+            https://www.googleapis.com/compute/v1/projects/project/global/networks/
+            network -
+            projects/project/global/networks/network -
+            global/networks/default
+
+            This field is a member of `oneof`_ ``_network``.
+        network_i_p (str):
+            An IPv4 internal IP address to assign to the
+            instance for this network interface. If not
+            specified by the user, an unused internal IP is
+            assigned by the system.
+
+            This field is a member of `oneof`_ ``_network_i_p``.
+        nic_type (str):
+            The type of vNIC to be used on this
+            interface. This may be gVNIC or VirtioNet. Check
+            the NicType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_nic_type``.
+        queue_count (int):
+            The networking queue count that's specified
+            by users for the network interface. Both Rx and
+            Tx queues will be set to this number. It'll be
+            empty if not specified by the users.
+
+            This field is a member of `oneof`_ ``_queue_count``.
+        stack_type (str):
+            The stack type for this network interface to identify
+            whether the IPv6 feature is enabled or not. If not
+            specified, IPV4_ONLY will be used. This field can be both
+            set at instance creation and update network interface
+            operations. Check the StackType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        subnetwork (str):
+            The URL of the Subnetwork resource for this
+            instance. If the network resource is in legacy
+            mode, do not specify this field. If the network
+            is in auto subnet mode, specifying the
+            subnetwork is optional. If the network is in
+            custom subnet mode, specifying the subnetwork is
+            required. If you specify this field, you can
+            specify the subnetwork as a full or partial URL.
+            For example, the following are all valid URLs: -
+            https://www.googleapis.com/compute/v1/projects/project/regions/region
+            /subnetworks/subnetwork -
+            regions/region/subnetworks/subnetwork
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+    """
+
+    class Ipv6AccessType(proto.Enum):
+        r"""[Output Only] One of EXTERNAL, INTERNAL to indicate whether the IP
+        can be accessed from the Internet. This field is always inherited
+        from its subnetwork. Valid only if stackType is IPV4_IPV6.
+        """
+        UNDEFINED_IPV6_ACCESS_TYPE = 0
+        EXTERNAL = 35607499
+        UNSPECIFIED_IPV6_ACCESS_TYPE = 313080613
+
+    class NicType(proto.Enum):
+        r"""The type of vNIC to be used on this interface. This may be
+        gVNIC or VirtioNet.
+        """
+        UNDEFINED_NIC_TYPE = 0
+        GVNIC = 68209305
+        UNSPECIFIED_NIC_TYPE = 67411801
+        VIRTIO_NET = 452123481
+
+    class StackType(proto.Enum):
+        r"""The stack type for this network interface to identify whether the
+        IPv6 feature is enabled or not. If not specified, IPV4_ONLY will be
+        used. This field can be both set at instance creation and update
+        network interface operations.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+        UNSPECIFIED_STACK_TYPE = 298084569
+
+    access_configs = proto.RepeatedField(
+        proto.MESSAGE, number=111058326, message="AccessConfig",
+    )
+    alias_ip_ranges = proto.RepeatedField(
+        proto.MESSAGE, number=165085631, message="AliasIpRange",
+    )
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    ipv6_access_configs = proto.RepeatedField(
+        proto.MESSAGE, number=483472110, message="AccessConfig",
+    )
+    ipv6_access_type = proto.Field(proto.STRING, number=504658653, optional=True,)
+    ipv6_address = proto.Field(proto.STRING, number=341563804, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    network_i_p = proto.Field(proto.STRING, number=207181961, optional=True,)
+    nic_type = proto.Field(proto.STRING, number=59810577, optional=True,)
+    queue_count = proto.Field(proto.INT32, number=503708769, optional=True,)
+    stack_type = proto.Field(proto.STRING, number=425908881, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694, optional=True,)
+
+
+class ReservationAffinity(proto.Message):
+    r"""Specifies the reservations that this instance can consume
+    from.
+
+    Attributes:
+        consume_reservation_type (str):
+            Specifies the type of reservation from which this instance
+            can consume resources: ANY_RESERVATION (default),
+            SPECIFIC_RESERVATION, or NO_RESERVATION. See Consuming
+            reserved instances for examples. Check the
+            ConsumeReservationType enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_consume_reservation_type``.
+        key (str):
+            Corresponds to the label key of a reservation resource. To
+            target a SPECIFIC_RESERVATION by name, specify
+            googleapis.com/reservation-name as the key and specify the
+            name of your reservation as its value.
+
+            This field is a member of `oneof`_ ``_key``.
+        values (Sequence[str]):
+            Corresponds to the label values of a
+            reservation resource. This can be either a name
+            to a reservation in the same project or
+            "projects/different-project/reservations/some-
+            reservation-name" to target a shared reservation
+            in the same zone but in a different project.
+    """
+
+    class ConsumeReservationType(proto.Enum):
+        r"""Specifies the type of reservation from which this instance can
+        consume resources: ANY_RESERVATION (default), SPECIFIC_RESERVATION,
+        or NO_RESERVATION. See Consuming reserved instances for examples.
+        """
+        UNDEFINED_CONSUME_RESERVATION_TYPE = 0
+        ANY_RESERVATION = 200008121
+        NO_RESERVATION = 169322030
+        SPECIFIC_RESERVATION = 229889055
+        UNSPECIFIED = 526786327
+
+    consume_reservation_type = proto.Field(
+        proto.STRING, number=300736944, optional=True,
+    )
+    key = proto.Field(proto.STRING, number=106079, optional=True,)
+    values = proto.RepeatedField(proto.STRING, number=249928994,)
+
+
+class Scheduling(proto.Message):
+    r"""Sets the scheduling options for an Instance. NextID: 21
+
+    Attributes:
+        automatic_restart (bool):
+            Specifies whether the instance should be
+            automatically restarted if it is terminated by
+            Compute Engine (not terminated by a user). You
+            can only set the automatic restart option for
+            standard instances. Preemptible instances cannot
+            be automatically restarted. By default, this is
+            set to true so an instance is automatically
+            restarted if it is terminated by Compute Engine.
+
+            This field is a member of `oneof`_ ``_automatic_restart``.
+        location_hint (str):
+            An opaque location hint used to place the
+            instance close to other resources. This field is
+            for use by internal tools that use the public
+            API.
+
+            This field is a member of `oneof`_ ``_location_hint``.
+        min_node_cpus (int):
+            The minimum number of virtual CPUs this
+            instance will consume when running on a sole-
+            tenant node.
+
+            This field is a member of `oneof`_ ``_min_node_cpus``.
+        node_affinities (Sequence[google.cloud.compute_v1.types.SchedulingNodeAffinity]):
+            A set of node affinity and anti-affinity
+            configurations. Refer to Configuring node
+            affinity for more information. Overrides
+            reservationAffinity.
+        on_host_maintenance (str):
+            Defines the maintenance behavior for this
+            instance. For standard instances, the default
+            behavior is MIGRATE. For preemptible instances,
+            the default and only possible behavior is
+            TERMINATE. For more information, see Setting
+            Instance Scheduling Options. Check the
+            OnHostMaintenance enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_on_host_maintenance``.
+        preemptible (bool):
+            Defines whether the instance is preemptible. This can only
+            be set during instance creation or while the instance is
+            stopped and therefore, in a ``TERMINATED`` state. See
+            Instance Life Cycle for more information on the possible
+            instance states.
+
+            This field is a member of `oneof`_ ``_preemptible``.
+    """
+
+    class OnHostMaintenance(proto.Enum):
+        r"""Defines the maintenance behavior for this instance. For
+        standard instances, the default behavior is MIGRATE. For
+        preemptible instances, the default and only possible behavior is
+        TERMINATE. For more information, see Setting Instance Scheduling
+        Options.
+        """
+        UNDEFINED_ON_HOST_MAINTENANCE = 0
+        MIGRATE = 165699979
+        TERMINATE = 527617601
+
+    automatic_restart = proto.Field(proto.BOOL, number=350821371, optional=True,)
+    location_hint = proto.Field(proto.STRING, number=350519505, optional=True,)
+    min_node_cpus = proto.Field(proto.INT32, number=317231675, optional=True,)
+    node_affinities = proto.RepeatedField(
+        proto.MESSAGE, number=461799971, message="SchedulingNodeAffinity",
+    )
+    on_host_maintenance = proto.Field(proto.STRING, number=64616796, optional=True,)
+    preemptible = proto.Field(proto.BOOL, number=324203169, optional=True,)
+
+
+class SchedulingNodeAffinity(proto.Message):
+    r"""Node Affinity: the configuration of desired nodes onto which
+    this Instance could be scheduled.
+
+    Attributes:
+        key (str):
+            Corresponds to the label key of Node
+            resource.
+
+            This field is a member of `oneof`_ ``_key``.
+        operator (str):
+            Defines the operation of node selection. Valid operators are
+            IN for affinity and NOT_IN for anti-affinity. Check the
+            Operator enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_operator``.
+        values (Sequence[str]):
+            Corresponds to the label values of Node
+            resource.
+    """
+
+    class Operator(proto.Enum):
+        r"""Defines the operation of node selection. Valid operators are IN for
+        affinity and NOT_IN for anti-affinity.
+        """
+        UNDEFINED_OPERATOR = 0
+        IN = 2341
+        NOT_IN = 161144369
+        OPERATOR_UNSPECIFIED = 128892924
+
+    key = proto.Field(proto.STRING, number=106079, optional=True,)
+    operator = proto.Field(proto.STRING, number=36317348, optional=True,)
+    values = proto.RepeatedField(proto.STRING, number=249928994,)
+
+
+class ServiceAccount(proto.Message):
+    r"""A service account.
+
+    Attributes:
+        email (str):
+            Email address of the service account.
+
+            This field is a member of `oneof`_ ``_email``.
+        scopes (Sequence[str]):
+            The list of scopes to be made available for
+            this service account.
+    """
+
+    email = proto.Field(proto.STRING, number=96619420, optional=True,)
+    scopes = proto.RepeatedField(proto.STRING, number=165973151,)
+
+
+class ShieldedInstanceConfig(proto.Message):
+    r"""A set of Shielded Instance options.
+
+    Attributes:
+        enable_integrity_monitoring (bool):
+            Defines whether the instance has integrity
+            monitoring enabled. Enabled by default.
+
+            This field is a member of `oneof`_ ``_enable_integrity_monitoring``.
+        enable_secure_boot (bool):
+            Defines whether the instance has Secure Boot
+            enabled. Disabled by default.
+
+            This field is a member of `oneof`_ ``_enable_secure_boot``.
+        enable_vtpm (bool):
+            Defines whether the instance has the vTPM
+            enabled. Enabled by default.
+
+            This field is a member of `oneof`_ ``_enable_vtpm``.
+    """
+
+    enable_integrity_monitoring = proto.Field(
+        proto.BOOL, number=409071030, optional=True,
+    )
+    enable_secure_boot = proto.Field(proto.BOOL, number=123568638, optional=True,)
+    enable_vtpm = proto.Field(proto.BOOL, number=181858935, optional=True,)
+
+
+class Tags(proto.Message):
+    r"""A set of instance tags.
+
+    Attributes:
+        fingerprint (str):
+            Specifies a fingerprint for this request,
+            which is essentially a hash of the tags'
+            contents and used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update tags. You must always provide an up-
+            to-date fingerprint hash in order to update or
+            change tags. To see the latest fingerprint, make
+            get() request to the instance.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        items (Sequence[str]):
+            An array of tags. Each tag must be 1-63
+            characters long, and comply with RFC1035.
+    """
+
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    items = proto.RepeatedField(proto.STRING, number=100526016,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,310 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+addresses, global_addresses.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"Address", "AddressList",},
+)
+
+
+class Address(proto.Message):
+    r"""Represents an IP Address resource. Google Compute Engine has two IP
+    Address resources: \* `Global (external and
+    internal) <https://cloud.google.com/compute/docs/reference/rest/v1/globalAddresses>`__
+    \* `Regional (external and
+    internal) <https://cloud.google.com/compute/docs/reference/rest/v1/addresses>`__
+    For more information, see Reserving a static external IP address.
+
+    Attributes:
+        address (str):
+            The static IP address represented by this
+            resource.
+
+            This field is a member of `oneof`_ ``_address``.
+        address_type (str):
+            The type of address to reserve, either
+            INTERNAL or EXTERNAL. If unspecified, defaults
+            to EXTERNAL. Check the AddressType enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_address_type``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this field when you create the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_version (str):
+            The IP version that will be used by this
+            address. Valid options are IPV4 or IPV6. This
+            can only be specified for a global address.
+            Check the IpVersion enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_ip_version``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#address
+            for addresses.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``. The first character must be
+            a lowercase letter, and all following characters (except for
+            the last character) must be a dash, lowercase letter, or
+            digit. The last character must be a lowercase letter or
+            digit.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network in which to reserve the address. This
+            field can only be used with INTERNAL type with the
+            VPC_PEERING purpose.
+
+            This field is a member of `oneof`_ ``_network``.
+        network_tier (str):
+            This signifies the networking tier used for
+            configuring this address and can only take the
+            following values: PREMIUM or STANDARD. Internal
+            IP addresses are always Premium Tier; global
+            external IP addresses are always Premium Tier;
+            regional external IP addresses can be either
+            Standard or Premium Tier. If this field is not
+            specified, it is assumed to be PREMIUM. Check
+            the NetworkTier enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_network_tier``.
+        prefix_length (int):
+            The prefix length if the resource represents
+            an IP range.
+
+            This field is a member of `oneof`_ ``_prefix_length``.
+        purpose (str):
+            The purpose of this resource, which can be one of the
+            following values: - GCE_ENDPOINT for addresses that are used
+            by VM instances, alias IP ranges, load balancers, and
+            similar resources. - DNS_RESOLVER for a DNS resolver address
+            in a subnetwork for a Cloud DNS inbound forwarder IP
+            addresses (regional internal IP address in a subnet of a VPC
+            network) - VPC_PEERING for global internal IP addresses used
+            for private services access allocated ranges. - NAT_AUTO for
+            the regional external IP addresses used by Cloud NAT when
+            allocating addresses using . - IPSEC_INTERCONNECT for
+            addresses created from a private IP range that are reserved
+            for a VLAN attachment in an *IPsec-encrypted Cloud
+            Interconnect* configuration. These addresses are regional
+            resources. Not currently available publicly. -
+            ``SHARED_LOADBALANCER_VIP`` for an internal IP address that
+            is assigned to multiple internal forwarding rules. -
+            ``PRIVATE_SERVICE_CONNECT`` for a private network address
+            that is used to configure Private Service Connect. Only
+            global internal addresses can use this purpose. Check the
+            Purpose enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_purpose``.
+        region (str):
+            [Output Only] The URL of the region where a regional address
+            resides. For regional addresses, you must specify the region
+            as a path parameter in the HTTP request URL. *This field is
+            not applicable to global addresses.*
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        status (str):
+            [Output Only] The status of the address, which can be one of
+            RESERVING, RESERVED, or IN_USE. An address that is RESERVING
+            is currently in the process of being reserved. A RESERVED
+            address is currently reserved and available to use. An
+            IN_USE address is currently being used by another resource
+            and is not available. Check the Status enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        subnetwork (str):
+            The URL of the subnetwork in which to reserve the address.
+            If an IP address is specified, it must be within the
+            subnetwork's IP range. This field can only be used with
+            INTERNAL type with a GCE_ENDPOINT or DNS_RESOLVER purpose.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+        users (Sequence[str]):
+            [Output Only] The URLs of the resources that are using this
+            address.
+    """
+
+    class AddressType(proto.Enum):
+        r"""The type of address to reserve, either INTERNAL or EXTERNAL.
+        If unspecified, defaults to EXTERNAL.
+        """
+        UNDEFINED_ADDRESS_TYPE = 0
+        EXTERNAL = 35607499
+        INTERNAL = 279295677
+        UNSPECIFIED_TYPE = 53933922
+
+    class IpVersion(proto.Enum):
+        r"""The IP version that will be used by this address. Valid
+        options are IPV4 or IPV6. This can only be specified for a
+        global address.
+        """
+        UNDEFINED_IP_VERSION = 0
+        IPV4 = 2254341
+        IPV6 = 2254343
+        UNSPECIFIED_VERSION = 21850000
+
+    class NetworkTier(proto.Enum):
+        r"""This signifies the networking tier used for configuring this
+        address and can only take the following values: PREMIUM or
+        STANDARD. Internal IP addresses are always Premium Tier; global
+        external IP addresses are always Premium Tier; regional external
+        IP addresses can be either Standard or Premium Tier. If this
+        field is not specified, it is assumed to be PREMIUM.
+        """
+        UNDEFINED_NETWORK_TIER = 0
+        PREMIUM = 399530551
+        STANDARD = 484642493
+
+    class Purpose(proto.Enum):
+        r"""The purpose of this resource, which can be one of the following
+        values: - GCE_ENDPOINT for addresses that are used by VM instances,
+        alias IP ranges, load balancers, and similar resources. -
+        DNS_RESOLVER for a DNS resolver address in a subnetwork for a Cloud
+        DNS inbound forwarder IP addresses (regional internal IP address in
+        a subnet of a VPC network) - VPC_PEERING for global internal IP
+        addresses used for private services access allocated ranges. -
+        NAT_AUTO for the regional external IP addresses used by Cloud NAT
+        when allocating addresses using . - IPSEC_INTERCONNECT for addresses
+        created from a private IP range that are reserved for a VLAN
+        attachment in an *IPsec-encrypted Cloud Interconnect* configuration.
+        These addresses are regional resources. Not currently available
+        publicly. - ``SHARED_LOADBALANCER_VIP`` for an internal IP address
+        that is assigned to multiple internal forwarding rules. -
+        ``PRIVATE_SERVICE_CONNECT`` for a private network address that is
+        used to configure Private Service Connect. Only global internal
+        addresses can use this purpose.
+        """
+        UNDEFINED_PURPOSE = 0
+        DNS_RESOLVER = 476114556
+        GCE_ENDPOINT = 230515243
+        IPSEC_INTERCONNECT = 340437251
+        NAT_AUTO = 163666477
+        PRIVATE_SERVICE_CONNECT = 48134724
+        SHARED_LOADBALANCER_VIP = 294447572
+        VPC_PEERING = 400800170
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the address, which can be one of
+        RESERVING, RESERVED, or IN_USE. An address that is RESERVING is
+        currently in the process of being reserved. A RESERVED address is
+        currently reserved and available to use. An IN_USE address is
+        currently being used by another resource and is not available.
+        """
+        UNDEFINED_STATUS = 0
+        IN_USE = 17393485
+        RESERVED = 432241448
+        RESERVING = 514587225
+
+    address = proto.Field(proto.STRING, number=462920692, optional=True,)
+    address_type = proto.Field(proto.STRING, number=264307877, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    ip_version = proto.Field(proto.STRING, number=294959552, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    network_tier = proto.Field(proto.STRING, number=517397843, optional=True,)
+    prefix_length = proto.Field(proto.INT32, number=453565747, optional=True,)
+    purpose = proto.Field(proto.STRING, number=316407070, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694, optional=True,)
+    users = proto.RepeatedField(proto.STRING, number=111578632,)
+
+
+class AddressList(proto.Message):
+    r"""Contains a list of addresses.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.Address]):
+            A list of Address resources.
+        kind (str):
+            [Output Only] Type of resource. Always compute#addressList
+            for lists of addresses.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="Address",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+disk_types, region_disk_types.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_07
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"DiskType",},)
+
+
+class DiskType(proto.Message):
+    r"""Represents a Disk Type resource. Google Compute Engine has two Disk
+    Type resources: \*
+    `Regional </compute/docs/reference/rest/v1/regionDiskTypes>`__ \*
+    `Zonal </compute/docs/reference/rest/v1/diskTypes>`__ You can choose
+    from a variety of disk types based on your needs. For more
+    information, read Storage options. The diskTypes resource represents
+    disk types for a zonal persistent disk. For more information, read
+    Zonal persistent disks. The regionDiskTypes resource represents disk
+    types for a regional persistent disk. For more information, read
+    Regional persistent disks.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        default_disk_size_gb (int):
+            [Output Only] Server-defined default disk size in GB.
+
+            This field is a member of `oneof`_ ``_default_disk_size_gb``.
+        deprecated (google.cloud.compute_v1.types.DeprecationStatus):
+            [Output Only] The deprecation status associated with this
+            disk type.
+
+            This field is a member of `oneof`_ ``_deprecated``.
+        description (str):
+            [Output Only] An optional description of this resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#diskType
+            for disk types.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            [Output Only] Name of the resource.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+            [Output Only] URL of the region where the disk type resides.
+            Only applicable for regional resources. You must specify
+            this field as part of the HTTP request URL. It is not
+            settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        valid_disk_size (str):
+            [Output Only] An optional textual description of the valid
+            disk size, such as "10GB-10TB".
+
+            This field is a member of `oneof`_ ``_valid_disk_size``.
+        zone (str):
+            [Output Only] URL of the zone where the disk type resides.
+            You must specify this field as part of the HTTP request URL.
+            It is not settable as a field in the request body.
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    default_disk_size_gb = proto.Field(proto.INT64, number=270619253, optional=True,)
+    deprecated = proto.Field(
+        proto.MESSAGE,
+        number=515138995,
+        optional=True,
+        message=shared_07.DeprecationStatus,
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    valid_disk_size = proto.Field(proto.STRING, number=493962464, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
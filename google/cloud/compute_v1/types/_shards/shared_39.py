@@ -0,0 +1,269 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+global_network_endpoint_groups, network_endpoint_groups.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_30
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "BackendServiceReference",
+        "ForwardingRuleReference",
+        "HealthCheckServiceReference",
+        "HealthStatusForNetworkEndpoint",
+        "NetworkEndpoint",
+        "NetworkEndpointGroupsListNetworkEndpoints",
+        "NetworkEndpointWithHealthStatus",
+    },
+)
+
+
+class BackendServiceReference(proto.Message):
+    r"""
+
+    Attributes:
+        backend_service (str):
+
+            This field is a member of `oneof`_ ``_backend_service``.
+    """
+
+    backend_service = proto.Field(proto.STRING, number=306946058, optional=True,)
+
+
+class ForwardingRuleReference(proto.Message):
+    r"""
+
+    Attributes:
+        forwarding_rule (str):
+
+            This field is a member of `oneof`_ ``_forwarding_rule``.
+    """
+
+    forwarding_rule = proto.Field(proto.STRING, number=269964030, optional=True,)
+
+
+class HealthCheckServiceReference(proto.Message):
+    r"""A full or valid partial URL to a health check service. For
+    example, the following are valid URLs: -
+    https://www.googleapis.com/compute/beta/projects/project-
+    id/regions/us-west1/healthCheckServices/health-check-service -
+    projects/project-id/regions/us-west1/healthCheckServices/health-
+    check-service - regions/us-west1/healthCheckServices/health-
+    check-service
+
+    Attributes:
+        health_check_service (str):
+
+            This field is a member of `oneof`_ ``_health_check_service``.
+    """
+
+    health_check_service = proto.Field(proto.STRING, number=408374747, optional=True,)
+
+
+class HealthStatusForNetworkEndpoint(proto.Message):
+    r"""
+
+    Attributes:
+        backend_service (google.cloud.compute_v1.types.BackendServiceReference):
+            URL of the backend service associated with
+            the health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_backend_service``.
+        forwarding_rule (google.cloud.compute_v1.types.ForwardingRuleReference):
+            URL of the forwarding rule associated with
+            the health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_forwarding_rule``.
+        health_check (google.cloud.compute_v1.types.HealthCheckReference):
+            URL of the health check associated with the
+            health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_health_check``.
+        health_check_service (google.cloud.compute_v1.types.HealthCheckServiceReference):
+            URL of the health check service associated
+            with the health state of the network endpoint.
+
+            This field is a member of `oneof`_ ``_health_check_service``.
+        health_state (str):
+            Health state of the network endpoint
+            determined based on the health checks
+            configured. Check the HealthState enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_health_state``.
+    """
+
+    class HealthState(proto.Enum):
+        r"""Health state of the network endpoint determined based on the
+        health checks configured.
+        """
+        UNDEFINED_HEALTH_STATE = 0
+        DRAINING = 480455402
+        HEALTHY = 439801213
+        UNHEALTHY = 462118084
+        UNKNOWN = 433141802
+
+    backend_service = proto.Field(
+        proto.MESSAGE,
+        number=306946058,
+        optional=True,
+        message="BackendServiceReference",
+    )
+    forwarding_rule = proto.Field(
+        proto.MESSAGE,
+        number=269964030,
+        optional=True,
+        message="ForwardingRuleReference",
+    )
+    health_check = proto.Field(
+        proto.MESSAGE,
+        number=308876645,
+        optional=True,
+        message=shared_30.HealthCheckReference,
+    )
+    health_check_service = proto.Field(
+        proto.MESSAGE,
+        number=408374747,
+        optional=True,
+        message="HealthCheckServiceReference",
+    )
+    health_state = proto.Field(proto.STRING, number=324007150, optional=True,)
+
+
+class NetworkEndpoint(proto.Message):
+    r"""The network endpoint.
+
+    Attributes:
+        annotations (Sequence[google.cloud.compute_v1.types.NetworkEndpoint.AnnotationsEntry]):
+            Metadata defined as annotations on the
+            network endpoint.
+        fqdn (str):
+            Optional fully qualified domain name of network endpoint.
+            This can only be specified when
+            NetworkEndpointGroup.network_endpoint_type is
+            NON_GCP_FQDN_PORT.
+
+            This field is a member of `oneof`_ ``_fqdn``.
+        instance (str):
+            The name for a specific VM instance that the IP address
+            belongs to. This is required for network endpoints of type
+            GCE_VM_IP_PORT. The instance must be in the same zone of
+            network endpoint group. The name must be 1-63 characters
+            long, and comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_instance``.
+        ip_address (str):
+            Optional IPv4 address of network endpoint.
+            The IP address must belong to a VM in Compute
+            Engine (either the primary IP or as part of an
+            aliased IP range). If the IP address is not
+            specified, then the primary IP address for the
+            VM instance in the network that the network
+            endpoint group belongs to will be used.
+
+            This field is a member of `oneof`_ ``_ip_address``.
+        port (int):
+            Optional port number of network endpoint. If
+            not specified, the defaultPort for the network
+            endpoint group will be used.
+
+            This field is a member of `oneof`_ ``_port``.
+    """
+
+    annotations = proto.MapField(proto.STRING, proto.STRING, number=112032548,)
+    fqdn = proto.Field(proto.STRING, number=3150485, optional=True,)
+    instance = proto.Field(proto.STRING, number=18257045, optional=True,)
+    ip_address = proto.Field(proto.STRING, number=406272220, optional=True,)
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+
+
+class NetworkEndpointGroupsListNetworkEndpoints(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.NetworkEndpointWithHealthStatus]):
+            A list of NetworkEndpointWithHealthStatus
+            resources.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#networkEndpointGroupsListNetworkEndpoints for the
+            list of network endpoints in the specified network endpoint
+            group.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="NetworkEndpointWithHealthStatus",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class NetworkEndpointWithHealthStatus(proto.Message):
+    r"""
+
+    Attributes:
+        healths (Sequence[google.cloud.compute_v1.types.HealthStatusForNetworkEndpoint]):
+            [Output only] The health status of network endpoint;
+        network_endpoint (google.cloud.compute_v1.types.NetworkEndpoint):
+            [Output only] The network endpoint;
+
+            This field is a member of `oneof`_ ``_network_endpoint``.
+    """
+
+    healths = proto.RepeatedField(
+        proto.MESSAGE, number=258689431, message="HealthStatusForNetworkEndpoint",
+    )
+    network_endpoint = proto.Field(
+        proto.MESSAGE, number=56789126, optional=True, message="NetworkEndpoint",
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
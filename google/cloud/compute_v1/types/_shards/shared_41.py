@@ -0,0 +1,774 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+health_checks, region_health_checks.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "GRPCHealthCheck",
+        "HTTP2HealthCheck",
+        "HTTPHealthCheck",
+        "HTTPSHealthCheck",
+        "HealthCheck",
+        "HealthCheckList",
+        "HealthCheckLogConfig",
+        "SSLHealthCheck",
+        "TCPHealthCheck",
+    },
+)
+
+
+class GRPCHealthCheck(proto.Message):
+    r"""
+
+    Attributes:
+        grpc_service_name (str):
+            The gRPC service name for the health check. This field is
+            optional. The value of grpc_service_name has the following
+            meanings by convention: - Empty service_name means the
+            overall status of all services at the backend. - Non-empty
+            service_name means the health of that gRPC service, as
+            defined by the owner of the service. The grpc_service_name
+            can only be ASCII.
+
+            This field is a member of `oneof`_ ``_grpc_service_name``.
+        port (int):
+            The port number for the health check request. Must be
+            specified if port_name and port_specification are not set or
+            if port_specification is USE_FIXED_PORT. Valid values are 1
+            through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Port name as defined in InstanceGroup#NamedPort#name. If
+            both port and port_name are defined, port takes precedence.
+            The port_name should conform to RFC1035.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how port is selected for health checking, can be
+            one of following values: USE_FIXED_PORT: The port number in
+            port is used for health checking. USE_NAMED_PORT: The
+            portName is used for health checking. USE_SERVING_PORT: For
+            NetworkEndpointGroup, the port specified for each network
+            endpoint is used for health checking. For other backends,
+            the port or named port specified in the Backend Service is
+            used for health checking. If not specified, gRPC health
+            check follows behavior specified in port and portName
+            fields. Check the PortSpecification enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how port is selected for health checking, can be one of
+        following values: USE_FIXED_PORT: The port number in port is used
+        for health checking. USE_NAMED_PORT: The portName is used for health
+        checking. USE_SERVING_PORT: For NetworkEndpointGroup, the port
+        specified for each network endpoint is used for health checking. For
+        other backends, the port or named port specified in the Backend
+        Service is used for health checking. If not specified, gRPC health
+        check follows behavior specified in port and portName fields.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    grpc_service_name = proto.Field(proto.STRING, number=136533078, optional=True,)
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+    port_name = proto.Field(proto.STRING, number=41534345, optional=True,)
+    port_specification = proto.Field(proto.STRING, number=51590597, optional=True,)
+
+
+class HTTP2HealthCheck(proto.Message):
+    r"""
+
+    Attributes:
+        host (str):
+            The value of the host header in the HTTP/2
+            health check request. If left empty (default
+            value), the IP on behalf of which this health
+            check is performed will be used.
+
+            This field is a member of `oneof`_ ``_host``.
+        port (int):
+            The TCP port number for the health check
+            request. The default value is 443. Valid values
+            are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Port name as defined in InstanceGroup#NamedPort#name. If
+            both port and port_name are defined, port takes precedence.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how port is selected for health checking, can be
+            one of following values: USE_FIXED_PORT: The port number in
+            port is used for health checking. USE_NAMED_PORT: The
+            portName is used for health checking. USE_SERVING_PORT: For
+            NetworkEndpointGroup, the port specified for each network
+            endpoint is used for health checking. For other backends,
+            the port or named port specified in the Backend Service is
+            used for health checking. If not specified, HTTP2 health
+            check follows behavior specified in port and portName
+            fields. Check the PortSpecification enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request_path (str):
+            The request path of the HTTP/2 health check
+            request. The default value is /.
+
+            This field is a member of `oneof`_ ``_request_path``.
+        response (str):
+            The string to match anywhere in the first
+            1024 bytes of the response body. If left empty
+            (the default value), the status code determines
+            health. The response data can only be ASCII.
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how port is selected for health checking, can be one of
+        following values: USE_FIXED_PORT: The port number in port is used
+        for health checking. USE_NAMED_PORT: The portName is used for health
+        checking. USE_SERVING_PORT: For NetworkEndpointGroup, the port
+        specified for each network endpoint is used for health checking. For
+        other backends, the port or named port specified in the Backend
+        Service is used for health checking. If not specified, HTTP2 health
+        check follows behavior specified in port and portName fields.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    host = proto.Field(proto.STRING, number=3208616, optional=True,)
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+    port_name = proto.Field(proto.STRING, number=41534345, optional=True,)
+    port_specification = proto.Field(proto.STRING, number=51590597, optional=True,)
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+    request_path = proto.Field(proto.STRING, number=229403605, optional=True,)
+    response = proto.Field(proto.STRING, number=196547649, optional=True,)
+
+
+class HTTPHealthCheck(proto.Message):
+    r"""
+
+    Attributes:
+        host (str):
+            The value of the host header in the HTTP
+            health check request. If left empty (default
+            value), the IP on behalf of which this health
+            check is performed will be used.
+
+            This field is a member of `oneof`_ ``_host``.
+        port (int):
+            The TCP port number for the health check
+            request. The default value is 80. Valid values
+            are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Port name as defined in InstanceGroup#NamedPort#name. If
+            both port and port_name are defined, port takes precedence.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how port is selected for health checking, can be
+            one of following values: USE_FIXED_PORT: The port number in
+            port is used for health checking. USE_NAMED_PORT: The
+            portName is used for health checking. USE_SERVING_PORT: For
+            NetworkEndpointGroup, the port specified for each network
+            endpoint is used for health checking. For other backends,
+            the port or named port specified in the Backend Service is
+            used for health checking. If not specified, HTTP health
+            check follows behavior specified in port and portName
+            fields. Check the PortSpecification enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request_path (str):
+            The request path of the HTTP health check
+            request. The default value is /.
+
+            This field is a member of `oneof`_ ``_request_path``.
+        response (str):
+            The string to match anywhere in the first
+            1024 bytes of the response body. If left empty
+            (the default value), the status code determines
+            health. The response data can only be ASCII.
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how port is selected for health checking, can be one of
+        following values: USE_FIXED_PORT: The port number in port is used
+        for health checking. USE_NAMED_PORT: The portName is used for health
+        checking. USE_SERVING_PORT: For NetworkEndpointGroup, the port
+        specified for each network endpoint is used for health checking. For
+        other backends, the port or named port specified in the Backend
+        Service is used for health checking. If not specified, HTTP health
+        check follows behavior specified in port and portName fields.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    host = proto.Field(proto.STRING, number=3208616, optional=True,)
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+    port_name = proto.Field(proto.STRING, number=41534345, optional=True,)
+    port_specification = proto.Field(proto.STRING, number=51590597, optional=True,)
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+    request_path = proto.Field(proto.STRING, number=229403605, optional=True,)
+    response = proto.Field(proto.STRING, number=196547649, optional=True,)
+
+
+class HTTPSHealthCheck(proto.Message):
+    r"""
+
+    Attributes:
+        host (str):
+            The value of the host header in the HTTPS
+            health check request. If left empty (default
+            value), the IP on behalf of which this health
+            check is performed will be used.
+
+            This field is a member of `oneof`_ ``_host``.
+        port (int):
+            The TCP port number for the health check
+            request. The default value is 443. Valid values
+            are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Port name as defined in InstanceGroup#NamedPort#name. If
+            both port and port_name are defined, port takes precedence.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how port is selected for health checking, can be
+            one of following values: USE_FIXED_PORT: The port number in
+            port is used for health checking. USE_NAMED_PORT: The
+            portName is used for health checking. USE_SERVING_PORT: For
+            NetworkEndpointGroup, the port specified for each network
+            endpoint is used for health checking. For other backends,
+            the port or named port specified in the Backend Service is
+            used for health checking. If not specified, HTTPS health
+            check follows behavior specified in port and portName
+            fields. Check the PortSpecification enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request_path (str):
+            The request path of the HTTPS health check
+            request. The default value is /.
+
+            This field is a member of `oneof`_ ``_request_path``.
+        response (str):
+            The string to match anywhere in the first
+            1024 bytes of the response body. If left empty
+            (the default value), the status code determines
+            health. The response data can only be ASCII.
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how port is selected for health checking, can be one of
+        following values: USE_FIXED_PORT: The port number in port is used
+        for health checking. USE_NAMED_PORT: The portName is used for health
+        checking. USE_SERVING_PORT: For NetworkEndpointGroup, the port
+        specified for each network endpoint is used for health checking. For
+        other backends, the port or named port specified in the Backend
+        Service is used for health checking. If not specified, HTTPS health
+        check follows behavior specified in port and portName fields.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    host = proto.Field(proto.STRING, number=3208616, optional=True,)
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+    port_name = proto.Field(proto.STRING, number=41534345, optional=True,)
+    port_specification = proto.Field(proto.STRING, number=51590597, optional=True,)
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+    request_path = proto.Field(proto.STRING, number=229403605, optional=True,)
+    response = proto.Field(proto.STRING, number=196547649, optional=True,)
+
+
+class HealthCheck(proto.Message):
+    r"""Represents a Health Check resource. Google Compute Engine has two
+    Health Check resources: \*
+    `Global </compute/docs/reference/rest/v1/healthChecks>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionHealthChecks>`__
+    Internal HTTP(S) load balancers must use regional health checks
+    (``compute.v1.regionHealthChecks``). Traffic Director must use
+    global health checks (``compute.v1.HealthChecks``). Internal TCP/UDP
+    load balancers can use either regional or global health checks
+    (``compute.v1.regionHealthChecks`` or ``compute.v1.HealthChecks``).
+    External HTTP(S), TCP proxy, and SSL proxy load balancers as well as
+    managed instance group auto-healing must use global health checks
+    (``compute.v1.HealthChecks``). Backend service-based network load
+    balancers must use regional health checks
+    (``compute.v1.regionHealthChecks``). Target pool-based network load
+    balancers must use legacy HTTP health checks
+    (``compute.v1.httpHealthChecks``). For more information, see Health
+    checks overview.
+
+    Attributes:
+        check_interval_sec (int):
+            How often (in seconds) to send a health
+            check. The default value is 5 seconds.
+
+            This field is a member of `oneof`_ ``_check_interval_sec``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in 3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        grpc_health_check (google.cloud.compute_v1.types.GRPCHealthCheck):
+
+            This field is a member of `oneof`_ ``_grpc_health_check``.
+        healthy_threshold (int):
+            A so-far unhealthy instance will be marked
+            healthy after this many consecutive successes.
+            The default value is 2.
+
+            This field is a member of `oneof`_ ``_healthy_threshold``.
+        http2_health_check (google.cloud.compute_v1.types.HTTP2HealthCheck):
+
+            This field is a member of `oneof`_ ``_http2_health_check``.
+        http_health_check (google.cloud.compute_v1.types.HTTPHealthCheck):
+
+            This field is a member of `oneof`_ ``_http_health_check``.
+        https_health_check (google.cloud.compute_v1.types.HTTPSHealthCheck):
+
+            This field is a member of `oneof`_ ``_https_health_check``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            Type of the resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        log_config (google.cloud.compute_v1.types.HealthCheckLogConfig):
+            Configure logging on this health check.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. For example, a name that is 1-63
+            characters long, matches the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``, and otherwise complies with
+            RFC1035. This regular expression describes a name where the
+            first character is a lowercase letter, and all following
+            characters are a dash, lowercase letter, or digit, except
+            the last character, which isn't a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+            [Output Only] Region where the health check resides. Not
+            applicable to global health checks.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        ssl_health_check (google.cloud.compute_v1.types.SSLHealthCheck):
+
+            This field is a member of `oneof`_ ``_ssl_health_check``.
+        tcp_health_check (google.cloud.compute_v1.types.TCPHealthCheck):
+
+            This field is a member of `oneof`_ ``_tcp_health_check``.
+        timeout_sec (int):
+            How long (in seconds) to wait before claiming
+            failure. The default value is 5 seconds. It is
+            invalid for timeoutSec to have greater value
+            than checkIntervalSec.
+
+            This field is a member of `oneof`_ ``_timeout_sec``.
+        type_ (str):
+            Specifies the type of the healthCheck, either
+            TCP, SSL, HTTP, HTTPS or HTTP2. If not
+            specified, the default is TCP. Exactly one of
+            the protocol-specific health check field must be
+            specified, which must match type field. Check
+            the Type enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+        unhealthy_threshold (int):
+            A so-far healthy instance will be marked
+            unhealthy after this many consecutive failures.
+            The default value is 2.
+
+            This field is a member of `oneof`_ ``_unhealthy_threshold``.
+    """
+
+    class Type(proto.Enum):
+        r"""Specifies the type of the healthCheck, either TCP, SSL, HTTP,
+        HTTPS or HTTP2. If not specified, the default is TCP. Exactly
+        one of the protocol-specific health check field must be
+        specified, which must match type field.
+        """
+        UNDEFINED_TYPE = 0
+        GRPC = 2196510
+        HTTP = 2228360
+        HTTP2 = 69079210
+        HTTPS = 69079243
+        INVALID = 530283991
+        SSL = 82412
+        TCP = 82881
+
+    check_interval_sec = proto.Field(proto.INT32, number=345561006, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    grpc_health_check = proto.Field(
+        proto.MESSAGE, number=85529574, optional=True, message="GRPCHealthCheck",
+    )
+    healthy_threshold = proto.Field(proto.INT32, number=403212361, optional=True,)
+    http2_health_check = proto.Field(
+        proto.MESSAGE, number=11360986, optional=True, message="HTTP2HealthCheck",
+    )
+    http_health_check = proto.Field(
+        proto.MESSAGE, number=412586940, optional=True, message="HTTPHealthCheck",
+    )
+    https_health_check = proto.Field(
+        proto.MESSAGE, number=436046905, optional=True, message="HTTPSHealthCheck",
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    log_config = proto.Field(
+        proto.MESSAGE, number=351299741, optional=True, message="HealthCheckLogConfig",
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    ssl_health_check = proto.Field(
+        proto.MESSAGE, number=280032440, optional=True, message="SSLHealthCheck",
+    )
+    tcp_health_check = proto.Field(
+        proto.MESSAGE, number=469980419, optional=True, message="TCPHealthCheck",
+    )
+    timeout_sec = proto.Field(proto.INT32, number=79994995, optional=True,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+    unhealthy_threshold = proto.Field(proto.INT32, number=227958480, optional=True,)
+
+
+class HealthCheckList(proto.Message):
+    r"""Contains a list of HealthCheck resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.HealthCheck]):
+            A list of HealthCheck resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="HealthCheck",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class HealthCheckLogConfig(proto.Message):
+    r"""Configuration of logging on a health check. If logging is
+    enabled, logs will be exported to Stackdriver.
+
+    Attributes:
+        enable (bool):
+            Indicates whether or not to export logs. This
+            is false by default, which means no health check
+            logging will be done.
+
+            This field is a member of `oneof`_ ``_enable``.
+    """
+
+    enable = proto.Field(proto.BOOL, number=311764355, optional=True,)
+
+
+class SSLHealthCheck(proto.Message):
+    r"""
+
+    Attributes:
+        port (int):
+            The TCP port number for the health check
+            request. The default value is 443. Valid values
+            are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Port name as defined in InstanceGroup#NamedPort#name. If
+            both port and port_name are defined, port takes precedence.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how port is selected for health checking, can be
+            one of following values: USE_FIXED_PORT: The port number in
+            port is used for health checking. USE_NAMED_PORT: The
+            portName is used for health checking. USE_SERVING_PORT: For
+            NetworkEndpointGroup, the port specified for each network
+            endpoint is used for health checking. For other backends,
+            the port or named port specified in the Backend Service is
+            used for health checking. If not specified, SSL health check
+            follows behavior specified in port and portName fields.
+            Check the PortSpecification enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request (str):
+            The application data to send once the SSL
+            connection has been established (default value
+            is empty). If both request and response are
+            empty, the connection establishment alone will
+            indicate health. The request data can only be
+            ASCII.
+
+            This field is a member of `oneof`_ ``_request``.
+        response (str):
+            The bytes to match against the beginning of
+            the response data. If left empty (the default
+            value), any response will indicate health. The
+            response data can only be ASCII.
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how port is selected for health checking, can be one of
+        following values: USE_FIXED_PORT: The port number in port is used
+        for health checking. USE_NAMED_PORT: The portName is used for health
+        checking. USE_SERVING_PORT: For NetworkEndpointGroup, the port
+        specified for each network endpoint is used for health checking. For
+        other backends, the port or named port specified in the Backend
+        Service is used for health checking. If not specified, SSL health
+        check follows behavior specified in port and portName fields.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+    port_name = proto.Field(proto.STRING, number=41534345, optional=True,)
+    port_specification = proto.Field(proto.STRING, number=51590597, optional=True,)
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+    request = proto.Field(proto.STRING, number=21951119, optional=True,)
+    response = proto.Field(proto.STRING, number=196547649, optional=True,)
+
+
+class TCPHealthCheck(proto.Message):
+    r"""
+
+    Attributes:
+        port (int):
+            The TCP port number for the health check
+            request. The default value is 80. Valid values
+            are 1 through 65535.
+
+            This field is a member of `oneof`_ ``_port``.
+        port_name (str):
+            Port name as defined in InstanceGroup#NamedPort#name. If
+            both port and port_name are defined, port takes precedence.
+
+            This field is a member of `oneof`_ ``_port_name``.
+        port_specification (str):
+            Specifies how port is selected for health checking, can be
+            one of following values: USE_FIXED_PORT: The port number in
+            port is used for health checking. USE_NAMED_PORT: The
+            portName is used for health checking. USE_SERVING_PORT: For
+            NetworkEndpointGroup, the port specified for each network
+            endpoint is used for health checking. For other backends,
+            the port or named port specified in the Backend Service is
+            used for health checking. If not specified, TCP health check
+            follows behavior specified in port and portName fields.
+            Check the PortSpecification enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_port_specification``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        request (str):
+            The application data to send once the TCP
+            connection has been established (default value
+            is empty). If both request and response are
+            empty, the connection establishment alone will
+            indicate health. The request data can only be
+            ASCII.
+
+            This field is a member of `oneof`_ ``_request``.
+        response (str):
+            The bytes to match against the beginning of
+            the response data. If left empty (the default
+            value), any response will indicate health. The
+            response data can only be ASCII.
+
+            This field is a member of `oneof`_ ``_response``.
+    """
+
+    class PortSpecification(proto.Enum):
+        r"""Specifies how port is selected for health checking, can be one of
+        following values: USE_FIXED_PORT: The port number in port is used
+        for health checking. USE_NAMED_PORT: The portName is used for health
+        checking. USE_SERVING_PORT: For NetworkEndpointGroup, the port
+        specified for each network endpoint is used for health checking. For
+        other backends, the port or named port specified in the Backend
+        Service is used for health checking. If not specified, TCP health
+        check follows behavior specified in port and portName fields.
+        """
+        UNDEFINED_PORT_SPECIFICATION = 0
+        USE_FIXED_PORT = 190235748
+        USE_NAMED_PORT = 349300671
+        USE_SERVING_PORT = 362637516
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    port = proto.Field(proto.INT32, number=3446913, optional=True,)
+    port_name = proto.Field(proto.STRING, number=41534345, optional=True,)
+    port_specification = proto.Field(proto.STRING, number=51590597, optional=True,)
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+    request = proto.Field(proto.STRING, number=21951119, optional=True,)
+    response = proto.Field(proto.STRING, number=196547649, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
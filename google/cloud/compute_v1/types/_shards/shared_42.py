@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+image_family_views, images.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_07
+from google.cloud.compute_v1.types._shards import shared_08
+from google.cloud.compute_v1.types._shards import shared_09
+from google.cloud.compute_v1.types._shards import shared_12
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"Image", "RawDisk",},
+)
+
+
+class Image(proto.Message):
+    r"""Represents an Image resource. You can use images to create
+    boot disks for your VM instances. For more information, read
+    Images.
+
+    Attributes:
+        archive_size_bytes (int):
+            Size of the image tar.gz archive stored in
+            Google Cloud Storage (in bytes).
+
+            This field is a member of `oneof`_ ``_archive_size_bytes``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        deprecated (google.cloud.compute_v1.types.DeprecationStatus):
+            The deprecation status associated with this
+            image.
+
+            This field is a member of `oneof`_ ``_deprecated``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        disk_size_gb (int):
+            Size of the image when restored onto a
+            persistent disk (in GB).
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        family (str):
+            The name of the image family to which this
+            image belongs. You can create disks by
+            specifying an image family instead of a specific
+            image name. The image family always returns its
+            latest image that is not deprecated. The name of
+            the image family must comply with RFC1035.
+
+            This field is a member of `oneof`_ ``_family``.
+        guest_os_features (Sequence[google.cloud.compute_v1.types.GuestOsFeature]):
+            A list of features to enable on the guest
+            operating system. Applicable only for bootable
+            images. Read Enabling guest operating system
+            features to see a list of available options.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            Encrypts the image using a customer-supplied
+            encryption key. After you encrypt an image with
+            a customer-supplied key, you must provide the
+            same key if you use the image later (e.g. to
+            create a disk from the image). Customer-supplied
+            encryption keys do not protect access to
+            metadata of the disk. If you do not provide an
+            encryption key when creating the image, then the
+            disk will be encrypted using an automatically
+            generated key and you do not need to provide a
+            key to use the image later.
+
+            This field is a member of `oneof`_ ``_image_encryption_key``.
+        kind (str):
+            [Output Only] Type of the resource. Always compute#image for
+            images.
+
+            This field is a member of `oneof`_ ``_kind``.
+        label_fingerprint (str):
+            A fingerprint for the labels being applied to
+            this image, which is essentially a hash of the
+            labels used for optimistic locking. The
+            fingerprint is initially generated by Compute
+            Engine and changes after every request to modify
+            or update labels. You must always provide an up-
+            to-date fingerprint hash in order to update or
+            change labels, otherwise the request will fail
+            with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve an image.
+
+            This field is a member of `oneof`_ ``_label_fingerprint``.
+        labels (Sequence[google.cloud.compute_v1.types.Image.LabelsEntry]):
+            Labels to apply to this image. These can be
+            later modified by the setLabels method.
+        license_codes (Sequence[int]):
+            Integer license codes indicating which
+            licenses are attached to this image.
+        licenses (Sequence[str]):
+            Any applicable license URI.
+        name (str):
+            Name of the resource; provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        raw_disk (google.cloud.compute_v1.types.RawDisk):
+            The parameters of the raw disk image.
+
+            This field is a member of `oneof`_ ``_raw_disk``.
+        satisfies_pzs (bool):
+            [Output Only] Reserved for future use.
+
+            This field is a member of `oneof`_ ``_satisfies_pzs``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        shielded_instance_initial_state (google.cloud.compute_v1.types.InitialStateConfig):
+            Set the secure boot keys of shielded
+            instance.
+
+            This field is a member of `oneof`_ ``_shielded_instance_initial_state``.
+        source_disk (str):
+            URL of the source disk used to create this
+            image. For example, the following are valid
+            values: -
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone
+            /disks/disk -
+            projects/project/zones/zone/disks/disk -
+            zones/zone/disks/disk In order to create an
+            image, you must provide the full or partial URL
+            of one of the following: - The rawDisk.source
+            URL - The sourceDisk URL - The sourceImage URL -
+            The sourceSnapshot URL
+
+            This field is a member of `oneof`_ ``_source_disk``.
+        source_disk_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source disk. Required if the source disk is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_source_disk_encryption_key``.
+        source_disk_id (str):
+            [Output Only] The ID value of the disk used to create this
+            image. This value may be used to determine whether the image
+            was taken from the current or a previous instance of a given
+            disk name.
+
+            This field is a member of `oneof`_ ``_source_disk_id``.
+        source_image (str):
+            URL of the source image used to create this image. The
+            following are valid formats for the URL: -
+            https://www.googleapis.com/compute/v1/projects/project_id/global/
+            images/image_name -
+            projects/project_id/global/images/image_name In order to
+            create an image, you must provide the full or partial URL of
+            one of the following: - The rawDisk.source URL - The
+            sourceDisk URL - The sourceImage URL - The sourceSnapshot
+            URL
+
+            This field is a member of `oneof`_ ``_source_image``.
+        source_image_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source image. Required if the source image is
+            protected by a customer-supplied encryption key.
+
+            This field is a member of `oneof`_ ``_source_image_encryption_key``.
+        source_image_id (str):
+            [Output Only] The ID value of the image used to create this
+            image. This value may be used to determine whether the image
+            was taken from the current or a previous instance of a given
+            image name.
+
+            This field is a member of `oneof`_ ``_source_image_id``.
+        source_snapshot (str):
+            URL of the source snapshot used to create this image. The
+            following are valid formats for the URL: -
+            https://www.googleapis.com/compute/v1/projects/project_id/global/
+            snapshots/snapshot_name -
+            projects/project_id/global/snapshots/snapshot_name In order
+            to create an image, you must provide the full or partial URL
+            of one of the following: - The rawDisk.source URL - The
+            sourceDisk URL - The sourceImage URL - The sourceSnapshot
+            URL
+
+            This field is a member of `oneof`_ ``_source_snapshot``.
+        source_snapshot_encryption_key (google.cloud.compute_v1.types.CustomerEncryptionKey):
+            The customer-supplied encryption key of the
+            source snapshot. Required if the source snapshot
+            is protected by a customer-supplied encryption
+            key.
+
+            This field is a member of `oneof`_ ``_source_snapshot_encryption_key``.
+        source_snapshot_id (str):
+            [Output Only] The ID value of the snapshot used to create
+            this image. This value may be used to determine whether the
+            snapshot was taken from the current or a previous instance
+            of a given snapshot name.
+
+            This field is a member of `oneof`_ ``_source_snapshot_id``.
+        source_type (str):
+            The type of the image used to create this
+            disk. The default and only value is RAW Check
+            the SourceType enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_source_type``.
+        status (str):
+            [Output Only] The status of the image. An image can be used
+            to create other resources, such as instances, only after the
+            image has been successfully created and the status is set to
+            READY. Possible values are FAILED, PENDING, or READY. Check
+            the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+        storage_locations (Sequence[str]):
+            Cloud Storage bucket storage location of the
+            image (regional or multi-regional).
+    """
+
+    class SourceType(proto.Enum):
+        r"""The type of the image used to create this disk. The default
+        and only value is RAW
+        """
+        UNDEFINED_SOURCE_TYPE = 0
+        RAW = 80904
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the image. An image can be used to
+        create other resources, such as instances, only after the image has
+        been successfully created and the status is set to READY. Possible
+        values are FAILED, PENDING, or READY.
+        """
+        UNDEFINED_STATUS = 0
+        DELETING = 528602024
+        FAILED = 455706685
+        PENDING = 35394935
+        READY = 77848963
+
+    archive_size_bytes = proto.Field(proto.INT64, number=381093450, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    deprecated = proto.Field(
+        proto.MESSAGE,
+        number=515138995,
+        optional=True,
+        message=shared_07.DeprecationStatus,
+    )
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    disk_size_gb = proto.Field(proto.INT64, number=316263735, optional=True,)
+    family = proto.Field(proto.STRING, number=328751972, optional=True,)
+    guest_os_features = proto.RepeatedField(
+        proto.MESSAGE, number=79294545, message=shared_09.GuestOsFeature,
+    )
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    image_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=379512583,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    label_fingerprint = proto.Field(proto.STRING, number=178124825, optional=True,)
+    labels = proto.MapField(proto.STRING, proto.STRING, number=500195327,)
+    license_codes = proto.RepeatedField(proto.INT64, number=45482664,)
+    licenses = proto.RepeatedField(proto.STRING, number=337642578,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    raw_disk = proto.Field(
+        proto.MESSAGE, number=503113556, optional=True, message="RawDisk",
+    )
+    satisfies_pzs = proto.Field(proto.BOOL, number=480964267, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    shielded_instance_initial_state = proto.Field(
+        proto.MESSAGE,
+        number=192356867,
+        optional=True,
+        message=shared_12.InitialStateConfig,
+    )
+    source_disk = proto.Field(proto.STRING, number=451753793, optional=True,)
+    source_disk_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=531501153,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    source_disk_id = proto.Field(proto.STRING, number=454190809, optional=True,)
+    source_image = proto.Field(proto.STRING, number=50443319, optional=True,)
+    source_image_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=381503659,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    source_image_id = proto.Field(proto.STRING, number=55328291, optional=True,)
+    source_snapshot = proto.Field(proto.STRING, number=126061928, optional=True,)
+    source_snapshot_encryption_key = proto.Field(
+        proto.MESSAGE,
+        number=303679322,
+        optional=True,
+        message=shared_08.CustomerEncryptionKey,
+    )
+    source_snapshot_id = proto.Field(proto.STRING, number=98962258, optional=True,)
+    source_type = proto.Field(proto.STRING, number=452245726, optional=True,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+    storage_locations = proto.RepeatedField(proto.STRING, number=328005274,)
+
+
+class RawDisk(proto.Message):
+    r"""The parameters of the raw disk image.
+
+    Attributes:
+        container_type (str):
+            The format used to encode and transmit the
+            block device, which should be TAR. This is just
+            a container and transmission format and not a
+            runtime format. Provided by the client when the
+            disk image is created. Check the ContainerType
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_container_type``.
+        sha1_checksum (str):
+            [Deprecated] This field is deprecated. An optional SHA1
+            checksum of the disk image before unpackaging provided by
+            the client when the disk image is created.
+
+            This field is a member of `oneof`_ ``_sha1_checksum``.
+        source (str):
+            The full Google Cloud Storage URL where the raw disk image
+            archive is stored. The following are valid formats for the
+            URL: -
+            https://storage.googleapis.com/bucket_name/image_archive_name
+            - https://storage.googleapis.com/bucket_name/folder_name/
+            image_archive_name In order to create an image, you must
+            provide the full or partial URL of one of the following: -
+            The rawDisk.source URL - The sourceDisk URL - The
+            sourceImage URL - The sourceSnapshot URL
+
+            This field is a member of `oneof`_ ``_source``.
+    """
+
+    class ContainerType(proto.Enum):
+        r"""The format used to encode and transmit the block device,
+        which should be TAR. This is just a container and transmission
+        format and not a runtime format. Provided by the client when the
+        disk image is created.
+        """
+        UNDEFINED_CONTAINER_TYPE = 0
+        TAR = 82821
+
+    container_type = proto.Field(proto.STRING, number=318809144, optional=True,)
+    sha1_checksum = proto.Field(proto.STRING, number=314444349, optional=True,)
+    source = proto.Field(proto.STRING, number=177235995, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+instance_groups, region_instance_groups.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_20
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={"InstanceGroup", "InstanceWithNamedPorts",},
+)
+
+
+class InstanceGroup(proto.Message):
+    r"""Represents an Instance Group resource. Instance Groups can be
+    used to configure a target for load balancing. Instance groups
+    can either be managed or unmanaged. To create managed instance
+    groups, use the instanceGroupManager or
+    regionInstanceGroupManager resource instead. Use zonal unmanaged
+    instance groups if you need to apply load balancing to groups of
+    heterogeneous instances or if you need to manage the instances
+    yourself. You cannot create regional unmanaged instance groups.
+    For more information, read Instance groups.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] The creation timestamp for this instance group
+            in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        fingerprint (str):
+            [Output Only] The fingerprint of the named ports. The system
+            uses this fingerprint to detect conflicts when multiple
+            users change the named ports concurrently.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] A unique identifier for this instance group,
+            generated by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] The resource type, which is always
+            compute#instanceGroup for instance groups.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            The name of the instance group. The name must
+            be 1-63 characters long, and comply with
+            RFC1035.
+
+            This field is a member of `oneof`_ ``_name``.
+        named_ports (Sequence[google.cloud.compute_v1.types.NamedPort]):
+            Assigns a name to a port number. For example: {name: "http",
+            port: 80} This allows the system to reference ports by the
+            assigned name instead of a port number. Named ports can also
+            contain multiple ports. For example: [{name: "http", port:
+            80},{name: "http", port: 8080}] Named ports apply to all
+            instances in this instance group.
+        network (str):
+            [Output Only] The URL of the network to which all instances
+            in the instance group belong. If your instance has multiple
+            network interfaces, then the network and subnetwork fields
+            only refer to the network and subnet used by your primary
+            interface (nic0).
+
+            This field is a member of `oneof`_ ``_network``.
+        region (str):
+            [Output Only] The URL of the region where the instance group
+            is located (for regional resources).
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] The URL for this instance group. The server
+            generates this URL.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        size (int):
+            [Output Only] The total number of instances in the instance
+            group.
+
+            This field is a member of `oneof`_ ``_size``.
+        subnetwork (str):
+            [Output Only] The URL of the subnetwork to which all
+            instances in the instance group belong. If your instance has
+            multiple network interfaces, then the network and subnetwork
+            fields only refer to the network and subnet used by your
+            primary interface (nic0).
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+        zone (str):
+            [Output Only] The URL of the zone where the instance group
+            is located (for zonal resources).
+
+            This field is a member of `oneof`_ ``_zone``.
+    """
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    named_ports = proto.RepeatedField(
+        proto.MESSAGE, number=427598732, message=shared_20.NamedPort,
+    )
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    size = proto.Field(proto.INT32, number=3530753, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694, optional=True,)
+    zone = proto.Field(proto.STRING, number=3744684, optional=True,)
+
+
+class InstanceWithNamedPorts(proto.Message):
+    r"""
+
+    Attributes:
+        instance (str):
+            [Output Only] The URL of the instance.
+
+            This field is a member of `oneof`_ ``_instance``.
+        named_ports (Sequence[google.cloud.compute_v1.types.NamedPort]):
+            [Output Only] The named ports that belong to this instance
+            group.
+        status (str):
+            [Output Only] The status of the instance. Check the Status
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output Only] The status of the instance."""
+        UNDEFINED_STATUS = 0
+        DEPROVISIONING = 428935662
+        PROVISIONING = 290896621
+        REPAIRING = 413483285
+        RUNNING = 121282975
+        STAGING = 431072283
+        STOPPED = 444276141
+        STOPPING = 350791796
+        SUSPENDED = 51223995
+        SUSPENDING = 514206246
+        TERMINATED = 250018339
+
+    instance = proto.Field(proto.STRING, number=18257045, optional=True,)
+    named_ports = proto.RepeatedField(
+        proto.MESSAGE, number=427598732, message=shared_20.NamedPort,
+    )
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,182 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+instances, region_instances.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_31
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "BulkInsertInstanceResource",
+        "BulkInsertInstanceResourcePerInstanceProperties",
+        "LocationPolicy",
+        "LocationPolicyLocation",
+    },
+)
+
+
+class BulkInsertInstanceResource(proto.Message):
+    r"""A transient resource used in compute.instances.bulkInsert and
+    compute.regionInstances.bulkInsert . This resource is not
+    persisted anywhere, it is used only for processing the requests.
+
+    Attributes:
+        count (int):
+            The maximum number of instances to create.
+
+            This field is a member of `oneof`_ ``_count``.
+        instance_properties (google.cloud.compute_v1.types.InstanceProperties):
+            The instance properties defining the VM
+            instances to be created. Required if
+            sourceInstanceTemplate is not provided.
+
+            This field is a member of `oneof`_ ``_instance_properties``.
+        location_policy (google.cloud.compute_v1.types.LocationPolicy):
+            Policy for chosing target zone.
+
+            This field is a member of `oneof`_ ``_location_policy``.
+        min_count (int):
+            The minimum number of instances to create. If no min_count
+            is specified then count is used as the default value. If
+            min_count instances cannot be created, then no instances
+            will be created and instances already created will be
+            deleted.
+
+            This field is a member of `oneof`_ ``_min_count``.
+        name_pattern (str):
+            The string pattern used for the names of the VMs. Either
+            name_pattern or per_instance_properties must be set. The
+            pattern must contain one continuous sequence of placeholder
+            hash characters (#) with each character corresponding to one
+            digit of the generated instance name. Example: a
+            name_pattern of inst-#### generates instance names such as
+            inst-0001 and inst-0002. If existing instances in the same
+            project and zone have names that match the name pattern then
+            the generated instance numbers start after the biggest
+            existing number. For example, if there exists an instance
+            with name inst-0050, then instance names generated using the
+            pattern inst-#### begin with inst-0051. The name pattern
+            placeholder #...# can contain up to 18 characters.
+
+            This field is a member of `oneof`_ ``_name_pattern``.
+        per_instance_properties (Sequence[google.cloud.compute_v1.types.BulkInsertInstanceResource.PerInstancePropertiesEntry]):
+            Per-instance properties to be set on individual instances.
+            Keys of this map specify requested instance names. Can be
+            empty if name_pattern is used.
+        source_instance_template (str):
+            Specifies the instance template from which to
+            create instances. You may combine
+            sourceInstanceTemplate with instanceProperties
+            to override specific values from an existing
+            instance template. Bulk API follows the
+            semantics of JSON Merge Patch described by RFC
+            7396. It can be a full or partial URL. For
+            example, the following are all valid URLs to an
+            instance template: -
+            https://www.googleapis.com/compute/v1/projects/project
+            /global/instanceTemplates/instanceTemplate -
+            projects/project/global/instanceTemplates/instanceTemplate
+            - global/instanceTemplates/instanceTemplate This
+            field is optional.
+
+            This field is a member of `oneof`_ ``_source_instance_template``.
+    """
+
+    count = proto.Field(proto.INT64, number=94851343, optional=True,)
+    instance_properties = proto.Field(
+        proto.MESSAGE,
+        number=215355165,
+        optional=True,
+        message=shared_31.InstanceProperties,
+    )
+    location_policy = proto.Field(
+        proto.MESSAGE, number=465689852, optional=True, message="LocationPolicy",
+    )
+    min_count = proto.Field(proto.INT64, number=523228386, optional=True,)
+    name_pattern = proto.Field(proto.STRING, number=413815260, optional=True,)
+    per_instance_properties = proto.MapField(
+        proto.STRING,
+        proto.MESSAGE,
+        number=108502267,
+        message="BulkInsertInstanceResourcePerInstanceProperties",
+    )
+    source_instance_template = proto.Field(
+        proto.STRING, number=332423616, optional=True,
+    )
+
+
+class BulkInsertInstanceResourcePerInstanceProperties(proto.Message):
+    r"""Per-instance properties to be set on individual instances. To
+    be extended in the future.
+
+    Attributes:
+        name (str):
+            This field is only temporary. It will be
+            removed. Do not use it.
+
+            This field is a member of `oneof`_ ``_name``.
+    """
+
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+
+
+class LocationPolicy(proto.Message):
+    r"""Configuration for location policy among multiple possible
+    locations (e.g. preferences for zone selection among zones in a
+    single region).
+
+    Attributes:
+        locations (Sequence[google.cloud.compute_v1.types.LocationPolicy.LocationsEntry]):
+            Location configurations mapped by location
+            name. Currently only zone names are supported
+            and must be represented as valid internal URLs,
+            such as zones/us-central1-a.
+    """
+
+    locations = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=413423454, message="LocationPolicyLocation",
+    )
+
+
+class LocationPolicyLocation(proto.Message):
+    r"""
+
+    Attributes:
+        preference (str):
+            Preference for a given location: ALLOW or
+            DENY. Check the Preference enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_preference``.
+    """
+
+    class Preference(proto.Enum):
+        r"""Preference for a given location: ALLOW or DENY."""
+        UNDEFINED_PREFERENCE = 0
+        ALLOW = 62368553
+        DENY = 2094604
+        PREFERENCE_UNSPECIFIED = 496219571
+
+    preference = proto.Field(proto.STRING, number=150781147, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+node_groups, node_templates.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"LocalDisk", "ServerBinding",},
+)
+
+
+class LocalDisk(proto.Message):
+    r"""
+
+    Attributes:
+        disk_count (int):
+            Specifies the number of such disks.
+
+            This field is a member of `oneof`_ ``_disk_count``.
+        disk_size_gb (int):
+            Specifies the size of the disk in base-2 GB.
+
+            This field is a member of `oneof`_ ``_disk_size_gb``.
+        disk_type (str):
+            Specifies the desired disk type on the node.
+            This disk type must be a local storage type
+            (e.g.: local-ssd). Note that for nodeTemplates,
+            this should be the name of the disk type and not
+            its URL.
+
+            This field is a member of `oneof`_ ``_disk_type``.
+    """
+
+    disk_count = proto.Field(proto.INT32, number=182933485, optional=True,)
+    disk_size_gb = proto.Field(proto.INT32, number=316263735, optional=True,)
+    disk_type = proto.Field(proto.STRING, number=93009052, optional=True,)
+
+
+class ServerBinding(proto.Message):
+    r"""
+
+    Attributes:
+        type_ (str):
+            Check the Type enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r""""""
+        UNDEFINED_TYPE = 0
+        RESTART_NODE_ON_ANY_SERVER = 502950985
+        RESTART_NODE_ON_MINIMAL_SERVERS = 204166495
+        SERVER_BINDING_TYPE_UNSPECIFIED = 180825512
+
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+projects, regions.
+"""
+
+import proto  # type: ignore
+
+
+__protobuf__ = proto.module(package="google.cloud.compute.v1", manifest={"Quota",},)
+
+
+class Quota(proto.Message):
+    r"""A quotas entry.
+
+    Attributes:
+        limit (float):
+            [Output Only] Quota limit for this metric.
+
+            This field is a member of `oneof`_ ``_limit``.
+        metric (str):
+            [Output Only] Name of the quota metric. Check the Metric
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_metric``.
+        owner (str):
+            [Output Only] Owning resource. This is the resource on which
+            this quota is applied.
+
+            This field is a member of `oneof`_ ``_owner``.
+        usage (float):
+            [Output Only] Current usage of this metric.
+
+            This field is a member of `oneof`_ ``_usage``.
+    """
+
+    class Metric(proto.Enum):
+        r"""[Output Only] Name of the quota metric."""
+        UNDEFINED_METRIC = 0
+        A2_CPUS = 153206585
+        AFFINITY_GROUPS = 108303563
+        AUTOSCALERS = 471248988
+        BACKEND_BUCKETS = 137626846
+        BACKEND_SERVICES = 269623753
+        C2D_CPUS = 508182517
+        C2_CPUS = 317601211
+        C3_CPUS = 346230362
+        COMMITMENTS = 456141790
+        COMMITTED_A2_CPUS = 59330902
+        COMMITTED_C2D_CPUS = 282390904
+        COMMITTED_C2_CPUS = 223725528
+        COMMITTED_C3_CPUS = 252354679
+        COMMITTED_CPUS = 292394702
+        COMMITTED_E2_CPUS = 388120154
+        COMMITTED_LICENSES = 357606869
+        COMMITTED_LOCAL_SSD_TOTAL_GB = 308393480
+        COMMITTED_MEMORY_OPTIMIZED_CPUS = 489057886
+        COMMITTED_N2A_CPUS = 40064304
+        COMMITTED_N2D_CPUS = 125951757
+        COMMITTED_N2_CPUS = 322589603
+        COMMITTED_NVIDIA_A100_GPUS = 375799445
+        COMMITTED_NVIDIA_K80_GPUS = 3857188
+        COMMITTED_NVIDIA_P100_GPUS = 107528100
+        COMMITTED_NVIDIA_P4_GPUS = 347952897
+        COMMITTED_NVIDIA_T4_GPUS = 139871237
+        COMMITTED_NVIDIA_V100_GPUS = 219562
+        COMMITTED_T2D_CPUS = 382266439
+        CPUS = 2075595
+        CPUS_ALL_REGIONS = 470911149
+        DISKS_TOTAL_GB = 353520543
+        E2_CPUS = 481995837
+        EXTERNAL_NETWORK_LB_FORWARDING_RULES = 374298265
+        EXTERNAL_PROTOCOL_FORWARDING_RULES = 63478888
+        EXTERNAL_VPN_GATEWAYS = 272457134
+        FIREWALLS = 374485843
+        FORWARDING_RULES = 432668949
+        GLOBAL_INTERNAL_ADDRESSES = 42738332
+        GPUS_ALL_REGIONS = 39387177
+        HEALTH_CHECKS = 289347502
+        IMAGES = 15562360
+        INSTANCES = 131337822
+        INSTANCE_GROUPS = 355919038
+        INSTANCE_GROUP_MANAGERS = 101798192
+        INSTANCE_TEMPLATES = 226188271
+        INTERCONNECTS = 415204741
+        INTERCONNECT_ATTACHMENTS_PER_REGION = 159968086
+        INTERCONNECT_ATTACHMENTS_TOTAL_MBPS = 425090419
+        INTERCONNECT_TOTAL_GBPS = 285341866
+        INTERNAL_ADDRESSES = 197899392
+        INTERNAL_TRAFFIC_DIRECTOR_FORWARDING_RULES = 266433668
+        IN_PLACE_SNAPSHOTS = 151359133
+        IN_USE_ADDRESSES = 402125072
+        IN_USE_BACKUP_SCHEDULES = 32786705
+        IN_USE_SNAPSHOT_SCHEDULES = 462104083
+        LOCAL_SSD_TOTAL_GB = 330878021
+        M1_CPUS = 37203366
+        M2_CPUS = 65832517
+        MACHINE_IMAGES = 446986640
+        N2A_CPUS = 265855917
+        N2D_CPUS = 351743370
+        N2_CPUS = 416465286
+        NETWORKS = 485481477
+        NETWORK_ENDPOINT_GROUPS = 102144909
+        NETWORK_FIREWALL_POLICIES = 101117374
+        NODE_GROUPS = 24624817
+        NODE_TEMPLATES = 474896668
+        NVIDIA_A100_GPUS = 504872978
+        NVIDIA_K80_GPUS = 163886599
+        NVIDIA_P100_GPUS = 236601633
+        NVIDIA_P100_VWS_GPUS = 213970574
+        NVIDIA_P4_GPUS = 283841470
+        NVIDIA_P4_VWS_GPUS = 528296619
+        NVIDIA_T4_GPUS = 75759810
+        NVIDIA_T4_VWS_GPUS = 319813039
+        NVIDIA_V100_GPUS = 129293095
+        PACKET_MIRRORINGS = 15578407
+        PD_EXTREME_TOTAL_PROVISIONED_IOPS = 69593965
+        PREEMPTIBLE_CPUS = 251184841
+        PREEMPTIBLE_LOCAL_SSD_GB = 260819336
+        PREEMPTIBLE_NVIDIA_A100_GPUS = 68832784
+        PREEMPTIBLE_NVIDIA_K80_GPUS = 374960201
+        PREEMPTIBLE_NVIDIA_P100_GPUS = 337432351
+        PREEMPTIBLE_NVIDIA_P100_VWS_GPUS = 313544076
+        PREEMPTIBLE_NVIDIA_P4_GPUS = 429197628
+        PREEMPTIBLE_NVIDIA_P4_VWS_GPUS = 252981545
+        PREEMPTIBLE_NVIDIA_T4_GPUS = 221115968
+        PREEMPTIBLE_NVIDIA_T4_VWS_GPUS = 44497965
+        PREEMPTIBLE_NVIDIA_V100_GPUS = 230123813
+        PSC_ILB_CONSUMER_FORWARDING_RULES_PER_PRODUCER_NETWORK = 231164291
+        PSC_INTERNAL_LB_FORWARDING_RULES = 169005435
+        PUBLIC_ADVERTISED_PREFIXES = 471371980
+        PUBLIC_DELEGATED_PREFIXES = 532465974
+        REGIONAL_AUTOSCALERS = 29363772
+        REGIONAL_INSTANCE_GROUP_MANAGERS = 37543696
+        RESERVATIONS = 32644647
+        RESOURCE_POLICIES = 83955297
+        ROUTERS = 493018666
+        ROUTES = 275680074
+        SECURITY_POLICIES = 189518703
+        SECURITY_POLICIES_PER_REGION = 249041734
+        SECURITY_POLICY_CEVAL_RULES = 470815689
+        SECURITY_POLICY_RULES = 203549225
+        SECURITY_POLICY_RULES_PER_REGION = 126510156
+        SERVICE_ATTACHMENTS = 471521510
+        SNAPSHOTS = 343405327
+        SSD_TOTAL_GB = 161732561
+        SSL_CERTIFICATES = 378372399
+        STATIC_ADDRESSES = 93624049
+        STATIC_BYOIP_ADDRESSES = 275809649
+        SUBNETWORKS = 421330469
+        T2D_CPUS = 71187140
+        TARGET_HTTPS_PROXIES = 219522506
+        TARGET_HTTP_PROXIES = 164117155
+        TARGET_INSTANCES = 284519728
+        TARGET_POOLS = 348261257
+        TARGET_SSL_PROXIES = 159216235
+        TARGET_TCP_PROXIES = 182243136
+        TARGET_VPN_GATEWAYS = 75029928
+        URL_MAPS = 378660743
+        VPN_GATEWAYS = 35620282
+        VPN_TUNNELS = 104327296
+        XPN_SERVICE_PROJECTS = 95191981
+
+    limit = proto.Field(proto.DOUBLE, number=102976443, optional=True,)
+    metric = proto.Field(proto.STRING, number=533067184, optional=True,)
+    owner = proto.Field(proto.STRING, number=106164915, optional=True,)
+    usage = proto.Field(proto.DOUBLE, number=111574433, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+region_ssl_certificates, ssl_certificates.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "SslCertificate",
+        "SslCertificateList",
+        "SslCertificateManagedSslCertificate",
+        "SslCertificateSelfManagedSslCertificate",
+    },
+)
+
+
+class SslCertificate(proto.Message):
+    r"""Represents an SSL Certificate resource. Google Compute Engine has
+    two SSL Certificate resources: \*
+    `Global </compute/docs/reference/rest/v1/sslCertificates>`__ \*
+    `Regional </compute/docs/reference/rest/v1/regionSslCertificates>`__
+    The sslCertificates are used by: - external HTTPS load balancers -
+    SSL proxy load balancers The regionSslCertificates are used by
+    internal HTTPS load balancers. Optionally, certificate file contents
+    that you upload can contain a set of up to five PEM-encoded
+    certificates. The API call creates an object (sslCertificate) that
+    holds this data. You can use SSL keys and certificates to secure
+    connections to a load balancer. For more information, read Creating
+    and using SSL certificates, SSL certificates quotas and limits, and
+    Troubleshooting SSL certificates.
+
+    Attributes:
+        certificate (str):
+            A value read into memory from a certificate
+            file. The certificate file must be in PEM
+            format. The certificate chain must be no greater
+            than 5 certs long. The chain must include at
+            least one intermediate cert.
+
+            This field is a member of `oneof`_ ``_certificate``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        expire_time (str):
+            [Output Only] Expire time of the certificate. RFC3339
+
+            This field is a member of `oneof`_ ``_expire_time``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#sslCertificate for SSL certificates.
+
+            This field is a member of `oneof`_ ``_kind``.
+        managed (google.cloud.compute_v1.types.SslCertificateManagedSslCertificate):
+            Configuration and status of a managed SSL
+            certificate.
+
+            This field is a member of `oneof`_ ``_managed``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        private_key (str):
+            A value read into memory from a write-only
+            private key file. The private key file must be
+            in PEM format. For security, only insert
+            requests include this field.
+
+            This field is a member of `oneof`_ ``_private_key``.
+        region (str):
+            [Output Only] URL of the region where the regional SSL
+            Certificate resides. This field is not applicable to global
+            SSL Certificate.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        self_managed (google.cloud.compute_v1.types.SslCertificateSelfManagedSslCertificate):
+            Configuration and status of a self-managed
+            SSL certificate.
+
+            This field is a member of `oneof`_ ``_self_managed``.
+        subject_alternative_names (Sequence[str]):
+            [Output Only] Domains associated with the certificate via
+            Subject Alternative Name.
+        type_ (str):
+            (Optional) Specifies the type of SSL certificate, either
+            "SELF_MANAGED" or "MANAGED". If not specified, the
+            certificate is self-managed and the fields certificate and
+            private_key are used. Check the Type enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_type``.
+    """
+
+    class Type(proto.Enum):
+        r"""(Optional) Specifies the type of SSL certificate, either
+        "SELF_MANAGED" or "MANAGED". If not specified, the certificate is
+        self-managed and the fields certificate and private_key are used.
+        """
+        UNDEFINED_TYPE = 0
+        MANAGED = 479501183
+        SELF_MANAGED = 434437516
+        TYPE_UNSPECIFIED = 437714322
+
+    certificate = proto.Field(proto.STRING, number=341787031, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    expire_time = proto.Field(proto.STRING, number=440691181, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    managed = proto.Field(
+        proto.MESSAGE,
+        number=298389407,
+        optional=True,
+        message="SslCertificateManagedSslCertificate",
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    private_key = proto.Field(proto.STRING, number=361331107, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    self_managed = proto.Field(
+        proto.MESSAGE,
+        number=329284012,
+        optional=True,
+        message="SslCertificateSelfManagedSslCertificate",
+    )
+    subject_alternative_names = proto.RepeatedField(proto.STRING, number=528807907,)
+    type_ = proto.Field(proto.STRING, number=3575610, optional=True,)
+
+
+class SslCertificateList(proto.Message):
+    r"""Contains a list of SslCertificate resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.SslCertificate]):
+            A list of SslCertificate resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="SslCertificate",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SslCertificateManagedSslCertificate(proto.Message):
+    r"""Configuration and status of a managed SSL certificate.
+
+    Attributes:
+        domain_status (Sequence[google.cloud.compute_v1.types.SslCertificateManagedSslCertificate.DomainStatusEntry]):
+            [Output only] Detailed statuses of the domains specified for
+            managed certificate resource.
+        domains (Sequence[str]):
+            The domains for which a managed SSL certificate will be
+            generated. Each Google-managed SSL certificate supports up
+            to the `maximum number of domains per Google-managed SSL
+            certificate </load-balancing/docs/quotas#ssl_certificates>`__.
+        status (str):
+            [Output only] Status of the managed certificate resource.
+            Check the Status enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_status``.
+    """
+
+    class Status(proto.Enum):
+        r"""[Output only] Status of the managed certificate resource."""
+        UNDEFINED_STATUS = 0
+        ACTIVE = 314733318
+        MANAGED_CERTIFICATE_STATUS_UNSPECIFIED = 474800850
+        PROVISIONING = 290896621
+        PROVISIONING_FAILED = 76813775
+        PROVISIONING_FAILED_PERMANENTLY = 275036203
+        RENEWAL_FAILED = 434659076
+
+    domain_status = proto.MapField(proto.STRING, proto.STRING, number=360305613,)
+    domains = proto.RepeatedField(proto.STRING, number=226935855,)
+    status = proto.Field(proto.STRING, number=181260274, optional=True,)
+
+
+class SslCertificateSelfManagedSslCertificate(proto.Message):
+    r"""Configuration and status of a self-managed SSL certificate.
+
+    Attributes:
+        certificate (str):
+            A local certificate file. The certificate
+            must be in PEM format. The certificate chain
+            must be no greater than 5 certs long. The chain
+            must include at least one intermediate cert.
+
+            This field is a member of `oneof`_ ``_certificate``.
+        private_key (str):
+            A write-only private key in PEM format. Only
+            insert requests will include this field.
+
+            This field is a member of `oneof`_ ``_private_key``.
+    """
+
+    certificate = proto.Field(proto.STRING, number=341787031, optional=True,)
+    private_key = proto.Field(proto.STRING, number=361331107, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages shared by the 2 services:
+
+routers, routes.
+"""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_03
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1", manifest={"Route", "RouteAsPath",},
+)
+
+
+class Route(proto.Message):
+    r"""Represents a Route resource. A route defines a path from VM
+    instances in the VPC network to a specific destination. This
+    destination can be inside or outside the VPC network. For more
+    information, read the Routes overview.
+
+    Attributes:
+        as_paths (Sequence[google.cloud.compute_v1.types.RouteAsPath]):
+            [Output Only] AS path.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this field when you create the resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        dest_range (str):
+            The destination range of outgoing packets
+            that this route applies to. Both IPv4 and IPv6
+            are supported.
+
+            This field is a member of `oneof`_ ``_dest_range``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of this resource. Always compute#routes
+            for Route resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?``. The first character must be
+            a lowercase letter, and all following characters (except for
+            the last character) must be a dash, lowercase letter, or
+            digit. The last character must be a lowercase letter or
+            digit.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            Fully-qualified URL of the network that this
+            route applies to.
+
+            This field is a member of `oneof`_ ``_network``.
+        next_hop_gateway (str):
+            The URL to a gateway that should handle
+            matching packets. You can only specify the
+            internet gateway using a full or partial valid
+            URL: projects/ project/global/gateways/default-
+            internet-gateway
+
+            This field is a member of `oneof`_ ``_next_hop_gateway``.
+        next_hop_ilb (str):
+            The URL to a forwarding rule of type
+            loadBalancingScheme=INTERNAL that should handle
+            matching packets or the IP address of the
+            forwarding Rule. For example, the following are
+            all valid URLs: - 10.128.0.56 -
+            https://www.googleapis.com/compute/v1/projects/project/regions/region
+            /forwardingRules/forwardingRule -
+            regions/region/forwardingRules/forwardingRule
+
+            This field is a member of `oneof`_ ``_next_hop_ilb``.
+        next_hop_instance (str):
+            The URL to an instance that should handle
+            matching packets. You can specify this as a full
+            or partial URL. For example:
+            https://www.googleapis.com/compute/v1/projects/project/zones/zone/instances/
+
+            This field is a member of `oneof`_ ``_next_hop_instance``.
+        next_hop_ip (str):
+            The network IP address of an instance that
+            should handle matching packets. Only IPv4 is
+            supported.
+
+            This field is a member of `oneof`_ ``_next_hop_ip``.
+        next_hop_network (str):
+            The URL of the local network if it should
+            handle matching packets.
+
+            This field is a member of `oneof`_ ``_next_hop_network``.
+        next_hop_peering (str):
+            [Output Only] The network peering name that should handle
+            matching packets, which should conform to RFC1035.
+
+            This field is a member of `oneof`_ ``_next_hop_peering``.
+        next_hop_vpn_tunnel (str):
+            The URL to a VpnTunnel that should handle
+            matching packets.
+
+            This field is a member of `oneof`_ ``_next_hop_vpn_tunnel``.
+        priority (int):
+            The priority of this route. Priority is used to break ties
+            in cases where there is more than one matching route of
+            equal prefix length. In cases where multiple routes have
+            equal prefix length, the one with the lowest-numbered
+            priority value wins. The default value is ``1000``. The
+            priority value must be from ``0`` to ``65535``, inclusive.
+
+            This field is a member of `oneof`_ ``_priority``.
+        route_type (str):
+            [Output Only] The type of this route, which can be one of
+            the following values: - 'TRANSIT' for a transit route that
+            this router learned from another Cloud Router and will
+            readvertise to one of its BGP peers - 'SUBNET' for a route
+            from a subnet of the VPC - 'BGP' for a route learned from a
+            BGP peer of this router - 'STATIC' for a static route Check
+            the RouteType enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_route_type``.
+        self_link (str):
+            [Output Only] Server-defined fully-qualified URL for this
+            resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        tags (Sequence[str]):
+            A list of instance tags to which this route
+            applies.
+        warnings (Sequence[google.cloud.compute_v1.types.Warnings]):
+            [Output Only] If potential misconfigurations are detected
+            for this route, this field will be populated with warning
+            messages.
+    """
+
+    class RouteType(proto.Enum):
+        r"""[Output Only] The type of this route, which can be one of the
+        following values: - 'TRANSIT' for a transit route that this router
+        learned from another Cloud Router and will readvertise to one of its
+        BGP peers - 'SUBNET' for a route from a subnet of the VPC - 'BGP'
+        for a route learned from a BGP peer of this router - 'STATIC' for a
+        static route
+        """
+        UNDEFINED_ROUTE_TYPE = 0
+        BGP = 65707
+        STATIC = 308331118
+        SUBNET = 309278557
+        TRANSIT = 187793843
+
+    as_paths = proto.RepeatedField(
+        proto.MESSAGE, number=137568929, message="RouteAsPath",
+    )
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    dest_range = proto.Field(proto.STRING, number=381327712, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    next_hop_gateway = proto.Field(proto.STRING, number=377175298, optional=True,)
+    next_hop_ilb = proto.Field(proto.STRING, number=198679901, optional=True,)
+    next_hop_instance = proto.Field(proto.STRING, number=393508247, optional=True,)
+    next_hop_ip = proto.Field(proto.STRING, number=110319529, optional=True,)
+    next_hop_network = proto.Field(proto.STRING, number=262295788, optional=True,)
+    next_hop_peering = proto.Field(proto.STRING, number=412682750, optional=True,)
+    next_hop_vpn_tunnel = proto.Field(proto.STRING, number=519844501, optional=True,)
+    priority = proto.Field(proto.UINT32, number=445151652, optional=True,)
+    route_type = proto.Field(proto.STRING, number=375888752, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    tags = proto.RepeatedField(proto.STRING, number=3552281,)
+    warnings = proto.RepeatedField(
+        proto.MESSAGE, number=498091095, message=shared_03.Warnings,
+    )
+
+
+class RouteAsPath(proto.Message):
+    r"""
+
+    Attributes:
+        as_lists (Sequence[int]):
+            [Output Only] The AS numbers of the AS Path.
+        path_segment_type (str):
+            [Output Only] The type of the AS Path, which can be one of
+            the following values: - 'AS_SET': unordered set of
+            autonomous systems that the route in has traversed -
+            'AS_SEQUENCE': ordered set of autonomous systems that the
+            route has traversed - 'AS_CONFED_SEQUENCE': ordered set of
+            Member Autonomous Systems in the local confederation that
+            the route has traversed - 'AS_CONFED_SET': unordered set of
+            Member Autonomous Systems in the local confederation that
+            the route has traversed Check the PathSegmentType enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_path_segment_type``.
+    """
+
+    class PathSegmentType(proto.Enum):
+        r"""[Output Only] The type of the AS Path, which can be one of the
+        following values: - 'AS_SET': unordered set of autonomous systems
+        that the route in has traversed - 'AS_SEQUENCE': ordered set of
+        autonomous systems that the route has traversed -
+        'AS_CONFED_SEQUENCE': ordered set of Member Autonomous Systems in
+        the local confederation that the route has traversed -
+        'AS_CONFED_SET': unordered set of Member Autonomous Systems in the
+        local confederation that the route has traversed
+        """
+        UNDEFINED_PATH_SEGMENT_TYPE = 0
+        AS_CONFED_SEQUENCE = 222152624
+        AS_CONFED_SET = 374040307
+        AS_SEQUENCE = 106735918
+        AS_SET = 329846453
+
+    as_lists = proto.RepeatedField(proto.UINT32, number=134112584,)
+    path_segment_type = proto.Field(proto.STRING, number=513464992, optional=True,)
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
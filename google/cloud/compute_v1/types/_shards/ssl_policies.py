@@ -0,0 +1,503 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the ssl_policies service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_03
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteSslPolicyRequest",
+        "GetSslPolicyRequest",
+        "InsertSslPolicyRequest",
+        "ListAvailableFeaturesSslPoliciesRequest",
+        "ListSslPoliciesRequest",
+        "PatchSslPolicyRequest",
+        "SslPoliciesList",
+        "SslPoliciesListAvailableFeaturesResponse",
+        "SslPolicy",
+    },
+)
+
+
+class DeleteSslPolicyRequest(proto.Message):
+    r"""A request message for SslPolicies.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        ssl_policy (str):
+            Name of the SSL policy to delete. The name
+            must be 1-63 characters long, and comply with
+            RFC1035.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    ssl_policy = proto.Field(proto.STRING, number=295190213,)
+
+
+class GetSslPolicyRequest(proto.Message):
+    r"""A request message for SslPolicies.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        ssl_policy (str):
+            Name of the SSL policy to update. The name
+            must be 1-63 characters long, and comply with
+            RFC1035.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    ssl_policy = proto.Field(proto.STRING, number=295190213,)
+
+
+class InsertSslPolicyRequest(proto.Message):
+    r"""A request message for SslPolicies.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        ssl_policy_resource (google.cloud.compute_v1.types.SslPolicy):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    ssl_policy_resource = proto.Field(
+        proto.MESSAGE, number=274891848, message="SslPolicy",
+    )
+
+
+class ListAvailableFeaturesSslPoliciesRequest(proto.Message):
+    r"""A request message for SslPolicies.ListAvailableFeatures. See
+    the method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class ListSslPoliciesRequest(proto.Message):
+    r"""A request message for SslPolicies.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchSslPolicyRequest(proto.Message):
+    r"""A request message for SslPolicies.Patch. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        ssl_policy (str):
+            Name of the SSL policy to update. The name
+            must be 1-63 characters long, and comply with
+            RFC1035.
+        ssl_policy_resource (google.cloud.compute_v1.types.SslPolicy):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    ssl_policy = proto.Field(proto.STRING, number=295190213,)
+    ssl_policy_resource = proto.Field(
+        proto.MESSAGE, number=274891848, message="SslPolicy",
+    )
+
+
+class SslPoliciesList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.SslPolicy]):
+            A list of SslPolicy resources.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#sslPoliciesList for lists of sslPolicies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="SslPolicy",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SslPoliciesListAvailableFeaturesResponse(proto.Message):
+    r"""
+
+    Attributes:
+        features (Sequence[str]):
+
+    """
+
+    features = proto.RepeatedField(proto.STRING, number=246211645,)
+
+
+class SslPolicy(proto.Message):
+    r"""Represents an SSL Policy resource. Use SSL policies to
+    control the SSL features, such as versions and cipher suites,
+    offered by an HTTPS or SSL Proxy load balancer. For more
+    information, read SSL Policy Concepts.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        custom_features (Sequence[str]):
+            A list of features enabled when the selected
+            profile is CUSTOM. The method returns the set of
+            features that can be specified in this list.
+            This field must be empty if the profile is not
+            CUSTOM.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        enabled_features (Sequence[str]):
+            [Output Only] The list of features enabled in the SSL
+            policy.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a SslPolicy. An up-to-
+            date fingerprint must be provided in order to
+            update the SslPolicy, otherwise the request will
+            fail with error 412 conditionNotMet. To see the
+            latest fingerprint, make a get() request to
+            retrieve an SslPolicy.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output only] Type of the resource. Always
+            compute#sslPolicyfor SSL policies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        min_tls_version (str):
+            The minimum version of SSL protocol that can be used by the
+            clients to establish a connection with the load balancer.
+            This can be one of TLS_1_0, TLS_1_1, TLS_1_2. Check the
+            MinTlsVersion enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_min_tls_version``.
+        name (str):
+            Name of the resource. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        profile (str):
+            Profile specifies the set of SSL features
+            that can be used by the load balancer when
+            negotiating SSL with clients. This can be one of
+            COMPATIBLE, MODERN, RESTRICTED, or CUSTOM. If
+            using CUSTOM, the set of SSL features to enable
+            must be specified in the customFeatures field.
+            Check the Profile enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_profile``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warnings (Sequence[google.cloud.compute_v1.types.Warnings]):
+            [Output Only] If potential misconfigurations are detected
+            for this SSL policy, this field will be populated with
+            warning messages.
+    """
+
+    class MinTlsVersion(proto.Enum):
+        r"""The minimum version of SSL protocol that can be used by the clients
+        to establish a connection with the load balancer. This can be one of
+        TLS_1_0, TLS_1_1, TLS_1_2.
+        """
+        UNDEFINED_MIN_TLS_VERSION = 0
+        TLS_1_0 = 33116734
+        TLS_1_1 = 33116735
+        TLS_1_2 = 33116736
+
+    class Profile(proto.Enum):
+        r"""Profile specifies the set of SSL features that can be used by
+        the load balancer when negotiating SSL with clients. This can be
+        one of COMPATIBLE, MODERN, RESTRICTED, or CUSTOM. If using
+        CUSTOM, the set of SSL features to enable must be specified in
+        the customFeatures field.
+        """
+        UNDEFINED_PROFILE = 0
+        COMPATIBLE = 179357396
+        CUSTOM = 388595569
+        MODERN = 132013855
+        RESTRICTED = 261551195
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    custom_features = proto.RepeatedField(proto.STRING, number=34789707,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    enabled_features = proto.RepeatedField(proto.STRING, number=469017467,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    min_tls_version = proto.Field(proto.STRING, number=8155943, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    profile = proto.Field(proto.STRING, number=227445161, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warnings = proto.RepeatedField(
+        proto.MESSAGE, number=498091095, message=shared_03.Warnings,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
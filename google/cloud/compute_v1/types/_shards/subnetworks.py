@@ -0,0 +1,1271 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the subnetworks service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_04
+from google.cloud.compute_v1.types._shards import shared_13
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AggregatedListSubnetworksRequest",
+        "DeleteSubnetworkRequest",
+        "ExpandIpCidrRangeSubnetworkRequest",
+        "GetIamPolicySubnetworkRequest",
+        "GetSubnetworkRequest",
+        "InsertSubnetworkRequest",
+        "ListSubnetworksRequest",
+        "ListUsableSubnetworksRequest",
+        "PatchSubnetworkRequest",
+        "SetIamPolicySubnetworkRequest",
+        "SetPrivateIpGoogleAccessSubnetworkRequest",
+        "Subnetwork",
+        "SubnetworkAggregatedList",
+        "SubnetworkList",
+        "SubnetworkLogConfig",
+        "SubnetworkSecondaryRange",
+        "SubnetworksExpandIpCidrRangeRequest",
+        "SubnetworksScopedList",
+        "SubnetworksSetPrivateIpGoogleAccessRequest",
+        "TestIamPermissionsSubnetworkRequest",
+        "UsableSubnetwork",
+        "UsableSubnetworkSecondaryRange",
+        "UsableSubnetworksAggregatedList",
+    },
+)
+
+
+class AggregatedListSubnetworksRequest(proto.Message):
+    r"""A request message for Subnetworks.AggregatedList. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeleteSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource to delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694,)
+
+
+class ExpandIpCidrRangeSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.ExpandIpCidrRange. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource to update.
+        subnetworks_expand_ip_cidr_range_request_resource (google.cloud.compute_v1.types.SubnetworksExpandIpCidrRangeRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694,)
+    subnetworks_expand_ip_cidr_range_request_resource = proto.Field(
+        proto.MESSAGE, number=477014110, message="SubnetworksExpandIpCidrRangeRequest",
+    )
+
+
+class GetIamPolicySubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.GetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        options_requested_policy_version (int):
+            Requested IAM Policy version.
+
+            This field is a member of `oneof`_ ``_options_requested_policy_version``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    options_requested_policy_version = proto.Field(
+        proto.INT32, number=499220029, optional=True,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class GetSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        subnetwork (str):
+            Name of the Subnetwork resource to return.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    subnetwork = proto.Field(proto.STRING, number=307827694,)
+
+
+class InsertSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork_resource (google.cloud.compute_v1.types.Subnetwork):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    subnetwork_resource = proto.Field(
+        proto.MESSAGE, number=42233151, message="Subnetwork",
+    )
+
+
+class ListSubnetworksRequest(proto.Message):
+    r"""A request message for Subnetworks.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class ListUsableSubnetworksRequest(proto.Message):
+    r"""A request message for Subnetworks.ListUsable. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class PatchSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.Patch. See the method
+    description for details.
+
+    Attributes:
+        drain_timeout_seconds (int):
+            The drain timeout specifies the upper bound in seconds on
+            the amount of time allowed to drain connections from the
+            current ACTIVE subnetwork to the current BACKUP subnetwork.
+            The drain timeout is only applicable when the following
+            conditions are true: - the subnetwork being patched has
+            purpose = INTERNAL_HTTPS_LOAD_BALANCER - the subnetwork
+            being patched has role = BACKUP - the patch request is
+            setting the role to ACTIVE. Note that after this patch
+            operation the roles of the ACTIVE and BACKUP subnetworks
+            will be swapped.
+
+            This field is a member of `oneof`_ ``_drain_timeout_seconds``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource to patch.
+        subnetwork_resource (google.cloud.compute_v1.types.Subnetwork):
+            The body resource for this request
+    """
+
+    drain_timeout_seconds = proto.Field(proto.INT32, number=357707098, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694,)
+    subnetwork_resource = proto.Field(
+        proto.MESSAGE, number=42233151, message="Subnetwork",
+    )
+
+
+class SetIamPolicySubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.SetIamPolicy. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        region_set_policy_request_resource (google.cloud.compute_v1.types.RegionSetPolicyRequest):
+            The body resource for this request
+        resource (str):
+            Name or id of the resource for this request.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    region_set_policy_request_resource = proto.Field(
+        proto.MESSAGE, number=276489091, message=shared_13.RegionSetPolicyRequest,
+    )
+    resource = proto.Field(proto.STRING, number=195806222,)
+
+
+class SetPrivateIpGoogleAccessSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.SetPrivateIpGoogleAccess.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        subnetwork (str):
+            Name of the Subnetwork resource.
+        subnetworks_set_private_ip_google_access_request_resource (google.cloud.compute_v1.types.SubnetworksSetPrivateIpGoogleAccessRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    subnetwork = proto.Field(proto.STRING, number=307827694,)
+    subnetworks_set_private_ip_google_access_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=268920696,
+        message="SubnetworksSetPrivateIpGoogleAccessRequest",
+    )
+
+
+class Subnetwork(proto.Message):
+    r"""Represents a Subnetwork resource. A subnetwork (also known as
+    a subnet) is a logical partition of a Virtual Private Cloud
+    network with one primary IP range and zero or more secondary IP
+    ranges. For more information, read Virtual Private Cloud (VPC)
+    Network.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource. This field can be set only at resource
+            creation time.
+
+            This field is a member of `oneof`_ ``_description``.
+        enable_flow_logs (bool):
+            Whether to enable flow logging for this subnetwork. If this
+            field is not explicitly set, it will not appear in get
+            listings. If not set the default behavior is to disable flow
+            logging. This field isn't supported with the purpose field
+            set to INTERNAL_HTTPS_LOAD_BALANCER.
+
+            This field is a member of `oneof`_ ``_enable_flow_logs``.
+        external_ipv6_prefix (str):
+            [Output Only] The range of external IPv6 addresses that are
+            owned by this subnetwork.
+
+            This field is a member of `oneof`_ ``_external_ipv6_prefix``.
+        fingerprint (str):
+            Fingerprint of this resource. A hash of the
+            contents stored in this object. This field is
+            used in optimistic locking. This field will be
+            ignored when inserting a Subnetwork. An up-to-
+            date fingerprint must be provided in order to
+            update the Subnetwork, otherwise the request
+            will fail with error 412 conditionNotMet. To see
+            the latest fingerprint, make a get() request to
+            retrieve a Subnetwork.
+
+            This field is a member of `oneof`_ ``_fingerprint``.
+        gateway_address (str):
+            [Output Only] The gateway address for default routes to
+            reach destination addresses outside this subnetwork.
+
+            This field is a member of `oneof`_ ``_gateway_address``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        ip_cidr_range (str):
+            The range of internal addresses that are
+            owned by this subnetwork. Provide this property
+            when you create the subnetwork. For example,
+            10.0.0.0/8 or 100.64.0.0/10. Ranges must be
+            unique and non-overlapping within a network.
+            Only IPv4 is supported. This field is set at
+            resource creation time. The range can be any
+            range listed in the Valid ranges list. The range
+            can be expanded after creation using
+            expandIpCidrRange.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        ipv6_access_type (str):
+            The access type of IPv6 address this subnet holds. It's
+            immutable and can only be specified during creation or the
+            first time the subnet is updated into IPV4_IPV6 dual stack.
+            If the ipv6_type is EXTERNAL then this subnet cannot enable
+            direct path. Check the Ipv6AccessType enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_ipv6_access_type``.
+        ipv6_cidr_range (str):
+            [Output Only] The range of internal IPv6 addresses that are
+            owned by this subnetwork.
+
+            This field is a member of `oneof`_ ``_ipv6_cidr_range``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#subnetwork for Subnetwork resources.
+
+            This field is a member of `oneof`_ ``_kind``.
+        log_config (google.cloud.compute_v1.types.SubnetworkLogConfig):
+            This field denotes the VPC flow logging
+            options for this subnetwork. If logging is
+            enabled, logs are exported to Cloud Logging.
+
+            This field is a member of `oneof`_ ``_log_config``.
+        name (str):
+            The name of the resource, provided by the client when
+            initially creating the resource. The name must be 1-63
+            characters long, and comply with RFC1035. Specifically, the
+            name must be 1-63 characters long and match the regular
+            expression ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the
+            first character must be a lowercase letter, and all
+            following characters must be a dash, lowercase letter, or
+            digit, except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        network (str):
+            The URL of the network to which this
+            subnetwork belongs, provided by the client when
+            initially creating the subnetwork. This field
+            can be set only at resource creation time.
+
+            This field is a member of `oneof`_ ``_network``.
+        private_ip_google_access (bool):
+            Whether the VMs in this subnet can access
+            Google services without assigned external IP
+            addresses. This field can be both set at
+            resource creation time and updated using
+            setPrivateIpGoogleAccess.
+
+            This field is a member of `oneof`_ ``_private_ip_google_access``.
+        private_ipv6_google_access (str):
+            The private IPv6 google access type for the
+            VMs in this subnet. This is an expanded field of
+            enablePrivateV6Access. If both fields are set,
+            privateIpv6GoogleAccess will take priority. This
+            field can be both set at resource creation time
+            and updated using patch. Check the
+            PrivateIpv6GoogleAccess enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_private_ipv6_google_access``.
+        purpose (str):
+            The purpose of the resource. This field can be either
+            PRIVATE_RFC_1918 or INTERNAL_HTTPS_LOAD_BALANCER. A
+            subnetwork with purpose set to INTERNAL_HTTPS_LOAD_BALANCER
+            is a user-created subnetwork that is reserved for Internal
+            HTTP(S) Load Balancing. If unspecified, the purpose defaults
+            to PRIVATE_RFC_1918. The enableFlowLogs field isn't
+            supported with the purpose field set to
+            INTERNAL_HTTPS_LOAD_BALANCER. Check the Purpose enum for the
+            list of possible values.
+
+            This field is a member of `oneof`_ ``_purpose``.
+        region (str):
+            URL of the region where the Subnetwork
+            resides. This field can be set only at resource
+            creation time.
+
+            This field is a member of `oneof`_ ``_region``.
+        role (str):
+            The role of subnetwork. Currently, this field is only used
+            when purpose = INTERNAL_HTTPS_LOAD_BALANCER. The value can
+            be set to ACTIVE or BACKUP. An ACTIVE subnetwork is one that
+            is currently being used for Internal HTTP(S) Load Balancing.
+            A BACKUP subnetwork is one that is ready to be promoted to
+            ACTIVE or is currently draining. This field can be updated
+            with a patch request. Check the Role enum for the list of
+            possible values.
+
+            This field is a member of `oneof`_ ``_role``.
+        secondary_ip_ranges (Sequence[google.cloud.compute_v1.types.SubnetworkSecondaryRange]):
+            An array of configurations for secondary IP
+            ranges for VM instances contained in this
+            subnetwork. The primary IP of such VM must
+            belong to the primary ipCidrRange of the
+            subnetwork. The alias IPs may belong to either
+            primary or secondary ranges. This field can be
+            updated with a patch request.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        stack_type (str):
+            The stack type for this subnet to identify whether the IPv6
+            feature is enabled or not. If not specified IPV4_ONLY will
+            be used. This field can be both set at resource creation
+            time and updated using patch. Check the StackType enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_stack_type``.
+        state (str):
+            [Output Only] The state of the subnetwork, which can be one
+            of the following values: READY: Subnetwork is created and
+            ready to use DRAINING: only applicable to subnetworks that
+            have the purpose set to INTERNAL_HTTPS_LOAD_BALANCER and
+            indicates that connections to the load balancer are being
+            drained. A subnetwork that is draining cannot be used or
+            modified until it reaches a status of READY Check the State
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_state``.
+    """
+
+    class Ipv6AccessType(proto.Enum):
+        r"""The access type of IPv6 address this subnet holds. It's immutable
+        and can only be specified during creation or the first time the
+        subnet is updated into IPV4_IPV6 dual stack. If the ipv6_type is
+        EXTERNAL then this subnet cannot enable direct path.
+        """
+        UNDEFINED_IPV6_ACCESS_TYPE = 0
+        EXTERNAL = 35607499
+        UNSPECIFIED_IPV6_ACCESS_TYPE = 313080613
+
+    class PrivateIpv6GoogleAccess(proto.Enum):
+        r"""The private IPv6 google access type for the VMs in this
+        subnet. This is an expanded field of enablePrivateV6Access. If
+        both fields are set, privateIpv6GoogleAccess will take priority.
+        This field can be both set at resource creation time and updated
+        using patch.
+        """
+        UNDEFINED_PRIVATE_IPV6_GOOGLE_ACCESS = 0
+        DISABLE_GOOGLE_ACCESS = 450958579
+        ENABLE_BIDIRECTIONAL_ACCESS_TO_GOOGLE = 427975994
+        ENABLE_OUTBOUND_VM_ACCESS_TO_GOOGLE = 288210263
+
+    class Purpose(proto.Enum):
+        r"""The purpose of the resource. This field can be either
+        PRIVATE_RFC_1918 or INTERNAL_HTTPS_LOAD_BALANCER. A subnetwork with
+        purpose set to INTERNAL_HTTPS_LOAD_BALANCER is a user-created
+        subnetwork that is reserved for Internal HTTP(S) Load Balancing. If
+        unspecified, the purpose defaults to PRIVATE_RFC_1918. The
+        enableFlowLogs field isn't supported with the purpose field set to
+        INTERNAL_HTTPS_LOAD_BALANCER.
+        """
+        UNDEFINED_PURPOSE = 0
+        INTERNAL_HTTPS_LOAD_BALANCER = 248748889
+        PRIVATE = 403485027
+        PRIVATE_RFC_1918 = 254902107
+        PRIVATE_SERVICE_CONNECT = 48134724
+
+    class Role(proto.Enum):
+        r"""The role of subnetwork. Currently, this field is only used when
+        purpose = INTERNAL_HTTPS_LOAD_BALANCER. The value can be set to
+        ACTIVE or BACKUP. An ACTIVE subnetwork is one that is currently
+        being used for Internal HTTP(S) Load Balancing. A BACKUP subnetwork
+        is one that is ready to be promoted to ACTIVE or is currently
+        draining. This field can be updated with a patch request.
+        """
+        UNDEFINED_ROLE = 0
+        ACTIVE = 314733318
+        BACKUP = 341010882
+
+    class StackType(proto.Enum):
+        r"""The stack type for this subnet to identify whether the IPv6 feature
+        is enabled or not. If not specified IPV4_ONLY will be used. This
+        field can be both set at resource creation time and updated using
+        patch.
+        """
+        UNDEFINED_STACK_TYPE = 0
+        IPV4_IPV6 = 22197249
+        IPV4_ONLY = 22373798
+        UNSPECIFIED_STACK_TYPE = 298084569
+
+    class State(proto.Enum):
+        r"""[Output Only] The state of the subnetwork, which can be one of the
+        following values: READY: Subnetwork is created and ready to use
+        DRAINING: only applicable to subnetworks that have the purpose set
+        to INTERNAL_HTTPS_LOAD_BALANCER and indicates that connections to
+        the load balancer are being drained. A subnetwork that is draining
+        cannot be used or modified until it reaches a status of READY
+        """
+        UNDEFINED_STATE = 0
+        DRAINING = 480455402
+        READY = 77848963
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    enable_flow_logs = proto.Field(proto.BOOL, number=151544420, optional=True,)
+    external_ipv6_prefix = proto.Field(proto.STRING, number=139299190, optional=True,)
+    fingerprint = proto.Field(proto.STRING, number=234678500, optional=True,)
+    gateway_address = proto.Field(proto.STRING, number=459867385, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+    ipv6_access_type = proto.Field(proto.STRING, number=504658653, optional=True,)
+    ipv6_cidr_range = proto.Field(proto.STRING, number=273141258, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    log_config = proto.Field(
+        proto.MESSAGE, number=351299741, optional=True, message="SubnetworkLogConfig",
+    )
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    private_ip_google_access = proto.Field(proto.BOOL, number=421491790, optional=True,)
+    private_ipv6_google_access = proto.Field(
+        proto.STRING, number=48277006, optional=True,
+    )
+    purpose = proto.Field(proto.STRING, number=316407070, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    role = proto.Field(proto.STRING, number=3506294, optional=True,)
+    secondary_ip_ranges = proto.RepeatedField(
+        proto.MESSAGE, number=136658915, message="SubnetworkSecondaryRange",
+    )
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    stack_type = proto.Field(proto.STRING, number=425908881, optional=True,)
+    state = proto.Field(proto.STRING, number=109757585, optional=True,)
+
+
+class SubnetworkAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.SubnetworkAggregatedList.ItemsEntry]):
+            A list of SubnetworksScopedList resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#subnetworkAggregatedList for aggregated lists of
+            subnetworks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=100526016, message="SubnetworksScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SubnetworkList(proto.Message):
+    r"""Contains a list of Subnetwork resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.Subnetwork]):
+            A list of Subnetwork resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#subnetworkList for lists of subnetworks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="Subnetwork",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SubnetworkLogConfig(proto.Message):
+    r"""The available logging options for this subnetwork.
+
+    Attributes:
+        aggregation_interval (str):
+            Can only be specified if VPC flow logging for
+            this subnetwork is enabled. Toggles the
+            aggregation interval for collecting flow logs.
+            Increasing the interval time will reduce the
+            amount of generated flow logs for long lasting
+            connections. Default is an interval of 5 seconds
+            per connection. Check the AggregationInterval
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_aggregation_interval``.
+        enable (bool):
+            Whether to enable flow logging for this
+            subnetwork. If this field is not explicitly set,
+            it will not appear in get listings. If not set
+            the default behavior is to disable flow logging.
+
+            This field is a member of `oneof`_ ``_enable``.
+        filter_expr (str):
+            Can only be specified if VPC flow logs for
+            this subnetwork is enabled. Export filter used
+            to define which VPC flow logs should be logged.
+
+            This field is a member of `oneof`_ ``_filter_expr``.
+        flow_sampling (float):
+            Can only be specified if VPC flow logging for this
+            subnetwork is enabled. The value of the field must be in [0,
+            1]. Set the sampling rate of VPC flow logs within the
+            subnetwork where 1.0 means all collected logs are reported
+            and 0.0 means no logs are reported. Default is 0.5, which
+            means half of all collected logs are reported.
+
+            This field is a member of `oneof`_ ``_flow_sampling``.
+        metadata (str):
+            Can only be specified if VPC flow logs for this subnetwork
+            is enabled. Configures whether all, none or a subset of
+            metadata fields should be added to the reported VPC flow
+            logs. Default is EXCLUDE_ALL_METADATA. Check the Metadata
+            enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_metadata``.
+        metadata_fields (Sequence[str]):
+            Can only be specified if VPC flow logs for this subnetwork
+            is enabled and "metadata" was set to CUSTOM_METADATA.
+    """
+
+    class AggregationInterval(proto.Enum):
+        r"""Can only be specified if VPC flow logging for this subnetwork
+        is enabled. Toggles the aggregation interval for collecting flow
+        logs. Increasing the interval time will reduce the amount of
+        generated flow logs for long lasting connections. Default is an
+        interval of 5 seconds per connection.
+        """
+        UNDEFINED_AGGREGATION_INTERVAL = 0
+        INTERVAL_10_MIN = 487155916
+        INTERVAL_15_MIN = 491773521
+        INTERVAL_1_MIN = 69052714
+        INTERVAL_30_SEC = 7548937
+        INTERVAL_5_MIN = 72746798
+        INTERVAL_5_SEC = 72752429
+
+    class Metadata(proto.Enum):
+        r"""Can only be specified if VPC flow logs for this subnetwork is
+        enabled. Configures whether all, none or a subset of metadata fields
+        should be added to the reported VPC flow logs. Default is
+        EXCLUDE_ALL_METADATA.
+        """
+        UNDEFINED_METADATA = 0
+        CUSTOM_METADATA = 62450749
+        EXCLUDE_ALL_METADATA = 334519954
+        INCLUDE_ALL_METADATA = 164619908
+
+    aggregation_interval = proto.Field(proto.STRING, number=174919042, optional=True,)
+    enable = proto.Field(proto.BOOL, number=311764355, optional=True,)
+    filter_expr = proto.Field(proto.STRING, number=183374428, optional=True,)
+    flow_sampling = proto.Field(proto.FLOAT, number=530150360, optional=True,)
+    metadata = proto.Field(proto.STRING, number=86866735, optional=True,)
+    metadata_fields = proto.RepeatedField(proto.STRING, number=378461641,)
+
+
+class SubnetworkSecondaryRange(proto.Message):
+    r"""Represents a secondary IP range of a subnetwork.
+
+    Attributes:
+        ip_cidr_range (str):
+            The range of IP addresses belonging to this
+            subnetwork secondary range. Provide this
+            property when you create the subnetwork. Ranges
+            must be unique and non-overlapping with all
+            primary and secondary IP ranges within a
+            network. Only IPv4 is supported. The range can
+            be any range listed in the Valid ranges list.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        range_name (str):
+            The name associated with this subnetwork
+            secondary range, used when adding an alias IP
+            range to a VM instance. The name must be 1-63
+            characters long, and comply with RFC1035. The
+            name must be unique within the subnetwork.
+
+            This field is a member of `oneof`_ ``_range_name``.
+    """
+
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+    range_name = proto.Field(proto.STRING, number=332216397, optional=True,)
+
+
+class SubnetworksExpandIpCidrRangeRequest(proto.Message):
+    r"""
+
+    Attributes:
+        ip_cidr_range (str):
+            The IP (in CIDR format or netmask) of
+            internal addresses that are legal on this
+            Subnetwork. This range should be disjoint from
+            other subnetworks within this network. This
+            range can only be larger than (i.e. a superset
+            of) the range previously defined before the
+            update.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+    """
+
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+
+
+class SubnetworksScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        subnetworks (Sequence[google.cloud.compute_v1.types.Subnetwork]):
+            A list of subnetworks contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            An informational warning that appears when
+            the list of addresses is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    subnetworks = proto.RepeatedField(
+        proto.MESSAGE, number=415853125, message="Subnetwork",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class SubnetworksSetPrivateIpGoogleAccessRequest(proto.Message):
+    r"""
+
+    Attributes:
+        private_ip_google_access (bool):
+
+            This field is a member of `oneof`_ ``_private_ip_google_access``.
+    """
+
+    private_ip_google_access = proto.Field(proto.BOOL, number=421491790, optional=True,)
+
+
+class TestIamPermissionsSubnetworkRequest(proto.Message):
+    r"""A request message for Subnetworks.TestIamPermissions. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            The name of the region for this request.
+        resource (str):
+            Name or id of the resource for this request.
+        test_permissions_request_resource (google.cloud.compute_v1.types.TestPermissionsRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    resource = proto.Field(proto.STRING, number=195806222,)
+    test_permissions_request_resource = proto.Field(
+        proto.MESSAGE, number=439214758, message=shared_04.TestPermissionsRequest,
+    )
+
+
+class UsableSubnetwork(proto.Message):
+    r"""Subnetwork which the current user has compute.subnetworks.use
+    permission on.
+
+    Attributes:
+        ip_cidr_range (str):
+            The range of internal addresses that are
+            owned by this subnetwork.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        network (str):
+            Network URL.
+
+            This field is a member of `oneof`_ ``_network``.
+        secondary_ip_ranges (Sequence[google.cloud.compute_v1.types.UsableSubnetworkSecondaryRange]):
+            Secondary IP ranges.
+        subnetwork (str):
+            Subnetwork URL.
+
+            This field is a member of `oneof`_ ``_subnetwork``.
+    """
+
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+    network = proto.Field(proto.STRING, number=232872494, optional=True,)
+    secondary_ip_ranges = proto.RepeatedField(
+        proto.MESSAGE, number=136658915, message="UsableSubnetworkSecondaryRange",
+    )
+    subnetwork = proto.Field(proto.STRING, number=307827694, optional=True,)
+
+
+class UsableSubnetworkSecondaryRange(proto.Message):
+    r"""Secondary IP range of a usable subnetwork.
+
+    Attributes:
+        ip_cidr_range (str):
+            The range of IP addresses belonging to this
+            subnetwork secondary range.
+
+            This field is a member of `oneof`_ ``_ip_cidr_range``.
+        range_name (str):
+            The name associated with this subnetwork
+            secondary range, used when adding an alias IP
+            range to a VM instance. The name must be 1-63
+            characters long, and comply with RFC1035. The
+            name must be unique within the subnetwork.
+
+            This field is a member of `oneof`_ ``_range_name``.
+    """
+
+    ip_cidr_range = proto.Field(proto.STRING, number=98117322, optional=True,)
+    range_name = proto.Field(proto.STRING, number=332216397, optional=True,)
+
+
+class UsableSubnetworksAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.UsableSubnetwork]):
+            [Output] A list of usable subnetwork URLs.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#usableSubnetworksAggregatedList for aggregated lists
+            of usable subnetworks.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results. In special cases
+            listUsable may return 0 subnetworks and nextPageToken which
+            still should be used to get the next page of results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="UsableSubnetwork",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
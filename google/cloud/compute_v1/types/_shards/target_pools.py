@@ -0,0 +1,911 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the target_pools service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_23
+from google.cloud.compute_v1.types._shards import shared_27
+from google.cloud.compute_v1.types._shards import shared_30
+from google.cloud.compute_v1.types._shards import shared_45
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "AddHealthCheckTargetPoolRequest",
+        "AddInstanceTargetPoolRequest",
+        "AggregatedListTargetPoolsRequest",
+        "DeleteTargetPoolRequest",
+        "GetHealthTargetPoolRequest",
+        "GetTargetPoolRequest",
+        "InsertTargetPoolRequest",
+        "ListTargetPoolsRequest",
+        "RemoveHealthCheckTargetPoolRequest",
+        "RemoveInstanceTargetPoolRequest",
+        "SetBackupTargetPoolRequest",
+        "TargetPool",
+        "TargetPoolAggregatedList",
+        "TargetPoolInstanceHealth",
+        "TargetPoolList",
+        "TargetPoolsAddHealthCheckRequest",
+        "TargetPoolsAddInstanceRequest",
+        "TargetPoolsRemoveHealthCheckRequest",
+        "TargetPoolsRemoveInstanceRequest",
+        "TargetPoolsScopedList",
+    },
+)
+
+
+class AddHealthCheckTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.AddHealthCheck. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool (str):
+            Name of the target pool to add a health check
+            to.
+        target_pools_add_health_check_request_resource (google.cloud.compute_v1.types.TargetPoolsAddHealthCheckRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+    target_pools_add_health_check_request_resource = proto.Field(
+        proto.MESSAGE, number=269573412, message="TargetPoolsAddHealthCheckRequest",
+    )
+
+
+class AddInstanceTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.AddInstance. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool (str):
+            Name of the TargetPool resource to add
+            instances to.
+        target_pools_add_instance_request_resource (google.cloud.compute_v1.types.TargetPoolsAddInstanceRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+    target_pools_add_instance_request_resource = proto.Field(
+        proto.MESSAGE, number=428796404, message="TargetPoolsAddInstanceRequest",
+    )
+
+
+class AggregatedListTargetPoolsRequest(proto.Message):
+    r"""A request message for TargetPools.AggregatedList. See the
+    method description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        include_all_scopes (bool):
+            Indicates whether every visible scope for
+            each scope type (zone, region, global) should be
+            included in the response. For new resource types
+            added after this field, the flag has no effect
+            as new resource types will always include every
+            visible scope for each scope type in response.
+            For resource types which predate this field, if
+            this flag is omitted or false, only scopes of
+            the scope types where the resource type is
+            expected to be found will be included.
+
+            This field is a member of `oneof`_ ``_include_all_scopes``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    include_all_scopes = proto.Field(proto.BOOL, number=391327988, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class DeleteTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool (str):
+            Name of the TargetPool resource to delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+
+
+class GetHealthTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.GetHealth. See the method
+    description for details.
+
+    Attributes:
+        instance_reference_resource (google.cloud.compute_v1.types.InstanceReference):
+            The body resource for this request
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        target_pool (str):
+            Name of the TargetPool resource to which the
+            queried instance belongs.
+    """
+
+    instance_reference_resource = proto.Field(
+        proto.MESSAGE, number=292926060, message=shared_45.InstanceReference,
+    )
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+
+
+class GetTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        target_pool (str):
+            Name of the TargetPool resource to return.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+
+
+class InsertTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool_resource (google.cloud.compute_v1.types.TargetPool):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool_resource = proto.Field(
+        proto.MESSAGE, number=101281443, message="TargetPool",
+    )
+
+
+class ListTargetPoolsRequest(proto.Message):
+    r"""A request message for TargetPools.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class RemoveHealthCheckTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.RemoveHealthCheck. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool (str):
+            Name of the target pool to remove health
+            checks from.
+        target_pools_remove_health_check_request_resource (google.cloud.compute_v1.types.TargetPoolsRemoveHealthCheckRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+    target_pools_remove_health_check_request_resource = proto.Field(
+        proto.MESSAGE, number=304985011, message="TargetPoolsRemoveHealthCheckRequest",
+    )
+
+
+class RemoveInstanceTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.RemoveInstance. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool (str):
+            Name of the TargetPool resource to remove
+            instances from.
+        target_pools_remove_instance_request_resource (google.cloud.compute_v1.types.TargetPoolsRemoveInstanceRequest):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+    target_pools_remove_instance_request_resource = proto.Field(
+        proto.MESSAGE, number=29548547, message="TargetPoolsRemoveInstanceRequest",
+    )
+
+
+class SetBackupTargetPoolRequest(proto.Message):
+    r"""A request message for TargetPools.SetBackup. See the method
+    description for details.
+
+    Attributes:
+        failover_ratio (float):
+            New failoverRatio value for the target pool.
+
+            This field is a member of `oneof`_ ``_failover_ratio``.
+        project (str):
+            Project ID for this request.
+        region (str):
+            Name of the region scoping this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_pool (str):
+            Name of the TargetPool resource to set a
+            backup pool for.
+        target_reference_resource (google.cloud.compute_v1.types.TargetReference):
+            The body resource for this request
+    """
+
+    failover_ratio = proto.Field(proto.FLOAT, number=212667006, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    region = proto.Field(proto.STRING, number=138946292,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_pool = proto.Field(proto.STRING, number=62796298,)
+    target_reference_resource = proto.Field(
+        proto.MESSAGE, number=523721712, message=shared_27.TargetReference,
+    )
+
+
+class TargetPool(proto.Message):
+    r"""Represents a Target Pool resource. Target pools are used for
+    network TCP/UDP load balancing. A target pool references member
+    instances, an associated legacy HttpHealthCheck resource, and,
+    optionally, a backup target pool. For more information, read
+    Using target pools.
+
+    Attributes:
+        backup_pool (str):
+            The server-defined URL for the resource. This field is
+            applicable only when the containing target pool is serving a
+            forwarding rule as the primary pool, and its failoverRatio
+            field is properly set to a value between [0, 1]. backupPool
+            and failoverRatio together define the fallback behavior of
+            the primary target pool: if the ratio of the healthy
+            instances in the primary pool is at or below failoverRatio,
+            traffic arriving at the load-balanced IP will be directed to
+            the backup pool. In case where failoverRatio and backupPool
+            are not set, or all the instances in the backup pool are
+            unhealthy, the traffic will be directed back to the primary
+            pool in the "force" mode, where traffic will be spread to
+            the healthy instances with the best effort, or to all
+            instances when no instance is healthy.
+
+            This field is a member of `oneof`_ ``_backup_pool``.
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        failover_ratio (float):
+            This field is applicable only when the containing target
+            pool is serving a forwarding rule as the primary pool (i.e.,
+            not as a backup pool to some other target pool). The value
+            of the field must be in [0, 1]. If set, backupPool must also
+            be set. They together define the fallback behavior of the
+            primary target pool: if the ratio of the healthy instances
+            in the primary pool is at or below this number, traffic
+            arriving at the load-balanced IP will be directed to the
+            backup pool. In case where failoverRatio is not set or all
+            the instances in the backup pool are unhealthy, the traffic
+            will be directed back to the primary pool in the "force"
+            mode, where traffic will be spread to the healthy instances
+            with the best effort, or to all instances when no instance
+            is healthy.
+
+            This field is a member of `oneof`_ ``_failover_ratio``.
+        health_checks (Sequence[str]):
+            The URL of the HttpHealthCheck resource. A
+            member instance in this pool is considered
+            healthy if and only if the health checks pass.
+            Only legacy HttpHealthChecks are supported. Only
+            one health check may be specified.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        instances (Sequence[str]):
+            A list of resource URLs to the virtual
+            machine instances serving this pool. They must
+            live in zones contained in the same region as
+            this pool.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#targetPool for target pools.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        region (str):
+            [Output Only] URL of the region where the target pool
+            resides.
+
+            This field is a member of `oneof`_ ``_region``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        session_affinity (str):
+            Session affinity option, must be one of the following
+            values: NONE: Connections from the same client IP may go to
+            any instance in the pool. CLIENT_IP: Connections from the
+            same client IP will go to the same instance in the pool
+            while that instance remains healthy. CLIENT_IP_PROTO:
+            Connections from the same client IP with the same IP
+            protocol will go to the same instance in the pool while that
+            instance remains healthy. Check the SessionAffinity enum for
+            the list of possible values.
+
+            This field is a member of `oneof`_ ``_session_affinity``.
+    """
+
+    class SessionAffinity(proto.Enum):
+        r"""Session affinity option, must be one of the following values: NONE:
+        Connections from the same client IP may go to any instance in the
+        pool. CLIENT_IP: Connections from the same client IP will go to the
+        same instance in the pool while that instance remains healthy.
+        CLIENT_IP_PROTO: Connections from the same client IP with the same
+        IP protocol will go to the same instance in the pool while that
+        instance remains healthy.
+        """
+        UNDEFINED_SESSION_AFFINITY = 0
+        CLIENT_IP = 345665051
+        CLIENT_IP_NO_DESTINATION = 106122516
+        CLIENT_IP_PORT_PROTO = 221722926
+        CLIENT_IP_PROTO = 25322148
+        GENERATED_COOKIE = 370321204
+        HEADER_FIELD = 200737960
+        HTTP_COOKIE = 494981627
+        NONE = 2402104
+
+    backup_pool = proto.Field(proto.STRING, number=45884537, optional=True,)
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    failover_ratio = proto.Field(proto.FLOAT, number=212667006, optional=True,)
+    health_checks = proto.RepeatedField(proto.STRING, number=448370606,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    instances = proto.RepeatedField(proto.STRING, number=29097598,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    region = proto.Field(proto.STRING, number=138946292, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    session_affinity = proto.Field(proto.STRING, number=463888561, optional=True,)
+
+
+class TargetPoolAggregatedList(proto.Message):
+    r"""
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.TargetPoolAggregatedList.ItemsEntry]):
+            A list of TargetPool resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#targetPoolAggregatedList for aggregated lists of
+            target pools.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        unreachables (Sequence[str]):
+            [Output Only] Unreachable resources.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.MapField(
+        proto.STRING, proto.MESSAGE, number=100526016, message="TargetPoolsScopedList",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    unreachables = proto.RepeatedField(proto.STRING, number=243372063,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class TargetPoolInstanceHealth(proto.Message):
+    r"""
+
+    Attributes:
+        health_status (Sequence[google.cloud.compute_v1.types.HealthStatus]):
+
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#targetPoolInstanceHealth when checking the health of
+            an instance.
+
+            This field is a member of `oneof`_ ``_kind``.
+    """
+
+    health_status = proto.RepeatedField(
+        proto.MESSAGE, number=380545845, message=shared_23.HealthStatus,
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+
+
+class TargetPoolList(proto.Message):
+    r"""Contains a list of TargetPool resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.TargetPool]):
+            A list of TargetPool resources.
+        kind (str):
+            [Output Only] Type of resource. Always
+            compute#targetPoolList for lists of target pools.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(proto.MESSAGE, number=100526016, message="TargetPool",)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+class TargetPoolsAddHealthCheckRequest(proto.Message):
+    r"""
+
+    Attributes:
+        health_checks (Sequence[google.cloud.compute_v1.types.HealthCheckReference]):
+            The HttpHealthCheck to add to the target
+            pool.
+    """
+
+    health_checks = proto.RepeatedField(
+        proto.MESSAGE, number=448370606, message=shared_30.HealthCheckReference,
+    )
+
+
+class TargetPoolsAddInstanceRequest(proto.Message):
+    r"""
+
+    Attributes:
+        instances (Sequence[google.cloud.compute_v1.types.InstanceReference]):
+            A full or partial URL to an instance to add
+            to this target pool. This can be a full or
+            partial URL. For example, the following are
+            valid URLs: -
+            https://www.googleapis.com/compute/v1/projects/project-
+            id/zones/zone /instances/instance-name -
+            projects/project-
+            id/zones/zone/instances/instance-name -
+            zones/zone/instances/instance-name
+    """
+
+    instances = proto.RepeatedField(
+        proto.MESSAGE, number=29097598, message=shared_45.InstanceReference,
+    )
+
+
+class TargetPoolsRemoveHealthCheckRequest(proto.Message):
+    r"""
+
+    Attributes:
+        health_checks (Sequence[google.cloud.compute_v1.types.HealthCheckReference]):
+            Health check URL to be removed. This can be a
+            full or valid partial URL. For example, the
+            following are valid URLs: -
+            https://www.googleapis.com/compute/beta/projects/project
+            /global/httpHealthChecks/health-check -
+            projects/project/global/httpHealthChecks/health-
+            check - global/httpHealthChecks/health-check
+    """
+
+    health_checks = proto.RepeatedField(
+        proto.MESSAGE, number=448370606, message=shared_30.HealthCheckReference,
+    )
+
+
+class TargetPoolsRemoveInstanceRequest(proto.Message):
+    r"""
+
+    Attributes:
+        instances (Sequence[google.cloud.compute_v1.types.InstanceReference]):
+            URLs of the instances to be removed from
+            target pool.
+    """
+
+    instances = proto.RepeatedField(
+        proto.MESSAGE, number=29097598, message=shared_45.InstanceReference,
+    )
+
+
+class TargetPoolsScopedList(proto.Message):
+    r"""
+
+    Attributes:
+        target_pools (Sequence[google.cloud.compute_v1.types.TargetPool]):
+            A list of target pools contained in this
+            scope.
+        warning (google.cloud.compute_v1.types.Warning):
+            Informational warning which replaces the list
+            of addresses when the list is empty.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    target_pools = proto.RepeatedField(
+        proto.MESSAGE, number=336072617, message="TargetPool",
+    )
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
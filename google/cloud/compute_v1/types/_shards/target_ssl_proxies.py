@@ -0,0 +1,563 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Messages of the target_ssl_proxies service."""
+
+import proto  # type: ignore
+
+from google.cloud.compute_v1.types._shards import shared_02
+from google.cloud.compute_v1.types._shards import shared_55
+
+
+__protobuf__ = proto.module(
+    package="google.cloud.compute.v1",
+    manifest={
+        "DeleteTargetSslProxyRequest",
+        "GetTargetSslProxyRequest",
+        "InsertTargetSslProxyRequest",
+        "ListTargetSslProxiesRequest",
+        "SetBackendServiceTargetSslProxyRequest",
+        "SetProxyHeaderTargetSslProxyRequest",
+        "SetSslCertificatesTargetSslProxyRequest",
+        "SetSslPolicyTargetSslProxyRequest",
+        "TargetSslProxiesSetBackendServiceRequest",
+        "TargetSslProxiesSetProxyHeaderRequest",
+        "TargetSslProxiesSetSslCertificatesRequest",
+        "TargetSslProxy",
+        "TargetSslProxyList",
+    },
+)
+
+
+class DeleteTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.Delete. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_ssl_proxy (str):
+            Name of the TargetSslProxy resource to
+            delete.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_ssl_proxy = proto.Field(proto.STRING, number=338795853,)
+
+
+class GetTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.Get. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        target_ssl_proxy (str):
+            Name of the TargetSslProxy resource to
+            return.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    target_ssl_proxy = proto.Field(proto.STRING, number=338795853,)
+
+
+class InsertTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.Insert. See the method
+    description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_ssl_proxy_resource (google.cloud.compute_v1.types.TargetSslProxy):
+            The body resource for this request
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_ssl_proxy_resource = proto.Field(
+        proto.MESSAGE, number=142016192, message="TargetSslProxy",
+    )
+
+
+class ListTargetSslProxiesRequest(proto.Message):
+    r"""A request message for TargetSslProxies.List. See the method
+    description for details.
+
+    Attributes:
+        filter (str):
+            A filter expression that filters resources listed in the
+            response. The expression must specify the field name, a
+            comparison operator, and the value that you want to use for
+            filtering. The value must be a string, a number, or a
+            boolean. The comparison operator must be either ``=``,
+            ``!=``, ``>``, or ``<``. For example, if you are filtering
+            Compute Engine instances, you can exclude instances named
+            ``example-instance`` by specifying
+            ``name != example-instance``. You can also filter nested
+            fields. For example, you could specify
+            ``scheduling.automaticRestart = false`` to include instances
+            only if they are not scheduled for automatic restarts. You
+            can use filtering on nested fields to filter based on
+            resource labels. To filter on multiple expressions, provide
+            each separate expression within parentheses. For example:
+            ``(scheduling.automaticRestart = true) (cpuPlatform = "Intel Skylake")``
+            By default, each expression is an ``AND`` expression.
+            However, you can include ``AND`` and ``OR`` expressions
+            explicitly. For example:
+            ``(cpuPlatform = "Intel Skylake") OR (cpuPlatform = "Intel Broadwell") AND (scheduling.automaticRestart = true)``
+
+            This field is a member of `oneof`_ ``_filter``.
+        max_results (int):
+            The maximum number of results per page that should be
+            returned. If the number of available results is larger than
+            ``maxResults``, Compute Engine returns a ``nextPageToken``
+            that can be used to get the next page of results in
+            subsequent list requests. Acceptable values are ``0`` to
+            ``500``, inclusive. (Default: ``500``)
+
+            This field is a member of `oneof`_ ``_max_results``.
+        order_by (str):
+            Sorts list results by a certain order. By default, results
+            are returned in alphanumerical order based on the resource
+            name. You can also sort results in descending order based on
+            the creation timestamp using
+            ``orderBy="creationTimestamp desc"``. This sorts results
+            based on the ``creationTimestamp`` field in reverse
+            chronological order (newest result first). Use this to sort
+            resources like operations so that the newest operation is
+            returned first. Currently, only sorting by ``name`` or
+            ``creationTimestamp desc`` is supported.
+
+            This field is a member of `oneof`_ ``_order_by``.
+        page_token (str):
+            Specifies a page token to use. Set ``pageToken`` to the
+            ``nextPageToken`` returned by a previous list request to get
+            the next page of results.
+
+            This field is a member of `oneof`_ ``_page_token``.
+        project (str):
+            Project ID for this request.
+        return_partial_success (bool):
+            Opt-in for partial success behavior which
+            provides partial results in case of failure. The
+            default value is false.
+
+            This field is a member of `oneof`_ ``_return_partial_success``.
+    """
+
+    filter = proto.Field(proto.STRING, number=336120696, optional=True,)
+    max_results = proto.Field(proto.UINT32, number=54715419, optional=True,)
+    order_by = proto.Field(proto.STRING, number=160562920, optional=True,)
+    page_token = proto.Field(proto.STRING, number=19994697, optional=True,)
+    project = proto.Field(proto.STRING, number=227560217,)
+    return_partial_success = proto.Field(proto.BOOL, number=517198390, optional=True,)
+
+
+class SetBackendServiceTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.SetBackendService. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_ssl_proxies_set_backend_service_request_resource (google.cloud.compute_v1.types.TargetSslProxiesSetBackendServiceRequest):
+            The body resource for this request
+        target_ssl_proxy (str):
+            Name of the TargetSslProxy resource whose
+            BackendService resource is to be set.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_ssl_proxies_set_backend_service_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=139080868,
+        message="TargetSslProxiesSetBackendServiceRequest",
+    )
+    target_ssl_proxy = proto.Field(proto.STRING, number=338795853,)
+
+
+class SetProxyHeaderTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.SetProxyHeader. See
+    the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_ssl_proxies_set_proxy_header_request_resource (google.cloud.compute_v1.types.TargetSslProxiesSetProxyHeaderRequest):
+            The body resource for this request
+        target_ssl_proxy (str):
+            Name of the TargetSslProxy resource whose
+            ProxyHeader is to be set.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_ssl_proxies_set_proxy_header_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=205284526,
+        message="TargetSslProxiesSetProxyHeaderRequest",
+    )
+    target_ssl_proxy = proto.Field(proto.STRING, number=338795853,)
+
+
+class SetSslCertificatesTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.SetSslCertificates.
+    See the method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        target_ssl_proxies_set_ssl_certificates_request_resource (google.cloud.compute_v1.types.TargetSslProxiesSetSslCertificatesRequest):
+            The body resource for this request
+        target_ssl_proxy (str):
+            Name of the TargetSslProxy resource whose
+            SslCertificate resource is to be set.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    target_ssl_proxies_set_ssl_certificates_request_resource = proto.Field(
+        proto.MESSAGE,
+        number=147940797,
+        message="TargetSslProxiesSetSslCertificatesRequest",
+    )
+    target_ssl_proxy = proto.Field(proto.STRING, number=338795853,)
+
+
+class SetSslPolicyTargetSslProxyRequest(proto.Message):
+    r"""A request message for TargetSslProxies.SetSslPolicy. See the
+    method description for details.
+
+    Attributes:
+        project (str):
+            Project ID for this request.
+        request_id (str):
+            An optional request ID to identify requests.
+            Specify a unique request ID so that if you must
+            retry your request, the server will know to
+            ignore the request if it has already been
+            completed. For example, consider a situation
+            where you make an initial request and the
+            request times out. If you make the request again
+            with the same request ID, the server can check
+            if original operation with the same request ID
+            was received, and if so, will ignore the second
+            request. This prevents clients from accidentally
+            creating duplicate commitments. The request ID
+            must be a valid UUID with the exception that
+            zero UUID is not supported (
+            00000000-0000-0000-0000-000000000000).
+
+            This field is a member of `oneof`_ ``_request_id``.
+        ssl_policy_reference_resource (google.cloud.compute_v1.types.SslPolicyReference):
+            The body resource for this request
+        target_ssl_proxy (str):
+            Name of the TargetSslProxy resource whose SSL
+            policy is to be set. The name must be 1-63
+            characters long, and comply with RFC1035.
+    """
+
+    project = proto.Field(proto.STRING, number=227560217,)
+    request_id = proto.Field(proto.STRING, number=37109963, optional=True,)
+    ssl_policy_reference_resource = proto.Field(
+        proto.MESSAGE, number=235403836, message=shared_55.SslPolicyReference,
+    )
+    target_ssl_proxy = proto.Field(proto.STRING, number=338795853,)
+
+
+class TargetSslProxiesSetBackendServiceRequest(proto.Message):
+    r"""
+
+    Attributes:
+        service (str):
+            The URL of the new BackendService resource
+            for the targetSslProxy.
+
+            This field is a member of `oneof`_ ``_service``.
+    """
+
+    service = proto.Field(proto.STRING, number=373540533, optional=True,)
+
+
+class TargetSslProxiesSetProxyHeaderRequest(proto.Message):
+    r"""
+
+    Attributes:
+        proxy_header (str):
+            The new type of proxy header to append before sending data
+            to the backend. NONE or PROXY_V1 are allowed. Check the
+            ProxyHeader enum for the list of possible values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+    """
+
+    class ProxyHeader(proto.Enum):
+        r"""The new type of proxy header to append before sending data to the
+        backend. NONE or PROXY_V1 are allowed.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+
+
+class TargetSslProxiesSetSslCertificatesRequest(proto.Message):
+    r"""
+
+    Attributes:
+        ssl_certificates (Sequence[str]):
+            New set of URLs to SslCertificate resources
+            to associate with this TargetSslProxy. At least
+            one SSL certificate must be specified.
+            Currently, you may specify up to 15 SSL
+            certificates.
+    """
+
+    ssl_certificates = proto.RepeatedField(proto.STRING, number=366006543,)
+
+
+class TargetSslProxy(proto.Message):
+    r"""Represents a Target SSL Proxy resource. A target SSL proxy is
+    a component of a SSL Proxy load balancer. Global forwarding
+    rules reference a target SSL proxy, and the target proxy then
+    references an external backend service. For more information,
+    read Using Target Proxies.
+
+    Attributes:
+        creation_timestamp (str):
+            [Output Only] Creation timestamp in RFC3339 text format.
+
+            This field is a member of `oneof`_ ``_creation_timestamp``.
+        description (str):
+            An optional description of this resource.
+            Provide this property when you create the
+            resource.
+
+            This field is a member of `oneof`_ ``_description``.
+        id (int):
+            [Output Only] The unique identifier for the resource. This
+            identifier is defined by the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        kind (str):
+            [Output Only] Type of the resource. Always
+            compute#targetSslProxy for target SSL proxies.
+
+            This field is a member of `oneof`_ ``_kind``.
+        name (str):
+            Name of the resource. Provided by the client when the
+            resource is created. The name must be 1-63 characters long,
+            and comply with RFC1035. Specifically, the name must be 1-63
+            characters long and match the regular expression
+            ``[a-z]([-a-z0-9]*[a-z0-9])?`` which means the first
+            character must be a lowercase letter, and all following
+            characters must be a dash, lowercase letter, or digit,
+            except the last character, which cannot be a dash.
+
+            This field is a member of `oneof`_ ``_name``.
+        proxy_header (str):
+            Specifies the type of proxy header to append before sending
+            data to the backend, either NONE or PROXY_V1. The default is
+            NONE. Check the ProxyHeader enum for the list of possible
+            values.
+
+            This field is a member of `oneof`_ ``_proxy_header``.
+        self_link (str):
+            [Output Only] Server-defined URL for the resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        service (str):
+            URL to the BackendService resource.
+
+            This field is a member of `oneof`_ ``_service``.
+        ssl_certificates (Sequence[str]):
+            URLs to SslCertificate resources that are used to
+            authenticate connections to Backends. At least one SSL
+            certificate must be specified. Currently, you may specify up
+            to 15 SSL certificates. sslCertificates do not apply when
+            the load balancing scheme is set to INTERNAL_SELF_MANAGED.
+        ssl_policy (str):
+            URL of SslPolicy resource that will be
+            associated with the TargetSslProxy resource. If
+            not set, the TargetSslProxy resource will not
+            have any SSL policy configured.
+
+            This field is a member of `oneof`_ ``_ssl_policy``.
+    """
+
+    class ProxyHeader(proto.Enum):
+        r"""Specifies the type of proxy header to append before sending data to
+        the backend, either NONE or PROXY_V1. The default is NONE.
+        """
+        UNDEFINED_PROXY_HEADER = 0
+        NONE = 2402104
+        PROXY_V1 = 334352940
+
+    creation_timestamp = proto.Field(proto.STRING, number=30525366, optional=True,)
+    description = proto.Field(proto.STRING, number=422937596, optional=True,)
+    id = proto.Field(proto.UINT64, number=3355, optional=True,)
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    name = proto.Field(proto.STRING, number=3373707, optional=True,)
+    proxy_header = proto.Field(proto.STRING, number=160374142, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    service = proto.Field(proto.STRING, number=373540533, optional=True,)
+    ssl_certificates = proto.RepeatedField(proto.STRING, number=366006543,)
+    ssl_policy = proto.Field(proto.STRING, number=295190213, optional=True,)
+
+
+class TargetSslProxyList(proto.Message):
+    r"""Contains a list of TargetSslProxy resources.
+
+    Attributes:
+        id (str):
+            [Output Only] Unique identifier for the resource; defined by
+            the server.
+
+            This field is a member of `oneof`_ ``_id``.
+        items (Sequence[google.cloud.compute_v1.types.TargetSslProxy]):
+            A list of TargetSslProxy resources.
+        kind (str):
+            Type of resource.
+
+            This field is a member of `oneof`_ ``_kind``.
+        next_page_token (str):
+            [Output Only] This token allows you to get the next page of
+            results for list requests. If the number of results is
+            larger than maxResults, use the nextPageToken as a value for
+            the query parameter pageToken in the next list request.
+            Subsequent list requests will have their own nextPageToken
+            to continue paging through the results.
+
+            This field is a member of `oneof`_ ``_next_page_token``.
+        self_link (str):
+            [Output Only] Server-defined URL for this resource.
+
+            This field is a member of `oneof`_ ``_self_link``.
+        warning (google.cloud.compute_v1.types.Warning):
+            [Output Only] Informational warning message.
+
+            This field is a member of `oneof`_ ``_warning``.
+    """
+
+    @property
+    def raw_page(self):
+        return self
+
+    id = proto.Field(proto.STRING, number=3355, optional=True,)
+    items = proto.RepeatedField(
+        proto.MESSAGE, number=100526016, message="TargetSslProxy",
+    )
+    kind = proto.Field(proto.STRING, number=3292052, optional=True,)
+    next_page_token = proto.Field(proto.STRING, number=79797525, optional=True,)
+    self_link = proto.Field(proto.STRING, number=456214797, optional=True,)
+    warning = proto.Field(
+        proto.MESSAGE, number=50704284, optional=True, message=shared_02.Warning,
+    )
+
+
+__all__ = tuple(sorted(__protobuf__.manifest))
@@ -44,10 +44,16 @@ setuptools.setup(
     platforms="Posix; MacOS X; Windows",
     include_package_data=True,
     install_requires=(
-        "google-api-core[grpc] >= 2.2.0, <3.0.0dev",
+        "google-api-core[grpc] >= 2.11.0, <3.0.0dev",
         "proto-plus >= 1.19.7",
         "dataclasses >= 0.6; python_version < '3.7'",
     ),
+    extras_require={
+        "async_rest": ["aiohttp >= 3.6.2, < 4.0.0dev"],
+        "orjson": ["orjson >= 3.0.0"],
+        "arrow": ["pyarrow >= 3.0.0"],
+        "numpy": ["numpy >= 1.17.0"],
+    },
     python_requires=">=3.6",
     classifiers=[
         "Development Status :: 5 - Production/Stable",
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import mock
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud.compute_v1 import _async_session
+
+
+class _FakeResponse:
+    def __init__(self, status, content=b"{}"):
+        self.status = status
+        self.headers = {}
+        self.url = "https://compute.googleapis.com/x"
+        self._content = content
+
+    async def read(self):
+        return self._content
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _FakeSession:
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self.calls = []
+
+    def request(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs))
+        return self._responses.pop(0)
+
+
+def _make_session(credentials, *responses):
+    session = _async_session.AsyncAuthorizedSession(credentials)
+    session._session = _FakeSession(*responses)
+    return session
+
+
+def test_async_response_maps_to_api_error():
+    response = _async_session.AsyncResponse(
+        404,
+        {},
+        b'{"error": {"message": "missing"}}',
+        "GET",
+        "https://compute.googleapis.com/x",
+    )
+    assert response.json() == {"error": {"message": "missing"}}
+    assert response.text == '{"error": {"message": "missing"}}'
+
+    error = core_exceptions.from_http_response(response)
+    assert isinstance(error, core_exceptions.NotFound)
+    assert "GET https://compute.googleapis.com/x: missing" in str(error)
+
+
+def test_stringify_params():
+    params = [("returnPartialSuccess", True), ("flag", False), ("maxResults", 5)]
+    assert _async_session._stringify_params(params) == [
+        ("returnPartialSuccess", "true"),
+        ("flag", "false"),
+        ("maxResults", 5),
+    ]
+    assert _async_session._stringify_params([]) == []
+
+
+@pytest.mark.asyncio
+async def test_request_applies_credentials():
+    pytest.importorskip("aiohttp")
+    credentials = mock.Mock(spec=ga_credentials.Credentials, valid=True, token="t")
+    session = _make_session(credentials, _FakeResponse(200, b'{"name": "z"}'))
+
+    response = await session.get(
+        "https://compute.googleapis.com/x", headers={"Content-Type": "application/json"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"name": "z"}
+    assert response.request.method == "GET"
+    credentials.apply.assert_called_once_with({"Content-Type": "application/json"})
+    credentials.refresh.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_request_refreshes_on_unauthorized():
+    pytest.importorskip("aiohttp")
+    credentials = mock.Mock(spec=ga_credentials.Credentials, valid=True, token="t")
+
+    def refresh(request):
+        credentials.token = "fresh"
+
+    credentials.refresh.side_effect = refresh
+    session = _make_session(credentials, _FakeResponse(401), _FakeResponse(200))
+
+    response = await session.post("https://compute.googleapis.com/x", data="{}")
+
+    assert response.status_code == 200
+    assert credentials.refresh.call_count == 1
+    assert len(session._session.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_gives_up_after_max_refresh_attempts():
+    pytest.importorskip("aiohttp")
+    credentials = mock.Mock(spec=ga_credentials.Credentials, valid=True, token=None)
+    session = _make_session(
+        credentials, _FakeResponse(401), _FakeResponse(401), _FakeResponse(401)
+    )
+
+    response = await session.get("https://compute.googleapis.com/x")
+
+    assert response.status_code == 401
+    assert credentials.refresh.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_close_is_idempotent():
+    session = _async_session.AsyncAuthorizedSession(
+        ga_credentials.AnonymousCredentials()
+    )
+    await session.close()
+
+    inner = mock.Mock()
+    inner.close = mock.AsyncMock()
+    session._session = inner
+    async with session:
+        pass
+    inner.close.assert_awaited_once()
+    assert session._session is None
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+from importlib import metadata
+
+import mock
+import pytest
+
+from google.cloud.compute_v1 import _client_info
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    _client_info.gapic_version.cache_clear()
+    yield
+    _client_info.gapic_version.cache_clear()
+
+
+def test_gapic_version():
+    with mock.patch.object(metadata, "version", return_value="1.2.3") as version:
+        assert _client_info.gapic_version() == "1.2.3"
+        assert _client_info.gapic_version() == "1.2.3"
+    version.assert_called_once_with("google-cloud-compute")
+
+
+def test_gapic_version_not_installed():
+    with mock.patch.object(
+        metadata, "version", side_effect=metadata.PackageNotFoundError
+    ):
+        assert _client_info.gapic_version() is None
+
+
+def test_client_info_resolves_version_on_use():
+    with mock.patch.object(metadata, "version", return_value="1.2.3") as version:
+        client_info = _client_info.ClientInfo(rest_version="2.0")
+        version.assert_not_called()
+        assert client_info.gapic_version == "1.2.3"
+        assert "gapic/1.2.3" in client_info.to_user_agent()
+        assert "rest/2.0" in client_info.to_user_agent()
+
+
+def test_client_info_explicit_version():
+    client_info = _client_info.ClientInfo(gapic_version="4.5.6")
+    assert client_info.gapic_version == "4.5.6"
+    client_info.gapic_version = None
+    with mock.patch.object(metadata, "version", return_value="1.2.3"):
+        assert client_info.gapic_version == "1.2.3"
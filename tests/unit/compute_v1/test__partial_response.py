@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.cloud.compute_v1 import _partial_response
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.types import compute
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ("name", "name"),
+        ("name, status", "name,status"),
+        (["name", "metadata(items)"], "name,metadata(items)"),
+        (("disks/source",), "disks/source"),
+    ],
+)
+def test_format_fields(fields, expected):
+    assert _partial_response.format_fields(fields) == expected
+
+
+@pytest.mark.parametrize(
+    "fields, expected",
+    [
+        ("items(name,status)", "items(name,status),nextPageToken"),
+        ("items/*/instances(name)", "items/*/instances(name),nextPageToken"),
+        ("items(name),nextPageToken", "items(name),nextPageToken"),
+        ("nextPageToken,items/name", "nextPageToken,items/name"),
+        ("*", "*"),
+    ],
+)
+def test_format_fields_paged(fields, expected):
+    assert _partial_response.format_fields(fields, paged=True) == expected
+
+
+@pytest.mark.parametrize("fields", ["", "name,", "items(name", "items)name(", []])
+def test_format_fields_invalid(fields):
+    with pytest.raises(ValueError):
+        _partial_response.format_fields(fields)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_projected_payload(lazy):
+    # The response to fields=items/*/instances(name,status),nextPageToken.
+    payload = (
+        b'{"items": {"zones/us-central1-a": {"instances": '
+        b'[{"name": "vm", "status": "RUNNING"}]}, "zones/us-east1-b": {}}, '
+        b'"nextPageToken": "abc"}'
+    )
+    page = response_decoding.from_json(
+        compute.InstanceAggregatedList, payload, lazy=lazy
+    )
+    assert page.next_page_token == "abc"
+    assert page.items["zones/us-east1-b"].instances == []
+    (instance,) = page.items["zones/us-central1-a"].instances
+    assert (instance.name, instance.status, instance.zone) == ("vm", "RUNNING", "")
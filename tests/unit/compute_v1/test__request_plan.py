@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+import pytest
+
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1.types import compute
+
+
+ZONE_URI = "/compute/v1/projects/{project}/zones/{zone}"
+
+
+def _plan(request_type, uri, body=None, **kwargs):
+    http_option = {"method": "post" if body else "get", "uri": uri}
+    if body:
+        http_option["body"] = body
+    return _request_plan.RequestPlan(request_type, [http_option], **kwargs)
+
+
+def test_expand():
+    plan = _plan(compute.GetInstanceRequest, ZONE_URI + "/instances/{instance}")
+    request = compute.GetInstanceRequest(
+        project="my project", zone="us-central1-a", instance="vm:1"
+    )
+
+    assert plan.expand(request) == (
+        "get",
+        "/compute/v1/projects/my%20project/zones/us-central1-a/instances/vm%3A1",
+        None,
+    )
+    assert plan.query_params(request) == []
+
+
+def test_expand_body():
+    plan = _plan(
+        compute.InsertInstanceRequest,
+        ZONE_URI + "/instances",
+        body="instance_resource",
+    )
+    request = compute.InsertInstanceRequest(
+        project="p",
+        zone="z",
+        request_id="r",
+        instance_resource=compute.Instance(name="vm", can_ip_forward=False),
+    )
+
+    method, uri, body = plan.expand(request)
+    assert method == "post"
+    assert uri == "/compute/v1/projects/p/zones/z/instances"
+    assert json.loads(body) == {"name": "vm", "canIpForward": False}
+    assert plan.query_params(request) == [("requestId", "r")]
+
+
+@pytest.mark.parametrize(
+    "request_init",
+    [
+        {"project": "p"},
+        {"project": "p", "zone": ""},
+        {"project": "p", "zone": "a/b"},
+        {"project": "p", "zone": "z"},
+    ],
+)
+def test_expand_no_match(request_init):
+    plan = _plan(
+        compute.InsertInstanceRequest,
+        ZONE_URI + "/instances",
+        body="instance_resource",
+    )
+
+    with pytest.raises(ValueError) as exc:
+        plan.expand(compute.InsertInstanceRequest(request_init))
+    assert 'field: "zone", pattern: "*"' in str(exc.value)
+
+
+def test_expand_unsupported_template():
+    plan = _plan(compute.GetInstanceRequest, "/v1/{name=projects/*}")
+    with pytest.raises(ValueError):
+        plan.expand(compute.GetInstanceRequest())
+
+
+def test_query_params_encoding():
+    plan = _plan(compute.ListInstancesRequest, ZONE_URI + "/instances")
+    request = compute.ListInstancesRequest(
+        project="p",
+        zone="z",
+        filter="name = vm",
+        max_results=0,
+        order_by="",
+        return_partial_success=False,
+    )
+
+    # Optional fields are sent when set, even to their default value, in
+    # field number order like the JSON encoding.
+    assert plan.query_params(request) == [
+        ("maxResults", 0),
+        ("orderBy", ""),
+        ("filter", "name = vm"),
+        ("returnPartialSuccess", False),
+    ]
+
+
+def test_query_params_scalar_types():
+    int64_plan = _plan(
+        compute.GetSerialPortOutputInstanceRequest,
+        ZONE_URI + "/instances/{instance}/serialPort",
+    )
+    request = compute.GetSerialPortOutputInstanceRequest(
+        project="p", zone="z", instance="i", port=2, start=12345678901
+    )
+    assert int64_plan.query_params(request) == [
+        ("port", 2),
+        ("start", "12345678901"),
+    ]
+
+    float_plan = _plan(
+        compute.SetBackupTargetPoolRequest,
+        "/compute/v1/projects/{project}/regions/{region}/targetPools/{target_pool}/setBackup",
+        body="target_reference_resource",
+    )
+    request = compute.SetBackupTargetPoolRequest(failover_ratio=0.1)
+    assert float_plan.query_params(request) == [("failoverRatio", 0.1)]
+
+
+def test_query_params_required_fields():
+    plan = _plan(
+        compute.DeleteSignedUrlKeyBackendServiceRequest,
+        "/compute/v1/projects/{project}/global/backendServices/{backend_service}"
+        "/deleteSignedUrlKey",
+        required_fields_default_values={"keyName": ""},
+    )
+
+    request = compute.DeleteSignedUrlKeyBackendServiceRequest(request_id="r")
+    assert plan.query_params(request) == [("requestId", "r"), ("keyName", "")]
+
+    request = compute.DeleteSignedUrlKeyBackendServiceRequest(key_name="k")
+    assert plan.query_params(request) == [("keyName", "k")]
+
+
+def test_encoders():
+    assert _request_plan._encode_float(float("nan")) == "NaN"
+    assert _request_plan._encode_double(float("-inf")) == "-Infinity"
+    assert _request_plan._encode_double(float("inf")) == "Infinity"
+    assert _request_plan._encode_double(0.25) == 0.25
+    assert _request_plan._encode_bytes(b"\x00\x01") == "AAE="
+
+
+def test_plan_is_shared():
+    plan = _plan(compute.GetZoneRequest, ZONE_URI)
+    assert plan._bindings is None
+
+    plan.query_params(compute.GetZoneRequest(project="p", zone="z"))
+    bindings = plan._bindings
+    plan.expand(compute.GetZoneRequest(project="q", zone="y"))
+    assert plan._bindings is bindings
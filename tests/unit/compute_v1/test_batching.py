@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+import re
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import batching
+from google.cloud.compute_v1.types import compute
+
+INSTANCE = {"project": "p", "zone": "z", "instance": "vm"}
+
+
+def _client(client_class=compute_v1.InstancesClient, **kwargs):
+    return client_class(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest", **kwargs
+    )
+
+
+def _parse_batch(data, content_type):
+    boundary = content_type.split("boundary=")[1]
+    calls = []
+    for chunk in data.decode("utf-8").split("--" + boundary)[1:-1]:
+        head, _, message = chunk.strip("\r\n").partition("\r\n\r\n")
+        content_id = re.search(r"Content-ID: <(.*)>", head).group(1)
+        request_head, _, body = message.partition("\r\n\r\n")
+        request_line, *headers = request_head.split("\r\n")
+        calls.append((content_id, request_line, headers, body))
+    return calls
+
+
+def _reply(calls, respond):
+    parts = []
+    for content_id, request_line, _, _ in calls:
+        status, body = respond(request_line)
+        parts.append(
+            "--resp\r\nContent-Type: application/http\r\n"
+            "Content-ID: <response-{}>\r\n\r\n"
+            "HTTP/1.1 {}\r\nContent-Type: application/json; charset=UTF-8\r\n\r\n"
+            "{}\r\n".format(content_id, status, json.dumps(body))
+        )
+    response = Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = "multipart/mixed; boundary=resp"
+    response._content = ("".join(parts) + "--resp--\r\n").encode("utf-8")
+    return response
+
+
+def _ok(request_line):
+    return "200 OK", {"name": request_line.split()[1].split("?")[0].split("/")[-1]}
+
+
+@pytest.fixture
+def server():
+    batches = []
+
+    def request(method, url, data=None, headers=None, **kwargs):
+        calls = _parse_batch(data, headers["Content-Type"])
+        batches.append((method, url, calls))
+        return _reply(calls, server.respond)
+
+    server = mock.Mock(batches=batches, respond=_ok)
+    with mock.patch.object(Session, "request", side_effect=request):
+        yield server
+
+
+def test_batch(server):
+    instances = _client()
+    disks = _client(
+        compute_v1.DisksClient,
+        client_options={"session": instances.transport._session},
+    )
+    with compute_v1.batch(instances) as b:
+        get = b.add(instances.get, **INSTANCE)
+        stop = b.add(instances.stop_unary, request=dict(INSTANCE, instance="vm2"))
+        disk = b.add(disks.get, project="p", zone="z", disk="d")
+        assert len(b) == 3
+        assert not get.done()
+
+    assert len(b) == 0
+    assert get.result() == compute.Instance(name="vm")
+    assert stop.result() == compute.Operation(name="stop")
+    assert disk.result() == compute.Disk(name="d")
+
+    ((method, url, calls),) = server.batches
+    assert method == "POST"
+    assert url == "https://compute.googleapis.com:443/batch/compute/v1"
+    assert [line for _, line, _, _ in calls] == [
+        "GET /compute/v1/projects/p/zones/z/instances/vm HTTP/1.1",
+        "POST /compute/v1/projects/p/zones/z/instances/vm2/stop HTTP/1.1",
+        "GET /compute/v1/projects/p/zones/z/disks/d HTTP/1.1",
+    ]
+
+
+def test_batch_body_params_and_headers(server):
+    client = _client()
+    with batching.Batch(client) as b:
+        b.add(
+            client.set_labels_unary,
+            request=compute.SetLabelsInstanceRequest(
+                INSTANCE,
+                instances_set_labels_request_resource={"labels": {"env": "prod"}},
+                request_id="r",
+            ),
+            metadata=[("x-goog-custom", "1")],
+        )
+        b.add(client.get, fields=["name", "status"], **INSTANCE)
+
+    ((_, _, calls),) = server.batches
+    _, line, headers, body = calls[0]
+    assert line.endswith("/instances/vm/setLabels?requestId=r HTTP/1.1")
+    assert "x-goog-custom: 1" in headers
+    assert "Content-Type: application/json" in headers
+    assert json.loads(body) == {"labels": {"env": "prod"}}
+    _, line, _, body = calls[1]
+    assert line.endswith("/instances/vm?fields=name%2Cstatus HTTP/1.1")
+    assert body == ""
+
+
+def test_batch_error_part(server):
+    server.respond = lambda line: (
+        ("404 Not Found", {"error": {"code": 404, "message": "gone"}})
+        if "missing" in line
+        else _ok(line)
+    )
+    client = _client()
+    with compute_v1.batch(client) as b:
+        found = b.add(client.get, **INSTANCE)
+        missing = b.add(client.get, **dict(INSTANCE, instance="missing"))
+
+    assert found.result().name == "vm"
+    with pytest.raises(core_exceptions.NotFound, match="gone"):
+        missing.result()
+
+
+def test_batch_missing_part(server):
+    client = _client()
+    server.respond = _ok
+    with mock.patch.object(
+        batching.Batch, "_decode", return_value={}
+    ), compute_v1.batch(client) as b:
+        future = b.add(client.get, **INSTANCE)
+    assert isinstance(future.exception(), core_exceptions.InternalServerError)
+
+
+def test_batch_split(server):
+    client = _client()
+    with compute_v1.batch(client, max_batch_size=2) as b:
+        futures = [
+            b.add(client.get, **dict(INSTANCE, instance="vm{}".format(i)))
+            for i in range(5)
+        ]
+    assert [len(calls) for _, _, calls in server.batches] == [2, 2, 1]
+    assert [f.result().name for f in futures] == ["vm{}".format(i) for i in range(5)]
+
+
+def test_batch_http_error():
+    client = _client()
+    response = Response()
+    response.status_code = 500
+    response._content = b'{"error": {"message": "boom"}}'
+    response.request = mock.Mock(method="POST", url="u")
+    with mock.patch.object(Session, "request", return_value=response):
+        with compute_v1.batch(client) as b:
+            futures = [b.add(client.get, **INSTANCE) for _ in range(2)]
+    for future in futures:
+        with pytest.raises(core_exceptions.InternalServerError):
+            future.result()
+
+
+def test_batch_exception_cancels(server):
+    client = _client()
+    with pytest.raises(RuntimeError):
+        with compute_v1.batch(client) as b:
+            future = b.add(client.get, **INSTANCE)
+            raise RuntimeError()
+    assert future.cancelled()
+    assert server.batches == []
+
+
+def test_batch_session_from_first_call(server):
+    client = _client()
+    b = compute_v1.batch()
+    future = b.add(client.get, **INSTANCE)
+    b.execute()
+    assert future.result().name == "vm"
+
+
+def test_batch_invalid_calls():
+    client = _client()
+    b = compute_v1.batch(client)
+    with pytest.raises(ValueError):
+        b.add(client.get, request=INSTANCE, project="p")
+    with pytest.raises(TypeError):
+        b.add(len, [])
+    async_client = compute_v1.InstancesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with pytest.raises(TypeError):
+        b.add(async_client.get, **INSTANCE)
+    with pytest.raises(ValueError):
+        b.add(client.get, project="p")
+    other = _client(client_options={"api_endpoint": "other.example.com"})
+    with pytest.raises(ValueError):
+        b.add(other.get, **INSTANCE)
+    assert len(b) == 0
+
+
+@pytest.mark.parametrize("size", [0, batching.MAX_BATCH_SIZE + 1])
+def test_batch_invalid_size(size):
+    with pytest.raises(ValueError):
+        batching.Batch(max_batch_size=size)
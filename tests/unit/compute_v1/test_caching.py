@@ -0,0 +1,385 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import multiprocessing
+import sqlite3
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import caching
+from google.cloud.compute_v1.services.machine_types import transports
+
+
+class _Credentials(ga_credentials.Credentials):
+    def __init__(self, service_account_email=None):
+        super().__init__()
+        self.token = "token"
+        if service_account_email:
+            self.service_account_email = service_account_email
+
+    def refresh(self, request):
+        pass
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _request(name="e2-medium", **kwargs):
+    return compute_v1.GetMachineTypeRequest(
+        project="p", zone="z", machine_type=name, **kwargs
+    )
+
+
+def _transport(credentials=None, host="compute.googleapis.com"):
+    return mock.Mock(
+        _host=host, _credentials=credentials or ga_credentials.AnonymousCredentials()
+    )
+
+
+def _response(message, status_code=200):
+    response = Response()
+    response.status_code = status_code
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        compute_v1.ResponseCache(ttl=0)
+    with pytest.raises(ValueError):
+        compute_v1.ResponseCache(max_entries=0)
+
+
+def test_lookup_and_store():
+    cache = compute_v1.ResponseCache()
+    assert cache.lookup(_request()) is None
+    cache.store(_request(), compute_v1.MachineType(name="e2-medium"))
+    assert cache.lookup(_request()) == compute_v1.MachineType(name="e2-medium")
+    assert cache.lookup(_request("e2-small")) is None
+    # Views and field masks are part of the key.
+    assert cache.lookup(_request(), views=True) is None
+    assert cache.lookup(_request(), fields="name") is None
+    assert cache.stats() == compute_v1.CacheStats(hits=1, misses=4, evictions=0, size=1)
+
+
+def test_ttl():
+    clock = _Clock()
+    cache = compute_v1.ResponseCache(ttl=10, clock=clock)
+    cache.store(_request(), compute_v1.MachineType(name="e2-medium"))
+    clock.now = 9.9
+    assert cache.lookup(_request()) is not None
+    clock.now = 10
+    assert cache.lookup(_request()) is None
+
+
+def test_lru_eviction():
+    cache = compute_v1.ResponseCache(max_entries=2)
+    for name in ("a", "b"):
+        cache.store(_request(name), compute_v1.MachineType(name=name))
+    # Using "a" makes "b" the least recently used.
+    assert cache.lookup(_request("a")) is not None
+    cache.store(_request("c"), compute_v1.MachineType(name="c"))
+    assert cache.lookup(_request("b")) is None
+    assert cache.lookup(_request("a")) is not None
+    assert cache.lookup(_request("c")) is not None
+    assert cache.stats().evictions == 1
+    assert len(cache) == 2
+
+
+def test_invalidate():
+    cache = compute_v1.ResponseCache()
+    request = compute_v1.ListMachineTypesRequest(project="p", zone="z")
+    for token in ("", "next"):
+        page = compute_v1.ListMachineTypesRequest(request, page_token=token)
+        cache.store(page, compute_v1.MachineTypeList(id=token))
+    cache.store(_request(), compute_v1.MachineType(name="e2-medium"))
+    # Every page of the list is dropped.
+    assert cache.invalidate(request) == 2
+    assert cache.invalidate(request) == 0
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_copies():
+    cache = compute_v1.ResponseCache()
+    response = compute_v1.MachineType(name="e2-medium")
+    cache.store(_request(), response)
+    response.name = "changed"
+    cached = cache.lookup(_request())
+    cached.description = "changed"
+    assert cache.lookup(_request()) == compute_v1.MachineType(name="e2-medium")
+
+
+def test_cached_none():
+    method = mock.Mock()
+    assert caching.cached(method, None, _transport()) is method
+
+
+def test_cached_errors():
+    cache = compute_v1.ResponseCache()
+    method = mock.Mock(side_effect=core_exceptions.ServiceUnavailable("down"))
+    call = caching.cached(method, cache, _transport())
+    for _ in range(2):
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            call(_request())
+    assert method.call_count == 2
+    assert len(cache) == 0
+
+
+def test_cached_async():
+    cache = compute_v1.ResponseCache()
+    calls = []
+
+    async def method(request, metadata=()):
+        calls.append(request)
+        return compute_v1.MachineType(name=request.machine_type)
+
+    call = caching.cached(method, cache, _transport())
+    assert asyncio.iscoroutinefunction(call)
+
+    async def run():
+        return [await call(_request()) for _ in range(2)]
+
+    assert asyncio.run(run()) == [compute_v1.MachineType(name="e2-medium")] * 2
+    assert len(calls) == 1
+
+
+def test_client_cache():
+    cache = compute_v1.ResponseCache()
+    options = compute_v1.ClientOptions(cache=cache)
+    client = compute_v1.MachineTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), client_options=options
+    )
+    response = _response(compute_v1.MachineType(name="e2-medium", guest_cpus=2))
+    with mock.patch.object(Session, "request", return_value=response) as req:
+        first = client.get(project="p", zone="z", machine_type="e2-medium")
+        first.guest_cpus = 4
+        second = client.get(project="p", zone="z", machine_type="e2-medium")
+    assert req.call_count == 1
+    assert second.guest_cpus == 2
+    assert cache.stats().hits == 1
+
+
+def test_client_cache_shared():
+    cache = compute_v1.ResponseCache()
+    options = {"cache": cache}
+    zones = compute_v1.ZonesClient(
+        credentials=ga_credentials.AnonymousCredentials(), client_options=options
+    )
+    # Clients of other resources ignore the cache.
+    instances = compute_v1.InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials(), client_options=options
+    )
+    with mock.patch.object(
+        Session, "request", return_value=_response(compute_v1.Zone(name="z"))
+    ) as req:
+        zones.get(project="p", zone="z")
+        zones.get(project="p", zone="z")
+    assert req.call_count == 1
+    with mock.patch.object(
+        Session, "request", return_value=_response(compute_v1.Instance(name="i"))
+    ) as req:
+        instances.get(project="p", zone="z", instance="i")
+        instances.get(project="p", zone="z", instance="i")
+    assert req.call_count == 2
+    assert len(cache) == 1
+
+
+def test_cached_scope():
+    cache = compute_v1.ResponseCache()
+    method = mock.Mock(return_value=compute_v1.MachineType(name="e2-medium"))
+    alice = _Credentials("alice@p.iam.gserviceaccount.com")
+    for transport in (
+        _transport(alice),
+        _transport(_Credentials("alice@p.iam.gserviceaccount.com")),
+        _transport(_Credentials("bob@p.iam.gserviceaccount.com")),
+        _transport(_Credentials()),
+        _transport(_Credentials()),
+        _transport(alice, host="compute.example.com"),
+    ):
+        caching.cached(method, cache, transport)(_request())
+    # Only the credentials of the same service account share the response.
+    assert method.call_count == 5
+    assert cache.invalidate(_request()) == 5
+
+
+def test_client_cache_credentials():
+    cache = compute_v1.ResponseCache()
+    clients = [
+        compute_v1.MachineTypesClient(
+            credentials=_Credentials(email), client_options={"cache": cache}
+        )
+        for email in (
+            "alice@p.iam.gserviceaccount.com",
+            "bob@p.iam.gserviceaccount.com",
+        )
+    ]
+    response = _response(compute_v1.MachineType(name="e2-medium"))
+    with mock.patch.object(Session, "request", return_value=response) as req:
+        for client in clients:
+            client.get(project="p", zone="z", machine_type="e2-medium")
+    assert req.call_count == 2
+    assert len(cache) == 2
+
+
+def test_client_cache_errors():
+    cache = compute_v1.ResponseCache()
+    client = compute_v1.MachineTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        client_options=compute_v1.ClientOptions(cache=cache),
+    )
+    response = _response(compute_v1.MachineType(), status_code=404)
+    with mock.patch.object(Session, "request", return_value=response) as req:
+        for _ in range(2):
+            with pytest.raises(core_exceptions.NotFound):
+                client.get(project="p", zone="z", machine_type="missing")
+    assert req.call_count == 2
+    assert len(cache) == 0
+
+
+def test_client_cache_with_transport_instance():
+    transport = transports.MachineTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with pytest.raises(ValueError):
+        compute_v1.MachineTypesClient(
+            transport=transport,
+            client_options=compute_v1.ClientOptions(cache=compute_v1.ResponseCache()),
+        )
+
+
+def _store_in_child(directory):
+    cache = compute_v1.DiskCache(directory)
+    cache.store(_request(), compute_v1.MachineType(name="e2-medium", guest_cpus=2))
+
+
+def test_disk_cache(tmp_path):
+    cache = compute_v1.DiskCache(str(tmp_path))
+    assert cache.lookup(_request()) is None
+    cache.store(_request(), compute_v1.MachineType(name="e2-medium"))
+    assert cache.lookup(_request()) == compute_v1.MachineType(name="e2-medium")
+    assert cache.lookup(_request(), fields="name") is None
+    # Another cache of the same directory sees the response.
+    other = compute_v1.DiskCache(str(tmp_path))
+    assert other.lookup(_request()) == compute_v1.MachineType(name="e2-medium")
+    assert cache.stats() == compute_v1.CacheStats(
+        hits=1, misses=2, evictions=0, size=1, errors=0
+    )
+
+
+def test_disk_cache_processes(tmp_path):
+    process = multiprocessing.get_context("spawn").Process(
+        target=_store_in_child, args=(str(tmp_path),)
+    )
+    process.start()
+    process.join(30)
+    assert process.exitcode == 0
+    cache = compute_v1.DiskCache(str(tmp_path))
+    assert cache.lookup(_request()).guest_cpus == 2
+
+
+def test_disk_cache_ttl_and_eviction(tmp_path):
+    clock = _Clock()
+    cache = compute_v1.DiskCache(str(tmp_path), ttl=10, max_entries=2, clock=clock)
+    for name in ("a", "b"):
+        cache.store(_request(name), compute_v1.MachineType(name=name))
+        clock.now += 1
+    cache.store(_request("c"), compute_v1.MachineType(name="c"))
+    # The response closest to expiry is evicted.
+    assert cache.lookup(_request("a")) is None
+    assert cache.lookup(_request("b")) is not None
+    assert cache.stats().evictions == 1
+    clock.now = 11
+    assert cache.lookup(_request("b")) is None
+    assert cache.lookup(_request("c")) is not None
+    assert cache.stats().size == 1
+
+
+def test_disk_cache_invalidate(tmp_path):
+    cache = compute_v1.DiskCache(str(tmp_path))
+    request = compute_v1.ListMachineTypesRequest(project="p", zone="z")
+    for token in ("", "next"):
+        page = compute_v1.ListMachineTypesRequest(request, page_token=token)
+        cache.store(page, compute_v1.MachineTypeList(id=token))
+    cache.store(_request(), compute_v1.MachineType(name="e2-medium"))
+    assert cache.invalidate(request) == 2
+    assert cache.stats().size == 1
+    cache.clear()
+    assert cache.stats().size == 0
+
+
+def test_disk_cache_errors(tmp_path):
+    cache = compute_v1.DiskCache(str(tmp_path))
+    with mock.patch.object(
+        compute_v1.DiskCache,
+        "_connection",
+        side_effect=sqlite3.OperationalError("disk I/O error"),
+    ):
+        cache.store(_request(), compute_v1.MachineType(name="e2-medium"))
+        assert cache.lookup(_request()) is None
+    assert cache.lookup(_request()) is None
+    assert cache.stats() == compute_v1.CacheStats(
+        hits=0, misses=2, evictions=0, size=0, errors=2
+    )
+
+
+def test_client_disk_cache(tmp_path):
+    image = compute_v1.Image(name="debian-11-v1", family="debian-11")
+    for _ in range(2):
+        # A new client, as in a new process, reuses the cached response.
+        client = compute_v1.ImagesClient(
+            credentials=ga_credentials.AnonymousCredentials(),
+            client_options={"cache": compute_v1.DiskCache(str(tmp_path))},
+        )
+        with mock.patch.object(
+            Session, "request", return_value=_response(image)
+        ) as req:
+            assert client.get_from_family(project="p", family="debian-11") == image
+    assert req.call_count == 0
+    # Other methods of images are not cached.
+    with mock.patch.object(Session, "request", return_value=_response(image)) as req:
+        client.get(project="p", image="debian-11-v1")
+        client.get(project="p", image="debian-11-v1")
+    assert req.call_count == 2
+
+
+def test_client_disk_cache_credentials(tmp_path):
+    image = compute_v1.Image(name="debian-11-v1", family="debian-11")
+    for email in ("alice@p.iam.gserviceaccount.com", "bob@p.iam.gserviceaccount.com"):
+        client = compute_v1.ImagesClient(
+            credentials=_Credentials(email),
+            client_options={"cache": compute_v1.DiskCache(str(tmp_path))},
+        )
+        with mock.patch.object(
+            Session, "request", return_value=_response(image)
+        ) as req:
+            client.get_from_family(project="p", family="debian-11")
+        # Not served the response of the other service account.
+        assert req.call_count == 1
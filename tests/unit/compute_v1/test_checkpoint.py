@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import json
+import threading
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import _checkpoint
+from google.cloud.compute_v1.services.instances import pagers
+
+PAGES = [
+    compute_v1.InstanceList(
+        items=[
+            compute_v1.Instance(name="instance-{}-{}".format(i, j)) for j in range(2)
+        ],
+        next_page_token="token-{}".format(i + 1) if i < 2 else "",
+    )
+    for i in range(3)
+]
+NAMES = [instance.name for page in PAGES for instance in page.items]
+
+
+def _response(message):
+    response = Response()
+    response.status_code = 200
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _send(calls):
+    def request(method, url, **kwargs):
+        params = dict(kwargs["params"])
+        calls.append(params)
+        token = params.get("pageToken", "token-0")
+        return _response(PAGES[int(token.split("-")[1])])
+
+    return request
+
+
+def _client():
+    return compute_v1.InstancesClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def test_dumps_loads():
+    request = compute_v1.ListInstancesRequest(
+        project="p", zone="z", filter='status = "RUNNING"', page_token="token-1"
+    )
+    checkpoint = _checkpoint.dumps(request, 3)
+    assert json.loads(checkpoint)["offset"] == 3
+    assert _checkpoint.loads(checkpoint, compute_v1.ListInstancesRequest) == (
+        request,
+        3,
+    )
+
+
+def test_loads_invalid():
+    request = compute_v1.ListInstancesRequest(project="p", zone="z")
+    checkpoint = _checkpoint.dumps(request, 0)
+    with pytest.raises(ValueError):
+        _checkpoint.loads(checkpoint, compute_v1.ListDisksRequest)
+    with pytest.raises(ValueError):
+        _checkpoint.loads("not a checkpoint", compute_v1.ListInstancesRequest)
+    with pytest.raises(ValueError):
+        _checkpoint.loads("{}", compute_v1.ListInstancesRequest)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("consumed", [0, 1, 2, 3, 5, 6])
+def test_resume_from(prefetch, consumed):
+    client = _client()
+    calls = []
+    with mock.patch.object(Session, "request", side_effect=_send(calls)):
+        pager = client.list(project="p", zone="z", prefetch=prefetch)
+        names = []
+        iterator = iter(pager)
+        for _ in range(consumed):
+            names.append(next(iterator).name)
+        checkpoint = pager.checkpoint()
+        iterator.close()
+        # Let the background worker finish its request, if any.
+        for thread in threading.enumerate():
+            if thread.name == "PagerPrefetch":
+                thread.join(5)
+
+        calls.clear()
+        resumed = client.list(resume_from=checkpoint)
+        names.extend(instance.name for instance in resumed)
+
+    assert names == NAMES
+    # Only the pages that were not done are requested again.
+    assert calls[0].get("pageToken", "token-0") == "token-{}".format(
+        max(consumed - 1, 0) // 2
+    )
+
+
+def test_resume_from_keeps_request_fields():
+    client = _client()
+    calls = []
+    with mock.patch.object(Session, "request", side_effect=_send(calls)):
+        pager = client.list(
+            request={"project": "p", "zone": "z", "filter": 'name = "instance-.*"'}
+        )
+        iterator = iter(pager)
+        next(iterator)
+        next(iterator)
+        next(iterator)
+        checkpoint = pager.checkpoint()
+        calls.clear()
+        list(client.list(resume_from=checkpoint))
+
+    assert calls[0]["filter"] == 'name = "instance-.*"'
+    assert calls[0]["pageToken"] == "token-1"
+
+
+def test_resume_from_aggregated_list():
+    pages = [
+        compute_v1.InstanceAggregatedList(
+            items={
+                "zones/a": compute_v1.InstancesScopedList(instances=PAGES[0].items),
+                "zones/b": compute_v1.InstancesScopedList(instances=PAGES[1].items),
+            },
+            next_page_token="token-1",
+        ),
+        compute_v1.InstanceAggregatedList(
+            items={"zones/c": compute_v1.InstancesScopedList(instances=PAGES[2].items)}
+        ),
+    ]
+
+    def request(method, url, **kwargs):
+        token = dict(kwargs["params"]).get("pageToken", "token-0")
+        return _response(pages[int(token.split("-")[1])])
+
+    client = _client()
+    with mock.patch.object(Session, "request", side_effect=request):
+        pager = client.aggregated_list(project="p")
+        iterator = iter(pager)
+        assert next(iterator)[0] == "zones/a"
+        checkpoint = pager.checkpoint()
+        resumed = client.aggregated_list(resume_from=checkpoint)
+        assert [key for key, _ in resumed] == ["zones/b", "zones/c"]
+
+
+def test_resume_from_invalid_arguments():
+    client = _client()
+    checkpoint = _checkpoint.dumps(compute_v1.ListInstancesRequest(project="p"), 0)
+    with pytest.raises(ValueError):
+        client.list(project="p", resume_from=checkpoint)
+    with pytest.raises(ValueError):
+        client.list(request={"project": "p"}, resume_from=checkpoint)
+    with pytest.raises(ValueError):
+        client.aggregated_list(resume_from=checkpoint)
+    # The page of the checkpoint would be requested at another size.
+    with pytest.raises(ValueError):
+        client.list(resume_from=checkpoint, page_sizer=compute_v1.AdaptivePageSize())
+
+
+def test_parallel_aggregated_list_checkpoint():
+    client = _client()
+    response = compute_v1.InstanceAggregatedList()
+    with mock.patch.object(Session, "request", return_value=_response(response)):
+        pager = client.aggregated_list(project="p", parallel=2)
+    with pytest.raises(ValueError):
+        pager.checkpoint()
+
+
+def test_async_pager_checkpoint():
+    async def method(request, metadata=()):
+        return PAGES[int(request.page_token.split("-")[1])]
+
+    async def iterate():
+        request = compute_v1.ListInstancesRequest(project="p", zone="z")
+        pager = pagers.ListAsyncPager(method, request, PAGES[0])
+        names = []
+        async for instance in pager:
+            names.append(instance.name)
+            if len(names) == 3:
+                break
+        request, offset = _checkpoint.loads(
+            pager.checkpoint(), compute_v1.ListInstancesRequest
+        )
+        resumed = pagers.ListAsyncPager(
+            method, request, await method(request), offset=offset
+        )
+        async for instance in resumed:
+            names.append(instance.name)
+        return names
+
+    assert asyncio.run(iterate()) == NAMES
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import pytest
+
+from google.api_core import client_options as client_options_lib
+
+from google.cloud.compute_v1 import client_options
+
+
+def test_constructor():
+    session = object()
+    options = client_options.ClientOptions(
+        api_endpoint="foo.googleapis.com", session=session
+    )
+
+    assert isinstance(options, client_options_lib.ClientOptions)
+    assert options.api_endpoint == "foo.googleapis.com"
+    assert options.session is session
+
+
+def test_constructor_defaults():
+    options = client_options.ClientOptions()
+    assert options.session is None
+    assert options.api_endpoint is None
+
+
+def test_from_dict():
+    session = object()
+    options = client_options.from_dict(
+        {"api_endpoint": "foo.googleapis.com", "session": session}
+    )
+
+    assert isinstance(options, client_options.ClientOptions)
+    assert options.api_endpoint == "foo.googleapis.com"
+    assert options.session is session
+
+
+def test_from_dict_bad_argument():
+    with pytest.raises(ValueError):
+        client_options.from_dict({"sesion": object()})
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import coalescing
+from google.cloud.compute_v1.services.instances import transports
+
+IMAGE = compute_v1.Image(name="debian-11-v1", family="debian-11")
+
+
+class _Interrupted(BaseException):
+    pass
+
+
+def _wait_for(condition):
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert condition()
+
+
+def _response(message):
+    response = Response()
+    response.status_code = 200
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _call_together(coalescer, count, func, key="key"):
+    # Call ``func`` through the coalescer from ``count`` threads, and only
+    # let it finish once all of them are waiting.
+    release = threading.Event()
+
+    def blocked():
+        release.wait(5)
+        return func()
+
+    with concurrent.futures.ThreadPoolExecutor(count) as executor:
+        futures = [executor.submit(coalescer.call, key, blocked) for _ in range(count)]
+        _wait_for(lambda: coalescer.stats().coalesced >= count - 1)
+        release.set()
+    return futures
+
+
+def test_call():
+    coalescer = compute_v1.RequestCoalescer()
+    func = mock.Mock(return_value=IMAGE)
+    results = [f.result() for f in _call_together(coalescer, 8, func)]
+    assert func.call_count == 1
+    assert results == [IMAGE] * 8
+    # Every caller gets its own copy.
+    assert len({id(result) for result in results}) == 8
+    assert coalescer.stats() == compute_v1.CoalescerStats(
+        calls=1, coalesced=7, in_flight=0
+    )
+
+
+def test_call_not_in_flight():
+    coalescer = compute_v1.RequestCoalescer()
+    func = mock.Mock(return_value=IMAGE)
+    assert coalescer.call("key", func) is IMAGE
+    assert coalescer.call("key", func) is IMAGE
+    assert coalescer.call("other", func) is IMAGE
+    assert func.call_count == 3
+
+
+def test_call_error():
+    coalescer = compute_v1.RequestCoalescer()
+    func = mock.Mock(side_effect=core_exceptions.NotFound("missing"))
+    for future in _call_together(coalescer, 4, func):
+        with pytest.raises(core_exceptions.NotFound):
+            future.result()
+    assert func.call_count == 1
+
+
+def test_call_abandoned():
+    coalescer = compute_v1.RequestCoalescer()
+    func = mock.Mock(side_effect=[_Interrupted(), IMAGE, IMAGE])
+    futures = _call_together(coalescer, 3, func)
+    outcomes = [future.exception() or future.result() for future in futures]
+    # The calls that waited for the interrupted one send their own.
+    assert sum(isinstance(outcome, _Interrupted) for outcome in outcomes) == 1
+    assert outcomes.count(IMAGE) == 2
+    assert 2 <= func.call_count <= 3
+
+
+def test_call_async():
+    coalescer = compute_v1.RequestCoalescer()
+    calls = []
+
+    async def func():
+        calls.append(None)
+        await asyncio.sleep(0.01)
+        return IMAGE
+
+    async def run():
+        return await asyncio.gather(
+            *(coalescer.call_async("key", func) for _ in range(5))
+        )
+
+    assert asyncio.run(run()) == [IMAGE] * 5
+    assert len(calls) == 1
+
+
+def test_call_async_cancelled():
+    coalescer = compute_v1.RequestCoalescer()
+    calls = []
+
+    async def func():
+        calls.append(None)
+        await asyncio.sleep(0.05 if len(calls) == 1 else 0)
+        return IMAGE
+
+    async def run():
+        leader = asyncio.ensure_future(coalescer.call_async("key", func))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer.call_async("key", func))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await follower
+
+    assert asyncio.run(run()) == IMAGE
+    assert len(calls) == 2
+
+
+def test_coalesce_none():
+    func = mock.Mock()
+    assert coalescing.coalesce(func, None, mock.Mock()) is func
+
+
+def test_client_coalescer():
+    coalescer = compute_v1.RequestCoalescer()
+    client = compute_v1.ImagesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        client_options=compute_v1.ClientOptions(coalescer=coalescer),
+    )
+
+    def request(method, url, **kwargs):
+        _wait_for(lambda: coalescer.stats().coalesced == 5)
+        return _response(IMAGE)
+
+    with mock.patch.object(Session, "request", side_effect=request) as req:
+        with concurrent.futures.ThreadPoolExecutor(6) as executor:
+            futures = [
+                executor.submit(
+                    client.get_from_family, project="debian-cloud", family="debian-11"
+                )
+                for _ in range(6)
+            ]
+            results = [future.result() for future in futures]
+    assert req.call_count == 1
+    assert results == [IMAGE] * 6
+
+
+class _Credentials(ga_credentials.Credentials):
+    def __init__(self, service_account_email):
+        super().__init__()
+        self.token = "token"
+        self.service_account_email = service_account_email
+
+    def refresh(self, request):
+        pass
+
+
+def test_client_coalescer_credentials():
+    coalescer = compute_v1.RequestCoalescer()
+    transport = [
+        transports.InstancesRestTransport(credentials=credentials, coalescer=coalescer)
+        for credentials in (
+            _Credentials("alice@p.iam.gserviceaccount.com"),
+            _Credentials("alice@p.iam.gserviceaccount.com"),
+            _Credentials("bob@p.iam.gserviceaccount.com"),
+        )
+    ]
+    request = compute_v1.GetInstanceRequest(project="p", zone="z", instance="i")
+    # Transports of different principals do not share calls.
+    keys = [coalescing._key(t, request, {}) for t in transport]
+    assert keys[0] == keys[1]
+    assert keys[0] != keys[2]
+    assert coalescing._key(transport[0], request, {}) != coalescing._key(
+        transport[0], request, {"views": True}
+    )
+
+
+def test_client_coalescer_with_transport_instance():
+    transport = transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with pytest.raises(ValueError):
+        compute_v1.InstancesClient(
+            transport=transport,
+            client_options={"coalescer": compute_v1.RequestCoalescer()},
+        )
+
+
+def test_mutations_not_coalesced():
+    transport = transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+        coalescer=compute_v1.RequestCoalescer(),
+    )
+    with mock.patch.object(coalescing, "_key") as key:
+        with mock.patch.object(
+            Session, "request", return_value=_response(compute_v1.Operation())
+        ):
+            transport._wrapped_methods[transport.start](
+                compute_v1.StartInstanceRequest(project="p", zone="z", instance="i")
+            )
+    key.assert_not_called()
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import subprocess
+import sys
+import urllib.parse
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import columnar
+
+COLUMNS = {
+    "name": "name",
+    "id": "id",
+    "status": "status",
+    "ip": "network_interfaces[0].network_i_p",
+    "nat_ips": "network_interfaces.access_configs.nat_i_p",
+    "disk_sizes": "disks.disk_size_gb",
+    "last_disk": "disks[-1].device_name",
+    "team": "labels.team",
+    "labels": "labels",
+    "tags": "tags.items",
+}
+
+INSTANCES = [
+    compute_v1.Instance(
+        name="a",
+        id=1 << 60,
+        status="RUNNING",
+        labels={"team": "x", "env": "prod"},
+        network_interfaces=[
+            compute_v1.NetworkInterface(
+                network_i_p="10.0.0.1",
+                access_configs=[
+                    compute_v1.AccessConfig(nat_i_p="34.0.0.1"),
+                    compute_v1.AccessConfig(nat_i_p="34.0.0.2"),
+                ],
+            ),
+            compute_v1.NetworkInterface(network_i_p="10.1.0.1"),
+        ],
+        disks=[
+            compute_v1.AttachedDisk(disk_size_gb=10, device_name="boot"),
+            compute_v1.AttachedDisk(disk_size_gb=200, device_name="data"),
+        ],
+        tags=compute_v1.Tags(items=["http"]),
+    ),
+    compute_v1.Instance(name="b", status="TERMINATED"),
+    compute_v1.Instance(name="c", id=3, network_interfaces=[{}]),
+]
+
+EXPECTED = {
+    "name": ["a", "b", "c"],
+    "id": [1 << 60, None, 3],
+    "status": ["RUNNING", "TERMINATED", None],
+    "ip": ["10.0.0.1", None, None],
+    "nat_ips": [["34.0.0.1", "34.0.0.2"], [], []],
+    "disk_sizes": [[10, 200], [], []],
+    "last_disk": ["data", None, None],
+    "team": ["x", None, None],
+    "labels": [{"team": "x", "env": "prod"}, {}, {}],
+    "tags": [["http"], None, None],
+}
+
+
+def _response(message):
+    response = Response()
+    response.status_code = 200
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _client():
+    return compute_v1.InstancesClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def _list(method, url, **kwargs):
+    # One instance per page.
+    page_token = dict(kwargs["params"]).get("pageToken")
+    index = int(page_token or 0)
+    return _response(
+        compute_v1.InstanceList(
+            items=INSTANCES[index : index + 1],
+            next_page_token=str(index + 1) if index + 1 < len(INSTANCES) else "",
+        )
+    )
+
+
+def _aggregated_list(method, url, **kwargs):
+    assert urllib.parse.urlsplit(url).path.endswith("/aggregated/instances")
+    return _response(
+        compute_v1.InstanceAggregatedList(
+            items={
+                "zones/b": compute_v1.InstancesScopedList(instances=INSTANCES[1:]),
+                "zones/a": compute_v1.InstancesScopedList(instances=INSTANCES[:1]),
+                "zones/c": compute_v1.InstancesScopedList(
+                    warning=compute_v1.Warning(code="NO_RESULTS_ON_PAGE")
+                ),
+            }
+        )
+    )
+
+
+@pytest.mark.parametrize("views", [False, True])
+def test_to_columns(views):
+    with mock.patch.object(Session, "request", side_effect=_list):
+        pager = _client().list(project="p", zone="z", views=views)
+        columns = pager.to_columns(COLUMNS)
+    assert len(columns) == 3
+    assert columns.names == tuple(COLUMNS)
+    assert columns.to_pydict() == EXPECTED
+    assert columns["ip"] == EXPECTED["ip"]
+
+
+@pytest.mark.parametrize("views", [False, True])
+def test_to_columns_aggregated(views):
+    with mock.patch.object(Session, "request", side_effect=_aggregated_list):
+        pager = _client().aggregated_list(project="p", views=views)
+        columns = pager.to_columns(["name", "labels.team"])
+    # In the order of the scopes.
+    assert columns.to_pydict() == {
+        "name": ["a", "b", "c"],
+        "labels.team": ["x", None, None],
+    }
+
+
+def test_to_columns_remaining_results():
+    with mock.patch.object(Session, "request", side_effect=_list):
+        pager = _client().list(project="p", zone="z")
+        iterator = iter(pager)
+        next(iterator)
+        resume_from = pager.checkpoint()
+        assert pager.to_columns(["name"])["name"] == ["b", "c"]
+        pager = _client().list(resume_from=resume_from)
+        assert pager.to_columns(["name"])["name"] == ["b", "c"]
+
+
+def test_read_async():
+    async def pages():
+        for instance in INSTANCES:
+            yield compute_v1.InstanceList(items=[instance])
+
+    columns = asyncio.run(
+        columnar.read_async(pages(), compute_v1.Instance, COLUMNS, "items")
+    )
+    assert columns.to_pydict() == EXPECTED
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "missing",
+        "disks",
+        "name[0]",
+        "labels[0]",
+        "labels.team.name",
+        "network_interfaces.access_configs",
+        "name.length",
+        "disks..device_name",
+    ],
+)
+def test_invalid_path(path):
+    with pytest.raises(ValueError):
+        columnar.read([], compute_v1.Instance, [path], "items")
+
+
+def test_to_arrow():
+    pyarrow = pytest.importorskip("pyarrow")
+    pages = [compute_v1.InstanceList(items=INSTANCES)]
+    table = columnar.read(pages, compute_v1.Instance, COLUMNS, "items").to_arrow()
+    assert table.to_pydict() == dict(
+        EXPECTED, labels=[[("env", "prod"), ("team", "x")], [], []]
+    )
+    assert table.schema.field("id").type == pyarrow.uint64()
+    assert table.schema.field("disk_sizes").type == pyarrow.list_(pyarrow.int64())
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    pages = [compute_v1.InstanceList(items=INSTANCES)]
+    columns = columnar.read(
+        pages, compute_v1.Instance, ["name", "id", "cpu_platform"], "items"
+    )
+    records = columns.to_numpy()
+    assert records.dtype["name"] == numpy.dtype("O")
+    # Integers with missing values are objects.
+    assert records.dtype["id"] == numpy.dtype("O")
+    assert list(records["name"]) == ["a", "b", "c"]
+    pages = [compute_v1.InstanceList(items=[{"id": 1}, {"id": 2}])]
+    records = columnar.read(pages, compute_v1.Instance, ["id"], "items").to_numpy()
+    assert records.dtype["id"] == numpy.dtype("uint64")
+    assert list(records["id"]) == [1, 2]
+
+
+def test_missing_dependencies():
+    columns = columnar.read([], compute_v1.Instance, ["name"], "items")
+    with mock.patch.dict(sys.modules, {"pyarrow": None, "numpy": None}):
+        with pytest.raises(ImportError):
+            columns.to_arrow()
+        with pytest.raises(ImportError):
+            columns.to_numpy()
+
+
+def test_pagers_do_not_import_arrow_or_numpy():
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from google.cloud.compute_v1.services.instances import pagers\n"
+            "assert not {'numpy', 'pyarrow'} & set(sys.modules)\n",
+        ],
+        check=True,
+    )
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+
+import pytest
+
+from google.api_core import exceptions as core_exceptions
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import concurrency
+
+
+def _controller(initial=4):
+    return concurrency._Controller(
+        initial,
+        minimum=1,
+        maximum=16,
+        increase=1.0,
+        decrease=0.5,
+        latency_tolerance=2.0,
+    )
+
+
+def test_slow_start():
+    controller = _controller()
+    for _ in range(4):
+        controller.on_success(0.0, 1.0)
+    assert controller.limit == 8
+    for _ in range(20):
+        controller.on_success(0.0, 1.0)
+    assert controller.limit == 16
+
+
+def test_additive_increase_after_congestion():
+    controller = _controller(initial=8)
+    controller.on_congestion(0.0, 1.0)
+    assert controller.limit == 4
+    for _ in range(4):
+        controller.on_success(2.0, 3.0)
+    assert controller.limit == pytest.approx(5, rel=0.05)
+
+
+def test_decrease_once_per_congestion():
+    controller = _controller(initial=8)
+    controller.on_congestion(0.0, 5.0)
+    # Calls started before the decrease do not decrease the limit again.
+    controller.on_congestion(1.0, 6.0)
+    assert controller.limit == 4
+    controller.on_congestion(5.0, 7.0)
+    assert controller.limit == 2
+    controller.on_congestion(7.0, 8.0)
+    controller.on_congestion(8.0, 9.0)
+    assert controller.limit == 1
+
+
+def test_latency_inflation():
+    controller = _controller(initial=8)
+    controller.on_success(0.0, 1.0)
+    controller.on_success(0.0, 2.0)
+    assert controller.limit == 10
+    controller.on_success(0.0, 2.5)
+    assert controller.limit == 5
+    assert controller.min_latency == 1.0
+
+
+def test_is_throttled():
+    assert concurrency.is_throttled(core_exceptions.TooManyRequests("slow down"))
+    assert concurrency.is_throttled(core_exceptions.ServiceUnavailable("busy"))
+    assert not concurrency.is_throttled(core_exceptions.NotFound("missing"))
+    assert not concurrency.is_throttled(ValueError())
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        compute_v1.AdaptiveExecutor(initial=4, maximum=2)
+    with pytest.raises(ValueError):
+        compute_v1.AdaptiveExecutor(decrease=1.0)
+
+
+def test_executor_limits_concurrency():
+    lock = threading.Lock()
+    running = []
+    peak = []
+    release = threading.Event()
+
+    def call(i):
+        with lock:
+            running.append(i)
+            peak.append(len(running))
+        release.wait(5)
+        with lock:
+            running.remove(i)
+        return i
+
+    executor = compute_v1.AdaptiveExecutor(initial=2, maximum=4)
+    futures = [executor.submit(call, i) for i in range(10)]
+    assert executor.stats().running == 2
+    release.set()
+    assert [future.result(5) for future in futures] == list(range(10))
+    executor.shutdown()
+    stats = executor.stats()
+    assert stats.submitted == stats.succeeded == 10
+    assert stats.running == stats.failed == 0
+    assert max(peak) <= stats.peak_concurrency <= 4
+    assert stats.mean_latency >= stats.min_latency >= 0
+
+
+def test_executor_backs_off_when_throttled():
+    def call(i):
+        if i % 2:
+            raise core_exceptions.TooManyRequests("slow down")
+        return i
+
+    with compute_v1.AdaptiveExecutor(initial=1, maximum=8) as executor:
+        futures = [executor.submit(call, i) for i in range(6)]
+    assert futures[0].result() == 0
+    with pytest.raises(core_exceptions.TooManyRequests):
+        futures[1].result()
+    stats = executor.stats()
+    assert stats.succeeded == 3
+    assert stats.failed == stats.throttled == 3
+    assert stats.concurrency == executor.concurrency < 8
+
+
+def test_executor_other_errors_do_not_back_off():
+    def call():
+        raise core_exceptions.NotFound("missing")
+
+    with compute_v1.AdaptiveExecutor(initial=4) as executor:
+        future = executor.submit(call)
+    assert isinstance(future.exception(), core_exceptions.NotFound)
+    assert executor.stats().throttled == 0
+    assert executor.concurrency == 4
+
+
+def test_executor_shutdown():
+    release = threading.Event()
+    executor = compute_v1.AdaptiveExecutor(initial=1)
+    first = executor.submit(release.wait, 5)
+    second = executor.submit(lambda: "second")
+    executor.shutdown(wait=False, cancel_futures=True)
+    assert second.cancelled()
+    with pytest.raises(RuntimeError):
+        executor.submit(lambda: None)
+    release.set()
+    assert first.result(5) is True
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""Import-time regression tests.
+
+Each measurement runs in a fresh interpreter and the best of a few runs is
+compared with the budget, so that a slow machine or a busy CI worker does
+not make the tests flaky. ``benchmarks/import_time.py`` reports the same
+measurements in more detail.
+"""
+import subprocess
+import sys
+
+# Milliseconds. A bare import loads no services, types or transports and
+# takes a few milliseconds; importing them all takes seconds.
+IMPORT_BUDGET_MS = 250
+RUNS = 3
+
+_TIMER = """
+import time
+start = time.perf_counter()
+import google.cloud.compute_v1
+print((time.perf_counter() - start) * 1e3)
+"""
+
+
+def _run(code):
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+
+def test_import_within_budget():
+    elapsed = min(float(_run(_TIMER)) for _ in range(RUNS))
+    assert elapsed <= IMPORT_BUDGET_MS, (
+        "import google.cloud.compute_v1 took {:.1f} ms, over the budget of "
+        "{} ms".format(elapsed, IMPORT_BUDGET_MS)
+    )
+
+
+def test_clients_do_not_import_pkg_resources():
+    _run(
+        "import sys\n"
+        "from google.auth import credentials\n"
+        "from google.cloud import compute_v1\n"
+        "creds = credentials.AnonymousCredentials()\n"
+        "compute_v1.ZonesClient(credentials=creds)\n"
+        "compute_v1.ZonesAsyncClient(credentials=creds)\n"
+        "assert 'pkg_resources' not in sys.modules\n"
+    )
+
+
+def test_sync_clients_do_not_import_async_transports():
+    _run(
+        "import sys\n"
+        "from google.auth import credentials\n"
+        "from google.cloud import compute_v1\n"
+        "creds = credentials.AnonymousCredentials()\n"
+        "compute_v1.ZonesClient(credentials=creds)\n"
+        "assert 'aiohttp' not in sys.modules\n"
+        "loaded = [m for m in sys.modules if m.endswith('.rest_asyncio')]\n"
+        "assert not loaded, loaded\n"
+        "compute_v1.ZonesAsyncClient(credentials=creds)\n"
+        "assert 'google.cloud.compute_v1.services.zones.transports.rest_asyncio' "
+        "in sys.modules\n"
+    )
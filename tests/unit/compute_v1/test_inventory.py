@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import datetime
+import re
+import urllib.parse
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+
+LINK = "https://www.googleapis.com/compute/v1/projects/p/zones/{}/instances/{}"
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _instance(name, zone="us-central1-a", status="RUNNING", ip="10.0.0.1", **labels):
+    return compute_v1.Instance(
+        name=name,
+        zone="https://www.googleapis.com/compute/v1/projects/p/zones/" + zone,
+        self_link=LINK.format(zone, name),
+        status=status,
+        machine_type=".../zones/{}/machineTypes/e2-medium".format(zone),
+        labels=labels,
+        network_interfaces=[compute_v1.NetworkInterface(network_i_p=ip)],
+    )
+
+
+def _response(message):
+    response = Response()
+    response.status_code = 200
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+class _Project:
+    """Serves the instances and operations of a project."""
+
+    def __init__(self, *instances):
+        self.instances = {instance.self_link: instance for instance in instances}
+        self.operations = []
+        self.paths = []
+        # Fail listing the instances of a zone this many times.
+        self.failures = 0
+
+    def change(self, instance=None, deleted=None):
+        if instance is not None:
+            self.instances[instance.self_link] = instance
+            link = instance.self_link
+        else:
+            link = self.instances.pop(deleted).self_link
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self.operations.append(
+            compute_v1.Operation(
+                name="operation-{}".format(len(self.operations)),
+                self_link="{}/operations/{}".format(link, len(self.operations)),
+                target_link=link,
+                status=compute_v1.Operation.Status.DONE,
+                insert_time=now.isoformat(),
+                end_time=now.isoformat(),
+            )
+        )
+
+    def request(self, method, url, **kwargs):
+        path = urllib.parse.urlsplit(url).path
+        params = dict(kwargs["params"])
+        self.paths.append(path)
+        if path.endswith("/aggregated/instances"):
+            items = {}
+            for instance in self.instances.values():
+                zone = "zones/" + instance.zone.rsplit("/", 1)[-1]
+                items.setdefault(zone, compute_v1.InstancesScopedList())
+                items[zone].instances.append(instance)
+            return _response(compute_v1.InstanceAggregatedList(items=items))
+        if path.endswith("/aggregated/operations"):
+            scoped = compute_v1.OperationsScopedList(operations=self.operations)
+            return _response(
+                compute_v1.OperationAggregatedList(items={"zones/z": scoped})
+            )
+        zone = re.search(r"/zones/([^/]+)/instances$", path).group(1)
+        if self.failures:
+            self.failures -= 1
+            response = _response(compute_v1.InstanceList())
+            response.status_code = 403
+            return response
+        names = re.match(r'name eq "\((.*)\)"$', params["filter"]).group(1)
+        found = [
+            instance
+            for instance in self.instances.values()
+            if instance.zone.endswith("/" + zone) and re.fullmatch(names, instance.name)
+        ]
+        return _response(compute_v1.InstanceList(items=found))
+
+
+def _inventory(project, **kwargs):
+    client = compute_v1.InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    return compute_v1.InstanceInventory(client, "p", **kwargs)
+
+
+def _names(instances):
+    return [instance.name for instance in instances]
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        _inventory(None, max_staleness=0)
+    with pytest.raises(ValueError):
+        _inventory(None, max_staleness=60, resync_interval=30)
+
+
+def test_query():
+    project = _Project(
+        _instance("a", team="x"),
+        _instance("b", status="TERMINATED", ip="10.0.0.2", team="x"),
+        _instance("c", zone="us-central1-b", ip="10.0.0.3", team="y"),
+        _instance("d", zone="europe-west1-b", ip="10.1.0.1"),
+    )
+    inventory = _inventory(project)
+    with mock.patch.object(Session, "request", side_effect=project.request):
+        # In the order of the self links.
+        assert _names(inventory.query()) == ["d", "a", "b", "c"]
+        assert _names(inventory.query(zone="us-central1-a")) == ["a", "b"]
+        assert _names(
+            inventory.query(
+                region="us-central1", status="RUNNING", labels={"team": "x"}
+            )
+        ) == ["a"]
+        assert _names(
+            inventory.query(status=compute_v1.Instance.Status.TERMINATED)
+        ) == ["b"]
+        assert _names(inventory.query(network_ip="10.0.0.3")) == ["c"]
+        assert len(inventory.query(machine_type="e2-medium")) == 4
+        assert inventory.query(labels={"team": "z"}) == []
+        assert inventory.query(zone="us-central1-a", region="europe-west1") == []
+        assert inventory.get(LINK.format("europe-west1-b", "d")).name == "d"
+        assert inventory.get(LINK.format("europe-west1-b", "e")) is None
+    # Queries within the staleness bound are answered from the indexes.
+    assert len(project.paths) == 1
+    assert len(inventory) == 4
+
+
+def test_refresh_from_operations():
+    clock = _Clock()
+    project = _Project(
+        _instance("a", team="x"), _instance("b", team="x"), _instance("c")
+    )
+    inventory = _inventory(project, max_staleness=10, clock=clock)
+    with mock.patch.object(Session, "request", side_effect=project.request):
+        assert _names(inventory.query(labels={"team": "x"})) == ["a", "b"]
+        project.change(_instance("a", status="TERMINATED", team="x"))
+        project.change(deleted=LINK.format("us-central1-a", "b"))
+        project.change(_instance("e", zone="us-central1-b", team="x"))
+        clock.now = 5
+        assert _names(inventory.query(labels={"team": "x"})) == ["a", "b"]
+        clock.now = 11
+        assert _names(inventory.query(labels={"team": "x"})) == ["a", "e"]
+        assert _names(inventory.query(status="TERMINATED")) == ["a"]
+    assert project.paths == [
+        "/compute/v1/projects/p/aggregated/instances",
+        "/compute/v1/projects/p/aggregated/operations",
+        "/compute/v1/projects/p/zones/us-central1-a/instances",
+        "/compute/v1/projects/p/zones/us-central1-b/instances",
+    ]
+    assert inventory.stats() == compute_v1.InventoryStats(
+        instances=3, refreshes=1, resyncs=1, fetched=2
+    )
+
+
+def test_resync():
+    clock = _Clock()
+    project = _Project(_instance("a"), _instance("b"))
+    inventory = _inventory(project, max_staleness=10, resync_interval=60, clock=clock)
+    with mock.patch.object(Session, "request", side_effect=project.request):
+        inventory.refresh()
+        # A change that no operation reports.
+        project.instances[LINK.format("us-central1-a", "a")] = _instance(
+            "a", status="TERMINATED"
+        )
+        clock.now = 30
+        assert _names(inventory.query(status="RUNNING")) == ["a", "b"]
+        clock.now = 60
+        assert _names(inventory.query(status="RUNNING")) == ["b"]
+        inventory.refresh(full=True)
+    assert inventory.stats().resyncs == 3
+    assert inventory.staleness == 0
+
+
+def test_refresh_error_keeps_changes():
+    clock = _Clock()
+    project = _Project(_instance("a"), _instance("b"))
+    inventory = _inventory(project, max_staleness=10, clock=clock)
+    with mock.patch.object(Session, "request", side_effect=project.request):
+        inventory.refresh()
+        project.change(_instance("a", status="TERMINATED"))
+        project.failures = 1
+        clock.now = 11
+        with pytest.raises(core_exceptions.Forbidden):
+            inventory.refresh()
+        # The next refresh polls the same changes again.
+        assert _names(inventory.query(status="RUNNING")) == ["b"]
+    assert inventory.stats() == compute_v1.InventoryStats(
+        instances=2, refreshes=1, resyncs=1, fetched=1
+    )
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import subprocess
+import sys
+
+import pytest
+
+from google.cloud import compute
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import types
+from google.cloud.compute_v1.services.instances import InstancesClient
+from google.cloud.compute_v1.types import compute as compute_types
+
+
+def _run(code):
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_does_not_load_services():
+    _run(
+        "import sys\n"
+        "import google.cloud.compute_v1\n"
+        "import google.cloud.compute\n"
+        "loaded = [m for m in sys.modules if m.startswith('google.cloud.compute_v1.')]\n"
+        "assert not loaded, loaded\n"
+    )
+
+
+def test_client_access_loads_one_service():
+    _run(
+        "import sys\n"
+        "from google.cloud import compute_v1\n"
+        "compute_v1.ZonesClient\n"
+        "services = {m.split('.')[4] for m in sys.modules\n"
+        "            if m.startswith('google.cloud.compute_v1.services.')}\n"
+        "assert services == {'zones'}, services\n"
+    )
+
+
+def test_clients_build_only_reachable_messages():
+    _run(
+        "import sys\n"
+        "from google.auth import credentials\n"
+        "from google.cloud import compute_v1\n"
+        "creds = credentials.AnonymousCredentials()\n"
+        "compute_v1.ZonesClient(credentials=creds)\n"
+        "compute_v1.InstancesClient(credentials=creds)\n"
+        "prefix = 'google.cloud.compute_v1.types._shards.'\n"
+        "shards = {m[len(prefix):] for m in sys.modules if m.startswith(prefix)}\n"
+        "assert {'zones', 'instances'} <= shards, shards\n"
+        "assert not shards & {'disks', 'url_maps', 'region_instances'}, shards\n"
+    )
+
+
+@pytest.mark.parametrize("module", [compute_v1, compute])
+def test_all_names_resolve(module):
+    for name in module.__all__:
+        assert getattr(module, name) is not None
+    assert set(module.__all__) <= set(dir(module))
+
+
+def test_same_objects():
+    assert compute_v1.InstancesClient is InstancesClient
+    assert compute.InstancesClient is InstancesClient
+    assert compute_v1.Instance is types.Instance is compute_types.Instance
+    assert compute.Instance is compute_types.Instance
+    assert compute_v1.ClientOptions is compute.ClientOptions
+    assert compute_v1.batch is compute.batch
+
+
+def test_types_resolve():
+    for name in types.__all__:
+        assert getattr(types, name) is getattr(compute_types, name)
+
+
+def test_message_shards():
+    for name in compute_types.__all__:
+        message = getattr(compute_types, name)
+        assert message.__module__ == (
+            "google.cloud.compute_v1.types._shards." + compute_types._SHARDS[name]
+        )
+        assert message.pb().DESCRIPTOR.full_name == "google.cloud.compute.v1." + name
+
+
+def test_cross_shard_reference():
+    instance = compute_types.Instance(
+        network_interfaces=[{"access_configs": [{"name": "External NAT"}]}]
+    )
+    assert isinstance(
+        instance.network_interfaces[0].access_configs[0], compute_types.AccessConfig
+    )
+    assert (
+        compute_types.Instance.from_json(compute_types.Instance.to_json(instance))
+        == instance
+    )
+
+
+@pytest.mark.parametrize("module", [compute_v1, compute, types])
+def test_unknown_name(module):
+    with pytest.raises(AttributeError, match="NotAName"):
+        module.NotAName
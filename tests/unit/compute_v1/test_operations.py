@@ -0,0 +1,439 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import concurrent.futures
+import datetime
+import itertools
+import re
+import threading
+import urllib.parse
+
+import mock
+import pytest
+import requests
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import operations
+
+PATH = "/compute/v1/projects/p"
+PREFIX = "https://compute.googleapis.com" + PATH
+
+
+def _operation(status="RUNNING", scope="zones/z", **kwargs):
+    operation = compute_v1.Operation(
+        name="operation-1",
+        status=status,
+        self_link="{}/{}/operations/operation-1".format(PREFIX, scope),
+        **kwargs
+    )
+    if scope.startswith("zones/"):
+        operation.zone = "{}/{}".format(PREFIX, scope)
+    elif scope.startswith("regions/"):
+        operation.region = "{}/{}".format(PREFIX, scope)
+    return operation
+
+
+def _response(operation):
+    response = Response()
+    response.status_code = 200
+    response._content = compute_v1.Operation.to_json(operation).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _client():
+    return compute_v1.InstancesClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def _paths(req):
+    return [urllib.parse.urlsplit(call.args[1]).path for call in req.mock_calls]
+
+
+@pytest.mark.parametrize(
+    "operation, service, fields",
+    [
+        (
+            _operation(scope="zones/us-central1-a"),
+            operations.ZONE_OPERATIONS,
+            {"project": "p", "zone": "us-central1-a"},
+        ),
+        (
+            _operation(scope="regions/us-central1"),
+            operations.REGION_OPERATIONS,
+            {"project": "p", "region": "us-central1"},
+        ),
+        (_operation(scope="global"), operations.GLOBAL_OPERATIONS, {"project": "p"}),
+        (
+            compute_v1.Operation(
+                name="operation-1",
+                self_link="https://compute.googleapis.com/compute/v1/locations/global/operations/operation-1",
+            ),
+            operations.GLOBAL_ORGANIZATION_OPERATIONS,
+            {},
+        ),
+    ],
+)
+def test_scope(operation, service, fields):
+    fields["operation"] = "operation-1"
+    assert operations.scope(operation) == (service, fields)
+
+
+def test_operation_error():
+    operation = _operation(
+        "DONE",
+        http_error_status_code=404,
+        http_error_message="NOT FOUND",
+        error={"errors": [{"code": "RESOURCE_NOT_FOUND", "message": "gone"}]},
+    )
+    exc = operations.operation_error(operation)
+    assert isinstance(exc, core_exceptions.NotFound)
+    assert exc.message == "NOT FOUND"
+    assert exc.errors[0].code == "RESOURCE_NOT_FOUND"
+    assert exc.response is operation
+
+    del operation.http_error_status_code
+    del operation.http_error_message
+    exc = operations.operation_error(operation)
+    assert type(exc) is core_exceptions.GoogleAPICallError
+    assert exc.message == "gone"
+
+
+def test_done_operation():
+    with mock.patch.object(Session, "request") as req:
+        future = operations.OperationFuture(_operation("DONE"), _client().transport)
+        assert future.done()
+        assert future.result().name == "operation-1"
+    req.assert_not_called()
+    assert future.status == compute_v1.Operation.Status.DONE
+    assert not future.cancel()
+    assert not future.cancelled()
+
+
+def test_mutation_returns_future():
+    responses = [
+        _response(_operation()),
+        _response(_operation()),
+        _response(_operation("DONE", target_link="instance-link")),
+    ]
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        with mock.patch("time.sleep"):
+            future = _client().start(project="p", zone="z", instance="i")
+            assert isinstance(future, compute_v1.OperationFuture)
+            assert future.result().status == compute_v1.Operation.Status.DONE
+    assert _paths(req) == [
+        PATH + "/zones/z/instances/i/start",
+        PATH + "/zones/z/operations/operation-1/wait",
+        PATH + "/zones/z/operations/operation-1/wait",
+    ]
+    assert future.target_link == "instance-link"
+    assert future.operation.target_link == "instance-link"
+
+
+def test_done_gets_once():
+    responses = [_response(_operation(scope="regions/r"))]
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        future = operations.OperationFuture(
+            _operation(scope="regions/r"), _client().transport
+        )
+        assert not future.done()
+    assert _paths(req) == [PATH + "/regions/r/operations/operation-1"]
+
+
+def test_global_operation_waits():
+    responses = [_response(_operation("DONE", scope="global"))]
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        future = operations.OperationFuture(
+            _operation(scope="global"), _client().transport
+        )
+        future.result()
+    assert _paths(req) == [PATH + "/global/operations/operation-1/wait"]
+
+
+def test_operation_with_errors_raises():
+    failed = _operation(
+        "DONE",
+        http_error_status_code=409,
+        http_error_message="CONFLICT",
+        error={"errors": [{"code": "RESOURCE_ALREADY_EXISTS", "message": "exists"}]},
+    )
+    with mock.patch.object(Session, "request", side_effect=[_response(failed)]):
+        future = operations.OperationFuture(_operation(), _client().transport)
+        with pytest.raises(core_exceptions.Conflict) as exc_info:
+            future.result()
+    assert exc_info.value.errors[0].code == "RESOURCE_ALREADY_EXISTS"
+    assert future.exception() is exc_info.value
+
+
+def test_result_timeout_bounds_wait():
+    def request(method, url, **kwargs):
+        assert 1.0 <= kwargs["timeout"] <= 5.0
+        raise requests.exceptions.ReadTimeout()
+
+    with mock.patch.object(Session, "request", side_effect=request):
+        future = operations.OperationFuture(_operation(), _client().transport)
+        with pytest.raises(concurrent.futures.TimeoutError):
+            with mock.patch("time.sleep"):
+                future.result(timeout=5)
+
+
+def test_add_done_callback():
+    done = threading.Event()
+    responses = [_response(_operation("DONE"))]
+    with mock.patch.object(Session, "request", side_effect=responses):
+        future = operations.OperationFuture(_operation(), _client().transport)
+        future.add_done_callback(lambda f: done.set())
+        assert done.wait(5)
+    assert future.result().status == compute_v1.Operation.Status.DONE
+
+
+def test_operations_client_shares_transport():
+    transport = _client().transport
+    client = operations.operations_client(transport, operations.ZONE_OPERATIONS)
+    assert isinstance(client, compute_v1.ZoneOperationsClient)
+    assert client.transport._session is transport._session
+    assert client.transport._retry_policy is transport._retry_policy
+    assert operations.operations_client(transport, operations.ZONE_OPERATIONS) is client
+
+
+def _list_response(*operations_):
+    response = _response(compute_v1.Operation())
+    response._content = compute_v1.OperationList.to_json(
+        compute_v1.OperationList(items=operations_)
+    ).encode("utf-8")
+    return response
+
+
+def _aggregated_response(**scoped):
+    response = _response(compute_v1.Operation())
+    aggregated = compute_v1.OperationAggregatedList(
+        items={
+            "zones/" + key: compute_v1.OperationsScopedList(operations=operations_)
+            for key, operations_ in scoped.items()
+        }
+    )
+    response._content = compute_v1.OperationAggregatedList.to_json(aggregated).encode(
+        "utf-8"
+    )
+    return response
+
+
+def _named(name, status="RUNNING", scope="zones/z", **kwargs):
+    operation = _operation(status, scope, **kwargs)
+    operation.name = name
+    operation.self_link = "{}/{}/operations/{}".format(PREFIX, scope, name)
+    return operation
+
+
+def _filters(req):
+    return [dict(call.kwargs["params"])["filter"] for call in req.mock_calls]
+
+
+def test_waiter_lists_each_zone_once_per_refresh():
+    transport = _client().transport
+    pending = [_named("op-%d" % i) for i in range(3)]
+    responses = [
+        _list_response(_named("op-0", "DONE"), _named("op-1"), _named("op-2", "DONE")),
+        _list_response(_named("op-1", "DONE")),
+    ]
+    waiter = compute_v1.OperationWaiter(pending + [_named("op-3", "DONE")], transport)
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        with mock.patch("time.sleep") as sleep:
+            names = [future.name for future in waiter.as_completed()]
+    assert names == ["op-3", "op-0", "op-2", "op-1"]
+    assert _paths(req) == [PATH + "/zones/z/operations"] * 2
+    assert _filters(req) == ['name eq "(op-0|op-1|op-2)"', 'name eq "(op-1)"']
+    assert [call.args[0] for call in sleep.mock_calls] == [1.0, 1.0]
+    assert not waiter.pending
+
+
+def test_waiter_aggregates_zones():
+    transport = _client().transport
+    operations_ = [_named("op-a", scope="zones/a"), _named("op-b", scope="zones/b")]
+    response = _aggregated_response(
+        a=[_named("op-a", "DONE", scope="zones/a")],
+        b=[_named("op-b", "DONE", scope="zones/b")],
+    )
+    waiter = compute_v1.OperationWaiter(operations_, transport)
+    with mock.patch.object(Session, "request", side_effect=[response]) as req:
+        with mock.patch("time.sleep"):
+            futures = waiter.wait()
+    assert _paths(req) == [PATH + "/aggregated/operations"]
+    assert [future.result().status for future in futures] == [
+        compute_v1.Operation.Status.DONE
+    ] * 2
+
+
+def test_waiter_splits_filters():
+    transport = _client().transport
+    waiter = compute_v1.OperationWaiter(
+        [_named("op-%d" % i) for i in range(3)], transport
+    )
+    responses = [
+        _list_response(_named("op-0", "DONE"), _named("op-1", "DONE")),
+        _list_response(_named("op-2", "DONE")),
+    ]
+    with mock.patch.object(operations, "MAX_FILTER_NAMES", 2):
+        with mock.patch.object(Session, "request", side_effect=responses) as req:
+            waiter.refresh()
+    assert _filters(req) == ['name eq "(op-0|op-1)"', 'name eq "(op-2)"']
+    assert not waiter.pending
+
+
+def test_waiter_errors_and_backoff():
+    failed = _named(
+        "op-1",
+        "DONE",
+        http_error_status_code=400,
+        error={"errors": [{"code": "INVALID", "message": "bad"}]},
+    )
+    responses = [_list_response(), _list_response(), _list_response(failed)]
+    waiter = compute_v1.OperationWaiter(
+        [operations.OperationFuture(_named("op-1"), _client().transport)]
+    )
+    with mock.patch.object(Session, "request", side_effect=responses):
+        with mock.patch("time.sleep") as sleep:
+            (future,) = waiter.as_completed()
+    assert isinstance(future.exception(), core_exceptions.BadRequest)
+    assert [call.args[0] for call in sleep.mock_calls] == [1.0, 1.5, 2.25]
+
+
+def test_waiter_timeout():
+    waiter = compute_v1.OperationWaiter([_named("op-1")], _client().transport)
+    with mock.patch.object(Session, "request", return_value=_list_response()):
+        with pytest.raises(concurrent.futures.TimeoutError, match="1 of 1"):
+            list(waiter.as_completed(timeout=0.01))
+
+
+def test_waiter_needs_transport():
+    with pytest.raises(ValueError):
+        compute_v1.OperationWaiter([_named("op-1")])
+
+
+def _at(minute, second=0):
+    return "2021-10-18T10:{:02d}:{:02d}.000-07:00".format(minute, second)
+
+
+def test_change_feed():
+    transport = _client().transport
+    a = _named("op-a", "DONE", insert_time=_at(0), end_time=_at(1))
+    b = _named("op-b", "RUNNING", insert_time=_at(0), start_time=_at(2))
+    c = _named("op-c", "PENDING", scope="regions/r", insert_time=_at(3))
+    b_done = _named("op-b", "DONE", insert_time=_at(0), start_time=_at(2))
+    b_done.end_time = _at(5)
+    responses = [
+        _aggregated_response(z=[b, a]),
+        _aggregated_response(z=[a, b], r=[c]),
+        _aggregated_response(z=[b_done], r=[c]),
+    ]
+    feed = compute_v1.OperationChangeFeed(transport, project="p")
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        assert [op.name for op in feed.poll()] == ["op-a", "op-b"]
+        assert [op.name for op in feed.poll()] == ["op-c"]
+        assert feed.poll() == [b_done]
+    assert _paths(req) == [PATH + "/aggregated/operations"] * 3
+    filters = [dict(call.kwargs["params"]).get("filter") for call in req.mock_calls]
+    assert filters[0] is None
+    assert filters[1] == (
+        '(insertTime > "{0}") OR (startTime > "{0}") OR (endTime > "{0}")'.format(
+            "2021-10-18T05:01:00.000-12:00"
+        )
+    )
+    assert feed.watermark.isoformat(timespec="milliseconds") == _at(4)
+
+    resumed = compute_v1.OperationChangeFeed(
+        transport, project="p", resume_from=feed.checkpoint()
+    )
+    assert resumed.watermark == feed.watermark
+    with mock.patch.object(
+        Session, "request", side_effect=[_aggregated_response(z=[b_done])]
+    ):
+        assert resumed.poll() == []
+
+
+def test_change_feed_since():
+    old = _named("op-old", "DONE", insert_time=_at(0), end_time=_at(0, 30))
+    new = _named("op-new", "RUNNING", insert_time=_at(2))
+    feed = compute_v1.OperationChangeFeed(
+        _client().transport,
+        project="p",
+        zone="z",
+        since=operations._parse_time(_at(1)),
+        overlap=0,
+    )
+    with mock.patch.object(
+        Session, "request", side_effect=[_list_response(old, new)]
+    ) as req:
+        assert feed.poll() == [new]
+    assert _paths(req) == [PATH + "/zones/z/operations"]
+
+
+def test_change_feed_since_other_offset():
+    old = _named("op-old", "DONE", insert_time=_at(0), end_time=_at(0, 30))
+    new = _named("op-new", "RUNNING", insert_time=_at(2))
+    # 10:01 at -07:00, the offset of the times of the service.
+    since = datetime.datetime(2021, 10, 18, 17, 1, tzinfo=datetime.timezone.utc)
+    feed = compute_v1.OperationChangeFeed(
+        _client().transport, project="p", zone="z", since=since, overlap=0
+    )
+    with mock.patch.object(
+        Session, "request", side_effect=[_list_response(old, new)]
+    ) as req:
+        assert feed.poll() == [new]
+    value = re.search(r'"(.*?)"', dict(req.call_args.kwargs["params"])["filter"])
+    # Compared as strings, the filter keeps the later operation.
+    assert value.group(1) == "2021-10-18T05:01:00.000-12:00"
+    assert value.group(1) <= new.insert_time
+
+
+def test_change_feed_organization():
+    response = _list_response()
+    feed = compute_v1.OperationChangeFeed(
+        _client().transport, parent_id="organizations/1"
+    )
+    with mock.patch.object(Session, "request", side_effect=[response]) as req:
+        assert feed.poll() == []
+    assert _paths(req) == ["/compute/v1/locations/global/operations"]
+    assert dict(req.call_args.kwargs["params"])["parentId"] == "organizations/1"
+
+
+def test_change_feed_arguments():
+    transport = _client().transport
+    with pytest.raises(ValueError):
+        compute_v1.OperationChangeFeed(transport)
+    with pytest.raises(ValueError):
+        compute_v1.OperationChangeFeed(transport, project="p", parent_id="o")
+    with pytest.raises(ValueError):
+        compute_v1.OperationChangeFeed(transport, project="p", zone="z", region="r")
+
+
+def test_change_feed_follow():
+    feed = compute_v1.OperationChangeFeed(_client().transport, project="p")
+    a = _named("op-a", "DONE", insert_time=_at(0), end_time=_at(1))
+    b = _named("op-b", "PENDING", insert_time=_at(2))
+    responses = [_aggregated_response(z=[a]), _aggregated_response(z=[a, b])]
+    with mock.patch.object(Session, "request", side_effect=responses):
+        with mock.patch("time.sleep") as sleep:
+            assert list(itertools.islice(feed.follow(interval=5), 2)) == [a, b]
+    assert [call.args[0] for call in sleep.mock_calls] == [5]
+
+    with mock.patch.object(Session, "request", side_effect=[_aggregated_response()]):
+        with mock.patch("time.sleep") as sleep:
+            assert list(feed.follow(timeout=0)) == []
+    sleep.assert_not_called()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+
+import mock
+import pytest
+import requests
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import page_sizing
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _page(next_page_token="next"):
+    return compute_v1.InstanceList(
+        items=[compute_v1.Instance(name="instance")], next_page_token=next_page_token
+    )
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        compute_v1.AdaptivePageSize(maximum=1000)
+    with pytest.raises(ValueError):
+        compute_v1.AdaptivePageSize(initial=5, minimum=10)
+    with pytest.raises(ValueError):
+        compute_v1.AdaptivePageSize(target_latency=0)
+    with pytest.raises(ValueError):
+        compute_v1.AdaptivePageSize(growth=1.0)
+    with pytest.raises(ValueError):
+        compute_v1.AdaptivePageSize(smoothing=0)
+
+
+def test_grows_by_at_most_growth():
+    sizer = compute_v1.AdaptivePageSize(initial=100, target_latency=2.0)
+    sizer.observe(100, 0.1)
+    assert sizer.page_size == 200
+    sizer.observe(200, 0.2)
+    assert sizer.page_size == 400
+    sizer.observe(400, 0.4)
+    assert sizer.page_size == page_sizing.MAX_RESULTS
+
+
+def test_shrinks_to_target_latency():
+    sizer = compute_v1.AdaptivePageSize(initial=100, target_latency=2.0, smoothing=1)
+    sizer.observe(100, 4.0)
+    assert sizer.page_size == 50
+    sizer.observe(50, 1.0)
+    assert sizer.page_size == 100
+
+
+def test_shrinks_to_target_bytes():
+    sizer = compute_v1.AdaptivePageSize(
+        initial=100, target_latency=2.0, target_bytes=10000, smoothing=1
+    )
+    sizer.observe(100, 0.1, size=40000)
+    assert sizer.page_size == 25
+
+
+def test_minimum():
+    sizer = compute_v1.AdaptivePageSize(initial=100, minimum=20, smoothing=1)
+    sizer.observe(100, 100.0)
+    assert sizer.page_size == 20
+
+
+def test_on_timeout():
+    sizer = compute_v1.AdaptivePageSize(initial=40, minimum=10)
+    assert sizer.on_timeout(40)
+    assert sizer.page_size == 20
+    assert sizer.on_timeout(20)
+    assert not sizer.on_timeout(10)
+    assert sizer.page_size == 10
+
+
+def test_is_timeout():
+    assert page_sizing.is_timeout(core_exceptions.DeadlineExceeded("slow"))
+    assert page_sizing.is_timeout(requests.exceptions.ReadTimeout())
+    assert page_sizing.is_timeout(
+        core_exceptions.RetryError("slow", core_exceptions.GatewayTimeout("slow"))
+    )
+    assert not page_sizing.is_timeout(core_exceptions.NotFound("missing"))
+
+
+def test_wrap():
+    clock = _Clock()
+    sizer = compute_v1.AdaptivePageSize(
+        initial=100, target_latency=2.0, smoothing=1, clock=clock
+    )
+    sizes = []
+
+    def method(request, metadata=()):
+        sizes.append(request.max_results)
+        if len(sizes) == 1:
+            raise requests.exceptions.ReadTimeout()
+        clock.now += request.max_results * 0.01
+        return _page()
+
+    request = compute_v1.ListInstancesRequest(project="p", zone="z", max_results=7)
+    wrapped = sizer.wrap(method)
+    assert wrapped(request) == _page()
+    assert wrapped(request) == _page()
+    # The page that timed out is requested again with half the size.
+    assert sizes == [100, 50, 100]
+    assert sizer.page_size == 200
+    assert request.max_results == 7
+
+
+def test_wrap_last_page_not_observed():
+    clock = _Clock()
+    sizer = compute_v1.AdaptivePageSize(initial=100, clock=clock)
+
+    def method(request):
+        clock.now += 100
+        return _page(next_page_token="")
+
+    sizer.wrap(method)(compute_v1.ListInstancesRequest())
+    assert sizer.page_size == 100
+
+
+def test_wrap_other_errors():
+    sizer = compute_v1.AdaptivePageSize(initial=100)
+    method = mock.Mock(side_effect=core_exceptions.NotFound("missing"))
+    with pytest.raises(core_exceptions.NotFound):
+        sizer.wrap(method)(compute_v1.ListInstancesRequest())
+    assert method.call_count == 1
+    assert sizer.page_size == 100
+
+
+def test_wrap_async():
+    clock = _Clock()
+    sizer = compute_v1.AdaptivePageSize(
+        initial=100, minimum=50, smoothing=1, clock=clock
+    )
+    sizes = []
+
+    async def method(request):
+        sizes.append(request.max_results)
+        raise core_exceptions.DeadlineExceeded("slow")
+
+    with pytest.raises(core_exceptions.DeadlineExceeded):
+        asyncio.run(sizer.wrap_async(method)(compute_v1.ListInstancesRequest()))
+    assert sizes == [100, 50]
+
+
+def test_list_page_sizer():
+    clock = _Clock()
+    sizer = compute_v1.AdaptivePageSize(
+        initial=100, target_latency=2.0, smoothing=1, clock=clock
+    )
+    client = compute_v1.InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    sizes = []
+
+    def request(method, url, **kwargs):
+        params = dict(kwargs["params"])
+        sizes.append(int(params["maxResults"]))
+        # Every result takes 40ms.
+        clock.now += sizes[-1] * 0.04
+        response = Response()
+        response.status_code = 200
+        page = _page(next_page_token="" if len(sizes) == 3 else "next")
+        response._content = compute_v1.InstanceList.to_json(page).encode("utf-8")
+        response.request = mock.Mock(method="GET", url="https://example.com")
+        return response
+
+    with mock.patch.object(Session, "request", side_effect=request):
+        pager = client.list(project="p", zone="z", page_sizer=sizer)
+        assert len(list(pager)) == 3
+    assert sizes == [100, 50, 50]
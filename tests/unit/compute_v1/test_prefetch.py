@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import threading
+import time
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import _prefetch
+
+PAGES = [
+    compute_v1.ImageList(
+        items=[compute_v1.Image(name="image-{}".format(i))],
+        next_page_token="token-{}".format(i + 1) if i < 4 else "",
+    )
+    for i in range(5)
+]
+
+
+class _Method:
+    def __init__(self, failing=None):
+        self.lock = threading.Lock()
+        self.tokens = []
+        self.failing = failing
+
+    def __call__(self, request, metadata=()):
+        with self.lock:
+            self.tokens.append(request.page_token)
+        if request.page_token == self.failing:
+            raise core_exceptions.ServiceUnavailable("unavailable")
+        return PAGES[int(request.page_token.split("-")[1])]
+
+    def wait_for(self, count):
+        deadline = time.monotonic() + 5
+        while len(self.tokens) < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+        # Give the worker the chance to run further ahead than it should.
+        time.sleep(0.05)
+        return len(self.tokens)
+
+
+def _names(pages):
+    return [image.name for page in pages for image in page.items]
+
+
+def _response(message):
+    response = Response()
+    response.status_code = 200
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _prefetch_threads():
+    return [
+        thread
+        for thread in threading.enumerate()
+        if thread.name == "PagerPrefetch" and thread.is_alive()
+    ]
+
+
+def test_pages():
+    method = _Method()
+    request = compute_v1.ListImagesRequest(project="p")
+    pages = list(_prefetch.pages(method, request, PAGES[0], 2))
+    assert pages == list(zip(["", "token-1", "token-2", "token-3", "token-4"], PAGES))
+    assert request.page_token == ""
+    assert method.tokens == ["token-1", "token-2", "token-3", "token-4"]
+
+
+def test_pages_single_page():
+    method = _Method()
+    request = compute_v1.ListImagesRequest(project="p")
+    assert list(_prefetch.pages(method, request, PAGES[4], 2)) == [("", PAGES[4])]
+    assert method.tokens == []
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+def test_pages_bounded(depth):
+    method = _Method()
+    request = compute_v1.ListImagesRequest(project="p")
+    pages = _prefetch.pages(method, request, PAGES[0], depth)
+    assert next(pages)[1] is PAGES[0]
+    assert method.wait_for(depth) == depth
+    assert next(pages)[1] is PAGES[1]
+    assert method.wait_for(depth + 1) == depth + 1
+    pages.close()
+
+
+def test_pages_error():
+    method = _Method(failing="token-2")
+    request = compute_v1.ListImagesRequest(project="p")
+    pages = _prefetch.pages(method, request, PAGES[0], 3)
+    assert next(pages)[1] is PAGES[0]
+    assert next(pages)[1] is PAGES[1]
+    with pytest.raises(core_exceptions.ServiceUnavailable):
+        next(pages)
+    assert method.tokens == ["token-1", "token-2"]
+
+
+def test_pages_abandoned():
+    method = _Method()
+    request = compute_v1.ListImagesRequest(project="p")
+    pages = _prefetch.pages(method, request, PAGES[0], 1)
+    next(pages)
+    next(pages)
+    method.wait_for(2)
+    pages.close()
+    deadline = time.monotonic() + 5
+    while _prefetch_threads() and time.monotonic() < deadline:
+        time.sleep(0.001)
+    assert not _prefetch_threads()
+    assert method.tokens == ["token-1", "token-2"]
+
+
+def test_async_pages():
+    method = _Method(failing="token-3")
+
+    async def call(request, metadata=()):
+        await asyncio.sleep(0)
+        return method(request, metadata)
+
+    async def collect():
+        request = compute_v1.ListImagesRequest(project="p")
+        pages = []
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            async for _, page in _prefetch.async_pages(call, request, PAGES[0], 2):
+                pages.append(page)
+        return pages
+
+    assert asyncio.run(collect()) == PAGES[:3]
+
+
+def test_list_prefetch():
+    client = compute_v1.ImagesClient(credentials=ga_credentials.AnonymousCredentials())
+
+    def request(method, url, **kwargs):
+        token = dict(kwargs["params"]).get("pageToken", "token-0")
+        return _response(PAGES[int(token.split("-")[1])])
+
+    with mock.patch.object(Session, "request", side_effect=request) as req:
+        pager = client.list(project="p", prefetch=2)
+        names = [image.name for image in pager]
+    assert names == _names(PAGES)
+    assert req.call_count == 5
+    assert pager.next_page_token == ""
+
+
+def test_list_prefetch_invalid():
+    client = compute_v1.ImagesClient(credentials=ga_credentials.AnonymousCredentials())
+    with pytest.raises(ValueError):
+        client.list(project="p", prefetch=-1)
@@ -0,0 +1,216 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import json
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import rate_limiting
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def _limiter(clock, **kwargs):
+    return rate_limiting.TokenBucketLimiter(
+        {rate_limiting.READ: 120, rate_limiting.MUTATION: 60}, clock=clock, **kwargs
+    )
+
+
+def test_burst_then_quota_rate():
+    clock = _Clock()
+    limiter = _limiter(clock)
+    with mock.patch("time.sleep", side_effect=clock.sleep) as sleep:
+        for _ in range(4):
+            limiter.acquire("p", rate_limiting.READ)
+    # Two reads per second, of which the first two are sent at once.
+    assert [call.args[0] for call in sleep.mock_calls] == [0.5, 0.5]
+    assert clock.now == 1.0
+
+
+def test_bucket_refills():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=3)
+    with mock.patch("time.sleep") as sleep:
+        for _ in range(3):
+            limiter.acquire("p", rate_limiting.READ)
+        clock.now = 60.0
+        for _ in range(3):
+            limiter.acquire("p", rate_limiting.READ)
+    sleep.assert_not_called()
+
+
+def test_waiting_calls_reserve_in_order():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=1)
+    delays = [limiter._reserve("p", rate_limiting.MUTATION)[1] for _ in range(4)]
+    assert delays == [0.0, 1.0, 2.0, 3.0]
+    assert limiter.queue_depth() == 3
+
+
+def test_buckets_per_project_and_category():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=1)
+    with mock.patch("time.sleep") as sleep:
+        limiter.acquire("p1", rate_limiting.READ)
+        limiter.acquire("p2", rate_limiting.READ)
+        limiter.acquire("p1", rate_limiting.MUTATION)
+        # Categories without a quota are not paced.
+        for _ in range(10):
+            limiter.acquire("p1", rate_limiting.LIST)
+    sleep.assert_not_called()
+
+
+def test_queue_depth():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=1)
+    for project in ("p1", "p1", "p1", "p2", "p2"):
+        limiter._reserve(project, rate_limiting.READ)
+    limiter._reserve("p1", rate_limiting.MUTATION)
+    limiter._reserve("p1", rate_limiting.MUTATION)
+    assert limiter.queue_depth() == 4
+    assert limiter.queue_depth("p1") == 3
+    assert limiter.queue_depth(category=rate_limiting.READ) == 3
+    assert limiter.queue_depth("p2", rate_limiting.MUTATION) == 0
+
+
+def test_queue_depth_after_wait():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=1)
+
+    def sleep(seconds):
+        assert limiter.queue_depth("p") == 1
+        clock.sleep(seconds)
+
+    with mock.patch("time.sleep", side_effect=sleep):
+        limiter.acquire("p", rate_limiting.READ)
+        limiter.acquire("p", rate_limiting.READ)
+    assert limiter.queue_depth() == 0
+
+
+def test_acquire_async():
+    clock = _Clock()
+    limiter = _limiter(clock, burst=1)
+
+    async def sleep(seconds):
+        clock.sleep(seconds)
+
+    async def acquire():
+        for _ in range(3):
+            await limiter.acquire_async("p", rate_limiting.MUTATION)
+
+    with mock.patch("asyncio.sleep", side_effect=sleep):
+        asyncio.run(acquire())
+    assert clock.now == 2.0
+    assert limiter.queue_depth() == 0
+
+
+def test_invalid_quota():
+    with pytest.raises(ValueError, match="positive"):
+        rate_limiting.TokenBucketLimiter({rate_limiting.READ: 0})
+
+
+def test_limit():
+    limiter = mock.Mock(spec=rate_limiting.RateLimiter)
+    func = mock.Mock(return_value="response")
+    assert rate_limiting.limit(func, None, rate_limiting.READ) is func
+
+    limited = rate_limiting.limit(func, limiter, rate_limiting.READ)
+    request = compute_v1.GetInstanceRequest(project="p")
+    assert limited(request, timeout=5) == "response"
+    limiter.acquire.assert_called_once_with("p", rate_limiting.READ)
+    func.assert_called_once_with(request, timeout=5)
+
+
+def test_limit_async():
+    limiter = mock.Mock(spec=rate_limiting.RateLimiter)
+    limiter.acquire_async = mock.AsyncMock()
+
+    async def func(request):
+        return "response"
+
+    limited = rate_limiting.limit(func, limiter, rate_limiting.LIST)
+    assert asyncio.run(limited(compute_v1.ListZonesRequest(project="p"))) == (
+        "response"
+    )
+    limiter.acquire_async.assert_awaited_once_with("p", rate_limiting.LIST)
+
+
+def _response(payload):
+    response = Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def test_clients_share_limiter():
+    limiter = mock.Mock(spec=rate_limiting.RateLimiter)
+    options = compute_v1.ClientOptions(rate_limiter=limiter)
+    instances = compute_v1.InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials(), client_options=options,
+    )
+    disks = compute_v1.DisksClient(
+        credentials=ga_credentials.AnonymousCredentials(), client_options=options,
+    )
+    responses = [_response({"name": "instance-1"}), _response({})]
+    with mock.patch.object(Session, "request", side_effect=responses):
+        instances.get(project="p1", zone="z", instance="instance-1")
+        disks.list(project="p2", zone="z")
+    assert limiter.acquire.mock_calls == [
+        mock.call("p1", rate_limiting.READ),
+        mock.call("p2", rate_limiting.LIST),
+    ]
+
+
+def test_limiter_paces_each_attempt():
+    limiter = mock.Mock(spec=rate_limiting.RateLimiter)
+    client = compute_v1.InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        client_options={"rate_limiter": limiter},
+    )
+    unavailable = _response({"error": {"code": 503, "message": "error"}})
+    unavailable.status_code = 503
+    responses = [unavailable, _response({"name": "operation-1"})]
+    with mock.patch.object(Session, "request", side_effect=responses):
+        with mock.patch("time.sleep"):
+            client.start_unary(project="p", zone="z", instance="i")
+    assert limiter.acquire.mock_calls == [mock.call("p", rate_limiting.MUTATION)] * 2
+
+
+def test_rate_limiter_with_transport_instance():
+    transport = compute_v1.services.instances.transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with pytest.raises(ValueError, match="rate limiter"):
+        compute_v1.InstancesClient(
+            transport=transport,
+            client_options={"rate_limiter": rate_limiting.TokenBucketLimiter({})},
+        )
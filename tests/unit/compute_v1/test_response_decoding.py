@@ -0,0 +1,261 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import json
+
+import mock
+import pytest
+
+from google.protobuf import json_format
+
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1.types import compute
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    loads = response_decoding._loads
+    yield
+    response_decoding._loads = loads
+
+
+def _assert_same(message_type, payload):
+    expected = message_type.from_json(payload, ignore_unknown_fields=True)
+    actual = response_decoding.from_json(message_type, payload)
+    assert isinstance(actual, message_type)
+    assert actual._pb.SerializeToString(
+        deterministic=True
+    ) == expected._pb.SerializeToString(deterministic=True)
+    return actual
+
+
+PAYLOADS = [
+    {
+        "id": "7000000000000000001",
+        "items": {
+            "zones/us-central1-a": {
+                "instances": [
+                    {
+                        "id": "18446744073709551615",
+                        "name": "vm",
+                        "canIpForward": False,
+                        "labels": {"env": "prod"},
+                        "disks": [{"diskSizeGb": "20", "licenses": ["l"]}],
+                        "scheduling": {},
+                        "notAField": {"nested": [1, 2]},
+                        "cpuPlatform": None,
+                    }
+                ]
+            },
+            "zones/us-east1-b": {
+                "warning": {
+                    "code": "NO_RESULTS_ON_PAGE",
+                    "data": [{"key": "scope", "value": "zones/us-east1-b"}],
+                }
+            },
+        },
+        "next_page_token": "abc",
+        "unreachables": [],
+    },
+    {},
+]
+
+
+@pytest.mark.parametrize("backend", ["json", "orjson", json.loads])
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_from_json(backend, payload):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    response_decoding.set_json_backend(backend)
+
+    encoded = json.dumps(payload).encode("utf-8")
+    with mock.patch.object(compute.InstanceAggregatedList, "from_json") as reference:
+        reference.side_effect = AssertionError("fast path not taken")
+        actual = response_decoding.from_json(compute.InstanceAggregatedList, encoded)
+
+    _assert_same(compute.InstanceAggregatedList, encoded)
+    assert actual == compute.InstanceAggregatedList.from_json(
+        encoded, ignore_unknown_fields=True
+    )
+
+
+def test_from_json_scalar_types():
+    response_decoding.set_json_backend("json")
+    payload = json.dumps(
+        {
+            "status": "DONE",
+            "progress": 100,
+            "targetId": "123",
+            "warnings": [{"code": "UNKNOWN_CODE"}],
+        }
+    )
+    operation = _assert_same(compute.Operation, payload)
+    assert operation.status == compute.Operation.Status.DONE
+    assert operation.target_id == 123
+
+    # Unknown enum values are dropped, like with ignore_unknown_fields.
+    operation = _assert_same(compute.Operation, '{"status": "SOMETHING_NEW"}')
+    assert "status" not in operation
+
+    # Floats accept the special JSON spellings.
+    _assert_same(
+        compute.AutoscalingPolicyCpuUtilization, '{"utilizationTarget": "NaN"}',
+    )
+    _assert_same(compute.AutoscalingPolicyCpuUtilization, '{"utilizationTarget": 0.6}')
+
+
+@pytest.mark.parametrize(
+    "payload", [b"not json", b'{"id": 1.5}', b'{"items": {"zone": 5}}', b'{"id": {}}'],
+)
+def test_from_json_invalid(payload):
+    response_decoding.set_json_backend("json")
+    with pytest.raises(json_format.ParseError):
+        compute.InstanceAggregatedList.from_json(payload, ignore_unknown_fields=True)
+    with pytest.raises(json_format.ParseError):
+        response_decoding.from_json(compute.InstanceAggregatedList, payload)
+
+
+def test_json_format_backend():
+    response_decoding.set_json_backend("json_format")
+    with mock.patch.object(compute.Zone, "from_json") as reference:
+        response_decoding.from_json(compute.Zone, b"{}")
+    reference.assert_called_once_with(b"{}", ignore_unknown_fields=True)
+
+
+def test_set_json_backend_unknown():
+    with pytest.raises(ValueError):
+        response_decoding.set_json_backend("simdjson")
+
+
+def test_auto_backend_without_orjson():
+    with mock.patch.dict("sys.modules", {"orjson": None}):
+        response_decoding.set_json_backend("auto")
+    assert response_decoding._loads is json.loads
+
+
+def test_backend_from_environment(monkeypatch):
+    monkeypatch.setenv(response_decoding.JSON_BACKEND_ENV, "json")
+    response_decoding._loads = response_decoding._UNSET
+    response_decoding.from_json(compute.Zone, b'{"name": "z"}')
+    assert response_decoding._loads is json.loads
+
+
+def test_converters():
+    assert response_decoding._to_int(5) == 5
+    assert response_decoding._to_int("-5") == -5
+    with pytest.raises(TypeError):
+        response_decoding._to_int(5.5)
+    assert response_decoding._to_bytes("AP8") == b"\x00\xff"
+    assert response_decoding._to_bytes("-_8") == b"\xfb\xff"
+
+
+INSTANCE = {
+    "id": "18446744073709551615",
+    "name": "vm",
+    "status": "RUNNING",
+    "labels": {"env": "prod"},
+    "tags": {"items": ["http-server"]},
+    "disks": [{"diskSizeGb": "20", "type": "PERSISTENT"}],
+    "networkInterfaces": [{"accessConfigs": [{"type": "ONE_TO_ONE_NAT"}]}],
+    "notAField": 1,
+    "cpuPlatform": None,
+}
+
+
+def _view(message_type, obj, backend="json"):
+    response_decoding.set_json_backend(backend)
+    view = response_decoding.from_json(message_type, json.dumps(obj), lazy=True)
+    assert isinstance(view, response_decoding.LazyMessage)
+    return view
+
+
+@pytest.mark.parametrize("backend", ["json", "json_format"])
+def test_lazy_fields(backend):
+    view = _view(compute.Instance, INSTANCE, backend)
+    expected = compute.Instance.from_json(
+        json.dumps(INSTANCE), ignore_unknown_fields=True
+    )
+
+    assert view.id == expected.id == 18446744073709551615
+    assert view.name == "vm"
+    assert view.labels == {"env": "prod"}
+    assert view.tags.items == ["http-server"]
+    assert view.disks[0].disk_size_gb == 20
+    assert view.disks[0].type_ == "PERSISTENT"
+    assert view.network_interfaces[0].access_configs[0].type_ == "ONE_TO_ONE_NAT"
+    assert isinstance(view.scheduling, response_decoding.LazyMessage)
+    assert view.scheduling.automatic_restart is False
+    assert view.cpu_platform == "" and view.service_accounts == []
+    assert view.to_message() == expected
+    assert view == expected and view == _view(compute.Instance, INSTANCE)
+    assert view.to_message() is view.to_message()
+
+
+def test_lazy_fields_decoded_once():
+    view = _view(compute.Instance, INSTANCE)
+    assert view.disks is view.disks
+    assert "disks" in view._cache and "labels" not in view._cache
+
+
+def test_lazy_contains():
+    view = _view(compute.Instance, dict(INSTANCE, scheduling={}, metadata=None))
+    assert "name" in view
+    assert "scheduling" in view
+    assert "metadata" not in view
+    assert "cpu_platform" not in view
+    assert "service_accounts" not in view
+    assert "not_a_field" not in view
+
+
+def test_lazy_page():
+    page = _view(
+        compute.InstanceAggregatedList,
+        {"items": {"zones/a": {"instances": [INSTANCE]}}, "nextPageToken": "abc"},
+    )
+    assert page.next_page_token == "abc"
+    assert page.raw_page is page
+    assert page.items["zones/a"].instances[0].name == "vm"
+    assert page.items.get("zones/b") is None
+
+
+def test_lazy_read_only():
+    view = _view(compute.Instance, INSTANCE)
+    with pytest.raises(AttributeError):
+        view.name = "other"
+    with pytest.raises(AttributeError):
+        view.not_a_field
+    assert "network_interfaces" in dir(view)
+
+
+def test_lazy_pickle():
+    import pickle
+
+    view = pickle.loads(pickle.dumps(_view(compute.Instance, INSTANCE)))
+    assert view.name == "vm"
+
+
+def test_lazy_invalid_value_raises_on_access():
+    view = _view(compute.Instance, dict(INSTANCE, id=5.5))
+    assert view.name == "vm"
+    with pytest.raises(TypeError):
+        view.id
+    with pytest.raises(json_format.ParseError):
+        view.to_message()
+
+
+@pytest.mark.parametrize("payload", [b"not json", b"{"])
+def test_lazy_invalid_payload(payload):
+    with pytest.raises(json_format.ParseError):
+        response_decoding.from_json(compute.Instance, payload, lazy=True)
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import asyncio
+import email.utils
+import json
+import time
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import retry_policy
+
+
+def _response(status_code, payload=None, headers=None):
+    response = Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    response._content = json.dumps(payload or {}).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _error(status_code, reason=None, headers=None):
+    payload = {"error": {"code": status_code, "message": "error"}}
+    if reason:
+        payload["error"]["errors"] = [{"reason": reason, "message": "error"}]
+    return core_exceptions.from_http_response(_response(status_code, payload, headers))
+
+
+@pytest.mark.parametrize(
+    "exc, rate_limited, transient",
+    [
+        (_error(429), True, True),
+        (_error(403, "rateLimitExceeded"), True, True),
+        (_error(403, "userRateLimitExceeded"), True, True),
+        (_error(403, "quotaExceeded"), False, False),
+        (_error(403), False, False),
+        (_error(500), False, True),
+        (_error(502), False, True),
+        (_error(503), False, True),
+        (_error(504), False, True),
+        (_error(400), False, False),
+        (_error(404), False, False),
+        (ValueError("boom"), False, False),
+    ],
+)
+def test_predicates(exc, rate_limited, transient):
+    assert retry_policy.if_rate_limited(exc) is rate_limited
+    assert retry_policy.if_transient(exc) is transient
+
+
+def test_retry_after():
+    assert retry_policy.retry_after(_error(503)) is None
+    assert retry_policy.retry_after(ValueError()) is None
+    assert retry_policy.retry_after(_error(429, headers={"Retry-After": "7"})) == 7.0
+    assert retry_policy.retry_after(_error(429, headers={"Retry-After": "-1"})) == 0.0
+    assert retry_policy.retry_after(_error(429, headers={"Retry-After": "?"})) is None
+
+    when = email.utils.formatdate(time.time() + 30, usegmt=True)
+    delay = retry_policy.retry_after(_error(503, headers={"Retry-After": when}))
+    assert 25.0 < delay <= 30.0
+    past = email.utils.formatdate(time.time() - 30, usegmt=True)
+    assert retry_policy.retry_after(_error(503, headers={"Retry-After": past})) == 0.0
+
+
+def test_retry_until_success():
+    func = mock.Mock(side_effect=[_error(503), _error(429), "done"])
+    retry = retry_policy.Retry(initial=1.0, maximum=2.0, multiplier=2.0)
+    with mock.patch("time.sleep") as sleep:
+        assert retry(func)("request", timeout=3) == "done"
+    assert func.call_count == 3
+    func.assert_called_with("request", timeout=3)
+    first, second = [call.args[0] for call in sleep.call_args_list]
+    assert 0.0 <= first <= 1.0
+    assert 0.0 <= second <= 2.0
+
+
+def test_retry_honors_retry_after():
+    func = mock.Mock(side_effect=[_error(429, headers={"Retry-After": "5"}), "done"])
+    with mock.patch("time.sleep") as sleep:
+        assert retry_policy.Retry(initial=0.1)(func)() == "done"
+    sleep.assert_called_once_with(5.0)
+
+
+def test_retry_does_not_retry_other_errors():
+    func = mock.Mock(side_effect=_error(400))
+    with mock.patch("time.sleep") as sleep:
+        with pytest.raises(core_exceptions.BadRequest):
+            retry_policy.Retry()(func)()
+    assert func.call_count == 1
+    sleep.assert_not_called()
+
+
+def test_retry_timeout():
+    func = mock.Mock(side_effect=_error(429, headers={"Retry-After": "60"}))
+    with mock.patch("time.sleep") as sleep:
+        with pytest.raises(core_exceptions.RetryError) as exc_info:
+            retry_policy.Retry(timeout=30.0)(func)()
+    assert func.call_count == 1
+    sleep.assert_not_called()
+    assert isinstance(exc_info.value.cause, core_exceptions.TooManyRequests)
+
+
+def test_retry_sets_request_id_once():
+    request = compute_v1.InsertInstanceRequest(project="p", zone="z")
+    seen = []
+
+    def func(request):
+        seen.append(request.request_id)
+        if len(seen) < 3:
+            raise _error(503)
+        return "done"
+
+    with mock.patch("time.sleep"):
+        assert retry_policy.Retry(set_request_id=True)(func)(request) == "done"
+    assert len(set(seen)) == 1
+    assert seen[0] != ""
+    # The request of the caller is left unchanged.
+    assert request.request_id == ""
+
+
+def test_retry_keeps_request_id():
+    request = compute_v1.InsertInstanceRequest(request_id="my-id")
+    func = mock.Mock(return_value="done")
+    retry_policy.Retry(set_request_id=True)(func)(request)
+    assert request.request_id == "my-id"
+
+
+def test_async_retry():
+    calls = []
+
+    async def func(request):
+        calls.append(request)
+        if len(calls) < 2:
+            raise _error(503)
+        return "done"
+
+    async def no_sleep(delay):
+        pass
+
+    with mock.patch("asyncio.sleep", side_effect=no_sleep) as sleep:
+        result = asyncio.run(retry_policy.AsyncRetry()(func)("request"))
+    assert result == "done"
+    assert calls == ["request", "request"]
+    assert sleep.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "kind, set_request_id, predicate",
+    [
+        (retry_policy.READ, False, retry_policy.if_transient),
+        (retry_policy.MUTATION, True, retry_policy.if_transient),
+        (retry_policy.UNKEYED_MUTATION, False, retry_policy.if_rate_limited),
+    ],
+)
+def test_profile_retry(kind, set_request_id, predicate):
+    profile = retry_policy.RetryProfile(initial=2.0, timeout=10.0)
+    retry = profile.retry(kind)
+    assert type(retry) is retry_policy.Retry
+    assert retry._set_request_id is set_request_id
+    assert retry._predicate is predicate
+    assert retry._initial == 2.0
+    assert retry._timeout == 10.0
+    assert type(profile.retry(kind, asynchronous=True)) is retry_policy.AsyncRetry
+
+
+def test_profile_unknown_kind():
+    with pytest.raises(ValueError):
+        retry_policy.RetryProfile().retry("nope")
+
+
+def test_policy_profiles():
+    read = retry_policy.RetryProfile(timeout=1.0)
+    policy = retry_policy.RetryPolicy(read=read, methods={"insert": None})
+    assert policy.profile("get", retry_policy.READ) is read
+    assert policy.profile("insert", retry_policy.MUTATION) is None
+    assert (
+        policy.profile("stop", retry_policy.MUTATION)
+        is retry_policy.DEFAULT_MUTATION_PROFILE
+    )
+    assert policy.profile("wait", retry_policy.READ).timeout == 600.0
+
+
+def _client(**options):
+    return compute_v1.InstancesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport="rest",
+        client_options=options,
+    )
+
+
+def test_client_retries_reads():
+    responses = [
+        _response(503),
+        _response(200, {"name": "instance-1", "status": "RUNNING"}),
+    ]
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        with mock.patch("time.sleep"):
+            instance = _client().get(project="p", zone="z", instance="instance-1")
+    assert instance.name == "instance-1"
+    assert req.call_count == 2
+    # The default timeout applies to every attempt.
+    assert 0 < req.call_args.kwargs["timeout"] <= 120.0
+
+
+def test_client_retries_mutations_with_one_request_id():
+    responses = [
+        _response(429, headers={"Retry-After": "1"}),
+        _response(503),
+        _response(200, {"name": "operation-1", "status": "DONE"}),
+    ]
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        with mock.patch("time.sleep"):
+            _client().insert_unary(
+                project="p", zone="z", instance_resource={"name": "instance-1"}
+            )
+    request_ids = {dict(call.kwargs["params"])["requestId"] for call in req.mock_calls}
+    assert req.call_count == 3
+    assert len(request_ids) == 1
+
+
+def test_client_request_sent_twice_gets_two_request_ids():
+    request = compute_v1.InsertInstanceRequest(
+        project="p", zone="z", instance_resource={"name": "instance-1"}
+    )
+    responses = [
+        _response(200, {"name": "operation-{}".format(i), "status": "DONE"})
+        for i in range(2)
+    ]
+    with mock.patch.object(Session, "request", side_effect=responses) as req:
+        client = _client()
+        client.insert_unary(request=request)
+        client.insert_unary(request=request)
+    request_ids = [dict(call.kwargs["params"])["requestId"] for call in req.mock_calls]
+    assert len(set(request_ids)) == 2
+    assert request.request_id == ""
+
+
+def test_client_unkeyed_mutations_retry_rate_limits_only():
+    with mock.patch.object(Session, "request", side_effect=[_response(503)]) as req:
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            _client().set_iam_policy(
+                project="p",
+                zone="z",
+                resource="r",
+                zone_set_policy_request_resource=compute_v1.ZoneSetPolicyRequest(
+                    etag="e"
+                ),
+            )
+    assert req.call_count == 1
+
+
+def test_client_retry_policy_option():
+    policy = retry_policy.RetryPolicy(read=None)
+    with mock.patch.object(Session, "request", side_effect=[_response(503)]) as req:
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            _client(retry_policy=policy).get(project="p", zone="z", instance="i")
+    assert req.call_count == 1
+    assert req.call_args.kwargs["timeout"] is None
+
+
+def test_client_call_retry_takes_precedence():
+    with mock.patch.object(Session, "request", side_effect=[_response(503)]) as req:
+        with pytest.raises(core_exceptions.ServiceUnavailable):
+            _client().get(project="p", zone="z", instance="i", retry=None, timeout=5.0)
+    assert req.call_count == 1
+    assert req.call_args.kwargs["timeout"] == 5.0
+
+
+def test_retry_policy_with_transport_instance():
+    transport = compute_v1.services.instances.transports.InstancesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials()
+    )
+    with pytest.raises(ValueError, match="retry policy"):
+        compute_v1.InstancesClient(
+            transport=transport,
+            client_options={"retry_policy": retry_policy.RetryPolicy()},
+        )
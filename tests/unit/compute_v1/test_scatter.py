@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import threading
+import urllib.parse
+
+import mock
+import pytest
+from requests import Response
+from requests.sessions import Session
+
+from google.api_core import exceptions as core_exceptions
+from google.api_core import retry as retries
+from google.auth import credentials as ga_credentials
+
+from google.cloud import compute_v1
+from google.cloud.compute_v1 import _scatter
+
+PATH = "/compute/v1/projects/p"
+NO_RESULTS = compute_v1.DisksScopedList(
+    warning=compute_v1.Warning(code="NO_RESULTS_ON_PAGE")
+)
+
+
+def _response(message, status_code=200):
+    response = Response()
+    response.status_code = status_code
+    response._content = type(message).to_json(message).encode("utf-8")
+    response.request = mock.Mock(method="GET", url="https://example.com")
+    return response
+
+
+def _disks(*names):
+    return [compute_v1.Disk(name=name) for name in names]
+
+
+AGGREGATED_PAGES = {
+    "": compute_v1.DiskAggregatedList(
+        items={
+            "zones/a": compute_v1.DisksScopedList(disks=_disks("a1")),
+            "zones/b": NO_RESULTS,
+            "regions/r": NO_RESULTS,
+        },
+        next_page_token="aggregated-2",
+    ),
+    "aggregated-2": compute_v1.DiskAggregatedList(
+        items={
+            "zones/a": compute_v1.DisksScopedList(disks=_disks("a2")),
+            "zones/b": NO_RESULTS,
+            "regions/r": compute_v1.DisksScopedList(disks=_disks("r1")),
+        },
+    ),
+}
+LIST_PAGES = {
+    (PATH + "/zones/a/disks", ""): compute_v1.DiskList(
+        items=_disks("a1"), next_page_token="a-2"
+    ),
+    (PATH + "/zones/a/disks", "a-2"): compute_v1.DiskList(items=_disks("a2")),
+    (PATH + "/zones/b/disks", ""): compute_v1.DiskList(),
+    (PATH + "/regions/r/disks", ""): compute_v1.DiskList(items=_disks("r1")),
+}
+
+
+def _send(calls, failing=None):
+    lock = threading.Lock()
+
+    def request(method, url, **kwargs):
+        path = urllib.parse.urlsplit(url).path
+        params = dict(kwargs.get("params", ()))
+        with lock:
+            calls.append((path, params))
+        token = params.get("pageToken", "")
+        if path == PATH + "/aggregated/disks":
+            return _response(AGGREGATED_PAGES[token])
+        if path == failing:
+            return _response(compute_v1.DiskList(), status_code=404)
+        return _response(LIST_PAGES[path, token])
+
+    return request
+
+
+def _client():
+    return compute_v1.DisksClient(credentials=ga_credentials.AnonymousCredentials())
+
+
+def _contents(pages):
+    contents = {}
+    for page in pages:
+        for key, scoped_list in page.items.items():
+            contents.setdefault(key, []).extend(disk.name for disk in scoped_list.disks)
+    return {key: sorted(names) for key, names in contents.items() if names}
+
+
+@pytest.mark.parametrize(
+    "service, kind, expected",
+    [
+        ("instances", "zones", "instances"),
+        ("disks", "zones", "disks"),
+        ("disks", "regions", "region_disks"),
+        ("addresses", "regions", "addresses"),
+        ("addresses", "global", "global_addresses"),
+        ("global_operations", "zones", "zone_operations"),
+        ("global_operations", "global", "global_operations"),
+        ("instances", "regions", None),
+        ("disks", "unknown", None),
+    ],
+)
+def test_lister(service, kind, expected):
+    assert _scatter.lister(service, kind) == expected
+
+
+def test_aggregated_list_parallel():
+    calls = []
+    client = _client()
+    with mock.patch.object(Session, "request", side_effect=_send(calls)):
+        pager = client.aggregated_list(project="p", parallel=2)
+        pages = list(pager.pages)
+
+    # One page per scope, with the same resources as the aggregated pages.
+    assert len(pages) == 3
+    assert all(len(page.items) == 1 for page in pages)
+    assert _contents(pages) == _contents(AGGREGATED_PAGES.values())
+    empty = [page.items["zones/b"] for page in pages if "zones/b" in page.items]
+    assert empty == [NO_RESULTS]
+    # The following aggregated page is never requested.
+    assert sorted(path for path, _ in calls) == [
+        PATH + "/aggregated/disks",
+        PATH + "/regions/r/disks",
+        PATH + "/zones/a/disks",
+        PATH + "/zones/a/disks",
+        PATH + "/zones/b/disks",
+    ]
+
+
+def test_aggregated_list_parallel_copies_request_fields():
+    calls = []
+    client = _client()
+    request = compute_v1.AggregatedListDisksRequest(
+        project="p", filter='name eq "a.*"', return_partial_success=True
+    )
+    with mock.patch.object(Session, "request", side_effect=_send(calls)):
+        list(client.aggregated_list(request=request, parallel=2))
+
+    for path, params in calls:
+        assert params["filter"] == 'name eq "a.*"'
+        assert params["returnPartialSuccess"] in (True, "True", "true")
+
+
+def test_aggregated_list_parallel_single_page():
+    calls = []
+    client = _client()
+    with mock.patch.object(Session, "request", side_effect=_send(calls)):
+        pager = client.aggregated_list(
+            request={"project": "p", "page_token": "aggregated-2"}, parallel=2
+        )
+        pages = list(pager.pages)
+
+    assert pages == [AGGREGATED_PAGES["aggregated-2"]]
+    assert len(calls) == 1
+
+
+def test_aggregated_list_parallel_falls_back_to_pages():
+    calls = []
+    client = _client()
+    with mock.patch.object(Session, "request", side_effect=_send(calls)):
+        with mock.patch.object(_scatter, "lister", return_value=None):
+            pages = list(client.aggregated_list(project="p", parallel=2).pages)
+
+    assert pages == list(AGGREGATED_PAGES.values())
+    assert [path for path, _ in calls] == [PATH + "/aggregated/disks"] * 2
+
+
+def test_aggregated_list_parallel_error():
+    calls = []
+    client = _client()
+    send = _send(calls, failing=PATH + "/regions/r/disks")
+    with mock.patch.object(Session, "request", side_effect=send):
+        pager = client.aggregated_list(project="p", parallel=1)
+        with pytest.raises(core_exceptions.NotFound):
+            list(pager)
+
+
+def test_aggregated_list_parallel_call_options():
+    calls = []
+    send = _send([])
+
+    def request(method, url, **kwargs):
+        calls.append(kwargs)
+        return send(method, url, **kwargs)
+
+    client = _client()
+    with mock.patch.object(Session, "request", side_effect=request):
+        pager = client.aggregated_list(
+            project="p",
+            parallel=2,
+            timeout=7.0,
+            metadata=[("x-test", "1")],
+            prefetch=1,
+            page_sizer=compute_v1.AdaptivePageSize(initial=50),
+        )
+        list(pager)
+
+    # The list requests of the scopes have the options of the aggregated
+    # list; as with any pager, following pages only keep the metadata.
+    assert len(calls) == 5
+    for kwargs in calls:
+        params = dict(kwargs["params"])
+        assert kwargs["headers"]["x-test"] == "1"
+        assert "maxResults" in params
+        if "pageToken" not in params:
+            assert kwargs["timeout"] == 7.0
+
+
+def test_aggregated_list_parallel_retry():
+    calls = []
+    failing = [PATH + "/regions/r/disks"]
+    send = _send(calls, failing=PATH + "/regions/r/disks")
+
+    def request(method, url, **kwargs):
+        path = urllib.parse.urlsplit(url).path
+        if path in failing:
+            # Fail once.
+            failing.remove(path)
+            return send(method, url, **kwargs)
+        return _send([])(method, url, **kwargs)
+
+    retry = retries.Retry(
+        predicate=retries.if_exception_type(core_exceptions.NotFound),
+        initial=0.01,
+        maximum=0.01,
+    )
+    client = _client()
+    with mock.patch.object(Session, "request", side_effect=request):
+        pager = client.aggregated_list(project="p", parallel=2, retry=retry)
+        pages = list(pager.pages)
+
+    assert _contents(pages) == _contents(AGGREGATED_PAGES.values())
+    assert calls == [(PATH + "/regions/r/disks", mock.ANY)]
+
+
+def test_aggregated_list_parallel_invalid_arguments():
+    client = _client()
+    with pytest.raises(ValueError):
+        client.aggregated_list(project="p", parallel=0)
+    with pytest.raises(ValueError):
+        client.aggregated_list(project="p", parallel=2, views=True)
+    with pytest.raises(ValueError):
+        client.aggregated_list(project="p", parallel=2, fields="items")
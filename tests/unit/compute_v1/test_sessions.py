@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+# Copyright 2020 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import socket
+
+import mock
+import pytest
+
+from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
+
+from google.cloud.compute_v1 import _async_session
+from google.cloud.compute_v1 import sessions
+
+
+def test_create_session():
+    credentials = ga_credentials.AnonymousCredentials()
+    session = sessions.create_session(credentials, pool_maxsize=32, pool_block=True)
+
+    assert isinstance(session, AuthorizedSession)
+    assert session.credentials is credentials
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(prefix + "compute.googleapis.com")
+        assert isinstance(adapter, sessions._PooledHTTPAdapter)
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+
+
+def test_create_session_without_keepalive():
+    session = sessions.create_session(
+        ga_credentials.AnonymousCredentials(), tcp_keepalive=False
+    )
+    adapter = session.get_adapter("https://compute.googleapis.com")
+    assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+
+def test_create_session_default_credentials():
+    credentials = ga_credentials.AnonymousCredentials()
+    with mock.patch("google.auth.default", autospec=True) as adc:
+        adc.return_value = (credentials, None)
+        session = sessions.create_session(quota_project_id="octopus")
+
+    adc.assert_called_once_with(
+        scopes=None, default_scopes=sessions.DEFAULT_SCOPES, quota_project_id="octopus",
+    )
+    assert session.credentials is credentials
+
+
+def test_create_async_session():
+    credentials = ga_credentials.AnonymousCredentials()
+    session = sessions.create_async_session(
+        credentials, max_connections=8, keepalive_timeout=30.0
+    )
+
+    assert isinstance(session, _async_session.AsyncAuthorizedSession)
+    assert session.credentials is credentials
+    assert session._max_connections == 8
+    assert session._keepalive_timeout == 30.0
+
+
+def test_shared_session_across_clients():
+    from google.cloud import compute_v1
+
+    session = sessions.create_session(ga_credentials.AnonymousCredentials())
+    options = compute_v1.ClientOptions(session=session)
+    zones = compute_v1.ZonesClient(client_options=options)
+    regions = compute_v1.RegionsClient(client_options=options)
+
+    assert zones.transport._session is session
+    assert regions.transport._session is session
+    with pytest.raises(ValueError):
+        compute_v1.ZonesClient(client_options=options, transport=zones.transport)
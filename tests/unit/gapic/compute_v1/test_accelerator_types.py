@@ -34,7 +34,15 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.accelerator_types import (
+    AcceleratorTypesAsyncClient,
+)
 from google.cloud.compute_v1.services.accelerator_types import AcceleratorTypesClient
 from google.cloud.compute_v1.services.accelerator_types import pagers
 from google.cloud.compute_v1.services.accelerator_types import transports
@@ -535,6 +543,47 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AggregatedListAcceleratorTypesRequest, dict,]
+)
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AcceleratorTypeAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AcceleratorTypeAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListAcceleratorTypesRequest,
 ):
@@ -589,18 +638,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.AcceleratorTypeAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -780,6 +824,225 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
+    client = AcceleratorTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeAggregatedList(
+                items={
+                    "a": compute.AcceleratorTypesScopedList(),
+                    "b": compute.AcceleratorTypesScopedList(),
+                    "c": compute.AcceleratorTypesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AcceleratorTypeAggregatedList(items={}, next_page_token="def",),
+            compute.AcceleratorTypeAggregatedList(
+                items={"g": compute.AcceleratorTypesScopedList(),},
+                next_page_token="ghi",
+            ),
+            compute.AcceleratorTypeAggregatedList(
+                items={
+                    "h": compute.AcceleratorTypesScopedList(),
+                    "i": compute.AcceleratorTypesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(
+            compute.AcceleratorTypeAggregatedList.to_json(x) for x in response
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeAggregatedList(
+                items={
+                    "a": compute.AcceleratorTypesScopedList(),
+                    "b": compute.AcceleratorTypesScopedList(),
+                    "c": compute.AcceleratorTypesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AcceleratorTypeAggregatedList(items={}, next_page_token="def",),
+            compute.AcceleratorTypeAggregatedList(
+                items={"g": compute.AcceleratorTypesScopedList(),},
+                next_page_token="ghi",
+            ),
+            compute.AcceleratorTypeAggregatedList(
+                items={
+                    "h": compute.AcceleratorTypesScopedList(),
+                    "i": compute.AcceleratorTypesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(
+            compute.AcceleratorTypeAggregatedList.to_json(x) for x in response
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request)
+
+        assert isinstance(pager.get("a"), compute.AcceleratorTypesScopedList)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                compute.AcceleratorTypesScopedList,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.AcceleratorTypesScopedList)
+
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
+):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeAggregatedList(
+                items={
+                    "a": compute.AcceleratorTypesScopedList(),
+                    "b": compute.AcceleratorTypesScopedList(),
+                    "c": compute.AcceleratorTypesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AcceleratorTypeAggregatedList(items={}, next_page_token="def",),
+            compute.AcceleratorTypeAggregatedList(
+                items={"g": compute.AcceleratorTypesScopedList(),},
+                next_page_token="ghi",
+            ),
+            compute.AcceleratorTypeAggregatedList(
+                items={
+                    "h": compute.AcceleratorTypesScopedList(),
+                    "i": compute.AcceleratorTypesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(
+            compute.AcceleratorTypeAggregatedList.to_json(x) for x in response
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.GetAcceleratorTypeRequest, dict,])
 def test_get_rest(request_type):
     client = AcceleratorTypesClient(
@@ -828,23 +1091,72 @@ def test_get_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_get_rest_required_fields(request_type=compute.GetAcceleratorTypeRequest):
-    transport_class = transports.AcceleratorTypesRestTransport
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetAcceleratorTypeRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
 
-    request_init = {}
-    request_init["accelerator_type"] = ""
-    request_init["project"] = ""
-    request_init["zone"] = ""
+    # send a request that will satisfy transcoding
+    request_init = {
+        "project": "sample1",
+        "zone": "sample2",
+        "accelerator_type": "sample3",
+    }
     request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
 
-    # verify fields with default values are dropped
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AcceleratorType(
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            id=205,
+            kind="kind_value",
+            maximum_cards_per_instance=2756,
+            name="name_value",
+            self_link="self_link_value",
+            zone="zone_value",
+        )
 
-    unset_fields = transport_class(
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AcceleratorType.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.AcceleratorType)
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.maximum_cards_per_instance == 2756
+    assert response.name == "name_value"
+    assert response.self_link == "self_link_value"
+    assert response.zone == "zone_value"
+
+
+def test_get_rest_required_fields(request_type=compute.GetAcceleratorTypeRequest):
+    transport_class = transports.AcceleratorTypesRestTransport
+
+    request_init = {}
+    request_init["accelerator_type"] = ""
+    request_init["project"] = ""
+    request_init["zone"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
     ).get._get_unset_required_fields(jsonified_request)
     jsonified_request.update(unset_fields)
@@ -877,18 +1189,13 @@ def test_get_rest_required_fields(request_type=compute.GetAcceleratorTypeRequest
     return_value = compute.AcceleratorType()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1042,6 +1349,43 @@ def test_list_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListAcceleratorTypesRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AcceleratorTypeList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AcceleratorTypeList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_list_rest_required_fields(request_type=compute.ListAcceleratorTypesRequest):
     transport_class = transports.AcceleratorTypesRestTransport
 
@@ -1091,18 +1435,13 @@ def test_list_rest_required_fields(request_type=compute.ListAcceleratorTypesRequ
     return_value = compute.AcceleratorTypeList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1255,6 +1594,164 @@ def test_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_rest_pager_views(transport: str = "rest"):
+    client = AcceleratorTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeList(
+                items=[
+                    compute.AcceleratorType(),
+                    compute.AcceleratorType(),
+                    compute.AcceleratorType(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.AcceleratorTypeList(items=[], next_page_token="def",),
+            compute.AcceleratorTypeList(
+                items=[compute.AcceleratorType(),], next_page_token="ghi",
+            ),
+            compute.AcceleratorTypeList(
+                items=[compute.AcceleratorType(), compute.AcceleratorType(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AcceleratorTypeList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeList(
+                items=[
+                    compute.AcceleratorType(),
+                    compute.AcceleratorType(),
+                    compute.AcceleratorType(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.AcceleratorTypeList(items=[], next_page_token="def",),
+            compute.AcceleratorTypeList(
+                items=[compute.AcceleratorType(),], next_page_token="ghi",
+            ),
+            compute.AcceleratorTypeList(
+                items=[compute.AcceleratorType(), compute.AcceleratorType(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AcceleratorTypeList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.AcceleratorType) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeList(
+                items=[
+                    compute.AcceleratorType(),
+                    compute.AcceleratorType(),
+                    compute.AcceleratorType(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.AcceleratorTypeList(items=[], next_page_token="def",),
+            compute.AcceleratorTypeList(
+                items=[compute.AcceleratorType(),], next_page_token="ghi",
+            ),
+            compute.AcceleratorTypeList(
+                items=[compute.AcceleratorType(), compute.AcceleratorType(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AcceleratorTypeList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 def test_credentials_transport_error():
     # It is an error to provide credentials and a transport instance.
     transport = transports.AcceleratorTypesRestTransport(
@@ -1570,6 +2067,106 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.AcceleratorTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.AcceleratorTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.aggregated_list is first.aggregated_list
+    assert first.aggregated_list._session is first._session
+    assert second.aggregated_list._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = AcceleratorTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={
+                "project": "sample1",
+                "zone": "sample2",
+                "accelerator_type": "sample3",
+            },
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = AcceleratorTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeList(next_page_token="abc"),
+            compute.AcceleratorTypeList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.AcceleratorTypeList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = AcceleratorTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.AcceleratorTypeAggregatedList(next_page_token="abc"),
+            compute.AcceleratorTypeAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.AcceleratorTypeAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -1586,6 +2183,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = AcceleratorTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.AcceleratorTypesAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = AcceleratorTypesAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.AcceleratorTypesAsyncRestTransport)
+    assert AcceleratorTypesAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.AcceleratorTypesAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = AcceleratorTypesClient(client_options={"session": session})
+    other = AcceleratorTypesClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.AcceleratorTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        AcceleratorTypesClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.AcceleratorTypesRestTransport)
+    client = AcceleratorTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.AcceleratorTypesRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = AcceleratorTypesAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class",
     [(AcceleratorTypesClient, transports.AcceleratorTypesRestTransport),],
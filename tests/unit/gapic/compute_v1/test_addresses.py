@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.addresses import AddressesAsyncClient
 from google.cloud.compute_v1.services.addresses import AddressesClient
 from google.cloud.compute_v1.services.addresses import pagers
 from google.cloud.compute_v1.services.addresses import transports
@@ -510,6 +516,47 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AggregatedListAddressesRequest, dict,]
+)
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AddressAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AddressAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListAddressesRequest,
 ):
@@ -564,18 +611,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.AddressAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -747,6 +789,213 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressAggregatedList(
+                items={
+                    "a": compute.AddressesScopedList(),
+                    "b": compute.AddressesScopedList(),
+                    "c": compute.AddressesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AddressAggregatedList(items={}, next_page_token="def",),
+            compute.AddressAggregatedList(
+                items={"g": compute.AddressesScopedList(),}, next_page_token="ghi",
+            ),
+            compute.AddressAggregatedList(
+                items={
+                    "h": compute.AddressesScopedList(),
+                    "i": compute.AddressesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AddressAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressAggregatedList(
+                items={
+                    "a": compute.AddressesScopedList(),
+                    "b": compute.AddressesScopedList(),
+                    "c": compute.AddressesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AddressAggregatedList(items={}, next_page_token="def",),
+            compute.AddressAggregatedList(
+                items={"g": compute.AddressesScopedList(),}, next_page_token="ghi",
+            ),
+            compute.AddressAggregatedList(
+                items={
+                    "h": compute.AddressesScopedList(),
+                    "i": compute.AddressesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AddressAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request)
+
+        assert isinstance(pager.get("a"), compute.AddressesScopedList)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (str, compute.AddressesScopedList)
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.AddressesScopedList)
+
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
+):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressAggregatedList(
+                items={
+                    "a": compute.AddressesScopedList(),
+                    "b": compute.AddressesScopedList(),
+                    "c": compute.AddressesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AddressAggregatedList(items={}, next_page_token="def",),
+            compute.AddressAggregatedList(
+                items={"g": compute.AddressesScopedList(),}, next_page_token="ghi",
+            ),
+            compute.AddressAggregatedList(
+                items={
+                    "h": compute.AddressesScopedList(),
+                    "i": compute.AddressesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AddressAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.DeleteAddressRequest, dict,])
 def test_delete_unary_rest(request_type):
     client = AddressesClient(
@@ -819,6 +1068,79 @@ def test_delete_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.DeleteAddressRequest, dict,])
+async def test_delete_unary_rest_asyncio(request_type):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "address": "sample3"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_delete_unary_rest_required_fields(request_type=compute.DeleteAddressRequest):
     transport_class = transports.AddressesRestTransport
 
@@ -870,18 +1192,13 @@ def test_delete_unary_rest_required_fields(request_type=compute.DeleteAddressReq
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "delete",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("delete", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -893,6 +1210,11 @@ def test_delete_unary_rest_required_fields(request_type=compute.DeleteAddressReq
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1057,6 +1379,69 @@ def test_get_rest(request_type):
     assert response.users == ["users_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetAddressRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "address": "sample3"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Address(
+            address="address_value",
+            address_type="address_type_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            id=205,
+            ip_version="ip_version_value",
+            kind="kind_value",
+            name="name_value",
+            network="network_value",
+            network_tier="network_tier_value",
+            prefix_length=1391,
+            purpose="purpose_value",
+            region="region_value",
+            self_link="self_link_value",
+            status="status_value",
+            subnetwork="subnetwork_value",
+            users=["users_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Address.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Address)
+    assert response.address == "address_value"
+    assert response.address_type == "address_type_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.id == 205
+    assert response.ip_version == "ip_version_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.network == "network_value"
+    assert response.network_tier == "network_tier_value"
+    assert response.prefix_length == 1391
+    assert response.purpose == "purpose_value"
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.status == "status_value"
+    assert response.subnetwork == "subnetwork_value"
+    assert response.users == ["users_value"]
+
+
 def test_get_rest_required_fields(request_type=compute.GetAddressRequest):
     transport_class = transports.AddressesRestTransport
 
@@ -1106,18 +1491,13 @@ def test_get_rest_required_fields(request_type=compute.GetAddressRequest):
     return_value = compute.Address()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1230,9 +1610,101 @@ def test_get_rest_error():
 
 
 @pytest.mark.parametrize("request_type", [compute.InsertAddressRequest, dict,])
-def test_insert_unary_rest(request_type):
-    client = AddressesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+def test_insert_unary_rest(request_type):
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2"}
+    request_init["address_resource"] = {
+        "address": "address_value",
+        "address_type": "address_type_value",
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "id": 205,
+        "ip_version": "ip_version_value",
+        "kind": "kind_value",
+        "name": "name_value",
+        "network": "network_value",
+        "network_tier": "network_tier_value",
+        "prefix_length": 1391,
+        "purpose": "purpose_value",
+        "region": "region_value",
+        "self_link": "self_link_value",
+        "status": "status_value",
+        "subnetwork": "subnetwork_value",
+        "users": ["users_value_1", "users_value_2"],
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.insert_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InsertAddressRequest, dict,])
+async def test_insert_unary_rest_asyncio(request_type):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -1292,7 +1764,7 @@ def test_insert_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.insert_unary(request)
+        response = await client.insert_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -1367,19 +1839,13 @@ def test_insert_unary_rest_required_fields(request_type=compute.InsertAddressReq
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -1391,6 +1857,11 @@ def test_insert_unary_rest_required_fields(request_type=compute.InsertAddressReq
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1546,6 +2017,43 @@ def test_list_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListAddressesRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AddressList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AddressList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_list_rest_required_fields(request_type=compute.ListAddressesRequest):
     transport_class = transports.AddressesRestTransport
 
@@ -1595,18 +2103,13 @@ def test_list_rest_required_fields(request_type=compute.ListAddressesRequest):
     return_value = compute.AddressList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1751,6 +2254,140 @@ def test_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_rest_pager_views(transport: str = "rest"):
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressList(
+                items=[compute.Address(), compute.Address(), compute.Address(),],
+                next_page_token="abc",
+            ),
+            compute.AddressList(items=[], next_page_token="def",),
+            compute.AddressList(items=[compute.Address(),], next_page_token="ghi",),
+            compute.AddressList(items=[compute.Address(), compute.Address(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AddressList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressList(
+                items=[compute.Address(), compute.Address(), compute.Address(),],
+                next_page_token="abc",
+            ),
+            compute.AddressList(items=[], next_page_token="def",),
+            compute.AddressList(items=[compute.Address(),], next_page_token="ghi",),
+            compute.AddressList(items=[compute.Address(), compute.Address(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AddressList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.Address) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressList(
+                items=[compute.Address(), compute.Address(), compute.Address(),],
+                next_page_token="abc",
+            ),
+            compute.AddressList(items=[], next_page_token="def",),
+            compute.AddressList(items=[compute.Address(),], next_page_token="ghi",),
+            compute.AddressList(items=[compute.Address(), compute.Address(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AddressList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 def test_credentials_transport_error():
     # It is an error to provide credentials and a transport instance.
     transport = transports.AddressesRestTransport(
@@ -2066,6 +2703,102 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.AddressesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.AddressesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.aggregated_list is first.aggregated_list
+    assert first.aggregated_list._session is first._session
+    assert second.aggregated_list._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "region": "sample2", "address": "sample3"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressList(next_page_token="abc"),
+            compute.AddressList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.AddressList.to_json(response_val).encode(
+                "UTF-8"
+            )
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.AddressAggregatedList(next_page_token="abc"),
+            compute.AddressAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.AddressAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -2082,6 +2815,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = AddressesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.AddressesAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = AddressesAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.AddressesAsyncRestTransport)
+    assert AddressesAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.AddressesAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = AddressesClient(client_options={"session": session})
+    other = AddressesClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.AddressesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        AddressesClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.AddressesRestTransport)
+    client = AddressesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.AddressesRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = AddressesAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class",
     [(AddressesClient, transports.AddressesRestTransport),],
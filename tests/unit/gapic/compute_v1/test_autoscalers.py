@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.autoscalers import AutoscalersAsyncClient
 from google.cloud.compute_v1.services.autoscalers import AutoscalersClient
 from google.cloud.compute_v1.services.autoscalers import pagers
 from google.cloud.compute_v1.services.autoscalers import transports
@@ -514,6 +520,47 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AggregatedListAutoscalersRequest, dict,]
+)
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AutoscalerAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AutoscalerAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListAutoscalersRequest,
 ):
@@ -568,18 +615,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.AutoscalerAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -754,6 +796,216 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerAggregatedList(
+                items={
+                    "a": compute.AutoscalersScopedList(),
+                    "b": compute.AutoscalersScopedList(),
+                    "c": compute.AutoscalersScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AutoscalerAggregatedList(items={}, next_page_token="def",),
+            compute.AutoscalerAggregatedList(
+                items={"g": compute.AutoscalersScopedList(),}, next_page_token="ghi",
+            ),
+            compute.AutoscalerAggregatedList(
+                items={
+                    "h": compute.AutoscalersScopedList(),
+                    "i": compute.AutoscalersScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerAggregatedList(
+                items={
+                    "a": compute.AutoscalersScopedList(),
+                    "b": compute.AutoscalersScopedList(),
+                    "c": compute.AutoscalersScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AutoscalerAggregatedList(items={}, next_page_token="def",),
+            compute.AutoscalerAggregatedList(
+                items={"g": compute.AutoscalersScopedList(),}, next_page_token="ghi",
+            ),
+            compute.AutoscalerAggregatedList(
+                items={
+                    "h": compute.AutoscalersScopedList(),
+                    "i": compute.AutoscalersScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request)
+
+        assert isinstance(pager.get("a"), compute.AutoscalersScopedList)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                compute.AutoscalersScopedList,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.AutoscalersScopedList)
+
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
+):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerAggregatedList(
+                items={
+                    "a": compute.AutoscalersScopedList(),
+                    "b": compute.AutoscalersScopedList(),
+                    "c": compute.AutoscalersScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.AutoscalerAggregatedList(items={}, next_page_token="def",),
+            compute.AutoscalerAggregatedList(
+                items={"g": compute.AutoscalersScopedList(),}, next_page_token="ghi",
+            ),
+            compute.AutoscalerAggregatedList(
+                items={
+                    "h": compute.AutoscalersScopedList(),
+                    "i": compute.AutoscalersScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.DeleteAutoscalerRequest, dict,])
 def test_delete_unary_rest(request_type):
     client = AutoscalersClient(
@@ -826,23 +1078,96 @@ def test_delete_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_delete_unary_rest_required_fields(
-    request_type=compute.DeleteAutoscalerRequest,
-):
-    transport_class = transports.AutoscalersRestTransport
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.DeleteAutoscalerRequest, dict,])
+async def test_delete_unary_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
 
-    request_init = {}
-    request_init["autoscaler"] = ""
-    request_init["project"] = ""
-    request_init["zone"] = ""
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2", "autoscaler": "sample3"}
     request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
         )
-    )
 
-    # verify fields with default values are dropped
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_delete_unary_rest_required_fields(
+    request_type=compute.DeleteAutoscalerRequest,
+):
+    transport_class = transports.AutoscalersRestTransport
+
+    request_init = {}
+    request_init["autoscaler"] = ""
+    request_init["project"] = ""
+    request_init["zone"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
@@ -879,18 +1204,13 @@ def test_delete_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "delete",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("delete", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -902,6 +1222,11 @@ def test_delete_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1054,6 +1379,57 @@ def test_get_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetAutoscalerRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2", "autoscaler": "sample3"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Autoscaler(
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            id=205,
+            kind="kind_value",
+            name="name_value",
+            recommended_size=1693,
+            region="region_value",
+            self_link="self_link_value",
+            status="status_value",
+            target="target_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Autoscaler.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Autoscaler)
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.recommended_size == 1693
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.status == "status_value"
+    assert response.target == "target_value"
+    assert response.zone == "zone_value"
+
+
 def test_get_rest_required_fields(request_type=compute.GetAutoscalerRequest):
     transport_class = transports.AutoscalersRestTransport
 
@@ -1103,18 +1479,13 @@ def test_get_rest_required_fields(request_type=compute.GetAutoscalerRequest):
     return_value = compute.Autoscaler()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1342,6 +1713,123 @@ def test_insert_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InsertAutoscalerRequest, dict,])
+async def test_insert_unary_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2"}
+    request_init["autoscaler_resource"] = {
+        "autoscaling_policy": {
+            "cool_down_period_sec": 2112,
+            "cpu_utilization": {
+                "predictive_method": "predictive_method_value",
+                "utilization_target": 0.19540000000000002,
+            },
+            "custom_metric_utilizations": [
+                {
+                    "filter": "filter_value",
+                    "metric": "metric_value",
+                    "single_instance_assignment": 0.2766,
+                    "utilization_target": 0.19540000000000002,
+                    "utilization_target_type": "utilization_target_type_value",
+                }
+            ],
+            "load_balancing_utilization": {"utilization_target": 0.19540000000000002},
+            "max_num_replicas": 1703,
+            "min_num_replicas": 1701,
+            "mode": "mode_value",
+            "scale_in_control": {
+                "max_scaled_in_replicas": {
+                    "calculated": 1042,
+                    "fixed": 528,
+                    "percent": 753,
+                },
+                "time_window_sec": 1600,
+            },
+            "scaling_schedules": {},
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "recommended_size": 1693,
+        "region": "region_value",
+        "scaling_schedule_status": {},
+        "self_link": "self_link_value",
+        "status": "status_value",
+        "status_details": [{"message": "message_value", "type_": "type__value"}],
+        "target": "target_value",
+        "zone": "zone_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.insert_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_insert_unary_rest_required_fields(
     request_type=compute.InsertAutoscalerRequest,
 ):
@@ -1391,19 +1879,13 @@ def test_insert_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -1415,6 +1897,11 @@ def test_insert_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1599,6 +2086,43 @@ def test_list_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListAutoscalersRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.AutoscalerList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.AutoscalerList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_list_rest_required_fields(request_type=compute.ListAutoscalersRequest):
     transport_class = transports.AutoscalersRestTransport
 
@@ -1648,18 +2172,13 @@ def test_list_rest_required_fields(request_type=compute.ListAutoscalersRequest):
     return_value = compute.AutoscalerList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1788,34 +2307,309 @@ def test_list_rest_pager(transport: str = "rest"):
                 items=[compute.Autoscaler(), compute.Autoscaler(),],
             ),
         )
-        # Two responses for two calls
-        response = response + response
-
-        # Wrap the values into proper Response objs
-        response = tuple(compute.AutoscalerList.to_json(x) for x in response)
-        return_values = tuple(Response() for i in response)
-        for return_val, response_val in zip(return_values, response):
-            return_val._content = response_val.encode("UTF-8")
-            return_val.status_code = 200
-        req.side_effect = return_values
-
-        sample_request = {"project": "sample1", "zone": "sample2"}
-
-        pager = client.list(request=sample_request)
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = client.list(request=sample_request)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, compute.Autoscaler) for i in results)
+
+        pages = list(client.list(request=sample_request).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+def test_list_rest_pager_views(transport: str = "rest"):
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerList(
+                items=[
+                    compute.Autoscaler(),
+                    compute.Autoscaler(),
+                    compute.Autoscaler(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.AutoscalerList(items=[], next_page_token="def",),
+            compute.AutoscalerList(
+                items=[compute.Autoscaler(),], next_page_token="ghi",
+            ),
+            compute.AutoscalerList(
+                items=[compute.Autoscaler(), compute.Autoscaler(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerList(
+                items=[
+                    compute.Autoscaler(),
+                    compute.Autoscaler(),
+                    compute.Autoscaler(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.AutoscalerList(items=[], next_page_token="def",),
+            compute.AutoscalerList(
+                items=[compute.Autoscaler(),], next_page_token="ghi",
+            ),
+            compute.AutoscalerList(
+                items=[compute.Autoscaler(), compute.Autoscaler(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.Autoscaler) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerList(
+                items=[
+                    compute.Autoscaler(),
+                    compute.Autoscaler(),
+                    compute.Autoscaler(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.AutoscalerList(items=[], next_page_token="def",),
+            compute.AutoscalerList(
+                items=[compute.Autoscaler(),], next_page_token="ghi",
+            ),
+            compute.AutoscalerList(
+                items=[compute.Autoscaler(), compute.Autoscaler(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.AutoscalerList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [compute.PatchAutoscalerRequest, dict,])
+def test_patch_unary_rest(request_type):
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2"}
+    request_init["autoscaler_resource"] = {
+        "autoscaling_policy": {
+            "cool_down_period_sec": 2112,
+            "cpu_utilization": {
+                "predictive_method": "predictive_method_value",
+                "utilization_target": 0.19540000000000002,
+            },
+            "custom_metric_utilizations": [
+                {
+                    "filter": "filter_value",
+                    "metric": "metric_value",
+                    "single_instance_assignment": 0.2766,
+                    "utilization_target": 0.19540000000000002,
+                    "utilization_target_type": "utilization_target_type_value",
+                }
+            ],
+            "load_balancing_utilization": {"utilization_target": 0.19540000000000002},
+            "max_num_replicas": 1703,
+            "min_num_replicas": 1701,
+            "mode": "mode_value",
+            "scale_in_control": {
+                "max_scaled_in_replicas": {
+                    "calculated": 1042,
+                    "fixed": 528,
+                    "percent": 753,
+                },
+                "time_window_sec": 1600,
+            },
+            "scaling_schedules": {},
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "recommended_size": 1693,
+        "region": "region_value",
+        "scaling_schedule_status": {},
+        "self_link": "self_link_value",
+        "status": "status_value",
+        "status_details": [{"message": "message_value", "type_": "type__value"}],
+        "target": "target_value",
+        "zone": "zone_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
 
-        results = list(pager)
-        assert len(results) == 6
-        assert all(isinstance(i, compute.Autoscaler) for i in results)
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.patch_unary(request)
 
-        pages = list(client.list(request=sample_request).pages)
-        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
-            assert page_.raw_page.next_page_token == token
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.PatchAutoscalerRequest, dict,])
-def test_patch_unary_rest(request_type):
-    client = AutoscalersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_patch_unary_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -1900,7 +2694,7 @@ def test_patch_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.patch_unary(request)
+        response = await client.patch_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -1975,19 +2769,13 @@ def test_patch_unary_rest_required_fields(request_type=compute.PatchAutoscalerRe
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "patch",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("patch", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -1999,6 +2787,11 @@ def test_patch_unary_rest_required_fields(request_type=compute.PatchAutoscalerRe
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -2264,6 +3057,123 @@ def test_update_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.UpdateAutoscalerRequest, dict,])
+async def test_update_unary_rest_asyncio(request_type):
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2"}
+    request_init["autoscaler_resource"] = {
+        "autoscaling_policy": {
+            "cool_down_period_sec": 2112,
+            "cpu_utilization": {
+                "predictive_method": "predictive_method_value",
+                "utilization_target": 0.19540000000000002,
+            },
+            "custom_metric_utilizations": [
+                {
+                    "filter": "filter_value",
+                    "metric": "metric_value",
+                    "single_instance_assignment": 0.2766,
+                    "utilization_target": 0.19540000000000002,
+                    "utilization_target_type": "utilization_target_type_value",
+                }
+            ],
+            "load_balancing_utilization": {"utilization_target": 0.19540000000000002},
+            "max_num_replicas": 1703,
+            "min_num_replicas": 1701,
+            "mode": "mode_value",
+            "scale_in_control": {
+                "max_scaled_in_replicas": {
+                    "calculated": 1042,
+                    "fixed": 528,
+                    "percent": 753,
+                },
+                "time_window_sec": 1600,
+            },
+            "scaling_schedules": {},
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "recommended_size": 1693,
+        "region": "region_value",
+        "scaling_schedule_status": {},
+        "self_link": "self_link_value",
+        "status": "status_value",
+        "status_details": [{"message": "message_value", "type_": "type__value"}],
+        "target": "target_value",
+        "zone": "zone_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.update_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_update_unary_rest_required_fields(
     request_type=compute.UpdateAutoscalerRequest,
 ):
@@ -2313,19 +3223,13 @@ def test_update_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "put",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("put", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -2337,6 +3241,11 @@ def test_update_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -2803,6 +3712,102 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.AutoscalersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.AutoscalersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.aggregated_list is first.aggregated_list
+    assert first.aggregated_list._session is first._session
+    assert second.aggregated_list._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "zone": "sample2", "autoscaler": "sample3"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerList(next_page_token="abc"),
+            compute.AutoscalerList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.AutoscalerList.to_json(response_val).encode(
+                "UTF-8"
+            )
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.AutoscalerAggregatedList(next_page_token="abc"),
+            compute.AutoscalerAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.AutoscalerAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -2819,6 +3824,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = AutoscalersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.AutoscalersAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = AutoscalersAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.AutoscalersAsyncRestTransport)
+    assert AutoscalersAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.AutoscalersAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = AutoscalersClient(client_options={"session": session})
+    other = AutoscalersClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.AutoscalersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        AutoscalersClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.AutoscalersRestTransport)
+    client = AutoscalersClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.AutoscalersRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = AutoscalersAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class",
     [(AutoscalersClient, transports.AutoscalersRestTransport),],
@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.backend_buckets import BackendBucketsAsyncClient
 from google.cloud.compute_v1.services.backend_buckets import BackendBucketsClient
 from google.cloud.compute_v1.services.backend_buckets import pagers
 from google.cloud.compute_v1.services.backend_buckets import transports
@@ -562,6 +568,85 @@ def test_add_signed_url_key_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AddSignedUrlKeyBackendBucketRequest, dict,]
+)
+async def test_add_signed_url_key_unary_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_bucket": "sample2"}
+    request_init["signed_url_key_resource"] = {
+        "key_name": "key_name_value",
+        "key_value": "key_value_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.add_signed_url_key_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_add_signed_url_key_unary_rest_required_fields(
     request_type=compute.AddSignedUrlKeyBackendBucketRequest,
 ):
@@ -611,19 +696,13 @@ def test_add_signed_url_key_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -635,6 +714,11 @@ def test_add_signed_url_key_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -811,6 +895,79 @@ def test_delete_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.DeleteBackendBucketRequest, dict,])
+async def test_delete_unary_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_bucket": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_delete_unary_rest_required_fields(
     request_type=compute.DeleteBackendBucketRequest,
 ):
@@ -860,18 +1017,13 @@ def test_delete_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "delete",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("delete", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -883,6 +1035,11 @@ def test_delete_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1054,6 +1211,81 @@ def test_delete_signed_url_key_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.DeleteSignedUrlKeyBackendBucketRequest, dict,]
+)
+async def test_delete_signed_url_key_unary_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_bucket": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_signed_url_key_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_delete_signed_url_key_unary_rest_required_fields(
     request_type=compute.DeleteSignedUrlKeyBackendBucketRequest,
 ):
@@ -1110,18 +1342,13 @@ def test_delete_signed_url_key_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1135,6 +1362,11 @@ def test_delete_signed_url_key_unary_rest_required_fields(
                 ("keyName", "",),
             ]
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1281,6 +1513,53 @@ def test_get_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetBackendBucketRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_bucket": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendBucket(
+            bucket_name="bucket_name_value",
+            creation_timestamp="creation_timestamp_value",
+            custom_response_headers=["custom_response_headers_value"],
+            description="description_value",
+            enable_cdn=True,
+            id=205,
+            kind="kind_value",
+            name="name_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendBucket.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.BackendBucket)
+    assert response.bucket_name == "bucket_name_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.custom_response_headers == ["custom_response_headers_value"]
+    assert response.description == "description_value"
+    assert response.enable_cdn is True
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_get_rest_required_fields(request_type=compute.GetBackendBucketRequest):
     transport_class = transports.BackendBucketsRestTransport
 
@@ -1326,18 +1605,13 @@ def test_get_rest_required_fields(request_type=compute.GetBackendBucketRequest):
     return_value = compute.BackendBucket()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1546,8 +1820,111 @@ def test_insert_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_insert_unary_rest_required_fields(
-    request_type=compute.InsertBackendBucketRequest,
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InsertBackendBucketRequest, dict,])
+async def test_insert_unary_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request_init["backend_bucket_resource"] = {
+        "bucket_name": "bucket_name_value",
+        "cdn_policy": {
+            "bypass_cache_on_request_headers": [{"header_name": "header_name_value"}],
+            "cache_mode": "cache_mode_value",
+            "client_ttl": 1074,
+            "default_ttl": 1176,
+            "max_ttl": 761,
+            "negative_caching": True,
+            "negative_caching_policy": [{"code": 411, "ttl": 340}],
+            "request_coalescing": True,
+            "serve_while_stale": 1813,
+            "signed_url_cache_max_age_sec": 2890,
+            "signed_url_key_names": [
+                "signed_url_key_names_value_1",
+                "signed_url_key_names_value_2",
+            ],
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "custom_response_headers": [
+            "custom_response_headers_value_1",
+            "custom_response_headers_value_2",
+        ],
+        "description": "description_value",
+        "enable_cdn": True,
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.insert_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_insert_unary_rest_required_fields(
+    request_type=compute.InsertBackendBucketRequest,
 ):
     transport_class = transports.BackendBucketsRestTransport
 
@@ -1591,19 +1968,13 @@ def test_insert_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -1615,6 +1986,11 @@ def test_insert_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1783,6 +2159,43 @@ def test_list_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListBackendBucketsRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendBucketList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendBucketList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_list_rest_required_fields(request_type=compute.ListBackendBucketsRequest):
     transport_class = transports.BackendBucketsRestTransport
 
@@ -1828,18 +2241,13 @@ def test_list_rest_required_fields(request_type=compute.ListBackendBucketsReques
     return_value = compute.BackendBucketList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1979,21 +2387,282 @@ def test_list_rest_pager(transport: str = "rest"):
 
         sample_request = {"project": "sample1"}
 
-        pager = client.list(request=sample_request)
+        pager = client.list(request=sample_request)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, compute.BackendBucket) for i in results)
+
+        pages = list(client.list(request=sample_request).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+def test_list_rest_pager_views(transport: str = "rest"):
+    client = BackendBucketsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendBucketList(
+                items=[
+                    compute.BackendBucket(),
+                    compute.BackendBucket(),
+                    compute.BackendBucket(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendBucketList(items=[], next_page_token="def",),
+            compute.BackendBucketList(
+                items=[compute.BackendBucket(),], next_page_token="ghi",
+            ),
+            compute.BackendBucketList(
+                items=[compute.BackendBucket(), compute.BackendBucket(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendBucketList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendBucketList(
+                items=[
+                    compute.BackendBucket(),
+                    compute.BackendBucket(),
+                    compute.BackendBucket(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendBucketList(items=[], next_page_token="def",),
+            compute.BackendBucketList(
+                items=[compute.BackendBucket(),], next_page_token="ghi",
+            ),
+            compute.BackendBucketList(
+                items=[compute.BackendBucket(), compute.BackendBucket(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendBucketList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.BackendBucket) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendBucketList(
+                items=[
+                    compute.BackendBucket(),
+                    compute.BackendBucket(),
+                    compute.BackendBucket(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendBucketList(items=[], next_page_token="def",),
+            compute.BackendBucketList(
+                items=[compute.BackendBucket(),], next_page_token="ghi",
+            ),
+            compute.BackendBucketList(
+                items=[compute.BackendBucket(), compute.BackendBucket(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendBucketList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [compute.PatchBackendBucketRequest, dict,])
+def test_patch_unary_rest(request_type):
+    client = BackendBucketsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_bucket": "sample2"}
+    request_init["backend_bucket_resource"] = {
+        "bucket_name": "bucket_name_value",
+        "cdn_policy": {
+            "bypass_cache_on_request_headers": [{"header_name": "header_name_value"}],
+            "cache_mode": "cache_mode_value",
+            "client_ttl": 1074,
+            "default_ttl": 1176,
+            "max_ttl": 761,
+            "negative_caching": True,
+            "negative_caching_policy": [{"code": 411, "ttl": 340}],
+            "request_coalescing": True,
+            "serve_while_stale": 1813,
+            "signed_url_cache_max_age_sec": 2890,
+            "signed_url_key_names": [
+                "signed_url_key_names_value_1",
+                "signed_url_key_names_value_2",
+            ],
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "custom_response_headers": [
+            "custom_response_headers_value_1",
+            "custom_response_headers_value_2",
+        ],
+        "description": "description_value",
+        "enable_cdn": True,
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
 
-        results = list(pager)
-        assert len(results) == 6
-        assert all(isinstance(i, compute.BackendBucket) for i in results)
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.patch_unary(request)
 
-        pages = list(client.list(request=sample_request).pages)
-        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
-            assert page_.raw_page.next_page_token == token
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.PatchBackendBucketRequest, dict,])
-def test_patch_unary_rest(request_type):
-    client = BackendBucketsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_patch_unary_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -2064,7 +2733,7 @@ def test_patch_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.patch_unary(request)
+        response = await client.patch_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -2141,19 +2810,13 @@ def test_patch_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "patch",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("patch", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -2165,6 +2828,11 @@ def test_patch_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -2402,6 +3070,109 @@ def test_update_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.UpdateBackendBucketRequest, dict,])
+async def test_update_unary_rest_asyncio(request_type):
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_bucket": "sample2"}
+    request_init["backend_bucket_resource"] = {
+        "bucket_name": "bucket_name_value",
+        "cdn_policy": {
+            "bypass_cache_on_request_headers": [{"header_name": "header_name_value"}],
+            "cache_mode": "cache_mode_value",
+            "client_ttl": 1074,
+            "default_ttl": 1176,
+            "max_ttl": 761,
+            "negative_caching": True,
+            "negative_caching_policy": [{"code": 411, "ttl": 340}],
+            "request_coalescing": True,
+            "serve_while_stale": 1813,
+            "signed_url_cache_max_age_sec": 2890,
+            "signed_url_key_names": [
+                "signed_url_key_names_value_1",
+                "signed_url_key_names_value_2",
+            ],
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "custom_response_headers": [
+            "custom_response_headers_value_1",
+            "custom_response_headers_value_2",
+        ],
+        "description": "description_value",
+        "enable_cdn": True,
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.update_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_update_unary_rest_required_fields(
     request_type=compute.UpdateBackendBucketRequest,
 ):
@@ -2451,19 +3222,13 @@ def test_update_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "put",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("put", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -2475,6 +3240,11 @@ def test_update_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -2928,6 +3698,69 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.BackendBucketsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.BackendBucketsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.add_signed_url_key is first.add_signed_url_key
+    assert first.add_signed_url_key._session is first._session
+    assert second.add_signed_url_key._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = BackendBucketsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "backend_bucket": "sample2"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = BackendBucketsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendBucketList(next_page_token="abc"),
+            compute.BackendBucketList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.BackendBucketList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -2944,6 +3777,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = BackendBucketsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.BackendBucketsAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = BackendBucketsAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.BackendBucketsAsyncRestTransport)
+    assert BackendBucketsAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.BackendBucketsAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = BackendBucketsClient(client_options={"session": session})
+    other = BackendBucketsClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.BackendBucketsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        BackendBucketsClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.BackendBucketsRestTransport)
+    client = BackendBucketsClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.BackendBucketsRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = BackendBucketsAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class",
     [(BackendBucketsClient, transports.BackendBucketsRestTransport),],
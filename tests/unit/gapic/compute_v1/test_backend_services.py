@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.backend_services import BackendServicesAsyncClient
 from google.cloud.compute_v1.services.backend_services import BackendServicesClient
 from google.cloud.compute_v1.services.backend_services import pagers
 from google.cloud.compute_v1.services.backend_services import transports
@@ -572,6 +578,85 @@ def test_add_signed_url_key_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AddSignedUrlKeyBackendServiceRequest, dict,]
+)
+async def test_add_signed_url_key_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["signed_url_key_resource"] = {
+        "key_name": "key_name_value",
+        "key_value": "key_value_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.add_signed_url_key_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_add_signed_url_key_unary_rest_required_fields(
     request_type=compute.AddSignedUrlKeyBackendServiceRequest,
 ):
@@ -621,19 +706,13 @@ def test_add_signed_url_key_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -645,6 +724,11 @@ def test_add_signed_url_key_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -790,6 +874,47 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AggregatedListBackendServicesRequest, dict,]
+)
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendServiceAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendServiceAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListBackendServicesRequest,
 ):
@@ -844,18 +969,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.BackendServiceAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1035,253 +1155,302 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
-@pytest.mark.parametrize("request_type", [compute.DeleteBackendServiceRequest, dict,])
-def test_delete_unary_rest(request_type):
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
     client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
-    request = request_type(request_init)
-
     # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation(
-            client_operation_id="client_operation_id_value",
-            creation_timestamp="creation_timestamp_value",
-            description="description_value",
-            end_time="end_time_value",
-            http_error_message="http_error_message_value",
-            http_error_status_code=2374,
-            id=205,
-            insert_time="insert_time_value",
-            kind="kind_value",
-            name="name_value",
-            operation_group_id="operation_group_id_value",
-            operation_type="operation_type_value",
-            progress=885,
-            region="region_value",
-            self_link="self_link_value",
-            start_time="start_time_value",
-            status=compute.Operation.Status.DONE,
-            status_message="status_message_value",
-            target_id=947,
-            target_link="target_link_value",
-            user="user_value",
-            zone="zone_value",
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceAggregatedList(
+                items={
+                    "a": compute.BackendServicesScopedList(),
+                    "b": compute.BackendServicesScopedList(),
+                    "c": compute.BackendServicesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.BackendServiceAggregatedList(items={}, next_page_token="def",),
+            compute.BackendServiceAggregatedList(
+                items={"g": compute.BackendServicesScopedList(),},
+                next_page_token="ghi",
+            ),
+            compute.BackendServiceAggregatedList(
+                items={
+                    "h": compute.BackendServicesScopedList(),
+                    "i": compute.BackendServicesScopedList(),
+                },
+            ),
         )
+        # Two responses for two calls
+        response = response + response
 
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-        response = client.delete_unary(request)
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, compute.Operation)
-    assert response.client_operation_id == "client_operation_id_value"
-    assert response.creation_timestamp == "creation_timestamp_value"
-    assert response.description == "description_value"
-    assert response.end_time == "end_time_value"
-    assert response.http_error_message == "http_error_message_value"
-    assert response.http_error_status_code == 2374
-    assert response.id == 205
-    assert response.insert_time == "insert_time_value"
-    assert response.kind == "kind_value"
-    assert response.name == "name_value"
-    assert response.operation_group_id == "operation_group_id_value"
-    assert response.operation_type == "operation_type_value"
-    assert response.progress == 885
-    assert response.region == "region_value"
-    assert response.self_link == "self_link_value"
-    assert response.start_time == "start_time_value"
-    assert response.status == compute.Operation.Status.DONE
-    assert response.status_message == "status_message_value"
-    assert response.target_id == 947
-    assert response.target_link == "target_link_value"
-    assert response.user == "user_value"
-    assert response.zone == "zone_value"
+        # Wrap the values into proper Response objs
+        response = tuple(
+            compute.BackendServiceAggregatedList.to_json(x) for x in response
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
+        sample_request = {"project": "sample1"}
 
-def test_delete_unary_rest_required_fields(
-    request_type=compute.DeleteBackendServiceRequest,
-):
-    transport_class = transports.BackendServicesRestTransport
+        pager = client.aggregated_list(request=sample_request, views=True)
 
-    request_init = {}
-    request_init["backend_service"] = ""
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
 
-    # verify fields with default values are dropped
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
 
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).delete._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
 
-    # verify required fields with default values are now present
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
 
-    jsonified_request["backendService"] = "backend_service_value"
-    jsonified_request["project"] = "project_value"
 
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).delete._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
 
-    # verify required fields with non-default values are left alone
-    assert "backendService" in jsonified_request
-    assert jsonified_request["backendService"] == "backend_service_value"
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "delete",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceAggregatedList(
+                items={
+                    "a": compute.BackendServicesScopedList(),
+                    "b": compute.BackendServicesScopedList(),
+                    "c": compute.BackendServicesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.BackendServiceAggregatedList(items={}, next_page_token="def",),
+            compute.BackendServiceAggregatedList(
+                items={"g": compute.BackendServicesScopedList(),},
+                next_page_token="ghi",
+            ),
+            compute.BackendServiceAggregatedList(
+                items={
+                    "h": compute.BackendServicesScopedList(),
+                    "i": compute.BackendServicesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
 
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.Operation.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
+        # Wrap the values into proper Response objs
+        response = tuple(
+            compute.BackendServiceAggregatedList.to_json(x) for x in response
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
-            response = client.delete_unary(request)
+        sample_request = {"project": "sample1"}
 
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
+        pager = await client.aggregated_list(request=sample_request)
 
+        assert isinstance(pager.get("a"), compute.BackendServicesScopedList)
+        assert pager.get("h") is None
 
-def test_delete_unary_rest_unset_required_fields():
-    transport = transports.BackendServicesRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                compute.BackendServicesScopedList,
+            )
 
-    unset_fields = transport.delete._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("requestId",)) & set(("backendService", "project",))
-    )
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.BackendServicesScopedList)
 
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
 
-def test_delete_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.DeleteBackendServiceRequest
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
 ):
-    client = BackendServicesClient(
+    client = BackendServicesAsyncClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
-    request = request_type(request_init)
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceAggregatedList(
+                items={
+                    "a": compute.BackendServicesScopedList(),
+                    "b": compute.BackendServicesScopedList(),
+                    "c": compute.BackendServicesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.BackendServiceAggregatedList(items={}, next_page_token="def",),
+            compute.BackendServiceAggregatedList(
+                items={"g": compute.BackendServicesScopedList(),},
+                next_page_token="ghi",
+            ),
+            compute.BackendServiceAggregatedList(
+                items={
+                    "h": compute.BackendServicesScopedList(),
+                    "i": compute.BackendServicesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.delete_unary(request)
+        # Wrap the values into proper Response objs
+        response = tuple(
+            compute.BackendServiceAggregatedList.to_json(x) for x in response
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
+        sample_request = {"project": "sample1"}
 
-def test_delete_unary_rest_flattened():
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [compute.DeleteBackendServiceRequest, dict,])
+def test_delete_unary_rest(request_type):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport="rest",
     )
 
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
         json_return_value = compute.Operation.to_json(return_value)
-
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
+        response = client.delete_unary(request)
 
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "backend_service": "sample2"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value", backend_service="backend_service_value",
-        )
-        mock_args.update(sample_request)
-        client.delete_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_delete_unary_rest_flattened_error(transport: str = "rest"):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.delete_unary(
-            compute.DeleteBackendServiceRequest(),
-            project="project_value",
-            backend_service="backend_service_value",
-        )
-
-
-def test_delete_unary_rest_error():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
-@pytest.mark.parametrize(
-    "request_type", [compute.DeleteSignedUrlKeyBackendServiceRequest, dict,]
-)
-def test_delete_signed_url_key_unary_rest(request_type):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.DeleteBackendServiceRequest, dict,])
+async def test_delete_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -1322,7 +1491,1440 @@ def test_delete_signed_url_key_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.delete_signed_url_key_unary(request)
+        response = await client.delete_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_delete_unary_rest_required_fields(
+    request_type=compute.DeleteBackendServiceRequest,
+):
+    transport_class = transports.BackendServicesRestTransport
+
+    request_init = {}
+    request_init["backend_service"] = ""
+    request_init["project"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["backendService"] = "backend_service_value"
+    jsonified_request["project"] = "project_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id",))
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "backendService" in jsonified_request
+    assert jsonified_request["backendService"] == "backend_service_value"
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("delete", "v1/sample_method", None)
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.Operation.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.delete_unary(request)
+
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
+            assert expected_params == actual_params
+
+
+def test_delete_unary_rest_unset_required_fields():
+    transport = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.delete._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("requestId",)) & set(("backendService", "project",))
+    )
+
+
+def test_delete_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.DeleteBackendServiceRequest
+):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.delete_unary(request)
+
+
+def test_delete_unary_rest_flattened():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "backend_service": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value", backend_service="backend_service_value",
+        )
+        mock_args.update(sample_request)
+        client.delete_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_delete_unary_rest_flattened_error(transport: str = "rest"):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.delete_unary(
+            compute.DeleteBackendServiceRequest(),
+            project="project_value",
+            backend_service="backend_service_value",
+        )
+
+
+def test_delete_unary_rest_error():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize(
+    "request_type", [compute.DeleteSignedUrlKeyBackendServiceRequest, dict,]
+)
+def test_delete_signed_url_key_unary_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.delete_signed_url_key_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.DeleteSignedUrlKeyBackendServiceRequest, dict,]
+)
+async def test_delete_signed_url_key_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_signed_url_key_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_delete_signed_url_key_unary_rest_required_fields(
+    request_type=compute.DeleteSignedUrlKeyBackendServiceRequest,
+):
+    transport_class = transports.BackendServicesRestTransport
+
+    request_init = {}
+    request_init["backend_service"] = ""
+    request_init["key_name"] = ""
+    request_init["project"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+    assert "keyName" not in jsonified_request
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete_signed_url_key._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+    assert "keyName" in jsonified_request
+    assert jsonified_request["keyName"] == request_init["key_name"]
+
+    jsonified_request["backendService"] = "backend_service_value"
+    jsonified_request["keyName"] = "key_name_value"
+    jsonified_request["project"] = "project_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete_signed_url_key._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id", "key_name",))
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "backendService" in jsonified_request
+    assert jsonified_request["backendService"] == "backend_service_value"
+    assert "keyName" in jsonified_request
+    assert jsonified_request["keyName"] == "key_name_value"
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", None)
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.Operation.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.delete_signed_url_key_unary(request)
+
+            expected_params = [
+                ("keyName", "",),
+            ]
+            actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
+            assert expected_params == actual_params
+
+
+def test_delete_signed_url_key_unary_rest_unset_required_fields():
+    transport = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.delete_signed_url_key._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("requestId", "keyName",)) & set(("backendService", "keyName", "project",))
+    )
+
+
+def test_delete_signed_url_key_unary_rest_bad_request(
+    transport: str = "rest",
+    request_type=compute.DeleteSignedUrlKeyBackendServiceRequest,
+):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.delete_signed_url_key_unary(request)
+
+
+def test_delete_signed_url_key_unary_rest_flattened():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "backend_service": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            backend_service="backend_service_value",
+            key_name="key_name_value",
+        )
+        mock_args.update(sample_request)
+        client.delete_signed_url_key_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}/deleteSignedUrlKey"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_delete_signed_url_key_unary_rest_flattened_error(transport: str = "rest"):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.delete_signed_url_key_unary(
+            compute.DeleteSignedUrlKeyBackendServiceRequest(),
+            project="project_value",
+            backend_service="backend_service_value",
+            key_name="key_name_value",
+        )
+
+
+def test_delete_signed_url_key_unary_rest_error():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.GetBackendServiceRequest, dict,])
+def test_get_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendService(
+            affinity_cookie_ttl_sec=2432,
+            creation_timestamp="creation_timestamp_value",
+            custom_request_headers=["custom_request_headers_value"],
+            custom_response_headers=["custom_response_headers_value"],
+            description="description_value",
+            enable_c_d_n=True,
+            fingerprint="fingerprint_value",
+            health_checks=["health_checks_value"],
+            id=205,
+            kind="kind_value",
+            load_balancing_scheme="load_balancing_scheme_value",
+            locality_lb_policy="locality_lb_policy_value",
+            name="name_value",
+            network="network_value",
+            port=453,
+            port_name="port_name_value",
+            protocol="protocol_value",
+            region="region_value",
+            security_policy="security_policy_value",
+            self_link="self_link_value",
+            session_affinity="session_affinity_value",
+            timeout_sec=1185,
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendService.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.BackendService)
+    assert response.affinity_cookie_ttl_sec == 2432
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.custom_request_headers == ["custom_request_headers_value"]
+    assert response.custom_response_headers == ["custom_response_headers_value"]
+    assert response.description == "description_value"
+    assert response.enable_c_d_n is True
+    assert response.fingerprint == "fingerprint_value"
+    assert response.health_checks == ["health_checks_value"]
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.load_balancing_scheme == "load_balancing_scheme_value"
+    assert response.locality_lb_policy == "locality_lb_policy_value"
+    assert response.name == "name_value"
+    assert response.network == "network_value"
+    assert response.port == 453
+    assert response.port_name == "port_name_value"
+    assert response.protocol == "protocol_value"
+    assert response.region == "region_value"
+    assert response.security_policy == "security_policy_value"
+    assert response.self_link == "self_link_value"
+    assert response.session_affinity == "session_affinity_value"
+    assert response.timeout_sec == 1185
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetBackendServiceRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendService(
+            affinity_cookie_ttl_sec=2432,
+            creation_timestamp="creation_timestamp_value",
+            custom_request_headers=["custom_request_headers_value"],
+            custom_response_headers=["custom_response_headers_value"],
+            description="description_value",
+            enable_c_d_n=True,
+            fingerprint="fingerprint_value",
+            health_checks=["health_checks_value"],
+            id=205,
+            kind="kind_value",
+            load_balancing_scheme="load_balancing_scheme_value",
+            locality_lb_policy="locality_lb_policy_value",
+            name="name_value",
+            network="network_value",
+            port=453,
+            port_name="port_name_value",
+            protocol="protocol_value",
+            region="region_value",
+            security_policy="security_policy_value",
+            self_link="self_link_value",
+            session_affinity="session_affinity_value",
+            timeout_sec=1185,
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendService.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.BackendService)
+    assert response.affinity_cookie_ttl_sec == 2432
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.custom_request_headers == ["custom_request_headers_value"]
+    assert response.custom_response_headers == ["custom_response_headers_value"]
+    assert response.description == "description_value"
+    assert response.enable_c_d_n is True
+    assert response.fingerprint == "fingerprint_value"
+    assert response.health_checks == ["health_checks_value"]
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.load_balancing_scheme == "load_balancing_scheme_value"
+    assert response.locality_lb_policy == "locality_lb_policy_value"
+    assert response.name == "name_value"
+    assert response.network == "network_value"
+    assert response.port == 453
+    assert response.port_name == "port_name_value"
+    assert response.protocol == "protocol_value"
+    assert response.region == "region_value"
+    assert response.security_policy == "security_policy_value"
+    assert response.self_link == "self_link_value"
+    assert response.session_affinity == "session_affinity_value"
+    assert response.timeout_sec == 1185
+
+
+def test_get_rest_required_fields(request_type=compute.GetBackendServiceRequest):
+    transport_class = transports.BackendServicesRestTransport
+
+    request_init = {}
+    request_init["backend_service"] = ""
+    request_init["project"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).get._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["backendService"] = "backend_service_value"
+    jsonified_request["project"] = "project_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).get._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "backendService" in jsonified_request
+    assert jsonified_request["backendService"] == "backend_service_value"
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.BackendService()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.BackendService.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.get(request)
+
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            assert expected_params == actual_params
+
+
+def test_get_rest_unset_required_fields():
+    transport = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.get._get_unset_required_fields({})
+    assert set(unset_fields) == (set(()) & set(("backendService", "project",)))
+
+
+def test_get_rest_bad_request(
+    transport: str = "rest", request_type=compute.GetBackendServiceRequest
+):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.get(request)
+
+
+def test_get_rest_flattened():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendService()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendService.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "backend_service": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value", backend_service="backend_service_value",
+        )
+        mock_args.update(sample_request)
+        client.get(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_get_rest_flattened_error(transport: str = "rest"):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.get(
+            compute.GetBackendServiceRequest(),
+            project="project_value",
+            backend_service="backend_service_value",
+        )
+
+
+def test_get_rest_error():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize(
+    "request_type", [compute.GetHealthBackendServiceRequest, dict,]
+)
+def test_get_health_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["resource_group_reference_resource"] = {"group": "group_value"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendServiceGroupHealth(kind="kind_value",)
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.get_health(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.BackendServiceGroupHealth)
+    assert response.kind == "kind_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.GetHealthBackendServiceRequest, dict,]
+)
+async def test_get_health_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["resource_group_reference_resource"] = {"group": "group_value"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendServiceGroupHealth(kind="kind_value",)
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get_health(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.BackendServiceGroupHealth)
+    assert response.kind == "kind_value"
+
+
+def test_get_health_rest_required_fields(
+    request_type=compute.GetHealthBackendServiceRequest,
+):
+    transport_class = transports.BackendServicesRestTransport
+
+    request_init = {}
+    request_init["backend_service"] = ""
+    request_init["project"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).get_health._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["backendService"] = "backend_service_value"
+    jsonified_request["project"] = "project_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).get_health._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "backendService" in jsonified_request
+    assert jsonified_request["backendService"] == "backend_service_value"
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.BackendServiceGroupHealth()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.get_health(request)
+
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            assert expected_params == actual_params
+
+
+def test_get_health_rest_unset_required_fields():
+    transport = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.get_health._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(()) & set(("backendService", "project", "resourceGroupReferenceResource",))
+    )
+
+
+def test_get_health_rest_bad_request(
+    transport: str = "rest", request_type=compute.GetHealthBackendServiceRequest
+):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["resource_group_reference_resource"] = {"group": "group_value"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.get_health(request)
+
+
+def test_get_health_rest_flattened():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendServiceGroupHealth()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "backend_service": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            backend_service="backend_service_value",
+            resource_group_reference_resource=compute.ResourceGroupReference(
+                group="group_value"
+            ),
+        )
+        mock_args.update(sample_request)
+        client.get_health(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}/getHealth"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_get_health_rest_flattened_error(transport: str = "rest"):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.get_health(
+            compute.GetHealthBackendServiceRequest(),
+            project="project_value",
+            backend_service="backend_service_value",
+            resource_group_reference_resource=compute.ResourceGroupReference(
+                group="group_value"
+            ),
+        )
+
+
+def test_get_health_rest_error():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.InsertBackendServiceRequest, dict,])
+def test_insert_unary_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request_init["backend_service_resource"] = {
+        "affinity_cookie_ttl_sec": 2432,
+        "backends": [
+            {
+                "balancing_mode": "balancing_mode_value",
+                "capacity_scaler": 0.1575,
+                "description": "description_value",
+                "failover": True,
+                "group": "group_value",
+                "max_connections": 1608,
+                "max_connections_per_endpoint": 2990,
+                "max_connections_per_instance": 2978,
+                "max_rate": 849,
+                "max_rate_per_endpoint": 0.22310000000000002,
+                "max_rate_per_instance": 0.22190000000000001,
+                "max_utilization": 0.1633,
+            }
+        ],
+        "cdn_policy": {
+            "bypass_cache_on_request_headers": [{"header_name": "header_name_value"}],
+            "cache_key_policy": {
+                "include_host": True,
+                "include_protocol": True,
+                "include_query_string": True,
+                "query_string_blacklist": [
+                    "query_string_blacklist_value_1",
+                    "query_string_blacklist_value_2",
+                ],
+                "query_string_whitelist": [
+                    "query_string_whitelist_value_1",
+                    "query_string_whitelist_value_2",
+                ],
+            },
+            "cache_mode": "cache_mode_value",
+            "client_ttl": 1074,
+            "default_ttl": 1176,
+            "max_ttl": 761,
+            "negative_caching": True,
+            "negative_caching_policy": [{"code": 411, "ttl": 340}],
+            "request_coalescing": True,
+            "serve_while_stale": 1813,
+            "signed_url_cache_max_age_sec": 2890,
+            "signed_url_key_names": [
+                "signed_url_key_names_value_1",
+                "signed_url_key_names_value_2",
+            ],
+        },
+        "circuit_breakers": {
+            "max_connections": 1608,
+            "max_pending_requests": 2149,
+            "max_requests": 1313,
+            "max_requests_per_connection": 2902,
+            "max_retries": 1187,
+        },
+        "connection_draining": {"draining_timeout_sec": 2124},
+        "consistent_hash": {
+            "http_cookie": {
+                "name": "name_value",
+                "path": "path_value",
+                "ttl": {"nanos": 543, "seconds": 751},
+            },
+            "http_header_name": "http_header_name_value",
+            "minimum_ring_size": 1829,
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "custom_request_headers": [
+            "custom_request_headers_value_1",
+            "custom_request_headers_value_2",
+        ],
+        "custom_response_headers": [
+            "custom_response_headers_value_1",
+            "custom_response_headers_value_2",
+        ],
+        "description": "description_value",
+        "enable_c_d_n": True,
+        "failover_policy": {
+            "disable_connection_drain_on_failover": True,
+            "drop_traffic_if_unhealthy": True,
+            "failover_ratio": 0.1494,
+        },
+        "fingerprint": "fingerprint_value",
+        "health_checks": ["health_checks_value_1", "health_checks_value_2"],
+        "iap": {
+            "enabled": True,
+            "oauth2_client_id": "oauth2_client_id_value",
+            "oauth2_client_secret": "oauth2_client_secret_value",
+            "oauth2_client_secret_sha256": "oauth2_client_secret_sha256_value",
+        },
+        "id": 205,
+        "kind": "kind_value",
+        "load_balancing_scheme": "load_balancing_scheme_value",
+        "locality_lb_policy": "locality_lb_policy_value",
+        "log_config": {"enable": True, "sample_rate": 0.1165},
+        "max_stream_duration": {"nanos": 543, "seconds": 751},
+        "name": "name_value",
+        "network": "network_value",
+        "outlier_detection": {
+            "base_ejection_time": {"nanos": 543, "seconds": 751},
+            "consecutive_errors": 1956,
+            "consecutive_gateway_failure": 2880,
+            "enforcing_consecutive_errors": 3006,
+            "enforcing_consecutive_gateway_failure": 3930,
+            "enforcing_success_rate": 2334,
+            "interval": {"nanos": 543, "seconds": 751},
+            "max_ejection_percent": 2118,
+            "success_rate_minimum_hosts": 2799,
+            "success_rate_request_volume": 2915,
+            "success_rate_stdev_factor": 2663,
+        },
+        "port": 453,
+        "port_name": "port_name_value",
+        "protocol": "protocol_value",
+        "region": "region_value",
+        "security_policy": "security_policy_value",
+        "security_settings": {
+            "client_tls_policy": "client_tls_policy_value",
+            "subject_alt_names": [
+                "subject_alt_names_value_1",
+                "subject_alt_names_value_2",
+            ],
+        },
+        "self_link": "self_link_value",
+        "session_affinity": "session_affinity_value",
+        "subsetting": {"policy": "policy_value"},
+        "timeout_sec": 1185,
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.insert_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InsertBackendServiceRequest, dict,])
+async def test_insert_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request_init["backend_service_resource"] = {
+        "affinity_cookie_ttl_sec": 2432,
+        "backends": [
+            {
+                "balancing_mode": "balancing_mode_value",
+                "capacity_scaler": 0.1575,
+                "description": "description_value",
+                "failover": True,
+                "group": "group_value",
+                "max_connections": 1608,
+                "max_connections_per_endpoint": 2990,
+                "max_connections_per_instance": 2978,
+                "max_rate": 849,
+                "max_rate_per_endpoint": 0.22310000000000002,
+                "max_rate_per_instance": 0.22190000000000001,
+                "max_utilization": 0.1633,
+            }
+        ],
+        "cdn_policy": {
+            "bypass_cache_on_request_headers": [{"header_name": "header_name_value"}],
+            "cache_key_policy": {
+                "include_host": True,
+                "include_protocol": True,
+                "include_query_string": True,
+                "query_string_blacklist": [
+                    "query_string_blacklist_value_1",
+                    "query_string_blacklist_value_2",
+                ],
+                "query_string_whitelist": [
+                    "query_string_whitelist_value_1",
+                    "query_string_whitelist_value_2",
+                ],
+            },
+            "cache_mode": "cache_mode_value",
+            "client_ttl": 1074,
+            "default_ttl": 1176,
+            "max_ttl": 761,
+            "negative_caching": True,
+            "negative_caching_policy": [{"code": 411, "ttl": 340}],
+            "request_coalescing": True,
+            "serve_while_stale": 1813,
+            "signed_url_cache_max_age_sec": 2890,
+            "signed_url_key_names": [
+                "signed_url_key_names_value_1",
+                "signed_url_key_names_value_2",
+            ],
+        },
+        "circuit_breakers": {
+            "max_connections": 1608,
+            "max_pending_requests": 2149,
+            "max_requests": 1313,
+            "max_requests_per_connection": 2902,
+            "max_retries": 1187,
+        },
+        "connection_draining": {"draining_timeout_sec": 2124},
+        "consistent_hash": {
+            "http_cookie": {
+                "name": "name_value",
+                "path": "path_value",
+                "ttl": {"nanos": 543, "seconds": 751},
+            },
+            "http_header_name": "http_header_name_value",
+            "minimum_ring_size": 1829,
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "custom_request_headers": [
+            "custom_request_headers_value_1",
+            "custom_request_headers_value_2",
+        ],
+        "custom_response_headers": [
+            "custom_response_headers_value_1",
+            "custom_response_headers_value_2",
+        ],
+        "description": "description_value",
+        "enable_c_d_n": True,
+        "failover_policy": {
+            "disable_connection_drain_on_failover": True,
+            "drop_traffic_if_unhealthy": True,
+            "failover_ratio": 0.1494,
+        },
+        "fingerprint": "fingerprint_value",
+        "health_checks": ["health_checks_value_1", "health_checks_value_2"],
+        "iap": {
+            "enabled": True,
+            "oauth2_client_id": "oauth2_client_id_value",
+            "oauth2_client_secret": "oauth2_client_secret_value",
+            "oauth2_client_secret_sha256": "oauth2_client_secret_sha256_value",
+        },
+        "id": 205,
+        "kind": "kind_value",
+        "load_balancing_scheme": "load_balancing_scheme_value",
+        "locality_lb_policy": "locality_lb_policy_value",
+        "log_config": {"enable": True, "sample_rate": 0.1165},
+        "max_stream_duration": {"nanos": 543, "seconds": 751},
+        "name": "name_value",
+        "network": "network_value",
+        "outlier_detection": {
+            "base_ejection_time": {"nanos": 543, "seconds": 751},
+            "consecutive_errors": 1956,
+            "consecutive_gateway_failure": 2880,
+            "enforcing_consecutive_errors": 3006,
+            "enforcing_consecutive_gateway_failure": 3930,
+            "enforcing_success_rate": 2334,
+            "interval": {"nanos": 543, "seconds": 751},
+            "max_ejection_percent": 2118,
+            "success_rate_minimum_hosts": 2799,
+            "success_rate_request_volume": 2915,
+            "success_rate_stdev_factor": 2663,
+        },
+        "port": 453,
+        "port_name": "port_name_value",
+        "protocol": "protocol_value",
+        "region": "region_value",
+        "security_policy": "security_policy_value",
+        "security_settings": {
+            "client_tls_policy": "client_tls_policy_value",
+            "subject_alt_names": [
+                "subject_alt_names_value_1",
+                "subject_alt_names_value_2",
+            ],
+        },
+        "self_link": "self_link_value",
+        "session_affinity": "session_affinity_value",
+        "subsetting": {"policy": "policy_value"},
+        "timeout_sec": 1185,
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.insert_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -1350,14 +2952,12 @@ def test_delete_signed_url_key_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_delete_signed_url_key_unary_rest_required_fields(
-    request_type=compute.DeleteSignedUrlKeyBackendServiceRequest,
+def test_insert_unary_rest_required_fields(
+    request_type=compute.InsertBackendServiceRequest,
 ):
     transport_class = transports.BackendServicesRestTransport
 
     request_init = {}
-    request_init["backend_service"] = ""
-    request_init["key_name"] = ""
     request_init["project"] = ""
     request = request_type(request_init)
     jsonified_request = json.loads(
@@ -1367,33 +2967,24 @@ def test_delete_signed_url_key_unary_rest_required_fields(
     )
 
     # verify fields with default values are dropped
-    assert "keyName" not in jsonified_request
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).delete_signed_url_key._get_unset_required_fields(jsonified_request)
+    ).insert._get_unset_required_fields(jsonified_request)
     jsonified_request.update(unset_fields)
 
     # verify required fields with default values are now present
-    assert "keyName" in jsonified_request
-    assert jsonified_request["keyName"] == request_init["key_name"]
 
-    jsonified_request["backendService"] = "backend_service_value"
-    jsonified_request["keyName"] = "key_name_value"
     jsonified_request["project"] = "project_value"
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).delete_signed_url_key._get_unset_required_fields(jsonified_request)
+    ).insert._get_unset_required_fields(jsonified_request)
     # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id", "key_name",))
+    assert not set(unset_fields) - set(("request_id",))
     jsonified_request.update(unset_fields)
 
     # verify required fields with non-default values are left alone
-    assert "backendService" in jsonified_request
-    assert jsonified_request["backendService"] == "backend_service_value"
-    assert "keyName" in jsonified_request
-    assert jsonified_request["keyName"] == "key_name_value"
     assert "project" in jsonified_request
     assert jsonified_request["project"] == "project_value"
 
@@ -1406,18 +2997,13 @@ def test_delete_signed_url_key_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -1425,36 +3011,164 @@ def test_delete_signed_url_key_unary_rest_required_fields(
             response_value._content = json_return_value.encode("UTF-8")
             req.return_value = response_value
 
-            response = client.delete_signed_url_key_unary(request)
+            response = client.insert_unary(request)
 
-            expected_params = [
-                ("keyName", "",),
-            ]
+            expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
-def test_delete_signed_url_key_unary_rest_unset_required_fields():
+def test_insert_unary_rest_unset_required_fields():
     transport = transports.BackendServicesRestTransport(
         credentials=ga_credentials.AnonymousCredentials
     )
 
-    unset_fields = transport.delete_signed_url_key._get_unset_required_fields({})
+    unset_fields = transport.insert._get_unset_required_fields({})
     assert set(unset_fields) == (
-        set(("requestId", "keyName",)) & set(("backendService", "keyName", "project",))
+        set(("requestId",)) & set(("backendServiceResource", "project",))
     )
 
 
-def test_delete_signed_url_key_unary_rest_bad_request(
-    transport: str = "rest",
-    request_type=compute.DeleteSignedUrlKeyBackendServiceRequest,
+def test_insert_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.InsertBackendServiceRequest
 ):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
     # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init = {"project": "sample1"}
+    request_init["backend_service_resource"] = {
+        "affinity_cookie_ttl_sec": 2432,
+        "backends": [
+            {
+                "balancing_mode": "balancing_mode_value",
+                "capacity_scaler": 0.1575,
+                "description": "description_value",
+                "failover": True,
+                "group": "group_value",
+                "max_connections": 1608,
+                "max_connections_per_endpoint": 2990,
+                "max_connections_per_instance": 2978,
+                "max_rate": 849,
+                "max_rate_per_endpoint": 0.22310000000000002,
+                "max_rate_per_instance": 0.22190000000000001,
+                "max_utilization": 0.1633,
+            }
+        ],
+        "cdn_policy": {
+            "bypass_cache_on_request_headers": [{"header_name": "header_name_value"}],
+            "cache_key_policy": {
+                "include_host": True,
+                "include_protocol": True,
+                "include_query_string": True,
+                "query_string_blacklist": [
+                    "query_string_blacklist_value_1",
+                    "query_string_blacklist_value_2",
+                ],
+                "query_string_whitelist": [
+                    "query_string_whitelist_value_1",
+                    "query_string_whitelist_value_2",
+                ],
+            },
+            "cache_mode": "cache_mode_value",
+            "client_ttl": 1074,
+            "default_ttl": 1176,
+            "max_ttl": 761,
+            "negative_caching": True,
+            "negative_caching_policy": [{"code": 411, "ttl": 340}],
+            "request_coalescing": True,
+            "serve_while_stale": 1813,
+            "signed_url_cache_max_age_sec": 2890,
+            "signed_url_key_names": [
+                "signed_url_key_names_value_1",
+                "signed_url_key_names_value_2",
+            ],
+        },
+        "circuit_breakers": {
+            "max_connections": 1608,
+            "max_pending_requests": 2149,
+            "max_requests": 1313,
+            "max_requests_per_connection": 2902,
+            "max_retries": 1187,
+        },
+        "connection_draining": {"draining_timeout_sec": 2124},
+        "consistent_hash": {
+            "http_cookie": {
+                "name": "name_value",
+                "path": "path_value",
+                "ttl": {"nanos": 543, "seconds": 751},
+            },
+            "http_header_name": "http_header_name_value",
+            "minimum_ring_size": 1829,
+        },
+        "creation_timestamp": "creation_timestamp_value",
+        "custom_request_headers": [
+            "custom_request_headers_value_1",
+            "custom_request_headers_value_2",
+        ],
+        "custom_response_headers": [
+            "custom_response_headers_value_1",
+            "custom_response_headers_value_2",
+        ],
+        "description": "description_value",
+        "enable_c_d_n": True,
+        "failover_policy": {
+            "disable_connection_drain_on_failover": True,
+            "drop_traffic_if_unhealthy": True,
+            "failover_ratio": 0.1494,
+        },
+        "fingerprint": "fingerprint_value",
+        "health_checks": ["health_checks_value_1", "health_checks_value_2"],
+        "iap": {
+            "enabled": True,
+            "oauth2_client_id": "oauth2_client_id_value",
+            "oauth2_client_secret": "oauth2_client_secret_value",
+            "oauth2_client_secret_sha256": "oauth2_client_secret_sha256_value",
+        },
+        "id": 205,
+        "kind": "kind_value",
+        "load_balancing_scheme": "load_balancing_scheme_value",
+        "locality_lb_policy": "locality_lb_policy_value",
+        "log_config": {"enable": True, "sample_rate": 0.1165},
+        "max_stream_duration": {"nanos": 543, "seconds": 751},
+        "name": "name_value",
+        "network": "network_value",
+        "outlier_detection": {
+            "base_ejection_time": {"nanos": 543, "seconds": 751},
+            "consecutive_errors": 1956,
+            "consecutive_gateway_failure": 2880,
+            "enforcing_consecutive_errors": 3006,
+            "enforcing_consecutive_gateway_failure": 3930,
+            "enforcing_success_rate": 2334,
+            "interval": {"nanos": 543, "seconds": 751},
+            "max_ejection_percent": 2118,
+            "success_rate_minimum_hosts": 2799,
+            "success_rate_request_volume": 2915,
+            "success_rate_stdev_factor": 2663,
+        },
+        "port": 453,
+        "port_name": "port_name_value",
+        "protocol": "protocol_value",
+        "region": "region_value",
+        "security_policy": "security_policy_value",
+        "security_settings": {
+            "client_tls_policy": "client_tls_policy_value",
+            "subject_alt_names": [
+                "subject_alt_names_value_1",
+                "subject_alt_names_value_2",
+            ],
+        },
+        "self_link": "self_link_value",
+        "session_affinity": "session_affinity_value",
+        "subsetting": {"policy": "policy_value"},
+        "timeout_sec": 1185,
+    }
     request = request_type(request_init)
 
     # Mock the http request call within the method and fake a BadRequest error.
@@ -1466,10 +3180,10 @@ def test_delete_signed_url_key_unary_rest_bad_request(
         response_value.status_code = 400
         response_value.request = Request()
         req.return_value = response_value
-        client.delete_signed_url_key_unary(request)
+        client.insert_unary(request)
 
 
-def test_delete_signed_url_key_unary_rest_flattened():
+def test_insert_unary_rest_flattened():
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport="rest",
     )
@@ -1488,29 +3202,30 @@ def test_delete_signed_url_key_unary_rest_flattened():
         req.return_value = response_value
 
         # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "backend_service": "sample2"}
+        sample_request = {"project": "sample1"}
 
         # get truthy value for each flattened field
         mock_args = dict(
             project="project_value",
-            backend_service="backend_service_value",
-            key_name="key_name_value",
+            backend_service_resource=compute.BackendService(
+                affinity_cookie_ttl_sec=2432
+            ),
         )
         mock_args.update(sample_request)
-        client.delete_signed_url_key_unary(**mock_args)
+        client.insert_unary(**mock_args)
 
         # Establish that the underlying call was made with the expected
         # request object values.
         assert len(req.mock_calls) == 1
         _, args, _ = req.mock_calls[0]
         assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}/deleteSignedUrlKey"
+            "https://%s/compute/v1/projects/{project}/global/backendServices"
             % client.transport._host,
             args[1],
         )
 
 
-def test_delete_signed_url_key_unary_rest_flattened_error(transport: str = "rest"):
+def test_insert_unary_rest_flattened_error(transport: str = "rest"):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
@@ -1518,97 +3233,98 @@ def test_delete_signed_url_key_unary_rest_flattened_error(transport: str = "rest
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.delete_signed_url_key_unary(
-            compute.DeleteSignedUrlKeyBackendServiceRequest(),
+        client.insert_unary(
+            compute.InsertBackendServiceRequest(),
             project="project_value",
-            backend_service="backend_service_value",
-            key_name="key_name_value",
+            backend_service_resource=compute.BackendService(
+                affinity_cookie_ttl_sec=2432
+            ),
         )
 
 
-def test_delete_signed_url_key_unary_rest_error():
+def test_insert_unary_rest_error():
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport="rest"
     )
 
 
-@pytest.mark.parametrize("request_type", [compute.GetBackendServiceRequest, dict,])
-def test_get_rest(request_type):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+@pytest.mark.parametrize("request_type", [compute.ListBackendServicesRequest, dict,])
+def test_list_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.BackendServiceList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.BackendServiceList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListBackendServicesRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init = {"project": "sample1"}
     request = request_type(request_init)
 
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.BackendService(
-            affinity_cookie_ttl_sec=2432,
-            creation_timestamp="creation_timestamp_value",
-            custom_request_headers=["custom_request_headers_value"],
-            custom_response_headers=["custom_response_headers_value"],
-            description="description_value",
-            enable_c_d_n=True,
-            fingerprint="fingerprint_value",
-            health_checks=["health_checks_value"],
-            id=205,
+        return_value = compute.BackendServiceList(
+            id="id_value",
             kind="kind_value",
-            load_balancing_scheme="load_balancing_scheme_value",
-            locality_lb_policy="locality_lb_policy_value",
-            name="name_value",
-            network="network_value",
-            port=453,
-            port_name="port_name_value",
-            protocol="protocol_value",
-            region="region_value",
-            security_policy="security_policy_value",
+            next_page_token="next_page_token_value",
             self_link="self_link_value",
-            session_affinity="session_affinity_value",
-            timeout_sec=1185,
         )
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
-        json_return_value = compute.BackendService.to_json(return_value)
+        json_return_value = compute.BackendServiceList.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.get(request)
+        response = await client.list(request)
 
     # Establish that the response is the type that we expect.
-    assert isinstance(response, compute.BackendService)
-    assert response.affinity_cookie_ttl_sec == 2432
-    assert response.creation_timestamp == "creation_timestamp_value"
-    assert response.custom_request_headers == ["custom_request_headers_value"]
-    assert response.custom_response_headers == ["custom_response_headers_value"]
-    assert response.description == "description_value"
-    assert response.enable_c_d_n is True
-    assert response.fingerprint == "fingerprint_value"
-    assert response.health_checks == ["health_checks_value"]
-    assert response.id == 205
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
     assert response.kind == "kind_value"
-    assert response.load_balancing_scheme == "load_balancing_scheme_value"
-    assert response.locality_lb_policy == "locality_lb_policy_value"
-    assert response.name == "name_value"
-    assert response.network == "network_value"
-    assert response.port == 453
-    assert response.port_name == "port_name_value"
-    assert response.protocol == "protocol_value"
-    assert response.region == "region_value"
-    assert response.security_policy == "security_policy_value"
+    assert response.next_page_token == "next_page_token_value"
     assert response.self_link == "self_link_value"
-    assert response.session_affinity == "session_affinity_value"
-    assert response.timeout_sec == 1185
 
 
-def test_get_rest_required_fields(request_type=compute.GetBackendServiceRequest):
+def test_list_rest_required_fields(request_type=compute.ListBackendServicesRequest):
     transport_class = transports.BackendServicesRestTransport
 
     request_init = {}
-    request_init["backend_service"] = ""
     request_init["project"] = ""
     request = request_type(request_init)
     jsonified_request = json.loads(
@@ -1621,22 +3337,23 @@ def test_get_rest_required_fields(request_type=compute.GetBackendServiceRequest)
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).get._get_unset_required_fields(jsonified_request)
+    ).list._get_unset_required_fields(jsonified_request)
     jsonified_request.update(unset_fields)
 
     # verify required fields with default values are now present
 
-    jsonified_request["backendService"] = "backend_service_value"
     jsonified_request["project"] = "project_value"
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).get._get_unset_required_fields(jsonified_request)
+    ).list._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(
+        ("max_results", "filter", "order_by", "page_token", "return_partial_success",)
+    )
     jsonified_request.update(unset_fields)
 
     # verify required fields with non-default values are left alone
-    assert "backendService" in jsonified_request
-    assert jsonified_request["backendService"] == "backend_service_value"
     assert "project" in jsonified_request
     assert jsonified_request["project"] == "project_value"
 
@@ -1646,53 +3363,51 @@ def test_get_rest_required_fields(request_type=compute.GetBackendServiceRequest)
     request = request_type(request_init)
 
     # Designate an appropriate value for the returned response.
-    return_value = compute.BackendService()
+    return_value = compute.BackendServiceList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
-            json_return_value = compute.BackendService.to_json(return_value)
+            json_return_value = compute.BackendServiceList.to_json(return_value)
             response_value._content = json_return_value.encode("UTF-8")
             req.return_value = response_value
 
-            response = client.get(request)
+            response = client.list(request)
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
             assert expected_params == actual_params
 
 
-def test_get_rest_unset_required_fields():
+def test_list_rest_unset_required_fields():
     transport = transports.BackendServicesRestTransport(
         credentials=ga_credentials.AnonymousCredentials
     )
 
-    unset_fields = transport.get._get_unset_required_fields({})
-    assert set(unset_fields) == (set(()) & set(("backendService", "project",)))
+    unset_fields = transport.list._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("maxResults", "filter", "orderBy", "pageToken", "returnPartialSuccess",))
+        & set(("project",))
+    )
 
 
-def test_get_rest_bad_request(
-    transport: str = "rest", request_type=compute.GetBackendServiceRequest
+def test_list_rest_bad_request(
+    transport: str = "rest", request_type=compute.ListBackendServicesRequest
 ):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
     # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init = {"project": "sample1"}
     request = request_type(request_init)
 
     # Mock the http request call within the method and fake a BadRequest error.
@@ -1704,10 +3419,10 @@ def test_get_rest_bad_request(
         response_value.status_code = 400
         response_value.request = Request()
         req.return_value = response_value
-        client.get(request)
+        client.list(request)
 
 
-def test_get_rest_flattened():
+def test_list_rest_flattened():
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport="rest",
     )
@@ -1715,38 +3430,36 @@ def test_get_rest_flattened():
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.BackendService()
+        return_value = compute.BackendServiceList()
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
-        json_return_value = compute.BackendService.to_json(return_value)
+        json_return_value = compute.BackendServiceList.to_json(return_value)
 
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
 
         # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "backend_service": "sample2"}
+        sample_request = {"project": "sample1"}
 
         # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value", backend_service="backend_service_value",
-        )
+        mock_args = dict(project="project_value",)
         mock_args.update(sample_request)
-        client.get(**mock_args)
+        client.list(**mock_args)
 
         # Establish that the underlying call was made with the expected
         # request object values.
         assert len(req.mock_calls) == 1
         _, args, _ = req.mock_calls[0]
         assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}"
+            "https://%s/compute/v1/projects/{project}/global/backendServices"
             % client.transport._host,
             args[1],
         )
 
 
-def test_get_rest_flattened_error(transport: str = "rest"):
+def test_list_rest_flattened_error(transport: str = "rest"):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
@@ -1754,234 +3467,228 @@ def test_get_rest_flattened_error(transport: str = "rest"):
     # Attempting to call a method with both a request object and flattened
     # fields is an error.
     with pytest.raises(ValueError):
-        client.get(
-            compute.GetBackendServiceRequest(),
-            project="project_value",
-            backend_service="backend_service_value",
+        client.list(
+            compute.ListBackendServicesRequest(), project="project_value",
         )
 
 
-def test_get_rest_error():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
-
-
-@pytest.mark.parametrize(
-    "request_type", [compute.GetHealthBackendServiceRequest, dict,]
-)
-def test_get_health_rest(request_type):
+def test_list_rest_pager(transport: str = "rest"):
     client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
-    request_init["resource_group_reference_resource"] = {"group": "group_value"}
-    request = request_type(request_init)
-
     # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.BackendServiceGroupHealth(kind="kind_value",)
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-        response = client.get_health(request)
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, compute.BackendServiceGroupHealth)
-    assert response.kind == "kind_value"
-
-
-def test_get_health_rest_required_fields(
-    request_type=compute.GetHealthBackendServiceRequest,
-):
-    transport_class = transports.BackendServicesRestTransport
-
-    request_init = {}
-    request_init["backend_service"] = ""
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceList(
+                items=[
+                    compute.BackendService(),
+                    compute.BackendService(),
+                    compute.BackendService(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendServiceList(items=[], next_page_token="def",),
+            compute.BackendServiceList(
+                items=[compute.BackendService(),], next_page_token="ghi",
+            ),
+            compute.BackendServiceList(
+                items=[compute.BackendService(), compute.BackendService(),],
+            ),
         )
-    )
+        # Two responses for two calls
+        response = response + response
 
-    # verify fields with default values are dropped
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendServiceList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).get_health._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
+        sample_request = {"project": "sample1"}
 
-    # verify required fields with default values are now present
+        pager = client.list(request=sample_request)
 
-    jsonified_request["backendService"] = "backend_service_value"
-    jsonified_request["project"] = "project_value"
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, compute.BackendService) for i in results)
 
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).get_health._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
+        pages = list(client.list(request=sample_request).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
 
-    # verify required fields with non-default values are left alone
-    assert "backendService" in jsonified_request
-    assert jsonified_request["backendService"] == "backend_service_value"
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
 
+def test_list_rest_pager_views(transport: str = "rest"):
     client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
-    request = request_type(request_init)
 
-    # Designate an appropriate value for the returned response.
-    return_value = compute.BackendServiceGroupHealth()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceList(
+                items=[
+                    compute.BackendService(),
+                    compute.BackendService(),
+                    compute.BackendService(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendServiceList(items=[], next_page_token="def",),
+            compute.BackendServiceList(
+                items=[compute.BackendService(),], next_page_token="ghi",
+            ),
+            compute.BackendServiceList(
+                items=[compute.BackendService(), compute.BackendService(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
 
-            response = client.get_health(request)
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendServiceList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
+        sample_request = {"project": "sample1"}
 
+        pager = client.list(request=sample_request, views=True)
 
-def test_get_health_rest_unset_required_fields():
-    transport = transports.BackendServicesRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
 
-    unset_fields = transport.get_health._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(()) & set(("backendService", "project", "resourceGroupReferenceResource",))
-    )
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
 
 
-def test_get_health_rest_bad_request(
-    transport: str = "rest", request_type=compute.GetHealthBackendServiceRequest
-):
-    client = BackendServicesClient(
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = BackendServicesAsyncClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
-    request_init["resource_group_reference_resource"] = {"group": "group_value"}
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.get_health(request)
-
-
-def test_get_health_rest_flattened():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
     # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.BackendServiceGroupHealth()
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceList(
+                items=[
+                    compute.BackendService(),
+                    compute.BackendService(),
+                    compute.BackendService(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendServiceList(items=[], next_page_token="def",),
+            compute.BackendServiceList(
+                items=[compute.BackendService(),], next_page_token="ghi",
+            ),
+            compute.BackendServiceList(
+                items=[compute.BackendService(), compute.BackendService(),],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
 
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.BackendServiceGroupHealth.to_json(return_value)
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendServiceList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
+        sample_request = {"project": "sample1"}
 
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "backend_service": "sample2"}
+        pager = await client.list(request=sample_request)
 
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            backend_service="backend_service_value",
-            resource_group_reference_resource=compute.ResourceGroupReference(
-                group="group_value"
-            ),
-        )
-        mock_args.update(sample_request)
-        client.get_health(**mock_args)
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.BackendService) for i in results)
 
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}/getHealth"
-            % client.transport._host,
-            args[1],
-        )
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
 
 
-def test_get_health_rest_flattened_error(transport: str = "rest"):
-    client = BackendServicesClient(
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = BackendServicesAsyncClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.get_health(
-            compute.GetHealthBackendServiceRequest(),
-            project="project_value",
-            backend_service="backend_service_value",
-            resource_group_reference_resource=compute.ResourceGroupReference(
-                group="group_value"
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceList(
+                items=[
+                    compute.BackendService(),
+                    compute.BackendService(),
+                    compute.BackendService(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.BackendServiceList(items=[], next_page_token="def",),
+            compute.BackendServiceList(
+                items=[compute.BackendService(),], next_page_token="ghi",
+            ),
+            compute.BackendServiceList(
+                items=[compute.BackendService(), compute.BackendService(),],
             ),
         )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.BackendServiceList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
 
+        sample_request = {"project": "sample1"}
 
-def test_get_health_rest_error():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
+        pager = await client.list(request=sample_request, views=True)
 
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
 
-@pytest.mark.parametrize("request_type", [compute.InsertBackendServiceRequest, dict,])
-def test_insert_unary_rest(request_type):
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [compute.PatchBackendServiceRequest, dict,])
+def test_patch_unary_rest(request_type):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport="rest",
     )
 
     # send a request that will satisfy transcoding
-    request_init = {"project": "sample1"}
+    request_init = {"project": "sample1", "backend_service": "sample2"}
     request_init["backend_service_resource"] = {
         "affinity_cookie_ttl_sec": 2432,
         "backends": [
@@ -2144,7 +3851,7 @@ def test_insert_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.insert_unary(request)
+        response = client.patch_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -2164,106 +3871,23 @@ def test_insert_unary_rest(request_type):
     assert response.region == "region_value"
     assert response.self_link == "self_link_value"
     assert response.start_time == "start_time_value"
-    assert response.status == compute.Operation.Status.DONE
-    assert response.status_message == "status_message_value"
-    assert response.target_id == 947
-    assert response.target_link == "target_link_value"
-    assert response.user == "user_value"
-    assert response.zone == "zone_value"
-
-
-def test_insert_unary_rest_required_fields(
-    request_type=compute.InsertBackendServiceRequest,
-):
-    transport_class = transports.BackendServicesRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
-
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).insert._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).insert._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.Operation.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
-
-            response = client.insert_unary(request)
-
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
-
-
-def test_insert_unary_rest_unset_required_fields():
-    transport = transports.BackendServicesRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
-
-    unset_fields = transport.insert._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("requestId",)) & set(("backendServiceResource", "project",))
-    )
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
-def test_insert_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.InsertBackendServiceRequest
-):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.PatchBackendServiceRequest, dict,])
+async def test_patch_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
-    request_init = {"project": "sample1"}
+    request_init = {"project": "sample1", "backend_service": "sample2"}
     request_init["backend_service_resource"] = {
         "affinity_cookie_ttl_sec": 2432,
         "backends": [
@@ -2392,330 +4016,160 @@ def test_insert_unary_rest_bad_request(
     }
     request = request_type(request_init)
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.insert_unary(request)
-
-
-def test_insert_unary_rest_flattened():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            backend_service_resource=compute.BackendService(
-                affinity_cookie_ttl_sec=2432
-            ),
-        )
-        mock_args.update(sample_request)
-        client.insert_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_insert_unary_rest_flattened_error(transport: str = "rest"):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.insert_unary(
-            compute.InsertBackendServiceRequest(),
-            project="project_value",
-            backend_service_resource=compute.BackendService(
-                affinity_cookie_ttl_sec=2432
-            ),
-        )
-
-
-def test_insert_unary_rest_error():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
-
-
-@pytest.mark.parametrize("request_type", [compute.ListBackendServicesRequest, dict,])
-def test_list_rest(request_type):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1"}
-    request = request_type(request_init)
-
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.BackendServiceList(
-            id="id_value",
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
             kind="kind_value",
-            next_page_token="next_page_token_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
             self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
         )
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
-        json_return_value = compute.BackendServiceList.to_json(return_value)
+        json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.list(request)
+        response = await client.patch_unary(request)
 
     # Establish that the response is the type that we expect.
-    assert isinstance(response, pagers.ListPager)
-    assert response.id == "id_value"
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
     assert response.kind == "kind_value"
-    assert response.next_page_token == "next_page_token_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
     assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
-def test_list_rest_required_fields(request_type=compute.ListBackendServicesRequest):
-    transport_class = transports.BackendServicesRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
-
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).list._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).list._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(
-        ("max_results", "filter", "order_by", "page_token", "return_partial_success",)
-    )
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.BackendServiceList()
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.BackendServiceList.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
-
-            response = client.list(request)
-
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
-
-
-def test_list_rest_unset_required_fields():
-    transport = transports.BackendServicesRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
-
-    unset_fields = transport.list._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("maxResults", "filter", "orderBy", "pageToken", "returnPartialSuccess",))
-        & set(("project",))
-    )
-
-
-def test_list_rest_bad_request(
-    transport: str = "rest", request_type=compute.ListBackendServicesRequest
-):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1"}
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.list(request)
-
-
-def test_list_rest_flattened():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.BackendServiceList()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.BackendServiceList.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
+def test_patch_unary_rest_required_fields(
+    request_type=compute.PatchBackendServiceRequest,
+):
+    transport_class = transports.BackendServicesRestTransport
 
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1"}
+    request_init = {}
+    request_init["backend_service"] = ""
+    request_init["project"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
 
-        # get truthy value for each flattened field
-        mock_args = dict(project="project_value",)
-        mock_args.update(sample_request)
-        client.list(**mock_args)
+    # verify fields with default values are dropped
 
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices"
-            % client.transport._host,
-            args[1],
-        )
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).patch._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
 
+    # verify required fields with default values are now present
 
-def test_list_rest_flattened_error(transport: str = "rest"):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
+    jsonified_request["backendService"] = "backend_service_value"
+    jsonified_request["project"] = "project_value"
 
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.list(
-            compute.ListBackendServicesRequest(), project="project_value",
-        )
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).patch._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id",))
+    jsonified_request.update(unset_fields)
 
+    # verify required fields with non-default values are left alone
+    assert "backendService" in jsonified_request
+    assert jsonified_request["backendService"] == "backend_service_value"
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
 
-def test_list_rest_pager(transport: str = "rest"):
     client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
     )
+    request = request_type(request_init)
 
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # TODO(kbandes): remove this mock unless there's a good reason for it.
-        # with mock.patch.object(path_template, 'transcode') as transcode:
-        # Set the response as a series of pages
-        response = (
-            compute.BackendServiceList(
-                items=[
-                    compute.BackendService(),
-                    compute.BackendService(),
-                    compute.BackendService(),
-                ],
-                next_page_token="abc",
-            ),
-            compute.BackendServiceList(items=[], next_page_token="def",),
-            compute.BackendServiceList(
-                items=[compute.BackendService(),], next_page_token="ghi",
-            ),
-            compute.BackendServiceList(
-                items=[compute.BackendService(), compute.BackendService(),],
-            ),
-        )
-        # Two responses for two calls
-        response = response + response
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("patch", "v1/sample_method", "{}")
 
-        # Wrap the values into proper Response objs
-        response = tuple(compute.BackendServiceList.to_json(x) for x in response)
-        return_values = tuple(Response() for i in response)
-        for return_val, response_val in zip(return_values, response):
-            return_val._content = response_val.encode("UTF-8")
-            return_val.status_code = 200
-        req.side_effect = return_values
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.Operation.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
 
-        sample_request = {"project": "sample1"}
+            response = client.patch_unary(request)
 
-        pager = client.list(request=sample_request)
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
+            assert expected_params == actual_params
 
-        results = list(pager)
-        assert len(results) == 6
-        assert all(isinstance(i, compute.BackendService) for i in results)
 
-        pages = list(client.list(request=sample_request).pages)
-        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
-            assert page_.raw_page.next_page_token == token
+def test_patch_unary_rest_unset_required_fields():
+    transport = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
 
+    unset_fields = transport.patch._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("requestId",))
+        & set(("backendService", "backendServiceResource", "project",))
+    )
 
-@pytest.mark.parametrize("request_type", [compute.PatchBackendServiceRequest, dict,])
-def test_patch_unary_rest(request_type):
+
+def test_patch_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.PatchBackendServiceRequest
+):
     client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
     # send a request that will satisfy transcoding
@@ -2848,6 +4302,178 @@ def test_patch_unary_rest(request_type):
     }
     request = request_type(request_init)
 
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.patch_unary(request)
+
+
+def test_patch_unary_rest_flattened():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "backend_service": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            backend_service="backend_service_value",
+            backend_service_resource=compute.BackendService(
+                affinity_cookie_ttl_sec=2432
+            ),
+        )
+        mock_args.update(sample_request)
+        client.patch_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_patch_unary_rest_flattened_error(transport: str = "rest"):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.patch_unary(
+            compute.PatchBackendServiceRequest(),
+            project="project_value",
+            backend_service="backend_service_value",
+            backend_service_resource=compute.BackendService(
+                affinity_cookie_ttl_sec=2432
+            ),
+        )
+
+
+def test_patch_unary_rest_error():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize(
+    "request_type", [compute.SetSecurityPolicyBackendServiceRequest, dict,]
+)
+def test_set_security_policy_unary_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["security_policy_reference_resource"] = {
+        "security_policy": "security_policy_value"
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.set_security_policy_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.SetSecurityPolicyBackendServiceRequest, dict,]
+)
+async def test_set_security_policy_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["security_policy_reference_resource"] = {
+        "security_policy": "security_policy_value"
+    }
+    request = request_type(request_init)
+
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
@@ -2882,7 +4508,7 @@ def test_patch_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.patch_unary(request)
+        response = await client.set_security_policy_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -2910,8 +4536,8 @@ def test_patch_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_patch_unary_rest_required_fields(
-    request_type=compute.PatchBackendServiceRequest,
+def test_set_security_policy_unary_rest_required_fields(
+    request_type=compute.SetSecurityPolicyBackendServiceRequest,
 ):
     transport_class = transports.BackendServicesRestTransport
 
@@ -2929,7 +4555,7 @@ def test_patch_unary_rest_required_fields(
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).patch._get_unset_required_fields(jsonified_request)
+    ).set_security_policy._get_unset_required_fields(jsonified_request)
     jsonified_request.update(unset_fields)
 
     # verify required fields with default values are now present
@@ -2939,7 +4565,7 @@ def test_patch_unary_rest_required_fields(
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).patch._get_unset_required_fields(jsonified_request)
+    ).set_security_policy._get_unset_required_fields(jsonified_request)
     # Check that path parameters and body parameters are not mixing in.
     assert not set(unset_fields) - set(("request_id",))
     jsonified_request.update(unset_fields)
@@ -2959,19 +4585,13 @@ def test_patch_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "patch",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -2979,32 +4599,129 @@ def test_patch_unary_rest_required_fields(
             response_value._content = json_return_value.encode("UTF-8")
             req.return_value = response_value
 
-            response = client.patch_unary(request)
+            response = client.set_security_policy_unary(request)
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
-def test_patch_unary_rest_unset_required_fields():
+def test_set_security_policy_unary_rest_unset_required_fields():
     transport = transports.BackendServicesRestTransport(
         credentials=ga_credentials.AnonymousCredentials
     )
 
-    unset_fields = transport.patch._get_unset_required_fields({})
+    unset_fields = transport.set_security_policy._get_unset_required_fields({})
     assert set(unset_fields) == (
         set(("requestId",))
-        & set(("backendService", "backendServiceResource", "project",))
+        & set(("backendService", "project", "securityPolicyReferenceResource",))
     )
 
 
-def test_patch_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.PatchBackendServiceRequest
+def test_set_security_policy_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.SetSecurityPolicyBackendServiceRequest
 ):
     client = BackendServicesClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "backend_service": "sample2"}
+    request_init["security_policy_reference_resource"] = {
+        "security_policy": "security_policy_value"
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.set_security_policy_unary(request)
+
+
+def test_set_security_policy_unary_rest_flattened():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "backend_service": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            backend_service="backend_service_value",
+            security_policy_reference_resource=compute.SecurityPolicyReference(
+                security_policy="security_policy_value"
+            ),
+        )
+        mock_args.update(sample_request)
+        client.set_security_policy_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}/setSecurityPolicy"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_set_security_policy_unary_rest_flattened_error(transport: str = "rest"):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.set_security_policy_unary(
+            compute.SetSecurityPolicyBackendServiceRequest(),
+            project="project_value",
+            backend_service="backend_service_value",
+            security_policy_reference_resource=compute.SecurityPolicyReference(
+                security_policy="security_policy_value"
+            ),
+        )
+
+
+def test_set_security_policy_unary_rest_error():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.UpdateBackendServiceRequest, dict,])
+def test_update_unary_rest(request_type):
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
     # send a request that will satisfy transcoding
     request_init = {"project": "sample1", "backend_service": "sample2"}
     request_init["backend_service_resource"] = {
@@ -3135,100 +4852,6 @@ def test_patch_unary_rest_bad_request(
     }
     request = request_type(request_init)
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.patch_unary(request)
-
-
-def test_patch_unary_rest_flattened():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "backend_service": "sample2"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            backend_service="backend_service_value",
-            backend_service_resource=compute.BackendService(
-                affinity_cookie_ttl_sec=2432
-            ),
-        )
-        mock_args.update(sample_request)
-        client.patch_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_patch_unary_rest_flattened_error(transport: str = "rest"):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.patch_unary(
-            compute.PatchBackendServiceRequest(),
-            project="project_value",
-            backend_service="backend_service_value",
-            backend_service_resource=compute.BackendService(
-                affinity_cookie_ttl_sec=2432
-            ),
-        )
-
-
-def test_patch_unary_rest_error():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
-
-
-@pytest.mark.parametrize(
-    "request_type", [compute.SetSecurityPolicyBackendServiceRequest, dict,]
-)
-def test_set_security_policy_unary_rest(request_type):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
-    request_init["security_policy_reference_resource"] = {
-        "security_policy": "security_policy_value"
-    }
-    request = request_type(request_init)
-
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
@@ -3263,7 +4886,7 @@ def test_set_security_policy_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.set_security_policy_unary(request)
+        response = client.update_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -3291,191 +4914,11 @@ def test_set_security_policy_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_set_security_policy_unary_rest_required_fields(
-    request_type=compute.SetSecurityPolicyBackendServiceRequest,
-):
-    transport_class = transports.BackendServicesRestTransport
-
-    request_init = {}
-    request_init["backend_service"] = ""
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
-
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).set_security_policy._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["backendService"] = "backend_service_value"
-    jsonified_request["project"] = "project_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).set_security_policy._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "backendService" in jsonified_request
-    assert jsonified_request["backendService"] == "backend_service_value"
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.Operation.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
-
-            response = client.set_security_policy_unary(request)
-
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
-
-
-def test_set_security_policy_unary_rest_unset_required_fields():
-    transport = transports.BackendServicesRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
-
-    unset_fields = transport.set_security_policy._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("requestId",))
-        & set(("backendService", "project", "securityPolicyReferenceResource",))
-    )
-
-
-def test_set_security_policy_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.SetSecurityPolicyBackendServiceRequest
-):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "backend_service": "sample2"}
-    request_init["security_policy_reference_resource"] = {
-        "security_policy": "security_policy_value"
-    }
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.set_security_policy_unary(request)
-
-
-def test_set_security_policy_unary_rest_flattened():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "backend_service": "sample2"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            backend_service="backend_service_value",
-            security_policy_reference_resource=compute.SecurityPolicyReference(
-                security_policy="security_policy_value"
-            ),
-        )
-        mock_args.update(sample_request)
-        client.set_security_policy_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/backendServices/{backend_service}/setSecurityPolicy"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_set_security_policy_unary_rest_flattened_error(transport: str = "rest"):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.set_security_policy_unary(
-            compute.SetSecurityPolicyBackendServiceRequest(),
-            project="project_value",
-            backend_service="backend_service_value",
-            security_policy_reference_resource=compute.SecurityPolicyReference(
-                security_policy="security_policy_value"
-            ),
-        )
-
-
-def test_set_security_policy_unary_rest_error():
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
-
-
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.UpdateBackendServiceRequest, dict,])
-def test_update_unary_rest(request_type):
-    client = BackendServicesClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_update_unary_rest_asyncio(request_type):
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -3642,7 +5085,7 @@ def test_update_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.update_unary(request)
+        response = await client.update_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -3719,19 +5162,13 @@ def test_update_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "put",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("put", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -3743,6 +5180,11 @@ def test_update_unary_rest_required_fields(
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -4295,6 +5737,102 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.add_signed_url_key is first.add_signed_url_key
+    assert first.add_signed_url_key._session is first._session
+    assert second.add_signed_url_key._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "backend_service": "sample2"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceList(next_page_token="abc"),
+            compute.BackendServiceList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.BackendServiceList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.BackendServiceAggregatedList(next_page_token="abc"),
+            compute.BackendServiceAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.BackendServiceAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -4311,6 +5849,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = BackendServicesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.BackendServicesAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = BackendServicesAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.BackendServicesAsyncRestTransport)
+    assert BackendServicesAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.BackendServicesAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = BackendServicesClient(client_options={"session": session})
+    other = BackendServicesClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.BackendServicesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        BackendServicesClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.BackendServicesRestTransport)
+    client = BackendServicesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.BackendServicesRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = BackendServicesAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class",
     [(BackendServicesClient, transports.BackendServicesRestTransport),],
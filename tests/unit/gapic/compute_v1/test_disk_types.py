@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.disk_types import DiskTypesAsyncClient
 from google.cloud.compute_v1.services.disk_types import DiskTypesClient
 from google.cloud.compute_v1.services.disk_types import pagers
 from google.cloud.compute_v1.services.disk_types import transports
@@ -512,6 +518,47 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.AggregatedListDiskTypesRequest, dict,]
+)
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.DiskTypeAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.DiskTypeAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListDiskTypesRequest,
 ):
@@ -566,18 +613,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.DiskTypeAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -749,6 +791,213 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
+    client = DiskTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeAggregatedList(
+                items={
+                    "a": compute.DiskTypesScopedList(),
+                    "b": compute.DiskTypesScopedList(),
+                    "c": compute.DiskTypesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.DiskTypeAggregatedList(items={}, next_page_token="def",),
+            compute.DiskTypeAggregatedList(
+                items={"g": compute.DiskTypesScopedList(),}, next_page_token="ghi",
+            ),
+            compute.DiskTypeAggregatedList(
+                items={
+                    "h": compute.DiskTypesScopedList(),
+                    "i": compute.DiskTypesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.DiskTypeAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeAggregatedList(
+                items={
+                    "a": compute.DiskTypesScopedList(),
+                    "b": compute.DiskTypesScopedList(),
+                    "c": compute.DiskTypesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.DiskTypeAggregatedList(items={}, next_page_token="def",),
+            compute.DiskTypeAggregatedList(
+                items={"g": compute.DiskTypesScopedList(),}, next_page_token="ghi",
+            ),
+            compute.DiskTypeAggregatedList(
+                items={
+                    "h": compute.DiskTypesScopedList(),
+                    "i": compute.DiskTypesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.DiskTypeAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request)
+
+        assert isinstance(pager.get("a"), compute.DiskTypesScopedList)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (str, compute.DiskTypesScopedList)
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.DiskTypesScopedList)
+
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
+):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeAggregatedList(
+                items={
+                    "a": compute.DiskTypesScopedList(),
+                    "b": compute.DiskTypesScopedList(),
+                    "c": compute.DiskTypesScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.DiskTypeAggregatedList(items={}, next_page_token="def",),
+            compute.DiskTypeAggregatedList(
+                items={"g": compute.DiskTypesScopedList(),}, next_page_token="ghi",
+            ),
+            compute.DiskTypeAggregatedList(
+                items={
+                    "h": compute.DiskTypesScopedList(),
+                    "i": compute.DiskTypesScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.DiskTypeAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.GetDiskTypeRequest, dict,])
 def test_get_rest(request_type):
     client = DiskTypesClient(
@@ -797,6 +1046,55 @@ def test_get_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetDiskTypeRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2", "disk_type": "sample3"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.DiskType(
+            creation_timestamp="creation_timestamp_value",
+            default_disk_size_gb=2097,
+            description="description_value",
+            id=205,
+            kind="kind_value",
+            name="name_value",
+            region="region_value",
+            self_link="self_link_value",
+            valid_disk_size="valid_disk_size_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.DiskType.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.DiskType)
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.default_disk_size_gb == 2097
+    assert response.description == "description_value"
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.valid_disk_size == "valid_disk_size_value"
+    assert response.zone == "zone_value"
+
+
 def test_get_rest_required_fields(request_type=compute.GetDiskTypeRequest):
     transport_class = transports.DiskTypesRestTransport
 
@@ -846,18 +1144,13 @@ def test_get_rest_required_fields(request_type=compute.GetDiskTypeRequest):
     return_value = compute.DiskType()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1005,6 +1298,43 @@ def test_list_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListDiskTypesRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "zone": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.DiskTypeList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.DiskTypeList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_list_rest_required_fields(request_type=compute.ListDiskTypesRequest):
     transport_class = transports.DiskTypesRestTransport
 
@@ -1054,18 +1384,13 @@ def test_list_rest_required_fields(request_type=compute.ListDiskTypesRequest):
     return_value = compute.DiskTypeList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1208,6 +1533,140 @@ def test_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_list_rest_pager_views(transport: str = "rest"):
+    client = DiskTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeList(
+                items=[compute.DiskType(), compute.DiskType(), compute.DiskType(),],
+                next_page_token="abc",
+            ),
+            compute.DiskTypeList(items=[], next_page_token="def",),
+            compute.DiskTypeList(items=[compute.DiskType(),], next_page_token="ghi",),
+            compute.DiskTypeList(items=[compute.DiskType(), compute.DiskType(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.DiskTypeList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeList(
+                items=[compute.DiskType(), compute.DiskType(), compute.DiskType(),],
+                next_page_token="abc",
+            ),
+            compute.DiskTypeList(items=[], next_page_token="def",),
+            compute.DiskTypeList(items=[compute.DiskType(),], next_page_token="ghi",),
+            compute.DiskTypeList(items=[compute.DiskType(), compute.DiskType(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.DiskTypeList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.DiskType) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeList(
+                items=[compute.DiskType(), compute.DiskType(), compute.DiskType(),],
+                next_page_token="abc",
+            ),
+            compute.DiskTypeList(items=[], next_page_token="def",),
+            compute.DiskTypeList(items=[compute.DiskType(),], next_page_token="ghi",),
+            compute.DiskTypeList(items=[compute.DiskType(), compute.DiskType(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.DiskTypeList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 def test_credentials_transport_error():
     # It is an error to provide credentials and a transport instance.
     transport = transports.DiskTypesRestTransport(
@@ -1523,6 +1982,102 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.DiskTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.DiskTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.aggregated_list is first.aggregated_list
+    assert first.aggregated_list._session is first._session
+    assert second.aggregated_list._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = DiskTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "zone": "sample2", "disk_type": "sample3"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = DiskTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeList(next_page_token="abc"),
+            compute.DiskTypeList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.DiskTypeList.to_json(response_val).encode(
+                "UTF-8"
+            )
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "zone": "sample2"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = DiskTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.DiskTypeAggregatedList(next_page_token="abc"),
+            compute.DiskTypeAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.DiskTypeAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -1539,6 +2094,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = DiskTypesAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.DiskTypesAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = DiskTypesAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.DiskTypesAsyncRestTransport)
+    assert DiskTypesAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.DiskTypesAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = DiskTypesClient(client_options={"session": session})
+    other = DiskTypesClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.DiskTypesRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        DiskTypesClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.DiskTypesRestTransport)
+    client = DiskTypesClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.DiskTypesRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = DiskTypesAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class",
     [(DiskTypesClient, transports.DiskTypesRestTransport),],
@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.routers import RoutersAsyncClient
 from google.cloud.compute_v1.services.routers import RoutersClient
 from google.cloud.compute_v1.services.routers import pagers
 from google.cloud.compute_v1.services.routers import transports
@@ -505,6 +511,45 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.AggregatedListRoutersRequest, dict,])
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.RouterAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.RouterAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListRoutersRequest,
 ):
@@ -559,18 +604,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.RouterAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -742,6 +782,213 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterAggregatedList(
+                items={
+                    "a": compute.RoutersScopedList(),
+                    "b": compute.RoutersScopedList(),
+                    "c": compute.RoutersScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.RouterAggregatedList(items={}, next_page_token="def",),
+            compute.RouterAggregatedList(
+                items={"g": compute.RoutersScopedList(),}, next_page_token="ghi",
+            ),
+            compute.RouterAggregatedList(
+                items={
+                    "h": compute.RoutersScopedList(),
+                    "i": compute.RoutersScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.RouterAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterAggregatedList(
+                items={
+                    "a": compute.RoutersScopedList(),
+                    "b": compute.RoutersScopedList(),
+                    "c": compute.RoutersScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.RouterAggregatedList(items={}, next_page_token="def",),
+            compute.RouterAggregatedList(
+                items={"g": compute.RoutersScopedList(),}, next_page_token="ghi",
+            ),
+            compute.RouterAggregatedList(
+                items={
+                    "h": compute.RoutersScopedList(),
+                    "i": compute.RoutersScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.RouterAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request)
+
+        assert isinstance(pager.get("a"), compute.RoutersScopedList)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (str, compute.RoutersScopedList)
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.RoutersScopedList)
+
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
+):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterAggregatedList(
+                items={
+                    "a": compute.RoutersScopedList(),
+                    "b": compute.RoutersScopedList(),
+                    "c": compute.RoutersScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.RouterAggregatedList(items={}, next_page_token="def",),
+            compute.RouterAggregatedList(
+                items={"g": compute.RoutersScopedList(),}, next_page_token="ghi",
+            ),
+            compute.RouterAggregatedList(
+                items={
+                    "h": compute.RoutersScopedList(),
+                    "i": compute.RoutersScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.RouterAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.DeleteRouterRequest, dict,])
 def test_delete_unary_rest(request_type):
     client = RoutersClient(
@@ -814,71 +1061,139 @@ def test_delete_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_delete_unary_rest_required_fields(request_type=compute.DeleteRouterRequest):
-    transport_class = transports.RoutersRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request_init["region"] = ""
-    request_init["router"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.DeleteRouterRequest, dict,])
+async def test_delete_unary_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).delete._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-    jsonified_request["region"] = "region_value"
-    jsonified_request["router"] = "router_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).delete._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-    assert "region" in jsonified_request
-    assert jsonified_request["region"] == "region_value"
-    assert "router" in jsonified_request
-    assert jsonified_request["router"] == "router_value"
-
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
     request = request_type(request_init)
 
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "delete",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
-
-            response_value = Response()
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_delete_unary_rest_required_fields(request_type=compute.DeleteRouterRequest):
+    transport_class = transports.RoutersRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request_init["region"] = ""
+    request_init["router"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["project"] = "project_value"
+    jsonified_request["region"] = "region_value"
+    jsonified_request["router"] = "router_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id",))
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+    assert "region" in jsonified_request
+    assert jsonified_request["region"] == "region_value"
+    assert "router" in jsonified_request
+    assert jsonified_request["router"] == "router_value"
+
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("delete", "v1/sample_method", None)
+
+            response_value = Response()
             response_value.status_code = 200
             json_return_value = compute.Operation.to_json(return_value)
             response_value._content = json_return_value.encode("UTF-8")
@@ -888,6 +1203,11 @@ def test_delete_unary_rest_required_fields(request_type=compute.DeleteRouterRequ
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1036,6 +1356,53 @@ def test_get_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetRouterRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Router(
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            encrypted_interconnect_router=True,
+            id=205,
+            kind="kind_value",
+            name="name_value",
+            network="network_value",
+            region="region_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Router.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Router)
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.encrypted_interconnect_router is True
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.network == "network_value"
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_get_rest_required_fields(request_type=compute.GetRouterRequest):
     transport_class = transports.RoutersRestTransport
 
@@ -1085,18 +1452,13 @@ def test_get_rest_required_fields(request_type=compute.GetRouterRequest):
     return_value = compute.Router()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1246,6 +1608,45 @@ def test_get_nat_mapping_info_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "request_type", [compute.GetNatMappingInfoRoutersRequest, dict,]
+)
+async def test_get_nat_mapping_info_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.VmEndpointNatMappingsList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.VmEndpointNatMappingsList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get_nat_mapping_info(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.GetNatMappingInfoAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_get_nat_mapping_info_rest_required_fields(
     request_type=compute.GetNatMappingInfoRoutersRequest,
 ):
@@ -1301,18 +1702,13 @@ def test_get_nat_mapping_info_rest_required_fields(
     return_value = compute.VmEndpointNatMappingsList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1479,6 +1875,70 @@ def test_get_nat_mapping_info_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+@pytest.mark.asyncio
+async def test_get_nat_mapping_info_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.VmEndpointNatMappingsList(
+                result=[
+                    compute.VmEndpointNatMappings(),
+                    compute.VmEndpointNatMappings(),
+                    compute.VmEndpointNatMappings(),
+                ],
+                next_page_token="abc",
+            ),
+            compute.VmEndpointNatMappingsList(result=[], next_page_token="def",),
+            compute.VmEndpointNatMappingsList(
+                result=[compute.VmEndpointNatMappings(),], next_page_token="ghi",
+            ),
+            compute.VmEndpointNatMappingsList(
+                result=[
+                    compute.VmEndpointNatMappings(),
+                    compute.VmEndpointNatMappings(),
+                ],
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.VmEndpointNatMappingsList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {
+            "project": "sample1",
+            "region": "sample2",
+            "router": "sample3",
+        }
+
+        pager = await client.get_nat_mapping_info(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.VmEndpointNatMappings) for i in results)
+
+        pages = [
+            p
+            async for p in (
+                await client.get_nat_mapping_info(request=sample_request)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.GetRouterStatusRouterRequest, dict,])
 def test_get_router_status_rest(request_type):
     client = RoutersClient(
@@ -1507,18 +1967,47 @@ def test_get_router_status_rest(request_type):
     assert response.kind == "kind_value"
 
 
-def test_get_router_status_rest_required_fields(
-    request_type=compute.GetRouterStatusRouterRequest,
-):
-    transport_class = transports.RoutersRestTransport
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetRouterStatusRouterRequest, dict,])
+async def test_get_router_status_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
 
-    request_init = {}
-    request_init["project"] = ""
-    request_init["region"] = ""
-    request_init["router"] = ""
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
     request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.RouterStatusResponse(kind="kind_value",)
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.RouterStatusResponse.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get_router_status(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.RouterStatusResponse)
+    assert response.kind == "kind_value"
+
+
+def test_get_router_status_rest_required_fields(
+    request_type=compute.GetRouterStatusRouterRequest,
+):
+    transport_class = transports.RoutersRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request_init["region"] = ""
+    request_init["router"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
             request, including_default_value_fields=False, use_integers_for_enums=False
         )
     )
@@ -1558,18 +2047,13 @@ def test_get_router_status_rest_required_fields(
     return_value = compute.RouterStatusResponse()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1862,6 +2346,188 @@ def test_insert_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InsertRouterRequest, dict,])
+async def test_insert_unary_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2"}
+    request_init["router_resource"] = {
+        "bgp": {
+            "advertise_mode": "advertise_mode_value",
+            "advertised_groups": [
+                "advertised_groups_value_1",
+                "advertised_groups_value_2",
+            ],
+            "advertised_ip_ranges": [
+                {"description": "description_value", "range_": "range__value"}
+            ],
+            "asn": 322,
+            "keepalive_interval": 1914,
+        },
+        "bgp_peers": [
+            {
+                "advertise_mode": "advertise_mode_value",
+                "advertised_groups": [
+                    "advertised_groups_value_1",
+                    "advertised_groups_value_2",
+                ],
+                "advertised_ip_ranges": [
+                    {"description": "description_value", "range_": "range__value"}
+                ],
+                "advertised_route_priority": 2714,
+                "bfd": {
+                    "min_receive_interval": 2122,
+                    "min_transmit_interval": 2265,
+                    "multiplier": 1095,
+                    "session_initialization_mode": "session_initialization_mode_value",
+                },
+                "enable": "enable_value",
+                "interface_name": "interface_name_value",
+                "ip_address": "ip_address_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "peer_asn": 845,
+                "peer_ip_address": "peer_ip_address_value",
+                "router_appliance_instance": "router_appliance_instance_value",
+            }
+        ],
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "encrypted_interconnect_router": True,
+        "id": 205,
+        "interfaces": [
+            {
+                "ip_range": "ip_range_value",
+                "linked_interconnect_attachment": "linked_interconnect_attachment_value",
+                "linked_vpn_tunnel": "linked_vpn_tunnel_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "private_ip_address": "private_ip_address_value",
+                "redundant_interface": "redundant_interface_value",
+                "subnetwork": "subnetwork_value",
+            }
+        ],
+        "kind": "kind_value",
+        "name": "name_value",
+        "nats": [
+            {
+                "drain_nat_ips": ["drain_nat_ips_value_1", "drain_nat_ips_value_2"],
+                "enable_endpoint_independent_mapping": True,
+                "icmp_idle_timeout_sec": 2214,
+                "log_config": {"enable": True, "filter": "filter_value"},
+                "min_ports_per_vm": 1731,
+                "name": "name_value",
+                "nat_ip_allocate_option": "nat_ip_allocate_option_value",
+                "nat_ips": ["nat_ips_value_1", "nat_ips_value_2"],
+                "rules": [
+                    {
+                        "action": {
+                            "source_nat_active_ips": [
+                                "source_nat_active_ips_value_1",
+                                "source_nat_active_ips_value_2",
+                            ],
+                            "source_nat_drain_ips": [
+                                "source_nat_drain_ips_value_1",
+                                "source_nat_drain_ips_value_2",
+                            ],
+                        },
+                        "description": "description_value",
+                        "match": "match_value",
+                        "rule_number": 1184,
+                    }
+                ],
+                "source_subnetwork_ip_ranges_to_nat": "source_subnetwork_ip_ranges_to_nat_value",
+                "subnetworks": [
+                    {
+                        "name": "name_value",
+                        "secondary_ip_range_names": [
+                            "secondary_ip_range_names_value_1",
+                            "secondary_ip_range_names_value_2",
+                        ],
+                        "source_ip_ranges_to_nat": [
+                            "source_ip_ranges_to_nat_value_1",
+                            "source_ip_ranges_to_nat_value_2",
+                        ],
+                    }
+                ],
+                "tcp_established_idle_timeout_sec": 3371,
+                "tcp_time_wait_timeout_sec": 2665,
+                "tcp_transitory_idle_timeout_sec": 3330,
+                "udp_idle_timeout_sec": 2118,
+            }
+        ],
+        "network": "network_value",
+        "region": "region_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.insert_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
 def test_insert_unary_rest_required_fields(request_type=compute.InsertRouterRequest):
     transport_class = transports.RoutersRestTransport
 
@@ -1909,19 +2575,13 @@ def test_insert_unary_rest_required_fields(request_type=compute.InsertRouterRequ
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -1933,6 +2593,11 @@ def test_insert_unary_rest_required_fields(request_type=compute.InsertRouterRequ
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -2182,6 +2847,43 @@ def test_list_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListRoutersRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.RouterList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.RouterList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_list_rest_required_fields(request_type=compute.ListRoutersRequest):
     transport_class = transports.RoutersRestTransport
 
@@ -2231,18 +2933,13 @@ def test_list_rest_required_fields(request_type=compute.ListRoutersRequest):
     return_value = compute.RouterList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -2387,23 +3084,157 @@ def test_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
-@pytest.mark.parametrize("request_type", [compute.PatchRouterRequest, dict,])
-def test_patch_unary_rest(request_type):
+def test_list_rest_pager_views(transport: str = "rest"):
     client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
-    request_init["router_resource"] = {
-        "bgp": {
-            "advertise_mode": "advertise_mode_value",
-            "advertised_groups": [
-                "advertised_groups_value_1",
-                "advertised_groups_value_2",
-            ],
-            "advertised_ip_ranges": [
-                {"description": "description_value", "range_": "range__value"}
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterList(
+                items=[compute.Router(), compute.Router(), compute.Router(),],
+                next_page_token="abc",
+            ),
+            compute.RouterList(items=[], next_page_token="def",),
+            compute.RouterList(items=[compute.Router(),], next_page_token="ghi",),
+            compute.RouterList(items=[compute.Router(), compute.Router(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.RouterList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterList(
+                items=[compute.Router(), compute.Router(), compute.Router(),],
+                next_page_token="abc",
+            ),
+            compute.RouterList(items=[], next_page_token="def",),
+            compute.RouterList(items=[compute.Router(),], next_page_token="ghi",),
+            compute.RouterList(items=[compute.Router(), compute.Router(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.RouterList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.Router) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterList(
+                items=[compute.Router(), compute.Router(), compute.Router(),],
+                next_page_token="abc",
+            ),
+            compute.RouterList(items=[], next_page_token="def",),
+            compute.RouterList(items=[compute.Router(),], next_page_token="ghi",),
+            compute.RouterList(items=[compute.Router(), compute.Router(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.RouterList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [compute.PatchRouterRequest, dict,])
+def test_patch_unary_rest(request_type):
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
+    request_init["router_resource"] = {
+        "bgp": {
+            "advertise_mode": "advertise_mode_value",
+            "advertised_groups": [
+                "advertised_groups_value_1",
+                "advertised_groups_value_2",
+            ],
+            "advertised_ip_ranges": [
+                {"description": "description_value", "range_": "range__value"}
             ],
             "asn": 322,
             "keepalive_interval": 1914,
@@ -2568,100 +3399,11 @@ def test_patch_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_patch_unary_rest_required_fields(request_type=compute.PatchRouterRequest):
-    transport_class = transports.RoutersRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request_init["region"] = ""
-    request_init["router"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
-
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).patch._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-    jsonified_request["region"] = "region_value"
-    jsonified_request["router"] = "router_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).patch._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-    assert "region" in jsonified_request
-    assert jsonified_request["region"] == "region_value"
-    assert "router" in jsonified_request
-    assert jsonified_request["router"] == "router_value"
-
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "patch",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.Operation.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
-
-            response = client.patch_unary(request)
-
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
-
-
-def test_patch_unary_rest_unset_required_fields():
-    transport = transports.RoutersRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
-
-    unset_fields = transport.patch._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("requestId",)) & set(("project", "region", "router", "routerResource",))
-    )
-
-
-def test_patch_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.PatchRouterRequest
-):
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.PatchRouterRequest, dict,])
+async def test_patch_unary_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -2777,41 +3519,311 @@ def test_patch_unary_rest_bad_request(
     }
     request = request_type(request_init)
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.patch_unary(request)
-
-
-def test_patch_unary_rest_flattened():
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
         json_return_value = compute.Operation.to_json(return_value)
-
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
+        response = await client.patch_unary(request)
 
-        # get arguments that satisfy an http rule for this method
-        sample_request = {
-            "project": "sample1",
-            "region": "sample2",
-            "router": "sample3",
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_patch_unary_rest_required_fields(request_type=compute.PatchRouterRequest):
+    transport_class = transports.RoutersRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request_init["region"] = ""
+    request_init["router"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).patch._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["project"] = "project_value"
+    jsonified_request["region"] = "region_value"
+    jsonified_request["router"] = "router_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).patch._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id",))
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+    assert "region" in jsonified_request
+    assert jsonified_request["region"] == "region_value"
+    assert "router" in jsonified_request
+    assert jsonified_request["router"] == "router_value"
+
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("patch", "v1/sample_method", "{}")
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.Operation.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.patch_unary(request)
+
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
+            assert expected_params == actual_params
+
+
+def test_patch_unary_rest_unset_required_fields():
+    transport = transports.RoutersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.patch._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("requestId",)) & set(("project", "region", "router", "routerResource",))
+    )
+
+
+def test_patch_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.PatchRouterRequest
+):
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
+    request_init["router_resource"] = {
+        "bgp": {
+            "advertise_mode": "advertise_mode_value",
+            "advertised_groups": [
+                "advertised_groups_value_1",
+                "advertised_groups_value_2",
+            ],
+            "advertised_ip_ranges": [
+                {"description": "description_value", "range_": "range__value"}
+            ],
+            "asn": 322,
+            "keepalive_interval": 1914,
+        },
+        "bgp_peers": [
+            {
+                "advertise_mode": "advertise_mode_value",
+                "advertised_groups": [
+                    "advertised_groups_value_1",
+                    "advertised_groups_value_2",
+                ],
+                "advertised_ip_ranges": [
+                    {"description": "description_value", "range_": "range__value"}
+                ],
+                "advertised_route_priority": 2714,
+                "bfd": {
+                    "min_receive_interval": 2122,
+                    "min_transmit_interval": 2265,
+                    "multiplier": 1095,
+                    "session_initialization_mode": "session_initialization_mode_value",
+                },
+                "enable": "enable_value",
+                "interface_name": "interface_name_value",
+                "ip_address": "ip_address_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "peer_asn": 845,
+                "peer_ip_address": "peer_ip_address_value",
+                "router_appliance_instance": "router_appliance_instance_value",
+            }
+        ],
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "encrypted_interconnect_router": True,
+        "id": 205,
+        "interfaces": [
+            {
+                "ip_range": "ip_range_value",
+                "linked_interconnect_attachment": "linked_interconnect_attachment_value",
+                "linked_vpn_tunnel": "linked_vpn_tunnel_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "private_ip_address": "private_ip_address_value",
+                "redundant_interface": "redundant_interface_value",
+                "subnetwork": "subnetwork_value",
+            }
+        ],
+        "kind": "kind_value",
+        "name": "name_value",
+        "nats": [
+            {
+                "drain_nat_ips": ["drain_nat_ips_value_1", "drain_nat_ips_value_2"],
+                "enable_endpoint_independent_mapping": True,
+                "icmp_idle_timeout_sec": 2214,
+                "log_config": {"enable": True, "filter": "filter_value"},
+                "min_ports_per_vm": 1731,
+                "name": "name_value",
+                "nat_ip_allocate_option": "nat_ip_allocate_option_value",
+                "nat_ips": ["nat_ips_value_1", "nat_ips_value_2"],
+                "rules": [
+                    {
+                        "action": {
+                            "source_nat_active_ips": [
+                                "source_nat_active_ips_value_1",
+                                "source_nat_active_ips_value_2",
+                            ],
+                            "source_nat_drain_ips": [
+                                "source_nat_drain_ips_value_1",
+                                "source_nat_drain_ips_value_2",
+                            ],
+                        },
+                        "description": "description_value",
+                        "match": "match_value",
+                        "rule_number": 1184,
+                    }
+                ],
+                "source_subnetwork_ip_ranges_to_nat": "source_subnetwork_ip_ranges_to_nat_value",
+                "subnetworks": [
+                    {
+                        "name": "name_value",
+                        "secondary_ip_range_names": [
+                            "secondary_ip_range_names_value_1",
+                            "secondary_ip_range_names_value_2",
+                        ],
+                        "source_ip_ranges_to_nat": [
+                            "source_ip_ranges_to_nat_value_1",
+                            "source_ip_ranges_to_nat_value_2",
+                        ],
+                    }
+                ],
+                "tcp_established_idle_timeout_sec": 3371,
+                "tcp_time_wait_timeout_sec": 2665,
+                "tcp_transitory_idle_timeout_sec": 3330,
+                "udp_idle_timeout_sec": 2118,
+            }
+        ],
+        "network": "network_value",
+        "region": "region_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.patch_unary(request)
+
+
+def test_patch_unary_rest_flattened():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {
+            "project": "sample1",
+            "region": "sample2",
+            "router": "sample3",
         }
 
         # get truthy value for each flattened field
@@ -2842,30 +3854,167 @@ def test_patch_unary_rest_flattened_error(transport: str = "rest"):
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.patch_unary(
-            compute.PatchRouterRequest(),
-            project="project_value",
-            region="region_value",
-            router="router_value",
-            router_resource=compute.Router(
-                bgp=compute.RouterBgp(advertise_mode="advertise_mode_value")
-            ),
-        )
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.patch_unary(
+            compute.PatchRouterRequest(),
+            project="project_value",
+            region="region_value",
+            router="router_value",
+            router_resource=compute.Router(
+                bgp=compute.RouterBgp(advertise_mode="advertise_mode_value")
+            ),
+        )
+
+
+def test_patch_unary_rest_error():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.PreviewRouterRequest, dict,])
+def test_preview_rest(request_type):
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
+    request_init["router_resource"] = {
+        "bgp": {
+            "advertise_mode": "advertise_mode_value",
+            "advertised_groups": [
+                "advertised_groups_value_1",
+                "advertised_groups_value_2",
+            ],
+            "advertised_ip_ranges": [
+                {"description": "description_value", "range_": "range__value"}
+            ],
+            "asn": 322,
+            "keepalive_interval": 1914,
+        },
+        "bgp_peers": [
+            {
+                "advertise_mode": "advertise_mode_value",
+                "advertised_groups": [
+                    "advertised_groups_value_1",
+                    "advertised_groups_value_2",
+                ],
+                "advertised_ip_ranges": [
+                    {"description": "description_value", "range_": "range__value"}
+                ],
+                "advertised_route_priority": 2714,
+                "bfd": {
+                    "min_receive_interval": 2122,
+                    "min_transmit_interval": 2265,
+                    "multiplier": 1095,
+                    "session_initialization_mode": "session_initialization_mode_value",
+                },
+                "enable": "enable_value",
+                "interface_name": "interface_name_value",
+                "ip_address": "ip_address_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "peer_asn": 845,
+                "peer_ip_address": "peer_ip_address_value",
+                "router_appliance_instance": "router_appliance_instance_value",
+            }
+        ],
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "encrypted_interconnect_router": True,
+        "id": 205,
+        "interfaces": [
+            {
+                "ip_range": "ip_range_value",
+                "linked_interconnect_attachment": "linked_interconnect_attachment_value",
+                "linked_vpn_tunnel": "linked_vpn_tunnel_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "private_ip_address": "private_ip_address_value",
+                "redundant_interface": "redundant_interface_value",
+                "subnetwork": "subnetwork_value",
+            }
+        ],
+        "kind": "kind_value",
+        "name": "name_value",
+        "nats": [
+            {
+                "drain_nat_ips": ["drain_nat_ips_value_1", "drain_nat_ips_value_2"],
+                "enable_endpoint_independent_mapping": True,
+                "icmp_idle_timeout_sec": 2214,
+                "log_config": {"enable": True, "filter": "filter_value"},
+                "min_ports_per_vm": 1731,
+                "name": "name_value",
+                "nat_ip_allocate_option": "nat_ip_allocate_option_value",
+                "nat_ips": ["nat_ips_value_1", "nat_ips_value_2"],
+                "rules": [
+                    {
+                        "action": {
+                            "source_nat_active_ips": [
+                                "source_nat_active_ips_value_1",
+                                "source_nat_active_ips_value_2",
+                            ],
+                            "source_nat_drain_ips": [
+                                "source_nat_drain_ips_value_1",
+                                "source_nat_drain_ips_value_2",
+                            ],
+                        },
+                        "description": "description_value",
+                        "match": "match_value",
+                        "rule_number": 1184,
+                    }
+                ],
+                "source_subnetwork_ip_ranges_to_nat": "source_subnetwork_ip_ranges_to_nat_value",
+                "subnetworks": [
+                    {
+                        "name": "name_value",
+                        "secondary_ip_range_names": [
+                            "secondary_ip_range_names_value_1",
+                            "secondary_ip_range_names_value_2",
+                        ],
+                        "source_ip_ranges_to_nat": [
+                            "source_ip_ranges_to_nat_value_1",
+                            "source_ip_ranges_to_nat_value_2",
+                        ],
+                    }
+                ],
+                "tcp_established_idle_timeout_sec": 3371,
+                "tcp_time_wait_timeout_sec": 2665,
+                "tcp_transitory_idle_timeout_sec": 3330,
+                "udp_idle_timeout_sec": 2118,
+            }
+        ],
+        "network": "network_value",
+        "region": "region_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.RoutersPreviewResponse()
 
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.RoutersPreviewResponse.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.preview(request)
 
-def test_patch_unary_rest_error():
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.RoutersPreviewResponse)
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.PreviewRouterRequest, dict,])
-def test_preview_rest(request_type):
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_preview_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -2992,7 +4141,7 @@ def test_preview_rest(request_type):
         json_return_value = compute.RoutersPreviewResponse.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.preview(request)
+        response = await client.preview(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.RoutersPreviewResponse)
@@ -3047,19 +4196,13 @@ def test_preview_rest_required_fields(request_type=compute.PreviewRouterRequest)
     return_value = compute.RoutersPreviewResponse()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -3069,27 +4212,231 @@ def test_preview_rest_required_fields(request_type=compute.PreviewRouterRequest)
 
             response = client.preview(request)
 
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            assert expected_params == actual_params
+
+
+def test_preview_rest_unset_required_fields():
+    transport = transports.RoutersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.preview._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(()) & set(("project", "region", "router", "routerResource",))
+    )
+
+
+def test_preview_rest_bad_request(
+    transport: str = "rest", request_type=compute.PreviewRouterRequest
+):
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "region": "sample2", "router": "sample3"}
+    request_init["router_resource"] = {
+        "bgp": {
+            "advertise_mode": "advertise_mode_value",
+            "advertised_groups": [
+                "advertised_groups_value_1",
+                "advertised_groups_value_2",
+            ],
+            "advertised_ip_ranges": [
+                {"description": "description_value", "range_": "range__value"}
+            ],
+            "asn": 322,
+            "keepalive_interval": 1914,
+        },
+        "bgp_peers": [
+            {
+                "advertise_mode": "advertise_mode_value",
+                "advertised_groups": [
+                    "advertised_groups_value_1",
+                    "advertised_groups_value_2",
+                ],
+                "advertised_ip_ranges": [
+                    {"description": "description_value", "range_": "range__value"}
+                ],
+                "advertised_route_priority": 2714,
+                "bfd": {
+                    "min_receive_interval": 2122,
+                    "min_transmit_interval": 2265,
+                    "multiplier": 1095,
+                    "session_initialization_mode": "session_initialization_mode_value",
+                },
+                "enable": "enable_value",
+                "interface_name": "interface_name_value",
+                "ip_address": "ip_address_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "peer_asn": 845,
+                "peer_ip_address": "peer_ip_address_value",
+                "router_appliance_instance": "router_appliance_instance_value",
+            }
+        ],
+        "creation_timestamp": "creation_timestamp_value",
+        "description": "description_value",
+        "encrypted_interconnect_router": True,
+        "id": 205,
+        "interfaces": [
+            {
+                "ip_range": "ip_range_value",
+                "linked_interconnect_attachment": "linked_interconnect_attachment_value",
+                "linked_vpn_tunnel": "linked_vpn_tunnel_value",
+                "management_type": "management_type_value",
+                "name": "name_value",
+                "private_ip_address": "private_ip_address_value",
+                "redundant_interface": "redundant_interface_value",
+                "subnetwork": "subnetwork_value",
+            }
+        ],
+        "kind": "kind_value",
+        "name": "name_value",
+        "nats": [
+            {
+                "drain_nat_ips": ["drain_nat_ips_value_1", "drain_nat_ips_value_2"],
+                "enable_endpoint_independent_mapping": True,
+                "icmp_idle_timeout_sec": 2214,
+                "log_config": {"enable": True, "filter": "filter_value"},
+                "min_ports_per_vm": 1731,
+                "name": "name_value",
+                "nat_ip_allocate_option": "nat_ip_allocate_option_value",
+                "nat_ips": ["nat_ips_value_1", "nat_ips_value_2"],
+                "rules": [
+                    {
+                        "action": {
+                            "source_nat_active_ips": [
+                                "source_nat_active_ips_value_1",
+                                "source_nat_active_ips_value_2",
+                            ],
+                            "source_nat_drain_ips": [
+                                "source_nat_drain_ips_value_1",
+                                "source_nat_drain_ips_value_2",
+                            ],
+                        },
+                        "description": "description_value",
+                        "match": "match_value",
+                        "rule_number": 1184,
+                    }
+                ],
+                "source_subnetwork_ip_ranges_to_nat": "source_subnetwork_ip_ranges_to_nat_value",
+                "subnetworks": [
+                    {
+                        "name": "name_value",
+                        "secondary_ip_range_names": [
+                            "secondary_ip_range_names_value_1",
+                            "secondary_ip_range_names_value_2",
+                        ],
+                        "source_ip_ranges_to_nat": [
+                            "source_ip_ranges_to_nat_value_1",
+                            "source_ip_ranges_to_nat_value_2",
+                        ],
+                    }
+                ],
+                "tcp_established_idle_timeout_sec": 3371,
+                "tcp_time_wait_timeout_sec": 2665,
+                "tcp_transitory_idle_timeout_sec": 3330,
+                "udp_idle_timeout_sec": 2118,
+            }
+        ],
+        "network": "network_value",
+        "region": "region_value",
+        "self_link": "self_link_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.preview(request)
+
+
+def test_preview_rest_flattened():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.RoutersPreviewResponse()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.RoutersPreviewResponse.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {
+            "project": "sample1",
+            "region": "sample2",
+            "router": "sample3",
+        }
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            region="region_value",
+            router="router_value",
+            router_resource=compute.Router(
+                bgp=compute.RouterBgp(advertise_mode="advertise_mode_value")
+            ),
+        )
+        mock_args.update(sample_request)
+        client.preview(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/regions/{region}/routers/{router}/preview"
+            % client.transport._host,
+            args[1],
+        )
 
 
-def test_preview_rest_unset_required_fields():
-    transport = transports.RoutersRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
+def test_preview_rest_flattened_error(transport: str = "rest"):
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    unset_fields = transport.preview._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(()) & set(("project", "region", "router", "routerResource",))
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.preview(
+            compute.PreviewRouterRequest(),
+            project="project_value",
+            region="region_value",
+            router="router_value",
+            router_resource=compute.Router(
+                bgp=compute.RouterBgp(advertise_mode="advertise_mode_value")
+            ),
+        )
+
+
+def test_preview_rest_error():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
     )
 
 
-def test_preview_rest_bad_request(
-    transport: str = "rest", request_type=compute.PreviewRouterRequest
-):
+@pytest.mark.parametrize("request_type", [compute.UpdateRouterRequest, dict,])
+def test_update_unary_rest(request_type):
     client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
     )
 
     # send a request that will satisfy transcoding
@@ -3205,95 +4552,73 @@ def test_preview_rest_bad_request(
     }
     request = request_type(request_init)
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.preview(request)
-
-
-def test_preview_rest_flattened():
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.RoutersPreviewResponse()
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
-        json_return_value = compute.RoutersPreviewResponse.to_json(return_value)
-
+        json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
+        response = client.update_unary(request)
 
-        # get arguments that satisfy an http rule for this method
-        sample_request = {
-            "project": "sample1",
-            "region": "sample2",
-            "router": "sample3",
-        }
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            region="region_value",
-            router="router_value",
-            router_resource=compute.Router(
-                bgp=compute.RouterBgp(advertise_mode="advertise_mode_value")
-            ),
-        )
-        mock_args.update(sample_request)
-        client.preview(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/regions/{region}/routers/{router}/preview"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_preview_rest_flattened_error(transport: str = "rest"):
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.preview(
-            compute.PreviewRouterRequest(),
-            project="project_value",
-            region="region_value",
-            router="router_value",
-            router_resource=compute.Router(
-                bgp=compute.RouterBgp(advertise_mode="advertise_mode_value")
-            ),
-        )
-
-
-def test_preview_rest_error():
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.UpdateRouterRequest, dict,])
-def test_update_unary_rest(request_type):
-    client = RoutersClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_update_unary_rest_asyncio(request_type):
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -3443,7 +4768,7 @@ def test_update_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.update_unary(request)
+        response = await client.update_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -3522,19 +4847,13 @@ def test_update_unary_rest_required_fields(request_type=compute.UpdateRouterRequ
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "put",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("put", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -3546,6 +4865,11 @@ def test_update_unary_rest_required_fields(request_type=compute.UpdateRouterRequ
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -4085,6 +5409,102 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.RoutersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.RoutersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.aggregated_list is first.aggregated_list
+    assert first.aggregated_list._session is first._session
+    assert second.aggregated_list._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "region": "sample2", "router": "sample3"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterList(next_page_token="abc"),
+            compute.RouterList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.RouterList.to_json(response_val).encode(
+                "UTF-8"
+            )
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1", "region": "sample2"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.RouterAggregatedList(next_page_token="abc"),
+            compute.RouterAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.RouterAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -4101,6 +5521,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = RoutersAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.RoutersAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = RoutersAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.RoutersAsyncRestTransport)
+    assert RoutersAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.RoutersAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = RoutersClient(client_options={"session": session})
+    other = RoutersClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.RoutersRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        RoutersClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.RoutersRestTransport)
+    client = RoutersClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.RoutersRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = RoutersAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class", [(RoutersClient, transports.RoutersRestTransport),]
 )
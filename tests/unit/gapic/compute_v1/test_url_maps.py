@@ -34,7 +34,13 @@ from google.api_core import grpc_helpers
 from google.api_core import grpc_helpers_async
 from google.api_core import path_template
 from google.auth import credentials as ga_credentials
+from google.auth.transport.requests import AuthorizedSession
 from google.auth.exceptions import MutualTLSChannelError
+from google.cloud.compute_v1 import _request_plan
+from google.cloud.compute_v1 import response_decoding
+from google.cloud.compute_v1._async_session import AsyncAuthorizedSession
+from google.cloud.compute_v1.client_options import ClientOptions as ComputeClientOptions
+from google.cloud.compute_v1.services.url_maps import UrlMapsAsyncClient
 from google.cloud.compute_v1.services.url_maps import UrlMapsClient
 from google.cloud.compute_v1.services.url_maps import pagers
 from google.cloud.compute_v1.services.url_maps import transports
@@ -507,6 +513,45 @@ def test_aggregated_list_rest(request_type):
     assert response.unreachables == ["unreachables_value"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.AggregatedListUrlMapsRequest, dict,])
+async def test_aggregated_list_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.UrlMapsAggregatedList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+            unreachables=["unreachables_value"],
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.UrlMapsAggregatedList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.aggregated_list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.AggregatedListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+    assert response.unreachables == ["unreachables_value"]
+
+
 def test_aggregated_list_rest_required_fields(
     request_type=compute.AggregatedListUrlMapsRequest,
 ):
@@ -561,18 +606,13 @@ def test_aggregated_list_rest_required_fields(
     return_value = compute.UrlMapsAggregatedList()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -744,6 +784,213 @@ def test_aggregated_list_rest_pager(transport: str = "rest"):
             assert page_.raw_page.next_page_token == token
 
 
+def test_aggregated_list_rest_pager_views(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapsAggregatedList(
+                items={
+                    "a": compute.UrlMapsScopedList(),
+                    "b": compute.UrlMapsScopedList(),
+                    "c": compute.UrlMapsScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.UrlMapsAggregatedList(items={}, next_page_token="def",),
+            compute.UrlMapsAggregatedList(
+                items={"g": compute.UrlMapsScopedList(),}, next_page_token="ghi",
+            ),
+            compute.UrlMapsAggregatedList(
+                items={
+                    "h": compute.UrlMapsScopedList(),
+                    "i": compute.UrlMapsScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapsAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = list(client.aggregated_list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapsAggregatedList(
+                items={
+                    "a": compute.UrlMapsScopedList(),
+                    "b": compute.UrlMapsScopedList(),
+                    "c": compute.UrlMapsScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.UrlMapsAggregatedList(items={}, next_page_token="def",),
+            compute.UrlMapsAggregatedList(
+                items={"g": compute.UrlMapsScopedList(),}, next_page_token="ghi",
+            ),
+            compute.UrlMapsAggregatedList(
+                items={
+                    "h": compute.UrlMapsScopedList(),
+                    "i": compute.UrlMapsScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapsAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request)
+
+        assert isinstance(pager.get("a"), compute.UrlMapsScopedList)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (str, compute.UrlMapsScopedList)
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), compute.UrlMapsScopedList)
+
+        pages = [
+            p
+            async for p in (await client.aggregated_list(request=sample_request)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_aggregated_list_rest_asyncio_pager_views(
+    transport: str = "rest_asyncio",
+):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapsAggregatedList(
+                items={
+                    "a": compute.UrlMapsScopedList(),
+                    "b": compute.UrlMapsScopedList(),
+                    "c": compute.UrlMapsScopedList(),
+                },
+                next_page_token="abc",
+            ),
+            compute.UrlMapsAggregatedList(items={}, next_page_token="def",),
+            compute.UrlMapsAggregatedList(
+                items={"g": compute.UrlMapsScopedList(),}, next_page_token="ghi",
+            ),
+            compute.UrlMapsAggregatedList(
+                items={
+                    "h": compute.UrlMapsScopedList(),
+                    "i": compute.UrlMapsScopedList(),
+                },
+            ),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapsAggregatedList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.aggregated_list(request=sample_request, views=True)
+
+        assert isinstance(pager.get("a"), response_decoding.LazyMessage)
+        assert pager.get("h") is None
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, tuple) for i in results)
+        for result in results:
+            assert isinstance(result, tuple)
+            assert tuple(type(t) for t in result) == (
+                str,
+                response_decoding.LazyMessage,
+            )
+
+        assert pager.get("a") is None
+        assert isinstance(pager.get("h"), response_decoding.LazyMessage)
+
+        pages = [
+            p
+            async for p in (
+                await client.aggregated_list(request=sample_request, views=True)
+            ).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
 @pytest.mark.parametrize("request_type", [compute.DeleteUrlMapRequest, dict,])
 def test_delete_unary_rest(request_type):
     client = UrlMapsClient(
@@ -816,76 +1063,149 @@ def test_delete_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_delete_unary_rest_required_fields(request_type=compute.DeleteUrlMapRequest):
-    transport_class = transports.UrlMapsRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request_init["url_map"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.DeleteUrlMapRequest, dict,])
+async def test_delete_unary_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).delete._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-    jsonified_request["urlMap"] = "url_map_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).delete._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-    assert "urlMap" in jsonified_request
-    assert jsonified_request["urlMap"] == "url_map_value"
-
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
     request = request_type(request_init)
 
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "delete",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.Operation.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.delete_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_delete_unary_rest_required_fields(request_type=compute.DeleteUrlMapRequest):
+    transport_class = transports.UrlMapsRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request_init["url_map"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["project"] = "project_value"
+    jsonified_request["urlMap"] = "url_map_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).delete._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id",))
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+    assert "urlMap" in jsonified_request
+    assert jsonified_request["urlMap"] == "url_map_value"
+
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("delete", "v1/sample_method", None)
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.Operation.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
 
             response = client.delete_unary(request)
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -1025,6 +1345,53 @@ def test_get_rest(request_type):
     assert response.self_link == "self_link_value"
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.GetUrlMapRequest, dict,])
+async def test_get_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.UrlMap(
+            creation_timestamp="creation_timestamp_value",
+            default_service="default_service_value",
+            description="description_value",
+            fingerprint="fingerprint_value",
+            id=205,
+            kind="kind_value",
+            name="name_value",
+            region="region_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.UrlMap.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.get(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.UrlMap)
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.default_service == "default_service_value"
+    assert response.description == "description_value"
+    assert response.fingerprint == "fingerprint_value"
+    assert response.id == 205
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+
+
 def test_get_rest_required_fields(request_type=compute.GetUrlMapRequest):
     transport_class = transports.UrlMapsRestTransport
 
@@ -1070,18 +1437,13 @@ def test_get_rest_required_fields(request_type=compute.GetUrlMapRequest):
     return_value = compute.UrlMap()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
 
             response_value = Response()
             response_value.status_code = 200
@@ -1772,92 +2134,11 @@ def test_insert_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_insert_unary_rest_required_fields(request_type=compute.InsertUrlMapRequest):
-    transport_class = transports.UrlMapsRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
-
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).insert._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).insert._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(("request_id",))
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.Operation()
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.Operation.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
-
-            response = client.insert_unary(request)
-
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
-
-
-def test_insert_unary_rest_unset_required_fields():
-    transport = transports.UrlMapsRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
-
-    unset_fields = transport.insert._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("requestId",)) & set(("project", "urlMapResource",))
-    )
-
-
-def test_insert_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.InsertUrlMapRequest
-):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InsertUrlMapRequest, dict,])
+async def test_insert_unary_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -2378,97 +2659,6 @@ def test_insert_unary_rest_bad_request(
     }
     request = request_type(request_init)
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.insert_unary(request)
-
-
-def test_insert_unary_rest_flattened():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            url_map_resource=compute.UrlMap(
-                creation_timestamp="creation_timestamp_value"
-            ),
-        )
-        mock_args.update(sample_request)
-        client.insert_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/urlMaps"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_insert_unary_rest_flattened_error(transport: str = "rest"):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.insert_unary(
-            compute.InsertUrlMapRequest(),
-            project="project_value",
-            url_map_resource=compute.UrlMap(
-                creation_timestamp="creation_timestamp_value"
-            ),
-        )
-
-
-def test_insert_unary_rest_error():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
-
-
-@pytest.mark.parametrize("request_type", [compute.InvalidateCacheUrlMapRequest, dict,])
-def test_invalidate_cache_unary_rest(request_type):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "url_map": "sample2"}
-    request_init["cache_invalidation_rule_resource"] = {
-        "host": "host_value",
-        "path": "path_value",
-    }
-    request = request_type(request_init)
-
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
@@ -2503,7 +2693,7 @@ def test_invalidate_cache_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.invalidate_cache_unary(request)
+        response = await client.insert_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -2531,14 +2721,11 @@ def test_invalidate_cache_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_invalidate_cache_unary_rest_required_fields(
-    request_type=compute.InvalidateCacheUrlMapRequest,
-):
+def test_insert_unary_rest_required_fields(request_type=compute.InsertUrlMapRequest):
     transport_class = transports.UrlMapsRestTransport
 
     request_init = {}
     request_init["project"] = ""
-    request_init["url_map"] = ""
     request = request_type(request_init)
     jsonified_request = json.loads(
         request_type.to_json(
@@ -2550,17 +2737,16 @@ def test_invalidate_cache_unary_rest_required_fields(
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).invalidate_cache._get_unset_required_fields(jsonified_request)
+    ).insert._get_unset_required_fields(jsonified_request)
     jsonified_request.update(unset_fields)
 
     # verify required fields with default values are now present
 
     jsonified_request["project"] = "project_value"
-    jsonified_request["urlMap"] = "url_map_value"
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).invalidate_cache._get_unset_required_fields(jsonified_request)
+    ).insert._get_unset_required_fields(jsonified_request)
     # Check that path parameters and body parameters are not mixing in.
     assert not set(unset_fields) - set(("request_id",))
     jsonified_request.update(unset_fields)
@@ -2568,8 +2754,6 @@ def test_invalidate_cache_unary_rest_required_fields(
     # verify required fields with non-default values are left alone
     assert "project" in jsonified_request
     assert jsonified_request["project"] == "project_value"
-    assert "urlMap" in jsonified_request
-    assert jsonified_request["urlMap"] == "url_map_value"
 
     client = UrlMapsClient(
         credentials=ga_credentials.AnonymousCredentials(), transport="rest",
@@ -2580,19 +2764,13 @@ def test_invalidate_cache_unary_rest_required_fields(
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -2600,362 +2778,38 @@ def test_invalidate_cache_unary_rest_required_fields(
             response_value._content = json_return_value.encode("UTF-8")
             req.return_value = response_value
 
-            response = client.invalidate_cache_unary(request)
+            response = client.insert_unary(request)
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
-def test_invalidate_cache_unary_rest_unset_required_fields():
+def test_insert_unary_rest_unset_required_fields():
     transport = transports.UrlMapsRestTransport(
         credentials=ga_credentials.AnonymousCredentials
     )
 
-    unset_fields = transport.invalidate_cache._get_unset_required_fields({})
+    unset_fields = transport.insert._get_unset_required_fields({})
     assert set(unset_fields) == (
-        set(("requestId",))
-        & set(("cacheInvalidationRuleResource", "project", "urlMap",))
+        set(("requestId",)) & set(("project", "urlMapResource",))
     )
 
 
-def test_invalidate_cache_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.InvalidateCacheUrlMapRequest
+def test_insert_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.InsertUrlMapRequest
 ):
     client = UrlMapsClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
     )
 
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "url_map": "sample2"}
-    request_init["cache_invalidation_rule_resource"] = {
-        "host": "host_value",
-        "path": "path_value",
-    }
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.invalidate_cache_unary(request)
-
-
-def test_invalidate_cache_unary_rest_flattened():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "url_map": "sample2"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            url_map="url_map_value",
-            cache_invalidation_rule_resource=compute.CacheInvalidationRule(
-                host="host_value"
-            ),
-        )
-        mock_args.update(sample_request)
-        client.invalidate_cache_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/urlMaps/{url_map}/invalidateCache"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_invalidate_cache_unary_rest_flattened_error(transport: str = "rest"):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.invalidate_cache_unary(
-            compute.InvalidateCacheUrlMapRequest(),
-            project="project_value",
-            url_map="url_map_value",
-            cache_invalidation_rule_resource=compute.CacheInvalidationRule(
-                host="host_value"
-            ),
-        )
-
-
-def test_invalidate_cache_unary_rest_error():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
-
-
-@pytest.mark.parametrize("request_type", [compute.ListUrlMapsRequest, dict,])
-def test_list_rest(request_type):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
     # send a request that will satisfy transcoding
     request_init = {"project": "sample1"}
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.UrlMapList(
-            id="id_value",
-            kind="kind_value",
-            next_page_token="next_page_token_value",
-            self_link="self_link_value",
-        )
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.UrlMapList.to_json(return_value)
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-        response = client.list(request)
-
-    # Establish that the response is the type that we expect.
-    assert isinstance(response, pagers.ListPager)
-    assert response.id == "id_value"
-    assert response.kind == "kind_value"
-    assert response.next_page_token == "next_page_token_value"
-    assert response.self_link == "self_link_value"
-
-
-def test_list_rest_required_fields(request_type=compute.ListUrlMapsRequest):
-    transport_class = transports.UrlMapsRestTransport
-
-    request_init = {}
-    request_init["project"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
-        request_type.to_json(
-            request, including_default_value_fields=False, use_integers_for_enums=False
-        )
-    )
-
-    # verify fields with default values are dropped
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).list._get_unset_required_fields(jsonified_request)
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with default values are now present
-
-    jsonified_request["project"] = "project_value"
-
-    unset_fields = transport_class(
-        credentials=ga_credentials.AnonymousCredentials()
-    ).list._get_unset_required_fields(jsonified_request)
-    # Check that path parameters and body parameters are not mixing in.
-    assert not set(unset_fields) - set(
-        ("max_results", "filter", "order_by", "page_token", "return_partial_success",)
-    )
-    jsonified_request.update(unset_fields)
-
-    # verify required fields with non-default values are left alone
-    assert "project" in jsonified_request
-    assert jsonified_request["project"] == "project_value"
-
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-    request = request_type(request_init)
-
-    # Designate an appropriate value for the returned response.
-    return_value = compute.UrlMapList()
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "get",
-                "query_params": request_init,
-            }
-            transcode.return_value = transcode_result
-
-            response_value = Response()
-            response_value.status_code = 200
-            json_return_value = compute.UrlMapList.to_json(return_value)
-            response_value._content = json_return_value.encode("UTF-8")
-            req.return_value = response_value
-
-            response = client.list(request)
-
-            expected_params = []
-            actual_params = req.call_args.kwargs["params"]
-            assert expected_params == actual_params
-
-
-def test_list_rest_unset_required_fields():
-    transport = transports.UrlMapsRestTransport(
-        credentials=ga_credentials.AnonymousCredentials
-    )
-
-    unset_fields = transport.list._get_unset_required_fields({})
-    assert set(unset_fields) == (
-        set(("maxResults", "filter", "orderBy", "pageToken", "returnPartialSuccess",))
-        & set(("project",))
-    )
-
-
-def test_list_rest_bad_request(
-    transport: str = "rest", request_type=compute.ListUrlMapsRequest
-):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1"}
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.list(request)
-
-
-def test_list_rest_flattened():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.UrlMapList()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.UrlMapList.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(project="project_value",)
-        mock_args.update(sample_request)
-        client.list(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/urlMaps"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_list_rest_flattened_error(transport: str = "rest"):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.list(
-            compute.ListUrlMapsRequest(), project="project_value",
-        )
-
-
-def test_list_rest_pager(transport: str = "rest"):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(Session, "request") as req:
-        # TODO(kbandes): remove this mock unless there's a good reason for it.
-        # with mock.patch.object(path_template, 'transcode') as transcode:
-        # Set the response as a series of pages
-        response = (
-            compute.UrlMapList(
-                items=[compute.UrlMap(), compute.UrlMap(), compute.UrlMap(),],
-                next_page_token="abc",
-            ),
-            compute.UrlMapList(items=[], next_page_token="def",),
-            compute.UrlMapList(items=[compute.UrlMap(),], next_page_token="ghi",),
-            compute.UrlMapList(items=[compute.UrlMap(), compute.UrlMap(),],),
-        )
-        # Two responses for two calls
-        response = response + response
-
-        # Wrap the values into proper Response objs
-        response = tuple(compute.UrlMapList.to_json(x) for x in response)
-        return_values = tuple(Response() for i in response)
-        for return_val, response_val in zip(return_values, response):
-            return_val._content = response_val.encode("UTF-8")
-            return_val.status_code = 200
-        req.side_effect = return_values
-
-        sample_request = {"project": "sample1"}
-
-        pager = client.list(request=sample_request)
-
-        results = list(pager)
-        assert len(results) == 6
-        assert all(isinstance(i, compute.UrlMap) for i in results)
-
-        pages = list(client.list(request=sample_request).pages)
-        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
-            assert page_.raw_page.next_page_token == token
-
-
-@pytest.mark.parametrize("request_type", [compute.PatchUrlMapRequest, dict,])
-def test_patch_unary_rest(request_type):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # send a request that will satisfy transcoding
-    request_init = {"project": "sample1", "url_map": "sample2"}
     request_init["url_map_resource"] = {
         "creation_timestamp": "creation_timestamp_value",
         "default_route_action": {
@@ -3472,6 +3326,97 @@ def test_patch_unary_rest(request_type):
     }
     request = request_type(request_init)
 
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.insert_unary(request)
+
+
+def test_insert_unary_rest_flattened():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            url_map_resource=compute.UrlMap(
+                creation_timestamp="creation_timestamp_value"
+            ),
+        )
+        mock_args.update(sample_request)
+        client.insert_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/urlMaps"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_insert_unary_rest_flattened_error(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.insert_unary(
+            compute.InsertUrlMapRequest(),
+            project="project_value",
+            url_map_resource=compute.UrlMap(
+                creation_timestamp="creation_timestamp_value"
+            ),
+        )
+
+
+def test_insert_unary_rest_error():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.InvalidateCacheUrlMapRequest, dict,])
+def test_invalidate_cache_unary_rest(request_type):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["cache_invalidation_rule_resource"] = {
+        "host": "host_value",
+        "path": "path_value",
+    }
+    request = request_type(request_init)
+
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
@@ -3506,7 +3451,7 @@ def test_patch_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.patch_unary(request)
+        response = client.invalidate_cache_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -3534,14 +3479,93 @@ def test_patch_unary_rest(request_type):
     assert response.zone == "zone_value"
 
 
-def test_patch_unary_rest_required_fields(request_type=compute.PatchUrlMapRequest):
-    transport_class = transports.UrlMapsRestTransport
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.InvalidateCacheUrlMapRequest, dict,])
+async def test_invalidate_cache_unary_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
 
-    request_init = {}
-    request_init["project"] = ""
-    request_init["url_map"] = ""
-    request = request_type(request_init)
-    jsonified_request = json.loads(
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["cache_invalidation_rule_resource"] = {
+        "host": "host_value",
+        "path": "path_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.invalidate_cache_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_invalidate_cache_unary_rest_required_fields(
+    request_type=compute.InvalidateCacheUrlMapRequest,
+):
+    transport_class = transports.UrlMapsRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request_init["url_map"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
         request_type.to_json(
             request, including_default_value_fields=False, use_integers_for_enums=False
         )
@@ -3551,7 +3575,7 @@ def test_patch_unary_rest_required_fields(request_type=compute.PatchUrlMapReques
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).patch._get_unset_required_fields(jsonified_request)
+    ).invalidate_cache._get_unset_required_fields(jsonified_request)
     jsonified_request.update(unset_fields)
 
     # verify required fields with default values are now present
@@ -3561,7 +3585,7 @@ def test_patch_unary_rest_required_fields(request_type=compute.PatchUrlMapReques
 
     unset_fields = transport_class(
         credentials=ga_credentials.AnonymousCredentials()
-    ).patch._get_unset_required_fields(jsonified_request)
+    ).invalidate_cache._get_unset_required_fields(jsonified_request)
     # Check that path parameters and body parameters are not mixing in.
     assert not set(unset_fields) - set(("request_id",))
     jsonified_request.update(unset_fields)
@@ -3581,19 +3605,13 @@ def test_patch_unary_rest_required_fields(request_type=compute.PatchUrlMapReques
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "patch",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -3601,26 +3619,32 @@ def test_patch_unary_rest_required_fields(request_type=compute.PatchUrlMapReques
             response_value._content = json_return_value.encode("UTF-8")
             req.return_value = response_value
 
-            response = client.patch_unary(request)
+            response = client.invalidate_cache_unary(request)
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
-def test_patch_unary_rest_unset_required_fields():
+def test_invalidate_cache_unary_rest_unset_required_fields():
     transport = transports.UrlMapsRestTransport(
         credentials=ga_credentials.AnonymousCredentials
     )
 
-    unset_fields = transport.patch._get_unset_required_fields({})
+    unset_fields = transport.invalidate_cache._get_unset_required_fields({})
     assert set(unset_fields) == (
-        set(("requestId",)) & set(("project", "urlMap", "urlMapResource",))
+        set(("requestId",))
+        & set(("cacheInvalidationRuleResource", "project", "urlMap",))
     )
 
 
-def test_patch_unary_rest_bad_request(
-    transport: str = "rest", request_type=compute.PatchUrlMapRequest
+def test_invalidate_cache_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.InvalidateCacheUrlMapRequest
 ):
     client = UrlMapsClient(
         credentials=ga_credentials.AnonymousCredentials(), transport=transport,
@@ -3628,165 +3652,2520 @@ def test_patch_unary_rest_bad_request(
 
     # send a request that will satisfy transcoding
     request_init = {"project": "sample1", "url_map": "sample2"}
-    request_init["url_map_resource"] = {
-        "creation_timestamp": "creation_timestamp_value",
-        "default_route_action": {
-            "cors_policy": {
-                "allow_credentials": True,
-                "allow_headers": ["allow_headers_value_1", "allow_headers_value_2"],
-                "allow_methods": ["allow_methods_value_1", "allow_methods_value_2"],
-                "allow_origin_regexes": [
-                    "allow_origin_regexes_value_1",
-                    "allow_origin_regexes_value_2",
-                ],
-                "allow_origins": ["allow_origins_value_1", "allow_origins_value_2"],
-                "disabled": True,
-                "expose_headers": ["expose_headers_value_1", "expose_headers_value_2"],
-                "max_age": 722,
-            },
-            "fault_injection_policy": {
-                "abort": {"http_status": 1219, "percentage": 0.10540000000000001},
-                "delay": {
-                    "fixed_delay": {"nanos": 543, "seconds": 751},
-                    "percentage": 0.10540000000000001,
-                },
-            },
-            "max_stream_duration": {"nanos": 543, "seconds": 751},
-            "request_mirror_policy": {"backend_service": "backend_service_value"},
-            "retry_policy": {
-                "num_retries": 1197,
-                "per_try_timeout": {"nanos": 543, "seconds": 751},
-                "retry_conditions": [
-                    "retry_conditions_value_1",
-                    "retry_conditions_value_2",
-                ],
-            },
-            "timeout": {"nanos": 543, "seconds": 751},
-            "url_rewrite": {
-                "host_rewrite": "host_rewrite_value",
-                "path_prefix_rewrite": "path_prefix_rewrite_value",
-            },
-            "weighted_backend_services": [
-                {
-                    "backend_service": "backend_service_value",
-                    "header_action": {
-                        "request_headers_to_add": [
-                            {
-                                "header_name": "header_name_value",
-                                "header_value": "header_value_value",
-                                "replace": True,
-                            }
-                        ],
-                        "request_headers_to_remove": [
-                            "request_headers_to_remove_value_1",
-                            "request_headers_to_remove_value_2",
-                        ],
-                        "response_headers_to_add": [
-                            {
-                                "header_name": "header_name_value",
-                                "header_value": "header_value_value",
-                                "replace": True,
-                            }
-                        ],
-                        "response_headers_to_remove": [
-                            "response_headers_to_remove_value_1",
-                            "response_headers_to_remove_value_2",
-                        ],
-                    },
-                    "weight": 648,
-                }
-            ],
-        },
-        "default_service": "default_service_value",
-        "default_url_redirect": {
-            "host_redirect": "host_redirect_value",
-            "https_redirect": True,
-            "path_redirect": "path_redirect_value",
-            "prefix_redirect": "prefix_redirect_value",
-            "redirect_response_code": "redirect_response_code_value",
-            "strip_query": True,
-        },
-        "description": "description_value",
-        "fingerprint": "fingerprint_value",
-        "header_action": {
-            "request_headers_to_add": [
-                {
-                    "header_name": "header_name_value",
-                    "header_value": "header_value_value",
-                    "replace": True,
-                }
-            ],
-            "request_headers_to_remove": [
-                "request_headers_to_remove_value_1",
-                "request_headers_to_remove_value_2",
-            ],
-            "response_headers_to_add": [
-                {
-                    "header_name": "header_name_value",
-                    "header_value": "header_value_value",
-                    "replace": True,
-                }
-            ],
-            "response_headers_to_remove": [
-                "response_headers_to_remove_value_1",
-                "response_headers_to_remove_value_2",
-            ],
-        },
-        "host_rules": [
-            {
-                "description": "description_value",
-                "hosts": ["hosts_value_1", "hosts_value_2"],
-                "path_matcher": "path_matcher_value",
-            }
-        ],
-        "id": 205,
-        "kind": "kind_value",
-        "name": "name_value",
-        "path_matchers": [
-            {
-                "default_route_action": {
-                    "cors_policy": {
-                        "allow_credentials": True,
-                        "allow_headers": [
-                            "allow_headers_value_1",
-                            "allow_headers_value_2",
-                        ],
-                        "allow_methods": [
-                            "allow_methods_value_1",
-                            "allow_methods_value_2",
-                        ],
-                        "allow_origin_regexes": [
-                            "allow_origin_regexes_value_1",
-                            "allow_origin_regexes_value_2",
-                        ],
-                        "allow_origins": [
-                            "allow_origins_value_1",
-                            "allow_origins_value_2",
-                        ],
-                        "disabled": True,
-                        "expose_headers": [
-                            "expose_headers_value_1",
-                            "expose_headers_value_2",
-                        ],
-                        "max_age": 722,
-                    },
-                    "fault_injection_policy": {
-                        "abort": {
-                            "http_status": 1219,
-                            "percentage": 0.10540000000000001,
-                        },
-                        "delay": {
-                            "fixed_delay": {"nanos": 543, "seconds": 751},
-                            "percentage": 0.10540000000000001,
-                        },
-                    },
-                    "max_stream_duration": {"nanos": 543, "seconds": 751},
-                    "request_mirror_policy": {
-                        "backend_service": "backend_service_value"
-                    },
-                    "retry_policy": {
-                        "num_retries": 1197,
-                        "per_try_timeout": {"nanos": 543, "seconds": 751},
+    request_init["cache_invalidation_rule_resource"] = {
+        "host": "host_value",
+        "path": "path_value",
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.invalidate_cache_unary(request)
+
+
+def test_invalidate_cache_unary_rest_flattened():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "url_map": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            url_map="url_map_value",
+            cache_invalidation_rule_resource=compute.CacheInvalidationRule(
+                host="host_value"
+            ),
+        )
+        mock_args.update(sample_request)
+        client.invalidate_cache_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/urlMaps/{url_map}/invalidateCache"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_invalidate_cache_unary_rest_flattened_error(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.invalidate_cache_unary(
+            compute.InvalidateCacheUrlMapRequest(),
+            project="project_value",
+            url_map="url_map_value",
+            cache_invalidation_rule_resource=compute.CacheInvalidationRule(
+                host="host_value"
+            ),
+        )
+
+
+def test_invalidate_cache_unary_rest_error():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.ListUrlMapsRequest, dict,])
+def test_list_rest(request_type):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.UrlMapList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.UrlMapList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.ListUrlMapsRequest, dict,])
+async def test_list_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.UrlMapList(
+            id="id_value",
+            kind="kind_value",
+            next_page_token="next_page_token_value",
+            self_link="self_link_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.UrlMapList.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.list(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, pagers.ListAsyncPager)
+    assert response.id == "id_value"
+    assert response.kind == "kind_value"
+    assert response.next_page_token == "next_page_token_value"
+    assert response.self_link == "self_link_value"
+
+
+def test_list_rest_required_fields(request_type=compute.ListUrlMapsRequest):
+    transport_class = transports.UrlMapsRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).list._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["project"] = "project_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).list._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(
+        ("max_results", "filter", "order_by", "page_token", "return_partial_success",)
+    )
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.UrlMapList()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("get", "v1/sample_method", None)
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.UrlMapList.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.list(request)
+
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            assert expected_params == actual_params
+
+
+def test_list_rest_unset_required_fields():
+    transport = transports.UrlMapsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.list._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("maxResults", "filter", "orderBy", "pageToken", "returnPartialSuccess",))
+        & set(("project",))
+    )
+
+
+def test_list_rest_bad_request(
+    transport: str = "rest", request_type=compute.ListUrlMapsRequest
+):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1"}
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.list(request)
+
+
+def test_list_rest_flattened():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.UrlMapList()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.UrlMapList.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(project="project_value",)
+        mock_args.update(sample_request)
+        client.list(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/urlMaps"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_list_rest_flattened_error(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.list(
+            compute.ListUrlMapsRequest(), project="project_value",
+        )
+
+
+def test_list_rest_pager(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapList(
+                items=[compute.UrlMap(), compute.UrlMap(), compute.UrlMap(),],
+                next_page_token="abc",
+            ),
+            compute.UrlMapList(items=[], next_page_token="def",),
+            compute.UrlMapList(items=[compute.UrlMap(),], next_page_token="ghi",),
+            compute.UrlMapList(items=[compute.UrlMap(), compute.UrlMap(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.list(request=sample_request)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, compute.UrlMap) for i in results)
+
+        pages = list(client.list(request=sample_request).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+def test_list_rest_pager_views(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapList(
+                items=[compute.UrlMap(), compute.UrlMap(), compute.UrlMap(),],
+                next_page_token="abc",
+            ),
+            compute.UrlMapList(items=[], next_page_token="def",),
+            compute.UrlMapList(items=[compute.UrlMap(),], next_page_token="ghi",),
+            compute.UrlMapList(items=[compute.UrlMap(), compute.UrlMap(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = client.list(request=sample_request, views=True)
+
+        results = list(pager)
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = list(client.list(request=sample_request, views=True).pages)
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager(transport: str = "rest_asyncio"):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapList(
+                items=[compute.UrlMap(), compute.UrlMap(), compute.UrlMap(),],
+                next_page_token="abc",
+            ),
+            compute.UrlMapList(items=[], next_page_token="def",),
+            compute.UrlMapList(items=[compute.UrlMap(),], next_page_token="ghi",),
+            compute.UrlMapList(items=[compute.UrlMap(), compute.UrlMap(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.list(request=sample_request)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, compute.UrlMap) for i in results)
+
+        pages = [p async for p in (await client.list(request=sample_request)).pages]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.asyncio
+async def test_list_rest_asyncio_pager_views(transport: str = "rest_asyncio"):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(AsyncAuthorizedSession, "request") as req:
+        # TODO(kbandes): remove this mock unless there's a good reason for it.
+        # with mock.patch.object(path_template, 'transcode') as transcode:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapList(
+                items=[compute.UrlMap(), compute.UrlMap(), compute.UrlMap(),],
+                next_page_token="abc",
+            ),
+            compute.UrlMapList(items=[], next_page_token="def",),
+            compute.UrlMapList(items=[compute.UrlMap(),], next_page_token="ghi",),
+            compute.UrlMapList(items=[compute.UrlMap(), compute.UrlMap(),],),
+        )
+        # Two responses for two calls
+        response = response + response
+
+        # Wrap the values into proper Response objs
+        response = tuple(compute.UrlMapList.to_json(x) for x in response)
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = response_val.encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pager = await client.list(request=sample_request, views=True)
+
+        results = [i async for i in pager]
+        assert len(results) == 6
+        assert all(isinstance(i, response_decoding.LazyMessage) for i in results)
+
+        pages = [
+            p
+            async for p in (await client.list(request=sample_request, views=True)).pages
+        ]
+        for page_, token in zip(pages, ["abc", "def", "ghi", ""]):
+            assert page_.raw_page.next_page_token == token
+
+
+@pytest.mark.parametrize("request_type", [compute.PatchUrlMapRequest, dict,])
+def test_patch_unary_rest(request_type):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["url_map_resource"] = {
+        "creation_timestamp": "creation_timestamp_value",
+        "default_route_action": {
+            "cors_policy": {
+                "allow_credentials": True,
+                "allow_headers": ["allow_headers_value_1", "allow_headers_value_2"],
+                "allow_methods": ["allow_methods_value_1", "allow_methods_value_2"],
+                "allow_origin_regexes": [
+                    "allow_origin_regexes_value_1",
+                    "allow_origin_regexes_value_2",
+                ],
+                "allow_origins": ["allow_origins_value_1", "allow_origins_value_2"],
+                "disabled": True,
+                "expose_headers": ["expose_headers_value_1", "expose_headers_value_2"],
+                "max_age": 722,
+            },
+            "fault_injection_policy": {
+                "abort": {"http_status": 1219, "percentage": 0.10540000000000001},
+                "delay": {
+                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                    "percentage": 0.10540000000000001,
+                },
+            },
+            "max_stream_duration": {"nanos": 543, "seconds": 751},
+            "request_mirror_policy": {"backend_service": "backend_service_value"},
+            "retry_policy": {
+                "num_retries": 1197,
+                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                "retry_conditions": [
+                    "retry_conditions_value_1",
+                    "retry_conditions_value_2",
+                ],
+            },
+            "timeout": {"nanos": 543, "seconds": 751},
+            "url_rewrite": {
+                "host_rewrite": "host_rewrite_value",
+                "path_prefix_rewrite": "path_prefix_rewrite_value",
+            },
+            "weighted_backend_services": [
+                {
+                    "backend_service": "backend_service_value",
+                    "header_action": {
+                        "request_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "request_headers_to_remove": [
+                            "request_headers_to_remove_value_1",
+                            "request_headers_to_remove_value_2",
+                        ],
+                        "response_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "response_headers_to_remove": [
+                            "response_headers_to_remove_value_1",
+                            "response_headers_to_remove_value_2",
+                        ],
+                    },
+                    "weight": 648,
+                }
+            ],
+        },
+        "default_service": "default_service_value",
+        "default_url_redirect": {
+            "host_redirect": "host_redirect_value",
+            "https_redirect": True,
+            "path_redirect": "path_redirect_value",
+            "prefix_redirect": "prefix_redirect_value",
+            "redirect_response_code": "redirect_response_code_value",
+            "strip_query": True,
+        },
+        "description": "description_value",
+        "fingerprint": "fingerprint_value",
+        "header_action": {
+            "request_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "request_headers_to_remove": [
+                "request_headers_to_remove_value_1",
+                "request_headers_to_remove_value_2",
+            ],
+            "response_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "response_headers_to_remove": [
+                "response_headers_to_remove_value_1",
+                "response_headers_to_remove_value_2",
+            ],
+        },
+        "host_rules": [
+            {
+                "description": "description_value",
+                "hosts": ["hosts_value_1", "hosts_value_2"],
+                "path_matcher": "path_matcher_value",
+            }
+        ],
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "path_matchers": [
+            {
+                "default_route_action": {
+                    "cors_policy": {
+                        "allow_credentials": True,
+                        "allow_headers": [
+                            "allow_headers_value_1",
+                            "allow_headers_value_2",
+                        ],
+                        "allow_methods": [
+                            "allow_methods_value_1",
+                            "allow_methods_value_2",
+                        ],
+                        "allow_origin_regexes": [
+                            "allow_origin_regexes_value_1",
+                            "allow_origin_regexes_value_2",
+                        ],
+                        "allow_origins": [
+                            "allow_origins_value_1",
+                            "allow_origins_value_2",
+                        ],
+                        "disabled": True,
+                        "expose_headers": [
+                            "expose_headers_value_1",
+                            "expose_headers_value_2",
+                        ],
+                        "max_age": 722,
+                    },
+                    "fault_injection_policy": {
+                        "abort": {
+                            "http_status": 1219,
+                            "percentage": 0.10540000000000001,
+                        },
+                        "delay": {
+                            "fixed_delay": {"nanos": 543, "seconds": 751},
+                            "percentage": 0.10540000000000001,
+                        },
+                    },
+                    "max_stream_duration": {"nanos": 543, "seconds": 751},
+                    "request_mirror_policy": {
+                        "backend_service": "backend_service_value"
+                    },
+                    "retry_policy": {
+                        "num_retries": 1197,
+                        "per_try_timeout": {"nanos": 543, "seconds": 751},
+                        "retry_conditions": [
+                            "retry_conditions_value_1",
+                            "retry_conditions_value_2",
+                        ],
+                    },
+                    "timeout": {"nanos": 543, "seconds": 751},
+                    "url_rewrite": {
+                        "host_rewrite": "host_rewrite_value",
+                        "path_prefix_rewrite": "path_prefix_rewrite_value",
+                    },
+                    "weighted_backend_services": [
+                        {
+                            "backend_service": "backend_service_value",
+                            "header_action": {
+                                "request_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "request_headers_to_remove": [
+                                    "request_headers_to_remove_value_1",
+                                    "request_headers_to_remove_value_2",
+                                ],
+                                "response_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "response_headers_to_remove": [
+                                    "response_headers_to_remove_value_1",
+                                    "response_headers_to_remove_value_2",
+                                ],
+                            },
+                            "weight": 648,
+                        }
+                    ],
+                },
+                "default_service": "default_service_value",
+                "default_url_redirect": {
+                    "host_redirect": "host_redirect_value",
+                    "https_redirect": True,
+                    "path_redirect": "path_redirect_value",
+                    "prefix_redirect": "prefix_redirect_value",
+                    "redirect_response_code": "redirect_response_code_value",
+                    "strip_query": True,
+                },
+                "description": "description_value",
+                "header_action": {
+                    "request_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "request_headers_to_remove": [
+                        "request_headers_to_remove_value_1",
+                        "request_headers_to_remove_value_2",
+                    ],
+                    "response_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "response_headers_to_remove": [
+                        "response_headers_to_remove_value_1",
+                        "response_headers_to_remove_value_2",
+                    ],
+                },
+                "name": "name_value",
+                "path_rules": [
+                    {
+                        "paths": ["paths_value_1", "paths_value_2"],
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+                "route_rules": [
+                    {
+                        "description": "description_value",
+                        "header_action": {
+                            "request_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "request_headers_to_remove": [
+                                "request_headers_to_remove_value_1",
+                                "request_headers_to_remove_value_2",
+                            ],
+                            "response_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "response_headers_to_remove": [
+                                "response_headers_to_remove_value_1",
+                                "response_headers_to_remove_value_2",
+                            ],
+                        },
+                        "match_rules": [
+                            {
+                                "full_path_match": "full_path_match_value",
+                                "header_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "header_name": "header_name_value",
+                                        "invert_match": True,
+                                        "prefix_match": "prefix_match_value",
+                                        "present_match": True,
+                                        "range_match": {
+                                            "range_end": 931,
+                                            "range_start": 1178,
+                                        },
+                                        "regex_match": "regex_match_value",
+                                        "suffix_match": "suffix_match_value",
+                                    }
+                                ],
+                                "ignore_case": True,
+                                "metadata_filters": [
+                                    {
+                                        "filter_labels": [
+                                            {
+                                                "name": "name_value",
+                                                "value": "value_value",
+                                            }
+                                        ],
+                                        "filter_match_criteria": "filter_match_criteria_value",
+                                    }
+                                ],
+                                "prefix_match": "prefix_match_value",
+                                "query_parameter_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "name": "name_value",
+                                        "present_match": True,
+                                        "regex_match": "regex_match_value",
+                                    }
+                                ],
+                                "regex_match": "regex_match_value",
+                            }
+                        ],
+                        "priority": 898,
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+            }
+        ],
+        "region": "region_value",
+        "self_link": "self_link_value",
+        "tests": [
+            {
+                "description": "description_value",
+                "expected_output_url": "expected_output_url_value",
+                "expected_redirect_response_code": 3275,
+                "headers": [{"name": "name_value", "value": "value_value"}],
+                "host": "host_value",
+                "path": "path_value",
+                "service": "service_value",
+            }
+        ],
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.patch_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("request_type", [compute.PatchUrlMapRequest, dict,])
+async def test_patch_unary_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["url_map_resource"] = {
+        "creation_timestamp": "creation_timestamp_value",
+        "default_route_action": {
+            "cors_policy": {
+                "allow_credentials": True,
+                "allow_headers": ["allow_headers_value_1", "allow_headers_value_2"],
+                "allow_methods": ["allow_methods_value_1", "allow_methods_value_2"],
+                "allow_origin_regexes": [
+                    "allow_origin_regexes_value_1",
+                    "allow_origin_regexes_value_2",
+                ],
+                "allow_origins": ["allow_origins_value_1", "allow_origins_value_2"],
+                "disabled": True,
+                "expose_headers": ["expose_headers_value_1", "expose_headers_value_2"],
+                "max_age": 722,
+            },
+            "fault_injection_policy": {
+                "abort": {"http_status": 1219, "percentage": 0.10540000000000001},
+                "delay": {
+                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                    "percentage": 0.10540000000000001,
+                },
+            },
+            "max_stream_duration": {"nanos": 543, "seconds": 751},
+            "request_mirror_policy": {"backend_service": "backend_service_value"},
+            "retry_policy": {
+                "num_retries": 1197,
+                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                "retry_conditions": [
+                    "retry_conditions_value_1",
+                    "retry_conditions_value_2",
+                ],
+            },
+            "timeout": {"nanos": 543, "seconds": 751},
+            "url_rewrite": {
+                "host_rewrite": "host_rewrite_value",
+                "path_prefix_rewrite": "path_prefix_rewrite_value",
+            },
+            "weighted_backend_services": [
+                {
+                    "backend_service": "backend_service_value",
+                    "header_action": {
+                        "request_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "request_headers_to_remove": [
+                            "request_headers_to_remove_value_1",
+                            "request_headers_to_remove_value_2",
+                        ],
+                        "response_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "response_headers_to_remove": [
+                            "response_headers_to_remove_value_1",
+                            "response_headers_to_remove_value_2",
+                        ],
+                    },
+                    "weight": 648,
+                }
+            ],
+        },
+        "default_service": "default_service_value",
+        "default_url_redirect": {
+            "host_redirect": "host_redirect_value",
+            "https_redirect": True,
+            "path_redirect": "path_redirect_value",
+            "prefix_redirect": "prefix_redirect_value",
+            "redirect_response_code": "redirect_response_code_value",
+            "strip_query": True,
+        },
+        "description": "description_value",
+        "fingerprint": "fingerprint_value",
+        "header_action": {
+            "request_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "request_headers_to_remove": [
+                "request_headers_to_remove_value_1",
+                "request_headers_to_remove_value_2",
+            ],
+            "response_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "response_headers_to_remove": [
+                "response_headers_to_remove_value_1",
+                "response_headers_to_remove_value_2",
+            ],
+        },
+        "host_rules": [
+            {
+                "description": "description_value",
+                "hosts": ["hosts_value_1", "hosts_value_2"],
+                "path_matcher": "path_matcher_value",
+            }
+        ],
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "path_matchers": [
+            {
+                "default_route_action": {
+                    "cors_policy": {
+                        "allow_credentials": True,
+                        "allow_headers": [
+                            "allow_headers_value_1",
+                            "allow_headers_value_2",
+                        ],
+                        "allow_methods": [
+                            "allow_methods_value_1",
+                            "allow_methods_value_2",
+                        ],
+                        "allow_origin_regexes": [
+                            "allow_origin_regexes_value_1",
+                            "allow_origin_regexes_value_2",
+                        ],
+                        "allow_origins": [
+                            "allow_origins_value_1",
+                            "allow_origins_value_2",
+                        ],
+                        "disabled": True,
+                        "expose_headers": [
+                            "expose_headers_value_1",
+                            "expose_headers_value_2",
+                        ],
+                        "max_age": 722,
+                    },
+                    "fault_injection_policy": {
+                        "abort": {
+                            "http_status": 1219,
+                            "percentage": 0.10540000000000001,
+                        },
+                        "delay": {
+                            "fixed_delay": {"nanos": 543, "seconds": 751},
+                            "percentage": 0.10540000000000001,
+                        },
+                    },
+                    "max_stream_duration": {"nanos": 543, "seconds": 751},
+                    "request_mirror_policy": {
+                        "backend_service": "backend_service_value"
+                    },
+                    "retry_policy": {
+                        "num_retries": 1197,
+                        "per_try_timeout": {"nanos": 543, "seconds": 751},
+                        "retry_conditions": [
+                            "retry_conditions_value_1",
+                            "retry_conditions_value_2",
+                        ],
+                    },
+                    "timeout": {"nanos": 543, "seconds": 751},
+                    "url_rewrite": {
+                        "host_rewrite": "host_rewrite_value",
+                        "path_prefix_rewrite": "path_prefix_rewrite_value",
+                    },
+                    "weighted_backend_services": [
+                        {
+                            "backend_service": "backend_service_value",
+                            "header_action": {
+                                "request_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "request_headers_to_remove": [
+                                    "request_headers_to_remove_value_1",
+                                    "request_headers_to_remove_value_2",
+                                ],
+                                "response_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "response_headers_to_remove": [
+                                    "response_headers_to_remove_value_1",
+                                    "response_headers_to_remove_value_2",
+                                ],
+                            },
+                            "weight": 648,
+                        }
+                    ],
+                },
+                "default_service": "default_service_value",
+                "default_url_redirect": {
+                    "host_redirect": "host_redirect_value",
+                    "https_redirect": True,
+                    "path_redirect": "path_redirect_value",
+                    "prefix_redirect": "prefix_redirect_value",
+                    "redirect_response_code": "redirect_response_code_value",
+                    "strip_query": True,
+                },
+                "description": "description_value",
+                "header_action": {
+                    "request_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "request_headers_to_remove": [
+                        "request_headers_to_remove_value_1",
+                        "request_headers_to_remove_value_2",
+                    ],
+                    "response_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "response_headers_to_remove": [
+                        "response_headers_to_remove_value_1",
+                        "response_headers_to_remove_value_2",
+                    ],
+                },
+                "name": "name_value",
+                "path_rules": [
+                    {
+                        "paths": ["paths_value_1", "paths_value_2"],
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+                "route_rules": [
+                    {
+                        "description": "description_value",
+                        "header_action": {
+                            "request_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "request_headers_to_remove": [
+                                "request_headers_to_remove_value_1",
+                                "request_headers_to_remove_value_2",
+                            ],
+                            "response_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "response_headers_to_remove": [
+                                "response_headers_to_remove_value_1",
+                                "response_headers_to_remove_value_2",
+                            ],
+                        },
+                        "match_rules": [
+                            {
+                                "full_path_match": "full_path_match_value",
+                                "header_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "header_name": "header_name_value",
+                                        "invert_match": True,
+                                        "prefix_match": "prefix_match_value",
+                                        "present_match": True,
+                                        "range_match": {
+                                            "range_end": 931,
+                                            "range_start": 1178,
+                                        },
+                                        "regex_match": "regex_match_value",
+                                        "suffix_match": "suffix_match_value",
+                                    }
+                                ],
+                                "ignore_case": True,
+                                "metadata_filters": [
+                                    {
+                                        "filter_labels": [
+                                            {
+                                                "name": "name_value",
+                                                "value": "value_value",
+                                            }
+                                        ],
+                                        "filter_match_criteria": "filter_match_criteria_value",
+                                    }
+                                ],
+                                "prefix_match": "prefix_match_value",
+                                "query_parameter_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "name": "name_value",
+                                        "present_match": True,
+                                        "regex_match": "regex_match_value",
+                                    }
+                                ],
+                                "regex_match": "regex_match_value",
+                            }
+                        ],
+                        "priority": 898,
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+            }
+        ],
+        "region": "region_value",
+        "self_link": "self_link_value",
+        "tests": [
+            {
+                "description": "description_value",
+                "expected_output_url": "expected_output_url_value",
+                "expected_redirect_response_code": 3275,
+                "headers": [{"name": "name_value", "value": "value_value"}],
+                "host": "host_value",
+                "path": "path_value",
+                "service": "service_value",
+            }
+        ],
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
+        )
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = await client.patch_unary(request)
+
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
+
+
+def test_patch_unary_rest_required_fields(request_type=compute.PatchUrlMapRequest):
+    transport_class = transports.UrlMapsRestTransport
+
+    request_init = {}
+    request_init["project"] = ""
+    request_init["url_map"] = ""
+    request = request_type(request_init)
+    jsonified_request = json.loads(
+        request_type.to_json(
+            request, including_default_value_fields=False, use_integers_for_enums=False
+        )
+    )
+
+    # verify fields with default values are dropped
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).patch._get_unset_required_fields(jsonified_request)
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with default values are now present
+
+    jsonified_request["project"] = "project_value"
+    jsonified_request["urlMap"] = "url_map_value"
+
+    unset_fields = transport_class(
+        credentials=ga_credentials.AnonymousCredentials()
+    ).patch._get_unset_required_fields(jsonified_request)
+    # Check that path parameters and body parameters are not mixing in.
+    assert not set(unset_fields) - set(("request_id",))
+    jsonified_request.update(unset_fields)
+
+    # verify required fields with non-default values are left alone
+    assert "project" in jsonified_request
+    assert jsonified_request["project"] == "project_value"
+    assert "urlMap" in jsonified_request
+    assert jsonified_request["urlMap"] == "url_map_value"
+
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+    request = request_type(request_init)
+
+    # Designate an appropriate value for the returned response.
+    return_value = compute.Operation()
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("patch", "v1/sample_method", "{}")
+
+            response_value = Response()
+            response_value.status_code = 200
+            json_return_value = compute.Operation.to_json(return_value)
+            response_value._content = json_return_value.encode("UTF-8")
+            req.return_value = response_value
+
+            response = client.patch_unary(request)
+
+            expected_params = []
+            actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
+            assert expected_params == actual_params
+
+
+def test_patch_unary_rest_unset_required_fields():
+    transport = transports.UrlMapsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials
+    )
+
+    unset_fields = transport.patch._get_unset_required_fields({})
+    assert set(unset_fields) == (
+        set(("requestId",)) & set(("project", "urlMap", "urlMapResource",))
+    )
+
+
+def test_patch_unary_rest_bad_request(
+    transport: str = "rest", request_type=compute.PatchUrlMapRequest
+):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["url_map_resource"] = {
+        "creation_timestamp": "creation_timestamp_value",
+        "default_route_action": {
+            "cors_policy": {
+                "allow_credentials": True,
+                "allow_headers": ["allow_headers_value_1", "allow_headers_value_2"],
+                "allow_methods": ["allow_methods_value_1", "allow_methods_value_2"],
+                "allow_origin_regexes": [
+                    "allow_origin_regexes_value_1",
+                    "allow_origin_regexes_value_2",
+                ],
+                "allow_origins": ["allow_origins_value_1", "allow_origins_value_2"],
+                "disabled": True,
+                "expose_headers": ["expose_headers_value_1", "expose_headers_value_2"],
+                "max_age": 722,
+            },
+            "fault_injection_policy": {
+                "abort": {"http_status": 1219, "percentage": 0.10540000000000001},
+                "delay": {
+                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                    "percentage": 0.10540000000000001,
+                },
+            },
+            "max_stream_duration": {"nanos": 543, "seconds": 751},
+            "request_mirror_policy": {"backend_service": "backend_service_value"},
+            "retry_policy": {
+                "num_retries": 1197,
+                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                "retry_conditions": [
+                    "retry_conditions_value_1",
+                    "retry_conditions_value_2",
+                ],
+            },
+            "timeout": {"nanos": 543, "seconds": 751},
+            "url_rewrite": {
+                "host_rewrite": "host_rewrite_value",
+                "path_prefix_rewrite": "path_prefix_rewrite_value",
+            },
+            "weighted_backend_services": [
+                {
+                    "backend_service": "backend_service_value",
+                    "header_action": {
+                        "request_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "request_headers_to_remove": [
+                            "request_headers_to_remove_value_1",
+                            "request_headers_to_remove_value_2",
+                        ],
+                        "response_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "response_headers_to_remove": [
+                            "response_headers_to_remove_value_1",
+                            "response_headers_to_remove_value_2",
+                        ],
+                    },
+                    "weight": 648,
+                }
+            ],
+        },
+        "default_service": "default_service_value",
+        "default_url_redirect": {
+            "host_redirect": "host_redirect_value",
+            "https_redirect": True,
+            "path_redirect": "path_redirect_value",
+            "prefix_redirect": "prefix_redirect_value",
+            "redirect_response_code": "redirect_response_code_value",
+            "strip_query": True,
+        },
+        "description": "description_value",
+        "fingerprint": "fingerprint_value",
+        "header_action": {
+            "request_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "request_headers_to_remove": [
+                "request_headers_to_remove_value_1",
+                "request_headers_to_remove_value_2",
+            ],
+            "response_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "response_headers_to_remove": [
+                "response_headers_to_remove_value_1",
+                "response_headers_to_remove_value_2",
+            ],
+        },
+        "host_rules": [
+            {
+                "description": "description_value",
+                "hosts": ["hosts_value_1", "hosts_value_2"],
+                "path_matcher": "path_matcher_value",
+            }
+        ],
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "path_matchers": [
+            {
+                "default_route_action": {
+                    "cors_policy": {
+                        "allow_credentials": True,
+                        "allow_headers": [
+                            "allow_headers_value_1",
+                            "allow_headers_value_2",
+                        ],
+                        "allow_methods": [
+                            "allow_methods_value_1",
+                            "allow_methods_value_2",
+                        ],
+                        "allow_origin_regexes": [
+                            "allow_origin_regexes_value_1",
+                            "allow_origin_regexes_value_2",
+                        ],
+                        "allow_origins": [
+                            "allow_origins_value_1",
+                            "allow_origins_value_2",
+                        ],
+                        "disabled": True,
+                        "expose_headers": [
+                            "expose_headers_value_1",
+                            "expose_headers_value_2",
+                        ],
+                        "max_age": 722,
+                    },
+                    "fault_injection_policy": {
+                        "abort": {
+                            "http_status": 1219,
+                            "percentage": 0.10540000000000001,
+                        },
+                        "delay": {
+                            "fixed_delay": {"nanos": 543, "seconds": 751},
+                            "percentage": 0.10540000000000001,
+                        },
+                    },
+                    "max_stream_duration": {"nanos": 543, "seconds": 751},
+                    "request_mirror_policy": {
+                        "backend_service": "backend_service_value"
+                    },
+                    "retry_policy": {
+                        "num_retries": 1197,
+                        "per_try_timeout": {"nanos": 543, "seconds": 751},
+                        "retry_conditions": [
+                            "retry_conditions_value_1",
+                            "retry_conditions_value_2",
+                        ],
+                    },
+                    "timeout": {"nanos": 543, "seconds": 751},
+                    "url_rewrite": {
+                        "host_rewrite": "host_rewrite_value",
+                        "path_prefix_rewrite": "path_prefix_rewrite_value",
+                    },
+                    "weighted_backend_services": [
+                        {
+                            "backend_service": "backend_service_value",
+                            "header_action": {
+                                "request_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "request_headers_to_remove": [
+                                    "request_headers_to_remove_value_1",
+                                    "request_headers_to_remove_value_2",
+                                ],
+                                "response_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "response_headers_to_remove": [
+                                    "response_headers_to_remove_value_1",
+                                    "response_headers_to_remove_value_2",
+                                ],
+                            },
+                            "weight": 648,
+                        }
+                    ],
+                },
+                "default_service": "default_service_value",
+                "default_url_redirect": {
+                    "host_redirect": "host_redirect_value",
+                    "https_redirect": True,
+                    "path_redirect": "path_redirect_value",
+                    "prefix_redirect": "prefix_redirect_value",
+                    "redirect_response_code": "redirect_response_code_value",
+                    "strip_query": True,
+                },
+                "description": "description_value",
+                "header_action": {
+                    "request_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "request_headers_to_remove": [
+                        "request_headers_to_remove_value_1",
+                        "request_headers_to_remove_value_2",
+                    ],
+                    "response_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "response_headers_to_remove": [
+                        "response_headers_to_remove_value_1",
+                        "response_headers_to_remove_value_2",
+                    ],
+                },
+                "name": "name_value",
+                "path_rules": [
+                    {
+                        "paths": ["paths_value_1", "paths_value_2"],
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+                "route_rules": [
+                    {
+                        "description": "description_value",
+                        "header_action": {
+                            "request_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "request_headers_to_remove": [
+                                "request_headers_to_remove_value_1",
+                                "request_headers_to_remove_value_2",
+                            ],
+                            "response_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "response_headers_to_remove": [
+                                "response_headers_to_remove_value_1",
+                                "response_headers_to_remove_value_2",
+                            ],
+                        },
+                        "match_rules": [
+                            {
+                                "full_path_match": "full_path_match_value",
+                                "header_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "header_name": "header_name_value",
+                                        "invert_match": True,
+                                        "prefix_match": "prefix_match_value",
+                                        "present_match": True,
+                                        "range_match": {
+                                            "range_end": 931,
+                                            "range_start": 1178,
+                                        },
+                                        "regex_match": "regex_match_value",
+                                        "suffix_match": "suffix_match_value",
+                                    }
+                                ],
+                                "ignore_case": True,
+                                "metadata_filters": [
+                                    {
+                                        "filter_labels": [
+                                            {
+                                                "name": "name_value",
+                                                "value": "value_value",
+                                            }
+                                        ],
+                                        "filter_match_criteria": "filter_match_criteria_value",
+                                    }
+                                ],
+                                "prefix_match": "prefix_match_value",
+                                "query_parameter_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "name": "name_value",
+                                        "present_match": True,
+                                        "regex_match": "regex_match_value",
+                                    }
+                                ],
+                                "regex_match": "regex_match_value",
+                            }
+                        ],
+                        "priority": 898,
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+            }
+        ],
+        "region": "region_value",
+        "self_link": "self_link_value",
+        "tests": [
+            {
+                "description": "description_value",
+                "expected_output_url": "expected_output_url_value",
+                "expected_redirect_response_code": 3275,
+                "headers": [{"name": "name_value", "value": "value_value"}],
+                "host": "host_value",
+                "path": "path_value",
+                "service": "service_value",
+            }
+        ],
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.patch_unary(request)
+
+
+def test_patch_unary_rest_flattened():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "url_map": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            url_map="url_map_value",
+            url_map_resource=compute.UrlMap(
+                creation_timestamp="creation_timestamp_value"
+            ),
+        )
+        mock_args.update(sample_request)
+        client.patch_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/urlMaps/{url_map}"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_patch_unary_rest_flattened_error(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.patch_unary(
+            compute.PatchUrlMapRequest(),
+            project="project_value",
+            url_map="url_map_value",
+            url_map_resource=compute.UrlMap(
+                creation_timestamp="creation_timestamp_value"
+            ),
+        )
+
+
+def test_patch_unary_rest_error():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.UpdateUrlMapRequest, dict,])
+def test_update_unary_rest(request_type):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["url_map_resource"] = {
+        "creation_timestamp": "creation_timestamp_value",
+        "default_route_action": {
+            "cors_policy": {
+                "allow_credentials": True,
+                "allow_headers": ["allow_headers_value_1", "allow_headers_value_2"],
+                "allow_methods": ["allow_methods_value_1", "allow_methods_value_2"],
+                "allow_origin_regexes": [
+                    "allow_origin_regexes_value_1",
+                    "allow_origin_regexes_value_2",
+                ],
+                "allow_origins": ["allow_origins_value_1", "allow_origins_value_2"],
+                "disabled": True,
+                "expose_headers": ["expose_headers_value_1", "expose_headers_value_2"],
+                "max_age": 722,
+            },
+            "fault_injection_policy": {
+                "abort": {"http_status": 1219, "percentage": 0.10540000000000001},
+                "delay": {
+                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                    "percentage": 0.10540000000000001,
+                },
+            },
+            "max_stream_duration": {"nanos": 543, "seconds": 751},
+            "request_mirror_policy": {"backend_service": "backend_service_value"},
+            "retry_policy": {
+                "num_retries": 1197,
+                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                "retry_conditions": [
+                    "retry_conditions_value_1",
+                    "retry_conditions_value_2",
+                ],
+            },
+            "timeout": {"nanos": 543, "seconds": 751},
+            "url_rewrite": {
+                "host_rewrite": "host_rewrite_value",
+                "path_prefix_rewrite": "path_prefix_rewrite_value",
+            },
+            "weighted_backend_services": [
+                {
+                    "backend_service": "backend_service_value",
+                    "header_action": {
+                        "request_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "request_headers_to_remove": [
+                            "request_headers_to_remove_value_1",
+                            "request_headers_to_remove_value_2",
+                        ],
+                        "response_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "response_headers_to_remove": [
+                            "response_headers_to_remove_value_1",
+                            "response_headers_to_remove_value_2",
+                        ],
+                    },
+                    "weight": 648,
+                }
+            ],
+        },
+        "default_service": "default_service_value",
+        "default_url_redirect": {
+            "host_redirect": "host_redirect_value",
+            "https_redirect": True,
+            "path_redirect": "path_redirect_value",
+            "prefix_redirect": "prefix_redirect_value",
+            "redirect_response_code": "redirect_response_code_value",
+            "strip_query": True,
+        },
+        "description": "description_value",
+        "fingerprint": "fingerprint_value",
+        "header_action": {
+            "request_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "request_headers_to_remove": [
+                "request_headers_to_remove_value_1",
+                "request_headers_to_remove_value_2",
+            ],
+            "response_headers_to_add": [
+                {
+                    "header_name": "header_name_value",
+                    "header_value": "header_value_value",
+                    "replace": True,
+                }
+            ],
+            "response_headers_to_remove": [
+                "response_headers_to_remove_value_1",
+                "response_headers_to_remove_value_2",
+            ],
+        },
+        "host_rules": [
+            {
+                "description": "description_value",
+                "hosts": ["hosts_value_1", "hosts_value_2"],
+                "path_matcher": "path_matcher_value",
+            }
+        ],
+        "id": 205,
+        "kind": "kind_value",
+        "name": "name_value",
+        "path_matchers": [
+            {
+                "default_route_action": {
+                    "cors_policy": {
+                        "allow_credentials": True,
+                        "allow_headers": [
+                            "allow_headers_value_1",
+                            "allow_headers_value_2",
+                        ],
+                        "allow_methods": [
+                            "allow_methods_value_1",
+                            "allow_methods_value_2",
+                        ],
+                        "allow_origin_regexes": [
+                            "allow_origin_regexes_value_1",
+                            "allow_origin_regexes_value_2",
+                        ],
+                        "allow_origins": [
+                            "allow_origins_value_1",
+                            "allow_origins_value_2",
+                        ],
+                        "disabled": True,
+                        "expose_headers": [
+                            "expose_headers_value_1",
+                            "expose_headers_value_2",
+                        ],
+                        "max_age": 722,
+                    },
+                    "fault_injection_policy": {
+                        "abort": {
+                            "http_status": 1219,
+                            "percentage": 0.10540000000000001,
+                        },
+                        "delay": {
+                            "fixed_delay": {"nanos": 543, "seconds": 751},
+                            "percentage": 0.10540000000000001,
+                        },
+                    },
+                    "max_stream_duration": {"nanos": 543, "seconds": 751},
+                    "request_mirror_policy": {
+                        "backend_service": "backend_service_value"
+                    },
+                    "retry_policy": {
+                        "num_retries": 1197,
+                        "per_try_timeout": {"nanos": 543, "seconds": 751},
                         "retry_conditions": [
                             "retry_conditions_value_1",
                             "retry_conditions_value_2",
@@ -4136,97 +6515,81 @@ def test_patch_unary_rest_bad_request(
                 "expected_output_url": "expected_output_url_value",
                 "expected_redirect_response_code": 3275,
                 "headers": [{"name": "name_value", "value": "value_value"}],
-                "host": "host_value",
-                "path": "path_value",
-                "service": "service_value",
-            }
-        ],
-    }
-    request = request_type(request_init)
-
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.patch_unary(request)
-
-
-def test_patch_unary_rest_flattened():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
-    # Mock the http request call within the method and fake a response.
-    with mock.patch.object(type(client.transport._session), "request") as req:
-        # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
-
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
-        response_value._content = json_return_value.encode("UTF-8")
-        req.return_value = response_value
-
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "url_map": "sample2"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            url_map="url_map_value",
-            url_map_resource=compute.UrlMap(
-                creation_timestamp="creation_timestamp_value"
-            ),
-        )
-        mock_args.update(sample_request)
-        client.patch_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/urlMaps/{url_map}"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_patch_unary_rest_flattened_error(transport: str = "rest"):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.patch_unary(
-            compute.PatchUrlMapRequest(),
-            project="project_value",
-            url_map="url_map_value",
-            url_map_resource=compute.UrlMap(
-                creation_timestamp="creation_timestamp_value"
-            ),
+                "host": "host_value",
+                "path": "path_value",
+                "service": "service_value",
+            }
+        ],
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation(
+            client_operation_id="client_operation_id_value",
+            creation_timestamp="creation_timestamp_value",
+            description="description_value",
+            end_time="end_time_value",
+            http_error_message="http_error_message_value",
+            http_error_status_code=2374,
+            id=205,
+            insert_time="insert_time_value",
+            kind="kind_value",
+            name="name_value",
+            operation_group_id="operation_group_id_value",
+            operation_type="operation_type_value",
+            progress=885,
+            region="region_value",
+            self_link="self_link_value",
+            start_time="start_time_value",
+            status=compute.Operation.Status.DONE,
+            status_message="status_message_value",
+            target_id=947,
+            target_link="target_link_value",
+            user="user_value",
+            zone="zone_value",
         )
 
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+        response = client.update_unary(request)
 
-def test_patch_unary_rest_error():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.Operation)
+    assert response.client_operation_id == "client_operation_id_value"
+    assert response.creation_timestamp == "creation_timestamp_value"
+    assert response.description == "description_value"
+    assert response.end_time == "end_time_value"
+    assert response.http_error_message == "http_error_message_value"
+    assert response.http_error_status_code == 2374
+    assert response.id == 205
+    assert response.insert_time == "insert_time_value"
+    assert response.kind == "kind_value"
+    assert response.name == "name_value"
+    assert response.operation_group_id == "operation_group_id_value"
+    assert response.operation_type == "operation_type_value"
+    assert response.progress == 885
+    assert response.region == "region_value"
+    assert response.self_link == "self_link_value"
+    assert response.start_time == "start_time_value"
+    assert response.status == compute.Operation.Status.DONE
+    assert response.status_message == "status_message_value"
+    assert response.target_id == 947
+    assert response.target_link == "target_link_value"
+    assert response.user == "user_value"
+    assert response.zone == "zone_value"
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.UpdateUrlMapRequest, dict,])
-def test_update_unary_rest(request_type):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_update_unary_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -4781,7 +7144,7 @@ def test_update_unary_rest(request_type):
         json_return_value = compute.Operation.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.update_unary(request)
+        response = await client.update_unary(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.Operation)
@@ -4856,19 +7219,13 @@ def test_update_unary_rest_required_fields(request_type=compute.UpdateUrlMapRequ
     return_value = compute.Operation()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "put",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("put", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -4880,6 +7237,11 @@ def test_update_unary_rest_required_fields(request_type=compute.UpdateUrlMapRequ
 
             expected_params = []
             actual_params = req.call_args.kwargs["params"]
+            # A request id is sent, on a copy of the request.
+            assert not request.request_id
+            request_id = dict(actual_params)["requestId"]
+            assert request_id
+            actual_params.remove(("requestId", request_id))
             assert expected_params == actual_params
 
 
@@ -5050,97 +7412,262 @@ def test_update_unary_rest_bad_request(
                             "http_status": 1219,
                             "percentage": 0.10540000000000001,
                         },
-                        "delay": {
-                            "fixed_delay": {"nanos": 543, "seconds": 751},
-                            "percentage": 0.10540000000000001,
+                        "delay": {
+                            "fixed_delay": {"nanos": 543, "seconds": 751},
+                            "percentage": 0.10540000000000001,
+                        },
+                    },
+                    "max_stream_duration": {"nanos": 543, "seconds": 751},
+                    "request_mirror_policy": {
+                        "backend_service": "backend_service_value"
+                    },
+                    "retry_policy": {
+                        "num_retries": 1197,
+                        "per_try_timeout": {"nanos": 543, "seconds": 751},
+                        "retry_conditions": [
+                            "retry_conditions_value_1",
+                            "retry_conditions_value_2",
+                        ],
+                    },
+                    "timeout": {"nanos": 543, "seconds": 751},
+                    "url_rewrite": {
+                        "host_rewrite": "host_rewrite_value",
+                        "path_prefix_rewrite": "path_prefix_rewrite_value",
+                    },
+                    "weighted_backend_services": [
+                        {
+                            "backend_service": "backend_service_value",
+                            "header_action": {
+                                "request_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "request_headers_to_remove": [
+                                    "request_headers_to_remove_value_1",
+                                    "request_headers_to_remove_value_2",
+                                ],
+                                "response_headers_to_add": [
+                                    {
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
+                                    }
+                                ],
+                                "response_headers_to_remove": [
+                                    "response_headers_to_remove_value_1",
+                                    "response_headers_to_remove_value_2",
+                                ],
+                            },
+                            "weight": 648,
+                        }
+                    ],
+                },
+                "default_service": "default_service_value",
+                "default_url_redirect": {
+                    "host_redirect": "host_redirect_value",
+                    "https_redirect": True,
+                    "path_redirect": "path_redirect_value",
+                    "prefix_redirect": "prefix_redirect_value",
+                    "redirect_response_code": "redirect_response_code_value",
+                    "strip_query": True,
+                },
+                "description": "description_value",
+                "header_action": {
+                    "request_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "request_headers_to_remove": [
+                        "request_headers_to_remove_value_1",
+                        "request_headers_to_remove_value_2",
+                    ],
+                    "response_headers_to_add": [
+                        {
+                            "header_name": "header_name_value",
+                            "header_value": "header_value_value",
+                            "replace": True,
+                        }
+                    ],
+                    "response_headers_to_remove": [
+                        "response_headers_to_remove_value_1",
+                        "response_headers_to_remove_value_2",
+                    ],
+                },
+                "name": "name_value",
+                "path_rules": [
+                    {
+                        "paths": ["paths_value_1", "paths_value_2"],
+                        "route_action": {
+                            "cors_policy": {
+                                "allow_credentials": True,
+                                "allow_headers": [
+                                    "allow_headers_value_1",
+                                    "allow_headers_value_2",
+                                ],
+                                "allow_methods": [
+                                    "allow_methods_value_1",
+                                    "allow_methods_value_2",
+                                ],
+                                "allow_origin_regexes": [
+                                    "allow_origin_regexes_value_1",
+                                    "allow_origin_regexes_value_2",
+                                ],
+                                "allow_origins": [
+                                    "allow_origins_value_1",
+                                    "allow_origins_value_2",
+                                ],
+                                "disabled": True,
+                                "expose_headers": [
+                                    "expose_headers_value_1",
+                                    "expose_headers_value_2",
+                                ],
+                                "max_age": 722,
+                            },
+                            "fault_injection_policy": {
+                                "abort": {
+                                    "http_status": 1219,
+                                    "percentage": 0.10540000000000001,
+                                },
+                                "delay": {
+                                    "fixed_delay": {"nanos": 543, "seconds": 751},
+                                    "percentage": 0.10540000000000001,
+                                },
+                            },
+                            "max_stream_duration": {"nanos": 543, "seconds": 751},
+                            "request_mirror_policy": {
+                                "backend_service": "backend_service_value"
+                            },
+                            "retry_policy": {
+                                "num_retries": 1197,
+                                "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                "retry_conditions": [
+                                    "retry_conditions_value_1",
+                                    "retry_conditions_value_2",
+                                ],
+                            },
+                            "timeout": {"nanos": 543, "seconds": 751},
+                            "url_rewrite": {
+                                "host_rewrite": "host_rewrite_value",
+                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            },
+                            "weighted_backend_services": [
+                                {
+                                    "backend_service": "backend_service_value",
+                                    "header_action": {
+                                        "request_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "request_headers_to_remove": [
+                                            "request_headers_to_remove_value_1",
+                                            "request_headers_to_remove_value_2",
+                                        ],
+                                        "response_headers_to_add": [
+                                            {
+                                                "header_name": "header_name_value",
+                                                "header_value": "header_value_value",
+                                                "replace": True,
+                                            }
+                                        ],
+                                        "response_headers_to_remove": [
+                                            "response_headers_to_remove_value_1",
+                                            "response_headers_to_remove_value_2",
+                                        ],
+                                    },
+                                    "weight": 648,
+                                }
+                            ],
+                        },
+                        "service": "service_value",
+                        "url_redirect": {
+                            "host_redirect": "host_redirect_value",
+                            "https_redirect": True,
+                            "path_redirect": "path_redirect_value",
+                            "prefix_redirect": "prefix_redirect_value",
+                            "redirect_response_code": "redirect_response_code_value",
+                            "strip_query": True,
+                        },
+                    }
+                ],
+                "route_rules": [
+                    {
+                        "description": "description_value",
+                        "header_action": {
+                            "request_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "request_headers_to_remove": [
+                                "request_headers_to_remove_value_1",
+                                "request_headers_to_remove_value_2",
+                            ],
+                            "response_headers_to_add": [
+                                {
+                                    "header_name": "header_name_value",
+                                    "header_value": "header_value_value",
+                                    "replace": True,
+                                }
+                            ],
+                            "response_headers_to_remove": [
+                                "response_headers_to_remove_value_1",
+                                "response_headers_to_remove_value_2",
+                            ],
                         },
-                    },
-                    "max_stream_duration": {"nanos": 543, "seconds": 751},
-                    "request_mirror_policy": {
-                        "backend_service": "backend_service_value"
-                    },
-                    "retry_policy": {
-                        "num_retries": 1197,
-                        "per_try_timeout": {"nanos": 543, "seconds": 751},
-                        "retry_conditions": [
-                            "retry_conditions_value_1",
-                            "retry_conditions_value_2",
-                        ],
-                    },
-                    "timeout": {"nanos": 543, "seconds": 751},
-                    "url_rewrite": {
-                        "host_rewrite": "host_rewrite_value",
-                        "path_prefix_rewrite": "path_prefix_rewrite_value",
-                    },
-                    "weighted_backend_services": [
-                        {
-                            "backend_service": "backend_service_value",
-                            "header_action": {
-                                "request_headers_to_add": [
+                        "match_rules": [
+                            {
+                                "full_path_match": "full_path_match_value",
+                                "header_matches": [
                                     {
+                                        "exact_match": "exact_match_value",
                                         "header_name": "header_name_value",
-                                        "header_value": "header_value_value",
-                                        "replace": True,
+                                        "invert_match": True,
+                                        "prefix_match": "prefix_match_value",
+                                        "present_match": True,
+                                        "range_match": {
+                                            "range_end": 931,
+                                            "range_start": 1178,
+                                        },
+                                        "regex_match": "regex_match_value",
+                                        "suffix_match": "suffix_match_value",
                                     }
                                 ],
-                                "request_headers_to_remove": [
-                                    "request_headers_to_remove_value_1",
-                                    "request_headers_to_remove_value_2",
-                                ],
-                                "response_headers_to_add": [
+                                "ignore_case": True,
+                                "metadata_filters": [
                                     {
-                                        "header_name": "header_name_value",
-                                        "header_value": "header_value_value",
-                                        "replace": True,
+                                        "filter_labels": [
+                                            {
+                                                "name": "name_value",
+                                                "value": "value_value",
+                                            }
+                                        ],
+                                        "filter_match_criteria": "filter_match_criteria_value",
                                     }
                                 ],
-                                "response_headers_to_remove": [
-                                    "response_headers_to_remove_value_1",
-                                    "response_headers_to_remove_value_2",
+                                "prefix_match": "prefix_match_value",
+                                "query_parameter_matches": [
+                                    {
+                                        "exact_match": "exact_match_value",
+                                        "name": "name_value",
+                                        "present_match": True,
+                                        "regex_match": "regex_match_value",
+                                    }
                                 ],
-                            },
-                            "weight": 648,
-                        }
-                    ],
-                },
-                "default_service": "default_service_value",
-                "default_url_redirect": {
-                    "host_redirect": "host_redirect_value",
-                    "https_redirect": True,
-                    "path_redirect": "path_redirect_value",
-                    "prefix_redirect": "prefix_redirect_value",
-                    "redirect_response_code": "redirect_response_code_value",
-                    "strip_query": True,
-                },
-                "description": "description_value",
-                "header_action": {
-                    "request_headers_to_add": [
-                        {
-                            "header_name": "header_name_value",
-                            "header_value": "header_value_value",
-                            "replace": True,
-                        }
-                    ],
-                    "request_headers_to_remove": [
-                        "request_headers_to_remove_value_1",
-                        "request_headers_to_remove_value_2",
-                    ],
-                    "response_headers_to_add": [
-                        {
-                            "header_name": "header_name_value",
-                            "header_value": "header_value_value",
-                            "replace": True,
-                        }
-                    ],
-                    "response_headers_to_remove": [
-                        "response_headers_to_remove_value_1",
-                        "response_headers_to_remove_value_2",
-                    ],
-                },
-                "name": "name_value",
-                "path_rules": [
-                    {
-                        "paths": ["paths_value_1", "paths_value_2"],
+                                "regex_match": "regex_match_value",
+                            }
+                        ],
+                        "priority": 898,
                         "route_action": {
                             "cors_policy": {
                                 "allow_credentials": True,
@@ -5236,9 +7763,156 @@ def test_update_unary_rest_bad_request(
                         },
                     }
                 ],
-                "route_rules": [
+            }
+        ],
+        "region": "region_value",
+        "self_link": "self_link_value",
+        "tests": [
+            {
+                "description": "description_value",
+                "expected_output_url": "expected_output_url_value",
+                "expected_redirect_response_code": 3275,
+                "headers": [{"name": "name_value", "value": "value_value"}],
+                "host": "host_value",
+                "path": "path_value",
+                "service": "service_value",
+            }
+        ],
+    }
+    request = request_type(request_init)
+
+    # Mock the http request call within the method and fake a BadRequest error.
+    with mock.patch.object(Session, "request") as req, pytest.raises(
+        core_exceptions.BadRequest
+    ):
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 400
+        response_value.request = Request()
+        req.return_value = response_value
+        client.update_unary(request)
+
+
+def test_update_unary_rest_flattened():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(type(client.transport._session), "request") as req:
+        # Designate an appropriate value for the returned response.
+        return_value = compute.Operation()
+
+        # Wrap the value into a proper Response obj
+        response_value = Response()
+        response_value.status_code = 200
+        json_return_value = compute.Operation.to_json(return_value)
+
+        response_value._content = json_return_value.encode("UTF-8")
+        req.return_value = response_value
+
+        # get arguments that satisfy an http rule for this method
+        sample_request = {"project": "sample1", "url_map": "sample2"}
+
+        # get truthy value for each flattened field
+        mock_args = dict(
+            project="project_value",
+            url_map="url_map_value",
+            url_map_resource=compute.UrlMap(
+                creation_timestamp="creation_timestamp_value"
+            ),
+        )
+        mock_args.update(sample_request)
+        client.update_unary(**mock_args)
+
+        # Establish that the underlying call was made with the expected
+        # request object values.
+        assert len(req.mock_calls) == 1
+        _, args, _ = req.mock_calls[0]
+        assert path_template.validate(
+            "https://%s/compute/v1/projects/{project}/global/urlMaps/{url_map}"
+            % client.transport._host,
+            args[1],
+        )
+
+
+def test_update_unary_rest_flattened_error(transport: str = "rest"):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
+    )
+
+    # Attempting to call a method with both a request object and flattened
+    # fields is an error.
+    with pytest.raises(ValueError):
+        client.update_unary(
+            compute.UpdateUrlMapRequest(),
+            project="project_value",
+            url_map="url_map_value",
+            url_map_resource=compute.UrlMap(
+                creation_timestamp="creation_timestamp_value"
+            ),
+        )
+
+
+def test_update_unary_rest_error():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
+    )
+
+
+@pytest.mark.parametrize("request_type", [compute.ValidateUrlMapRequest, dict,])
+def test_validate_rest(request_type):
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # send a request that will satisfy transcoding
+    request_init = {"project": "sample1", "url_map": "sample2"}
+    request_init["url_maps_validate_request_resource"] = {
+        "resource": {
+            "creation_timestamp": "creation_timestamp_value",
+            "default_route_action": {
+                "cors_policy": {
+                    "allow_credentials": True,
+                    "allow_headers": ["allow_headers_value_1", "allow_headers_value_2"],
+                    "allow_methods": ["allow_methods_value_1", "allow_methods_value_2"],
+                    "allow_origin_regexes": [
+                        "allow_origin_regexes_value_1",
+                        "allow_origin_regexes_value_2",
+                    ],
+                    "allow_origins": ["allow_origins_value_1", "allow_origins_value_2"],
+                    "disabled": True,
+                    "expose_headers": [
+                        "expose_headers_value_1",
+                        "expose_headers_value_2",
+                    ],
+                    "max_age": 722,
+                },
+                "fault_injection_policy": {
+                    "abort": {"http_status": 1219, "percentage": 0.10540000000000001},
+                    "delay": {
+                        "fixed_delay": {"nanos": 543, "seconds": 751},
+                        "percentage": 0.10540000000000001,
+                    },
+                },
+                "max_stream_duration": {"nanos": 543, "seconds": 751},
+                "request_mirror_policy": {"backend_service": "backend_service_value"},
+                "retry_policy": {
+                    "num_retries": 1197,
+                    "per_try_timeout": {"nanos": 543, "seconds": 751},
+                    "retry_conditions": [
+                        "retry_conditions_value_1",
+                        "retry_conditions_value_2",
+                    ],
+                },
+                "timeout": {"nanos": 543, "seconds": 751},
+                "url_rewrite": {
+                    "host_rewrite": "host_rewrite_value",
+                    "path_prefix_rewrite": "path_prefix_rewrite_value",
+                },
+                "weighted_backend_services": [
                     {
-                        "description": "description_value",
+                        "backend_service": "backend_service_value",
                         "header_action": {
                             "request_headers_to_add": [
                                 {
@@ -5263,245 +7937,480 @@ def test_update_unary_rest_bad_request(
                                 "response_headers_to_remove_value_2",
                             ],
                         },
-                        "match_rules": [
+                        "weight": 648,
+                    }
+                ],
+            },
+            "default_service": "default_service_value",
+            "default_url_redirect": {
+                "host_redirect": "host_redirect_value",
+                "https_redirect": True,
+                "path_redirect": "path_redirect_value",
+                "prefix_redirect": "prefix_redirect_value",
+                "redirect_response_code": "redirect_response_code_value",
+                "strip_query": True,
+            },
+            "description": "description_value",
+            "fingerprint": "fingerprint_value",
+            "header_action": {
+                "request_headers_to_add": [
+                    {
+                        "header_name": "header_name_value",
+                        "header_value": "header_value_value",
+                        "replace": True,
+                    }
+                ],
+                "request_headers_to_remove": [
+                    "request_headers_to_remove_value_1",
+                    "request_headers_to_remove_value_2",
+                ],
+                "response_headers_to_add": [
+                    {
+                        "header_name": "header_name_value",
+                        "header_value": "header_value_value",
+                        "replace": True,
+                    }
+                ],
+                "response_headers_to_remove": [
+                    "response_headers_to_remove_value_1",
+                    "response_headers_to_remove_value_2",
+                ],
+            },
+            "host_rules": [
+                {
+                    "description": "description_value",
+                    "hosts": ["hosts_value_1", "hosts_value_2"],
+                    "path_matcher": "path_matcher_value",
+                }
+            ],
+            "id": 205,
+            "kind": "kind_value",
+            "name": "name_value",
+            "path_matchers": [
+                {
+                    "default_route_action": {
+                        "cors_policy": {
+                            "allow_credentials": True,
+                            "allow_headers": [
+                                "allow_headers_value_1",
+                                "allow_headers_value_2",
+                            ],
+                            "allow_methods": [
+                                "allow_methods_value_1",
+                                "allow_methods_value_2",
+                            ],
+                            "allow_origin_regexes": [
+                                "allow_origin_regexes_value_1",
+                                "allow_origin_regexes_value_2",
+                            ],
+                            "allow_origins": [
+                                "allow_origins_value_1",
+                                "allow_origins_value_2",
+                            ],
+                            "disabled": True,
+                            "expose_headers": [
+                                "expose_headers_value_1",
+                                "expose_headers_value_2",
+                            ],
+                            "max_age": 722,
+                        },
+                        "fault_injection_policy": {
+                            "abort": {
+                                "http_status": 1219,
+                                "percentage": 0.10540000000000001,
+                            },
+                            "delay": {
+                                "fixed_delay": {"nanos": 543, "seconds": 751},
+                                "percentage": 0.10540000000000001,
+                            },
+                        },
+                        "max_stream_duration": {"nanos": 543, "seconds": 751},
+                        "request_mirror_policy": {
+                            "backend_service": "backend_service_value"
+                        },
+                        "retry_policy": {
+                            "num_retries": 1197,
+                            "per_try_timeout": {"nanos": 543, "seconds": 751},
+                            "retry_conditions": [
+                                "retry_conditions_value_1",
+                                "retry_conditions_value_2",
+                            ],
+                        },
+                        "timeout": {"nanos": 543, "seconds": 751},
+                        "url_rewrite": {
+                            "host_rewrite": "host_rewrite_value",
+                            "path_prefix_rewrite": "path_prefix_rewrite_value",
+                        },
+                        "weighted_backend_services": [
                             {
-                                "full_path_match": "full_path_match_value",
-                                "header_matches": [
+                                "backend_service": "backend_service_value",
+                                "header_action": {
+                                    "request_headers_to_add": [
+                                        {
+                                            "header_name": "header_name_value",
+                                            "header_value": "header_value_value",
+                                            "replace": True,
+                                        }
+                                    ],
+                                    "request_headers_to_remove": [
+                                        "request_headers_to_remove_value_1",
+                                        "request_headers_to_remove_value_2",
+                                    ],
+                                    "response_headers_to_add": [
+                                        {
+                                            "header_name": "header_name_value",
+                                            "header_value": "header_value_value",
+                                            "replace": True,
+                                        }
+                                    ],
+                                    "response_headers_to_remove": [
+                                        "response_headers_to_remove_value_1",
+                                        "response_headers_to_remove_value_2",
+                                    ],
+                                },
+                                "weight": 648,
+                            }
+                        ],
+                    },
+                    "default_service": "default_service_value",
+                    "default_url_redirect": {
+                        "host_redirect": "host_redirect_value",
+                        "https_redirect": True,
+                        "path_redirect": "path_redirect_value",
+                        "prefix_redirect": "prefix_redirect_value",
+                        "redirect_response_code": "redirect_response_code_value",
+                        "strip_query": True,
+                    },
+                    "description": "description_value",
+                    "header_action": {
+                        "request_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "request_headers_to_remove": [
+                            "request_headers_to_remove_value_1",
+                            "request_headers_to_remove_value_2",
+                        ],
+                        "response_headers_to_add": [
+                            {
+                                "header_name": "header_name_value",
+                                "header_value": "header_value_value",
+                                "replace": True,
+                            }
+                        ],
+                        "response_headers_to_remove": [
+                            "response_headers_to_remove_value_1",
+                            "response_headers_to_remove_value_2",
+                        ],
+                    },
+                    "name": "name_value",
+                    "path_rules": [
+                        {
+                            "paths": ["paths_value_1", "paths_value_2"],
+                            "route_action": {
+                                "cors_policy": {
+                                    "allow_credentials": True,
+                                    "allow_headers": [
+                                        "allow_headers_value_1",
+                                        "allow_headers_value_2",
+                                    ],
+                                    "allow_methods": [
+                                        "allow_methods_value_1",
+                                        "allow_methods_value_2",
+                                    ],
+                                    "allow_origin_regexes": [
+                                        "allow_origin_regexes_value_1",
+                                        "allow_origin_regexes_value_2",
+                                    ],
+                                    "allow_origins": [
+                                        "allow_origins_value_1",
+                                        "allow_origins_value_2",
+                                    ],
+                                    "disabled": True,
+                                    "expose_headers": [
+                                        "expose_headers_value_1",
+                                        "expose_headers_value_2",
+                                    ],
+                                    "max_age": 722,
+                                },
+                                "fault_injection_policy": {
+                                    "abort": {
+                                        "http_status": 1219,
+                                        "percentage": 0.10540000000000001,
+                                    },
+                                    "delay": {
+                                        "fixed_delay": {"nanos": 543, "seconds": 751},
+                                        "percentage": 0.10540000000000001,
+                                    },
+                                },
+                                "max_stream_duration": {"nanos": 543, "seconds": 751},
+                                "request_mirror_policy": {
+                                    "backend_service": "backend_service_value"
+                                },
+                                "retry_policy": {
+                                    "num_retries": 1197,
+                                    "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                    "retry_conditions": [
+                                        "retry_conditions_value_1",
+                                        "retry_conditions_value_2",
+                                    ],
+                                },
+                                "timeout": {"nanos": 543, "seconds": 751},
+                                "url_rewrite": {
+                                    "host_rewrite": "host_rewrite_value",
+                                    "path_prefix_rewrite": "path_prefix_rewrite_value",
+                                },
+                                "weighted_backend_services": [
                                     {
-                                        "exact_match": "exact_match_value",
-                                        "header_name": "header_name_value",
-                                        "invert_match": True,
-                                        "prefix_match": "prefix_match_value",
-                                        "present_match": True,
-                                        "range_match": {
-                                            "range_end": 931,
-                                            "range_start": 1178,
+                                        "backend_service": "backend_service_value",
+                                        "header_action": {
+                                            "request_headers_to_add": [
+                                                {
+                                                    "header_name": "header_name_value",
+                                                    "header_value": "header_value_value",
+                                                    "replace": True,
+                                                }
+                                            ],
+                                            "request_headers_to_remove": [
+                                                "request_headers_to_remove_value_1",
+                                                "request_headers_to_remove_value_2",
+                                            ],
+                                            "response_headers_to_add": [
+                                                {
+                                                    "header_name": "header_name_value",
+                                                    "header_value": "header_value_value",
+                                                    "replace": True,
+                                                }
+                                            ],
+                                            "response_headers_to_remove": [
+                                                "response_headers_to_remove_value_1",
+                                                "response_headers_to_remove_value_2",
+                                            ],
                                         },
-                                        "regex_match": "regex_match_value",
-                                        "suffix_match": "suffix_match_value",
+                                        "weight": 648,
                                     }
                                 ],
-                                "ignore_case": True,
-                                "metadata_filters": [
+                            },
+                            "service": "service_value",
+                            "url_redirect": {
+                                "host_redirect": "host_redirect_value",
+                                "https_redirect": True,
+                                "path_redirect": "path_redirect_value",
+                                "prefix_redirect": "prefix_redirect_value",
+                                "redirect_response_code": "redirect_response_code_value",
+                                "strip_query": True,
+                            },
+                        }
+                    ],
+                    "route_rules": [
+                        {
+                            "description": "description_value",
+                            "header_action": {
+                                "request_headers_to_add": [
                                     {
-                                        "filter_labels": [
-                                            {
-                                                "name": "name_value",
-                                                "value": "value_value",
-                                            }
-                                        ],
-                                        "filter_match_criteria": "filter_match_criteria_value",
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
                                     }
                                 ],
-                                "prefix_match": "prefix_match_value",
-                                "query_parameter_matches": [
+                                "request_headers_to_remove": [
+                                    "request_headers_to_remove_value_1",
+                                    "request_headers_to_remove_value_2",
+                                ],
+                                "response_headers_to_add": [
                                     {
-                                        "exact_match": "exact_match_value",
-                                        "name": "name_value",
-                                        "present_match": True,
-                                        "regex_match": "regex_match_value",
+                                        "header_name": "header_name_value",
+                                        "header_value": "header_value_value",
+                                        "replace": True,
                                     }
                                 ],
-                                "regex_match": "regex_match_value",
-                            }
-                        ],
-                        "priority": 898,
-                        "route_action": {
-                            "cors_policy": {
-                                "allow_credentials": True,
-                                "allow_headers": [
-                                    "allow_headers_value_1",
-                                    "allow_headers_value_2",
-                                ],
-                                "allow_methods": [
-                                    "allow_methods_value_1",
-                                    "allow_methods_value_2",
-                                ],
-                                "allow_origin_regexes": [
-                                    "allow_origin_regexes_value_1",
-                                    "allow_origin_regexes_value_2",
-                                ],
-                                "allow_origins": [
-                                    "allow_origins_value_1",
-                                    "allow_origins_value_2",
-                                ],
-                                "disabled": True,
-                                "expose_headers": [
-                                    "expose_headers_value_1",
-                                    "expose_headers_value_2",
+                                "response_headers_to_remove": [
+                                    "response_headers_to_remove_value_1",
+                                    "response_headers_to_remove_value_2",
                                 ],
-                                "max_age": 722,
                             },
-                            "fault_injection_policy": {
-                                "abort": {
-                                    "http_status": 1219,
-                                    "percentage": 0.10540000000000001,
+                            "match_rules": [
+                                {
+                                    "full_path_match": "full_path_match_value",
+                                    "header_matches": [
+                                        {
+                                            "exact_match": "exact_match_value",
+                                            "header_name": "header_name_value",
+                                            "invert_match": True,
+                                            "prefix_match": "prefix_match_value",
+                                            "present_match": True,
+                                            "range_match": {
+                                                "range_end": 931,
+                                                "range_start": 1178,
+                                            },
+                                            "regex_match": "regex_match_value",
+                                            "suffix_match": "suffix_match_value",
+                                        }
+                                    ],
+                                    "ignore_case": True,
+                                    "metadata_filters": [
+                                        {
+                                            "filter_labels": [
+                                                {
+                                                    "name": "name_value",
+                                                    "value": "value_value",
+                                                }
+                                            ],
+                                            "filter_match_criteria": "filter_match_criteria_value",
+                                        }
+                                    ],
+                                    "prefix_match": "prefix_match_value",
+                                    "query_parameter_matches": [
+                                        {
+                                            "exact_match": "exact_match_value",
+                                            "name": "name_value",
+                                            "present_match": True,
+                                            "regex_match": "regex_match_value",
+                                        }
+                                    ],
+                                    "regex_match": "regex_match_value",
+                                }
+                            ],
+                            "priority": 898,
+                            "route_action": {
+                                "cors_policy": {
+                                    "allow_credentials": True,
+                                    "allow_headers": [
+                                        "allow_headers_value_1",
+                                        "allow_headers_value_2",
+                                    ],
+                                    "allow_methods": [
+                                        "allow_methods_value_1",
+                                        "allow_methods_value_2",
+                                    ],
+                                    "allow_origin_regexes": [
+                                        "allow_origin_regexes_value_1",
+                                        "allow_origin_regexes_value_2",
+                                    ],
+                                    "allow_origins": [
+                                        "allow_origins_value_1",
+                                        "allow_origins_value_2",
+                                    ],
+                                    "disabled": True,
+                                    "expose_headers": [
+                                        "expose_headers_value_1",
+                                        "expose_headers_value_2",
+                                    ],
+                                    "max_age": 722,
                                 },
-                                "delay": {
-                                    "fixed_delay": {"nanos": 543, "seconds": 751},
-                                    "percentage": 0.10540000000000001,
+                                "fault_injection_policy": {
+                                    "abort": {
+                                        "http_status": 1219,
+                                        "percentage": 0.10540000000000001,
+                                    },
+                                    "delay": {
+                                        "fixed_delay": {"nanos": 543, "seconds": 751},
+                                        "percentage": 0.10540000000000001,
+                                    },
                                 },
-                            },
-                            "max_stream_duration": {"nanos": 543, "seconds": 751},
-                            "request_mirror_policy": {
-                                "backend_service": "backend_service_value"
-                            },
-                            "retry_policy": {
-                                "num_retries": 1197,
-                                "per_try_timeout": {"nanos": 543, "seconds": 751},
-                                "retry_conditions": [
-                                    "retry_conditions_value_1",
-                                    "retry_conditions_value_2",
+                                "max_stream_duration": {"nanos": 543, "seconds": 751},
+                                "request_mirror_policy": {
+                                    "backend_service": "backend_service_value"
+                                },
+                                "retry_policy": {
+                                    "num_retries": 1197,
+                                    "per_try_timeout": {"nanos": 543, "seconds": 751},
+                                    "retry_conditions": [
+                                        "retry_conditions_value_1",
+                                        "retry_conditions_value_2",
+                                    ],
+                                },
+                                "timeout": {"nanos": 543, "seconds": 751},
+                                "url_rewrite": {
+                                    "host_rewrite": "host_rewrite_value",
+                                    "path_prefix_rewrite": "path_prefix_rewrite_value",
+                                },
+                                "weighted_backend_services": [
+                                    {
+                                        "backend_service": "backend_service_value",
+                                        "header_action": {
+                                            "request_headers_to_add": [
+                                                {
+                                                    "header_name": "header_name_value",
+                                                    "header_value": "header_value_value",
+                                                    "replace": True,
+                                                }
+                                            ],
+                                            "request_headers_to_remove": [
+                                                "request_headers_to_remove_value_1",
+                                                "request_headers_to_remove_value_2",
+                                            ],
+                                            "response_headers_to_add": [
+                                                {
+                                                    "header_name": "header_name_value",
+                                                    "header_value": "header_value_value",
+                                                    "replace": True,
+                                                }
+                                            ],
+                                            "response_headers_to_remove": [
+                                                "response_headers_to_remove_value_1",
+                                                "response_headers_to_remove_value_2",
+                                            ],
+                                        },
+                                        "weight": 648,
+                                    }
                                 ],
                             },
-                            "timeout": {"nanos": 543, "seconds": 751},
-                            "url_rewrite": {
-                                "host_rewrite": "host_rewrite_value",
-                                "path_prefix_rewrite": "path_prefix_rewrite_value",
+                            "service": "service_value",
+                            "url_redirect": {
+                                "host_redirect": "host_redirect_value",
+                                "https_redirect": True,
+                                "path_redirect": "path_redirect_value",
+                                "prefix_redirect": "prefix_redirect_value",
+                                "redirect_response_code": "redirect_response_code_value",
+                                "strip_query": True,
                             },
-                            "weighted_backend_services": [
-                                {
-                                    "backend_service": "backend_service_value",
-                                    "header_action": {
-                                        "request_headers_to_add": [
-                                            {
-                                                "header_name": "header_name_value",
-                                                "header_value": "header_value_value",
-                                                "replace": True,
-                                            }
-                                        ],
-                                        "request_headers_to_remove": [
-                                            "request_headers_to_remove_value_1",
-                                            "request_headers_to_remove_value_2",
-                                        ],
-                                        "response_headers_to_add": [
-                                            {
-                                                "header_name": "header_name_value",
-                                                "header_value": "header_value_value",
-                                                "replace": True,
-                                            }
-                                        ],
-                                        "response_headers_to_remove": [
-                                            "response_headers_to_remove_value_1",
-                                            "response_headers_to_remove_value_2",
-                                        ],
-                                    },
-                                    "weight": 648,
-                                }
-                            ],
-                        },
-                        "service": "service_value",
-                        "url_redirect": {
-                            "host_redirect": "host_redirect_value",
-                            "https_redirect": True,
-                            "path_redirect": "path_redirect_value",
-                            "prefix_redirect": "prefix_redirect_value",
-                            "redirect_response_code": "redirect_response_code_value",
-                            "strip_query": True,
-                        },
-                    }
-                ],
-            }
-        ],
-        "region": "region_value",
-        "self_link": "self_link_value",
-        "tests": [
-            {
-                "description": "description_value",
-                "expected_output_url": "expected_output_url_value",
-                "expected_redirect_response_code": 3275,
-                "headers": [{"name": "name_value", "value": "value_value"}],
-                "host": "host_value",
-                "path": "path_value",
-                "service": "service_value",
-            }
-        ],
+                        }
+                    ],
+                }
+            ],
+            "region": "region_value",
+            "self_link": "self_link_value",
+            "tests": [
+                {
+                    "description": "description_value",
+                    "expected_output_url": "expected_output_url_value",
+                    "expected_redirect_response_code": 3275,
+                    "headers": [{"name": "name_value", "value": "value_value"}],
+                    "host": "host_value",
+                    "path": "path_value",
+                    "service": "service_value",
+                }
+            ],
+        }
     }
     request = request_type(request_init)
 
-    # Mock the http request call within the method and fake a BadRequest error.
-    with mock.patch.object(Session, "request") as req, pytest.raises(
-        core_exceptions.BadRequest
-    ):
-        # Wrap the value into a proper Response obj
-        response_value = Response()
-        response_value.status_code = 400
-        response_value.request = Request()
-        req.return_value = response_value
-        client.update_unary(request)
-
-
-def test_update_unary_rest_flattened():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
-    )
-
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(type(client.transport._session), "request") as req:
         # Designate an appropriate value for the returned response.
-        return_value = compute.Operation()
+        return_value = compute.UrlMapsValidateResponse()
 
         # Wrap the value into a proper Response obj
         response_value = Response()
         response_value.status_code = 200
-        json_return_value = compute.Operation.to_json(return_value)
-
+        json_return_value = compute.UrlMapsValidateResponse.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
+        response = client.validate(request)
 
-        # get arguments that satisfy an http rule for this method
-        sample_request = {"project": "sample1", "url_map": "sample2"}
-
-        # get truthy value for each flattened field
-        mock_args = dict(
-            project="project_value",
-            url_map="url_map_value",
-            url_map_resource=compute.UrlMap(
-                creation_timestamp="creation_timestamp_value"
-            ),
-        )
-        mock_args.update(sample_request)
-        client.update_unary(**mock_args)
-
-        # Establish that the underlying call was made with the expected
-        # request object values.
-        assert len(req.mock_calls) == 1
-        _, args, _ = req.mock_calls[0]
-        assert path_template.validate(
-            "https://%s/compute/v1/projects/{project}/global/urlMaps/{url_map}"
-            % client.transport._host,
-            args[1],
-        )
-
-
-def test_update_unary_rest_flattened_error(transport: str = "rest"):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport=transport,
-    )
-
-    # Attempting to call a method with both a request object and flattened
-    # fields is an error.
-    with pytest.raises(ValueError):
-        client.update_unary(
-            compute.UpdateUrlMapRequest(),
-            project="project_value",
-            url_map="url_map_value",
-            url_map_resource=compute.UrlMap(
-                creation_timestamp="creation_timestamp_value"
-            ),
-        )
-
-
-def test_update_unary_rest_error():
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest"
-    )
+    # Establish that the response is the type that we expect.
+    assert isinstance(response, compute.UrlMapsValidateResponse)
 
 
+@pytest.mark.asyncio
 @pytest.mark.parametrize("request_type", [compute.ValidateUrlMapRequest, dict,])
-def test_validate_rest(request_type):
-    client = UrlMapsClient(
-        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+async def test_validate_rest_asyncio(request_type):
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio",
     )
 
     # send a request that will satisfy transcoding
@@ -6038,7 +8947,7 @@ def test_validate_rest(request_type):
         json_return_value = compute.UrlMapsValidateResponse.to_json(return_value)
         response_value._content = json_return_value.encode("UTF-8")
         req.return_value = response_value
-        response = client.validate(request)
+        response = await client.validate(request)
 
     # Establish that the response is the type that we expect.
     assert isinstance(response, compute.UrlMapsValidateResponse)
@@ -6089,19 +8998,13 @@ def test_validate_rest_required_fields(request_type=compute.ValidateUrlMapReques
     return_value = compute.UrlMapsValidateResponse()
     # Mock the http request call within the method and fake a response.
     with mock.patch.object(Session, "request") as req:
-        # We need to mock transcode() because providing default values
-        # for required fields will fail the real version if the http_options
-        # expect actual values for those fields.
-        with mock.patch.object(path_template, "transcode") as transcode:
-            # A uri without fields and an empty body will force all the
-            # request fields to show up in the query_params.
-            transcode_result = {
-                "uri": "v1/sample_method",
-                "method": "post",
-                "query_params": request_init,
-            }
-            transcode_result["body"] = {}
-            transcode.return_value = transcode_result
+        # We need to mock the request plan's path expansion because providing
+        # default values for required fields will fail the real version if the
+        # http_options expect actual values for those fields.
+        with mock.patch.object(_request_plan.RequestPlan, "expand") as expand:
+            # A uri without fields and an empty body leave only the query
+            # fields of the request to show up in the query_params.
+            expand.return_value = ("post", "v1/sample_method", "{}")
 
             response_value = Response()
             response_value.status_code = 200
@@ -7055,6 +9958,102 @@ def test_transport_close():
             close.assert_called_once()
 
 
+def test_transport_stubs_not_shared():
+    first = transports.UrlMapsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    second = transports.UrlMapsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    assert first.aggregated_list is first.aggregated_list
+    assert first.aggregated_list._session is first._session
+    assert second.aggregated_list._session is second._session
+    assert first._session is not second._session
+
+
+def test_get_rest_fields():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        response_value = Response()
+        response_value.status_code = 200
+        response_value._content = b"{}"
+        req.return_value = response_value
+
+        client.get(
+            request={"project": "sample1", "url_map": "sample2"},
+            fields=["name", "selfLink"],
+        )
+
+        _, kwargs = req.call_args
+        assert ("fields", "name,selfLink") in kwargs["params"]
+
+
+def test_list_rest_pager_fields():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapList(next_page_token="abc"),
+            compute.UrlMapList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.UrlMapList.to_json(response_val).encode(
+                "UTF-8"
+            )
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(client.list(request=sample_request, fields="items(name)").pages)
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items(name),nextPageToken") in kwargs["params"]
+
+
+def test_aggregated_list_rest_pager_fields():
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest",
+    )
+
+    # Mock the http request call within the method and fake a response.
+    with mock.patch.object(Session, "request") as req:
+        # Set the response as a series of pages
+        response = (
+            compute.UrlMapsAggregatedList(next_page_token="abc"),
+            compute.UrlMapsAggregatedList(),
+        )
+        return_values = tuple(Response() for i in response)
+        for return_val, response_val in zip(return_values, response):
+            return_val._content = compute.UrlMapsAggregatedList.to_json(
+                response_val
+            ).encode("UTF-8")
+            return_val.status_code = 200
+        req.side_effect = return_values
+
+        sample_request = {"project": "sample1"}
+
+        pages = list(
+            client.aggregated_list(
+                request=sample_request, fields="items/*/warning"
+            ).pages
+        )
+
+        assert len(pages) == 2
+        for _, kwargs in req.call_args_list:
+            assert ("fields", "items/*/warning,nextPageToken") in kwargs["params"]
+
+
 def test_client_ctx():
     transports = [
         "rest",
@@ -7071,6 +10070,81 @@ def test_client_ctx():
             close.assert_called()
 
 
+@pytest.mark.asyncio
+async def test_transport_close_async():
+    client = UrlMapsAsyncClient(
+        credentials=ga_credentials.AnonymousCredentials(), transport="rest_asyncio"
+    )
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            close.assert_not_called()
+        close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_client_shares_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.UrlMapsAsyncRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(), session=session
+    )
+    client = UrlMapsAsyncClient(transport=transport)
+    assert client.transport._session is session
+    assert isinstance(client.transport, transports.UrlMapsAsyncRestTransport)
+    assert UrlMapsAsyncClient.get_transport_class("rest_asyncio") is (
+        transports.UrlMapsAsyncRestTransport
+    )
+
+
+def test_client_options_session():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = UrlMapsClient(client_options={"session": session})
+    other = UrlMapsClient(client_options=ComputeClientOptions(session=session))
+    assert client.transport._session is session
+    assert other.transport._session is session
+    assert client.transport._credentials is session.credentials
+
+    # The caller owns a shared session; closing a client leaves it open.
+    with mock.patch.object(AuthorizedSession, "close") as close:
+        with client:
+            pass
+        close.assert_not_called()
+
+
+def test_client_options_session_with_transport_instance():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    transport = transports.UrlMapsRestTransport(
+        credentials=ga_credentials.AnonymousCredentials(),
+    )
+    with pytest.raises(ValueError):
+        UrlMapsClient(client_options={"session": session}, transport=transport)
+
+
+def test_transport_factory():
+    session = AuthorizedSession(ga_credentials.AnonymousCredentials())
+    factory = mock.Mock(wraps=transports.UrlMapsRestTransport)
+    client = UrlMapsClient(
+        credentials=ga_credentials.AnonymousCredentials(),
+        transport=factory,
+        client_options={"session": session},
+    )
+    factory.assert_called_once()
+    assert factory.call_args[1]["session"] is session
+    assert isinstance(client.transport, transports.UrlMapsRestTransport)
+    assert client.transport._session is session
+
+
+@pytest.mark.asyncio
+async def test_async_client_options_session():
+    session = AsyncAuthorizedSession(ga_credentials.AnonymousCredentials())
+    client = UrlMapsAsyncClient(client_options={"session": session})
+    assert client.transport._session is session
+
+    with mock.patch.object(AsyncAuthorizedSession, "close") as close:
+        async with client:
+            pass
+        close.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "client_class,transport_class", [(UrlMapsClient, transports.UrlMapsRestTransport),]
 )